@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkUnstructuredGrid
+
+from baramFlow.base.field import COORDINATE
+from baramFlow.coredb import coredb
+from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.openfoam.openfoam_reader import OpenFOAMReader
+from baramFlow.openfoam.solver_field import getSolverFieldName
+from libbaram.openfoam.polymesh import addCoordinateVector, collectInternalMesh
+
+
+MAX_CACHED_TIMES = 4
+MEMORY_BUDGET = 4 * 1024 * 1024  # KiB, as returned by vtkDataObject.GetActualMemorySize()
+
+_mutex = Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _pointsMtime(polyMesh: Path) -> int:
+    # Transforming the mesh rewrites points in place, which does not change the modification time of polyMesh
+    return _mtime(polyMesh / 'points') or _mtime(polyMesh / 'points.gz')
+
+
+class TimeDataSet:
+    def __init__(self, polyMesh: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid):
+        self.polyMesh = polyMesh
+        self.internalMesh = internalMesh
+
+        # Arrays shared by the two data sets are counted twice, which errs on the safe side
+        self.memorySize = polyMesh.GetActualMemorySize() + internalMesh.GetActualMemorySize()
+
+
+class DataSetCache:
+    """Data sets of time steps read by OpenFOAMReader, shared by all the Graphics
+
+    A time step is read once, and its poly mesh with coordinate vectors and the collected internal mesh
+    are reused by the Graphics at the same time.
+    The key includes the case root, time, regions and modification times of the mesh and the time directories,
+    so that switching cases or writing results does not return stale data sets.
+    Files rewritten in place do not change the modification times of their directories,
+    so invalidate() should be called after generating or initializing a case and after running the solver.
+    Entries are evicted in least recently used order
+    when there are more than MAX_CACHED_TIMES or they take more than MEMORY_BUDGET.
+    """
+    def __new__(cls, *args, **kwargs):
+        with _mutex:
+            if not hasattr(cls, '_instance'):
+                cls._instance = super(DataSetCache, cls).__new__(cls, *args, **kwargs)
+
+        return cls._instance
+
+    def __init__(self):
+        with _mutex:
+            if hasattr(self, '_initialized'):
+                return
+            else:
+                self._initialized = True
+
+        self._entries: OrderedDict[tuple, TimeDataSet] = OrderedDict()
+        self._loading: dict[tuple, asyncio.Future] = {}
+        self._generation = 0    # Increased by invalidate() not to keep data sets being read before it
+
+        self.maxTimes = MAX_CACHED_TIMES
+        self.memoryBudget = MEMORY_BUDGET
+
+    async def get(self, time: str) -> TimeDataSet:
+        key = self._key(time)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        # Graphics of the same time requested while it is being read wait for the reading
+        generation = self._generation
+        loadingKey = (generation, key)
+        if loadingKey in self._loading:
+            return await asyncio.shield(self._loading[loadingKey])
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[loadingKey] = future
+        try:
+            dataSet = await self._read(time)
+            future.set_result(dataSet)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here not to be reported as never retrieved when no one waits for it
+            raise
+        finally:
+            del self._loading[loadingKey]
+
+        if generation == self._generation:
+            self._entries[key] = dataSet
+            self._evict()
+
+        return dataSet
+
+    def invalidate(self):
+        """Drop all the data sets, which is required when the mesh is replaced or results are rewritten in place
+
+        Data sets being read are returned to the Graphics waiting for them, but not kept.
+        """
+        self._entries.clear()
+        self._generation += 1
+
+    def _key(self, time: str) -> tuple:
+        caseRoot = FileSystem.caseRoot()
+        regions = tuple(coredb.CoreDB().getRegions())
+
+        root = FileSystem.processorPath(0) or caseRoot
+        polyMeshes = [root / 'constant' / rname / 'polyMesh' for rname in regions]
+        stamps = tuple((_mtime(p), _pointsMtime(p)) for p in polyMeshes)
+
+        return str(caseRoot), float(time), regions, stamps, _mtime(root / time)
+
+    async def _read(self, time: str) -> TimeDataSet:
+        async with OpenFOAMReader() as reader:
+            reader.setTimeValue(float(time))
+            await reader.update()
+            mBlock = reader.getOutput()
+
+        polyMesh = await addCoordinateVector(mBlock, getSolverFieldName(COORDINATE))
+        internalMesh = await collectInternalMesh(polyMesh)
+
+        return TimeDataSet(polyMesh, internalMesh)
+
+    def _evict(self):
+        total = sum(e.memorySize for e in self._entries.values())
+        while len(self._entries) > 1 and (len(self._entries) > self.maxTimes or total > self.memoryBudget):
+            key, entry = self._entries.popitem(last=False)
+            total -= entry.memorySize
+            logger.debug(f'Data set of time {key[1]} evicted')
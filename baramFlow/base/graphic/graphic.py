@@ -14,16 +14,14 @@ from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkUnstructuredG
 from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
 
 from baramFlow.base.constants import FieldCategory, FieldType, VectorComponent
-from baramFlow.base.field import COORDINATE, VECTOR_COMPONENT_TEXTS, VELOCITY, Field, getFieldInstance
+from baramFlow.base.field import VECTOR_COMPONENT_TEXTS, VELOCITY, Field, getFieldInstance
 from baramFlow.base.scaffold.scaffolds_db import ScaffoldsDB
 from baramFlow.coredb import coredb
+from baramFlow.base.graphic.dataset_cache import DataSetCache
 from baramFlow.base.graphic.display_item import DisplayItem
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.graphic.color_scheme import ColormapScheme
-from baramFlow.openfoam.openfoam_reader import OpenFOAMReader
-from baramFlow.openfoam.solver_field import getSolverFieldName
 from libbaram.async_signal import AsyncSignal
-from libbaram.openfoam.polymesh import addCoordinateVector, collectInternalMesh
 
 
 class StreamlineIntegratorType(Enum):
@@ -281,18 +279,13 @@ class Graphic:
         return rMin, rMax
 
     async def updatePolyMesh(self):
-        async with OpenFOAMReader() as reader:
-            reader.setTimeValue(float(self.time))
-            await reader.update()
-            mBlock = reader.getOutput()
-
-        coordsFieldName = getSolverFieldName(COORDINATE)
-        self.polyMesh = await addCoordinateVector(mBlock, coordsFieldName)
-        self.internalMesh = await collectInternalMesh(self.polyMesh)
+        dataSet = await DataSetCache().get(self.time)
+        self.polyMesh = dataSet.polyMesh
+        self.internalMesh = dataSet.internalMesh
 
         for item in self.displayItems.values():
             scaffold = ScaffoldsDB().getScaffold(item.scaffoldUuid)
-            item.dataSet = await scaffold.getDataSet(self.polyMesh)
+            item.dataSet = await scaffold.getDataSet(self.polyMesh, self.internalMesh)
 
         self.rangeMin, self.rangeMax = self.getValueRange(self.useNodeValues, self.relevantScaffoldsOnly)
 
@@ -5,6 +5,7 @@ from threading import Lock
 from uuid import UUID, uuid4
 
 from baramFlow.coredb import coredb
+from baramFlow.base.graphic.dataset_cache import DataSetCache
 from baramFlow.base.graphic.graphic import Graphic
 
 from baramFlow.coredb.libdb import nsmap
@@ -53,6 +54,7 @@ class GraphicsDB:
             await self.removingReport.emit(report.uuid)
 
         self._reports = {}
+        DataSetCache().invalidate()
 
     async def _parseGraphics(self) -> dict[UUID, Graphic]:
         reports = {}
@@ -76,7 +78,11 @@ class GraphicsDB:
 
         return False
 
-    async def updatePolyMeshAll(self):
+    async def updatePolyMeshAll(self, invalidate=False):
+        """Update data sets of all the reports, reading them again if "invalidate" is True"""
+        if invalidate:
+            DataSetCache().invalidate()
+
         for report in self._reports.values():
             await report.updatePolyMesh()
 
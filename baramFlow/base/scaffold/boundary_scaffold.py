@@ -6,7 +6,7 @@ from dataclasses import field as dataClassField
 from uuid import UUID
 
 from lxml import etree
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkUnstructuredGrid
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.boundary_db import BoundaryDB
@@ -65,7 +65,7 @@ class BoundaryScaffold(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/boundaries' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         boundaries: list[tuple[str, str]] = []
 
         for bcid in self.boundaries:
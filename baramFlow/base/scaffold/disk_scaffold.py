@@ -5,14 +5,13 @@ from dataclasses import dataclass
 from lxml import etree
 from uuid import UUID
 
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkStaticCellLocator
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkStaticCellLocator, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkPointDataToCellData, vtkResampleWithDataSet
 from vtkmodules.vtkFiltersSources import vtkDiskSource
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.scaffold.scaffold import Scaffold
-from libbaram.openfoam.polymesh import collectInternalMesh
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -104,9 +103,7 @@ class DiskScaffold(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/diskScaffolds' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
-        mesh = await collectInternalMesh(mBlock)
-
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         disk = vtkDiskSource()
         disk.SetCenter(float(self.centerX), float(self.centerY), float(self.centerZ))
         disk.SetNormal(float(self.normalX), float(self.normalY), float(self.normalZ))
@@ -121,7 +118,7 @@ class DiskScaffold(Scaffold):
         resample.ComputeToleranceOff()  #  Computed tolerance is too small so that some field values are not interpolated
         resample.SetTolerance(1.0)  # "1.0" is the default value for "Tolerance" in vtkResampleWithDataSet
         resample.PassPartialArraysOn()
-        resample.SetSourceData(mesh)
+        resample.SetSourceData(internalMesh)
         resample.SetInputConnection(disk.GetOutputPort())
 
         p2c = vtkPointDataToCellData()
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from lxml import etree
 
-from vtkmodules.vtkCommonDataModel import vtkDataObject, vtkMultiBlockDataSet, vtkPolyData
+from vtkmodules.vtkCommonDataModel import vtkDataObject, vtkMultiBlockDataSet, vtkPolyData, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkArrayCalculator, vtkContourFilter
 
 from baramFlow.base.constants import FieldCategory, FieldType, VectorComponent
@@ -15,7 +15,6 @@ from baramFlow.coredb import coredb
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.scaffold.scaffold import Scaffold
 from baramFlow.openfoam.solver_field import getSolverFieldName
-from libbaram.openfoam.polymesh import collectInternalMesh
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -79,10 +78,8 @@ class IsoSurface(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/isoSurfaces' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         values = self._getValues()
-        mesh = await collectInternalMesh(mBlock)
-
         solverFieldName = getSolverFieldName(self.field)
         contour = vtkContourFilter()
         contour.ComputeNormalsOn()
@@ -91,7 +88,7 @@ class IsoSurface(Scaffold):
             calc = vtkArrayCalculator()
             calc.ReplaceInvalidValuesOn()
             calc.SetReplacementValue(0.0)
-            calc.SetInputData(mesh)
+            calc.SetInputData(internalMesh)
             calc.SetAttributeTypeToPointData()
             if self.fieldComponent == VectorComponent.MAGNITUDE:
                 calc.AddVectorArrayName(solverFieldName)
@@ -112,7 +109,7 @@ class IsoSurface(Scaffold):
             contour.SetInputConnection(calc.GetOutputPort())
             contour.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_POINTS, 'isoScalar')
         else:  # FieldType.SCALAR
-            contour.SetInputData(mesh)
+            contour.SetInputData(internalMesh)
             contour.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_POINTS, solverFieldName)
 
         for i, v in enumerate(values):
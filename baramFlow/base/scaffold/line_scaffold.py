@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from lxml import etree
 from uuid import UUID
 
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkPointDataToCellData
 from vtkmodules.vtkFiltersParallelDIY2 import vtkProbeLineFilter
 from vtkmodules.vtkFiltersSources import vtkLineSource
@@ -13,7 +13,6 @@ from vtkmodules.vtkFiltersSources import vtkLineSource
 from baramFlow.coredb import coredb
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.scaffold.scaffold import Scaffold
-from libbaram.openfoam.polymesh import collectInternalMesh
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -91,9 +90,7 @@ class LineScaffold(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/lineScaffolds' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
-        mesh = await collectInternalMesh(mBlock)
-
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         line = vtkLineSource()
         line.SetPoint1(float(self.point1X), float(self.point1Y), float(self.point1Z))
         line.SetPoint2(float(self.point2X), float(self.point2Y), float(self.point2Z))
@@ -101,7 +98,7 @@ class LineScaffold(Scaffold):
         line.SetResolution(1)
 
         probe = vtkProbeLineFilter()
-        probe.SetInputData(mesh)
+        probe.SetInputData(internalMesh)
         probe.SetSourceConnection(line.GetOutputPort())
         probe.SetSamplingPattern(vtkProbeLineFilter.SAMPLE_LINE_UNIFORMLY)
         probe.SetLineResolution(self.numberOfSamples)
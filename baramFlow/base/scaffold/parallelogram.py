@@ -5,14 +5,13 @@ from dataclasses import dataclass
 from lxml import etree
 from uuid import UUID
 
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkStaticCellLocator
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkStaticCellLocator, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkPointDataToCellData, vtkResampleWithDataSet
 from vtkmodules.vtkFiltersSources import vtkPlaneSource
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.scaffold.scaffold import Scaffold
-from libbaram.openfoam.polymesh import collectInternalMesh
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -110,9 +109,7 @@ class Parallelogram(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/parallelograms' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
-        mesh = await collectInternalMesh(mBlock)
-
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         plane = vtkPlaneSource()
         plane.SetOrigin(float(self.originX), float(self.originY), float(self.originZ))
         plane.SetPoint1(float(self.point1X), float(self.point1Y), float(self.point1Z))
@@ -126,7 +123,7 @@ class Parallelogram(Scaffold):
         resample.ComputeToleranceOff()  #  Computed tolerance is too small so that some field values are not interpolated
         resample.SetTolerance(1.0)  # "1.0" is the default value for "Tolerance" in vtkResampleWithDataSet
         resample.PassPartialArraysOn()
-        resample.SetSourceData(mesh)
+        resample.SetSourceData(internalMesh)
         resample.SetInputConnection(plane.GetOutputPort())
 
         p2c = vtkPointDataToCellData()
@@ -5,13 +5,12 @@ from dataclasses import dataclass
 from lxml import etree
 from uuid import UUID
 
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPlane, vtkPolyData
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPlane, vtkPolyData, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkCutter
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.scaffold.scaffold import Scaffold
-from libbaram.openfoam.polymesh import collectInternalMesh
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -83,15 +82,13 @@ class PlaneScaffold(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/planeScaffolds' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
-        mesh = await collectInternalMesh(mBlock)
-
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         plane = vtkPlane()
         plane.SetOrigin(float(self.originX), float(self.originY), float(self.originZ))
         plane.SetNormal(float(self.normalX), float(self.normalY), float(self.normalZ))
 
         cutter = vtkCutter()
-        cutter.SetInputData(mesh)
+        cutter.SetInputData(internalMesh)
         cutter.SetCutFunction(plane)
 
         await vtk_run_in_thread(cutter.Update)
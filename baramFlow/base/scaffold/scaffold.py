@@ -7,7 +7,7 @@ from enum import Enum
 from typing import ClassVar
 from uuid import UUID
 
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkUnstructuredGrid
 
 from libbaram.async_signal import AsyncSignal
 
@@ -50,7 +50,14 @@ class Scaffold:
     def removeElement(self):
         raise NotImplementedError
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
+        """Returns the data set of the scaffold
+
+        Args:
+            mBlock: Output of OpenFOAMReader with coordinate vectors
+            internalMesh: Internal meshes of all the regions collected from "mBlock",
+                shared by the scaffolds so that the cell locator built by VTK for it is reused
+        """
         raise NotImplementedError
 
     async def markUpdated(self):
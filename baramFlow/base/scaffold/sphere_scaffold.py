@@ -5,14 +5,13 @@ from dataclasses import dataclass
 from lxml import etree
 from uuid import UUID
 
-from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkStaticCellLocator
+from vtkmodules.vtkCommonDataModel import vtkMultiBlockDataSet, vtkPolyData, vtkStaticCellLocator, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkPointDataToCellData, vtkResampleWithDataSet
 from vtkmodules.vtkFiltersSources import vtkSphereSource
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.libdb import nsmap
 from baramFlow.base.scaffold.scaffold import Scaffold
-from libbaram.openfoam.polymesh import collectInternalMesh
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -84,9 +83,7 @@ class SphereScaffold(Scaffold):
     def removeElement(self):
         coredb.CoreDB().removeElement(Scaffold.SCAFFOLDS_PATH + '/sphereScaffolds' + self.xpath())
 
-    async def getDataSet(self, mBlock: vtkMultiBlockDataSet) -> vtkPolyData:
-        mesh = await collectInternalMesh(mBlock)
-
+    async def getDataSet(self, mBlock: vtkMultiBlockDataSet, internalMesh: vtkUnstructuredGrid) -> vtkPolyData:
         sphere = vtkSphereSource()
         sphere.SetCenter(float(self.centerX), float(self.centerY), float(self.centerZ))
         sphere.SetRadius(float(self.radius))
@@ -99,7 +96,7 @@ class SphereScaffold(Scaffold):
         resample.ComputeToleranceOff()  #  Computed tolerance is too small so that some field values are not interpolated
         resample.SetTolerance(1.0)  # "1.0" is the default value for "Tolerance" in vtkResampleWithDataSet
         resample.PassPartialArraysOn()
-        resample.SetSourceData(mesh)
+        resample.SetSourceData(internalMesh)
         resample.SetInputConnection(sphere.GetOutputPort())
 
         p2c = vtkPointDataToCellData()
@@ -1,14 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import tempfile
+from pathlib import Path
 from threading import Lock
 
+from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
 from PySide6.QtCore import Signal, QTimer, QObject
 
+from baramFlow.base.graphic.dataset_cache import DataSetCache
 from baramFlow.base.graphic.graphics_db import GraphicsDB
 from baramFlow.openfoam.openfoam_reader import OpenFOAMReader
 from libbaram.utils import rmtree
-from libbaram.openfoam.constants import CASE_DIRECTORY_NAME
+from libbaram.mpi import ParallelType
+from libbaram.openfoam.constants import CASE_DIRECTORY_NAME, Directory
 from libbaram.run import launchSolver, runParallelUtility, STDOUT_FILE_NAME, STDERR_FILE_NAME
 
 from .coredb import coredb
@@ -16,6 +21,7 @@ from .coredb.project import Project
 from .coredb.coredb_reader import CoreDBReader
 from .coredb.filedb import FileDB
 from .openfoam import parallel
+from .openfoam.batch_scheduler import BatchPacking, BatchScheduler, launchDryRunSolver
 from .openfoam.case_generator import CaseGenerator
 from .openfoam.file_system import FileSystem
 from .openfoam.solver import findSolver
@@ -86,6 +92,7 @@ class Case(QObject):
         await self._generator.setupCase()
         # await self._generator.initialize()
         self._generator = None
+        DataSetCache().invalidate()
 
     def cancel(self):
         if self._generator is not None:
@@ -103,6 +110,7 @@ class Case(QObject):
         self._generator.progress.connect(self.progress)
         await self._generator.setupCase()
         self._generator = None
+        DataSetCache().invalidate()
 
 
 class LiveCase(Case):
@@ -184,6 +192,8 @@ class LiveCase(Case):
         else:
             self._setStatus(SolverStatus.ENDED)
             self._stopMonitor()
+            # The solver may have rewritten fields of existing time directories
+            DataSetCache().invalidate()
 
 
 class BatchCase(Case):
@@ -195,6 +205,9 @@ class BatchCase(Case):
         self._parameters = parameters
 
         self._process = None
+        self._solver = None
+        self._parallel = None
+        self._dryRun = False
 
         self._status = self._project.getBatchStatus(name)
 
@@ -205,26 +218,62 @@ class BatchCase(Case):
         super().load()
 
     async def run(self, skipCaseGeneration=False):
+        await self.prepare()
+        await self.solve()
+
+    async def prepare(self, dryRun=False, coreBinding=True):
+        """Generate the case files, which requires the case to be loaded
+
+        coreBinding should be False when other cases run on the same machine at the same time.
+        """
         try:
             if FileSystem.caseRoot() != self._path:
                 raise RuntimeError
 
-            await self._generateCase()
+            if not dryRun:
+                await self._generateCase()
 
-            stdout = open(self._path / STDOUT_FILE_NAME, 'w')
-            stderr = open(self._path / STDERR_FILE_NAME, 'w')
+            self._solver = findSolver()
+            self._parallel = parallel.getEnvironment()
+            self._parallel.setCoreBinding(coreBinding)
+            self._dryRun = dryRun
+        except Exception as e:
+            self._setStatus(SolverStatus.ERROR)
+            raise e
 
-            self._process = await runParallelUtility(findSolver(), parallel=parallel.getEnvironment(), cwd=self._path,
-                                                     stdout=stdout, stderr=stderr)
-            self._setStatus(SolverStatus.RUNNING)
-            returncode = await self._process.wait()
-            self._process = None
+    async def solve(self):
+        """Run the solver on the files generated by "prepare", which can be done after another case is loaded"""
+        try:
+            with open(self._path / STDOUT_FILE_NAME, 'w') as stdout, open(self._path / STDERR_FILE_NAME, 'w') as stderr:
+                if self._dryRun:
+                    self._process = await launchDryRunSolver(self._parallel.np(), self._path, stdout, stderr)
+                else:
+                    self._process = await runParallelUtility(self._solver, parallel=self._parallel, cwd=self._path,
+                                                             stdout=stdout, stderr=stderr)
+                self._setStatus(SolverStatus.RUNNING)
+                returncode = await self._process.wait()
+                self._process = None
 
             self._setStatus(SolverStatus.ENDED if returncode == 0 else SolverStatus.ERROR)
         except Exception as e:
             self._setStatus(SolverStatus.ERROR)
             raise e
 
+    def setStopAt(self, stopAt):
+        """Ask the running solver to stop, as the Stop buttons do for the loaded case"""
+        path = self._path / Directory.SYSTEM_DIRECTORY_NAME / 'controlDict'
+        if self._process is None or not path.is_file():
+            return
+
+        controlDict = ParsedParameterFile(str(path), debug=False)
+        controlDict['stopAt'] = stopAt
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, dir=path.parent) as f:
+            f.write(str(controlDict))
+            p = Path(f.name)
+
+        p.replace(path)
+
     def kill(self):
         if self._process:
             self._process.terminate()
@@ -511,7 +560,7 @@ class CaseManager(QObject):
         self._generator = None
         self._batchProcess = None
         self._batchRunning = False
-        self._batchStop = False
+        self._batchScheduler = None
 
     def currentCaseName(self):
         return self._currentCase.name if self._currentCase else None
@@ -567,7 +616,7 @@ class CaseManager(QObject):
         return self._currentCase.status()
 
     def isBatchRunning(self):
-        return self._batchRunning and self.isRunning()
+        return self._batchRunning and (self.isRunning() or bool(self._batchScheduler.running()))
 
     def liveProcess(self):
         return self._liveCase.process()
@@ -576,21 +625,33 @@ class CaseManager(QObject):
         case = await self.loadLiveCase()
         await case.run(skipCaseGeneration)
 
-    async def batchRun(self, cases):
-        self._batchStop = False
-        self._batchRunning = True
-        for case in cases:
-            await self.loadBatchCase(case).run()
+    async def batchRun(self, cases, packing=BatchPacking.SEQUENTIAL, coreBudget=None, dryRun=False):
+        """Run batch cases, several at a time if packing is PACKED
 
-            if self._batchStop:
-                break
+        Each case uses the configured number of cores, which is fixed by the decomposition of the live case.
+        coreBudget defaults to the number of cores of this machine, or of one case for other parallel types.
+        In dry run, case files are not generated and a stub process that just sleeps runs in place of the solver.
+        """
+        if coreBudget is None and parallel.getParallelType() != ParallelType.LOCAL_MACHINE:
+            coreBudget = parallel.getNP()
 
-        self._batchRunning = False
+        async def prepare(case):
+            await self.loadBatchCase(case).prepare(dryRun, self._batchScheduler.concurrency() == 1)
+
+        async def solve(case):
+            await case.solve()
+
+        self._batchRunning = True
+        self._batchScheduler = BatchScheduler(parallel.getNP(), coreBudget, packing)
+        try:
+            await self._batchScheduler.run(cases, prepare, solve)
+        finally:
+            self._batchRunning = False
 
         async with OpenFOAMReader() as reader:
             await reader.setupReader()
 
-        await GraphicsDB().updatePolyMeshAll()
+        await GraphicsDB().updatePolyMeshAll(invalidate=True)
 
     async def podRunGenerateROM(self, listCaseName, isBatchRunning=False):
         tempPodCase = PODCase()
@@ -644,12 +705,22 @@ class CaseManager(QObject):
         if self._currentCase:
             self._currentCase.kill()
 
+        if self._batchRunning:
+            for case in self._batchScheduler.running():
+                case.kill()
+
     def cancel(self):
         if self._currentCase:
             self._currentCase.cancel()
 
-    def stopBatchRun(self):
-        self._batchStop = True
+    def stopBatchRun(self, stopAt=None):
+        """Stop scheduling batch cases, passing stopAt to the controlDict of the cases running"""
+        if self._batchScheduler is not None:
+            self._batchScheduler.stop()
+            if stopAt is not None:
+                for case in self._batchScheduler.running():
+                    case.setStopAt(stopAt)
+
         self.cancel()
 
     def clearCases(self):
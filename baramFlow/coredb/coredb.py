@@ -5,6 +5,9 @@ from __future__ import annotations
 
 import copy
 import logging
+import re
+import threading
+from contextlib import contextmanager
 from typing import Optional
 
 from lxml import etree
@@ -22,6 +25,19 @@ from .libdb import nsmap, ns, DBError, ValueException
 
 __instance: Optional[_CoreDB] = None
 
+# Snapshots read by CoreDB() in the threads reading them
+_threadSnapshot = threading.local()
+
+_POSITION_PATTERN = re.compile(r'\[\d+\]')
+
+# Entities whose elements are journaled together when any of them is returned in transactions,
+# in addition to the elements declared globally in the schema and the top level sections
+_SCOPE_TAGS = {f'{{{ns}}}region', f'{{{ns}}}material'}
+
+# Journaling an element costs about ten times as much as copying it,
+# so the whole configuration is copied instead when scopes returned in a transaction get larger than this
+_MAX_JOURNALED_ELEMENTS = 10000
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +47,9 @@ class Cancel(Exception):
 
 def CoreDB():
     global __instance
+    if (snapshot := threadSnapshot()) is not None:
+        return snapshot
+
     assert(__instance is not None)
 
     return __instance
@@ -66,6 +85,106 @@ def destroy():
     __instance = None
 
 
+def snapshot() -> _CoreDB:
+    """Returns a copy of the configuration that other threads can read while the configuration is modified"""
+    db = copy.copy(CoreDB())
+    db._xmlTree = copy.deepcopy(db._xmlTree)
+    db._journal = None
+    db._journaledScopes = None
+    db._backupTree = None
+
+    return db
+
+
+@contextmanager
+def readingSnapshot(db: _CoreDB):
+    """CoreDB() and CoreDBReader() read the snapshot in the block, only in the thread running the block"""
+    _threadSnapshot.db = db
+    try:
+        yield db
+    finally:
+        _threadSnapshot.db = None
+
+
+def threadSnapshot() -> Optional[_CoreDB]:
+    return getattr(_threadSnapshot, 'db', None)
+
+
+class _ElementImage:
+    """Shallow state of an element, its text, attributes and list of children, to be restored on rollback
+
+    Descendants keep their own states, so restoring the images of all the modified elements
+    restores the whole configuration.
+    """
+    def __init__(self, element):
+        self._element = element
+        self._text = element.text
+        self._tail = element.tail
+        self._attributes = dict(element.attrib)
+        self._children = list(element)
+
+    def restore(self):
+        # Elements recorded but not modified are left alone, since clearing an element detaches its whole subtree
+        if (self._element.text == self._text and self._element.tail == self._tail
+                and self._element.attrib == self._attributes and list(self._element) == self._children):
+            return
+
+        self._element.clear()
+        self._element.text = self._text
+        self._element.tail = self._tail
+        for name, value in self._attributes.items():
+            self._element.set(name, value)
+        self._element.extend(self._children)
+
+
+class _ValueType:
+    """Schema information needed to get and validate values of elements declared at an element path"""
+    NUMBER_LIST = 'numberList'
+    NUMBER = 'number'
+    STRING = 'string'
+
+    def __init__(self, schema):
+        type_ = schema.type
+
+        self.batchParameterAllowed = type_.is_complex() and 'batchParameter' in type_.attributes
+
+        self.integer = False
+        self.double = False
+        self.minInclusive = None
+        self.maxInclusive = None
+        self.minExclusive = None
+        self.maxExclusive = None
+        self.enumeration = None
+        self.patterns = []
+
+        if type_.local_name == 'inputNumberListType':
+            self.kind = self.NUMBER_LIST
+        elif type_.is_derived(type_.maps.types[XSD_DOUBLE]):  # The case when the type has restrictions or attributes
+            self.kind = self.NUMBER
+            self.double = True
+            self.minInclusive = getattr(type_.base_type.get_facet(XSD_MIN_INCLUSIVE), 'value', None)
+            self.maxInclusive = getattr(type_.base_type.get_facet(XSD_MAX_INCLUSIVE), 'value', None)
+            self.minExclusive = getattr(type_.base_type.get_facet(XSD_MIN_EXCLUSIVE), 'value', None)
+            self.maxExclusive = getattr(type_.base_type.get_facet(XSD_MAX_EXCLUSIVE), 'value', None)
+        elif type_.is_decimal():
+            self.kind = self.NUMBER
+            if type_.is_simple():
+                name = type_.local_name.lower()
+                self.minInclusive = type_.min_value
+                self.maxInclusive = type_.max_value
+            else:
+                name = type_.content.primitive_type.local_name.lower()
+                self.minInclusive = type_.content.min_value
+                self.maxInclusive = type_.content.max_value
+            self.integer = 'integer' in name
+        else:
+            self.kind = self.STRING
+            if type_.is_restriction():
+                self.enumeration = type_.enumeration
+                if type_.patterns is not None:
+                    self.patterns = type_.patterns.patterns
+
+
 class _CoreDB(object):
     CONFIGURATION_ROOT = 'configurations'
     XSD_PATH = f'{CONFIGURATION_ROOT}/baram.cfg.xsd'
@@ -97,30 +216,48 @@ class _CoreDB(object):
         self._configCountAtSave = self._configCount
         self._inContext = False
         self._backupTree = None
+        self._journal: Optional[dict[etree.Element, _ElementImage]] = None
+        self._journaledScopes: Optional[set[etree.Element]] = None
         self._lastError = None
         self._lastNote = None
+        self._validationDeferred = 0
+        self._validationPending = False
+        self._valueTypes: dict[str, Optional[_ValueType]] = {}
+        self._valueTypeLock = threading.Lock()   # Snapshots share the cache, and are read in other threads
+        self._valueTypeHits = 0
+        self._valueTypeMisses = 0
 
         self._schema = xmlschema.XMLSchema(resource.file(self.XSD_PATH))
 
         xsdTree = etree.parse(resource.file(self.XSD_PATH))
         self._xmlSchema = etree.XMLSchema(etree=xsdTree)
+        # Elements declared globally in the schema can be validated apart from the configuration tree
+        self._globalElements = set(f'{{{ns}}}{e.get("name")}'
+                                   for e in xsdTree.getroot().iterfind('{http://www.w3.org/2001/XMLSchema}element'))
         self._xmlParser = etree.XMLParser(schema=self._xmlSchema)
 
         self._xmlTree = None
 
     def __enter__(self):
         logger.debug('enter')
-        self._backupTree = copy.deepcopy(self._xmlTree)
+        self._journal = {}
+        self._journaledScopes = set()
         self._lastError = None
         self._inContext = True
         return self
 
     def __exit__(self, eType, eValue, eTraceback):
         if self._lastError is not None or eType is not None:
-            self._xmlTree = self._backupTree
+            if self._backupTree is None:
+                for image in self._journal.values():
+                    image.restore()
+            else:
+                self._xmlTree = self._backupTree
 
         self._lastError = None
         self._backupTree = None
+        self._journal = None
+        self._journaledScopes = None
         self._inContext = False
 
         if eType == Cancel:
@@ -130,6 +267,29 @@ class _CoreDB(object):
             logger.debug('exit without error')
             return None
 
+    @contextmanager
+    def deferredValidation(self):
+        """Validates the configuration once at the end of the block instead of on every modification
+
+        Use it for a large number of modifications, like adding boundary conditions of a mesh.
+        Combined with "with" context of CoreDB, modifications are rolled back when the validation fails.
+
+        Raises:
+            DocumentInvalid: The configuration is not valid at the end of the block
+        """
+        self._validationDeferred += 1
+        try:
+            yield self
+        finally:
+            self._validationDeferred -= 1
+            pending = self._validationPending and self._validationDeferred == 0
+            if self._validationDeferred == 0:
+                # Not validated when the block raises, and not left pending for the next validation either
+                self._validationPending = False
+
+        if pending:
+            self._xmlSchema.assertValid(self._xmlTree)
+
     def getAttribute(self, xpath: str, name: str) -> str:
         """Returns attribute value on specified configuration path.
 
@@ -180,6 +340,7 @@ class _CoreDB(object):
             raise LookupError
 
         oldValue = elements[0].get(name)
+        self._record(elements[0])
         elements[0].set(name, value)
         if value != oldValue:
             self._configCount += 1
@@ -200,17 +361,11 @@ class _CoreDB(object):
         Raises:
             LookupError: Less or more than one item are matched
         """
-        element = self.getElement(xpath)
+        element = self._findElement(xpath)
         if parameter := element.get('batchParameter'):
             return '$' + parameter
 
-        path = self._xmlTree.getelementpath(element)
-        schema = self._schema.find('/{http://www.baramcfd.org/baram}configuration/' + path, namespaces=nsmap)
-
-        if schema is None:
-            raise LookupError
-
-        if not schema.type.has_simple_content():
+        if self._valueType(element) is None:
             raise LookupError
 
         logger.debug(f'getValue( {xpath} -> {element.text} )')
@@ -235,21 +390,16 @@ class _CoreDB(object):
             ValueError: Invalid configuration value by program
             DBValueException: Invalid configuration value by user
         """
-        element = self.getElement(xpath)
-
-        path = self._xmlTree.getelementpath(element)
-        schema = self._schema.find('/{http://www.baramcfd.org/baram}configuration/' + path, namespaces=nsmap)
-
-        if schema is None:
-            raise LookupError
+        element = self._findElement(xpath)
 
-        if not schema.type.has_simple_content():
+        valueType = self._valueType(element)
+        if valueType is None:
             raise LookupError
 
         batchParameter = None
         value = value.strip()
 
-        if schema.type.is_complex() and 'batchParameter' in schema.type.attributes:
+        if valueType.batchParameterAllowed:
             if value and value[0] == '$':
                 batchParameter = value[1:]
                 batchParameterXPath = f'/runCalculation/batch/parameters/parameter[name="{batchParameter}"]'
@@ -260,7 +410,7 @@ class _CoreDB(object):
                 else:
                     batchParameter = None
 
-        if schema.type.local_name == 'inputNumberListType':
+        if valueType.kind == _ValueType.NUMBER_LIST:
             numbers = value.split()
             # To check if the strings in value are valid numbers
             # 'ValueError' exception is raised if invalid number found
@@ -272,80 +422,34 @@ class _CoreDB(object):
 
             return element, ' '.join(numbers), None
 
-        elif schema.type.is_derived(schema.type.maps.types[XSD_DOUBLE]):  # The case when the type has restrictions or attributes
+        elif valueType.kind == _ValueType.NUMBER:
             try:
-                decimal = float(value)
+                decimal = int(value) if valueType.integer else float(value)
             except ValueError:
-                self._lastError = DBError.FLOAT_ONLY
-                raise ValueException(DBError.FLOAT_ONLY, self._lastNote)
-
-            if (minValue := getattr(schema.type.base_type.get_facet(XSD_MIN_INCLUSIVE), 'value', None)) is not None:
-                if decimal < minValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
-
-            if (maxValue := getattr(schema.type.base_type.get_facet(XSD_MAX_INCLUSIVE), 'value', None)) is not None:
-                if decimal > maxValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
-
-            if (minValue := getattr(schema.type.base_type.get_facet(XSD_MIN_EXCLUSIVE), 'value', None)) is not None:
-                if decimal <= minValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
-
-            if (maxValue := getattr(schema.type.base_type.get_facet(XSD_MAX_EXCLUSIVE), 'value', None)) is not None:
-                if decimal >= maxValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
-
-            return element, value.lower(), batchParameter
-
-        elif schema.type.is_decimal():
-            if schema.type.is_simple():
-                name = schema.type.local_name.lower()
-                minValue = schema.type.min_value
-                maxValue = schema.type.max_value
-            else:
-                name = schema.type.content.primitive_type.local_name.lower()
-                minValue = schema.type.content.min_value
-                maxValue = schema.type.content.max_value
-
-            if 'integer' in name:
-                try:
-                    decimal = int(value)
-                except ValueError:
-                    self._lastError = DBError.INTEGER_ONLY
-                    raise ValueException(DBError.INTEGER_ONLY, self._lastNote)
-            else:
-                try:
-                    decimal = float(value)
-                except ValueError:
-                    self._lastError = DBError.FLOAT_ONLY
-                    raise ValueException(DBError.FLOAT_ONLY, self._lastNote)
-
-            if minValue is not None and decimal < minValue:
+                error = DBError.INTEGER_ONLY if valueType.integer else DBError.FLOAT_ONLY
+                self._lastError = error
+                raise ValueException(error, self._lastNote)
+
+            if ((valueType.minInclusive is not None and decimal < valueType.minInclusive)
+                    or (valueType.maxInclusive is not None and decimal > valueType.maxInclusive)
+                    or (valueType.minExclusive is not None and decimal <= valueType.minExclusive)
+                    or (valueType.maxExclusive is not None and decimal >= valueType.maxExclusive)):
                 self._lastError = DBError.OUT_OF_RANGE
                 raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if maxValue is not None and decimal > maxValue:
-                self._lastError = DBError.OUT_OF_RANGE
-                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
-
-            return element, value.lower(), None
+            # Batch parameters are available only for the types derived from double
+            return element, value.lower(), batchParameter if valueType.double else None
 
         # String
         # For now, string value is set only by VIEW code not by user.
         # Therefore, raising exception(not returning value) is reasonable.
         else:
-            if schema.type.is_restriction():
-                if schema.type.enumeration is not None and value not in schema.type.enumeration:
-                    raise ValueError
+            if valueType.enumeration is not None and value not in valueType.enumeration:
+                raise ValueError
 
-                if schema.type.patterns is not None:
-                    for p in schema.type.patterns.patterns:
-                        if p.match(value) is None:
-                            raise ValueError
+            for p in valueType.patterns:
+                if p.match(value) is None:
+                    raise ValueError
 
             return element, value, None
 
@@ -365,6 +469,7 @@ class _CoreDB(object):
         """
         self._lastNote = note
         element, value, parameter = self.validate(xpath, value)
+        self._record(element)
 
         if element.text != value:
             if element.text or value:     # the case of (element.text=='' and oldValue is None) happens because of XML processing
@@ -374,7 +479,7 @@ class _CoreDB(object):
 
         logger.debug(f'setValue( {xpath} -> {element.text} )')
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(element)
 
         if element.get('batchParameter') != parameter:
             if parameter:
@@ -438,11 +543,12 @@ class _CoreDB(object):
         if len(elements) != 1:
             raise LookupError
 
+        self._record(elements[0])
         elements[0].clear()
         _setBulkInternal(elements[0], value)
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(elements[0])
 
     def getBulk(self, xpath: str) -> dict:
         """Get the value at the specified path
@@ -493,7 +599,7 @@ class _CoreDB(object):
         return _getBulkInternal(elements[0])
 
     def availableID(self, xpath, attribute):
-        idList = [e.get(attribute) for e in self.getElements(xpath)]
+        idList = [e.get(attribute) for e in self._xmlTree.findall(xpath, namespaces=nsmap)]
         index = 1
         while str(index) in idList:
             index += 1
@@ -520,6 +626,7 @@ class _CoreDB(object):
 
     def clearRegions(self):
         parent = self._xmlTree.find('/regions', namespaces=nsmap)
+        self._record(parent)
         parent.clear()
 
     def addCellZone(self, rname: str, zname: str) -> int:
@@ -528,7 +635,8 @@ class _CoreDB(object):
         if zone is not None:
             raise FileExistsError
 
-        idList = self._xmlTree.xpath(f'/x:configuration/x:regions/x:region/x:cellZones/x:cellZone/@czid', namespaces={'x': ns})
+        idList = set(self._xmlTree.xpath(f'/x:configuration/x:regions/x:region/x:cellZones/x:cellZone/@czid',
+                                         namespaces={'x': ns}))
 
         for index in range(1, self.CELL_ZONE_MAX_INDEX):
             if str(index) not in idList:
@@ -544,11 +652,12 @@ class _CoreDB(object):
         zone.find('name', namespaces=nsmap).text = zname
         zone.attrib['czid'] = str(index)
 
+        self._record(cellZones)
         cellZones.append(zone)
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(zone)
 
         return index
 
@@ -568,7 +677,8 @@ class _CoreDB(object):
         if bc is not None:
             raise FileExistsError
 
-        idList = self._xmlTree.xpath(f'/x:configuration/x:regions/x:region/x:boundaryConditions/x:boundaryCondition/@bcid', namespaces={'x': ns})
+        idList = set(self._xmlTree.xpath(f'/x:configuration/x:regions/x:region/x:boundaryConditions/x:boundaryCondition/@bcid',
+                                         namespaces={'x': ns}))
 
         for index in range(1, self.BOUNDARY_CONDITION_MAX_INDEX):
             if str(index) not in idList:
@@ -588,11 +698,12 @@ class _CoreDB(object):
 
         bc.find('physicalType', namespaces=nsmap).text = physicalType
 
+        self._record(parent)
         parent.append(bc)
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(bc)
 
         return index
 
@@ -614,11 +725,12 @@ class _CoreDB(object):
                  e.find('physicalType', namespaces=nsmap).text) for e in elements]
 
     def copyBoundaryConditions(self, sourceID, targetID):
-        old = self.getElement(f'regions/region/boundaryConditions/boundaryCondition[@bcid="{targetID}"]')
-        new = copy.deepcopy(self.getElement(f'regions/region/boundaryConditions/boundaryCondition[@bcid="{sourceID}"]'))
+        old = self._findElement(f'regions/region/boundaryConditions/boundaryCondition[@bcid="{targetID}"]')
+        new = copy.deepcopy(self._findElement(f'regions/region/boundaryConditions/boundaryCondition[@bcid="{sourceID}"]'))
         new.set('bcid', str(targetID))
         new.find('name', namespaces=nsmap).text = old.find('name', namespaces=nsmap).text
         new.find('geometricalType', namespaces=nsmap).text = old.find('geometricalType', namespaces=nsmap).text
+        self._record(old.getparent())
         old.getparent().replace(old, new)
 
     def hasMesh(self):
@@ -639,11 +751,12 @@ class _CoreDB(object):
         forceTree = etree.parse(resource.file(self.FORCE_MONITOR_PATH), self._xmlParser)
         forceTree.find('name', namespaces=nsmap).text = monitorName
 
+        self._record(parent)
         parent.append(forceTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(forceTree.getroot())
 
         return monitorName
 
@@ -653,6 +766,7 @@ class _CoreDB(object):
             raise LookupError
 
         parent = self._xmlTree.find(f'/monitors/forces', namespaces=nsmap)
+        self._record(parent)
         parent.remove(monitor)
 
         self._configCount += 1
@@ -663,6 +777,7 @@ class _CoreDB(object):
 
     def clearForceMonitors(self):
         parent = self._xmlTree.find('/monitors/forces', namespaces=nsmap)
+        self._record(parent)
         parent.clear()
 
     def addPointMonitor(self) -> str:
@@ -680,11 +795,12 @@ class _CoreDB(object):
         pointTree = etree.parse(resource.file(self.POINT_MONITOR_PATH), self._xmlParser)
         pointTree.find('name', namespaces=nsmap).text = monitorName
 
+        self._record(parent)
         parent.append(pointTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(pointTree.getroot())
 
         return monitorName
 
@@ -694,6 +810,7 @@ class _CoreDB(object):
             raise LookupError
 
         parent = self._xmlTree.find(f'/monitors/points', namespaces=nsmap)
+        self._record(parent)
         parent.remove(monitor)
 
         self._configCount += 1
@@ -704,6 +821,7 @@ class _CoreDB(object):
 
     def clearPointMonitors(self):
         parent = self._xmlTree.find('/monitors/points', namespaces=nsmap)
+        self._record(parent)
         parent.clear()
 
     def addSurfaceMonitor(self) -> str:
@@ -721,11 +839,12 @@ class _CoreDB(object):
         surfaceTree = etree.parse(resource.file(self.SURFACE_MONITOR_PATH), self._xmlParser)
         surfaceTree.find('name', namespaces=nsmap).text = monitorName
 
+        self._record(parent)
         parent.append(surfaceTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(surfaceTree.getroot())
 
         return monitorName
 
@@ -735,6 +854,7 @@ class _CoreDB(object):
             raise LookupError
 
         parent = self._xmlTree.find(f'/monitors/surfaces', namespaces=nsmap)
+        self._record(parent)
         parent.remove(monitor)
 
         self._configCount += 1
@@ -745,6 +865,7 @@ class _CoreDB(object):
 
     def clearSurfacesMonitors(self):
         parent = self._xmlTree.find('/monitors/surfaces', namespaces=nsmap)
+        self._record(parent)
         parent.clear()
 
     def addVolumeMonitor(self) -> str:
@@ -762,11 +883,12 @@ class _CoreDB(object):
         volumeTree = etree.parse(resource.file(self.VOLUME_MONITOR_PATH), self._xmlParser)
         volumeTree.find('name', namespaces=nsmap).text = monitorName
 
+        self._record(parent)
         parent.append(volumeTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(volumeTree.getroot())
 
         return monitorName
 
@@ -776,6 +898,7 @@ class _CoreDB(object):
             raise LookupError
 
         parent = self._xmlTree.find(f'/monitors/volumes', namespaces=nsmap)
+        self._record(parent)
         parent.remove(monitor)
 
         self._configCount += 1
@@ -786,6 +909,7 @@ class _CoreDB(object):
 
     def clearVolumeMonitors(self):
         parent = self._xmlTree.find('/monitors/volumes', namespaces=nsmap)
+        self._record(parent)
         parent.clear()
 
     def clearMonitors(self):
@@ -836,9 +960,10 @@ class _CoreDB(object):
         if parent is None:
             raise LookupError
 
+        self._record(parent)
         parent.append(etree.fromstring(text))
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(parent)
 
         self._configCount += 1
 
@@ -847,9 +972,10 @@ class _CoreDB(object):
         if parent is None:
             raise LookupError
 
+        self._record(parent)
         parent.append(element)
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(parent)
 
         self._configCount += 1
 
@@ -859,6 +985,7 @@ class _CoreDB(object):
             return
 
         parent = self._xmlTree.find(xpath+'/..', namespaces=nsmap)
+        self._record(parent)
         parent.remove(element)
 
         self._configCount += 1
@@ -868,6 +995,7 @@ class _CoreDB(object):
         if element is None:
             raise LookupError
 
+        self._record(element)
         element.clear()
 
     def getList(self, xpath) -> list[str]:
@@ -945,15 +1073,146 @@ class _CoreDB(object):
         self._configCountAtSave = self._configCount
 
     def getElement(self, xpath):
+        element = self._findElement(xpath)
+        self._recordScopes([element])
+
+        return element
+
+    def getElements(self, xpath):
+        elements = self._xmlTree.findall(xpath, namespaces=nsmap)
+        self._recordScopes(elements)
+
+        return elements
+
+    def _findElement(self, xpath):
         element = self._xmlTree.find(xpath, namespaces=nsmap)
         if element is None:
             raise LookupError
 
         return element
 
-    def getElements(self, xpath):
-        return self._xmlTree.findall(xpath, namespaces=nsmap)
+    def _record(self, element):
+        """Keeps the state of the element before its first modification in the transaction"""
+        if self._journal is not None and element not in self._journal:
+            self._journal[element] = _ElementImage(element)
+
+    def _recordScopes(self, elements):
+        """Keeps the states of the elements that can be modified through the elements returned in the transaction
+
+        Callers modify the elements, their descendants and the elements around them, like their siblings or parents.
+        The scope of an element is the nearest entity containing it, like a boundary condition or a region,
+        whose descendants and ancestors are recorded.
+        The whole configuration is copied instead when the scopes are too large to journal.
+        """
+        if self._journal is None:
+            return
+
+        scopes = {}
+        size = len(self._journal)
+        for element in elements:
+            scope = element
+            while (scope.tag not in self._globalElements and scope.tag not in _SCOPE_TAGS
+                   and scope.getparent() is not None and scope.getparent().getparent() is not None):
+                scope = scope.getparent()
+
+            if scope in self._journaledScopes or scope in scopes:
+                continue
+
+            if scope.getparent() is None:
+                self._backup()
+                return
+
+            scopes[scope] = list(scope.iter(etree.Element))
+            size += len(scopes[scope])
+            if size > _MAX_JOURNALED_ELEMENTS:
+                self._backup()
+                return
+
+        for scope, descendants in scopes.items():
+            self._journaledScopes.add(scope)
+            for e in descendants:
+                self._record(e)
+            for e in scope.iterancestors():
+                self._record(e)
+
+    def _backup(self):
+        """Copies the configuration at the beginning of the transaction
+
+        Modifications so far are undone to make the copy, and then redone.
+        """
+        images = [(image, _ElementImage(element)) for element, image in self._journal.items()]
+        for before, _ in images:
+            before.restore()
+
+        self._backupTree = copy.deepcopy(self._xmlTree)
+
+        for _, after in images:
+            after.restore()
+
+        self._journal = None
+
+    @property
+    def valueTypeHitRate(self) -> float:
+        """Hit rate of the cache of schema lookups by getValue() and validate(), for profiling"""
+        lookups = self._valueTypeHits + self._valueTypeMisses
+        return self._valueTypeHits / lookups if lookups else 0
+
+    def _valueType(self, element) -> Optional[_ValueType]:
+        """Returns schema information of the element, or None if it is not a value element
+
+        The schema is looked up once for each element path without position predicates,
+        like "regions/region/boundaryConditions/boundaryCondition/physicalType",
+        since all the elements at the path have the same declaration.
+        The cache does not need invalidation by changes of the configuration.
+        """
+        path = _POSITION_PATTERN.sub('', self._xmlTree.getelementpath(element))
+        with self._valueTypeLock:
+            if path in self._valueTypes:
+                self._valueTypeHits += 1
+                return self._valueTypes[path]
+
+            self._valueTypeMisses += 1
+
+            valueType = None
+            schema = self._schema.find('/{http://www.baramcfd.org/baram}configuration/' + path, namespaces=nsmap)
+            if schema is not None and schema.type.has_simple_content():
+                valueType = _ValueType(schema)
+
+            self._valueTypes[path] = valueType
+
+            return valueType
 
     def increaseConfigCount(self):
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._validate(self._xmlTree.getroot())
         self._configCount += 1
+
+    def _validate(self, element):
+        """Validates the smallest subtree containing the element that can be validated by itself
+
+        The subtree is the nearest ancestor-or-self declared globally in the schema, like a boundary condition.
+        A leaf element out of such subtrees is validated by its declaration,
+        and the whole configuration is validated only for other elements.
+        Validation is postponed to the end of deferredValidation() block.
+
+        Raises:
+            DocumentInvalid: The subtree is not valid
+        """
+        if self._validationDeferred:
+            self._validationPending = True
+            return
+
+        scope = element
+        while scope.tag not in self._globalElements:
+            scope = scope.getparent()
+
+        if scope.getparent() is not None:
+            self._xmlSchema.assertValid(scope)
+        elif len(element) == 0 and element.getparent() is not None:
+            path = self._xmlTree.getelementpath(element)
+            schema = self._schema.find('/{http://www.baramcfd.org/baram}configuration/' + path, namespaces=nsmap)
+            if schema is None:
+                self._xmlSchema.assertValid(self._xmlTree)
+            elif error := next(schema.iter_errors(element), None):
+                raise etree.DocumentInvalid(error.reason)
+        else:
+            self._xmlSchema.assertValid(self._xmlTree)
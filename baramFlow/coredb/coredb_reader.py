@@ -157,6 +157,16 @@ class CoreDBReader(_CoreDB):
         self._xmlTree = coredb.CoreDB()._xmlTree
         self._arguments = self.getBatchDefaults()
 
+    @property
+    def _xmlTree(self):
+        # Threads reading a snapshot of CoreDB read the snapshot through the reader too
+        snapshot = coredb.threadSnapshot()
+        return self._tree if snapshot is None else snapshot._xmlTree
+
+    @_xmlTree.setter
+    def _xmlTree(self, tree):
+        self._tree = tree
+
     def reloadCoreDB(self):
         self._xmlTree = coredb.CoreDB()._xmlTree
 
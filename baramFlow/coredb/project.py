@@ -37,6 +37,9 @@ class SettingKey(Enum):
     PARALLEL_TYPE = 'parallel_type'
     HOSTFILE = 'hostfile'
     BATCH_STATUS = 'batch_status'
+    BATCH_PACKING = 'batch_packing'
+    BATCH_CORE_BUDGET = 'batch_core_budget'
+    REDISTRIBUTION_CONCURRENCY = 'redistribution_concurrency'
 
 
 class _Project(QObject):
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import logging
+import os
+import sys
+from enum import Enum, auto
+from pathlib import Path
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+DRY_RUN_SECONDS = 1
+
+# Stands in for the solver in dry runs, printing the number of cores it would use
+_DRY_RUN_SOLVER = 'import sys, time; print(f"Dry run on {sys.argv[1]} cores", flush=True); time.sleep(float(sys.argv[2]))'
+
+
+class BatchPacking(Enum):
+    SEQUENTIAL = auto()     # One case at a time, as many cores as configured
+    PACKED = auto()         # As many cases at a time as the core budget allows
+
+
+def defaultCoreBudget() -> int:
+    return os.cpu_count() or 1
+
+
+async def launchDryRunSolver(np: int, cwd: Path, stdout, stderr, seconds=None):
+    return await asyncio.create_subprocess_exec(
+        sys.executable, '-c', _DRY_RUN_SOLVER, str(np), str(DRY_RUN_SECONDS if seconds is None else seconds),
+        cwd=cwd, stdout=stdout, stderr=stderr)
+
+
+class BatchScheduler:
+    """Runs batch cases in slots of a core budget
+
+    Each case is prepared and then solved.
+    Preparing is done one case at a time because it loads the case into the CoreDB and the file system.
+    Solvers of prepared cases run concurrently while the sum of their cores fits in the budget.
+    Cases are not started any more once the scheduler is stopped or a case raises an exception,
+    and the exception is raised after all the running solvers finish.
+    """
+    def __init__(self, np: int, budget: int = None, packing=BatchPacking.SEQUENTIAL):
+        self._np = max(np, 1)
+        self._budget = defaultCoreBudget() if budget is None else budget
+        self._packing = packing
+
+        self._running = []
+        self._stopped = False
+
+    def concurrency(self) -> int:
+        if self._packing == BatchPacking.SEQUENTIAL:
+            return 1
+
+        return max(1, self._budget // self._np)
+
+    def running(self) -> list:
+        return list(self._running)
+
+    def isStopped(self):
+        return self._stopped
+
+    def stop(self):
+        self._stopped = True
+
+    async def run(self, cases, prepare: Callable[[object], Awaitable], solve: Callable[[object], Awaitable]):
+        self._stopped = False
+        slots = asyncio.Semaphore(self.concurrency())
+        tasks = []
+
+        async def solveInSlot(case):
+            self._running.append(case)
+            try:
+                await solve(case)
+            finally:
+                self._running.remove(case)
+                slots.release()
+
+        def failed():
+            return any(t.done() and not t.cancelled() and t.exception() for t in tasks)
+
+        try:
+            for case in cases:
+                await slots.acquire()
+                if self._stopped or failed():
+                    slots.release()
+                    break
+
+                try:
+                    await prepare(case)
+                except Exception:
+                    slots.release()
+                    raise
+
+                # A case stopped while being prepared is not solved
+                if self._stopped:
+                    slots.release()
+                    break
+
+                logger.debug(f'Batch case started, {len(self._running) + 1} of {self.concurrency()} slots in use')
+                tasks.append(asyncio.create_task(solveInSlot(case)))
+        finally:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
@@ -5,9 +5,8 @@ from enum import Enum, auto
 from math import sqrt
 import logging
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile, DataClass
+from libbaram.openfoam.field_file import FieldFile, fieldFilePath
 
 from baramFlow.base.material.material import UNIVERSAL_GAS_CONSTANT
 from baramFlow.coredb.boundary_db import WallMotion, BoundaryDB, FlowDirectionSpecificationMethod
@@ -46,16 +45,17 @@ class BoundaryCondition(DictionaryFile):
             self._fieldsData = None
             return self
 
-        path = self.fullPath(self._processorNo)
-        if path.is_file():
-            self._fieldsData = ParsedParameterFile(str(path), debug=None)
+        # Only boundaryField is updated, without parsing internalField that can be huge after running
+        if path := fieldFilePath(self.fullPath(self._processorNo)):
+            self._fieldsData = FieldFile(path)
 
             for name, builded in self._data['boundaryField'].items():
-                loaded = self._fieldsData.content['boundaryField'][name]
-                if loaded['type'] == builded['type'] == 'fixedValue' and not loaded['value'].isUniform():
+                value = self._fieldsData.entry(name, 'value')
+                if (self._fieldsData.entry(name, 'type') == builded['type'] == 'fixedValue'
+                        and value is not None and not value.startswith('uniform')):
                     builded['value'] = None
 
-                loaded.update({k: v for k, v in builded.items() if v is not None})
+                self._fieldsData.updatePatch(name, builded)
 
         return self
 
@@ -71,13 +71,12 @@ class BoundaryCondition(DictionaryFile):
 
     def write(self):
         if self._fieldsData:
-            self._fieldsData.writeFile()
+            self._fieldsData.write()
         elif self._data:
             self._write(self._processorNo)
 
     def _initialValueByTime(self):
-        path = self.fullPath(self._processorNo)
-        if self._time == '0' or not path.is_file():
+        if self._time == '0' or not fieldFilePath(self.fullPath(self._processorNo)):
             return 'uniform', self._initialValue
         else:
             return None
@@ -3,6 +3,9 @@
 
 import asyncio
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6.QtCore import QCoreApplication, QObject, Signal
 
@@ -54,6 +57,8 @@ from baramFlow.openfoam.system.set_fields_dict import SetFieldsDict
 
 logger = logging.getLogger(__name__)
 
+MAX_GENERATION_WORKERS = 8
+
 
 class CaseGenerator(QObject):
     progress = Signal(str)
@@ -123,11 +128,28 @@ class CaseGenerator(QObject):
 
         return errors
 
-    def _generateFiles(self):
-        for file in self._files:
-            if self._canceled:
-                return
+    def _generateFiles(self, db):
+        # Files are independent of each other, and most of the time is spent reading and writing them.
+        # Workers read the snapshot db, not to race with modifications of the configuration in the GUI.
+        with ThreadPoolExecutor(max_workers=min(MAX_GENERATION_WORKERS, os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(self._generateFile, file, db) for file in self._files]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def _generateFile(self, file, db):
+        if self._canceled:
+            return
+
+        start = time.perf_counter()
+        with coredb.readingSnapshot(db):
             file.build().write()
+        elapsed = time.perf_counter() - start
+
+        self.progress.emit(self.tr('Generating Files... {0} ({1:.0f} ms)').format(file.objectPath(), elapsed * 1000))
 
     def _validate(self, solver):
         if not GeneralDB.isTimeTransient():
@@ -213,7 +235,8 @@ class CaseGenerator(QObject):
         if boundaryConditionsPath.is_dir() and any(boundaryConditionsPath.iterdir()):
             hasInitiailied = True
 
-        errors = await asyncio.to_thread(self._generateFiles)
+        errors = await asyncio.to_thread(self._generateFiles, coredb.snapshot())
+        logger.debug(f'Schema lookup cache hit rate: {self._db.valueTypeHitRate:.1%}')
         if self._canceled:
             raise CanceledException
         if errors:
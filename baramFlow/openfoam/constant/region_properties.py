@@ -1,10 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-
 from libbaram.openfoam.constants import Directory
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
+from libbaram.openfoam.poly_mesh_files import readDictionary
 
 from baramFlow.base.material.material import Phase
 from baramFlow.coredb.coredb_reader import CoreDBReader
@@ -25,7 +24,7 @@ class RegionProperties(DictionaryFile):
         regionPropFile = path / Directory.REGION_PROPERTIES_FILE_NAME
 
         if regionPropFile.is_file():
-            regionsDict = ParsedParameterFile(regionPropFile).content['regions']
+            regionsDict = readDictionary(regionPropFile)['regions']
             for i in range(1, len(regionsDict), 2):
                 for region in regionsDict[i]:
                     if not path.joinpath(region).is_dir():
@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 from libbaram.mpi import ParallelType, ParallelEnvironment
 
 from baramFlow.coredb import coredb
-from baramFlow.coredb.project import Project
+from baramFlow.coredb.project import Project, SettingKey
+from baramFlow.openfoam.batch_scheduler import BatchPacking
 
 
 def getNP() -> int:
@@ -30,3 +33,28 @@ def getEnvironment():
 
 def setEnvironment(environment: ParallelEnvironment):
     Project.instance().setParallelEnvironment(environment)
+
+
+def getBatchPacking() -> BatchPacking:
+    return BatchPacking[Project.instance().getLocalSetting(SettingKey.BATCH_PACKING) or BatchPacking.SEQUENTIAL.name]
+
+
+def getBatchCoreBudget() -> Optional[int]:
+    """Returns the number of cores batch cases share, or None for the default of CaseManager.batchRun"""
+    budget = Project.instance().getLocalSetting(SettingKey.BATCH_CORE_BUDGET)
+    return None if budget is None else int(budget)
+
+
+def setBatchScheduling(packing: BatchPacking, coreBudget: int):
+    Project.instance().setLocalSetting(SettingKey.BATCH_PACKING, packing.name)
+    Project.instance().setLocalSetting(SettingKey.BATCH_CORE_BUDGET, coreBudget)
+
+
+def getRedistributionConcurrency() -> Optional[int]:
+    """Returns the number of cases reconstructed or decomposed at a time, or None for the default of RedistributionTask"""
+    concurrency = Project.instance().getLocalSetting(SettingKey.REDISTRIBUTION_CONCURRENCY)
+    return None if concurrency is None else int(concurrency)
+
+
+def setRedistributionConcurrency(concurrency: int):
+    Project.instance().setLocalSetting(SettingKey.REDISTRIBUTION_CONCURRENCY, concurrency)
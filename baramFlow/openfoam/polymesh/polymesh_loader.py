@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict
 from PySide6.QtCore import QObject, Signal
 from vtkmodules.vtkCommonDataModel import vtkCompositeDataSet
 from vtkmodules.vtkCommonCore import VTK_MULTIBLOCK_DATA_SET, VTK_UNSTRUCTURED_GRID, VTK_POLY_DATA
@@ -14,6 +15,7 @@ from baramFlow.base.model.DPM_model import DPMModelManager
 from baramFlow.base.scaffold.scaffolds_db import ScaffoldsDB
 from baramFlow.openfoam.openfoam_reader import OpenFOAMReader
 from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.poly_mesh_files import BoundaryFile
 
 from baramFlow.app import app
 from baramFlow.coredb import coredb
@@ -108,8 +110,8 @@ class PolyMeshLoader(QObject):
     progress = Signal(str)
 
     @classmethod
-    def loadBoundaryDict(cls, path, listLengthUnparsed=None, longListOutputThreshold=None):
-        return ParsedBoundaryDict(path, listLengthUnparsed=listLengthUnparsed, treatBinaryAsASCII=True, longListOutputThreshold=longListOutputThreshold)
+    def loadBoundaryDict(cls, path) -> BoundaryFile:
+        return BoundaryFile(path)
 
     async def loadMesh(self):
         self.progress.emit(self.tr("Loading Mesh..."))
@@ -130,26 +132,20 @@ class PolyMeshLoader(QObject):
         await self._updateMeshModel(vtkMesh)
 
     def _loadBoundaries(self):
-        def toTypedBoundaryConditions(dictBoundaries):
+        def loadTypedBoundaryConditions(rname):
+            dictBoundaries = self.loadBoundaryDict(path / rname / Directory.POLY_MESH_DIRECTORY_NAME / 'boundary').content
             for name, boundary in dictBoundaries.items():
                 boundary['bctype'] = defaultBoundaryType(name, GeometricalType(boundary['type']))
 
             return dictBoundaries
 
-        boundaries = {}
-
         path = FileSystem.constantPath()
         regionPropFile = path / Directory.REGION_PROPERTIES_FILE_NAME
-        if regionPropFile.is_file():
-            regions = RegionProperties.loadRegions(path)
-            for rname in regions:
-                boundaryDict = self.loadBoundaryDict(path / rname / Directory.POLY_MESH_DIRECTORY_NAME / 'boundary')
-                boundaries[rname] = toTypedBoundaryConditions(boundaryDict.content)
-        else:
-            boundaryDict = self.loadBoundaryDict(path / 'polyMesh' / 'boundary')
-            boundaries[''] = toTypedBoundaryConditions(boundaryDict.content)
+        regions = RegionProperties.loadRegions(path) if regionPropFile.is_file() else ['']
 
-        return boundaries
+        # Boundary files of regions are read in parallel
+        with ThreadPoolExecutor(max(1, min(len(regions), os.cpu_count() or 1))) as executor:
+            return dict(zip(regions, executor.map(loadTypedBoundaryConditions, regions)))
 
     async def _getVtkMesh(self):
         """
@@ -262,58 +258,60 @@ class PolyMeshLoader(QObject):
                     for rname in boundaries):
             return False
 
-        UserDefinedScalarsDB.clearUserDefinedScalars(db)
-        db.clearRegions()
-        db.clearMonitors()
-        DPMModelManager.turnOff(meshUpdated=True)
-
-        for rname in boundaries:
-            RegionDB.addRegion(rname)
-
-            # Initial value of "0" for pressure in density-based solvers causes trouble by making density zero
-            # because operating pressure is fixed to "0" for density-based solvers
-            if GeneralDB.isDensityBased():
-                pressurePath = f'/regions/region[name="{rname}"]/initialization/initialValues/pressure'
-                db.setValue(pressurePath, '101325')
-
-            for bcname in vtkMesh[rname]['boundary']:
-                boundary = boundaries[rname][bcname]
-                geometricalType = GeometricalType(boundary['type'])
-                boundaryType = boundary['bctype']
-
-                coupledBoundary = None
-                if BoundaryDB.needsCoupledBoundary(boundaryType):
-                    if geometricalType == GeometricalType.MAPPED_WALL and 'samplePatch' in boundary:
-                        sampleRegion, samplePatch = getSamplePatch(rname, bcname)
-                        if samplePatch and getSamplePatch(sampleRegion, samplePatch) == (rname, bcname):
-                            coupledBoundary = boundaries[sampleRegion][samplePatch]
-                    elif 'neighbourPatch' in boundary:
-                        neighbourPatch = getNeighbourPatch(rname, bcname)
-                        if neighbourPatch and getNeighbourPatch(rname, neighbourPatch) == bcname:
-                            coupledBoundary = boundaries[rname][neighbourPatch]
-                elif boundaryType == BoundaryType.WALL:     # Geometrica type is patch or wall.
-                    if couple := getCouplePatchByName(bcname):
-                        coupleRegion, coupleName = couple
-                        coupledBoundary = boundaries[coupleRegion][coupleName]
-                        if coupleRegion == rname:
-                            boundaryType = BoundaryType.INTERFACE
-                        else:
-                            boundaryType = BoundaryType.THERMO_COUPLED_WALL
-
-                boundary['bcid'] = str(db.addBoundaryCondition(rname, bcname, boundary['type'], boundaryType.value))
-
-                xpath = BoundaryDB.getXPath(boundary['bcid'])
-
-                if coupledBoundary and 'bcid' in coupledBoundary:
-                    db.setValue(xpath + '/coupledBoundary', coupledBoundary['bcid'])
-                    db.setValue(BoundaryDB.getXPath(coupledBoundary['bcid']) + '/coupledBoundary', boundary['bcid'])
-
-                interactionType = DPMModelManager.getDefaultPatchInteractionType(boundaryType)
-                db.setValue(xpath + '/patchInteraction/type', interactionType.value)
-
-            if 'zones' in vtkMesh[rname] and 'cellZones' in vtkMesh[rname]['zones']:
-                for czname in vtkMesh[rname]['zones']['cellZones']:
-                    db.addCellZone(rname, czname)
+        # Whole configuration is validated once after adding all the boundaries
+        with db.deferredValidation():
+            UserDefinedScalarsDB.clearUserDefinedScalars(db)
+            db.clearRegions()
+            db.clearMonitors()
+            DPMModelManager.turnOff(meshUpdated=True)
+
+            for rname in boundaries:
+                RegionDB.addRegion(rname)
+
+                # Initial value of "0" for pressure in density-based solvers causes trouble by making density zero
+                # because operating pressure is fixed to "0" for density-based solvers
+                if GeneralDB.isDensityBased():
+                    pressurePath = f'/regions/region[name="{rname}"]/initialization/initialValues/pressure'
+                    db.setValue(pressurePath, '101325')
+
+                for bcname in vtkMesh[rname]['boundary']:
+                    boundary = boundaries[rname][bcname]
+                    geometricalType = GeometricalType(boundary['type'])
+                    boundaryType = boundary['bctype']
+
+                    coupledBoundary = None
+                    if BoundaryDB.needsCoupledBoundary(boundaryType):
+                        if geometricalType == GeometricalType.MAPPED_WALL and 'samplePatch' in boundary:
+                            sampleRegion, samplePatch = getSamplePatch(rname, bcname)
+                            if samplePatch and getSamplePatch(sampleRegion, samplePatch) == (rname, bcname):
+                                coupledBoundary = boundaries[sampleRegion][samplePatch]
+                        elif 'neighbourPatch' in boundary:
+                            neighbourPatch = getNeighbourPatch(rname, bcname)
+                            if neighbourPatch and getNeighbourPatch(rname, neighbourPatch) == bcname:
+                                coupledBoundary = boundaries[rname][neighbourPatch]
+                    elif boundaryType == BoundaryType.WALL:     # Geometrica type is patch or wall.
+                        if couple := getCouplePatchByName(bcname):
+                            coupleRegion, coupleName = couple
+                            coupledBoundary = boundaries[coupleRegion][coupleName]
+                            if coupleRegion == rname:
+                                boundaryType = BoundaryType.INTERFACE
+                            else:
+                                boundaryType = BoundaryType.THERMO_COUPLED_WALL
+
+                    boundary['bcid'] = str(db.addBoundaryCondition(rname, bcname, boundary['type'], boundaryType.value))
+
+                    xpath = BoundaryDB.getXPath(boundary['bcid'])
+
+                    if coupledBoundary and 'bcid' in coupledBoundary:
+                        db.setValue(xpath + '/coupledBoundary', coupledBoundary['bcid'])
+                        db.setValue(BoundaryDB.getXPath(coupledBoundary['bcid']) + '/coupledBoundary', boundary['bcid'])
+
+                    interactionType = DPMModelManager.getDefaultPatchInteractionType(boundaryType)
+                    db.setValue(xpath + '/patchInteraction/type', interactionType.value)
+
+                if 'zones' in vtkMesh[rname] and 'cellZones' in vtkMesh[rname]['zones']:
+                    for czname in vtkMesh[rname]['zones']['cellZones']:
+                        db.addCellZone(rname, czname)
 
         return True
 
@@ -337,4 +335,4 @@ class PolyMeshLoader(QObject):
 
         ScaffoldsDB().rematchBoundaries()
 
-        await GraphicsDB().updatePolyMeshAll()
+        await GraphicsDB().updatePolyMeshAll(invalidate=True)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Optional
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, QFileSystemWatcher, Signal, Qt
+
+
+MIN_POLL_INTERVAL = 500     # ms
+MAX_POLL_INTERVAL = 4000    # ms
+POLL_BACKOFF_FACTOR = 2     # The interval is multiplied by this factor on every tick without change
+
+_mutex = Lock()
+
+logger = logging.getLogger(__name__)
+
+
+FileSizes = dict[Path, int]
+
+
+def scanFiles(directory: Path) -> FileSizes:
+    """Return sizes of all the files under the directory"""
+    files = {}
+
+    def scan(path):
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            scan(entry.path)
+                        else:
+                            files[Path(entry.path)] = entry.stat().st_size
+                    except FileNotFoundError:   # Removed while scanning
+                        pass
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+    scan(directory)
+
+    return files
+
+
+class _Subscription:
+    def __init__(self, directory: Path, handler: Callable[[FileSizes], None]):
+        self.directory = directory
+        self.prefix = str(directory) + os.sep
+        self.handler = handler
+        self.finalHandler: Optional[Callable[[FileSizes], None]] = None
+        self.notified = False
+
+    def contains(self, path: Path):
+        return str(path).startswith(self.prefix)
+
+    def files(self, snapshot: FileSizes) -> FileSizes:
+        return {p: s for p, s in snapshot.items() if self.contains(p)}
+
+
+class _Scanner(QObject):
+    subscribe = Signal(object)
+    unsubscribe = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+
+        self.minInterval = MIN_POLL_INTERVAL
+        self.maxInterval = MAX_POLL_INTERVAL
+
+        self._subscriptions: list[_Subscription] = []
+        self._snapshot: FileSizes = {}
+
+        self._timer = None
+        self._notifier = None
+
+        self.subscribe.connect(self._addSubscription, type=Qt.ConnectionType.QueuedConnection)
+        self.unsubscribe.connect(self._removeSubscription, type=Qt.ConnectionType.QueuedConnection)
+
+    def _addSubscription(self, subscription: _Subscription):
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(self.minInterval)
+            self._timer.timeout.connect(self._tick)
+
+            self._notifier = QFileSystemWatcher(self)
+            self._notifier.directoryChanged.connect(self._notified)
+            self._notifier.fileChanged.connect(self._notified)
+
+        self._subscriptions.append(subscription)
+        self._tick()
+
+    def _removeSubscription(self, subscription: _Subscription):
+        if subscription not in self._subscriptions:
+            return
+
+        self._subscriptions.remove(subscription)
+
+        if subscription.finalHandler is not None:
+            self._call(subscription.finalHandler, subscription.files(self._scan()))
+
+        if not self._subscriptions:
+            self._timer.stop()
+            self._notifier.removePaths(self._notifier.files() + self._notifier.directories())
+            self._snapshot = {}
+
+    def _tick(self):
+        if not self._subscriptions:
+            return
+
+        previous = self._snapshot
+        snapshot = self._scan()
+
+        changed = [p for p, s in snapshot.items() if previous.get(p) != s]
+        changed += [p for p in previous if p not in snapshot]
+
+        hasChange = False
+        for subscription in self._subscriptions:
+            if not subscription.notified or any(subscription.contains(p) for p in changed):
+                subscription.notified = True
+                self._call(subscription.handler, subscription.files(snapshot))
+                hasChange = True
+
+        self._watchPaths(snapshot)
+
+        if hasChange:
+            interval = self.minInterval
+        else:
+            interval = min(max(self._timer.interval(), self.minInterval) * POLL_BACKOFF_FACTOR, self.maxInterval)
+
+        self._timer.start(interval)
+
+    def _notified(self, path):
+        if self._timer.isActive() and self._timer.remainingTime() > self.minInterval:
+            self._timer.start(self.minInterval)
+
+    def _scan(self) -> FileSizes:
+        snapshot = {}
+        for directory in self._roots():
+            snapshot.update(scanFiles(directory))
+
+        self._snapshot = snapshot
+
+        return snapshot
+
+    def _roots(self) -> list[Path]:
+        # Directories nested in another subscribed directory are covered by scanning the outer one
+        roots = []
+        for directory in sorted({s.directory for s in self._subscriptions}, key=lambda d: len(str(d))):
+            if not any(str(directory).startswith(str(r) + os.sep) for r in roots):
+                roots.append(directory)
+
+        return roots
+
+    def _watchPaths(self, snapshot: FileSizes):
+        paths = {str(d) for d in self._roots() if d.is_dir()}
+        for p in snapshot:
+            paths.add(str(p))
+            paths.add(str(p.parent))
+
+        watching = set(self._notifier.files() + self._notifier.directories())
+        if removed := list(watching - paths):
+            self._notifier.removePaths(removed)
+        if added := list(paths - watching):
+            self._notifier.addPaths(added)
+
+    def _call(self, handler, files: FileSizes):
+        try:
+            handler(files)
+        except Exception as e:
+            logger.exception(e)
+
+
+class PostProcessingWatcher:
+    """Watches output files of function objects for all the monitors in one thread
+
+    Subscribed directories are scanned once per tick,
+    and handlers of the directories with added, grown or removed files are called
+    with the sizes of all the files under their directories.
+    Handlers are called in the watcher thread, so they can read the new bytes of the files without blocking the UI.
+
+    The poll interval backs off from MIN_POLL_INTERVAL to MAX_POLL_INTERVAL while nothing changes.
+    File system notifications, inotify on Linux, reset it so that changes are picked up promptly.
+    """
+    def __new__(cls, *args, **kwargs):
+        with _mutex:
+            if not hasattr(cls, '_instance'):
+                cls._instance = super(PostProcessingWatcher, cls).__new__(cls, *args, **kwargs)
+
+        return cls._instance
+
+    def __init__(self):
+        with _mutex:
+            if hasattr(self, '_initialized'):
+                return
+            else:
+                self._initialized = True
+
+        self._thread = None
+        self._scanner = _Scanner()
+
+    def setPollInterval(self, minimum: int, maximum: int):
+        """Set the range of adaptive poll interval in milliseconds"""
+        self._scanner.minInterval = minimum
+        self._scanner.maxInterval = max(minimum, maximum)
+
+    def subscribe(self, directory: Path, handler: Callable[[FileSizes], None]) -> _Subscription:
+        """Call the handler in the watcher thread whenever files under the directory change
+
+        The handler is called on the first scan even if there is no file.
+        """
+        if self._thread is None:
+            self._thread = QThread()
+            self._scanner.moveToThread(self._thread)
+            self._thread.finished.connect(self._scanner.deleteLater)
+            self._thread.start()
+
+            if app := QCoreApplication.instance():
+                app.aboutToQuit.connect(self.shutdown)
+
+        subscription = _Subscription(directory, handler)
+        self._scanner.subscribe.emit(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: _Subscription, finalHandler: Callable[[FileSizes], None] = None):
+        """Stop watching for the subscription
+
+        If finalHandler is given, it is called in the watcher thread with the files of the last scan.
+        """
+        subscription.finalHandler = finalHandler
+        self._scanner.unsubscribe.emit(subscription)
+
+    def shutdown(self):
+        """Stop the watcher thread, dropping all the subscriptions"""
+        if self._thread is None:
+            return
+
+        if app := QCoreApplication.instance():
+            app.aboutToQuit.disconnect(self.shutdown)
+
+        self._thread.quit()
+        self._thread.wait()
+        self._thread = None
+
+        minInterval, maxInterval = self._scanner.minInterval, self._scanner.maxInterval
+        self._scanner = _Scanner()
+        self.setPollInterval(minInterval, maxInterval)
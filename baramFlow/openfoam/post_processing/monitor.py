@@ -1,10 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import time
-
 import pandas as pd
-from PySide6.QtCore import QThread, QObject, QTimer, Signal, Qt
+from PySide6.QtCore import QObject, Signal, Qt
 
 from baramFlow.base.monitor.monitor import getMonitorField
 from baramFlow.case_manager import CaseManager
@@ -17,6 +15,7 @@ from baramFlow.coredb.project import Project
 from baramFlow.coredb.run_calculation_db import RunCalculationDB, TimeSteppingMethod
 from baramFlow.openfoam.function_objects.surface_field_value import SurfaceReportType
 from baramFlow.openfoam.function_objects.vol_field_value import VolumeReportType
+from baramFlow.openfoam.post_processing.file_watcher import PostProcessingWatcher
 from baramFlow.openfoam.post_processing.post_file_reader import PostFileReader
 from baramFlow.view.widgets.chart_wigdet import ChartWidget
 
@@ -45,48 +44,68 @@ class Worker(QObject):
     dataUpdated = Signal(pd.DataFrame)
     stopped = Signal()
     flushed = Signal()
+    done = Signal()
 
-    def __init__(self, name):
+    def __init__(self, name, rname, fileName, extension):
         super().__init__()
-        self._project = Project.instance()
-        self._name = name
-        self._reader = None
-        self._timer = None
+        self._reader = PostFileReader(name, rname, fileName, extension)
+        self._subscription = None
+        self._monitoring = False
 
-    def createReader(self, rname, fileName, extension):
-        self._reader = PostFileReader(self._name, rname, fileName, extension)
+        self.done.connect(self.quit, type=Qt.ConnectionType.QueuedConnection)
 
     def startMonitor(self):
-        changedFiles = self._reader.chagedFiles()
-        while not changedFiles and CaseManager().isRunning():
-            time.sleep(0.5)
-            changedFiles = self._reader.chagedFiles()
+        if self._subscription is None:
+            self._subscription = PostProcessingWatcher().subscribe(self._reader.path, self._filesChanged)
+
+    def stopMonitor(self):
+        if self._subscription is not None:
+            PostProcessingWatcher().unsubscribe(self._subscription, self._stopped)
+            self._subscription = None
+
+    def quit(self):
+        if self._subscription is not None:
+            PostProcessingWatcher().unsubscribe(self._subscription, self._quitted)
+            self._subscription = None
+
+    def _filesChanged(self, files):
+        # Called in the watcher thread
+        if not self._monitoring:
+            changedFiles = self._reader.chagedFiles(files)
+            if not changedFiles:
+                if not CaseManager().isRunning():
+                    self.done.emit()
+                return
 
-        if changedFiles:
             for path in changedFiles[1:]:
                 data = self._reader.readDataFrame(path)
                 self.dataUpdated.emit(data)
 
             self._reader.openMonitor()
-            self._monitor()
+            self._monitoring = True
 
-            if CaseManager().isRunning():
-                self._timer = QTimer()
-                self._timer.setInterval(500)
-                self._timer.timeout.connect(self._monitor)
-                self._timer.start()
-            else:
-                self.flushed.emit()
-                self._reader.closeMonitor()
+        self._monitor()
 
-    def stopMonitor(self):
-        if self._timer:
-            self._timer.stop()
-            self._timer = None
+        if not CaseManager().isRunning():
+            self.flushed.emit()
+            self.done.emit()
+
+    def _stopped(self, files):
+        # Called in the watcher thread
+        if self._monitoring:
             self._monitor()
-            self._reader.closeMonitor()
+            self._closeMonitor()
             self.stopped.emit()
 
+    def _quitted(self, files):
+        # Called in the watcher thread
+        if self._monitoring:
+            self._closeMonitor()
+
+    def _closeMonitor(self):
+        self._reader.closeMonitor()
+        self._monitoring = False
+
     def _monitor(self):
         data = self._reader.readTailDataFrame()
         if data is not None:
@@ -94,8 +113,6 @@ class Worker(QObject):
 
 
 class Monitor(QObject):
-    startWorker = Signal()
-    stopWorker = Signal()
     stopped = Signal(str)
 
     def __init__(self, name):
@@ -103,7 +120,6 @@ class Monitor(QObject):
 
         self._name = name
         self._rname = ''
-        self._thread = None
         self._worker = None
         self._showChart = True
 
@@ -122,36 +138,23 @@ class Monitor(QObject):
     def visibility(self):
         return self._showChart
 
-    def startThread(self):
-        self._thread = QThread()
-        self._worker = Worker(self.name)
-        self._worker.moveToThread(self._thread)
-        self._worker.createReader(self._rname, self.fileName, self.extension)
-        self._worker.dataUpdated.connect(self._updateChart, type=Qt.ConnectionType.QueuedConnection)
-        self._worker.stopped.connect(self._stopped, type=Qt.ConnectionType.QueuedConnection)
-        self._worker.flushed.connect(self._fitChart, type=Qt.ConnectionType.QueuedConnection)
-
-        self._thread.started.connect(self._worker.startMonitor, type=Qt.ConnectionType.QueuedConnection)
-        self._thread.start()
-
-        self.startWorker.connect(self._worker.startMonitor, type=Qt.ConnectionType.QueuedConnection)
-        self.stopWorker.connect(self._worker.stopMonitor, type=Qt.ConnectionType.QueuedConnection)
-
     def start(self):
-        if self._worker:
-            self.startWorker.emit()
-        else:
-            self.startThread()
+        if self._worker is None:
+            self._worker = Worker(self.name, self._rname, self.fileName, self.extension)
+            self._worker.dataUpdated.connect(self._updateChart, type=Qt.ConnectionType.QueuedConnection)
+            self._worker.stopped.connect(self._stopped, type=Qt.ConnectionType.QueuedConnection)
+            self._worker.flushed.connect(self._fitChart, type=Qt.ConnectionType.QueuedConnection)
+
+        self._worker.startMonitor()
 
     def stop(self):
-        self.stopWorker.emit()
+        if self._worker:
+            self._worker.stopMonitor()
 
     def quit(self):
-        self.stop()
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait()
-            self._thread = None
+        if self._worker:
+            self._worker.quit()
+            self._worker = None
 
     def _updateChart(self, data):
         pass
@@ -1,35 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from io import StringIO
+from fnmatch import fnmatch
+from pathlib import Path
 
 import pandas as pd
 from PySide6.QtCore import QObject
 
 from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.openfoam.post_processing.tail_reader import TableTailReader, readTable
 
 
 def readPostFile(path) -> pd.DataFrame:
-    with path.open(mode='r') as f:
-        header = None
-        line = f.readline()
-        while line[0] == '#':
-            p = f.tell()
-            header = line
-            line = f.readline()
+    df = readTable(path)
+    if df is None:
+        raise RuntimeError
 
-        names = header[1:].split()  # read header
-        if names[0] != 'Time':
-            raise RuntimeError
-
-        if len(names) == 1:
-            names.append(path.stem)
-
-        f.seek(p)
-        df = pd.read_csv(f, sep=r'\s+', names=names, skiprows=0, engine='python')
-        df.set_index('Time', inplace=True)
-
-        return df
+    return df
 
 
 class PostFileReader(QObject):
@@ -43,65 +30,48 @@ class PostFileReader(QObject):
         self._files = {}
         self._currentFilePath = None
         self._currentFile = None
-        self._header = None
-        self._newLine = ''
-        self._cols = None
 
-    def chagedFiles(self):
+    @property
+    def path(self):
+        return self._path
+
+    def chagedFiles(self, files: dict[Path, int]):
+        """Return files changed since the last call among "files", sizes of files under the monitor directory
+
+        The last one of the files is the file being written and the others are in the order of time.
+        """
         self._currentFilePath = None
         changedFiles = []
 
-        dirs = sorted([(d.name, d) for d in self._path.glob('[0-9.]*') if d.name.count('.') < 2],
-                      key=lambda x: float(x[0]))
-        for dirTime, dirPath in dirs:
+        dirs = {}
+        for path, size in files.items():
+            if path.parent.parent == self._path:
+                dirs.setdefault(path.parent, []).append(path)
+
+        for dirPath in sorted([d for d in dirs if d.name[0] in '0123456789.' and d.name.count('.') < 2],
+                              key=lambda d: float(d.name)):
             path = dirPath / self._fileName
-            if path.is_file() and self._updateFileInfo(path):
+            if path in files and self._updateFileInfo(path, files[path]):
                 changedFiles.append(self._currentFilePath)
                 self._currentFilePath = path
 
-            files = [(f.stem[self._nameLen:], f) for f in dirPath.glob(self._pattern)]
-            for time, path in sorted(files, key=lambda x: int(x[0])):
-                if self._updateFileInfo(path):
+            dupFiles = [(f.stem[self._nameLen:], f) for f in dirs[dirPath] if fnmatch(f.name, self._pattern)]
+            for time, path in sorted(dupFiles, key=lambda x: int(x[0])):
+                if self._updateFileInfo(path, files[path]):
                     changedFiles.append(self._currentFilePath)
                     self._currentFilePath = path
 
         return changedFiles
 
     def readDataFrame(self, path):
-        with path.open(mode='r') as f:
-            header = None
-            line = f.readline()
-            while line[0] == '#':
-                p = f.tell()
-                header = line
-                line = f.readline()
-
-            names = header[1:].split()  # read header
-            if names[0] != 'Time':
-                raise RuntimeError
-            if len(names) == 1:
-                names.append(self._currentFilePath.stem)
-
-            f.seek(p)
-            df = pd.read_csv(f, sep=r'\s+', names=names, skiprows=0)
-            df.set_index('Time', inplace=True)
-
-            return df
+        return readTable(path)
 
     def readTailDataFrame(self):
-        if tail := self._readUpdatedLines():
-            stream = StringIO(tail)
-            df = pd.read_csv(stream, sep=r'\s+', names=self._header)
-            stream.close()
-            df.set_index('Time', inplace=True)
-
-            return df
-
-        return None
+        return self._currentFile.read()
 
     def openMonitor(self):
         if self._currentFilePath:
-            self._currentFile = open(self._currentFilePath, 'r')
+            self._currentFile = TableTailReader(self._currentFilePath)
 
     def closeMonitor(self):
         if self._currentFile:
@@ -110,30 +80,9 @@ class PostFileReader(QObject):
             self._files[self._currentFilePath] = self._currentFilePath.stat().st_size
             self._currentFilePath = None
 
-    def _updateFileInfo(self, path):
-        size = path.stat().st_size
+    def _updateFileInfo(self, path, size):
         if path not in self._files or size != self._files[path]:
             self._files[path] = size
             return True
 
         return False
-
-    def _readUpdatedLines(self):
-        lines = self._newLine
-
-        line = self._currentFile.readline()
-        if line and line.endswith('\n'):     # complete at least one line including comments
-            while line.endswith('\n'):
-                lines += line
-                if lines[0] == '#':
-                    self._header = lines[1:].split()
-                    if len(self._header) == 1:
-                        self._header.append(self._currentFilePath.stem)
-                    lines = ''
-                line = self._currentFile.readline()
-
-            self._newLine = line    # Incomplete line is replaced by the new line
-            return lines
-
-        self._newLine += line       # New line is still incomplete.
-        return ''
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _pread(fd, size, offset) -> bytes:
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, offset)
+
+    # Windows does not have pread
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+class TailReader:
+    """Reads complete lines appended to a file since the last read
+
+    New bytes are read in bulk by file offset.
+    Trailing bytes without a newline are kept until the line is completed by the writer.
+    """
+    def __init__(self, path: Path, offset=0):
+        self._path = path
+        self._fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        self._offset = offset
+        self._incompleteLine = b''
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def offset(self):
+        return self._offset
+
+    def readLines(self) -> bytes:
+        size = os.fstat(self._fd).st_size - self._offset
+        if size <= 0:
+            return b''
+
+        data = _pread(self._fd, size, self._offset)
+        self._offset += len(data)
+
+        if self._incompleteLine:
+            data = self._incompleteLine + data
+
+        end = data.rfind(b'\n') + 1
+        self._incompleteLine = data[end:]
+
+        return data[:end]
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class TableTailReader(TailReader):
+    """Reads rows appended to a table file written by OpenFOAM function objects, such as "solverInfo.dat"
+
+    Comment lines beginning with "# Time" give column names of the following rows, and other comments are ignored.
+    Rows are parsed into a DataFrame indexed by "Time" in one vectorized pass over the new bytes.
+    Only the columns chosen by "columns" are converted, so non-numeric columns like solver names can be skipped.
+    """
+    def __init__(self, path: Path, columns: Callable[[list[str]], list[str]] = None, offset=0):
+        super().__init__(path, offset)
+
+        self._selectColumns = columns
+        self._names = None
+        self._columns = None
+        self._usecols = None
+
+    @property
+    def names(self) -> Optional[list[str]]:
+        return self._names
+
+    def read(self) -> Optional[pd.DataFrame]:
+        block = self.readLines()
+        if not block:
+            return None
+
+        if b'#' not in block:
+            return self._parse(block)
+
+        frames = []
+        rows = []
+        for line in block.splitlines(keepends=True):
+            if line.startswith(b'#'):
+                if rows:
+                    frames.append(self._parse(b''.join(rows)))
+                    rows = []
+                self._parseHeader(line)
+            else:
+                rows.append(line)
+
+        if rows:
+            frames.append(self._parse(b''.join(rows)))
+
+        frames = [df for df in frames if df is not None]
+        if not frames:
+            return None
+
+        return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+    def _parseHeader(self, line: bytes):
+        names = line[1:].decode().split()
+        if not names or names[0] != 'Time':
+            return
+
+        if len(names) == 1:  # Files of single value, like probes of a scalar field, are named after the field
+            names.append(self._path.stem)
+
+        self._names = names
+        self._columns = self._selectColumns(names) if self._selectColumns else names
+        self._usecols = [names.index(c) for c in self._columns]
+
+    def _parse(self, rows: bytes) -> Optional[pd.DataFrame]:
+        if self._names is None:  # Rows before the header
+            return None
+
+        try:
+            values = np.loadtxt(BytesIO(rows), dtype=np.float64, comments=None, usecols=self._usecols, ndmin=2)
+        except ValueError:
+            # Rows that loadtxt cannot split into the header columns, like vectors in parentheses
+            df = pd.read_csv(BytesIO(rows), sep=r'\s+', names=self._names)[self._columns]
+            return df.set_index('Time')
+
+        return pd.DataFrame(values[:, 1:], index=pd.Index(values[:, 0], name='Time'), columns=self._columns[1:])
+
+
+def readTable(path: Path, columns: Callable[[list[str]], list[str]] = None) -> Optional[pd.DataFrame]:
+    reader = TableTailReader(path, columns)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
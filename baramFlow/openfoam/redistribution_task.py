@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
+from pathlib import Path
+from typing import Awaitable, Callable
 
 from PySide6.QtCore import QObject, Signal
 
@@ -21,17 +24,54 @@ from baramFlow.openfoam.file_system import FileSystem
 from baramFlow.openfoam import parallel
 from baramFlow.openfoam.polymesh.polymesh_loader import PolyMeshLoader
 
+# reconstructPar and decomposePar of large cases take a lot of memory each
+DEFAULT_CONCURRENCY = 2
+
 logger = logging.getLogger(__name__)
 
 
+async def runConcurrently(cases: list[Path], run: Callable[[Path], Awaitable], concurrency: int) -> list:
+    """Runs run(case) for the cases, at most concurrency cases at a time
+
+    Cases are not started any more once a case fails.
+    Failed cases are returned with their exceptions after the running cases finish.
+    """
+    slots = asyncio.Semaphore(concurrency)
+    failures = []
+
+    async def runInSlot(case):
+        async with slots:
+            if failures:
+                return
+
+            try:
+                await run(case)
+            except Exception as ex:
+                logger.info(ex, exc_info=True)
+                failures.append((case, ex))
+
+    await asyncio.gather(*[runInSlot(case) for case in cases])
+
+    return failures
+
+
 class RedistributionTask(QObject):
+    """Reconstructs and decomposes the live case and batch cases again for a new number of cores
+
+    reconstructPar and decomposePar run for several cases at a time, up to concurrency,
+    which defaults to DEFAULT_CONCURRENCY.
+    Batch cases are decomposed after the live case, whose decomposed mesh they link.
+    No more cases are started once a case fails,
+    and an error naming the failed cases is raised after the running ones finish.
+    """
     progress = Signal(str)
 
-    def __init__(self):
+    def __init__(self, concurrency: int = None):
         super().__init__()
 
-        self._caseName = ''
-        self._latestTime = '0'
+        self._concurrency = max(1, DEFAULT_CONCURRENCY if concurrency is None else concurrency)
+        self._liveCaseFolder = None
+        self._decomposedCases = 0
 
     async def redistribute(self):
         db = coredb.CoreDB()
@@ -42,6 +82,7 @@ class RedistributionTask(QObject):
         podRoot        = Project.instance().path.joinpath(POD_DIRECTORY_NAME)  # noqa: E221
         caseFolders = list(batchRoot.iterdir()) if batchRoot.exists() else []
         caseFolders.insert(0, liveCaseFolder)
+        self._liveCaseFolder = liveCaseFolder
 
         numCores = parallel.getNP()
 
@@ -54,25 +95,18 @@ class RedistributionTask(QObject):
             return
 
         try:
+            reconstructing = []
             for caseRoot in caseFolders:
                 processorFolders = list(caseRoot.glob('processor[0-9]*'))
-                nProcessorFolders = len(processorFolders)
-                if nProcessorFolders > 0 and len(FileSystem.times(processorFolders[0])) > 0:
-                    self.progress.emit(self.tr('Reconstructing the case.'))
+                if processorFolders and FileSystem.times(processorFolders[0]):
+                    reconstructing.append(caseRoot)
 
-                    if caseRoot == liveCaseFolder:
-                        self._caseName = ''
-                    else:
-                        self._caseName = caseRoot.name
+            if reconstructing:
+                self.progress.emit(self.tr('Reconstructing the case.'))
 
-                    self._latestTime = FileSystem.latestTime(processorFolders[0])
-
-                    cm = RunUtility('reconstructPar', '-allRegions', '-withZero', '-case', caseRoot, cwd=caseRoot)
-                    cm.output.connect(self._reportTimeProgress)
-                    await cm.start()
-                    result = await cm.wait()
-                    if result != 0:
-                        raise RuntimeError(self.tr('Reconstruction failed.'))
+                failures = await runConcurrently(reconstructing, self._reconstruct, self._concurrency)
+                if failures:
+                    raise RuntimeError(self._failureMessage(self.tr('Reconstruction failed.'), failures))
 
             for caseRoot in caseFolders:
                 processorFolders = list(caseRoot.glob('processor[0-9]*'))
@@ -85,79 +119,118 @@ class RedistributionTask(QObject):
                 console = app.window.consoleView()
                 app.window.showConsoleDock()
 
-                for caseRoot in caseFolders:
-                    if caseRoot == liveCaseFolder:
-                        if len(regions) > 1:
-                            # This might be for HD KSOE,
-                            # which uses NF5 that requires decomposeParDict only in system folder not system/<region> folder
-                            DecomposeParDict(caseRoot, '', numCores).build().write()
+                # Batch cases link the mesh decomposed in the live case
+                await self._decomposeLiveCase(regions, numCores, console)
 
-                        for rname in regions:
+                batchCases = caseFolders[1:]
+                self._decomposedCases = 0
 
-                            singleProcessorFaceSets = []
+                async def decomposeBatchCase(caseRoot):
+                    await self._decomposeBatchCase(caseRoot, regions, console)
 
-                            cyclingBoundaries = BoundaryDB.cyclingBoundaries(rname)
+                    self._decomposedCases += 1
+                    self.progress.emit(self.tr('Decomposing the case.') + f' ({self._decomposedCases}/{len(batchCases)})')
 
-                            if cyclingBoundaries:
-                                coupleSets = {f'{c[0]}_{c[1]}': (c[0], c[1]) for c in cyclingBoundaries}
+                failures = await runConcurrently(batchCases, decomposeBatchCase, self._concurrency)
+                if failures:
+                    raise RuntimeError(self._failureMessage(self.tr('Decomposition failed.'), failures))
 
-                                TopoSetDict(rname).setupCoupleSets(coupleSets).build().write()
+                self.progress.emit(self.tr(f'Decomposition done.'))
 
-                                if len(regions) == 1:
-                                    cm = RunUtility('topoSet', cwd=caseRoot)
-                                else:
-                                    cm = RunUtility('topoSet', '-region', rname, cwd=caseRoot)
+            async with OpenFOAMReader() as reader:
+                await reader.setupReader()
 
-                                cm.output.connect(console.append)
-                                cm.errorOutput.connect(console.append)
+            utils.rmtree(podRoot)
 
-                                await cm.start()
-                                rc = await cm.wait()
-                                if rc != 0:
-                                    raise RuntimeError(self.tr('Decomposition failed.'))
+            loader = PolyMeshLoader()
+            loader.progress.connect(self.progress)
+            await loader.loadVtk()
 
-                                singleProcessorFaceSets = list(coupleSets.keys())
+        except Exception as ex:
+            logger.info(ex, exc_info=True)
+            raise
 
-                            DecomposeParDict(caseRoot, rname, numCores, singleProcessorFaceSets).build().write()
+    async def _reconstruct(self, caseRoot):
+        caseName = self._caseName(caseRoot)
+        latestTime = FileSystem.latestTime(next(caseRoot.glob('processor[0-9]*')))
 
-                        args = ('-allRegions', '-time', '0:', '-case', caseRoot)
-                    else:
-                        FileSystem.linkLivePolyMeshTo(liveCaseFolder, caseRoot, regions, processorOnly=True)
+        cm = RunUtility('reconstructPar', '-allRegions', '-withZero', '-case', caseRoot, cwd=caseRoot)
+        cm.output.connect(lambda msg: self._reportTimeProgress(caseName, latestTime, msg))
+        await cm.start()
+        result = await cm.wait()
+        if result != 0:
+            raise RuntimeError(self.tr('Reconstruction failed.'))
 
-                        args = ('-allRegions', '-fields', '-time', '0:', '-case', caseRoot)
+    async def _decomposeLiveCase(self, regions, numCores, console):
+        caseRoot = self._liveCaseFolder
+        if len(regions) > 1:
+            # This might be for HD KSOE,
+            # which uses NF5 that requires decomposeParDict only in system folder not system/<region> folder
+            DecomposeParDict(caseRoot, '', numCores).build().write()
 
-                    cm = RunUtility('decomposePar', *args, cwd=caseRoot)
-                    cm.output.connect(console.append)
-                    cm.errorOutput.connect(console.append)
+        for rname in regions:
 
-                    await cm.start()
-                    result = await cm.wait()
-                    if result != 0:
-                        raise RuntimeError(self.tr('Decomposition failed.'))
+            singleProcessorFaceSets = []
 
-                    # Delete time folders in case root
-                    #
-                    # Do NOT delete the polyMesh in case root
-                    # It was decided to be kept
-                    #
-                    for time in FileSystem.times(caseRoot):
-                        utils.rmtree(caseRoot / time)
+            cyclingBoundaries = BoundaryDB.cyclingBoundaries(rname)
 
-                self.progress.emit(self.tr(f'Decomposition done.'))
+            if cyclingBoundaries:
+                coupleSets = {f'{c[0]}_{c[1]}': (c[0], c[1]) for c in cyclingBoundaries}
 
-            async with OpenFOAMReader() as reader:
-                await reader.setupReader()
+                TopoSetDict(rname).setupCoupleSets(coupleSets).build().write()
 
-            utils.rmtree(podRoot)
+                if len(regions) == 1:
+                    cm = RunUtility('topoSet', cwd=caseRoot)
+                else:
+                    cm = RunUtility('topoSet', '-region', rname, cwd=caseRoot)
 
-            loader = PolyMeshLoader()
-            loader.progress.connect(self.progress)
-            await loader.loadVtk()
+                cm.output.connect(console.append)
+                cm.errorOutput.connect(console.append)
 
-        except Exception as ex:
-            logger.info(ex, exc_info=True)
-            raise
+                await cm.start()
+                rc = await cm.wait()
+                if rc != 0:
+                    raise RuntimeError(self.tr('Decomposition failed.'))
+
+                singleProcessorFaceSets = list(coupleSets.keys())
+
+            DecomposeParDict(caseRoot, rname, numCores, singleProcessorFaceSets).build().write()
+
+        await self._decompose(caseRoot, ('-allRegions', '-time', '0:', '-case', caseRoot), console.append)
+
+    async def _decomposeBatchCase(self, caseRoot, regions, console):
+        FileSystem.linkLivePolyMeshTo(self._liveCaseFolder, caseRoot, regions, processorOnly=True)
+
+        # Output of cases decomposed at the same time is mixed in the console
+        def append(line):
+            console.append(f'[{caseRoot.name}] {line}')
+
+        await self._decompose(caseRoot, ('-allRegions', '-fields', '-time', '0:', '-case', caseRoot), append)
+
+    async def _decompose(self, caseRoot, args, append):
+        cm = RunUtility('decomposePar', *args, cwd=caseRoot)
+        cm.output.connect(append)
+        cm.errorOutput.connect(append)
+
+        await cm.start()
+        result = await cm.wait()
+        if result != 0:
+            raise RuntimeError(self.tr('Decomposition failed.'))
+
+        # Delete time folders in case root
+        #
+        # Do NOT delete the polyMesh in case root
+        # It was decided to be kept
+        #
+        for time in FileSystem.times(caseRoot):
+            utils.rmtree(caseRoot / time)
+
+    def _caseName(self, caseRoot):
+        return '' if caseRoot == self._liveCaseFolder else caseRoot.name
+
+    def _failureMessage(self, message, failures):
+        return f'{message} {", ".join(caseRoot.name for caseRoot, _ in failures)}'
 
-    def _reportTimeProgress(self, msg):
+    def _reportTimeProgress(self, caseName, latestTime, msg):
         if msg.startswith('Time = '):
-            self.progress.emit(self.tr(f'Reconstructing the case. {self._caseName} ({msg.strip()}/{self._latestTime})'))
+            self.progress.emit(self.tr(f'Reconstructing the case. {caseName} ({msg.strip()}/{latestTime})'))
@@ -3,17 +3,18 @@
 
 import glob
 import re
-from typing import Final, TextIO, Optional
-from io import StringIO
+from typing import Final, Optional
 from pathlib import Path
 from dataclasses import dataclass
 import logging
 
-import numpy as np
 import pandas as pd
-from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal
+from PySide6.QtCore import Qt, QObject, Signal
 
 from baramFlow.case_manager import CaseManager
+from baramFlow.openfoam.post_processing.file_watcher import PostProcessingWatcher
+from baramFlow.openfoam.post_processing.tail_reader import TableTailReader, readTable
+from libbaram.time_series import TimeSeriesBuffer
 
 
 # One solverInfo file per "Region" is updated by solver during calculation.
@@ -51,91 +52,25 @@ class _SolverInfo:
     dup: str
     size: int
     path: Path
-    f: Optional[TextIO]
-
-
-def readCompleteLineOnly(f):
-    line = f.readline()
-    if line.endswith('\n'):
-        if hasattr(f, 'incompleteLine'):
-            line = f.incompleteLine + line
-            f.incompleteLine = ''
-        return line
-    else:
-        if hasattr(f, 'incompleteLine'):
-            f.incompleteLine += line
-        else:
-            f.incompleteLine = line
-        return ''
-
-
-def readOutFile(f: TextIO):
-    lines = ''
-
-    while line := readCompleteLineOnly(f):
-        if not hasattr(f, 'residualHeader'):  # Initial State
-            if not line.startswith('# Solver information'):
-                raise RuntimeError
-            f.residualHeader = None
-        elif not f.residualHeader:  # Waiting residual header
-            names = line.split()
-            names.pop(0)  # remove '#' from the list
-            if names[0] != 'Time':
-                raise RuntimeError
-            f.residualHeader = names
-        else:  # Parse residuals
-            lines += line
-
-    if hasattr(f, 'residualHeader'):
-        return lines, f.residualHeader
-    else:
-        return lines, None
-
-
-def mergeDataFrames(data: [pd.DataFrame]):
-    merged = None
-    for df in data:
-        if df is None:
-            continue
-        
-        if merged is None:
-            merged = df
-        else:
-            left_on = {'Time', *(merged.columns.values.tolist())}
-            right_on = {'Time', *(df.columns.values.tolist())}
-            on = list(left_on.intersection(right_on))
-
-            # "merge" rather than "concat" should be used because of multi-region cases
-            merged = pd.merge(merged, df, how='outer', on=on)
-            merged = merged.sort_values(by='Time')
+    reader: Optional[TableTailReader]
 
-    return merged
 
-
-def updateData(target, source):
-    if target is None:
-        return source
-    else:
-        # Drop obsoleted rows.
-        # Dataframes should be kept PER REGION because of this dropping.
-        # If dataframes of regions are merged, updated data in other regions can be lost.
-        time = source.first_valid_index()
-        filtered = target[target.index < time]
-        return mergeDataFrames([filtered, source])
+def residualColumns(names: [str]) -> [str]:
+    return [names[0]] + [n for n in names[1:] if n.endswith('_initial')]
 
 
 class Worker(QObject):
-    start = Signal()
-    stop = Signal()
     updateResiduals = Signal()
     residualsUpdated = Signal(pd.DataFrame)
     flushed = Signal()
+    done = Signal()
 
     def __init__(self, casePath: Path, regions: [str]):
         super().__init__()
 
-        self.mrGlobPattern = casePath / 'postProcessing' / '*' / 'solverInfo_*' / '*' / 'solverInfo*.dat'
-        self.srGlobPattern = casePath / 'postProcessing' / 'solverInfo_*' / '*' / 'solverInfo*.dat'
+        self.postProcessingPath = casePath / 'postProcessing'
+        self.mrGlobPattern = self.postProcessingPath / '*' / 'solverInfo_*' / '*' / 'solverInfo*.dat'
+        self.srGlobPattern = self.postProcessingPath / 'solverInfo_*' / '*' / 'solverInfo*.dat'
 
         self.regions = regions
 
@@ -146,14 +81,16 @@ class Worker(QObject):
 
         self.infoFiles = None
 
-        self.timer = None
+        # Sizes of files under postProcessing given by PostProcessingWatcher. Files are globbed if it is None.
+        self.files = None
+
+        self.subscription = None
         self.running = False
 
-        self.start.connect(self.startRun, type=Qt.ConnectionType.QueuedConnection)
-        self.stop.connect(self.stopRun, type=Qt.ConnectionType.QueuedConnection)
+        self.done.connect(self._unsubscribe, type=Qt.ConnectionType.QueuedConnection)
 
     def startRun(self):
-        if self.running:
+        if self.subscription is not None:
             return
 
         self.running = CaseManager().isRunning()
@@ -161,32 +98,50 @@ class Worker(QObject):
         self.collectionReady = 0
 
         self.changingFiles = {r: None for r in self.regions}
-        self.data = {r: None for r in self.regions}
+        # Residuals are kept PER REGION because obsoleted rows are dropped when a region restarts from earlier time.
+        # If residuals of regions are merged, updated data in other regions can be lost.
+        self.data = {r: TimeSeriesBuffer() for r in self.regions}
+
+        self.infoFiles = None
+
+        self.subscription = PostProcessingWatcher().subscribe(self.postProcessingPath, self._filesChanged)
+
+    def stopRun(self):
+        if self.subscription is not None:
+            PostProcessingWatcher().unsubscribe(self.subscription, self._finish)
+            self.subscription = None
 
-        if self.running:
+    def _filesChanged(self, files):
+        # Called in the watcher thread
+        self.files = files
+
+        if self.infoFiles is not None:
+            self.process()
+        elif self.running:
             # Get current snapshot of info files
             self.infoFiles = self.getInfoFiles()
-
-            self.timer = QTimer()
-            self.timer.setInterval(500)
-            self.timer.timeout.connect(self.process)
-            self.timer.start()
         else:
             self.infoFiles = {}
             self.process()
-            self.stopRun()
+            self._finish(files)
             self.flushed.emit()
+            self.done.emit()
 
-    def stopRun(self):
-        if self.running:
-            self.timer.stop()
+    def _unsubscribe(self):
+        if self.subscription is not None:
+            PostProcessingWatcher().unsubscribe(self.subscription)
+            self.subscription = None
+
+    def _finish(self, files):
+        # Called in the watcher thread
+        self.files = files
 
         self.process()
 
         for s in self.changingFiles.values():
-            if s is not None and s.f is not None:  # "s" or "s.f" could remain "None" if the solver stops by error as soon as it starts
-                s.f.close()
-        QThread.currentThread().quit()
+            if s is not None and s.reader is not None:  # "s" or "s.reader" could remain "None" if the solver stops by error as soon as it starts
+                s.reader.close()
+
         self.running = False
 
     def process(self):
@@ -209,38 +164,28 @@ class Worker(QObject):
                 if self.collectionReady < CHANGING_FILE_CHEKING_THRESHOLD_COUNT:
                     return
 
-                hasUpdate = False
                 for s in self.infoFiles.values():
                     if s not in self.changingFiles.values():  # not-changing files
                         df = self._getDataFrame(s.rname, s.path)
                         if df is not None:
-                            self.data[s.rname] = updateData(self.data[s.rname], df)
+                            self.data[s.rname].appendDataFrame(df)
 
                 for s in self.changingFiles.values():
                     if s is None:
                         continue
 
-                    s.f = open(s.path, 'r')
-                    updated, df = self._updateDataFromFile(self.data[s.rname], s.rname, s.f)
-                    if updated:
-                        self.data[s.rname] = updateData(self.data[s.rname], df)
-                        hasUpdate = True
+                    s.reader = TableTailReader(s.path, residualColumns)
+                    self._updateDataFromFile(s.rname, s.reader)
 
-                if hasUpdate:
-                    self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
+                self._publishUpdates()
 
                 return
 
         # regular update routine
-        hasUpdate = False
         for s in updatedFiles.values():
-            updated, df = self._updateDataFromFile(self.data[s.rname], s.rname, self.infoFiles[s.path].f)
-            if updated:
-                self.data[s.rname] = df
-                hasUpdate = True
+            self._updateDataFromFile(s.rname, self.infoFiles[s.path].reader)
 
-        if hasUpdate:
-            self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
+        self._publishUpdates()
 
     def getUpdatedFiles(self, current: {Path: _SolverInfo}) -> {Path: _SolverInfo}:
         infoFiles = self.getInfoFiles()
@@ -253,8 +198,14 @@ class Worker(QObject):
 
         return updatedFiles
 
+    def _listFiles(self, pattern: Path) -> [(Path, int)]:
+        if self.files is None:
+            return [((p := Path(pstr)), p.stat().st_size) for pstr in glob.glob(str(pattern))]
+
+        return [(p, size) for p, size in self.files.items() if p.match(str(pattern))]
+
     def _getInfoFilesMultiRegion(self) -> {Path: _SolverInfo}:
-        mrFiles = [((p := Path(pstr)), p.stat().st_size) for pstr in glob.glob(str(self.mrGlobPattern))]
+        mrFiles = self._listFiles(self.mrGlobPattern)
         infoFiles = {}
         for path, size in mrFiles:
             m = re.search(mrRegexPattern, str(path))
@@ -264,7 +215,7 @@ class Worker(QObject):
         return infoFiles
 
     def _getInfoFilesSingleRegion(self) -> {Path: _SolverInfo}:
-        srFiles = [((p := Path(pstr)), p.stat().st_size) for pstr in glob.glob(str(self.srGlobPattern))]
+        srFiles = self._listFiles(self.srGlobPattern)
         infoFiles = {}
         for path, size in srFiles:
             m = re.search(srRegexPattern, str(path))
@@ -286,53 +237,42 @@ class Worker(QObject):
         return infoFiles
 
     def update(self):
-        self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
-
-    def _updateDataFromFile(self, target: pd.DataFrame, rname: str, f: TextIO) -> (bool, pd.DataFrame):
-        lines, names = readOutFile(f)
-        if not lines:
-            return False, target
-
-        names, columns = self._getResidualHeader(names, rname)
-
-        stream = StringIO(lines)
-        df = pd.read_csv(stream, sep=r'\s+', names=names, dtype={'Time': np.float64})[columns]
-        stream.close()
+        for buffer in self.data.values():
+            if len(buffer) > 0:
+                self.residualsUpdated.emit(buffer.toDataFrame())
+
+    def _publishUpdates(self):
+        # Only the rows appended or rewritten since the last publication are sent, one frame per region.
+        # Receivers replace their rows from the first time of the frame on.
+        for buffer in self.data.values():
+            start = buffer.takeModifiedFrom()
+            if start is not None and start < len(buffer):
+                self.residualsUpdated.emit(buffer.toDataFrame(start))
+
+    def _updateDataFromFile(self, rname: str, reader: TableTailReader) -> bool:
+        df = reader.read()
+        if df is None:
+            return False
 
-        df.set_index('Time', inplace=True)
+        self.data[rname].appendDataFrame(self._residuals(df, rname))
 
-        return True, updateData(target, df)
+        return True
 
     def _getDataFrame(self, rname, path) -> Optional[pd.DataFrame]:
-        with path.open(mode='r') as f:
-            f.readline()  # skip '# Solver information' comment
-            names = f.readline().split()  # read header
-            if len(names) == 0:
-                return None
-
-            names.pop(0)  # remove '#' from the list
-            if names[0] != 'Time':
-                raise RuntimeError
-
-            names, columns = self._getResidualHeader(names, rname)
-
-            df = pd.read_csv(f, sep=r'\s+', names=names, dtype={'Time': np.float64}, skiprows=0)[columns]
-            df.set_index('Time', inplace=True)
-            return df
-
-    def _getResidualHeader(self, names: [str], rname: str):
-        header = names.copy()
-        columns = [names[0]]     # Time
-        for i in range(1, len(names)):
-            if names[i].endswith('_initial'):
-                header[i] = names[i][:-8]
-                columns.append(header[i])
+        df = readTable(path, residualColumns)
+        if df is None:
+            return None
+
+        return self._residuals(df, rname)
 
+    def _residuals(self, df: pd.DataFrame, rname: str) -> pd.DataFrame:
+        names = [c[:-8] for c in df.columns]  # remove '_initial'
         if rname != '':
-            header = [k if k == 'Time' else rname + ':' + k for k in header]
-            columns = [k if k == 'Time' else rname + ':' + k for k in columns]
+            names = [rname + ':' + n for n in names]
 
-        return header, columns
+        df.columns = names
+
+        return df
 
 
 class SolverInfoManager(QObject):
@@ -343,39 +283,31 @@ class SolverInfoManager(QObject):
         super().__init__()
 
         self.worker = None
-        self.thread = None
 
     def startCollecting(self, casePath: Path, regions: [str]):
-        if self.thread is not None:
+        if self.worker is not None:
             self.stopCollecting()
 
         if not casePath.is_absolute():
             raise AssertionError
 
-        self.thread = QThread()
         self.worker = Worker(casePath, regions)
 
-        self.worker.moveToThread(self.thread)
-
         self.worker.residualsUpdated.connect(self.residualsUpdated, type=Qt.ConnectionType.QueuedConnection)
         self.worker.flushed.connect(self.flushed, type=Qt.ConnectionType.QueuedConnection)
 
-        self.thread.start()
-
-        self.worker.start.emit()
+        self.worker.startRun()
 
     def stopCollecting(self):
-        if self.thread is None:
+        if self.worker is None:
             return
 
-        self.worker.stop.emit()
-        self.thread.wait(1000)  # usually 1ms is sufficient, yet delay over 500ms was seen once
+        self.worker.stopRun()
 
         self.worker = None
-        self.thread = None
 
     def updateResiduals(self):
-        if self.thread is None:
+        if self.worker is None:
             raise FileNotFoundError
 
         self.worker.updateResiduals.emit()
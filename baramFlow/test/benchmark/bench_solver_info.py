@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Replays a synthetic solverInfo.dat into SolverInfoManager.Worker as the solver would write it
+
+    python -m baramFlow.test.benchmark.bench_solver_info [lines] [lines per tick]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from baramFlow.openfoam.post_processing.tail_reader import TableTailReader
+from baramFlow.openfoam.solver_info_manager import residualColumns, Worker
+from libbaram.time_series import TimeSeriesBuffer
+
+
+FIELDS = ['Ux', 'Uy', 'Uz', 'p', 'k', 'omega', 'h', 'O2', 'H2O', 'CO2', 'N2']
+
+
+def header():
+    names = ['Time']
+    for f in FIELDS:
+        names += [f'{f}_solver', f'{f}_initial', f'{f}_final', f'{f}_iters']
+    names.append('converged')
+
+    return '# Solver information\n# ' + '\t'.join(names) + '\n'
+
+
+def rows(start, count):
+    rng = np.random.default_rng(start)
+    residuals = rng.random((count, len(FIELDS)))
+    lines = []
+    for i in range(count):
+        values = [f'{start + i + 1}']
+        for r in residuals[i]:
+            values += ['DILUPBiCGStab', f'{r:.8e}', f'{r * 1e-3:.8e}', '3']
+        values.append('false')
+        lines.append('\t'.join(values) + '\n')
+
+    return ''.join(lines)
+
+
+def main():
+    totalLines = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    linesPerTick = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'solverInfo.dat'
+        path.write_text(header())
+
+        worker = Worker(Path(directory), [''])
+        worker.data = {'': TimeSeriesBuffer()}
+        publishedRows = 0
+
+        def published(df):
+            nonlocal publishedRows
+            publishedRows += len(df)
+
+        worker.residualsUpdated.connect(published)
+
+        elapsed = 0
+        slowest = 0
+        reader = TableTailReader(path, residualColumns)
+        for start in range(0, totalLines, linesPerTick):
+            with path.open('a') as w:
+                w.write(rows(start, min(linesPerTick, totalLines - start)))
+
+            t = time.perf_counter()
+            worker._updateDataFromFile('', reader)
+            worker._publishUpdates()
+            tick = time.perf_counter() - t
+
+            elapsed += tick
+            slowest = max(slowest, tick)
+
+        reader.close()
+
+        ticks = (totalLines + linesPerTick - 1) // linesPerTick
+        print(f'{totalLines} lines in {ticks} ticks: total {elapsed:.2f}s, '
+              f'mean {elapsed / ticks * 1000:.2f}ms, slowest {slowest * 1000:.2f}ms, published {publishedRows} rows')
+
+
+if __name__ == '__main__':
+    main()
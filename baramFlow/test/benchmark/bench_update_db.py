@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Times PolyMeshLoader._updateDB for meshes with many patches, as in importing a large Fluent mesh
+
+    python -m baramFlow.test.benchmark.bench_update_db [patches ...]
+"""
+
+import sys
+import time
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.boundary_db import GeometricalType
+from baramFlow.openfoam.polymesh.polymesh_loader import PolyMeshLoader, defaultBoundaryType
+
+
+def mesh(count):
+    boundaries = {}
+    for i in range(count):
+        # Pairs of walls named "<name>" and "<name>_slave" are coupled into interfaces
+        name = f'wall{i // 2}' if i % 2 == 0 else f'wall{i // 2}_slave'
+        if i % 10 == 0:
+            name = f'inlet{i}'
+        elif i % 10 == 1:
+            name = f'outlet{i}'
+
+        boundaries[name] = {'type': 'wall' if name.startswith('wall') else 'patch'}
+        boundaries[name]['bctype'] = defaultBoundaryType(name, GeometricalType(boundaries[name]['type']))
+
+    vtkMesh = {'': {'boundary': {name: None for name in boundaries}, 'internalMesh': None}}
+
+    return vtkMesh, {'': boundaries}
+
+
+def main():
+    counts = [int(a) for a in sys.argv[1:]] or [1000, 5000, 10000]
+
+    for count in counts:
+        vtkMesh, boundaries = mesh(count)
+
+        db = coredb.createDB()
+        try:
+            t = time.perf_counter()
+            PolyMeshLoader()._updateDB(vtkMesh, boundaries)
+            elapsed = time.perf_counter() - t
+
+            print(f'{count} patches: {elapsed:.2f}s, {len(db.getBoundaryConditions(""))} boundary conditions')
+        finally:
+            coredb.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import threading
+import unittest
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.coredb_reader import CoreDBReader
+
+ITERATIONS_XPATH = '/runCalculation/runConditions/numberOfIterations'
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        self.db.setValue(ITERATIONS_XPATH, '10')
+        CoreDBReader().reloadCoreDB()
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def _readInThread(self, db):
+        values = []
+
+        def read():
+            with coredb.readingSnapshot(db):
+                values.append(coredb.CoreDB().getValue(ITERATIONS_XPATH))
+                values.append(CoreDBReader().getValue(ITERATIONS_XPATH))
+            values.append(coredb.CoreDB().getValue(ITERATIONS_XPATH))
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+        return values
+
+    def testSnapshotIsNotModified(self):
+        snapshot = coredb.snapshot()
+        self.db.setValue(ITERATIONS_XPATH, '20')
+
+        self.assertEqual(['10', '10', '20'], self._readInThread(snapshot))
+
+    def testSnapshotReadOnlyInBlock(self):
+        with coredb.readingSnapshot(coredb.snapshot()):
+            self.db.setValue(ITERATIONS_XPATH, '20')
+            self.assertEqual('10', CoreDBReader().getValue(ITERATIONS_XPATH))
+
+        self.assertEqual('20', coredb.CoreDB().getValue(ITERATIONS_XPATH))
+        self.assertEqual('20', CoreDBReader().getValue(ITERATIONS_XPATH))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from lxml import etree
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.boundary_db import BoundaryDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestTransaction(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        RegionDB.addRegion('')
+        self.inlet = self.db.addBoundaryCondition('', 'inlet', 'patch', 'velocityInlet')
+        self.outlet = self.db.addBoundaryCondition('', 'outlet', 'patch', 'pressureOutlet')
+        self.db.addForceMonitor()
+        self.original = etree.tostring(self.db._xmlTree)
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def _modify(self, db):
+        db.setValue('/runCalculation/runConditions/numberOfIterations', '20')
+        db.setAttribute(BoundaryDB.getXPath(self.inlet) + '/thermoCoupledWall/temperature/wallLayers', 'disabled', 'false')
+        db.addBoundaryCondition('', 'wall', 'wall', 'wall')
+        db.copyBoundaryConditions(self.inlet, self.outlet)
+        db.removeElement(BoundaryDB.getXPath(self.inlet))
+        db.clearMonitors()
+
+    def testRollbackByJournal(self):
+        tree = self.db._xmlTree
+        with self.db as db:
+            self._modify(db)
+            raise coredb.Cancel
+
+        self.assertIs(tree, self.db._xmlTree)
+        self.assertEqual(self.original, etree.tostring(self.db._xmlTree))
+
+    def testRollbackAfterGetElement(self):
+        with self.db as db:
+            self._modify(db)
+            db.getElement('/regions/region/boundaryConditions').clear()
+            db.setValue('/runCalculation/runConditions/numberOfIterations', '30')
+            db.addBoundaryCondition('', 'inlet', 'patch', 'wall')
+            raise coredb.Cancel
+
+        self.assertEqual(self.original, etree.tostring(self.db._xmlTree))
+
+    def testRollbackByScopeJournal(self):
+        tree = self.db._xmlTree
+        with self.db as db:
+            element = db.getElement(BoundaryDB.getXPath(self.inlet) + '/physicalType')
+            element.text = 'wall'
+            element.getparent().getparent().remove(db.getElement(BoundaryDB.getXPath(self.outlet)))
+            db.getElement('/runCalculation/runConditions/numberOfIterations').text = '30'
+            raise coredb.Cancel
+
+        self.assertIs(tree, self.db._xmlTree)
+        self.assertEqual(self.original, etree.tostring(self.db._xmlTree))
+
+    def testRollbackByCopy(self):
+        tree = self.db._xmlTree
+        with self.db as db:
+            self._modify(db)
+            db.getElement('.').clear()
+            raise coredb.Cancel
+
+        self.assertIsNot(tree, self.db._xmlTree)
+        self.assertEqual(self.original, etree.tostring(self.db._xmlTree))
+
+    def testCommit(self):
+        with self.db as db:
+            db.getElement('/regions/region/boundaryConditions')
+            self._modify(db)
+
+        expected = etree.tostring(self.db._xmlTree)
+
+        coredb.destroy()
+        self.db = coredb.createDB()
+        RegionDB.addRegion('')
+        self.db.addBoundaryCondition('', 'inlet', 'patch', 'velocityInlet')
+        self.db.addBoundaryCondition('', 'outlet', 'patch', 'pressureOutlet')
+        self.db.addForceMonitor()
+        self._modify(self.db)
+
+        self.assertEqual(expected, etree.tostring(self.db._xmlTree))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from lxml import etree
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.boundary_db import BoundaryDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        RegionDB.addRegion('')
+        self.bcid = self.db.addBoundaryCondition('', 'inlet', 'patch', 'velocityInlet')
+        self.xpath = BoundaryDB.getXPath(self.bcid)
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testInvalidSubtree(self):
+        self.db.getElement(self.xpath + '/physicalType').text = 'invalid'
+        with self.assertRaises(etree.DocumentInvalid):
+            self.db.setValue(self.xpath + '/patchInteraction/type', 'escape')
+
+    def testDeferredValidation(self):
+        with self.db.deferredValidation():
+            self.db.getElement(self.xpath + '/physicalType').text = 'invalid'
+            self.db.setValue(self.xpath + '/patchInteraction/type', 'escape')
+            self.db.getElement(self.xpath + '/physicalType').text = 'wall'
+
+        self.assertEqual('escape', self.db.getValue(self.xpath + '/patchInteraction/type'))
+
+    def testDeferredValidationRollback(self):
+        with self.assertRaises(etree.DocumentInvalid):
+            with self.db:
+                with self.db.deferredValidation():
+                    self.db.addBoundaryCondition('', 'outlet', 'patch', 'pressureOutlet')
+                    self.db.getElement(self.xpath + '/physicalType').text = 'invalid'
+
+        self.assertEqual([(self.bcid, 'inlet', 'velocityInlet')], self.db.getBoundaryConditions(''))
+
+    def testDeferredValidationRaised(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.deferredValidation():
+                self.db.setValue(self.xpath + '/patchInteraction/type', 'escape')
+                raise RuntimeError
+
+        self.assertFalse(self.db._validationPending)
+
+    def testValueTypeCache(self):
+        outlet = self.db.addBoundaryCondition('', 'outlet', 'patch', 'pressureOutlet')
+        self.db.getValue(self.xpath + '/physicalType')
+        self.db.getValue(BoundaryDB.getXPath(outlet) + '/physicalType')
+        self.assertEqual(0.5, self.db.valueTypeHitRate)
+
+        with self.assertRaises(ValueError):
+            self.db.setValue(BoundaryDB.getXPath(outlet) + '/physicalType', 'invalid')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from baramFlow.openfoam.batch_scheduler import BatchPacking, BatchScheduler, launchDryRunSolver
+
+
+class TestBatchScheduler(unittest.TestCase):
+    def setUp(self):
+        self._events = []
+        self._solving = 0
+        self._maxSolving = 0
+        self._preparing = 0
+
+    async def _prepare(self, case):
+        self._preparing += 1
+        self.assertEqual(1, self._preparing)
+        await asyncio.sleep(0.001)
+        self._preparing -= 1
+        if case == 'bad':
+            raise RuntimeError(case)
+
+    async def _solve(self, case):
+        self._solving += 1
+        self._maxSolving = max(self._maxSolving, self._solving)
+        await asyncio.sleep(0.02)
+        self._events.append(case)
+        self._solving -= 1
+
+    def _run(self, scheduler, cases):
+        asyncio.run(scheduler.run(cases, self._prepare, self._solve))
+
+    def testSequential(self):
+        scheduler = BatchScheduler(4, 64, BatchPacking.SEQUENTIAL)
+        self._run(scheduler, list(range(5)))
+
+        self.assertEqual(1, self._maxSolving)
+        self.assertEqual(list(range(5)), self._events)
+
+    def testPacked(self):
+        scheduler = BatchScheduler(4, 14, BatchPacking.PACKED)
+        self.assertEqual(3, scheduler.concurrency())
+
+        self._run(scheduler, list(range(10)))
+
+        self.assertEqual(3, self._maxSolving)
+        self.assertEqual(list(range(10)), sorted(self._events))
+
+    def testStop(self):
+        scheduler = BatchScheduler(1, 2, BatchPacking.PACKED)
+
+        async def solve(case):
+            await self._solve(case)
+            scheduler.stop()
+
+        asyncio.run(scheduler.run(list(range(10)), self._prepare, solve))
+
+        self.assertLess(len(self._events), 10)
+        self.assertEqual([], scheduler.running())
+
+    def testErrorWaitsForRunningCases(self):
+        scheduler = BatchScheduler(1, 4, BatchPacking.PACKED)
+
+        with self.assertRaises(RuntimeError):
+            self._run(scheduler, [0, 1, 'bad', 3, 4])
+
+        self.assertEqual([0, 1], sorted(self._events))
+
+    def testDryRunSolver(self):
+        async def run(path):
+            with open(path / 'log', 'w') as stdout:
+                process = await launchDryRunSolver(4, path, stdout, None, seconds=0)
+                return await process.wait()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory)
+            self.assertEqual(0, asyncio.run(run(path)))
+            self.assertEqual('Dry run on 4 cores', (path / 'log').read_text().strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
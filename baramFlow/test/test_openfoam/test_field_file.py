@@ -0,0 +1,150 @@
+import gzip
+import os
+import stat
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
+
+from libbaram.openfoam.field_file import FieldFile, fieldFilePath
+
+
+HEADER = '''FoamFile
+{{
+    version     2.0;
+    format      {format};
+    arch        "LSB;label=32;scalar=64";
+    class       volScalarField;
+    location    "1";
+    object      p;
+}}
+// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+
+dimensions      [1 -1 -2 0 0 0 0];
+
+'''
+
+BOUNDARY_FIELD = '''
+boundaryField
+{
+    inlet
+    {
+        type            zeroGradient;
+    }
+    outlet
+    {
+        type            fixedValue;
+        value           nonuniform List<scalar> 3(1 2 3);
+    }
+    /* patch with comments; and sub-dictionary */
+    wall
+    {
+        type            uniformFixedValue;
+        uniformValue    table;
+        uniformValueCoeffs
+        {
+            values      ( (0 1) (1 2) );
+        }
+    }
+}
+
+
+// ************************************************************************* //
+'''
+
+
+class TestFieldFile(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name) / 'p'
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _writeAscii(self, count=1000):
+        values = '\n'.join(str(i * 0.5) for i in range(count))
+        self._path.write_text(HEADER.format(format='ascii')
+                              + f'internalField   nonuniform List<scalar> \n{count}\n(\n{values}\n)\n;\n'
+                              + BOUNDARY_FIELD)
+
+    def testEntries(self):
+        self._writeAscii()
+        f = FieldFile(self._path)
+
+        self.assertEqual(['inlet', 'outlet', 'wall'], f.patchNames())
+        self.assertEqual('fixedValue', f.entry('outlet', 'type'))
+        self.assertEqual('nonuniform List<scalar> 3(1 2 3)', f.entry('outlet', 'value'))
+        self.assertIsNone(f.entry('inlet', 'value'))
+        self.assertIsNone(f.entry('none', 'type'))
+
+    def testUpdatePatch(self):
+        self._writeAscii()
+        original = self._path.read_bytes()
+
+        f = FieldFile(self._path)
+        f.updatePatch('inlet', {'type': 'fixedValue', 'value': ('uniform', 3)})
+        f.updatePatch('wall', {'type': 'uniformFixedValue', 'uniformValue': 'table'})
+        f.updatePatch('added', {'type': 'zeroGradient'})
+        f.write()
+
+        content = self._path.read_bytes()
+        self.assertEqual(original[:original.index(b'boundaryField')], content[:content.index(b'boundaryField')])
+
+        parsed = ParsedParameterFile(str(self._path), debug=None).content
+        self.assertEqual(1000, len(parsed['internalField']))
+        self.assertEqual('fixedValue', parsed['boundaryField']['inlet']['type'])
+        self.assertEqual(3, parsed['boundaryField']['inlet']['value'].val)
+        self.assertEqual('fixedValue', parsed['boundaryField']['outlet']['type'])
+        self.assertEqual([[0, 1], [1, 2]], parsed['boundaryField']['wall']['uniformValueCoeffs']['values'])
+        self.assertEqual('zeroGradient', parsed['boundaryField']['added']['type'])
+
+    def testNoChange(self):
+        self._writeAscii()
+        f = FieldFile(self._path)
+        f.updatePatch('inlet', {'type': 'zeroGradient', 'value': None})
+        f.write()
+
+        self.assertEqual(FieldFile(self._path).patchNames(), f.patchNames())
+
+    def testQuotedNameAndPermissions(self):
+        self._writeAscii()
+        self._path.write_bytes(self._path.read_bytes().replace(b'    wall\n', b'    "wall.*"\n'))
+        os.chmod(self._path, 0o664)
+
+        f = FieldFile(self._path)
+        f.updatePatch('wall.*', {'type': 'zeroGradient'})
+        f.write()
+
+        content = self._path.read_bytes()
+        self.assertIn(b'"wall.*"\n    {\n        type', content)
+        self.assertEqual(0o664, stat.S_IMODE(self._path.stat().st_mode))
+
+    def testBinaryAndCompressed(self):
+        # Raw bytes of the list include braces and semicolons
+        values = struct.pack('<4d', 1.0, float.fromhex('0x1.7b3b7dp+0'), 0.0, 2.5) + b'{;}' + bytes(5)
+        count = len(values) // 8
+        data = (HEADER.format(format='binary').encode()
+                + b'internalField   nonuniform List<scalar> ' + str(count).encode() + b'\n(' + values + b')\n;\n'
+                + BOUNDARY_FIELD.encode().replace(b'3(1 2 3)', b'3(' + struct.pack('<3d', 1, 2, 3) + b')'))
+
+        path = self._path.with_name('p.gz')
+        with gzip.open(path, 'wb') as f:
+            f.write(data)
+
+        self.assertEqual(path, fieldFilePath(self._path))
+
+        f = FieldFile(path)
+        f.updatePatch('outlet', {'type': 'fixedValue', 'value': ('uniform', 1)})
+        f.write()
+
+        with gzip.open(path, 'rb') as z:
+            content = z.read()
+
+        self.assertTrue(content.startswith(data[:data.index(b'boundaryField')]))
+        self.assertEqual(['uniform', '1'], FieldFile(path).entry('outlet', 'value').split())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from libbaram.file_copy import CopyMode, copyTrees
+
+
+class TestFileCopy(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name)
+
+        self._pairs = []
+        for n in range(3):
+            source = self._path / f'processor{n}' / '2'
+            (source / 'polyMesh').mkdir(parents=True)
+            (source / 'polyMesh' / 'points').write_bytes(os.urandom(1000))
+            (source / 'cellLevel').write_text(f'processor{n}')
+            self._pairs.append((source, self._path / f'processor{n}' / '4'))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _assertCopied(self):
+        for source, target in self._pairs:
+            self.assertEqual((source / 'polyMesh' / 'points').read_bytes(), (target / 'polyMesh' / 'points').read_bytes())
+            self.assertEqual((source / 'cellLevel').read_text(), (target / 'cellLevel').read_text())
+
+    def testCopy(self):
+        asyncio.run(copyTrees(self._pairs, CopyMode.REFLINK, 2))
+        self._assertCopied()
+
+        # Targets are independent of sources
+        source, target = self._pairs[0]
+        (target / 'cellLevel').write_text('changed')
+        self.assertEqual('processor0', (source / 'cellLevel').read_text())
+
+    def testHardLink(self):
+        asyncio.run(copyTrees(self._pairs, CopyMode.HARDLINK))
+        self._assertCopied()
+
+        source, target = self._pairs[0]
+        self.assertTrue((source / 'cellLevel').samefile(target / 'cellLevel'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict
+
+from libbaram.openfoam.poly_mesh_files import BoundaryFile, readDictionary
+
+
+HEADER = '''/*--------------------------------*- C++ -*----------------------------------*\\
+  =========                 |
+  \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox
+\\*---------------------------------------------------------------------------*/
+FoamFile
+{{
+    version     2.0;
+    format      {format};
+    arch        "LSB;label=32;scalar=64";
+    class       {class_};
+    location    "constant/polyMesh";
+    object      {object_};
+}}
+// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+
+'''
+
+BOUNDARY = '''3
+(
+    inlet
+    {
+        type            patch;
+        nFaces          50;
+        startFace       10325;
+    }
+    cyc_half0
+    {
+        type            cyclic;
+        inGroups        List<word> 2(cyclic other);
+        nFaces          20;
+        startFace       10375;
+        matchTolerance  0.0001;
+        transform       rotational;
+        neighbourPatch  cyc_half1;
+        rotationAxis    (0 0 1);
+        rotationCentre  (0 0 0);
+    }
+    walls
+    {
+        type            wall;
+        inGroups        1(wall);
+        nFaces          0;
+        startFace       10375;
+    }
+)
+
+// ************************************************************************* //
+'''
+
+
+class TestPolyMeshFiles(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _writeBoundary(self):
+        path = self._path / 'boundary'
+        path.write_text(HEADER.format(format='binary', class_='polyBoundaryMesh', object_='boundary') + BOUNDARY)
+
+        return path
+
+    def testBoundary(self):
+        path = self._writeBoundary()
+        boundaries = BoundaryFile(path).content
+
+        self.assertEqual(['inlet', 'cyc_half0', 'walls'], list(boundaries.keys()))
+        self.assertEqual({'type': 'patch', 'nFaces': 50, 'startFace': 10325}, boundaries['inlet'])
+        self.assertEqual(['cyclic', 'other'], boundaries['cyc_half0']['inGroups'])
+        self.assertEqual(['wall'], boundaries['walls']['inGroups'])
+        self.assertEqual(0.0001, boundaries['cyc_half0']['matchTolerance'])
+        self.assertEqual([0, 0, 1], boundaries['cyc_half0']['rotationAxis'])
+
+        parsed = ParsedBoundaryDict(str(path), treatBinaryAsASCII=True).content
+        for name, patch in parsed.items():
+            self.assertEqual(patch['type'], boundaries[name]['type'])
+            self.assertEqual(patch['nFaces'], boundaries[name]['nFaces'])
+
+    def testWriteBoundary(self):
+        path = self._writeBoundary()
+        original = path.read_text()
+
+        boundaryFile = BoundaryFile(path)
+        del boundaryFile.content['walls']
+        boundaryFile.content['inlet']['type'] = 'wall'
+        boundaryFile.content['cyc_half0']['rotationAxis'] = [0.0, 1.0, 0.0]
+        boundaryFile.writeFile()
+
+        content = path.read_text()
+        self.assertEqual(original[:original.index('3\n(')], content[:content.index('2\n(')])
+        self.assertTrue(content.endswith(original[original.index(')\n\n//'):]))
+
+        boundaries = BoundaryFile(path).content
+        self.assertEqual(['inlet', 'cyc_half0'], list(boundaries.keys()))
+        self.assertEqual('wall', boundaries['inlet']['type'])
+        self.assertEqual([0, 1, 0], boundaries['cyc_half0']['rotationAxis'])
+        self.assertEqual(['cyclic', 'other'], boundaries['cyc_half0']['inGroups'])
+
+        parsed = ParsedBoundaryDict(str(path), treatBinaryAsASCII=True).content
+        self.assertEqual('rotational', parsed['cyc_half0']['transform'])
+
+    def testRegionProperties(self):
+        path = self._path / 'regionProperties'
+        path.write_text(HEADER.format(format='ascii', class_='dictionary', object_='regionProperties')
+                        + 'regions\n(\n    fluid       (air water)\n    solid       (heater)\n);\n')
+
+        self.assertEqual({'regions': ['fluid', ['air', 'water'], 'solid', ['heater']]}, readDictionary(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
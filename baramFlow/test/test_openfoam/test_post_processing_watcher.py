@@ -0,0 +1,70 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication
+
+from baramFlow.openfoam.post_processing.file_watcher import PostProcessingWatcher, scanFiles
+
+
+class TestPostProcessingWatcher(unittest.TestCase):
+    def setUp(self):
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name)
+        (self._path / 'monitor' / '0').mkdir(parents=True)
+
+        self._watcher = PostProcessingWatcher()
+        self._watcher.setPollInterval(20, 100)
+
+    def tearDown(self) -> None:
+        self._watcher.shutdown()
+        self._directory.cleanup()
+
+    def _processEvents(self, seconds):
+        end = time.time() + seconds
+        while time.time() < end:
+            self._app.processEvents()
+            time.sleep(0.01)
+
+    def testScanFiles(self):
+        (self._path / 'monitor' / '0' / 'surfaceFieldValue.dat').write_text('12345')
+
+        self.assertEqual({self._path / 'monitor' / '0' / 'surfaceFieldValue.dat': 5}, scanFiles(self._path))
+        self.assertEqual({}, scanFiles(self._path / 'none'))
+
+    def testDispatchChangesUnderDirectory(self):
+        monitorCalls = []
+        allCalls = []
+        monitor = self._watcher.subscribe(self._path / 'monitor', monitorCalls.append)
+        everything = self._watcher.subscribe(self._path, allCalls.append)
+        self._processEvents(0.2)
+
+        self.assertEqual([{}], monitorCalls)
+        self.assertEqual([{}], allCalls)
+
+        path = self._path / 'monitor' / '0' / 'volFieldValue.dat'
+        path.write_text('# Time\n')
+        self._processEvents(0.3)
+
+        self.assertEqual({path: 7}, monitorCalls[-1])
+        self.assertEqual({path: 7}, allCalls[-1])
+
+        monitorCalls.clear()
+        (self._path / 'solverInfo.dat').write_text('#')
+        self._processEvents(0.3)
+
+        self.assertEqual([], monitorCalls)
+        self.assertEqual(2, len(allCalls[-1]))
+
+        finalCalls = []
+        self._watcher.unsubscribe(monitor, finalCalls.append)
+        self._watcher.unsubscribe(everything)
+        self._processEvents(0.2)
+
+        self.assertEqual([{path: 7}], finalCalls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+from pathlib import Path
+
+from baramFlow.openfoam.redistribution_task import runConcurrently
+
+
+class TestRunConcurrently(unittest.TestCase):
+    def setUp(self):
+        self._running = 0
+        self._maxRunning = 0
+        self._finished = []
+
+    async def _run(self, case):
+        self._running += 1
+        self._maxRunning = max(self._maxRunning, self._running)
+        await asyncio.sleep(0.01)
+        self._running -= 1
+        if case.name == 'bad':
+            raise RuntimeError(case.name)
+        self._finished.append(case.name)
+
+    def testConcurrencyLimit(self):
+        cases = [Path(f'case{i}') for i in range(10)]
+        failures = asyncio.run(runConcurrently(cases, self._run, 3))
+
+        self.assertEqual([], failures)
+        self.assertEqual(3, self._maxRunning)
+        self.assertEqual(sorted(c.name for c in cases), sorted(self._finished))
+
+    def testFailure(self):
+        cases = [Path('case0'), Path('bad'), Path('case2')] + [Path(f'late{i}') for i in range(5)]
+        failures = asyncio.run(runConcurrently(cases, self._run, 3))
+
+        self.assertEqual([Path('bad')], [case for case, _ in failures])
+        self.assertIsInstance(failures[0][1], RuntimeError)
+        # Cases running with the failed one finish, and no more cases start
+        self.assertEqual(['case0', 'case2'], sorted(self._finished))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,50 +1,59 @@
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
 from pathlib import Path
 
-from baramFlow.openfoam.solver_info_manager import readCompleteLineOnly, readOutFile, Worker
+import numpy as np
+
+from baramFlow.openfoam.post_processing.tail_reader import TailReader, TableTailReader
+from baramFlow.openfoam.solver_info_manager import residualColumns, Worker
+from libbaram.time_series import TimeSeriesBuffer
 
 
 class TestSolverInfoManager(unittest.TestCase):
     def setUp(self):
-        ...
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name)
 
     def tearDown(self) -> None:
-        ...
-
-    def testReadCompleteLineOnly(self):
-        f = MagicMock()
-        f.incompleteLine = ''  # This is necessary because python unittest Mock() always returns True for hasattr()
-        f.readline.side_effect = [
-            'Line 1 incomplete ',
-            'Line 1 middle ',
-            'Line 1 ending\n',
-            'Line2 incomplete ',
-            'Line 2 remaining\n'
-        ]
-        self.assertEqual('', readCompleteLineOnly(f))
-        self.assertEqual('', readCompleteLineOnly(f))
-        self.assertEqual('Line 1 incomplete Line 1 middle Line 1 ending\n', readCompleteLineOnly(f))
-        self.assertEqual('', readCompleteLineOnly(f))
-        self.assertEqual('Line2 incomplete Line 2 remaining\n', readCompleteLineOnly(f))
-
-    @patch('openfoam.solver_info_manager.readCompleteLineOnly')
-    def testReadOutFile(self, mockReadCompleteLineOnly):
-        f = MagicMock()
-        del f.residualHeader  # make hasattr(f, 'residualHeader) return False
+        self._directory.cleanup()
+
+    def testReadCompleteLinesOnly(self):
+        path = self._path / 'solverInfo.dat'
+        path.write_bytes(b'Line 1 incomplete ')
+        reader = TailReader(path)
+        self.assertEqual(b'', reader.readLines())
+
+        with path.open('ab') as f:
+            f.write(b'Line 1 ending\nLine2 incomplete ')
+        self.assertEqual(b'Line 1 incomplete Line 1 ending\n', reader.readLines())
+        self.assertEqual(b'', reader.readLines())
+
+        with path.open('ab') as f:
+            f.write(b'Line 2 remaining\n')
+        self.assertEqual(b'Line2 incomplete Line 2 remaining\n', reader.readLines())
+        reader.close()
+
+    def testReadOutFile(self):
         fileContents = [
             '# Solver information\n',
-            '# Time          	U_solver        	Ux_initial      	Ux_final        	Ux_iters        	Uy_initial      	Uy_final        	Uy_iters        	Uz_initial      	Uz_final        	Uz_iters        	U_converged     \n',
-            '0.0120482       	DILUPBiCGStab	1.00000000e+00	8.58724200e-08	1	1.00000000e+00	5.78842110e-14	1	1.00000000e+00	6.57355850e-14	1	false\n',
-            '0.0265769       	DILUPBiCGStab	3.66757700e-01	2.17151110e-13	1	9.06273050e-01	3.18900850e-13	1	3.76387760e-01	3.48509970e-13	1	false\n',
-            '0.0439595       	DILUPBiCGStab	2.31957720e-02	2.67950170e-08	1	5.38653860e-01	3.35496420e-13	1	3.79282860e-02	5.53125350e-08	1	false\n',
-            ''
+            '# Time          \tU_solver        \tUx_initial      \tUx_final        \tUx_iters        \tUy_initial      \tUy_final        \tUy_iters        \tUz_initial      \tUz_final        \tUz_iters        \tU_converged     \n',
+            '0.0120482       \tDILUPBiCGStab\t1.00000000e+00\t8.58724200e-08\t1\t1.00000000e+00\t5.78842110e-14\t1\t1.00000000e+00\t6.57355850e-14\t1\tfalse\n',
+            '0.0265769       \tDILUPBiCGStab\t3.66757700e-01\t2.17151110e-13\t1\t9.06273050e-01\t3.18900850e-13\t1\t3.76387760e-01\t3.48509970e-13\t1\tfalse\n',
+            '0.0439595       \tDILUPBiCGStab\t2.31957720e-02\t2.67950170e-08\t1\t5.38653860e-01\t3.35496420e-13\t1\t3.79282860e-02\t5.53125350e-08\t1\tfalse\n',
         ]
-        mockReadCompleteLineOnly.side_effect = fileContents
-        lines, names = readOutFile(f)
-        self.assertEqual(''.join(fileContents[2:]), lines)
-        self.assertEqual(fileContents[1].split()[1:], names)
+        path = self._path / 'solverInfo.dat'
+        path.write_text(''.join(fileContents))
+
+        reader = TableTailReader(path, residualColumns)
+        df = reader.read()
+        reader.close()
+
+        self.assertEqual(fileContents[1].split()[1:], reader.names)
+        self.assertEqual(['Ux_initial', 'Uy_initial', 'Uz_initial'], df.columns.tolist())
+        self.assertEqual([0.0120482, 0.0265769, 0.0439595], df.index.tolist())
+        self.assertEqual([1.0, 9.06273050e-01, 5.38653860e-01], df['Uy_initial'].tolist())
 
     @patch('glob.glob')
     @patch.object(Path, 'stat')
@@ -111,6 +120,44 @@ class TestSolverInfoManager(unittest.TestCase):
         solverInfo = infoFiles[Path(files[2])]
         self.assertIsNotNone(solverInfo.dup)
 
+    def testPublishAppendedRowsOnly(self):
+        w = Worker(Path('/test/case/folder'), [''])
+        w.data = {'': TimeSeriesBuffer()}
+        published = []
+        w.residualsUpdated.connect(published.append)
+
+        path = self._path / 'solverInfo.dat'
+        path.write_text('# Solver information\n# Time\tp_solver\tp_initial\tp_final\tp_iters\tp_converged\n'
+                        '1\tGAMG\t1.0e-01\t1e-05\t3\tfalse\n2\tGAMG\t2.0e-01\t1e-05\t3\tfalse\n')
+        reader = TableTailReader(path, residualColumns)
+        w._updateDataFromFile('', reader)
+        w._publishUpdates()
+
+        with path.open('a') as f:
+            f.write('3\tGAMG\t3.0e-01\t1e-05\t3\tfalse\n')
+        w._updateDataFromFile('', reader)
+        w._publishUpdates()
+        w._publishUpdates()  # Nothing changed
+        reader.close()
+
+        self.assertEqual(2, len(published))
+        self.assertEqual([1.0, 2.0], published[0].index.tolist())
+        self.assertEqual([3.0], published[1].index.tolist())
+        self.assertEqual([0.3], published[1]['p'].tolist())
+
+    def testTruncateOnRestart(self):
+        buffer = TimeSeriesBuffer(2)
+        buffer.append(np.array([1., 2., 3., 4.]), ['a'], np.array([[1.], [2.], [3.], [4.]]))
+        buffer.takeModifiedFrom()
+
+        buffer.append(np.array([3., 3.5]), ['a', 'b'], np.array([[30., 300.], [35., 350.]]))
+
+        self.assertEqual(2, buffer.takeModifiedFrom())
+        self.assertEqual([1., 2., 3., 3.5], buffer.times.tolist())
+        self.assertEqual([1., 2., 30., 35.], buffer.column('a').tolist())
+        self.assertTrue(np.isnan(buffer.column('b')[:2]).all())
+        self.assertEqual([300., 350.], buffer.column('b')[2:].tolist())
+
 
 if __name__ == '__main__':
     unittest.main()
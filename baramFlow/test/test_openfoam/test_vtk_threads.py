@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import unittest
+
+from vtkmodules.vtkFiltersCore import vtkPointDataToCellData
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import vtkPolyDataMapper
+
+from libbaram import vtk_threads
+from libbaram.vtk_threads import vtk_run_in_thread
+
+
+def filterOf(dataSet):
+    f = vtkPointDataToCellData()
+    f.SetInputData(dataSet)
+
+    return f
+
+
+class TestVtkThreads(unittest.TestCase):
+    def setUp(self):
+        self._running = 0
+        self._maxRunning = 0
+        self._mutex = threading.Lock()
+        self._holds = []
+
+    def _work(self, seconds=0.1):
+        with self._mutex:
+            self._running += 1
+            self._maxRunning = max(self._maxRunning, self._running)
+        self._holds.append(vtk_threads.isRenderingHold())
+        threading.Event().wait(seconds)
+        with self._mutex:
+            self._running -= 1
+
+    def _source(self):
+        source = vtkSphereSource()
+        source.Update()
+
+        return source.GetOutput()
+
+    def _runAll(self, pipelines):
+        async def run():
+            await asyncio.gather(*[vtk_run_in_thread(self._work, pipeline=p) for p in pipelines])
+
+        asyncio.run(run())
+
+    def testIndependentPipelines(self):
+        self._runAll([filterOf(self._source()), filterOf(self._source())])
+
+        self.assertEqual(min(2, vtk_threads._pool._max_workers), self._maxRunning)
+        self.assertEqual([False, False], self._holds)
+        self.assertEqual({}, vtk_threads._locks)
+
+    def testSharedDataObject(self):
+        dataSet = self._source()
+        self._runAll([filterOf(dataSet), filterOf(dataSet)])
+
+        self.assertEqual(1, self._maxRunning)
+
+    def testChainedPipelines(self):
+        first = filterOf(self._source())
+        second = vtkPointDataToCellData()
+        second.SetInputConnection(first.GetOutputPort())
+        self._runAll([first, second])
+
+        self.assertEqual(1, self._maxRunning)
+
+    def testMapperHoldsRendering(self):
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputData(self._source())
+        self._runAll([mapper])
+
+        self.assertEqual([True], self._holds)
+        self.assertFalse(vtk_threads.isRenderingHold())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'case_wizard.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QSizePolicy, QWidget, QWizard)
+
+class Ui_CaseWizard(object):
+    def setupUi(self, CaseWizard):
+        if not CaseWizard.objectName():
+            CaseWizard.setObjectName(u"CaseWizard")
+        CaseWizard.resize(420, 300)
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(CaseWizard.sizePolicy().hasHeightForWidth())
+        CaseWizard.setSizePolicy(sizePolicy)
+        CaseWizard.setMinimumSize(QSize(420, 300))
+        CaseWizard.setMaximumSize(QSize(420, 300))
+        font = QFont()
+        font.setPointSize(10)
+        CaseWizard.setFont(font)
+        CaseWizard.setStyleSheet(u"")
+        CaseWizard.setWizardStyle(QWizard.ModernStyle)
+        CaseWizard.setOptions(QWizard.CancelButtonOnLeft|QWizard.HaveHelpButton|QWizard.NoBackButtonOnStartPage)
+
+        self.retranslateUi(CaseWizard)
+
+        QMetaObject.connectSlotsByName(CaseWizard)
+    # setupUi
+
+    def retranslateUi(self, CaseWizard):
+        CaseWizard.setWindowTitle(QCoreApplication.translate("CaseWizard", u"Wizard", None))
+    # retranslateUi
+
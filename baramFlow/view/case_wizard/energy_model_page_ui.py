@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'energy_model_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QRadioButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget, QWizardPage)
+import resource_rc
+
+class Ui_EnergyModelPage(object):
+    def setupUi(self, EnergyModelPage):
+        if not EnergyModelPage.objectName():
+            EnergyModelPage.setObjectName(u"EnergyModelPage")
+        EnergyModelPage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        EnergyModelPage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(EnergyModelPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(EnergyModelPage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.include = QRadioButton(self.widget)
+        self.include.setObjectName(u"include")
+
+        self.verticalLayout.addWidget(self.include)
+
+        self.notInclude = QRadioButton(self.widget)
+        self.notInclude.setObjectName(u"notInclude")
+
+        self.verticalLayout.addWidget(self.notInclude)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(EnergyModelPage)
+
+        QMetaObject.connectSlotsByName(EnergyModelPage)
+    # setupUi
+
+    def retranslateUi(self, EnergyModelPage):
+        EnergyModelPage.setWindowTitle(QCoreApplication.translate("EnergyModelPage", u"WizardPage", None))
+        EnergyModelPage.setTitle(QCoreApplication.translate("EnergyModelPage", u"Energy Model", None))
+        self.include.setText(QCoreApplication.translate("EnergyModelPage", u"Include", None))
+        self.notInclude.setText(QCoreApplication.translate("EnergyModelPage", u"Not Include", None))
+    # retranslateUi
+
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'flow_type_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QRadioButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget, QWizardPage)
+import resource_rc
+
+class Ui_FlowTypePage(object):
+    def setupUi(self, FlowTypePage):
+        if not FlowTypePage.objectName():
+            FlowTypePage.setObjectName(u"FlowTypePage")
+        FlowTypePage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        FlowTypePage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(FlowTypePage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(FlowTypePage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.compressible = QRadioButton(self.widget)
+        self.compressible.setObjectName(u"compressible")
+        self.compressible.setEnabled(True)
+
+        self.verticalLayout.addWidget(self.compressible)
+
+        self.incompressible = QRadioButton(self.widget)
+        self.incompressible.setObjectName(u"incompressible")
+        self.incompressible.setChecked(True)
+
+        self.verticalLayout.addWidget(self.incompressible)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(FlowTypePage)
+
+        QMetaObject.connectSlotsByName(FlowTypePage)
+    # setupUi
+
+    def retranslateUi(self, FlowTypePage):
+        FlowTypePage.setWindowTitle(QCoreApplication.translate("FlowTypePage", u"WizardPage", None))
+        FlowTypePage.setTitle(QCoreApplication.translate("FlowTypePage", u"Flow Type", None))
+        FlowTypePage.setSubTitle("")
+        self.compressible.setText(QCoreApplication.translate("FlowTypePage", u"Compressible", None))
+        self.incompressible.setText(QCoreApplication.translate("FlowTypePage", u"Incompressible", None))
+    # retranslateUi
+
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'gravity_model_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QLabel, QLineEdit,
+    QRadioButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget, QWizardPage)
+import resource_rc
+
+class Ui_GravityModelPage(object):
+    def setupUi(self, GravityModelPage):
+        if not GravityModelPage.objectName():
+            GravityModelPage.setObjectName(u"GravityModelPage")
+        GravityModelPage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        GravityModelPage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(GravityModelPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(GravityModelPage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.include = QRadioButton(self.widget)
+        self.include.setObjectName(u"include")
+
+        self.verticalLayout.addWidget(self.include)
+
+        self.formWidget = QWidget(self.widget)
+        self.formWidget.setObjectName(u"formWidget")
+        self.formLayout = QFormLayout(self.formWidget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(20, -1, 30, -1)
+        self.label_x = QLabel(self.formWidget)
+        self.label_x.setObjectName(u"label_x")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_x.sizePolicy().hasHeightForWidth())
+        self.label_x.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_x)
+
+        self.x = QLineEdit(self.formWidget)
+        self.x.setObjectName(u"x")
+        self.x.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.x)
+
+        self.label_y = QLabel(self.formWidget)
+        self.label_y.setObjectName(u"label_y")
+        sizePolicy.setHeightForWidth(self.label_y.sizePolicy().hasHeightForWidth())
+        self.label_y.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_y)
+
+        self.y = QLineEdit(self.formWidget)
+        self.y.setObjectName(u"y")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.y)
+
+        self.label_z = QLabel(self.formWidget)
+        self.label_z.setObjectName(u"label_z")
+        sizePolicy.setHeightForWidth(self.label_z.sizePolicy().hasHeightForWidth())
+        self.label_z.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_z)
+
+        self.z = QLineEdit(self.formWidget)
+        self.z.setObjectName(u"z")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.z)
+
+
+        self.verticalLayout.addWidget(self.formWidget)
+
+        self.notInclude = QRadioButton(self.widget)
+        self.notInclude.setObjectName(u"notInclude")
+
+        self.verticalLayout.addWidget(self.notInclude)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(GravityModelPage)
+        self.include.toggled.connect(self.x.setEnabled)
+        self.include.toggled.connect(self.z.setEnabled)
+        self.include.toggled.connect(self.y.setEnabled)
+
+        QMetaObject.connectSlotsByName(GravityModelPage)
+    # setupUi
+
+    def retranslateUi(self, GravityModelPage):
+        GravityModelPage.setWindowTitle(QCoreApplication.translate("GravityModelPage", u"WizardPage", None))
+        GravityModelPage.setTitle(QCoreApplication.translate("GravityModelPage", u"Gravity", None))
+        self.include.setText(QCoreApplication.translate("GravityModelPage", u"Include", None))
+        self.label_x.setText(QCoreApplication.translate("GravityModelPage", u"X(m/s<sup>2</sup>)", None))
+        self.x.setText("")
+        self.label_y.setText(QCoreApplication.translate("GravityModelPage", u"Y(m/s<sup>2</sup>)", None))
+        self.y.setText("")
+        self.label_z.setText(QCoreApplication.translate("GravityModelPage", u"Z(m/s<sup>2</sup>)", None))
+        self.z.setText("")
+        self.notInclude.setText(QCoreApplication.translate("GravityModelPage", u"Not Include", None))
+    # retranslateUi
+
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'last_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QLabel, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget, QWizardPage)
+import resource_rc
+
+class Ui_LastPage(object):
+    def setupUi(self, LastPage):
+        if not LastPage.objectName():
+            LastPage.setObjectName(u"LastPage")
+        LastPage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        LastPage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(LastPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(LastPage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+        self.label.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.label)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(LastPage)
+
+        QMetaObject.connectSlotsByName(LastPage)
+    # setupUi
+
+    def retranslateUi(self, LastPage):
+        LastPage.setWindowTitle(QCoreApplication.translate("LastPage", u"WizardPage", None))
+        LastPage.setTitle(QCoreApplication.translate("LastPage", u"Completed!", None))
+        LastPage.setSubTitle("")
+        self.label.setText(QCoreApplication.translate("LastPage", u"Configuration for a new project has completed", None))
+    # retranslateUi
+
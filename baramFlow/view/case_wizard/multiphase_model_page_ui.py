@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'multiphase_model_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget, QWizardPage)
+import resource_rc
+
+class Ui_MultiphaseModelPage(object):
+    def setupUi(self, MultiphaseModelPage):
+        if not MultiphaseModelPage.objectName():
+            MultiphaseModelPage.setObjectName(u"MultiphaseModelPage")
+        MultiphaseModelPage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        MultiphaseModelPage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(MultiphaseModelPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(MultiphaseModelPage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.off = QRadioButton(self.widget)
+        self.modelRadioGroup = QButtonGroup(MultiphaseModelPage)
+        self.modelRadioGroup.setObjectName(u"modelRadioGroup")
+        self.modelRadioGroup.addButton(self.off)
+        self.off.setObjectName(u"off")
+
+        self.verticalLayout.addWidget(self.off)
+
+        self.volumeOfFluid = QRadioButton(self.widget)
+        self.modelRadioGroup.addButton(self.volumeOfFluid)
+        self.volumeOfFluid.setObjectName(u"volumeOfFluid")
+
+        self.verticalLayout.addWidget(self.volumeOfFluid)
+
+        self.mixture = QRadioButton(self.widget)
+        self.modelRadioGroup.addButton(self.mixture)
+        self.mixture.setObjectName(u"mixture")
+
+        self.verticalLayout.addWidget(self.mixture)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(MultiphaseModelPage)
+
+        QMetaObject.connectSlotsByName(MultiphaseModelPage)
+    # setupUi
+
+    def retranslateUi(self, MultiphaseModelPage):
+        MultiphaseModelPage.setWindowTitle(QCoreApplication.translate("MultiphaseModelPage", u"WizardPage", None))
+        MultiphaseModelPage.setTitle(QCoreApplication.translate("MultiphaseModelPage", u"Multiphase Model", None))
+        self.off.setText(QCoreApplication.translate("MultiphaseModelPage", u"Off", None))
+        self.volumeOfFluid.setText(QCoreApplication.translate("MultiphaseModelPage", u"Volume of Fluid", None))
+        self.mixture.setText(QCoreApplication.translate("MultiphaseModelPage", u"Mixture (cavitation)", None))
+    # retranslateUi
+
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'solver_type_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QRadioButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget,
+    QWizardPage)
+import resource_rc
+
+class Ui_SolverTypePage(object):
+    def setupUi(self, SolverTypePage):
+        if not SolverTypePage.objectName():
+            SolverTypePage.setObjectName(u"SolverTypePage")
+        SolverTypePage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        SolverTypePage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(SolverTypePage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(SolverTypePage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.pressureBased = QRadioButton(self.widget)
+        self.pressureBased.setObjectName(u"pressureBased")
+        self.pressureBased.setEnabled(True)
+
+        self.verticalLayout.addWidget(self.pressureBased)
+
+        self.densityBased = QRadioButton(self.widget)
+        self.densityBased.setObjectName(u"densityBased")
+
+        self.verticalLayout.addWidget(self.densityBased)
+
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(20, 0, 0, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+        self.label.setWordWrap(True)
+
+        self.horizontalLayout.addWidget(self.label)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(SolverTypePage)
+
+        QMetaObject.connectSlotsByName(SolverTypePage)
+    # setupUi
+
+    def retranslateUi(self, SolverTypePage):
+        SolverTypePage.setWindowTitle(QCoreApplication.translate("SolverTypePage", u"WizardPage", None))
+        SolverTypePage.setTitle(QCoreApplication.translate("SolverTypePage", u"Solver Type", None))
+        self.pressureBased.setText(QCoreApplication.translate("SolverTypePage", u"Pressure-based", None))
+        self.densityBased.setText(QCoreApplication.translate("SolverTypePage", u"Density-based", None))
+        self.label.setText(QCoreApplication.translate("SolverTypePage", u"\"Density-based\" solver is for high Mach-number flows", None))
+    # retranslateUi
+
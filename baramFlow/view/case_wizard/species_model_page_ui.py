@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'species_model_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QRadioButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget, QWizardPage)
+import resource_rc
+
+class Ui_SpeciesModelPage(object):
+    def setupUi(self, SpeciesModelPage):
+        if not SpeciesModelPage.objectName():
+            SpeciesModelPage.setObjectName(u"SpeciesModelPage")
+        SpeciesModelPage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        SpeciesModelPage.setFont(font)
+        self.verticalLayout_2 = QVBoxLayout(SpeciesModelPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(SpeciesModelPage)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(15, -1, 15, -1)
+        self.include = QRadioButton(self.widget)
+        self.include.setObjectName(u"include")
+        self.include.setEnabled(False)
+
+        self.verticalLayout.addWidget(self.include)
+
+        self.notInclude = QRadioButton(self.widget)
+        self.notInclude.setObjectName(u"notInclude")
+        self.notInclude.setChecked(True)
+
+        self.verticalLayout.addWidget(self.notInclude)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(SpeciesModelPage)
+
+        QMetaObject.connectSlotsByName(SpeciesModelPage)
+    # setupUi
+
+    def retranslateUi(self, SpeciesModelPage):
+        SpeciesModelPage.setWindowTitle(QCoreApplication.translate("SpeciesModelPage", u"WizardPage", None))
+        SpeciesModelPage.setTitle(QCoreApplication.translate("SpeciesModelPage", u"Species Model", None))
+        self.include.setText(QCoreApplication.translate("SpeciesModelPage", u"Include", None))
+        self.notInclude.setText(QCoreApplication.translate("SpeciesModelPage", u"Not Include", None))
+    # retranslateUi
+
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'workspace_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget, QWizardPage)
+import resource_rc
+
+class Ui_WorkspacePage(object):
+    def setupUi(self, WorkspacePage):
+        if not WorkspacePage.objectName():
+            WorkspacePage.setObjectName(u"WorkspacePage")
+        WorkspacePage.resize(300, 200)
+        font = QFont()
+        font.setPointSize(10)
+        WorkspacePage.setFont(font)
+        self.verticalLayout = QVBoxLayout(WorkspacePage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.workspace = QWidget(WorkspacePage)
+        self.workspace.setObjectName(u"workspace")
+        self.formLayout = QFormLayout(self.workspace)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.workspace)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.projectName = QLineEdit(self.workspace)
+        self.projectName.setObjectName(u"projectName")
+        self.projectName.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.projectName)
+
+        self.label_2 = QLabel(self.workspace)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.widget_2 = QWidget(self.workspace)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.projectLocation = QLineEdit(self.widget_2)
+        self.projectLocation.setObjectName(u"projectLocation")
+        self.projectLocation.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.projectLocation)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+        self.select.setMinimumSize(QSize(20, 0))
+        self.select.setMaximumSize(QSize(20, 16777215))
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.widget_2)
+
+
+        self.verticalLayout.addWidget(self.workspace)
+
+        self.validationMessage = QLabel(WorkspacePage)
+        self.validationMessage.setObjectName(u"validationMessage")
+        self.validationMessage.setStyleSheet(u"color: red")
+
+        self.verticalLayout.addWidget(self.validationMessage)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(WorkspacePage)
+
+        QMetaObject.connectSlotsByName(WorkspacePage)
+    # setupUi
+
+    def retranslateUi(self, WorkspacePage):
+        WorkspacePage.setWindowTitle(QCoreApplication.translate("WorkspacePage", u"WizardPage", None))
+        WorkspacePage.setTitle(QCoreApplication.translate("WorkspacePage", u"Project Directory", None))
+        self.label.setText(QCoreApplication.translate("WorkspacePage", u"Project Name", None))
+        self.label_2.setText(QCoreApplication.translate("WorkspacePage", u"Project Location", None))
+        self.select.setText(QCoreApplication.translate("WorkspacePage", u"...", None))
+        self.validationMessage.setText("")
+    # retranslateUi
+
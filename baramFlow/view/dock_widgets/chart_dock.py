@@ -102,7 +102,7 @@ class ChartView(QWidget):
             self.stopDrawing()
 
     def _updated(self, data: pd.DataFrame):
-        self._chart.dataUpdated(data)
+        self._chart.dataAppended(data)
 
     def _flushed(self):
         self._chart.fitChart()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'fluent_regions_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QGridLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_FlluentRegionsDialog(object):
+    def setupUi(self, FlluentRegionsDialog):
+        if not FlluentRegionsDialog.objectName():
+            FlluentRegionsDialog.setObjectName(u"FlluentRegionsDialog")
+        FlluentRegionsDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(FlluentRegionsDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(FlluentRegionsDialog)
+        self.widget.setObjectName(u"widget")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.widget_3 = QWidget(self.widget)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.table = QWidget(self.widget_3)
+        self.table.setObjectName(u"table")
+        sizePolicy.setHeightForWidth(self.table.sizePolicy().hasHeightForWidth())
+        self.table.setSizePolicy(sizePolicy)
+        self.gridLayout = QGridLayout(self.table)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(-1, 0, -1, -1)
+        self.label = QLabel(self.table)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+
+        self.verticalLayout_3.addWidget(self.table)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout.addWidget(self.widget_3)
+
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, -1, -1, -1)
+        self.addRegion = QPushButton(self.widget_2)
+        self.addRegion.setObjectName(u"addRegion")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.addRegion.sizePolicy().hasHeightForWidth())
+        self.addRegion.setSizePolicy(sizePolicy1)
+        icon = QIcon()
+        icon.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.addRegion.setIcon(icon)
+
+        self.verticalLayout_2.addWidget(self.addRegion)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout.addWidget(self.widget_2)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_5 = QWidget(FlluentRegionsDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+
+        self.retranslateUi(FlluentRegionsDialog)
+        self.cancel.clicked.connect(FlluentRegionsDialog.close)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(FlluentRegionsDialog)
+    # setupUi
+
+    def retranslateUi(self, FlluentRegionsDialog):
+        FlluentRegionsDialog.setWindowTitle(QCoreApplication.translate("FlluentRegionsDialog", u"Configure Regions", None))
+        self.label.setText("")
+        self.addRegion.setText("")
+        self.ok.setText(QCoreApplication.translate("FlluentRegionsDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("FlluentRegionsDialog", u"Cancel", None))
+    # retranslateUi
+
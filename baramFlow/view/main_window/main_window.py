@@ -557,7 +557,7 @@ class MainWindow(QMainWindow, expert_mode.IExpertModeObserver):
             progressDialog.setLabelText('Redistributing Case')
 
             try:
-                redistributionTask = RedistributionTask()
+                redistributionTask = RedistributionTask(parallel.getRedistributionConcurrency())
                 redistributionTask.progress.connect(progressDialog.setLabelText)
 
                 await redistributionTask.redistribute()
@@ -879,7 +879,7 @@ class MainWindow(QMainWindow, expert_mode.IExpertModeObserver):
             loader.progress.connect(progressDialog.setLabelText)
             await loader.loadMesh()
 
-            redistributeTask = RedistributionTask()
+            redistributeTask = RedistributionTask(parallel.getRedistributionConcurrency())
             redistributeTask.progress.connect(progressDialog.setLabelText)
             await redistributeTask.redistribute()
         except Exception as ex:
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QHeaderView, QLabel,
+    QListWidget, QListWidgetItem, QMainWindow, QMenu,
+    QMenuBar, QPushButton, QSizePolicy, QSpacerItem,
+    QSplitter, QStackedWidget, QStatusBar, QTreeWidget,
+    QTreeWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1280, 768)
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        self.actionCloseProject = QAction(MainWindow)
+        self.actionCloseProject.setObjectName(u"actionCloseProject")
+        self.actionSave = QAction(MainWindow)
+        self.actionSave.setObjectName(u"actionSave")
+        self.actionSaveAs = QAction(MainWindow)
+        self.actionSaveAs.setObjectName(u"actionSaveAs")
+        self.actionPreference = QAction(MainWindow)
+        self.actionPreference.setObjectName(u"actionPreference")
+        self.actionExit = QAction(MainWindow)
+        self.actionExit.setObjectName(u"actionExit")
+        self.actionScale = QAction(MainWindow)
+        self.actionScale.setObjectName(u"actionScale")
+        self.actionLanguage = QAction(MainWindow)
+        self.actionLanguage.setObjectName(u"actionLanguage")
+        self.actionMeshScale = QAction(MainWindow)
+        self.actionMeshScale.setObjectName(u"actionMeshScale")
+        self.actionMeshTranslate = QAction(MainWindow)
+        self.actionMeshTranslate.setObjectName(u"actionMeshTranslate")
+        self.actionMeshRotate = QAction(MainWindow)
+        self.actionMeshRotate.setObjectName(u"actionMeshRotate")
+        self.actionOpenFoam = QAction(MainWindow)
+        self.actionOpenFoam.setObjectName(u"actionOpenFoam")
+        self.actionFluent = QAction(MainWindow)
+        self.actionFluent.setObjectName(u"actionFluent")
+        self.actionFluent.setEnabled(True)
+        self.actionStarCCM = QAction(MainWindow)
+        self.actionStarCCM.setObjectName(u"actionStarCCM")
+        self.actionStarCCM.setEnabled(True)
+        self.actionStarCCM.setVisible(True)
+        self.actionGmsh = QAction(MainWindow)
+        self.actionGmsh.setObjectName(u"actionGmsh")
+        self.actionIdeas = QAction(MainWindow)
+        self.actionIdeas.setObjectName(u"actionIdeas")
+        self.actionNasaPlot3d = QAction(MainWindow)
+        self.actionNasaPlot3d.setObjectName(u"actionNasaPlot3d")
+        self.actionNasaPlot3d.setEnabled(False)
+        self.actionParaView = QAction(MainWindow)
+        self.actionParaView.setObjectName(u"actionParaView")
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName(u"actionAbout")
+        self.actionParallelEnvironment = QAction(MainWindow)
+        self.actionParallelEnvironment.setObjectName(u"actionParallelEnvironment")
+        self.actionParaViewSetting = QAction(MainWindow)
+        self.actionParaViewSetting.setObjectName(u"actionParaViewSetting")
+        self.actionMeshInfo = QAction(MainWindow)
+        self.actionMeshInfo.setObjectName(u"actionMeshInfo")
+        self.actionMultiplePolyMesh = QAction(MainWindow)
+        self.actionMultiplePolyMesh.setObjectName(u"actionMultiplePolyMesh")
+        self.actionTutorials = QAction(MainWindow)
+        self.actionTutorials.setObjectName(u"actionTutorials")
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.horizontalLayout_2 = QHBoxLayout(self.centralwidget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.splitter = QSplitter(self.centralwidget)
+        self.splitter.setObjectName(u"splitter")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.splitter.sizePolicy().hasHeightForWidth())
+        self.splitter.setSizePolicy(sizePolicy1)
+        self.splitter.setMaximumSize(QSize(16777215, 16777215))
+        self.splitter.setOrientation(Qt.Horizontal)
+        self.splitter.setChildrenCollapsible(False)
+        self.navigatorView = QTreeWidget(self.splitter)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(0, u"1");
+        self.navigatorView.setHeaderItem(__qtreewidgetitem)
+        self.navigatorView.setObjectName(u"navigatorView")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.navigatorView.sizePolicy().hasHeightForWidth())
+        self.navigatorView.setSizePolicy(sizePolicy2)
+        self.navigatorView.setMinimumSize(QSize(200, 0))
+        self.splitter.addWidget(self.navigatorView)
+        self.navigatorView.header().setVisible(False)
+        self.formView = QStackedWidget(self.splitter)
+        self.formView.setObjectName(u"formView")
+        sizePolicy1.setHeightForWidth(self.formView.sizePolicy().hasHeightForWidth())
+        self.formView.setSizePolicy(sizePolicy1)
+        self.formView.setMinimumSize(QSize(400, 0))
+        self.emptyPage = QWidget()
+        self.emptyPage.setObjectName(u"emptyPage")
+        self.verticalLayout = QVBoxLayout(self.emptyPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(self.emptyPage)
+        self.label.setObjectName(u"label")
+        sizePolicy2.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy2)
+        self.label.setMinimumSize(QSize(0, 0))
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.formView.addWidget(self.emptyPage)
+        self.listPage = QWidget()
+        self.listPage.setObjectName(u"listPage")
+        self.verticalLayout_2 = QVBoxLayout(self.listPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.title = QLabel(self.listPage)
+        self.title.setObjectName(u"title")
+
+        self.verticalLayout_2.addWidget(self.title)
+
+        self.editList = QListWidget(self.listPage)
+        self.editList.setObjectName(u"editList")
+        self.editList.setMinimumSize(QSize(0, 200))
+        self.editList.setModelColumn(0)
+
+        self.verticalLayout_2.addWidget(self.editList)
+
+        self.widget = QWidget(self.listPage)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(120, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        self.edit.setLocale(QLocale(QLocale.English, QLocale.UnitedStates))
+
+        self.horizontalLayout.addWidget(self.edit)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 219, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.formView.addWidget(self.listPage)
+        self.splitter.addWidget(self.formView)
+
+        self.horizontalLayout_2.addWidget(self.splitter)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1280, 22))
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menuLoadMesh = QMenu(self.menuFile)
+        self.menuLoadMesh.setObjectName(u"menuLoadMesh")
+        self.menuView = QMenu(self.menubar)
+        self.menuView.setObjectName(u"menuView")
+        self.menuSetting = QMenu(self.menubar)
+        self.menuSetting.setObjectName(u"menuSetting")
+        self.menuMesh = QMenu(self.menubar)
+        self.menuMesh.setObjectName(u"menuMesh")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        self.menuParallel = QMenu(self.menubar)
+        self.menuParallel.setObjectName(u"menuParallel")
+        self.menuExternal_Tools = QMenu(self.menubar)
+        self.menuExternal_Tools.setObjectName(u"menuExternal_Tools")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuMesh.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
+        self.menubar.addAction(self.menuParallel.menuAction())
+        self.menubar.addAction(self.menuSetting.menuAction())
+        self.menubar.addAction(self.menuExternal_Tools.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addAction(self.actionSave)
+        self.menuFile.addAction(self.actionSaveAs)
+        self.menuFile.addAction(self.menuLoadMesh.menuAction())
+        self.menuFile.addAction(self.actionCloseProject)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionExit)
+        self.menuLoadMesh.addAction(self.actionOpenFoam)
+        self.menuLoadMesh.addAction(self.actionMultiplePolyMesh)
+        self.menuLoadMesh.addAction(self.actionFluent)
+        self.menuLoadMesh.addAction(self.actionStarCCM)
+        self.menuLoadMesh.addAction(self.actionGmsh)
+        self.menuLoadMesh.addAction(self.actionIdeas)
+        self.menuLoadMesh.addAction(self.actionNasaPlot3d)
+        self.menuSetting.addAction(self.actionScale)
+        self.menuSetting.addAction(self.actionLanguage)
+        self.menuSetting.addAction(self.actionParaViewSetting)
+        self.menuMesh.addAction(self.actionMeshInfo)
+        self.menuMesh.addAction(self.actionMeshScale)
+        self.menuMesh.addAction(self.actionMeshTranslate)
+        self.menuMesh.addAction(self.actionMeshRotate)
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuHelp.addAction(self.actionTutorials)
+        self.menuParallel.addAction(self.actionParallelEnvironment)
+        self.menuExternal_Tools.addAction(self.actionParaView)
+
+        self.retranslateUi(MainWindow)
+
+        self.formView.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"BaramFlow", None))
+        self.actionCloseProject.setText(QCoreApplication.translate("MainWindow", u"&Close Project", None))
+        self.actionSave.setText(QCoreApplication.translate("MainWindow", u"&Save", None))
+        self.actionSaveAs.setText(QCoreApplication.translate("MainWindow", u"Save &As", None))
+        self.actionPreference.setText(QCoreApplication.translate("MainWindow", u"Preference", None))
+        self.actionExit.setText(QCoreApplication.translate("MainWindow", u"&Exit", None))
+        self.actionScale.setText(QCoreApplication.translate("MainWindow", u"&Scale", None))
+        self.actionLanguage.setText(QCoreApplication.translate("MainWindow", u"&Language", None))
+        self.actionMeshScale.setText(QCoreApplication.translate("MainWindow", u"&Scale", None))
+        self.actionMeshTranslate.setText(QCoreApplication.translate("MainWindow", u"&Translate", None))
+        self.actionMeshRotate.setText(QCoreApplication.translate("MainWindow", u"&Rotate", None))
+        self.actionOpenFoam.setText(QCoreApplication.translate("MainWindow", u"OpenFOAM", None))
+        self.actionFluent.setText(QCoreApplication.translate("MainWindow", u"Fluent (ASCII)", None))
+        self.actionStarCCM.setText(QCoreApplication.translate("MainWindow", u"StarCCM+", None))
+        self.actionGmsh.setText(QCoreApplication.translate("MainWindow", u"Gmsh (ASCII)", None))
+        self.actionIdeas.setText(QCoreApplication.translate("MainWindow", u"I-deas Universal (ASCII)", None))
+        self.actionNasaPlot3d.setText(QCoreApplication.translate("MainWindow", u"PLOT3D GRID (ASCII)", None))
+        self.actionParaView.setText(QCoreApplication.translate("MainWindow", u"&ParaView", None))
+        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"About", None))
+        self.actionParallelEnvironment.setText(QCoreApplication.translate("MainWindow", u"&Environment", None))
+        self.actionParaViewSetting.setText(QCoreApplication.translate("MainWindow", u"&ParaView", None))
+        self.actionMeshInfo.setText(QCoreApplication.translate("MainWindow", u"&Info.", None))
+#if QT_CONFIG(tooltip)
+        self.actionMeshInfo.setToolTip(QCoreApplication.translate("MainWindow", u"Mesh Info.", None))
+#endif // QT_CONFIG(tooltip)
+        self.actionMultiplePolyMesh.setText(QCoreApplication.translate("MainWindow", u"Multiple polyMesh", None))
+        self.actionTutorials.setText(QCoreApplication.translate("MainWindow", u"Tutorials", None))
+        self.label.setText("")
+        self.title.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.edit.setText(QCoreApplication.translate("MainWindow", u"Edit", None))
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"&File", None))
+        self.menuLoadMesh.setTitle(QCoreApplication.translate("MainWindow", u"&Load Mesh", None))
+        self.menuView.setTitle(QCoreApplication.translate("MainWindow", u"&View", None))
+        self.menuSetting.setTitle(QCoreApplication.translate("MainWindow", u"&Settings", None))
+        self.menuMesh.setTitle(QCoreApplication.translate("MainWindow", u"&Mesh", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"&Help", None))
+        self.menuParallel.setTitle(QCoreApplication.translate("MainWindow", u"&Parallel", None))
+        self.menuExternal_Tools.setTitle(QCoreApplication.translate("MainWindow", u"External &Tools", None))
+    # retranslateUi
+
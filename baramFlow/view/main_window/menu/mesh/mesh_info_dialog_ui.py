@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mesh_info_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QPushButton, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_MeshInfoDialog(object):
+    def setupUi(self, MeshInfoDialog):
+        if not MeshInfoDialog.objectName():
+            MeshInfoDialog.setObjectName(u"MeshInfoDialog")
+        MeshInfoDialog.resize(222, 270)
+        self.verticalLayout = QVBoxLayout(MeshInfoDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox_10 = QGroupBox(MeshInfoDialog)
+        self.groupBox_10.setObjectName(u"groupBox_10")
+        self.gridLayout_2 = QGridLayout(self.groupBox_10)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.zLen = QLabel(self.groupBox_10)
+        self.zLen.setObjectName(u"zLen")
+
+        self.gridLayout_2.addWidget(self.zLen, 4, 3, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_10)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_2.addWidget(self.label_7, 2, 0, 1, 1)
+
+        self.xMin = QLabel(self.groupBox_10)
+        self.xMin.setObjectName(u"xMin")
+
+        self.gridLayout_2.addWidget(self.xMin, 2, 1, 1, 1)
+
+        self.label_9 = QLabel(self.groupBox_10)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout_2.addWidget(self.label_9, 4, 0, 1, 1)
+
+        self.label_8 = QLabel(self.groupBox_10)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout_2.addWidget(self.label_8, 3, 0, 1, 1)
+
+        self.yMax = QLabel(self.groupBox_10)
+        self.yMax.setObjectName(u"yMax")
+
+        self.gridLayout_2.addWidget(self.yMax, 3, 2, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox_10)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout_2.addWidget(self.label_3, 0, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_10)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout_2.addWidget(self.label_4, 0, 2, 1, 1)
+
+        self.zMax = QLabel(self.groupBox_10)
+        self.zMax.setObjectName(u"zMax")
+
+        self.gridLayout_2.addWidget(self.zMax, 4, 2, 1, 1)
+
+        self.label_39 = QLabel(self.groupBox_10)
+        self.label_39.setObjectName(u"label_39")
+
+        self.gridLayout_2.addWidget(self.label_39, 0, 3, 1, 1)
+
+        self.xLen = QLabel(self.groupBox_10)
+        self.xLen.setObjectName(u"xLen")
+
+        self.gridLayout_2.addWidget(self.xLen, 2, 3, 1, 1)
+
+        self.zMin = QLabel(self.groupBox_10)
+        self.zMin.setObjectName(u"zMin")
+
+        self.gridLayout_2.addWidget(self.zMin, 4, 1, 1, 1)
+
+        self.yMin = QLabel(self.groupBox_10)
+        self.yMin.setObjectName(u"yMin")
+
+        self.gridLayout_2.addWidget(self.yMin, 3, 1, 1, 1)
+
+        self.yLen = QLabel(self.groupBox_10)
+        self.yLen.setObjectName(u"yLen")
+
+        self.gridLayout_2.addWidget(self.yLen, 3, 3, 1, 1)
+
+        self.xMax = QLabel(self.groupBox_10)
+        self.xMax.setObjectName(u"xMax")
+
+        self.gridLayout_2.addWidget(self.xMax, 2, 2, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_10)
+
+        self.frame = QFrame(MeshInfoDialog)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.StyledPanel)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.gridLayout = QGridLayout(self.frame)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(self.frame)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.numCells = QLabel(self.frame)
+        self.numCells.setObjectName(u"numCells")
+        font = QFont()
+        font.setBold(True)
+        self.numCells.setFont(font)
+
+        self.gridLayout.addWidget(self.numCells, 0, 1, 1, 1)
+
+        self.label_5 = QLabel(self.frame)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout.addWidget(self.label_5, 1, 0, 1, 1)
+
+        self.largestVolume = QLabel(self.frame)
+        self.largestVolume.setObjectName(u"largestVolume")
+        self.largestVolume.setFont(font)
+
+        self.gridLayout.addWidget(self.largestVolume, 1, 1, 1, 1)
+
+        self.label_10 = QLabel(self.frame)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout.addWidget(self.label_10, 2, 0, 1, 1)
+
+        self.smallestVolume = QLabel(self.frame)
+        self.smallestVolume.setObjectName(u"smallestVolume")
+        self.smallestVolume.setFont(font)
+
+        self.gridLayout.addWidget(self.smallestVolume, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.frame)
+
+        self.widget = QWidget(MeshInfoDialog)
+        self.widget.setObjectName(u"widget")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.buttonOk = QPushButton(self.widget)
+        self.buttonOk.setObjectName(u"buttonOk")
+        self.buttonOk.setEnabled(False)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.buttonOk.sizePolicy().hasHeightForWidth())
+        self.buttonOk.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout.addWidget(self.buttonOk)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(MeshInfoDialog)
+        self.buttonOk.clicked.connect(MeshInfoDialog.close)
+
+        QMetaObject.connectSlotsByName(MeshInfoDialog)
+    # setupUi
+
+    def retranslateUi(self, MeshInfoDialog):
+        MeshInfoDialog.setWindowTitle(QCoreApplication.translate("MeshInfoDialog", u"Mesh Information", None))
+        self.groupBox_10.setTitle(QCoreApplication.translate("MeshInfoDialog", u"Grid Span", None))
+        self.zLen.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label_7.setText(QCoreApplication.translate("MeshInfoDialog", u"X", None))
+        self.xMin.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label_9.setText(QCoreApplication.translate("MeshInfoDialog", u"Z", None))
+        self.label_8.setText(QCoreApplication.translate("MeshInfoDialog", u"Y", None))
+        self.yMax.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label_3.setText(QCoreApplication.translate("MeshInfoDialog", u"Min.", None))
+        self.label_4.setText(QCoreApplication.translate("MeshInfoDialog", u"Max.", None))
+        self.zMax.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label_39.setText(QCoreApplication.translate("MeshInfoDialog", u"Len.", None))
+        self.xLen.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.zMin.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.yMin.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.yLen.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.xMax.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label.setText(QCoreApplication.translate("MeshInfoDialog", u"Number of Cells", None))
+        self.numCells.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label_5.setText(QCoreApplication.translate("MeshInfoDialog", u"Volume of Largest Cell", None))
+        self.largestVolume.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.label_10.setText(QCoreApplication.translate("MeshInfoDialog", u"Volume of Smallest Cell", None))
+        self.smallestVolume.setText(QCoreApplication.translate("MeshInfoDialog", u"Calc...", None))
+        self.buttonOk.setText(QCoreApplication.translate("MeshInfoDialog", u"Ok", None))
+    # retranslateUi
+
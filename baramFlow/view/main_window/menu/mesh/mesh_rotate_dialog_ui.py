@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mesh_rotate_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_MeshRotateDialog(object):
+    def setupUi(self, MeshRotateDialog):
+        if not MeshRotateDialog.objectName():
+            MeshRotateDialog.setObjectName(u"MeshRotateDialog")
+        MeshRotateDialog.resize(354, 208)
+        self.verticalLayout = QVBoxLayout(MeshRotateDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(MeshRotateDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.rotationAngle = QLineEdit(self.widget)
+        self.rotationAngle.setObjectName(u"rotationAngle")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.rotationAngle)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(MeshRotateDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.widget_2)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout = QGridLayout(self.groupBox)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 0, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 1, 0, 1, 1)
+
+        self.originY = QLineEdit(self.groupBox)
+        self.originY.setObjectName(u"originY")
+
+        self.gridLayout.addWidget(self.originY, 1, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.originZ = QLineEdit(self.groupBox)
+        self.originZ.setObjectName(u"originZ")
+
+        self.gridLayout.addWidget(self.originZ, 2, 1, 1, 1)
+
+        self.originX = QLineEdit(self.groupBox)
+        self.originX.setObjectName(u"originX")
+
+        self.gridLayout.addWidget(self.originX, 0, 1, 1, 1)
+
+
+        self.horizontalLayout.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(self.widget_2)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_2 = QGridLayout(self.groupBox_2)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_2.addWidget(self.label_5, 0, 0, 1, 1)
+
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_2.addWidget(self.label_6, 1, 0, 1, 1)
+
+        self.axisY = QLineEdit(self.groupBox_2)
+        self.axisY.setObjectName(u"axisY")
+
+        self.gridLayout_2.addWidget(self.axisY, 1, 1, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_2)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_2.addWidget(self.label_7, 2, 0, 1, 1)
+
+        self.axisZ = QLineEdit(self.groupBox_2)
+        self.axisZ.setObjectName(u"axisZ")
+
+        self.gridLayout_2.addWidget(self.axisZ, 2, 1, 1, 1)
+
+        self.axisX = QLineEdit(self.groupBox_2)
+        self.axisX.setObjectName(u"axisX")
+
+        self.gridLayout_2.addWidget(self.axisX, 0, 1, 1, 1)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_2)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.buttonBox = QDialogButtonBox(MeshRotateDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(MeshRotateDialog)
+        self.buttonBox.accepted.connect(MeshRotateDialog.accept)
+        self.buttonBox.rejected.connect(MeshRotateDialog.reject)
+
+        QMetaObject.connectSlotsByName(MeshRotateDialog)
+    # setupUi
+
+    def retranslateUi(self, MeshRotateDialog):
+        MeshRotateDialog.setWindowTitle(QCoreApplication.translate("MeshRotateDialog", u"Dialog", None))
+        self.label.setText(QCoreApplication.translate("MeshRotateDialog", u"Rotation Angle (deg)", None))
+        self.rotationAngle.setText(QCoreApplication.translate("MeshRotateDialog", u"10", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MeshRotateDialog", u"Rotation Origin", None))
+        self.label_2.setText(QCoreApplication.translate("MeshRotateDialog", u"X (m)", None))
+        self.label_3.setText(QCoreApplication.translate("MeshRotateDialog", u"Y (m)", None))
+        self.originY.setText(QCoreApplication.translate("MeshRotateDialog", u"0", None))
+        self.label_4.setText(QCoreApplication.translate("MeshRotateDialog", u"Z (m)", None))
+        self.originZ.setText(QCoreApplication.translate("MeshRotateDialog", u"0", None))
+        self.originX.setText(QCoreApplication.translate("MeshRotateDialog", u"0", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("MeshRotateDialog", u"Rotation Axis", None))
+        self.label_5.setText(QCoreApplication.translate("MeshRotateDialog", u"X", None))
+        self.label_6.setText(QCoreApplication.translate("MeshRotateDialog", u"Y", None))
+        self.axisY.setText(QCoreApplication.translate("MeshRotateDialog", u"0", None))
+        self.label_7.setText(QCoreApplication.translate("MeshRotateDialog", u"Z", None))
+        self.axisZ.setText(QCoreApplication.translate("MeshRotateDialog", u"1", None))
+        self.axisX.setText(QCoreApplication.translate("MeshRotateDialog", u"0", None))
+    # retranslateUi
+
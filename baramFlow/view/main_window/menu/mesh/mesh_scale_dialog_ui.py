@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mesh_scale_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QGridLayout, QGroupBox, QLabel, QLineEdit,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_MeshScaleDialog(object):
+    def setupUi(self, MeshScaleDialog):
+        if not MeshScaleDialog.objectName():
+            MeshScaleDialog.setObjectName(u"MeshScaleDialog")
+        MeshScaleDialog.resize(194, 162)
+        self.verticalLayout = QVBoxLayout(MeshScaleDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox = QGroupBox(MeshScaleDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout = QGridLayout(self.groupBox)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.factorY = QLineEdit(self.groupBox)
+        self.factorY.setObjectName(u"factorY")
+
+        self.gridLayout.addWidget(self.factorY, 1, 1, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+
+        self.factorZ = QLineEdit(self.groupBox)
+        self.factorZ.setObjectName(u"factorZ")
+
+        self.gridLayout.addWidget(self.factorZ, 2, 1, 1, 1)
+
+        self.factorX = QLineEdit(self.groupBox)
+        self.factorX.setObjectName(u"factorX")
+
+        self.gridLayout.addWidget(self.factorX, 0, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(MeshScaleDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        QWidget.setTabOrder(self.factorX, self.factorY)
+        QWidget.setTabOrder(self.factorY, self.factorZ)
+
+        self.retranslateUi(MeshScaleDialog)
+        self.buttonBox.accepted.connect(MeshScaleDialog.accept)
+        self.buttonBox.rejected.connect(MeshScaleDialog.reject)
+
+        QMetaObject.connectSlotsByName(MeshScaleDialog)
+    # setupUi
+
+    def retranslateUi(self, MeshScaleDialog):
+        MeshScaleDialog.setWindowTitle(QCoreApplication.translate("MeshScaleDialog", u"Dialog", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MeshScaleDialog", u"Scaling Factors", None))
+        self.label.setText(QCoreApplication.translate("MeshScaleDialog", u"X", None))
+        self.label_2.setText(QCoreApplication.translate("MeshScaleDialog", u"Y", None))
+        self.factorY.setText(QCoreApplication.translate("MeshScaleDialog", u"1", None))
+        self.label_3.setText(QCoreApplication.translate("MeshScaleDialog", u"Z", None))
+        self.factorZ.setText(QCoreApplication.translate("MeshScaleDialog", u"1", None))
+        self.factorX.setText(QCoreApplication.translate("MeshScaleDialog", u"1", None))
+    # retranslateUi
+
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mesh_translate_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QGridLayout, QGroupBox, QLabel, QLineEdit,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_MeshTranslateDialog(object):
+    def setupUi(self, MeshTranslateDialog):
+        if not MeshTranslateDialog.objectName():
+            MeshTranslateDialog.setObjectName(u"MeshTranslateDialog")
+        MeshTranslateDialog.resize(194, 162)
+        self.verticalLayout = QVBoxLayout(MeshTranslateDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox = QGroupBox(MeshTranslateDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout = QGridLayout(self.groupBox)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.offsetX = QLineEdit(self.groupBox)
+        self.offsetX.setObjectName(u"offsetX")
+
+        self.gridLayout.addWidget(self.offsetX, 0, 1, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.offsetY = QLineEdit(self.groupBox)
+        self.offsetY.setObjectName(u"offsetY")
+
+        self.gridLayout.addWidget(self.offsetY, 1, 1, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+
+        self.offsetZ = QLineEdit(self.groupBox)
+        self.offsetZ.setObjectName(u"offsetZ")
+
+        self.gridLayout.addWidget(self.offsetZ, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(MeshTranslateDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(MeshTranslateDialog)
+        self.buttonBox.accepted.connect(MeshTranslateDialog.accept)
+        self.buttonBox.rejected.connect(MeshTranslateDialog.reject)
+
+        QMetaObject.connectSlotsByName(MeshTranslateDialog)
+    # setupUi
+
+    def retranslateUi(self, MeshTranslateDialog):
+        MeshTranslateDialog.setWindowTitle(QCoreApplication.translate("MeshTranslateDialog", u"Dialog", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MeshTranslateDialog", u"Translation Offsets", None))
+        self.label.setText(QCoreApplication.translate("MeshTranslateDialog", u"X (m)", None))
+        self.offsetX.setText(QCoreApplication.translate("MeshTranslateDialog", u"0", None))
+        self.label_2.setText(QCoreApplication.translate("MeshTranslateDialog", u"Y (m)", None))
+        self.offsetY.setText(QCoreApplication.translate("MeshTranslateDialog", u"0", None))
+        self.label_3.setText(QCoreApplication.translate("MeshTranslateDialog", u"Z (m)", None))
+        self.offsetZ.setText(QCoreApplication.translate("MeshTranslateDialog", u"0", None))
+    # retranslateUi
+
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'poly_mesh_selection_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_PolyMeshSelectionDialog(object):
+    def setupUi(self, PolyMeshSelectionDialog):
+        if not PolyMeshSelectionDialog.objectName():
+            PolyMeshSelectionDialog.setObjectName(u"PolyMeshSelectionDialog")
+        PolyMeshSelectionDialog.resize(400, 120)
+        self.verticalLayout = QVBoxLayout(PolyMeshSelectionDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(PolyMeshSelectionDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.regionName = QLineEdit(self.widget)
+        self.regionName.setObjectName(u"regionName")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.regionName)
+
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.polyMesh = QLineEdit(self.widget)
+        self.polyMesh.setObjectName(u"polyMesh")
+        self.polyMesh.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.polyMesh)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.formLayout.setLayout(1, QFormLayout.FieldRole, self.horizontalLayout)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.buttonBox = QDialogButtonBox(PolyMeshSelectionDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(PolyMeshSelectionDialog)
+        self.buttonBox.accepted.connect(PolyMeshSelectionDialog.accept)
+        self.buttonBox.rejected.connect(PolyMeshSelectionDialog.reject)
+
+        QMetaObject.connectSlotsByName(PolyMeshSelectionDialog)
+    # setupUi
+
+    def retranslateUi(self, PolyMeshSelectionDialog):
+        PolyMeshSelectionDialog.setWindowTitle(QCoreApplication.translate("PolyMeshSelectionDialog", u"Select PolyMesh", None))
+        self.label.setText(QCoreApplication.translate("PolyMeshSelectionDialog", u"Region Name", None))
+        self.label_3.setText(QCoreApplication.translate("PolyMeshSelectionDialog", u"PolyMesh", None))
+        self.select.setText(QCoreApplication.translate("PolyMeshSelectionDialog", u"Select", None))
+    # retranslateUi
+
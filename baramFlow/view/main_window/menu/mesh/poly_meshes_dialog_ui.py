@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'poly_meshes_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractItemView, QApplication, QDialog,
+    QDialogButtonBox, QGroupBox, QHBoxLayout, QHeaderView,
+    QPushButton, QSizePolicy, QSpacerItem, QTreeWidget,
+    QTreeWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_PolyMeshesDialog(object):
+    def setupUi(self, PolyMeshesDialog):
+        if not PolyMeshesDialog.objectName():
+            PolyMeshesDialog.setObjectName(u"PolyMeshesDialog")
+        PolyMeshesDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(PolyMeshesDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox = QGroupBox(PolyMeshesDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(-1, -1, -1, 0)
+        self.polyMeshes = QTreeWidget(self.groupBox)
+        self.polyMeshes.headerItem().setText(2, "")
+        self.polyMeshes.setObjectName(u"polyMeshes")
+        self.polyMeshes.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)
+        self.polyMeshes.setIndentation(0)
+        self.polyMeshes.setColumnCount(3)
+        self.polyMeshes.header().setVisible(True)
+
+        self.verticalLayout_2.addWidget(self.polyMeshes)
+
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, -1)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.add = QPushButton(self.widget)
+        self.add.setObjectName(u"add")
+
+        self.horizontalLayout.addWidget(self.add)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(PolyMeshesDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(PolyMeshesDialog)
+        self.buttonBox.accepted.connect(PolyMeshesDialog.accept)
+        self.buttonBox.rejected.connect(PolyMeshesDialog.reject)
+
+        QMetaObject.connectSlotsByName(PolyMeshesDialog)
+    # setupUi
+
+    def retranslateUi(self, PolyMeshesDialog):
+        PolyMeshesDialog.setWindowTitle(QCoreApplication.translate("PolyMeshesDialog", u"Select PolyMeshes", None))
+        self.groupBox.setTitle(QCoreApplication.translate("PolyMeshesDialog", u"Load Multiple polyMeshes to compose Multi-region Case", None))
+        ___qtreewidgetitem = self.polyMeshes.headerItem()
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("PolyMeshesDialog", u"PolyMesh Path", None));
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("PolyMeshesDialog", u"Region Name", None));
+        self.add.setText(QCoreApplication.translate("PolyMeshesDialog", u"Add", None))
+    # retranslateUi
+
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'settings_paraview_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_ParaViewSettingDialog(object):
+    def setupUi(self, ParaViewSettingDialog):
+        if not ParaViewSettingDialog.objectName():
+            ParaViewSettingDialog.setObjectName(u"ParaViewSettingDialog")
+        ParaViewSettingDialog.resize(600, 90)
+        self.verticalLayout = QVBoxLayout(ParaViewSettingDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ParaViewSettingDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.filePath = QLineEdit(self.widget)
+        self.filePath.setObjectName(u"filePath")
+        self.filePath.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.filePath)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.buttonBox = QDialogButtonBox(ParaViewSettingDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(ParaViewSettingDialog)
+        self.buttonBox.accepted.connect(ParaViewSettingDialog.accept)
+        self.buttonBox.rejected.connect(ParaViewSettingDialog.reject)
+
+        QMetaObject.connectSlotsByName(ParaViewSettingDialog)
+    # setupUi
+
+    def retranslateUi(self, ParaViewSettingDialog):
+        ParaViewSettingDialog.setWindowTitle(QCoreApplication.translate("ParaViewSettingDialog", u"ParaView Setting", None))
+        self.label.setText(QCoreApplication.translate("ParaViewSettingDialog", u"Executable File Path", None))
+        self.select.setText(QCoreApplication.translate("ParaViewSettingDialog", u"Select", None))
+    # retranslateUi
+
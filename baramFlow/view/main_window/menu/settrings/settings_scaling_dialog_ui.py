@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'settings_scaling_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QDoubleSpinBox, QGroupBox, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_SettingScalingDialog(object):
+    def setupUi(self, SettingScalingDialog):
+        if not SettingScalingDialog.objectName():
+            SettingScalingDialog.setObjectName(u"SettingScalingDialog")
+        SettingScalingDialog.setWindowModality(Qt.WindowModal)
+        SettingScalingDialog.resize(240, 120)
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(SettingScalingDialog.sizePolicy().hasHeightForWidth())
+        SettingScalingDialog.setSizePolicy(sizePolicy)
+        SettingScalingDialog.setMinimumSize(QSize(240, 120))
+        SettingScalingDialog.setMaximumSize(QSize(240, 120))
+        SettingScalingDialog.setModal(True)
+        self.verticalLayout_2 = QVBoxLayout(SettingScalingDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.group = QGroupBox(SettingScalingDialog)
+        self.group.setObjectName(u"group")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.group.sizePolicy().hasHeightForWidth())
+        self.group.setSizePolicy(sizePolicy1)
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.group.setFont(font)
+        self.group.setStyleSheet(u"QGroupBox {\n"
+"    border: 1px solid gray;\n"
+"    border-radius: 2px;\n"
+"    margin-top: 8;\n"
+"	 border-color : rgb(200, 200, 200);\n"
+"}\n"
+"\n"
+"QGroupBox::title {\n"
+"    subcontrol-origin: margin;\n"
+"    left: 10px;\n"
+"    padding: 0 3px 0 3px;\n"
+"}\n"
+"")
+        self.vGBox_MeshSize = QVBoxLayout(self.group)
+        self.vGBox_MeshSize.setObjectName(u"vGBox_MeshSize")
+        self.vGBox_MeshSize.setContentsMargins(10, 15, 10, 10)
+        self.scaling = QDoubleSpinBox(self.group)
+        self.scaling.setObjectName(u"scaling")
+        self.scaling.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+        self.scaling.setDecimals(1)
+        self.scaling.setMinimum(1.000000000000000)
+        self.scaling.setMaximum(2.000000000000000)
+        self.scaling.setSingleStep(0.100000000000000)
+        self.scaling.setValue(1.100000000000000)
+
+        self.vGBox_MeshSize.addWidget(self.scaling)
+
+
+        self.verticalLayout_2.addWidget(self.group)
+
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, 10, -1, -1)
+        self.buttonBox = QDialogButtonBox(SettingScalingDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        sizePolicy1.setHeightForWidth(self.buttonBox.sizePolicy().hasHeightForWidth())
+        self.buttonBox.setSizePolicy(sizePolicy1)
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+        self.buttonBox.setCenterButtons(False)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+
+
+        self.retranslateUi(SettingScalingDialog)
+        self.buttonBox.accepted.connect(SettingScalingDialog.accept)
+        self.buttonBox.rejected.connect(SettingScalingDialog.reject)
+
+        QMetaObject.connectSlotsByName(SettingScalingDialog)
+    # setupUi
+
+    def retranslateUi(self, SettingScalingDialog):
+        SettingScalingDialog.setWindowTitle(QCoreApplication.translate("SettingScalingDialog", u"Setting", None))
+        self.group.setTitle(QCoreApplication.translate("SettingScalingDialog", u"< UI scaling >", None))
+    # retranslateUi
+
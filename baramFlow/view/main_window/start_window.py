@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import asyncio
 import ctypes
 import logging
 import platform
@@ -39,7 +38,7 @@ class Baram(QObject):
         app.projectCreated.connect(self._openProject)
 
     async def start(self, path=None):
-        vtk_threads.vtkThreadLock = asyncio.Lock()
+        vtk_threads.configureSMP()
 
         if path is not None:
             await self._projectSelected(path)
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'colormap_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QFrame, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_ColormapDialog(object):
+    def setupUi(self, ColormapDialog):
+        if not ColormapDialog.objectName():
+            ColormapDialog.setObjectName(u"ColormapDialog")
+        ColormapDialog.resize(303, 699)
+        self.verticalLayout_3 = QVBoxLayout(ColormapDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget_6 = QWidget(ColormapDialog)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, 0, -1, 0)
+        self.label_6 = QLabel(self.widget_6)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_5.addWidget(self.label_6)
+
+        self.fieldDisplayName = QLineEdit(self.widget_6)
+        self.fieldDisplayName.setObjectName(u"fieldDisplayName")
+
+        self.horizontalLayout_5.addWidget(self.fieldDisplayName)
+
+
+        self.verticalLayout_3.addWidget(self.widget_6)
+
+        self.widget_7 = QWidget(ColormapDialog)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(-1, 0, -1, 0)
+        self.label_1 = QLabel(self.widget_7)
+        self.label_1.setObjectName(u"label_1")
+
+        self.horizontalLayout_6.addWidget(self.label_1)
+
+        self.numberOfLevels = QLineEdit(self.widget_7)
+        self.numberOfLevels.setObjectName(u"numberOfLevels")
+
+        self.horizontalLayout_6.addWidget(self.numberOfLevels)
+
+
+        self.verticalLayout_3.addWidget(self.widget_7)
+
+        self.widget_12 = QWidget(ColormapDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.verticalLayout_8 = QVBoxLayout(self.widget_12)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.useNodeValues = QCheckBox(self.widget_12)
+        self.useNodeValues.setObjectName(u"useNodeValues")
+
+        self.verticalLayout_8.addWidget(self.useNodeValues)
+
+
+        self.verticalLayout_3.addWidget(self.widget_12)
+
+        self.groupBox = QGroupBox(ColormapDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.colorBy = QLabel(self.groupBox)
+        self.colorBy.setObjectName(u"colorBy")
+        font = QFont()
+        font.setBold(True)
+        self.colorBy.setFont(font)
+
+        self.verticalLayout.addWidget(self.colorBy)
+
+        self.frame = QFrame(self.groupBox)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.Box)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_5 = QVBoxLayout(self.frame)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_8 = QWidget(self.frame)
+        self.widget_8.setObjectName(u"widget_8")
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_8)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.widget_9 = QWidget(self.widget_8)
+        self.widget_9.setObjectName(u"widget_9")
+        self.formLayout_5 = QFormLayout(self.widget_9)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label_8 = QLabel(self.widget_9)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_8)
+
+        self.rangeMin = QLineEdit(self.widget_9)
+        self.rangeMin.setObjectName(u"rangeMin")
+        self.rangeMin.setEnabled(False)
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.rangeMin)
+
+
+        self.horizontalLayout_7.addWidget(self.widget_9)
+
+        self.widget_10 = QWidget(self.widget_8)
+        self.widget_10.setObjectName(u"widget_10")
+        self.formLayout_6 = QFormLayout(self.widget_10)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label_9 = QLabel(self.widget_10)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.rangeMax = QLineEdit(self.widget_10)
+        self.rangeMax.setObjectName(u"rangeMax")
+        self.rangeMax.setEnabled(False)
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.rangeMax)
+
+
+        self.horizontalLayout_7.addWidget(self.widget_10)
+
+
+        self.verticalLayout_5.addWidget(self.widget_8)
+
+        self.relevantScaffoldsOnly = QCheckBox(self.frame)
+        self.relevantScaffoldsOnly.setObjectName(u"relevantScaffoldsOnly")
+
+        self.verticalLayout_5.addWidget(self.relevantScaffoldsOnly)
+
+        self.widget = QWidget(self.frame)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalSpacer_2 = QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_2)
+
+        self.computeRange = QPushButton(self.widget)
+        self.computeRange.setObjectName(u"computeRange")
+
+        self.horizontalLayout.addWidget(self.computeRange)
+
+
+        self.verticalLayout_5.addWidget(self.widget)
+
+
+        self.verticalLayout.addWidget(self.frame)
+
+        self.useCustomRange = QCheckBox(self.groupBox)
+        self.useCustomRange.setObjectName(u"useCustomRange")
+
+        self.verticalLayout.addWidget(self.useCustomRange)
+
+        self.customRangeGroup = QFrame(self.groupBox)
+        self.customRangeGroup.setObjectName(u"customRangeGroup")
+        self.customRangeGroup.setFrameShape(QFrame.Box)
+        self.customRangeGroup.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_4 = QVBoxLayout(self.customRangeGroup)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.frame_2 = QFrame(self.customRangeGroup)
+        self.frame_2.setObjectName(u"frame_2")
+        self.frame_2.setFrameShape(QFrame.Box)
+        self.frame_2.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout_4 = QHBoxLayout(self.frame_2)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.widget_4 = QWidget(self.frame_2)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_3 = QFormLayout(self.widget_4)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_4 = QLabel(self.widget_4)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.customRangeMin = QLineEdit(self.widget_4)
+        self.customRangeMin.setObjectName(u"customRangeMin")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.customRangeMin)
+
+
+        self.horizontalLayout_4.addWidget(self.widget_4)
+
+        self.widget_5 = QWidget(self.frame_2)
+        self.widget_5.setObjectName(u"widget_5")
+        self.formLayout_4 = QFormLayout(self.widget_5)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_5 = QLabel(self.widget_5)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.customRangeMax = QLineEdit(self.widget_5)
+        self.customRangeMax.setObjectName(u"customRangeMax")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.customRangeMax)
+
+
+        self.horizontalLayout_4.addWidget(self.widget_5)
+
+
+        self.verticalLayout_4.addWidget(self.frame_2)
+
+        self.clipToRange = QCheckBox(self.customRangeGroup)
+        self.clipToRange.setObjectName(u"clipToRange")
+
+        self.verticalLayout_4.addWidget(self.clipToRange)
+
+
+        self.verticalLayout.addWidget(self.customRangeGroup)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(ColormapDialog)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(-1, -1, -1, 0)
+        self.widget_2 = QWidget(self.groupBox_2)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_8 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.usePresetColorScheme = QRadioButton(self.widget_2)
+        self.usePresetColorScheme.setObjectName(u"usePresetColorScheme")
+
+        self.horizontalLayout_8.addWidget(self.usePresetColorScheme)
+
+        self.useCustomColorScheme = QRadioButton(self.widget_2)
+        self.useCustomColorScheme.setObjectName(u"useCustomColorScheme")
+
+        self.horizontalLayout_8.addWidget(self.useCustomColorScheme)
+
+        self.horizontalSpacer_3 = QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.presetSchemeGroup = QWidget(self.groupBox_2)
+        self.presetSchemeGroup.setObjectName(u"presetSchemeGroup")
+        self.verticalLayout_6 = QVBoxLayout(self.presetSchemeGroup)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.widget_11 = QWidget(self.presetSchemeGroup)
+        self.widget_11.setObjectName(u"widget_11")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_11)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, -1, -1, -1)
+        self.label_3 = QLabel(self.widget_11)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_2.addWidget(self.label_3)
+
+        self.presetColorScheme = QLabel(self.widget_11)
+        self.presetColorScheme.setObjectName(u"presetColorScheme")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.presetColorScheme.sizePolicy().hasHeightForWidth())
+        self.presetColorScheme.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_2.addWidget(self.presetColorScheme)
+
+        self.select = QPushButton(self.widget_11)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout_2.addWidget(self.select)
+
+
+        self.verticalLayout_6.addWidget(self.widget_11)
+
+        self.presetColorBar = QWidget(self.presetSchemeGroup)
+        self.presetColorBar.setObjectName(u"presetColorBar")
+
+        self.verticalLayout_6.addWidget(self.presetColorBar)
+
+
+        self.verticalLayout_2.addWidget(self.presetSchemeGroup)
+
+        self.customSchemeGroup = QWidget(self.groupBox_2)
+        self.customSchemeGroup.setObjectName(u"customSchemeGroup")
+        self.verticalLayout_7 = QVBoxLayout(self.customSchemeGroup)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.label = QLabel(self.customSchemeGroup)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_7.addWidget(self.label)
+
+        self.widget_13 = QWidget(self.customSchemeGroup)
+        self.widget_13.setObjectName(u"widget_13")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_13)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.customMinColor = QPushButton(self.widget_13)
+        self.customMinColor.setObjectName(u"customMinColor")
+        self.customMinColor.setMaximumSize(QSize(24, 24))
+
+        self.horizontalLayout_9.addWidget(self.customMinColor)
+
+        self.customColorBar = QLabel(self.widget_13)
+        self.customColorBar.setObjectName(u"customColorBar")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.customColorBar.sizePolicy().hasHeightForWidth())
+        self.customColorBar.setSizePolicy(sizePolicy1)
+        self.customColorBar.setMinimumSize(QSize(20, 20))
+        self.customColorBar.setMaximumSize(QSize(16777215, 20))
+
+        self.horizontalLayout_9.addWidget(self.customColorBar)
+
+        self.customMaxColor = QPushButton(self.widget_13)
+        self.customMaxColor.setObjectName(u"customMaxColor")
+        self.customMaxColor.setMaximumSize(QSize(24, 24))
+
+        self.horizontalLayout_9.addWidget(self.customMaxColor)
+
+
+        self.verticalLayout_7.addWidget(self.widget_13)
+
+
+        self.verticalLayout_2.addWidget(self.customSchemeGroup)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+        self.widget_3 = QWidget(ColormapDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+
+        self.retranslateUi(ColormapDialog)
+        self.cancel.clicked.connect(ColormapDialog.reject)
+
+        QMetaObject.connectSlotsByName(ColormapDialog)
+    # setupUi
+
+    def retranslateUi(self, ColormapDialog):
+        ColormapDialog.setWindowTitle(QCoreApplication.translate("ColormapDialog", u"Colormap Legend", None))
+        self.label_6.setText(QCoreApplication.translate("ColormapDialog", u"Title", None))
+        self.label_1.setText(QCoreApplication.translate("ColormapDialog", u"Number of Levels", None))
+        self.useNodeValues.setText(QCoreApplication.translate("ColormapDialog", u"Use Node Values", None))
+        self.groupBox.setTitle(QCoreApplication.translate("ColormapDialog", u"Range", None))
+        self.colorBy.setText(QCoreApplication.translate("ColormapDialog", u"TextLabel", None))
+        self.label_8.setText(QCoreApplication.translate("ColormapDialog", u"Min", None))
+        self.label_9.setText(QCoreApplication.translate("ColormapDialog", u"Max", None))
+        self.relevantScaffoldsOnly.setText(QCoreApplication.translate("ColormapDialog", u"Relevant scaffolds only", None))
+        self.computeRange.setText(QCoreApplication.translate("ColormapDialog", u"Compute Range", None))
+        self.useCustomRange.setText(QCoreApplication.translate("ColormapDialog", u"Custom Range", None))
+        self.label_4.setText(QCoreApplication.translate("ColormapDialog", u"Min", None))
+        self.customRangeMin.setText("")
+        self.label_5.setText(QCoreApplication.translate("ColormapDialog", u"Max", None))
+        self.customRangeMax.setText("")
+        self.clipToRange.setText(QCoreApplication.translate("ColormapDialog", u"Clip to Range", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("ColormapDialog", u"Color Scheme", None))
+        self.usePresetColorScheme.setText(QCoreApplication.translate("ColormapDialog", u"Preset", None))
+        self.useCustomColorScheme.setText(QCoreApplication.translate("ColormapDialog", u"Custom", None))
+        self.label_3.setText(QCoreApplication.translate("ColormapDialog", u"Color Scheme:", None))
+        self.presetColorScheme.setText(QCoreApplication.translate("ColormapDialog", u"TextLabel", None))
+        self.select.setText(QCoreApplication.translate("ColormapDialog", u"Select", None))
+        self.label.setText(QCoreApplication.translate("ColormapDialog", u"Color Scheme", None))
+        self.customMinColor.setText("")
+        self.customColorBar.setText("")
+        self.customMaxColor.setText("")
+        self.ok.setText(QCoreApplication.translate("ColormapDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ColormapDialog", u"Cancel", None))
+    # retranslateUi
+
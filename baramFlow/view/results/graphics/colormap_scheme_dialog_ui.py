@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'colormap_scheme_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QListWidget,
+    QListWidgetItem, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_ColormapSchemeDialog(object):
+    def setupUi(self, ColormapSchemeDialog):
+        if not ColormapSchemeDialog.objectName():
+            ColormapSchemeDialog.setObjectName(u"ColormapSchemeDialog")
+        ColormapSchemeDialog.resize(450, 300)
+        self.verticalLayout = QVBoxLayout(ColormapSchemeDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.schemes = QListWidget(ColormapSchemeDialog)
+        self.schemes.setObjectName(u"schemes")
+        self.schemes.setStyleSheet(u"QListWidget {background-color: transparent} QListWidget::item {padding:3\n"
+"px}")
+
+        self.verticalLayout.addWidget(self.schemes)
+
+        self.widget_3 = QWidget(ColormapSchemeDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(199, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+        self.ok.setEnabled(False)
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+
+        self.retranslateUi(ColormapSchemeDialog)
+        self.cancel.clicked.connect(ColormapSchemeDialog.reject)
+
+        QMetaObject.connectSlotsByName(ColormapSchemeDialog)
+    # setupUi
+
+    def retranslateUi(self, ColormapSchemeDialog):
+        ColormapSchemeDialog.setWindowTitle(QCoreApplication.translate("ColormapSchemeDialog", u"Choose Preset", None))
+        self.ok.setText(QCoreApplication.translate("ColormapSchemeDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ColormapSchemeDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -396,7 +396,9 @@ class DisplayControl(QTreeWidgetItem):
         self._vectorGlyph.SetSourceConnection(self._vectorArrow.GetOutputPort())
         self._vectorGlyph.SetInputConnection(self._vectorMask.GetOutputPort())
 
+        # The glyph is updated through the mapper, which holds rendering while its output is rewritten
         self._vectorMapper = vtkPolyDataMapper()
+        self._vectorMapper.SetInputConnection(self._vectorGlyph.GetOutputPort())
         self._vectorMapper.SetColorModeToMapScalars()
         self._vectorMapper.UseLookupTableScalarRangeOn()
         self._vectorMapper.SetLookupTable(self._lookupTable)
@@ -430,10 +432,6 @@ class DisplayControl(QTreeWidgetItem):
         else:
             self._vectorGlyph.SetScaleModeToScaleByVector()
 
-        await vtk_run_in_thread(self._vectorGlyph.Update)
-
-        self._vectorMapper.SetInputData(self._vectorGlyph.GetOutput())
-
         if self._displayItem.solidColor:
             self._vectorMapper.ScalarVisibilityOff()
         else:
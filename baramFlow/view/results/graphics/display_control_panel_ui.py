@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'display_control_panel.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QHeaderView, QLabel,
+    QSizePolicy, QTreeWidget, QTreeWidgetItem, QVBoxLayout,
+    QWidget)
+
+class Ui_DisplayControlPanel(object):
+    def setupUi(self, DisplayControlPanel):
+        if not DisplayControlPanel.objectName():
+            DisplayControlPanel.setObjectName(u"DisplayControlPanel")
+        DisplayControlPanel.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(DisplayControlPanel)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(DisplayControlPanel)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.treeWidget = QTreeWidget(DisplayControlPanel)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(2, u"3");
+        __qtreewidgetitem.setText(1, u"2");
+        __qtreewidgetitem.setText(0, u"1");
+        self.treeWidget.setHeaderItem(__qtreewidgetitem)
+        self.treeWidget.setObjectName(u"treeWidget")
+        self.treeWidget.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.treeWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.treeWidget.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.treeWidget.setSortingEnabled(True)
+        self.treeWidget.setColumnCount(3)
+        self.treeWidget.header().setStretchLastSection(False)
+
+        self.verticalLayout.addWidget(self.treeWidget)
+
+
+        self.retranslateUi(DisplayControlPanel)
+
+        QMetaObject.connectSlotsByName(DisplayControlPanel)
+    # setupUi
+
+    def retranslateUi(self, DisplayControlPanel):
+        DisplayControlPanel.setWindowTitle(QCoreApplication.translate("DisplayControlPanel", u"Form", None))
+        self.label.setText(QCoreApplication.translate("DisplayControlPanel", u"Display Control", None))
+    # retranslateUi
+
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'display_item_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_DisplayItemDialog(object):
+    def setupUi(self, DisplayItemDialog):
+        if not DisplayItemDialog.objectName():
+            DisplayItemDialog.setObjectName(u"DisplayItemDialog")
+        DisplayItemDialog.setWindowModality(Qt.ApplicationModal)
+        DisplayItemDialog.resize(404, 226)
+        DisplayItemDialog.setModal(True)
+        self.verticalLayout = QVBoxLayout(DisplayItemDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(DisplayItemDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_4 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_4.addWidget(self.label)
+
+        self.maxNumberOfSamplingPoints = QLineEdit(self.widget_2)
+        self.maxNumberOfSamplingPoints.setObjectName(u"maxNumberOfSamplingPoints")
+
+        self.verticalLayout_4.addWidget(self.maxNumberOfSamplingPoints)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+        self.groupBox_2 = QGroupBox(self.widget)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_11 = QWidget(self.groupBox_2)
+        self.widget_11.setObjectName(u"widget_11")
+        self.horizontalLayout_11 = QHBoxLayout(self.widget_11)
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.horizontalLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.label_9 = QLabel(self.widget_11)
+        self.label_9.setObjectName(u"label_9")
+        self.label_9.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignTop)
+
+        self.horizontalLayout_11.addWidget(self.label_9)
+
+        self.widget_13 = QWidget(self.widget_11)
+        self.widget_13.setObjectName(u"widget_13")
+        self.verticalLayout_6 = QVBoxLayout(self.widget_13)
+        self.verticalLayout_6.setSpacing(0)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.streamlinesIntegrateForward = QCheckBox(self.widget_13)
+        self.streamlinesIntegrateForward.setObjectName(u"streamlinesIntegrateForward")
+        self.streamlinesIntegrateForward.setChecked(True)
+
+        self.verticalLayout_6.addWidget(self.streamlinesIntegrateForward)
+
+        self.streamlinesIntegrateBackward = QCheckBox(self.widget_13)
+        self.streamlinesIntegrateBackward.setObjectName(u"streamlinesIntegrateBackward")
+
+        self.verticalLayout_6.addWidget(self.streamlinesIntegrateBackward)
+
+
+        self.horizontalLayout_11.addWidget(self.widget_13)
+
+
+        self.verticalLayout_5.addWidget(self.widget_11)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_12 = QWidget(DisplayItemDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(DisplayItemDialog)
+
+        QMetaObject.connectSlotsByName(DisplayItemDialog)
+    # setupUi
+
+    def retranslateUi(self, DisplayItemDialog):
+        DisplayItemDialog.setWindowTitle(QCoreApplication.translate("DisplayItemDialog", u"Display Control", None))
+        self.label.setText(QCoreApplication.translate("DisplayItemDialog", u"Max. Number of Sampling Points\n"
+"(This limits maximum number of Vectors or Pathlines on this scaffold)", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("DisplayItemDialog", u"Streamlines", None))
+        self.label_9.setText(QCoreApplication.translate("DisplayItemDialog", u"Direction of Integration", None))
+        self.streamlinesIntegrateForward.setText(QCoreApplication.translate("DisplayItemDialog", u"Forward", None))
+        self.streamlinesIntegrateBackward.setText(QCoreApplication.translate("DisplayItemDialog", u"Backward", None))
+        self.ok.setText(QCoreApplication.translate("DisplayItemDialog", u"Ok", None))
+        self.cancel.setText(QCoreApplication.translate("DisplayItemDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -186,7 +186,7 @@ class GraphicDialog(QDialog):
 
         for scaffoldUuid in addedScaffolds:
             scaffold = ScaffoldsDB().getScaffold(scaffoldUuid)
-            dataSet = await scaffold.getDataSet(self._graphic.polyMesh)
+            dataSet = await scaffold.getDataSet(self._graphic.polyMesh, self._graphic.internalMesh)
             item = DisplayItem(scaffoldUuid=scaffoldUuid, dataSet=dataSet)
             await self._graphic.addDisplayItem(item)
 
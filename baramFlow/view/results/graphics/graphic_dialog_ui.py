@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'graphic_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QDialog, QFrame, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QSizePolicy, QSlider, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_GraphicDialog(object):
+    def setupUi(self, GraphicDialog):
+        if not GraphicDialog.objectName():
+            GraphicDialog.setObjectName(u"GraphicDialog")
+        GraphicDialog.resize(199, 716)
+        self.verticalLayout = QVBoxLayout(GraphicDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(GraphicDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 9)
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget_2)
+        self.name.setObjectName(u"name")
+
+        self.horizontalLayout.addWidget(self.name)
+
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_5)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+        self.groupBox = QGroupBox(self.widget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.widget_4 = QWidget(self.groupBox)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_8 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.startTime = QLabel(self.widget_4)
+        self.startTime.setObjectName(u"startTime")
+
+        self.horizontalLayout_8.addWidget(self.startTime)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_3)
+
+        self.currentTime = QLabel(self.widget_4)
+        self.currentTime.setObjectName(u"currentTime")
+        self.currentTime.setMinimumSize(QSize(53, 0))
+        self.currentTime.setFrameShape(QFrame.Panel)
+        self.currentTime.setAlignment(Qt.AlignCenter)
+
+        self.horizontalLayout_8.addWidget(self.currentTime)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_4)
+
+        self.lastTime = QLabel(self.widget_4)
+        self.lastTime.setObjectName(u"lastTime")
+
+        self.horizontalLayout_8.addWidget(self.lastTime)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+        self.slider = QSlider(self.groupBox)
+        self.slider.setObjectName(u"slider")
+        self.slider.setOrientation(Qt.Horizontal)
+
+        self.verticalLayout_2.addWidget(self.slider)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.widget_3 = QWidget(self.widget)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label_2 = QLabel(self.widget_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_2.addWidget(self.label_2)
+
+        self.field = PythonComboBox(self.widget_3)
+        self.field.setObjectName(u"field")
+
+        self.horizontalLayout_2.addWidget(self.field)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_6)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+        self.widget_5 = QWidget(self.widget)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label_3 = QLabel(self.widget_5)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_3.addWidget(self.label_3)
+
+        self.fieldComponent = VectorComponentComboBox(self.widget_5)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.horizontalLayout_3.addWidget(self.fieldComponent)
+
+        self.horizontalSpacer_8 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_8)
+
+
+        self.verticalLayout_3.addWidget(self.widget_5)
+
+        self.includeVectors = QGroupBox(self.widget)
+        self.includeVectors.setObjectName(u"includeVectors")
+        self.includeVectors.setChecked(False)
+        self.verticalLayout_4 = QVBoxLayout(self.includeVectors)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_6 = QWidget(self.includeVectors)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.label_4 = QLabel(self.widget_6)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_4.addWidget(self.label_4)
+
+        self.vectorField = QComboBox(self.widget_6)
+        self.vectorField.setObjectName(u"vectorField")
+
+        self.horizontalLayout_4.addWidget(self.vectorField)
+
+        self.horizontalSpacer = QSpacerItem(111, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout_4.addWidget(self.widget_6)
+
+        self.widget_7 = QWidget(self.includeVectors)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label_5 = QLabel(self.widget_7)
+        self.label_5.setObjectName(u"label_5")
+
+        self.horizontalLayout_5.addWidget(self.label_5)
+
+        self.scaleFactor = QLineEdit(self.widget_7)
+        self.scaleFactor.setObjectName(u"scaleFactor")
+
+        self.horizontalLayout_5.addWidget(self.scaleFactor)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout_4.addWidget(self.widget_7)
+
+        self.vectorFixedLength = QCheckBox(self.includeVectors)
+        self.vectorFixedLength.setObjectName(u"vectorFixedLength")
+
+        self.verticalLayout_4.addWidget(self.vectorFixedLength)
+
+
+        self.verticalLayout_3.addWidget(self.includeVectors)
+
+        self.groupBox_2 = QGroupBox(self.widget)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_10 = QWidget(self.groupBox_2)
+        self.widget_10.setObjectName(u"widget_10")
+        self.horizontalLayout_10 = QHBoxLayout(self.widget_10)
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.horizontalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.label_7 = QLabel(self.widget_10)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout_10.addWidget(self.label_7)
+
+        self.stepSize = QLineEdit(self.widget_10)
+        self.stepSize.setObjectName(u"stepSize")
+
+        self.horizontalLayout_10.addWidget(self.stepSize)
+
+
+        self.verticalLayout_5.addWidget(self.widget_10)
+
+        self.widget_14 = QWidget(self.groupBox_2)
+        self.widget_14.setObjectName(u"widget_14")
+        self.horizontalLayout_12 = QHBoxLayout(self.widget_14)
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.horizontalLayout_12.setContentsMargins(0, 0, 0, 0)
+        self.label_10 = QLabel(self.widget_14)
+        self.label_10.setObjectName(u"label_10")
+
+        self.horizontalLayout_12.addWidget(self.label_10)
+
+        self.maxSteps = QLineEdit(self.widget_14)
+        self.maxSteps.setObjectName(u"maxSteps")
+
+        self.horizontalLayout_12.addWidget(self.maxSteps)
+
+
+        self.verticalLayout_5.addWidget(self.widget_14)
+
+        self.widget_15 = QWidget(self.groupBox_2)
+        self.widget_15.setObjectName(u"widget_15")
+        self.horizontalLayout_13 = QHBoxLayout(self.widget_15)
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.horizontalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.label_11 = QLabel(self.widget_15)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout_13.addWidget(self.label_11)
+
+        self.maxLength = QLineEdit(self.widget_15)
+        self.maxLength.setObjectName(u"maxLength")
+
+        self.horizontalLayout_13.addWidget(self.maxLength)
+
+
+        self.verticalLayout_5.addWidget(self.widget_15)
+
+        self.accuracyControl = QGroupBox(self.groupBox_2)
+        self.accuracyControl.setObjectName(u"accuracyControl")
+        self.accuracyControl.setCheckable(True)
+        self.horizontalLayout_14 = QHBoxLayout(self.accuracyControl)
+        self.horizontalLayout_14.setObjectName(u"horizontalLayout_14")
+        self.label_12 = QLabel(self.accuracyControl)
+        self.label_12.setObjectName(u"label_12")
+
+        self.horizontalLayout_14.addWidget(self.label_12)
+
+        self.tolerance = QLineEdit(self.accuracyControl)
+        self.tolerance.setObjectName(u"tolerance")
+
+        self.horizontalLayout_14.addWidget(self.tolerance)
+
+
+        self.verticalLayout_5.addWidget(self.accuracyControl)
+
+        self.widget_16 = QWidget(self.groupBox_2)
+        self.widget_16.setObjectName(u"widget_16")
+        self.horizontalLayout_15 = QHBoxLayout(self.widget_16)
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.horizontalLayout_15.setContentsMargins(0, 0, 0, 0)
+        self.label_13 = QLabel(self.widget_16)
+        self.label_13.setObjectName(u"label_13")
+
+        self.horizontalLayout_15.addWidget(self.label_13)
+
+        self.lineStyle = PythonComboBox(self.widget_16)
+        self.lineStyle.setObjectName(u"lineStyle")
+
+        self.horizontalLayout_15.addWidget(self.lineStyle)
+
+
+        self.verticalLayout_5.addWidget(self.widget_16)
+
+        self.widget_17 = QWidget(self.groupBox_2)
+        self.widget_17.setObjectName(u"widget_17")
+        self.horizontalLayout_16 = QHBoxLayout(self.widget_17)
+        self.horizontalLayout_16.setObjectName(u"horizontalLayout_16")
+        self.horizontalLayout_16.setContentsMargins(0, 0, 0, 0)
+        self.label_14 = QLabel(self.widget_17)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_16.addWidget(self.label_14)
+
+        self.lineWidth = QLineEdit(self.widget_17)
+        self.lineWidth.setObjectName(u"lineWidth")
+
+        self.horizontalLayout_16.addWidget(self.lineWidth)
+
+
+        self.verticalLayout_5.addWidget(self.widget_17)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+        self.widget_9 = QWidget(self.widget)
+        self.widget_9.setObjectName(u"widget_9")
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_9)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.label_8 = QLabel(self.widget_9)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout_7.addWidget(self.label_8)
+
+        self.horizontalSpacer_10 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_10)
+
+        self.select = QPushButton(self.widget_9)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout_7.addWidget(self.select)
+
+
+        self.verticalLayout_3.addWidget(self.widget_9)
+
+        self.scaffolds = QListWidget(self.widget)
+        self.scaffolds.setObjectName(u"scaffolds")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.scaffolds.sizePolicy().hasHeightForWidth())
+        self.scaffolds.setSizePolicy(sizePolicy)
+        self.scaffolds.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.scaffolds.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout_3.addWidget(self.scaffolds)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(GraphicDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.update = QPushButton(self.widget_12)
+        self.update.setObjectName(u"update")
+
+        self.horizontalLayout_9.addWidget(self.update)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(GraphicDialog)
+
+        QMetaObject.connectSlotsByName(GraphicDialog)
+    # setupUi
+
+    def retranslateUi(self, GraphicDialog):
+        GraphicDialog.setWindowTitle(QCoreApplication.translate("GraphicDialog", u"Graphic", None))
+        self.label.setText(QCoreApplication.translate("GraphicDialog", u"Name", None))
+        self.groupBox.setTitle(QCoreApplication.translate("GraphicDialog", u"Time", None))
+        self.startTime.setText(QCoreApplication.translate("GraphicDialog", u"0", None))
+        self.currentTime.setText(QCoreApplication.translate("GraphicDialog", u"0", None))
+        self.lastTime.setText(QCoreApplication.translate("GraphicDialog", u"0", None))
+        self.label_2.setText(QCoreApplication.translate("GraphicDialog", u"Color by", None))
+        self.label_3.setText(QCoreApplication.translate("GraphicDialog", u"Component", None))
+        self.includeVectors.setTitle(QCoreApplication.translate("GraphicDialog", u"Vectors", None))
+        self.label_4.setText(QCoreApplication.translate("GraphicDialog", u"Vectors of", None))
+        self.label_5.setText(QCoreApplication.translate("GraphicDialog", u"Scale", None))
+        self.vectorFixedLength.setText(QCoreApplication.translate("GraphicDialog", u"Fixed Length", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("GraphicDialog", u"Streamlines", None))
+        self.label_7.setText(QCoreApplication.translate("GraphicDialog", u"Step Size (m)", None))
+        self.label_10.setText(QCoreApplication.translate("GraphicDialog", u"Max. Steps", None))
+        self.label_11.setText(QCoreApplication.translate("GraphicDialog", u"Max. Length (m)", None))
+        self.accuracyControl.setTitle(QCoreApplication.translate("GraphicDialog", u"Accuracy Control", None))
+        self.label_12.setText(QCoreApplication.translate("GraphicDialog", u"Tolerance (m)", None))
+        self.label_13.setText(QCoreApplication.translate("GraphicDialog", u"Style", None))
+        self.label_14.setText(QCoreApplication.translate("GraphicDialog", u"Width", None))
+        self.label_8.setText(QCoreApplication.translate("GraphicDialog", u"Scaffolds", None))
+        self.select.setText(QCoreApplication.translate("GraphicDialog", u"Select", None))
+        self.update.setText(QCoreApplication.translate("GraphicDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("GraphicDialog", u"Cancel", None))
+    # retranslateUi
+
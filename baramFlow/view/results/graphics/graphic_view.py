@@ -237,7 +237,7 @@ class VisualReportView(RenderingView):
             return  # Not my scaffold
 
         scaffold = ScaffoldsDB().getScaffold(uuid)
-        dataSet = await scaffold.getDataSet(self._graphic.polyMesh)
+        dataSet = await scaffold.getDataSet(self._graphic.polyMesh, self._graphic.internalMesh)
 
         displayUuid = self._scaffold2displayControl[uuid]
         control = self._controls[displayUuid]
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'graphic_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_GraphicWidget(object):
+    def setupUi(self, GraphicWidget):
+        if not GraphicWidget.objectName():
+            GraphicWidget.setObjectName(u"GraphicWidget")
+        GraphicWidget.resize(400, 48)
+        self.horizontalLayout_2 = QHBoxLayout(GraphicWidget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, 4, -1, 4)
+        self.widget_2 = QWidget(GraphicWidget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.widget_2.setMinimumSize(QSize(40, 40))
+        self.widget_2.setMaximumSize(QSize(40, 40))
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.tag = QLabel(self.widget_2)
+        self.tag.setObjectName(u"tag")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tag.sizePolicy().hasHeightForWidth())
+        self.tag.setSizePolicy(sizePolicy)
+        self.tag.setMinimumSize(QSize(32, 32))
+        self.tag.setMaximumSize(QSize(32, 32))
+        self.tag.setStyleSheet(u"background-color:skyblue; border-radius:15px")
+
+        self.horizontalLayout_3.addWidget(self.tag)
+
+
+        self.horizontalLayout_2.addWidget(self.widget_2)
+
+        self.widget = QWidget(GraphicWidget)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.name = QLabel(self.widget)
+        self.name.setObjectName(u"name")
+        font = QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        self.name.setFont(font)
+
+        self.verticalLayout.addWidget(self.name)
+
+        self.description = QLabel(self.widget)
+        self.description.setObjectName(u"description")
+        self.description.setStyleSheet(u"color:grey")
+
+        self.verticalLayout.addWidget(self.description)
+
+
+        self.horizontalLayout_2.addWidget(self.widget)
+
+
+        self.retranslateUi(GraphicWidget)
+
+        QMetaObject.connectSlotsByName(GraphicWidget)
+    # setupUi
+
+    def retranslateUi(self, GraphicWidget):
+        self.tag.setText("")
+        self.name.setText(QCoreApplication.translate("GraphicWidget", u"TextLabel", None))
+        self.description.setText(QCoreApplication.translate("GraphicWidget", u"TextLabel", None))
+        pass
+    # retranslateUi
+
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'opacity_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QLabel, QSizePolicy, QSlider,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_OpacityDialog(object):
+    def setupUi(self, OpacityDialog):
+        if not OpacityDialog.objectName():
+            OpacityDialog.setObjectName(u"OpacityDialog")
+        OpacityDialog.setWindowModality(Qt.ApplicationModal)
+        OpacityDialog.resize(400, 128)
+        OpacityDialog.setModal(True)
+        self.verticalLayout = QVBoxLayout(OpacityDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(OpacityDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(-1, 0, -1, 0)
+        self.widget_5 = QWidget(self.widget)
+        self.widget_5.setObjectName(u"widget_5")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_5)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.verticalSpacer = QSpacerItem(20, 25, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer)
+
+        self.label = QLabel(self.widget_5)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.label_2 = QLabel(self.widget_5)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setAlignment(Qt.AlignBottom|Qt.AlignRight|Qt.AlignTrailing)
+
+        self.verticalLayout_3.addWidget(self.label_2)
+
+
+        self.horizontalLayout.addWidget(self.widget_5)
+
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setSpacing(2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, -1)
+        self.widget_3 = QWidget(self.widget_2)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 9, 0, 9)
+        self.widget_4 = QWidget(self.widget_3)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, 0)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.value = QLabel(self.widget_4)
+        self.value.setObjectName(u"value")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.value.setFont(font)
+
+        self.horizontalLayout_3.addWidget(self.value)
+
+        self.label_6 = QLabel(self.widget_4)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setFont(font)
+
+        self.horizontalLayout_3.addWidget(self.label_6)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+        self.slider = QSlider(self.widget_3)
+        self.slider.setObjectName(u"slider")
+        self.slider.setMaximum(10)
+        self.slider.setSingleStep(1)
+        self.slider.setPageStep(1)
+        self.slider.setOrientation(Qt.Horizontal)
+        self.slider.setTickPosition(QSlider.TicksAbove)
+
+        self.verticalLayout_2.addWidget(self.slider)
+
+
+        self.horizontalLayout_2.addWidget(self.widget_3)
+
+
+        self.horizontalLayout.addWidget(self.widget_2)
+
+        self.widget_6 = QWidget(self.widget)
+        self.widget_6.setObjectName(u"widget_6")
+        self.verticalLayout_4 = QVBoxLayout(self.widget_6)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, -1, -1, -1)
+        self.verticalSpacer_2 = QSpacerItem(20, 61, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer_2)
+
+        self.label_4 = QLabel(self.widget_6)
+        self.label_4.setObjectName(u"label_4")
+
+        self.verticalLayout_4.addWidget(self.label_4)
+
+        self.label_3 = QLabel(self.widget_6)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setAlignment(Qt.AlignBottom|Qt.AlignLeading|Qt.AlignLeft)
+
+        self.verticalLayout_4.addWidget(self.label_3)
+
+
+        self.horizontalLayout.addWidget(self.widget_6)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.buttonBox = QDialogButtonBox(OpacityDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(OpacityDialog)
+        self.buttonBox.accepted.connect(OpacityDialog.accept)
+        self.buttonBox.rejected.connect(OpacityDialog.reject)
+
+        QMetaObject.connectSlotsByName(OpacityDialog)
+    # setupUi
+
+    def retranslateUi(self, OpacityDialog):
+        OpacityDialog.setWindowTitle(QCoreApplication.translate("OpacityDialog", u"Opacity", None))
+        self.label.setText(QCoreApplication.translate("OpacityDialog", u"Transparent", None))
+        self.label_2.setText(QCoreApplication.translate("OpacityDialog", u"0", None))
+        self.value.setText(QCoreApplication.translate("OpacityDialog", u"0", None))
+        self.label_6.setText(QCoreApplication.translate("OpacityDialog", u"%", None))
+        self.label_4.setText(QCoreApplication.translate("OpacityDialog", u"Opaque", None))
+        self.label_3.setText(QCoreApplication.translate("OpacityDialog", u"100", None))
+    # retranslateUi
+
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'collateral_fields_report_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QGroupBox,
+    QHBoxLayout, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_CollateralFieldsReportDialog(object):
+    def setupUi(self, CollateralFieldsReportDialog):
+        if not CollateralFieldsReportDialog.objectName():
+            CollateralFieldsReportDialog.setObjectName(u"CollateralFieldsReportDialog")
+        CollateralFieldsReportDialog.resize(218, 330)
+        self.verticalLayout = QVBoxLayout(CollateralFieldsReportDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox_3 = QGroupBox(CollateralFieldsReportDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.age = QCheckBox(self.groupBox_3)
+        self.age.setObjectName(u"age")
+
+        self.verticalLayout_3.addWidget(self.age)
+
+        self.heatTransferCoefficient = QCheckBox(self.groupBox_3)
+        self.heatTransferCoefficient.setObjectName(u"heatTransferCoefficient")
+
+        self.verticalLayout_3.addWidget(self.heatTransferCoefficient)
+
+        self.machNumber = QCheckBox(self.groupBox_3)
+        self.machNumber.setObjectName(u"machNumber")
+
+        self.verticalLayout_3.addWidget(self.machNumber)
+
+        self.q = QCheckBox(self.groupBox_3)
+        self.q.setObjectName(u"q")
+
+        self.verticalLayout_3.addWidget(self.q)
+
+        self.totalPressure = QCheckBox(self.groupBox_3)
+        self.totalPressure.setObjectName(u"totalPressure")
+
+        self.verticalLayout_3.addWidget(self.totalPressure)
+
+        self.vorticity = QCheckBox(self.groupBox_3)
+        self.vorticity.setObjectName(u"vorticity")
+
+        self.verticalLayout_3.addWidget(self.vorticity)
+
+        self.wallHeatFlux = QCheckBox(self.groupBox_3)
+        self.wallHeatFlux.setObjectName(u"wallHeatFlux")
+
+        self.verticalLayout_3.addWidget(self.wallHeatFlux)
+
+        self.wallShearStress = QCheckBox(self.groupBox_3)
+        self.wallShearStress.setObjectName(u"wallShearStress")
+
+        self.verticalLayout_3.addWidget(self.wallShearStress)
+
+        self.wallYPlus = QCheckBox(self.groupBox_3)
+        self.wallYPlus.setObjectName(u"wallYPlus")
+
+        self.verticalLayout_3.addWidget(self.wallYPlus)
+
+        self.widget_5 = QWidget(self.groupBox_3)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.compute = QPushButton(self.widget_5)
+        self.compute.setObjectName(u"compute")
+
+        self.horizontalLayout_2.addWidget(self.compute)
+
+        self.close = QPushButton(self.widget_5)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout_2.addWidget(self.close)
+
+
+        self.verticalLayout_3.addWidget(self.widget_5)
+
+
+        self.verticalLayout.addWidget(self.groupBox_3)
+
+
+        self.retranslateUi(CollateralFieldsReportDialog)
+        self.close.clicked.connect(CollateralFieldsReportDialog.close)
+
+        QMetaObject.connectSlotsByName(CollateralFieldsReportDialog)
+    # setupUi
+
+    def retranslateUi(self, CollateralFieldsReportDialog):
+        CollateralFieldsReportDialog.setWindowTitle(QCoreApplication.translate("CollateralFieldsReportDialog", u"Collateral Fields Report", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("CollateralFieldsReportDialog", u"Collateral Fields", None))
+        self.age.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Age", None))
+        self.heatTransferCoefficient.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Heat Transfer Coefficient", None))
+        self.machNumber.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Mach Number", None))
+        self.q.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Q", None))
+        self.totalPressure.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Total Pressure", None))
+        self.vorticity.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Vorticity", None))
+        self.wallHeatFlux.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Wall Heat Flux", None))
+        self.wallShearStress.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Wall Shear Stress", None))
+        self.wallYPlus.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Wall y plus", None))
+        self.compute.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Compute", None))
+        self.close.setText(QCoreApplication.translate("CollateralFieldsReportDialog", u"Close", None))
+    # retranslateUi
+
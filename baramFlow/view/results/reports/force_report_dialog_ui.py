@@ -0,0 +1,702 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'force_report_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QFormLayout,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_ForceReportDialog(object):
+    def setupUi(self, ForceReportDialog):
+        if not ForceReportDialog.objectName():
+            ForceReportDialog.setObjectName(u"ForceReportDialog")
+        ForceReportDialog.resize(751, 595)
+        self.verticalLayout_2 = QVBoxLayout(ForceReportDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_10 = QWidget(ForceReportDialog)
+        self.widget_10.setObjectName(u"widget_10")
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_10)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.widget_10)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.groupBox_2.setEnabled(True)
+        self.verticalLayout_4 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_4 = QWidget(self.groupBox_2)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_2 = QFormLayout(self.widget_4)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label_4 = QLabel(self.widget_4)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.specificationMethod = EnumComboBox(self.widget_4)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout_4.addWidget(self.widget_4)
+
+        self.direction = QGroupBox(self.groupBox_2)
+        self.direction.setObjectName(u"direction")
+        self.verticalLayout_5 = QVBoxLayout(self.direction)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_5 = QWidget(self.direction)
+        self.widget_5.setObjectName(u"widget_5")
+        self.gridLayout = QGridLayout(self.widget_5)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(-1, 0, -1, -1)
+        self.label_5 = QLabel(self.widget_5)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_5, 0, 3, 1, 1)
+
+        self.label_6 = QLabel(self.widget_5)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_6, 0, 1, 1, 1)
+
+        self.dragDirectionX = QLineEdit(self.widget_5)
+        self.dragDirectionX.setObjectName(u"dragDirectionX")
+
+        self.gridLayout.addWidget(self.dragDirectionX, 1, 1, 1, 1)
+
+        self.label_10 = QLabel(self.widget_5)
+        self.label_10.setObjectName(u"label_10")
+        self.label_10.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_10, 0, 2, 1, 1)
+
+        self.dragDirectionZ = QLineEdit(self.widget_5)
+        self.dragDirectionZ.setObjectName(u"dragDirectionZ")
+
+        self.gridLayout.addWidget(self.dragDirectionZ, 1, 3, 1, 1)
+
+        self.dragDirectionY = QLineEdit(self.widget_5)
+        self.dragDirectionY.setObjectName(u"dragDirectionY")
+
+        self.gridLayout.addWidget(self.dragDirectionY, 1, 2, 1, 1)
+
+        self.label_11 = QLabel(self.widget_5)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.label_12 = QLabel(self.widget_5)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout.addWidget(self.label_12, 2, 0, 1, 1)
+
+        self.liftDirectionX = QLineEdit(self.widget_5)
+        self.liftDirectionX.setObjectName(u"liftDirectionX")
+
+        self.gridLayout.addWidget(self.liftDirectionX, 2, 1, 1, 1)
+
+        self.liftDirectionY = QLineEdit(self.widget_5)
+        self.liftDirectionY.setObjectName(u"liftDirectionY")
+
+        self.gridLayout.addWidget(self.liftDirectionY, 2, 2, 1, 1)
+
+        self.liftDirectionZ = QLineEdit(self.widget_5)
+        self.liftDirectionZ.setObjectName(u"liftDirectionZ")
+
+        self.gridLayout.addWidget(self.liftDirectionZ, 2, 3, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.widget_5)
+
+
+        self.verticalLayout_4.addWidget(self.direction)
+
+        self.angles = QWidget(self.groupBox_2)
+        self.angles.setObjectName(u"angles")
+        self.formLayout_4 = QFormLayout(self.angles)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.formLayout_4.setContentsMargins(0, -1, 0, -1)
+        self.label_22 = QLabel(self.angles)
+        self.label_22.setObjectName(u"label_22")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_22)
+
+        self.AoA = QLineEdit(self.angles)
+        self.AoA.setObjectName(u"AoA")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.AoA)
+
+        self.label_23 = QLabel(self.angles)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_23)
+
+        self.AoS = QLineEdit(self.angles)
+        self.AoS.setObjectName(u"AoS")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.AoS)
+
+
+        self.verticalLayout_4.addWidget(self.angles)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.widget_2 = QWidget(self.groupBox)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.groupBox_5 = QGroupBox(self.widget_2)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.formLayout_5 = QFormLayout(self.groupBox_5)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.label_14 = QLabel(self.groupBox_5)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_14)
+
+        self.centerOfRotationX = QLineEdit(self.groupBox_5)
+        self.centerOfRotationX.setObjectName(u"centerOfRotationX")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.centerOfRotationX)
+
+        self.label_15 = QLabel(self.groupBox_5)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_15)
+
+        self.centerOfRotationY = QLineEdit(self.groupBox_5)
+        self.centerOfRotationY.setObjectName(u"centerOfRotationY")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.centerOfRotationY)
+
+        self.label_16 = QLabel(self.groupBox_5)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_5.setWidget(2, QFormLayout.LabelRole, self.label_16)
+
+        self.centerOfRotationZ = QLineEdit(self.groupBox_5)
+        self.centerOfRotationZ.setObjectName(u"centerOfRotationZ")
+
+        self.formLayout_5.setWidget(2, QFormLayout.FieldRole, self.centerOfRotationZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_5)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_17 = QLabel(self.widget)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout.addWidget(self.label_17)
+
+        self.horizontalSpacer = QSpacerItem(0, 0, QSizePolicy.MinimumExpanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.boundaries = QListWidget(self.groupBox)
+        self.boundaries.setObjectName(u"boundaries")
+        self.boundaries.setSelectionMode(QAbstractItemView.MultiSelection)
+
+        self.verticalLayout.addWidget(self.boundaries)
+
+
+        self.horizontalLayout_7.addWidget(self.groupBox)
+
+        self.groupBox_6 = QGroupBox(self.widget_10)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_6)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.groupBox_3 = QGroupBox(self.groupBox_6)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_2 = QGridLayout(self.groupBox_3)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.lift = QLabel(self.groupBox_3)
+        self.lift.setObjectName(u"lift")
+        font = QFont()
+        font.setBold(True)
+        self.lift.setFont(font)
+
+        self.gridLayout_2.addWidget(self.lift, 1, 1, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout_2.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.label = QLabel(self.groupBox_3)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout_2.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox_3)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout_2.addWidget(self.label_3, 2, 0, 1, 1)
+
+        self.drag = QLabel(self.groupBox_3)
+        self.drag.setObjectName(u"drag")
+        self.drag.setFont(font)
+
+        self.gridLayout_2.addWidget(self.drag, 0, 1, 1, 1)
+
+        self.moment = QLabel(self.groupBox_3)
+        self.moment.setObjectName(u"moment")
+        self.moment.setFont(font)
+
+        self.gridLayout_2.addWidget(self.moment, 2, 1, 1, 1)
+
+        self.gridLayout_2.setColumnStretch(0, 1)
+        self.gridLayout_2.setColumnStretch(1, 3)
+
+        self.verticalLayout_6.addWidget(self.groupBox_3)
+
+        self.widget_7 = QWidget(self.groupBox_6)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.groupBox_12 = QGroupBox(self.widget_7)
+        self.groupBox_12.setObjectName(u"groupBox_12")
+        self.verticalLayout_7 = QVBoxLayout(self.groupBox_12)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.groupBox_7 = QGroupBox(self.groupBox_12)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.gridLayout_4 = QGridLayout(self.groupBox_7)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.label_18 = QLabel(self.groupBox_7)
+        self.label_18.setObjectName(u"label_18")
+
+        self.gridLayout_4.addWidget(self.label_18, 3, 0, 1, 1)
+
+        self.label_13 = QLabel(self.groupBox_7)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_4.addWidget(self.label_13, 2, 0, 1, 1)
+
+        self.label_19 = QLabel(self.groupBox_7)
+        self.label_19.setObjectName(u"label_19")
+
+        self.gridLayout_4.addWidget(self.label_19, 4, 0, 1, 1)
+
+        self.total_force_z = QLabel(self.groupBox_7)
+        self.total_force_z.setObjectName(u"total_force_z")
+        self.total_force_z.setFont(font)
+
+        self.gridLayout_4.addWidget(self.total_force_z, 4, 1, 1, 1)
+
+        self.total_force_y = QLabel(self.groupBox_7)
+        self.total_force_y.setObjectName(u"total_force_y")
+        self.total_force_y.setFont(font)
+
+        self.gridLayout_4.addWidget(self.total_force_y, 3, 1, 1, 1)
+
+        self.total_force_x = QLabel(self.groupBox_7)
+        self.total_force_x.setObjectName(u"total_force_x")
+        self.total_force_x.setFont(font)
+
+        self.gridLayout_4.addWidget(self.total_force_x, 2, 1, 1, 1)
+
+        self.gridLayout_4.setColumnStretch(0, 1)
+        self.gridLayout_4.setColumnStretch(1, 10)
+
+        self.verticalLayout_7.addWidget(self.groupBox_7)
+
+        self.groupBox_13 = QGroupBox(self.groupBox_12)
+        self.groupBox_13.setObjectName(u"groupBox_13")
+        self.gridLayout_5 = QGridLayout(self.groupBox_13)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.pressure_force_x = QLabel(self.groupBox_13)
+        self.pressure_force_x.setObjectName(u"pressure_force_x")
+        self.pressure_force_x.setFont(font)
+
+        self.gridLayout_5.addWidget(self.pressure_force_x, 0, 1, 1, 1)
+
+        self.label_21 = QLabel(self.groupBox_13)
+        self.label_21.setObjectName(u"label_21")
+
+        self.gridLayout_5.addWidget(self.label_21, 1, 0, 1, 1)
+
+        self.label_20 = QLabel(self.groupBox_13)
+        self.label_20.setObjectName(u"label_20")
+
+        self.gridLayout_5.addWidget(self.label_20, 0, 0, 1, 1)
+
+        self.label_24 = QLabel(self.groupBox_13)
+        self.label_24.setObjectName(u"label_24")
+
+        self.gridLayout_5.addWidget(self.label_24, 2, 0, 1, 1)
+
+        self.pressure_force_y = QLabel(self.groupBox_13)
+        self.pressure_force_y.setObjectName(u"pressure_force_y")
+        self.pressure_force_y.setFont(font)
+
+        self.gridLayout_5.addWidget(self.pressure_force_y, 1, 1, 1, 1)
+
+        self.pressure_force_z = QLabel(self.groupBox_13)
+        self.pressure_force_z.setObjectName(u"pressure_force_z")
+        self.pressure_force_z.setFont(font)
+
+        self.gridLayout_5.addWidget(self.pressure_force_z, 2, 1, 1, 1)
+
+        self.gridLayout_5.setColumnStretch(0, 1)
+        self.gridLayout_5.setColumnStretch(1, 10)
+
+        self.verticalLayout_7.addWidget(self.groupBox_13)
+
+        self.groupBox_4 = QGroupBox(self.groupBox_12)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_3 = QGridLayout(self.groupBox_4)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.label_9 = QLabel(self.groupBox_4)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout_3.addWidget(self.label_9, 2, 0, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_3.addWidget(self.label_7, 0, 0, 1, 1)
+
+        self.label_8 = QLabel(self.groupBox_4)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout_3.addWidget(self.label_8, 1, 0, 1, 1)
+
+        self.viscous_force_x = QLabel(self.groupBox_4)
+        self.viscous_force_x.setObjectName(u"viscous_force_x")
+        self.viscous_force_x.setFont(font)
+
+        self.gridLayout_3.addWidget(self.viscous_force_x, 0, 1, 1, 1)
+
+        self.viscous_force_y = QLabel(self.groupBox_4)
+        self.viscous_force_y.setObjectName(u"viscous_force_y")
+        self.viscous_force_y.setFont(font)
+
+        self.gridLayout_3.addWidget(self.viscous_force_y, 1, 1, 1, 1)
+
+        self.viscous_force_z = QLabel(self.groupBox_4)
+        self.viscous_force_z.setObjectName(u"viscous_force_z")
+        self.viscous_force_z.setFont(font)
+
+        self.gridLayout_3.addWidget(self.viscous_force_z, 2, 1, 1, 1)
+
+        self.gridLayout_3.setColumnStretch(0, 1)
+        self.gridLayout_3.setColumnStretch(1, 10)
+
+        self.verticalLayout_7.addWidget(self.groupBox_4)
+
+
+        self.horizontalLayout_3.addWidget(self.groupBox_12)
+
+        self.groupBox_14 = QGroupBox(self.widget_7)
+        self.groupBox_14.setObjectName(u"groupBox_14")
+        self.verticalLayout_8 = QVBoxLayout(self.groupBox_14)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.groupBox_9 = QGroupBox(self.groupBox_14)
+        self.groupBox_9.setObjectName(u"groupBox_9")
+        self.gridLayout_6 = QGridLayout(self.groupBox_9)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.label_25 = QLabel(self.groupBox_9)
+        self.label_25.setObjectName(u"label_25")
+
+        self.gridLayout_6.addWidget(self.label_25, 3, 0, 1, 1)
+
+        self.label_26 = QLabel(self.groupBox_9)
+        self.label_26.setObjectName(u"label_26")
+
+        self.gridLayout_6.addWidget(self.label_26, 2, 0, 1, 1)
+
+        self.label_27 = QLabel(self.groupBox_9)
+        self.label_27.setObjectName(u"label_27")
+
+        self.gridLayout_6.addWidget(self.label_27, 4, 0, 1, 1)
+
+        self.total_moment_z = QLabel(self.groupBox_9)
+        self.total_moment_z.setObjectName(u"total_moment_z")
+        self.total_moment_z.setFont(font)
+
+        self.gridLayout_6.addWidget(self.total_moment_z, 4, 1, 1, 1)
+
+        self.total_moment_y = QLabel(self.groupBox_9)
+        self.total_moment_y.setObjectName(u"total_moment_y")
+        self.total_moment_y.setFont(font)
+
+        self.gridLayout_6.addWidget(self.total_moment_y, 3, 1, 1, 1)
+
+        self.total_moment_x = QLabel(self.groupBox_9)
+        self.total_moment_x.setObjectName(u"total_moment_x")
+        self.total_moment_x.setFont(font)
+
+        self.gridLayout_6.addWidget(self.total_moment_x, 2, 1, 1, 1)
+
+        self.gridLayout_6.setColumnStretch(0, 1)
+        self.gridLayout_6.setColumnStretch(1, 10)
+
+        self.verticalLayout_8.addWidget(self.groupBox_9)
+
+        self.groupBox_10 = QGroupBox(self.groupBox_14)
+        self.groupBox_10.setObjectName(u"groupBox_10")
+        self.gridLayout_7 = QGridLayout(self.groupBox_10)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.pressure_moment_x = QLabel(self.groupBox_10)
+        self.pressure_moment_x.setObjectName(u"pressure_moment_x")
+        self.pressure_moment_x.setFont(font)
+
+        self.gridLayout_7.addWidget(self.pressure_moment_x, 0, 1, 1, 1)
+
+        self.label_28 = QLabel(self.groupBox_10)
+        self.label_28.setObjectName(u"label_28")
+
+        self.gridLayout_7.addWidget(self.label_28, 1, 0, 1, 1)
+
+        self.label_29 = QLabel(self.groupBox_10)
+        self.label_29.setObjectName(u"label_29")
+
+        self.gridLayout_7.addWidget(self.label_29, 0, 0, 1, 1)
+
+        self.label_30 = QLabel(self.groupBox_10)
+        self.label_30.setObjectName(u"label_30")
+
+        self.gridLayout_7.addWidget(self.label_30, 2, 0, 1, 1)
+
+        self.pressure_moment_y = QLabel(self.groupBox_10)
+        self.pressure_moment_y.setObjectName(u"pressure_moment_y")
+        self.pressure_moment_y.setFont(font)
+
+        self.gridLayout_7.addWidget(self.pressure_moment_y, 1, 1, 1, 1)
+
+        self.pressure_moment_z = QLabel(self.groupBox_10)
+        self.pressure_moment_z.setObjectName(u"pressure_moment_z")
+        self.pressure_moment_z.setFont(font)
+
+        self.gridLayout_7.addWidget(self.pressure_moment_z, 2, 1, 1, 1)
+
+        self.gridLayout_7.setColumnStretch(0, 1)
+        self.gridLayout_7.setColumnStretch(1, 10)
+
+        self.verticalLayout_8.addWidget(self.groupBox_10)
+
+        self.groupBox_11 = QGroupBox(self.groupBox_14)
+        self.groupBox_11.setObjectName(u"groupBox_11")
+        self.gridLayout_8 = QGridLayout(self.groupBox_11)
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.label_31 = QLabel(self.groupBox_11)
+        self.label_31.setObjectName(u"label_31")
+
+        self.gridLayout_8.addWidget(self.label_31, 2, 0, 1, 1)
+
+        self.label_32 = QLabel(self.groupBox_11)
+        self.label_32.setObjectName(u"label_32")
+
+        self.gridLayout_8.addWidget(self.label_32, 0, 0, 1, 1)
+
+        self.label_33 = QLabel(self.groupBox_11)
+        self.label_33.setObjectName(u"label_33")
+
+        self.gridLayout_8.addWidget(self.label_33, 1, 0, 1, 1)
+
+        self.viscous_moment_x = QLabel(self.groupBox_11)
+        self.viscous_moment_x.setObjectName(u"viscous_moment_x")
+        self.viscous_moment_x.setFont(font)
+
+        self.gridLayout_8.addWidget(self.viscous_moment_x, 0, 1, 1, 1)
+
+        self.viscous_moment_y = QLabel(self.groupBox_11)
+        self.viscous_moment_y.setObjectName(u"viscous_moment_y")
+        self.viscous_moment_y.setFont(font)
+
+        self.gridLayout_8.addWidget(self.viscous_moment_y, 1, 1, 1, 1)
+
+        self.viscous_moment_z = QLabel(self.groupBox_11)
+        self.viscous_moment_z.setObjectName(u"viscous_moment_z")
+        self.viscous_moment_z.setFont(font)
+
+        self.gridLayout_8.addWidget(self.viscous_moment_z, 2, 1, 1, 1)
+
+        self.gridLayout_8.setColumnStretch(0, 1)
+        self.gridLayout_8.setColumnStretch(1, 10)
+
+        self.verticalLayout_8.addWidget(self.groupBox_11)
+
+
+        self.horizontalLayout_3.addWidget(self.groupBox_14)
+
+
+        self.verticalLayout_6.addWidget(self.widget_7)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_6.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout_7.addWidget(self.groupBox_6)
+
+        self.horizontalLayout_7.setStretch(0, 1)
+        self.horizontalLayout_7.setStretch(1, 1)
+
+        self.verticalLayout_2.addWidget(self.widget_10)
+
+        self.widget_3 = QWidget(ForceReportDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.compute = QPushButton(self.widget_3)
+        self.compute.setObjectName(u"compute")
+
+        self.horizontalLayout_2.addWidget(self.compute)
+
+        self.close = QPushButton(self.widget_3)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout_2.addWidget(self.close)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+        QWidget.setTabOrder(self.specificationMethod, self.dragDirectionX)
+        QWidget.setTabOrder(self.dragDirectionX, self.dragDirectionY)
+        QWidget.setTabOrder(self.dragDirectionY, self.dragDirectionZ)
+        QWidget.setTabOrder(self.dragDirectionZ, self.liftDirectionX)
+        QWidget.setTabOrder(self.liftDirectionX, self.liftDirectionY)
+        QWidget.setTabOrder(self.liftDirectionY, self.liftDirectionZ)
+        QWidget.setTabOrder(self.liftDirectionZ, self.AoA)
+        QWidget.setTabOrder(self.AoA, self.AoS)
+        QWidget.setTabOrder(self.AoS, self.centerOfRotationX)
+        QWidget.setTabOrder(self.centerOfRotationX, self.centerOfRotationY)
+        QWidget.setTabOrder(self.centerOfRotationY, self.centerOfRotationZ)
+        QWidget.setTabOrder(self.centerOfRotationZ, self.select)
+        QWidget.setTabOrder(self.select, self.boundaries)
+
+        self.retranslateUi(ForceReportDialog)
+
+        QMetaObject.connectSlotsByName(ForceReportDialog)
+    # setupUi
+
+    def retranslateUi(self, ForceReportDialog):
+        ForceReportDialog.setWindowTitle(QCoreApplication.translate("ForceReportDialog", u"Force Report", None))
+        self.groupBox.setTitle(QCoreApplication.translate("ForceReportDialog", u"Parameters", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("ForceReportDialog", u"Flow Direction", None))
+        self.label_4.setText(QCoreApplication.translate("ForceReportDialog", u"Specification Method", None))
+        self.direction.setTitle(QCoreApplication.translate("ForceReportDialog", u"Direction", None))
+        self.label_5.setText(QCoreApplication.translate("ForceReportDialog", u"Z", None))
+        self.label_6.setText(QCoreApplication.translate("ForceReportDialog", u"X", None))
+        self.dragDirectionX.setText(QCoreApplication.translate("ForceReportDialog", u"1", None))
+        self.label_10.setText(QCoreApplication.translate("ForceReportDialog", u"Y", None))
+        self.dragDirectionZ.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.dragDirectionY.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_11.setText(QCoreApplication.translate("ForceReportDialog", u"Drag Direction", None))
+        self.label_12.setText(QCoreApplication.translate("ForceReportDialog", u"Lift Direction", None))
+        self.liftDirectionX.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.liftDirectionY.setText(QCoreApplication.translate("ForceReportDialog", u"1", None))
+        self.liftDirectionZ.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_22.setText(QCoreApplication.translate("ForceReportDialog", u"Angle of Attack, AOA (degree)", None))
+        self.AoA.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_23.setText(QCoreApplication.translate("ForceReportDialog", u"Angle of Sideslip, AOS (degree)", None))
+        self.AoS.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("ForceReportDialog", u"Center of Rotation", None))
+        self.label_14.setText(QCoreApplication.translate("ForceReportDialog", u"X", None))
+        self.centerOfRotationX.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_15.setText(QCoreApplication.translate("ForceReportDialog", u"Y", None))
+        self.centerOfRotationY.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_16.setText(QCoreApplication.translate("ForceReportDialog", u"Z", None))
+        self.centerOfRotationZ.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_17.setText(QCoreApplication.translate("ForceReportDialog", u"Boundaries", None))
+        self.select.setText(QCoreApplication.translate("ForceReportDialog", u"Select", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("ForceReportDialog", u"Results", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("ForceReportDialog", u"Force Coefficient", None))
+        self.lift.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_2.setText(QCoreApplication.translate("ForceReportDialog", u"Lift, C<sub>L</sub> :", None))
+        self.label.setText(QCoreApplication.translate("ForceReportDialog", u"Drag, C<sub>D</sub> :", None))
+        self.label_3.setText(QCoreApplication.translate("ForceReportDialog", u"Moment, C<sub>M</sub> :", None))
+        self.drag.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.moment.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_12.setTitle(QCoreApplication.translate("ForceReportDialog", u"Force", None))
+        self.groupBox_7.setTitle(QCoreApplication.translate("ForceReportDialog", u"Total Force (N)", None))
+        self.label_18.setText(QCoreApplication.translate("ForceReportDialog", u"Y :", None))
+        self.label_13.setText(QCoreApplication.translate("ForceReportDialog", u"X :", None))
+        self.label_19.setText(QCoreApplication.translate("ForceReportDialog", u"Z :", None))
+        self.total_force_z.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.total_force_y.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.total_force_x.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_13.setTitle(QCoreApplication.translate("ForceReportDialog", u"Pressure Force (N)", None))
+        self.pressure_force_x.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_21.setText(QCoreApplication.translate("ForceReportDialog", u"Y :", None))
+        self.label_20.setText(QCoreApplication.translate("ForceReportDialog", u"X :", None))
+        self.label_24.setText(QCoreApplication.translate("ForceReportDialog", u"Z :", None))
+        self.pressure_force_y.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.pressure_force_z.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("ForceReportDialog", u"Viscous Force (N)", None))
+        self.label_9.setText(QCoreApplication.translate("ForceReportDialog", u"Z :", None))
+        self.label_7.setText(QCoreApplication.translate("ForceReportDialog", u"X :", None))
+        self.label_8.setText(QCoreApplication.translate("ForceReportDialog", u"Y :", None))
+        self.viscous_force_x.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.viscous_force_y.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.viscous_force_z.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_14.setTitle(QCoreApplication.translate("ForceReportDialog", u"Moment", None))
+        self.groupBox_9.setTitle(QCoreApplication.translate("ForceReportDialog", u"Total Moment (N\u00b7m)", None))
+        self.label_25.setText(QCoreApplication.translate("ForceReportDialog", u"Y :", None))
+        self.label_26.setText(QCoreApplication.translate("ForceReportDialog", u"X :", None))
+        self.label_27.setText(QCoreApplication.translate("ForceReportDialog", u"Z :", None))
+        self.total_moment_z.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.total_moment_y.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.total_moment_x.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_10.setTitle(QCoreApplication.translate("ForceReportDialog", u"Pressure Moment (N\u00b7m)", None))
+        self.pressure_moment_x.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.label_28.setText(QCoreApplication.translate("ForceReportDialog", u"Y :", None))
+        self.label_29.setText(QCoreApplication.translate("ForceReportDialog", u"X :", None))
+        self.label_30.setText(QCoreApplication.translate("ForceReportDialog", u"Z :", None))
+        self.pressure_moment_y.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.pressure_moment_z.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.groupBox_11.setTitle(QCoreApplication.translate("ForceReportDialog", u"Viscous Moment (N\u00b7m)", None))
+        self.label_31.setText(QCoreApplication.translate("ForceReportDialog", u"Z :", None))
+        self.label_32.setText(QCoreApplication.translate("ForceReportDialog", u"X :", None))
+        self.label_33.setText(QCoreApplication.translate("ForceReportDialog", u"Y :", None))
+        self.viscous_moment_x.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.viscous_moment_y.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.viscous_moment_z.setText(QCoreApplication.translate("ForceReportDialog", u"0", None))
+        self.compute.setText(QCoreApplication.translate("ForceReportDialog", u"Compute", None))
+        self.close.setText(QCoreApplication.translate("ForceReportDialog", u"Close", None))
+    # retranslateUi
+
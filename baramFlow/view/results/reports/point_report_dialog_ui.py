@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'point_report_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDialog, QFormLayout,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+
+class Ui_PointReportDialog(object):
+    def setupUi(self, PointReportDialog):
+        if not PointReportDialog.objectName():
+            PointReportDialog.setObjectName(u"PointReportDialog")
+        PointReportDialog.resize(374, 400)
+        self.verticalLayout_2 = QVBoxLayout(PointReportDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(PointReportDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.propeties = QWidget(self.groupBox)
+        self.propeties.setObjectName(u"propeties")
+        self.formLayout = QFormLayout(self.propeties)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.propeties)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.field = QComboBox(self.propeties)
+        self.field.setObjectName(u"field")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.field)
+
+        self.label_7 = QLabel(self.propeties)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.fieldComponent = VectorComponentComboBox(self.propeties)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.fieldComponent)
+
+
+        self.verticalLayout.addWidget(self.propeties)
+
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_2 = QFormLayout(self.groupBox_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.coordinateX = QLineEdit(self.groupBox_2)
+        self.coordinateX.setObjectName(u"coordinateX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.coordinateX)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.coordinateY = QLineEdit(self.groupBox_2)
+        self.coordinateY.setObjectName(u"coordinateY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.coordinateY)
+
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.coordinateZ = QLineEdit(self.groupBox_2)
+        self.coordinateZ.setObjectName(u"coordinateZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.coordinateZ)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.widget_2 = QWidget(self.groupBox)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(9, 9, 9, 9)
+        self.label_6 = QLabel(self.widget_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout.addWidget(self.label_6)
+
+        self.snapOntoBoundary = QLineEdit(self.widget_2)
+        self.snapOntoBoundary.setObjectName(u"snapOntoBoundary")
+        self.snapOntoBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.snapOntoBoundary)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.groupBox_3 = QGroupBox(PointReportDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout = QGridLayout(self.groupBox_3)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.resultLabel = QLabel(self.groupBox_3)
+        self.resultLabel.setObjectName(u"resultLabel")
+
+        self.gridLayout.addWidget(self.resultLabel, 0, 0, 1, 1)
+
+        self.resultValue = QLabel(self.groupBox_3)
+        self.resultValue.setObjectName(u"resultValue")
+        font = QFont()
+        font.setBold(True)
+        self.resultValue.setFont(font)
+
+        self.gridLayout.addWidget(self.resultValue, 0, 1, 1, 1)
+
+        self.gridLayout.setColumnStretch(0, 1)
+        self.gridLayout.setColumnStretch(1, 8)
+
+        self.verticalLayout_2.addWidget(self.groupBox_3)
+
+        self.widget_3 = QWidget(PointReportDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.compute = QPushButton(self.widget_3)
+        self.compute.setObjectName(u"compute")
+
+        self.horizontalLayout_2.addWidget(self.compute)
+
+        self.close = QPushButton(self.widget_3)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout_2.addWidget(self.close)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+
+        self.retranslateUi(PointReportDialog)
+        self.close.clicked.connect(PointReportDialog.reject)
+
+        QMetaObject.connectSlotsByName(PointReportDialog)
+    # setupUi
+
+    def retranslateUi(self, PointReportDialog):
+        PointReportDialog.setWindowTitle(QCoreApplication.translate("PointReportDialog", u"Point Report", None))
+        self.groupBox.setTitle(QCoreApplication.translate("PointReportDialog", u"Parameters", None))
+        self.label.setText(QCoreApplication.translate("PointReportDialog", u"Field", None))
+        self.label_7.setText(QCoreApplication.translate("PointReportDialog", u"Component", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("PointReportDialog", u"Coordinate", None))
+        self.label_3.setText(QCoreApplication.translate("PointReportDialog", u"X (m)", None))
+        self.label_4.setText(QCoreApplication.translate("PointReportDialog", u"Y (m)", None))
+        self.label_5.setText(QCoreApplication.translate("PointReportDialog", u"Z (m)", None))
+        self.label_6.setText(QCoreApplication.translate("PointReportDialog", u"Snap onto Boundary", None))
+        self.select.setText(QCoreApplication.translate("PointReportDialog", u"Select", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("PointReportDialog", u"Result", None))
+        self.resultLabel.setText(QCoreApplication.translate("PointReportDialog", u"Value :", None))
+        self.resultValue.setText(QCoreApplication.translate("PointReportDialog", u"0", None))
+        self.compute.setText(QCoreApplication.translate("PointReportDialog", u"Compute", None))
+        self.close.setText(QCoreApplication.translate("PointReportDialog", u"Close", None))
+    # retranslateUi
+
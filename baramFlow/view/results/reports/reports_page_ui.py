@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'reports_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QGroupBox, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_ReportsPage(object):
+    def setupUi(self, ReportsPage):
+        if not ReportsPage.objectName():
+            ReportsPage.setObjectName(u"ReportsPage")
+        ReportsPage.resize(353, 482)
+        self.verticalLayout_4 = QVBoxLayout(ReportsPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(-1, -1, 9, -1)
+        self.title = QLabel(ReportsPage)
+        self.title.setObjectName(u"title")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.title.sizePolicy().hasHeightForWidth())
+        self.title.setSizePolicy(sizePolicy)
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.title)
+
+        self.line = QFrame(ReportsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.widget = QWidget(ReportsPage)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.groupBox_3 = QGroupBox(self.widget)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.forceReport = QPushButton(self.groupBox_3)
+        self.forceReport.setObjectName(u"forceReport")
+        self.forceReport.setMinimumSize(QSize(0, 48))
+
+        self.verticalLayout_6.addWidget(self.forceReport)
+
+        self.pointReport = QPushButton(self.groupBox_3)
+        self.pointReport.setObjectName(u"pointReport")
+        self.pointReport.setMinimumSize(QSize(0, 48))
+
+        self.verticalLayout_6.addWidget(self.pointReport)
+
+        self.surfaceReport = QPushButton(self.groupBox_3)
+        self.surfaceReport.setObjectName(u"surfaceReport")
+        self.surfaceReport.setEnabled(True)
+        self.surfaceReport.setMinimumSize(QSize(0, 48))
+
+        self.verticalLayout_6.addWidget(self.surfaceReport)
+
+        self.volumeReport = QPushButton(self.groupBox_3)
+        self.volumeReport.setObjectName(u"volumeReport")
+        self.volumeReport.setEnabled(True)
+        self.volumeReport.setMinimumSize(QSize(0, 48))
+        self.volumeReport.setToolTipDuration(10)
+
+        self.verticalLayout_6.addWidget(self.volumeReport)
+
+        self.collateralFieldsReprot = QPushButton(self.groupBox_3)
+        self.collateralFieldsReprot.setObjectName(u"collateralFieldsReprot")
+        self.collateralFieldsReprot.setEnabled(True)
+        self.collateralFieldsReprot.setMinimumSize(QSize(0, 48))
+        self.collateralFieldsReprot.setToolTipDuration(10)
+
+        self.verticalLayout_6.addWidget(self.collateralFieldsReprot)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout_4.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(ReportsPage)
+
+        QMetaObject.connectSlotsByName(ReportsPage)
+    # setupUi
+
+    def retranslateUi(self, ReportsPage):
+        ReportsPage.setWindowTitle(QCoreApplication.translate("ReportsPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("ReportsPage", u"Reports", None))
+        self.groupBox_3.setTitle("")
+        self.forceReport.setText(QCoreApplication.translate("ReportsPage", u"Force", None))
+        self.pointReport.setText(QCoreApplication.translate("ReportsPage", u"Point", None))
+#if QT_CONFIG(tooltip)
+        self.surfaceReport.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.surfaceReport.setText(QCoreApplication.translate("ReportsPage", u"Surface", None))
+#if QT_CONFIG(tooltip)
+        self.volumeReport.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.volumeReport.setStatusTip("")
+#endif // QT_CONFIG(statustip)
+#if QT_CONFIG(whatsthis)
+        self.volumeReport.setWhatsThis("")
+#endif // QT_CONFIG(whatsthis)
+        self.volumeReport.setText(QCoreApplication.translate("ReportsPage", u"Volume", None))
+#if QT_CONFIG(tooltip)
+        self.collateralFieldsReprot.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.collateralFieldsReprot.setStatusTip("")
+#endif // QT_CONFIG(statustip)
+#if QT_CONFIG(whatsthis)
+        self.collateralFieldsReprot.setWhatsThis("")
+#endif // QT_CONFIG(whatsthis)
+        self.collateralFieldsReprot.setText(QCoreApplication.translate("ReportsPage", u"Collateral Fields", None))
+    # retranslateUi
+
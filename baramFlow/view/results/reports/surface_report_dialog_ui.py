@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'surface_report_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_SurfaceReportDialog(object):
+    def setupUi(self, SurfaceReportDialog):
+        if not SurfaceReportDialog.objectName():
+            SurfaceReportDialog.setObjectName(u"SurfaceReportDialog")
+        SurfaceReportDialog.resize(244, 277)
+        self.verticalLayout_2 = QVBoxLayout(SurfaceReportDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(SurfaceReportDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_2 = QWidget(self.groupBox)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_3.addWidget(self.label)
+
+        self.reportType = PythonComboBox(self.widget_2)
+        self.reportType.setObjectName(u"reportType")
+
+        self.horizontalLayout_3.addWidget(self.reportType)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.widget_4 = QWidget(self.groupBox)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(-1, 0, -1, 0)
+        self.label_2 = QLabel(self.widget_4)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_4.addWidget(self.label_2)
+
+        self.field = PythonComboBox(self.widget_4)
+        self.field.setObjectName(u"field")
+
+        self.horizontalLayout_4.addWidget(self.field)
+
+
+        self.verticalLayout.addWidget(self.widget_4)
+
+        self.widget_5 = QWidget(self.groupBox)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, 0, -1, 0)
+        self.label_4 = QLabel(self.widget_5)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_5.addWidget(self.label_4)
+
+        self.fieldComponent = VectorComponentComboBox(self.widget_5)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.horizontalLayout_5.addWidget(self.fieldComponent)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(9, 0, 9, 9)
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout.addWidget(self.label_3)
+
+        self.surface = QLineEdit(self.widget)
+        self.surface.setObjectName(u"surface")
+        self.surface.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.surface)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.groupBox_3 = QGroupBox(SurfaceReportDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout = QGridLayout(self.groupBox_3)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.resultLabel = QLabel(self.groupBox_3)
+        self.resultLabel.setObjectName(u"resultLabel")
+
+        self.gridLayout.addWidget(self.resultLabel, 0, 0, 1, 1)
+
+        self.resultValue = QLabel(self.groupBox_3)
+        self.resultValue.setObjectName(u"resultValue")
+        font = QFont()
+        font.setBold(True)
+        self.resultValue.setFont(font)
+
+        self.gridLayout.addWidget(self.resultValue, 0, 1, 1, 1)
+
+        self.gridLayout.setColumnStretch(0, 1)
+        self.gridLayout.setColumnStretch(1, 8)
+
+        self.verticalLayout_2.addWidget(self.groupBox_3)
+
+        self.widget_3 = QWidget(SurfaceReportDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.compute = QPushButton(self.widget_3)
+        self.compute.setObjectName(u"compute")
+
+        self.horizontalLayout_2.addWidget(self.compute)
+
+        self.close = QPushButton(self.widget_3)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout_2.addWidget(self.close)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+
+        self.retranslateUi(SurfaceReportDialog)
+        self.close.clicked.connect(SurfaceReportDialog.reject)
+
+        QMetaObject.connectSlotsByName(SurfaceReportDialog)
+    # setupUi
+
+    def retranslateUi(self, SurfaceReportDialog):
+        SurfaceReportDialog.setWindowTitle(QCoreApplication.translate("SurfaceReportDialog", u"Surface Report", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SurfaceReportDialog", u"Parameters", None))
+        self.label.setText(QCoreApplication.translate("SurfaceReportDialog", u"Report Type", None))
+        self.label_2.setText(QCoreApplication.translate("SurfaceReportDialog", u"Field", None))
+        self.label_4.setText(QCoreApplication.translate("SurfaceReportDialog", u"Component", None))
+        self.label_3.setText(QCoreApplication.translate("SurfaceReportDialog", u"Surface", None))
+        self.select.setText(QCoreApplication.translate("SurfaceReportDialog", u"Select", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("SurfaceReportDialog", u"Result", None))
+        self.resultLabel.setText(QCoreApplication.translate("SurfaceReportDialog", u"Value :", None))
+        self.resultValue.setText(QCoreApplication.translate("SurfaceReportDialog", u"0", None))
+        self.compute.setText(QCoreApplication.translate("SurfaceReportDialog", u"Compute", None))
+        self.close.setText(QCoreApplication.translate("SurfaceReportDialog", u"Close", None))
+    # retranslateUi
+
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'volume_report_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGridLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_VolumeReportDialog(object):
+    def setupUi(self, VolumeReportDialog):
+        if not VolumeReportDialog.objectName():
+            VolumeReportDialog.setObjectName(u"VolumeReportDialog")
+        VolumeReportDialog.resize(310, 292)
+        self.verticalLayout = QVBoxLayout(VolumeReportDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox = QGroupBox(VolumeReportDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.properties = QWidget(self.groupBox)
+        self.properties.setObjectName(u"properties")
+        self.formLayout = QFormLayout(self.properties)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(-1, -1, -1, 0)
+        self.label = QLabel(self.properties)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.reportType = PythonComboBox(self.properties)
+        self.reportType.setObjectName(u"reportType")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.reportType)
+
+        self.label_2 = QLabel(self.properties)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.fieldVariable = PythonComboBox(self.properties)
+        self.fieldVariable.setObjectName(u"fieldVariable")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.fieldVariable)
+
+        self.label_4 = QLabel(self.properties)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.fieldComponent = VectorComponentComboBox(self.properties)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.fieldComponent)
+
+
+        self.verticalLayout_2.addWidget(self.properties)
+
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(9, 0, 9, 9)
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_2.addWidget(self.label_3)
+
+        self.volume = QLineEdit(self.widget)
+        self.volume.setObjectName(u"volume")
+        self.volume.setEnabled(False)
+
+        self.horizontalLayout_2.addWidget(self.volume)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout_2.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.groupBox_3 = QGroupBox(VolumeReportDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout = QGridLayout(self.groupBox_3)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.resultLabel = QLabel(self.groupBox_3)
+        self.resultLabel.setObjectName(u"resultLabel")
+
+        self.gridLayout.addWidget(self.resultLabel, 0, 0, 1, 1)
+
+        self.resultValue = QLabel(self.groupBox_3)
+        self.resultValue.setObjectName(u"resultValue")
+        font = QFont()
+        font.setBold(True)
+        self.resultValue.setFont(font)
+
+        self.gridLayout.addWidget(self.resultValue, 0, 1, 1, 1)
+
+        self.gridLayout.setColumnStretch(0, 1)
+        self.gridLayout.setColumnStretch(1, 8)
+
+        self.verticalLayout.addWidget(self.groupBox_3)
+
+        self.widget_3 = QWidget(VolumeReportDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.compute = QPushButton(self.widget_3)
+        self.compute.setObjectName(u"compute")
+
+        self.horizontalLayout_3.addWidget(self.compute)
+
+        self.close = QPushButton(self.widget_3)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout_3.addWidget(self.close)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+
+        self.retranslateUi(VolumeReportDialog)
+        self.close.clicked.connect(VolumeReportDialog.reject)
+
+        QMetaObject.connectSlotsByName(VolumeReportDialog)
+    # setupUi
+
+    def retranslateUi(self, VolumeReportDialog):
+        VolumeReportDialog.setWindowTitle(QCoreApplication.translate("VolumeReportDialog", u"Volume Report", None))
+        self.groupBox.setTitle(QCoreApplication.translate("VolumeReportDialog", u"Parameters", None))
+        self.label.setText(QCoreApplication.translate("VolumeReportDialog", u"Report Type", None))
+        self.label_2.setText(QCoreApplication.translate("VolumeReportDialog", u"Field Variable", None))
+        self.label_4.setText(QCoreApplication.translate("VolumeReportDialog", u"Component", None))
+        self.label_3.setText(QCoreApplication.translate("VolumeReportDialog", u"Volumes", None))
+        self.select.setText(QCoreApplication.translate("VolumeReportDialog", u"Select", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("VolumeReportDialog", u"Result", None))
+        self.resultLabel.setText(QCoreApplication.translate("VolumeReportDialog", u"Value :", None))
+        self.resultValue.setText(QCoreApplication.translate("VolumeReportDialog", u"0", None))
+        self.compute.setText(QCoreApplication.translate("VolumeReportDialog", u"Compute", None))
+        self.close.setText(QCoreApplication.translate("VolumeReportDialog", u"Close", None))
+    # retranslateUi
+
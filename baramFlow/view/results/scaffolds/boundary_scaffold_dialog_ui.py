@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'boundary_scaffold_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QHBoxLayout, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_BoundaryScaffoldDialog(object):
+    def setupUi(self, BoundaryScaffoldDialog):
+        if not BoundaryScaffoldDialog.objectName():
+            BoundaryScaffoldDialog.setObjectName(u"BoundaryScaffoldDialog")
+        BoundaryScaffoldDialog.resize(198, 225)
+        self.verticalLayout = QVBoxLayout(BoundaryScaffoldDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(BoundaryScaffoldDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.verticalLayout_3.addWidget(self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(BoundaryScaffoldDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_8 = QLabel(self.widget_2)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout.addWidget(self.label_8)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.boundaries = QListWidget(BoundaryScaffoldDialog)
+        self.boundaries.setObjectName(u"boundaries")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.boundaries.sizePolicy().hasHeightForWidth())
+        self.boundaries.setSizePolicy(sizePolicy)
+        self.boundaries.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.boundaries.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout.addWidget(self.boundaries)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(BoundaryScaffoldDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(BoundaryScaffoldDialog)
+
+        QMetaObject.connectSlotsByName(BoundaryScaffoldDialog)
+    # setupUi
+
+    def retranslateUi(self, BoundaryScaffoldDialog):
+        BoundaryScaffoldDialog.setWindowTitle(QCoreApplication.translate("BoundaryScaffoldDialog", u"Boundary Scaffold", None))
+        self.label.setText(QCoreApplication.translate("BoundaryScaffoldDialog", u"Scaffold Name", None))
+        self.label_8.setText(QCoreApplication.translate("BoundaryScaffoldDialog", u"Boundary", None))
+        self.select.setText(QCoreApplication.translate("BoundaryScaffoldDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("BoundaryScaffoldDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("BoundaryScaffoldDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'disk_scaffold_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_DiskScaffoldDialog(object):
+    def setupUi(self, DiskScaffoldDialog):
+        if not DiskScaffoldDialog.objectName():
+            DiskScaffoldDialog.setObjectName(u"DiskScaffoldDialog")
+        DiskScaffoldDialog.resize(198, 540)
+        self.verticalLayout = QVBoxLayout(DiskScaffoldDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(DiskScaffoldDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.verticalLayout_3.addWidget(self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(DiskScaffoldDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_2 = QGridLayout(self.groupBox)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_11 = QLabel(self.groupBox)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_2.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.centerX = QLineEdit(self.groupBox)
+        self.centerX.setObjectName(u"centerX")
+
+        self.gridLayout_2.addWidget(self.centerX, 0, 1, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_2.addWidget(self.label_10, 0, 0, 1, 1)
+
+        self.centerY = QLineEdit(self.groupBox)
+        self.centerY.setObjectName(u"centerY")
+
+        self.gridLayout_2.addWidget(self.centerY, 1, 1, 1, 1)
+
+        self.centerZ = QLineEdit(self.groupBox)
+        self.centerZ.setObjectName(u"centerZ")
+
+        self.gridLayout_2.addWidget(self.centerZ, 2, 1, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_2.addWidget(self.label_12, 2, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.groupBox_1 = QGroupBox(DiskScaffoldDialog)
+        self.groupBox_1.setObjectName(u"groupBox_1")
+        self.gridLayout = QGridLayout(self.groupBox_1)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_3 = QLabel(self.groupBox_1)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 1, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_1)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 0, 1, 1)
+
+        self.normalX = QLineEdit(self.groupBox_1)
+        self.normalX.setObjectName(u"normalX")
+
+        self.gridLayout.addWidget(self.normalX, 0, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_1)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.normalY = QLineEdit(self.groupBox_1)
+        self.normalY.setObjectName(u"normalY")
+
+        self.gridLayout.addWidget(self.normalY, 1, 1, 1, 1)
+
+        self.normalZ = QLineEdit(self.groupBox_1)
+        self.normalZ.setObjectName(u"normalZ")
+
+        self.gridLayout.addWidget(self.normalZ, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_1)
+
+        self.groupBox_2 = QGroupBox(DiskScaffoldDialog)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_3 = QGridLayout(self.groupBox_2)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.outerRadius = QLineEdit(self.groupBox_2)
+        self.outerRadius.setObjectName(u"outerRadius")
+
+        self.gridLayout_3.addWidget(self.outerRadius, 0, 1, 1, 1)
+
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_3.addWidget(self.label_5, 0, 0, 1, 1)
+
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_3.addWidget(self.label_6, 1, 0, 1, 1)
+
+        self.innerRadius = QLineEdit(self.groupBox_2)
+        self.innerRadius.setObjectName(u"innerRadius")
+
+        self.gridLayout_3.addWidget(self.innerRadius, 1, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(DiskScaffoldDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_4 = QGridLayout(self.groupBox_3)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.label_7 = QLabel(self.groupBox_3)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_4.addWidget(self.label_7, 0, 0, 1, 1)
+
+        self.radialSamples = QLineEdit(self.groupBox_3)
+        self.radialSamples.setObjectName(u"radialSamples")
+
+        self.gridLayout_4.addWidget(self.radialSamples, 0, 1, 1, 1)
+
+        self.label_8 = QLabel(self.groupBox_3)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout_4.addWidget(self.label_8, 1, 0, 1, 1)
+
+        self.circumferentialSamples = QLineEdit(self.groupBox_3)
+        self.circumferentialSamples.setObjectName(u"circumferentialSamples")
+
+        self.gridLayout_4.addWidget(self.circumferentialSamples, 1, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_3)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(DiskScaffoldDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(DiskScaffoldDialog)
+
+        QMetaObject.connectSlotsByName(DiskScaffoldDialog)
+    # setupUi
+
+    def retranslateUi(self, DiskScaffoldDialog):
+        DiskScaffoldDialog.setWindowTitle(QCoreApplication.translate("DiskScaffoldDialog", u"Form", None))
+        self.label.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Scaffold Name", None))
+        self.groupBox.setTitle(QCoreApplication.translate("DiskScaffoldDialog", u"Center", None))
+        self.label_11.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Y", None))
+        self.label_10.setText(QCoreApplication.translate("DiskScaffoldDialog", u"X", None))
+        self.label_12.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Z", None))
+        self.groupBox_1.setTitle(QCoreApplication.translate("DiskScaffoldDialog", u"Normal", None))
+        self.label_3.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Y", None))
+        self.label_2.setText(QCoreApplication.translate("DiskScaffoldDialog", u"X", None))
+        self.label_4.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Z", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("DiskScaffoldDialog", u"Radius", None))
+        self.label_5.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Outer", None))
+        self.label_6.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Inner", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("DiskScaffoldDialog", u"Number of Sampling Points", None))
+        self.label_7.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Radial", None))
+        self.label_8.setText(QCoreApplication.translate("DiskScaffoldDialog", u"circumferential", None))
+        self.ok.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("DiskScaffoldDialog", u"Cancel", None))
+    # retranslateUi
+
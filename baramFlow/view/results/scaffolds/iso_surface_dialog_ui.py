@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'iso_surface_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSlider, QSpacerItem, QSpinBox,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_IsoSurfaceDialog(object):
+    def setupUi(self, IsoSurfaceDialog):
+        if not IsoSurfaceDialog.objectName():
+            IsoSurfaceDialog.setObjectName(u"IsoSurfaceDialog")
+        IsoSurfaceDialog.resize(205, 552)
+        self.verticalLayout = QVBoxLayout(IsoSurfaceDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(IsoSurfaceDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.verticalLayout_3.addWidget(self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(IsoSurfaceDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_4 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.label_2 = QLabel(self.widget_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.verticalLayout_4.addWidget(self.label_2)
+
+        self.field = PythonComboBox(self.widget_2)
+        self.field.setObjectName(u"field")
+
+        self.verticalLayout_4.addWidget(self.field)
+
+        self.fieldComponent = VectorComponentComboBox(self.widget_2)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.verticalLayout_4.addWidget(self.fieldComponent)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.groupBox = QGroupBox(IsoSurfaceDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.frame = QFrame(self.groupBox)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.Box)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout = QHBoxLayout(self.frame)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_4 = QLabel(self.frame)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout.addWidget(self.label_4)
+
+        self.rangeMin = QLabel(self.frame)
+        self.rangeMin.setObjectName(u"rangeMin")
+        font = QFont()
+        font.setBold(True)
+        self.rangeMin.setFont(font)
+
+        self.horizontalLayout.addWidget(self.rangeMin)
+
+        self.label_6 = QLabel(self.frame)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout.addWidget(self.label_6)
+
+        self.rangeMax = QLabel(self.frame)
+        self.rangeMax.setObjectName(u"rangeMax")
+        self.rangeMax.setFont(font)
+
+        self.horizontalLayout.addWidget(self.rangeMax)
+
+        self.horizontalLayout.setStretch(1, 1)
+        self.horizontalLayout.setStretch(3, 1)
+
+        self.verticalLayout_2.addWidget(self.frame)
+
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(9, 9, 9, 9)
+        self.widget_6 = QWidget(self.groupBox_2)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_8 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.startTime = QLabel(self.widget_6)
+        self.startTime.setObjectName(u"startTime")
+
+        self.horizontalLayout_8.addWidget(self.startTime)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_3)
+
+        self.currentTime = QLabel(self.widget_6)
+        self.currentTime.setObjectName(u"currentTime")
+        self.currentTime.setMinimumSize(QSize(53, 0))
+        self.currentTime.setFrameShape(QFrame.Panel)
+        self.currentTime.setAlignment(Qt.AlignCenter)
+
+        self.horizontalLayout_8.addWidget(self.currentTime)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_4)
+
+        self.lastTime = QLabel(self.widget_6)
+        self.lastTime.setObjectName(u"lastTime")
+
+        self.horizontalLayout_8.addWidget(self.lastTime)
+
+
+        self.verticalLayout_5.addWidget(self.widget_6)
+
+        self.slider = QSlider(self.groupBox_2)
+        self.slider.setObjectName(u"slider")
+        self.slider.setOrientation(Qt.Horizontal)
+
+        self.verticalLayout_5.addWidget(self.slider)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_2)
+
+        self.widget_3 = QWidget(self.groupBox)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer = QSpacerItem(180, 4, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+        self.computeRange = QPushButton(self.widget_3)
+        self.computeRange.setObjectName(u"computeRange")
+
+        self.horizontalLayout_2.addWidget(self.computeRange)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.widget_4 = QWidget(IsoSurfaceDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.verticalLayout_6 = QVBoxLayout(self.widget_4)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label_5 = QLabel(self.widget_4)
+        self.label_5.setObjectName(u"label_5")
+
+        self.verticalLayout_6.addWidget(self.label_5)
+
+        self.isoValues = QLineEdit(self.widget_4)
+        self.isoValues.setObjectName(u"isoValues")
+
+        self.verticalLayout_6.addWidget(self.isoValues)
+
+
+        self.verticalLayout.addWidget(self.widget_4)
+
+        self.label_7 = QLabel(IsoSurfaceDialog)
+        self.label_7.setObjectName(u"label_7")
+        self.label_7.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.verticalLayout.addWidget(self.label_7)
+
+        self.widget_5 = QWidget(IsoSurfaceDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.gridLayout = QGridLayout(self.widget_5)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_8 = QLabel(self.widget_5)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout.addWidget(self.label_8, 0, 0, 1, 1)
+
+        self.label_9 = QLabel(self.widget_5)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout.addWidget(self.label_9, 0, 1, 1, 1)
+
+        self.spacing = QLineEdit(self.widget_5)
+        self.spacing.setObjectName(u"spacing")
+
+        self.gridLayout.addWidget(self.spacing, 1, 1, 1, 1)
+
+        self.surfacesPerValue = QSpinBox(self.widget_5)
+        self.surfacesPerValue.setObjectName(u"surfacesPerValue")
+        self.surfacesPerValue.setMinimum(1)
+        self.surfacesPerValue.setMaximum(9999)
+
+        self.gridLayout.addWidget(self.surfacesPerValue, 1, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(IsoSurfaceDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(IsoSurfaceDialog)
+
+        QMetaObject.connectSlotsByName(IsoSurfaceDialog)
+    # setupUi
+
+    def retranslateUi(self, IsoSurfaceDialog):
+        IsoSurfaceDialog.setWindowTitle(QCoreApplication.translate("IsoSurfaceDialog", u"Form", None))
+        self.label.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Scaffold Name", None))
+        self.label_2.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Surface of Constant", None))
+        self.groupBox.setTitle(QCoreApplication.translate("IsoSurfaceDialog", u"Range", None))
+        self.label_4.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Min", None))
+        self.rangeMin.setText(QCoreApplication.translate("IsoSurfaceDialog", u"0", None))
+        self.label_6.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Max", None))
+        self.rangeMax.setText(QCoreApplication.translate("IsoSurfaceDialog", u"0", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("IsoSurfaceDialog", u"Time", None))
+        self.startTime.setText(QCoreApplication.translate("IsoSurfaceDialog", u"0", None))
+        self.currentTime.setText(QCoreApplication.translate("IsoSurfaceDialog", u"0", None))
+        self.lastTime.setText(QCoreApplication.translate("IsoSurfaceDialog", u"0", None))
+        self.computeRange.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Compute Range", None))
+        self.label_5.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Iso-Values", None))
+        self.label_7.setText(QCoreApplication.translate("IsoSurfaceDialog", u"(\"space\"-separated multiple values)", None))
+        self.label_8.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Surfaces per Value", None))
+        self.label_9.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Spacing", None))
+        self.ok.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("IsoSurfaceDialog", u"Cancel", None))
+    # retranslateUi
+
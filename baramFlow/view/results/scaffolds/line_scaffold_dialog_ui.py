@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'line_scaffold_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_LineScaffoldDialog(object):
+    def setupUi(self, LineScaffoldDialog):
+        if not LineScaffoldDialog.objectName():
+            LineScaffoldDialog.setObjectName(u"LineScaffoldDialog")
+        LineScaffoldDialog.resize(198, 420)
+        self.verticalLayout = QVBoxLayout(LineScaffoldDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(LineScaffoldDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.verticalLayout_3.addWidget(self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(LineScaffoldDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_2 = QGridLayout(self.groupBox)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_11 = QLabel(self.groupBox)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_2.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.point1X = QLineEdit(self.groupBox)
+        self.point1X.setObjectName(u"point1X")
+
+        self.gridLayout_2.addWidget(self.point1X, 0, 1, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_2.addWidget(self.label_10, 0, 0, 1, 1)
+
+        self.point1Y = QLineEdit(self.groupBox)
+        self.point1Y.setObjectName(u"point1Y")
+
+        self.gridLayout_2.addWidget(self.point1Y, 1, 1, 1, 1)
+
+        self.point1Z = QLineEdit(self.groupBox)
+        self.point1Z.setObjectName(u"point1Z")
+
+        self.gridLayout_2.addWidget(self.point1Z, 2, 1, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_2.addWidget(self.label_12, 2, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(LineScaffoldDialog)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout = QGridLayout(self.groupBox_2)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 1, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 0, 1, 1)
+
+        self.point2X = QLineEdit(self.groupBox_2)
+        self.point2X.setObjectName(u"point2X")
+
+        self.gridLayout.addWidget(self.point2X, 0, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.point2Y = QLineEdit(self.groupBox_2)
+        self.point2Y.setObjectName(u"point2Y")
+
+        self.gridLayout.addWidget(self.point2Y, 1, 1, 1, 1)
+
+        self.point2Z = QLineEdit(self.groupBox_2)
+        self.point2Z.setObjectName(u"point2Z")
+
+        self.gridLayout.addWidget(self.point2Z, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(LineScaffoldDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_4 = QGridLayout(self.groupBox_3)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.label_7 = QLabel(self.groupBox_3)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_4.addWidget(self.label_7, 0, 0, 1, 1)
+
+        self.numberOfSamples = QLineEdit(self.groupBox_3)
+        self.numberOfSamples.setObjectName(u"numberOfSamples")
+
+        self.gridLayout_4.addWidget(self.numberOfSamples, 0, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_3)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(LineScaffoldDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(LineScaffoldDialog)
+
+        QMetaObject.connectSlotsByName(LineScaffoldDialog)
+    # setupUi
+
+    def retranslateUi(self, LineScaffoldDialog):
+        LineScaffoldDialog.setWindowTitle(QCoreApplication.translate("LineScaffoldDialog", u"Form", None))
+        self.label.setText(QCoreApplication.translate("LineScaffoldDialog", u"Scaffold Name", None))
+        self.groupBox.setTitle(QCoreApplication.translate("LineScaffoldDialog", u"Point1", None))
+        self.label_11.setText(QCoreApplication.translate("LineScaffoldDialog", u"Y", None))
+        self.label_10.setText(QCoreApplication.translate("LineScaffoldDialog", u"X", None))
+        self.label_12.setText(QCoreApplication.translate("LineScaffoldDialog", u"Z", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("LineScaffoldDialog", u"Point2", None))
+        self.label_3.setText(QCoreApplication.translate("LineScaffoldDialog", u"Y", None))
+        self.label_2.setText(QCoreApplication.translate("LineScaffoldDialog", u"X", None))
+        self.label_4.setText(QCoreApplication.translate("LineScaffoldDialog", u"Z", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("LineScaffoldDialog", u"Number of Sampling Points", None))
+        self.label_7.setText(QCoreApplication.translate("LineScaffoldDialog", u"Samples", None))
+        self.ok.setText(QCoreApplication.translate("LineScaffoldDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("LineScaffoldDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'parallelogram_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_ParallelogramDialog(object):
+    def setupUi(self, ParallelogramDialog):
+        if not ParallelogramDialog.objectName():
+            ParallelogramDialog.setObjectName(u"ParallelogramDialog")
+        ParallelogramDialog.resize(198, 568)
+        self.verticalLayout = QVBoxLayout(ParallelogramDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ParallelogramDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.verticalLayout_3.addWidget(self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox_4 = QGroupBox(ParallelogramDialog)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_3 = QGridLayout(self.groupBox_4)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.label_13 = QLabel(self.groupBox_4)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_3.addWidget(self.label_13, 1, 0, 1, 1)
+
+        self.originX = QLineEdit(self.groupBox_4)
+        self.originX.setObjectName(u"originX")
+
+        self.gridLayout_3.addWidget(self.originX, 0, 1, 1, 1)
+
+        self.label_14 = QLabel(self.groupBox_4)
+        self.label_14.setObjectName(u"label_14")
+
+        self.gridLayout_3.addWidget(self.label_14, 0, 0, 1, 1)
+
+        self.originY = QLineEdit(self.groupBox_4)
+        self.originY.setObjectName(u"originY")
+
+        self.gridLayout_3.addWidget(self.originY, 1, 1, 1, 1)
+
+        self.originZ = QLineEdit(self.groupBox_4)
+        self.originZ.setObjectName(u"originZ")
+
+        self.gridLayout_3.addWidget(self.originZ, 2, 1, 1, 1)
+
+        self.label_15 = QLabel(self.groupBox_4)
+        self.label_15.setObjectName(u"label_15")
+
+        self.gridLayout_3.addWidget(self.label_15, 2, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_4)
+
+        self.groupBox = QGroupBox(ParallelogramDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_2 = QGridLayout(self.groupBox)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_11 = QLabel(self.groupBox)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_2.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.point1X = QLineEdit(self.groupBox)
+        self.point1X.setObjectName(u"point1X")
+
+        self.gridLayout_2.addWidget(self.point1X, 0, 1, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_2.addWidget(self.label_10, 0, 0, 1, 1)
+
+        self.point1Y = QLineEdit(self.groupBox)
+        self.point1Y.setObjectName(u"point1Y")
+
+        self.gridLayout_2.addWidget(self.point1Y, 1, 1, 1, 1)
+
+        self.point1Z = QLineEdit(self.groupBox)
+        self.point1Z.setObjectName(u"point1Z")
+
+        self.gridLayout_2.addWidget(self.point1Z, 2, 1, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_2.addWidget(self.label_12, 2, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(ParallelogramDialog)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout = QGridLayout(self.groupBox_2)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 1, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 0, 1, 1)
+
+        self.point2X = QLineEdit(self.groupBox_2)
+        self.point2X.setObjectName(u"point2X")
+
+        self.gridLayout.addWidget(self.point2X, 0, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.point2Y = QLineEdit(self.groupBox_2)
+        self.point2Y.setObjectName(u"point2Y")
+
+        self.gridLayout.addWidget(self.point2Y, 1, 1, 1, 1)
+
+        self.point2Z = QLineEdit(self.groupBox_2)
+        self.point2Z.setObjectName(u"point2Z")
+
+        self.gridLayout.addWidget(self.point2Z, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(ParallelogramDialog)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_4 = QGridLayout(self.groupBox_3)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.point1Samples = QLineEdit(self.groupBox_3)
+        self.point1Samples.setObjectName(u"point1Samples")
+
+        self.gridLayout_4.addWidget(self.point1Samples, 0, 1, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_3)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_4.addWidget(self.label_7, 0, 0, 1, 1)
+
+        self.label_5 = QLabel(self.groupBox_3)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_4.addWidget(self.label_5, 1, 0, 1, 1)
+
+        self.point2Samples = QLineEdit(self.groupBox_3)
+        self.point2Samples.setObjectName(u"point2Samples")
+
+        self.gridLayout_4.addWidget(self.point2Samples, 1, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_3)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(ParallelogramDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(ParallelogramDialog)
+
+        QMetaObject.connectSlotsByName(ParallelogramDialog)
+    # setupUi
+
+    def retranslateUi(self, ParallelogramDialog):
+        ParallelogramDialog.setWindowTitle(QCoreApplication.translate("ParallelogramDialog", u"Form", None))
+        self.label.setText(QCoreApplication.translate("ParallelogramDialog", u"Scaffold Name", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("ParallelogramDialog", u"Origin", None))
+        self.label_13.setText(QCoreApplication.translate("ParallelogramDialog", u"Y", None))
+        self.label_14.setText(QCoreApplication.translate("ParallelogramDialog", u"X", None))
+        self.label_15.setText(QCoreApplication.translate("ParallelogramDialog", u"Z", None))
+        self.groupBox.setTitle(QCoreApplication.translate("ParallelogramDialog", u"Point1", None))
+        self.label_11.setText(QCoreApplication.translate("ParallelogramDialog", u"Y", None))
+        self.label_10.setText(QCoreApplication.translate("ParallelogramDialog", u"X", None))
+        self.label_12.setText(QCoreApplication.translate("ParallelogramDialog", u"Z", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("ParallelogramDialog", u"Point2", None))
+        self.label_3.setText(QCoreApplication.translate("ParallelogramDialog", u"Y", None))
+        self.label_2.setText(QCoreApplication.translate("ParallelogramDialog", u"X", None))
+        self.label_4.setText(QCoreApplication.translate("ParallelogramDialog", u"Z", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("ParallelogramDialog", u"Number of Sampling Points", None))
+        self.label_7.setText(QCoreApplication.translate("ParallelogramDialog", u"To Point1", None))
+        self.label_5.setText(QCoreApplication.translate("ParallelogramDialog", u"To Point2", None))
+        self.ok.setText(QCoreApplication.translate("ParallelogramDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("ParallelogramDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'plane_scaffold_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_PlaneScaffoldDialog(object):
+    def setupUi(self, PlaneScaffoldDialog):
+        if not PlaneScaffoldDialog.objectName():
+            PlaneScaffoldDialog.setObjectName(u"PlaneScaffoldDialog")
+        PlaneScaffoldDialog.resize(198, 349)
+        self.verticalLayout = QVBoxLayout(PlaneScaffoldDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(PlaneScaffoldDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.verticalLayout_3.addWidget(self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(PlaneScaffoldDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout_2 = QGridLayout(self.groupBox)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_11 = QLabel(self.groupBox)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_2.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.originX = QLineEdit(self.groupBox)
+        self.originX.setObjectName(u"originX")
+
+        self.gridLayout_2.addWidget(self.originX, 0, 1, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_2.addWidget(self.label_10, 0, 0, 1, 1)
+
+        self.originY = QLineEdit(self.groupBox)
+        self.originY.setObjectName(u"originY")
+
+        self.gridLayout_2.addWidget(self.originY, 1, 1, 1, 1)
+
+        self.originZ = QLineEdit(self.groupBox)
+        self.originZ.setObjectName(u"originZ")
+
+        self.gridLayout_2.addWidget(self.originZ, 2, 1, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_2.addWidget(self.label_12, 2, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(PlaneScaffoldDialog)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout = QGridLayout(self.groupBox_2)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 1, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 0, 1, 1)
+
+        self.normalX = QLineEdit(self.groupBox_2)
+        self.normalX.setObjectName(u"normalX")
+
+        self.gridLayout.addWidget(self.normalX, 0, 1, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.normalY = QLineEdit(self.groupBox_2)
+        self.normalY.setObjectName(u"normalY")
+
+        self.gridLayout.addWidget(self.normalY, 1, 1, 1, 1)
+
+        self.normalZ = QLineEdit(self.groupBox_2)
+        self.normalZ.setObjectName(u"normalZ")
+
+        self.gridLayout.addWidget(self.normalZ, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_12 = QWidget(PlaneScaffoldDialog)
+        self.widget_12.setObjectName(u"widget_12")
+        self.horizontalLayout_9 = QHBoxLayout(self.widget_12)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_7)
+
+        self.ok = QPushButton(self.widget_12)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_9.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_12)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_9.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_12)
+
+
+        self.retranslateUi(PlaneScaffoldDialog)
+
+        QMetaObject.connectSlotsByName(PlaneScaffoldDialog)
+    # setupUi
+
+    def retranslateUi(self, PlaneScaffoldDialog):
+        PlaneScaffoldDialog.setWindowTitle(QCoreApplication.translate("PlaneScaffoldDialog", u"Form", None))
+        self.label.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Scaffold Name", None))
+        self.groupBox.setTitle(QCoreApplication.translate("PlaneScaffoldDialog", u"Origin", None))
+        self.label_11.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Y", None))
+        self.label_10.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"X", None))
+        self.label_12.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Z", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("PlaneScaffoldDialog", u"Normal", None))
+        self.label_3.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Y", None))
+        self.label_2.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"X", None))
+        self.label_4.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Z", None))
+        self.ok.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Update", None))
+        self.cancel.setText(QCoreApplication.translate("PlaneScaffoldDialog", u"Cancel", None))
+    # retranslateUi
+
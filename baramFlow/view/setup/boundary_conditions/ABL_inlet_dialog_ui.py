@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'ABL_inlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_ABLInletDialog(object):
+    def setupUi(self, ABLInletDialog):
+        if not ABLInletDialog.objectName():
+            ABLInletDialog.setObjectName(u"ABLInletDialog")
+        ABLInletDialog.resize(339, 662)
+        self.verticalLayout_2 = QVBoxLayout(ABLInletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(ABLInletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget_2 = QWidget(self.groupBox)
+        self.widget_2.setObjectName(u"widget_2")
+        self.formLayout = QFormLayout(self.widget_2)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_11 = QLabel(self.widget_2)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_11)
+
+        self.flowDirectionSpecMethod = PythonComboBox(self.widget_2)
+        self.flowDirectionSpecMethod.setObjectName(u"flowDirectionSpecMethod")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.flowDirectionSpecMethod)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+        self.flowDirection = QWidget(self.groupBox)
+        self.flowDirection.setObjectName(u"flowDirection")
+        self.formLayout_5 = QFormLayout(self.flowDirection)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.flowDirection)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.flowDirectionXComponent = BatchableFloatEdit(self.flowDirection)
+        self.flowDirectionXComponent.setObjectName(u"flowDirectionXComponent")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.flowDirectionXComponent.sizePolicy().hasHeightForWidth())
+        self.flowDirectionXComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.flowDirectionXComponent)
+
+        self.label_2 = QLabel(self.flowDirection)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.flowDirectionYComponent = BatchableFloatEdit(self.flowDirection)
+        self.flowDirectionYComponent.setObjectName(u"flowDirectionYComponent")
+        sizePolicy.setHeightForWidth(self.flowDirectionYComponent.sizePolicy().hasHeightForWidth())
+        self.flowDirectionYComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.flowDirectionYComponent)
+
+        self.label_3 = QLabel(self.flowDirection)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_5.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.flowDirectionZComponent = BatchableFloatEdit(self.flowDirection)
+        self.flowDirectionZComponent.setObjectName(u"flowDirectionZComponent")
+        sizePolicy.setHeightForWidth(self.flowDirectionZComponent.sizePolicy().hasHeightForWidth())
+        self.flowDirectionZComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout_5.setWidget(2, QFormLayout.FieldRole, self.flowDirectionZComponent)
+
+
+        self.verticalLayout_3.addWidget(self.flowDirection)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(self.dialogContents)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_2 = QFormLayout(self.groupBox_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.groundNormalDirectionXComponent = BatchableFloatEdit(self.groupBox_2)
+        self.groundNormalDirectionXComponent.setObjectName(u"groundNormalDirectionXComponent")
+        sizePolicy.setHeightForWidth(self.groundNormalDirectionXComponent.sizePolicy().hasHeightForWidth())
+        self.groundNormalDirectionXComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.groundNormalDirectionXComponent)
+
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.groundNormalDirectionYComponent = BatchableFloatEdit(self.groupBox_2)
+        self.groundNormalDirectionYComponent.setObjectName(u"groundNormalDirectionYComponent")
+        sizePolicy.setHeightForWidth(self.groundNormalDirectionYComponent.sizePolicy().hasHeightForWidth())
+        self.groundNormalDirectionYComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.groundNormalDirectionYComponent)
+
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_6)
+
+        self.groundNormalDirectionZComponent = BatchableFloatEdit(self.groupBox_2)
+        self.groundNormalDirectionZComponent.setObjectName(u"groundNormalDirectionZComponent")
+        sizePolicy.setHeightForWidth(self.groundNormalDirectionZComponent.sizePolicy().hasHeightForWidth())
+        self.groundNormalDirectionZComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.groundNormalDirectionZComponent)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_3 = QFormLayout(self.widget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.referenceFlowSpeed = BatchableFloatEdit(self.widget)
+        self.referenceFlowSpeed.setObjectName(u"referenceFlowSpeed")
+        sizePolicy.setHeightForWidth(self.referenceFlowSpeed.sizePolicy().hasHeightForWidth())
+        self.referenceFlowSpeed.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.referenceFlowSpeed)
+
+        self.label_7 = QLabel(self.widget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.referenceHeight = BatchableFloatEdit(self.widget)
+        self.referenceHeight.setObjectName(u"referenceHeight")
+        sizePolicy.setHeightForWidth(self.referenceHeight.sizePolicy().hasHeightForWidth())
+        self.referenceHeight.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.referenceHeight)
+
+        self.label_8 = QLabel(self.widget)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.surfaceRoughnessLength = BatchableFloatEdit(self.widget)
+        self.surfaceRoughnessLength.setObjectName(u"surfaceRoughnessLength")
+        sizePolicy.setHeightForWidth(self.surfaceRoughnessLength.sizePolicy().hasHeightForWidth())
+        self.surfaceRoughnessLength.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.surfaceRoughnessLength)
+
+        self.label_10 = QLabel(self.widget)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_3.setWidget(3, QFormLayout.LabelRole, self.label_10)
+
+        self.minimumZCoordinate = BatchableFloatEdit(self.widget)
+        self.minimumZCoordinate.setObjectName(u"minimumZCoordinate")
+
+        self.formLayout_3.setWidget(3, QFormLayout.FieldRole, self.minimumZCoordinate)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.pasquillStability = QGroupBox(ABLInletDialog)
+        self.pasquillStability.setObjectName(u"pasquillStability")
+        self.pasquillStability.setCheckable(True)
+        self.pasquillStability.setChecked(False)
+        self.formLayout_4 = QFormLayout(self.pasquillStability)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_12 = QLabel(self.pasquillStability)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_12)
+
+        self.latitude = BatchableFloatEdit(self.pasquillStability)
+        self.latitude.setObjectName(u"latitude")
+        sizePolicy.setHeightForWidth(self.latitude.sizePolicy().hasHeightForWidth())
+        self.latitude.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.latitude)
+
+        self.label_13 = QLabel(self.pasquillStability)
+        self.label_13.setObjectName(u"label_13")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_13)
+
+        self.surfaceHeatFlux = BatchableFloatEdit(self.pasquillStability)
+        self.surfaceHeatFlux.setObjectName(u"surfaceHeatFlux")
+        sizePolicy.setHeightForWidth(self.surfaceHeatFlux.sizePolicy().hasHeightForWidth())
+        self.surfaceHeatFlux.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.surfaceHeatFlux)
+
+        self.label_14 = QLabel(self.pasquillStability)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_4.setWidget(3, QFormLayout.LabelRole, self.label_14)
+
+        self.referenceDensity = BatchableFloatEdit(self.pasquillStability)
+        self.referenceDensity.setObjectName(u"referenceDensity")
+        sizePolicy.setHeightForWidth(self.referenceDensity.sizePolicy().hasHeightForWidth())
+        self.referenceDensity.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(3, QFormLayout.FieldRole, self.referenceDensity)
+
+        self.label_15 = QLabel(self.pasquillStability)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.stabilityClass = PythonComboBox(self.pasquillStability)
+        self.stabilityClass.setObjectName(u"stabilityClass")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.stabilityClass)
+
+        self.label_16 = QLabel(self.pasquillStability)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_4.setWidget(4, QFormLayout.LabelRole, self.label_16)
+
+        self.label_17 = QLabel(self.pasquillStability)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_4.setWidget(5, QFormLayout.LabelRole, self.label_17)
+
+        self.referenceSpecificHeat = BatchableFloatEdit(self.pasquillStability)
+        self.referenceSpecificHeat.setObjectName(u"referenceSpecificHeat")
+        sizePolicy.setHeightForWidth(self.referenceSpecificHeat.sizePolicy().hasHeightForWidth())
+        self.referenceSpecificHeat.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(4, QFormLayout.FieldRole, self.referenceSpecificHeat)
+
+        self.referenceTemperature = BatchableFloatEdit(self.pasquillStability)
+        self.referenceTemperature.setObjectName(u"referenceTemperature")
+        sizePolicy.setHeightForWidth(self.referenceTemperature.sizePolicy().hasHeightForWidth())
+        self.referenceTemperature.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(5, QFormLayout.FieldRole, self.referenceTemperature)
+
+
+        self.verticalLayout_2.addWidget(self.pasquillStability)
+
+        self.widget_4 = QWidget(ABLInletDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.retranslateUi(ABLInletDialog)
+        self.cancel.clicked.connect(ABLInletDialog.reject)
+
+        QMetaObject.connectSlotsByName(ABLInletDialog)
+    # setupUi
+
+    def retranslateUi(self, ABLInletDialog):
+        ABLInletDialog.setWindowTitle(QCoreApplication.translate("ABLInletDialog", u"ABL Inlet Boundary Condition", None))
+        self.groupBox.setTitle(QCoreApplication.translate("ABLInletDialog", u"Flow Direction", None))
+        self.label_11.setText(QCoreApplication.translate("ABLInletDialog", u"Spec. Method", None))
+        self.label.setText(QCoreApplication.translate("ABLInletDialog", u"X-Component", None))
+        self.label_2.setText(QCoreApplication.translate("ABLInletDialog", u"Y-Component", None))
+        self.label_3.setText(QCoreApplication.translate("ABLInletDialog", u"Z-Component", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("ABLInletDialog", u"Ground-Normal Direction", None))
+        self.label_4.setText(QCoreApplication.translate("ABLInletDialog", u"X-Component", None))
+        self.label_5.setText(QCoreApplication.translate("ABLInletDialog", u"Y-Component", None))
+        self.label_6.setText(QCoreApplication.translate("ABLInletDialog", u"Z-Component", None))
+        self.label_9.setText(QCoreApplication.translate("ABLInletDialog", u"Reference Flow Speed, U<sub>ref</sub> (m/s)", None))
+        self.label_7.setText(QCoreApplication.translate("ABLInletDialog", u"Reference Height, Z<sub>ref</sub> (m)", None))
+        self.label_8.setText(QCoreApplication.translate("ABLInletDialog", u"Surface Roughness Length, z<sub>0</sub> (m)", None))
+        self.label_10.setText(QCoreApplication.translate("ABLInletDialog", u"Minimum z-coordinate (m)", None))
+        self.pasquillStability.setTitle(QCoreApplication.translate("ABLInletDialog", u"Pasquill Stability", None))
+        self.label_12.setText(QCoreApplication.translate("ABLInletDialog", u"Latitude (Degree)", None))
+        self.label_13.setText(QCoreApplication.translate("ABLInletDialog", u"Surface Heat Flux (W/m<sup>2</sup>)", None))
+        self.label_14.setText(QCoreApplication.translate("ABLInletDialog", u"Reference Density (kg/m<sup>3</sup>)", None))
+        self.label_15.setText(QCoreApplication.translate("ABLInletDialog", u"Stability Class", None))
+        self.label_16.setText(QCoreApplication.translate("ABLInletDialog", u"Reference Specific Heat (J/kg\u00b7K)", None))
+        self.label_17.setText(QCoreApplication.translate("ABLInletDialog", u"Reference Temperature (K)", None))
+        self.ok.setText(QCoreApplication.translate("ABLInletDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ABLInletDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'boundary_conditions_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QFrame, QHBoxLayout,
+    QHeaderView, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QTreeWidget, QTreeWidgetItem,
+    QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_BoundaryConditionsPage(object):
+    def setupUi(self, BoundaryConditionsPage):
+        if not BoundaryConditionsPage.objectName():
+            BoundaryConditionsPage.setObjectName(u"BoundaryConditionsPage")
+        BoundaryConditionsPage.resize(250, 500)
+        self.verticalLayout = QVBoxLayout(BoundaryConditionsPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.title = QLabel(BoundaryConditionsPage)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout.addWidget(self.title)
+
+        self.line = QFrame(BoundaryConditionsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.widget_2 = QWidget(BoundaryConditionsPage)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.filter = QLineEdit(self.widget_2)
+        self.filter.setObjectName(u"filter")
+
+        self.horizontalLayout_2.addWidget(self.filter)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.boundaries = QTreeWidget(BoundaryConditionsPage)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(1, u"2");
+        __qtreewidgetitem.setText(0, u"1");
+        self.boundaries.setHeaderItem(__qtreewidgetitem)
+        self.boundaries.setObjectName(u"boundaries")
+        self.boundaries.setStyleSheet(u"QTreeView::indicator:unchecked {image: url(:/icons/eye-off.svg);}\n"
+"QTreeView::indicator:checked {image: url(:/icons/eye.svg);}")
+        self.boundaries.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.boundaries.setAnimated(True)
+        self.boundaries.setHeaderHidden(True)
+        self.boundaries.setColumnCount(2)
+
+        self.verticalLayout.addWidget(self.boundaries)
+
+        self.widget = QWidget(BoundaryConditionsPage)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, -1)
+        self.copy = QPushButton(self.widget)
+        self.copy.setObjectName(u"copy")
+
+        self.horizontalLayout.addWidget(self.copy)
+
+        self.horizontalSpacer = QSpacerItem(130, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        self.edit.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.edit)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(BoundaryConditionsPage)
+
+        QMetaObject.connectSlotsByName(BoundaryConditionsPage)
+    # setupUi
+
+    def retranslateUi(self, BoundaryConditionsPage):
+        BoundaryConditionsPage.setWindowTitle(QCoreApplication.translate("BoundaryConditionsPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("BoundaryConditionsPage", u"Boundary Conditions", None))
+        self.filter.setPlaceholderText(QCoreApplication.translate("BoundaryConditionsPage", u"filter string is here", None))
+        self.copy.setText(QCoreApplication.translate("BoundaryConditionsPage", u"Copy", None))
+        self.edit.setText(QCoreApplication.translate("BoundaryConditionsPage", u"&Edit", None))
+    # retranslateUi
+
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'boundary_type_picker.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QHBoxLayout, QLabel,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from widgets.flat_push_button import FlatPushButton
+
+class Ui_BoundaryTypePicker(object):
+    def setupUi(self, BoundaryTypePicker):
+        if not BoundaryTypePicker.objectName():
+            BoundaryTypePicker.setObjectName(u"BoundaryTypePicker")
+        BoundaryTypePicker.resize(308, 499)
+        self.horizontalLayout = QHBoxLayout(BoundaryTypePicker)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.widget = QWidget(BoundaryTypePicker)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayout_3.addWidget(self.label)
+
+        self.widget_3 = QWidget(self.widget)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout = QVBoxLayout(self.widget_3)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, 0, -1, -1)
+        self.velocityInlet = FlatPushButton(self.widget_3)
+        self.buttonGroup = QButtonGroup(BoundaryTypePicker)
+        self.buttonGroup.setObjectName(u"buttonGroup")
+        self.buttonGroup.addButton(self.velocityInlet)
+        self.velocityInlet.setObjectName(u"velocityInlet")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.velocityInlet.sizePolicy().hasHeightForWidth())
+        self.velocityInlet.setSizePolicy(sizePolicy1)
+        self.velocityInlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.velocityInlet)
+
+        self.flowRateInlet = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.flowRateInlet)
+        self.flowRateInlet.setObjectName(u"flowRateInlet")
+        sizePolicy1.setHeightForWidth(self.flowRateInlet.sizePolicy().hasHeightForWidth())
+        self.flowRateInlet.setSizePolicy(sizePolicy1)
+        self.flowRateInlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.flowRateInlet)
+
+        self.pressureInlet = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.pressureInlet)
+        self.pressureInlet.setObjectName(u"pressureInlet")
+        sizePolicy1.setHeightForWidth(self.pressureInlet.sizePolicy().hasHeightForWidth())
+        self.pressureInlet.setSizePolicy(sizePolicy1)
+        self.pressureInlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.pressureInlet)
+
+        self.intakeFan = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.intakeFan)
+        self.intakeFan.setObjectName(u"intakeFan")
+        sizePolicy1.setHeightForWidth(self.intakeFan.sizePolicy().hasHeightForWidth())
+        self.intakeFan.setSizePolicy(sizePolicy1)
+        self.intakeFan.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.intakeFan)
+
+        self.ABLInlet = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.ABLInlet)
+        self.ABLInlet.setObjectName(u"ABLInlet")
+        sizePolicy1.setHeightForWidth(self.ABLInlet.sizePolicy().hasHeightForWidth())
+        self.ABLInlet.setSizePolicy(sizePolicy1)
+        self.ABLInlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.ABLInlet)
+
+        self.openChannelInlet = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.openChannelInlet)
+        self.openChannelInlet.setObjectName(u"openChannelInlet")
+        sizePolicy1.setHeightForWidth(self.openChannelInlet.sizePolicy().hasHeightForWidth())
+        self.openChannelInlet.setSizePolicy(sizePolicy1)
+        self.openChannelInlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.openChannelInlet)
+
+        self.freeStream = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.freeStream)
+        self.freeStream.setObjectName(u"freeStream")
+        sizePolicy1.setHeightForWidth(self.freeStream.sizePolicy().hasHeightForWidth())
+        self.freeStream.setSizePolicy(sizePolicy1)
+        self.freeStream.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.freeStream)
+
+        self.farFieldRiemann = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.farFieldRiemann)
+        self.farFieldRiemann.setObjectName(u"farFieldRiemann")
+        sizePolicy1.setHeightForWidth(self.farFieldRiemann.sizePolicy().hasHeightForWidth())
+        self.farFieldRiemann.setSizePolicy(sizePolicy1)
+        self.farFieldRiemann.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.farFieldRiemann)
+
+        self.subsonicInlet = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.subsonicInlet)
+        self.subsonicInlet.setObjectName(u"subsonicInlet")
+        sizePolicy1.setHeightForWidth(self.subsonicInlet.sizePolicy().hasHeightForWidth())
+        self.subsonicInlet.setSizePolicy(sizePolicy1)
+        self.subsonicInlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.subsonicInlet)
+
+        self.supersonicInflow = FlatPushButton(self.widget_3)
+        self.buttonGroup.addButton(self.supersonicInflow)
+        self.supersonicInflow.setObjectName(u"supersonicInflow")
+        sizePolicy1.setHeightForWidth(self.supersonicInflow.sizePolicy().hasHeightForWidth())
+        self.supersonicInflow.setSizePolicy(sizePolicy1)
+        self.supersonicInflow.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout.addWidget(self.supersonicInflow)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy)
+        self.label_2.setFont(font)
+
+        self.verticalLayout_3.addWidget(self.label_2)
+
+        self.widget_4 = QWidget(self.widget)
+        self.widget_4.setObjectName(u"widget_4")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_4)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(-1, 0, -1, 0)
+        self.flowRateOutlet = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.flowRateOutlet)
+        self.flowRateOutlet.setObjectName(u"flowRateOutlet")
+        sizePolicy1.setHeightForWidth(self.flowRateOutlet.sizePolicy().hasHeightForWidth())
+        self.flowRateOutlet.setSizePolicy(sizePolicy1)
+        self.flowRateOutlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.flowRateOutlet)
+
+        self.pressureOutlet = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.pressureOutlet)
+        self.pressureOutlet.setObjectName(u"pressureOutlet")
+        sizePolicy1.setHeightForWidth(self.pressureOutlet.sizePolicy().hasHeightForWidth())
+        self.pressureOutlet.setSizePolicy(sizePolicy1)
+        self.pressureOutlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.pressureOutlet)
+
+        self.exhaustFan = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.exhaustFan)
+        self.exhaustFan.setObjectName(u"exhaustFan")
+        sizePolicy1.setHeightForWidth(self.exhaustFan.sizePolicy().hasHeightForWidth())
+        self.exhaustFan.setSizePolicy(sizePolicy1)
+        self.exhaustFan.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.exhaustFan)
+
+        self.openChannelOutlet = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.openChannelOutlet)
+        self.openChannelOutlet.setObjectName(u"openChannelOutlet")
+        sizePolicy1.setHeightForWidth(self.openChannelOutlet.sizePolicy().hasHeightForWidth())
+        self.openChannelOutlet.setSizePolicy(sizePolicy1)
+        self.openChannelOutlet.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.openChannelOutlet)
+
+        self.outflow = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.outflow)
+        self.outflow.setObjectName(u"outflow")
+        sizePolicy1.setHeightForWidth(self.outflow.sizePolicy().hasHeightForWidth())
+        self.outflow.setSizePolicy(sizePolicy1)
+        self.outflow.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.outflow)
+
+        self.subsonicOutflow = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.subsonicOutflow)
+        self.subsonicOutflow.setObjectName(u"subsonicOutflow")
+        sizePolicy1.setHeightForWidth(self.subsonicOutflow.sizePolicy().hasHeightForWidth())
+        self.subsonicOutflow.setSizePolicy(sizePolicy1)
+        self.subsonicOutflow.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.subsonicOutflow)
+
+        self.supersonicOutflow = FlatPushButton(self.widget_4)
+        self.buttonGroup.addButton(self.supersonicOutflow)
+        self.supersonicOutflow.setObjectName(u"supersonicOutflow")
+        sizePolicy1.setHeightForWidth(self.supersonicOutflow.sizePolicy().hasHeightForWidth())
+        self.supersonicOutflow.setSizePolicy(sizePolicy1)
+        self.supersonicOutflow.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_2.addWidget(self.supersonicOutflow)
+
+
+        self.verticalLayout_3.addWidget(self.widget_4)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(BoundaryTypePicker)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_6 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label_4 = QLabel(self.widget_2)
+        self.label_4.setObjectName(u"label_4")
+        sizePolicy.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy)
+        self.label_4.setFont(font)
+
+        self.verticalLayout_6.addWidget(self.label_4)
+
+        self.widget_5 = QWidget(self.widget_2)
+        self.widget_5.setObjectName(u"widget_5")
+        self.verticalLayout_5 = QVBoxLayout(self.widget_5)
+        self.verticalLayout_5.setSpacing(0)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(-1, 0, -1, -1)
+        self.wall = FlatPushButton(self.widget_5)
+        self.buttonGroup.addButton(self.wall)
+        self.wall.setObjectName(u"wall")
+        sizePolicy1.setHeightForWidth(self.wall.sizePolicy().hasHeightForWidth())
+        self.wall.setSizePolicy(sizePolicy1)
+        self.wall.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_5.addWidget(self.wall)
+
+        self.thermoCoupledWall = FlatPushButton(self.widget_5)
+        self.buttonGroup.addButton(self.thermoCoupledWall)
+        self.thermoCoupledWall.setObjectName(u"thermoCoupledWall")
+        sizePolicy1.setHeightForWidth(self.thermoCoupledWall.sizePolicy().hasHeightForWidth())
+        self.thermoCoupledWall.setSizePolicy(sizePolicy1)
+        self.thermoCoupledWall.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_5.addWidget(self.thermoCoupledWall)
+
+
+        self.verticalLayout_6.addWidget(self.widget_5)
+
+        self.label_5 = QLabel(self.widget_2)
+        self.label_5.setObjectName(u"label_5")
+        sizePolicy.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy)
+        self.label_5.setFont(font)
+
+        self.verticalLayout_6.addWidget(self.label_5)
+
+        self.widget_6 = QWidget(self.widget_2)
+        self.widget_6.setObjectName(u"widget_6")
+        self.verticalLayout_4 = QVBoxLayout(self.widget_6)
+        self.verticalLayout_4.setSpacing(0)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(-1, 0, -1, 0)
+        self.symmetry = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.symmetry)
+        self.symmetry.setObjectName(u"symmetry")
+        sizePolicy1.setHeightForWidth(self.symmetry.sizePolicy().hasHeightForWidth())
+        self.symmetry.setSizePolicy(sizePolicy1)
+        self.symmetry.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.symmetry)
+
+        self.interface_ = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.interface_)
+        self.interface_.setObjectName(u"interface_")
+        sizePolicy1.setHeightForWidth(self.interface_.sizePolicy().hasHeightForWidth())
+        self.interface_.setSizePolicy(sizePolicy1)
+        self.interface_.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.interface_)
+
+        self.empty = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.empty)
+        self.empty.setObjectName(u"empty")
+        sizePolicy1.setHeightForWidth(self.empty.sizePolicy().hasHeightForWidth())
+        self.empty.setSizePolicy(sizePolicy1)
+        self.empty.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.empty)
+
+        self.cyclic = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.cyclic)
+        self.cyclic.setObjectName(u"cyclic")
+        sizePolicy1.setHeightForWidth(self.cyclic.sizePolicy().hasHeightForWidth())
+        self.cyclic.setSizePolicy(sizePolicy1)
+        self.cyclic.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.cyclic)
+
+        self.wedge = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.wedge)
+        self.wedge.setObjectName(u"wedge")
+        sizePolicy1.setHeightForWidth(self.wedge.sizePolicy().hasHeightForWidth())
+        self.wedge.setSizePolicy(sizePolicy1)
+        self.wedge.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.wedge)
+
+        self.porousJump = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.porousJump)
+        self.porousJump.setObjectName(u"porousJump")
+        sizePolicy1.setHeightForWidth(self.porousJump.sizePolicy().hasHeightForWidth())
+        self.porousJump.setSizePolicy(sizePolicy1)
+        self.porousJump.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.porousJump)
+
+        self.FAN = FlatPushButton(self.widget_6)
+        self.buttonGroup.addButton(self.FAN)
+        self.FAN.setObjectName(u"FAN")
+        sizePolicy1.setHeightForWidth(self.FAN.sizePolicy().hasHeightForWidth())
+        self.FAN.setSizePolicy(sizePolicy1)
+        self.FAN.setStyleSheet(u"text-align:left")
+
+        self.verticalLayout_4.addWidget(self.FAN)
+
+
+        self.verticalLayout_6.addWidget(self.widget_6)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.verticalLayout_6.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(BoundaryTypePicker)
+
+        QMetaObject.connectSlotsByName(BoundaryTypePicker)
+    # setupUi
+
+    def retranslateUi(self, BoundaryTypePicker):
+        BoundaryTypePicker.setWindowTitle(QCoreApplication.translate("BoundaryTypePicker", u"Form", None))
+        self.label.setText(QCoreApplication.translate("BoundaryTypePicker", u"Inlet", None))
+        self.velocityInlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Velocity Inlet", None))
+        self.flowRateInlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Flow Rate Inlet", None))
+        self.pressureInlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Pressure Inlet", None))
+        self.intakeFan.setText(QCoreApplication.translate("BoundaryTypePicker", u"Intake Fan", None))
+        self.ABLInlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"ABL Inlet", None))
+        self.openChannelInlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Open Channel Inlet", None))
+        self.freeStream.setText(QCoreApplication.translate("BoundaryTypePicker", u"Free Stream", None))
+        self.farFieldRiemann.setText(QCoreApplication.translate("BoundaryTypePicker", u"Far-field Riemann", None))
+        self.subsonicInlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Subsonic Inlet", None))
+        self.supersonicInflow.setText(QCoreApplication.translate("BoundaryTypePicker", u"Supersonic Inflow", None))
+        self.label_2.setText(QCoreApplication.translate("BoundaryTypePicker", u"Outlet", None))
+        self.flowRateOutlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Flow Rate Outlet", None))
+        self.pressureOutlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Pressure Outlet", None))
+        self.exhaustFan.setText(QCoreApplication.translate("BoundaryTypePicker", u"Exhaust Fan", None))
+        self.openChannelOutlet.setText(QCoreApplication.translate("BoundaryTypePicker", u"Open Channel Outlet", None))
+        self.outflow.setText(QCoreApplication.translate("BoundaryTypePicker", u"Outflow", None))
+        self.subsonicOutflow.setText(QCoreApplication.translate("BoundaryTypePicker", u"Subsonic Outflow", None))
+        self.supersonicOutflow.setText(QCoreApplication.translate("BoundaryTypePicker", u"Supersonic Outflow", None))
+        self.label_4.setText(QCoreApplication.translate("BoundaryTypePicker", u"Wall", None))
+        self.wall.setText(QCoreApplication.translate("BoundaryTypePicker", u"Wall", None))
+        self.thermoCoupledWall.setText(QCoreApplication.translate("BoundaryTypePicker", u"Thermo-Coupled Wall", None))
+        self.label_5.setText(QCoreApplication.translate("BoundaryTypePicker", u"Misc.", None))
+        self.symmetry.setText(QCoreApplication.translate("BoundaryTypePicker", u"Symmetry", None))
+        self.interface_.setText(QCoreApplication.translate("BoundaryTypePicker", u"Interface", None))
+        self.empty.setText(QCoreApplication.translate("BoundaryTypePicker", u"Empty", None))
+        self.cyclic.setText(QCoreApplication.translate("BoundaryTypePicker", u"Cyclic", None))
+        self.wedge.setText(QCoreApplication.translate("BoundaryTypePicker", u"Wedge", None))
+        self.porousJump.setText(QCoreApplication.translate("BoundaryTypePicker", u"Porous Jump", None))
+        self.FAN.setText(QCoreApplication.translate("BoundaryTypePicker", u"FAN", None))
+    # retranslateUi
+
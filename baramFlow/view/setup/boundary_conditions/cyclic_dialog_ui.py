@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'cyclic_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_CyclicDialog(object):
+    def setupUi(self, CyclicDialog):
+        if not CyclicDialog.objectName():
+            CyclicDialog.setObjectName(u"CyclicDialog")
+        CyclicDialog.resize(400, 90)
+        CyclicDialog.setMinimumSize(QSize(400, 0))
+        self.verticalLayout_2 = QVBoxLayout(CyclicDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(CyclicDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.horizontalLayout = QHBoxLayout(self.dialogContents)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, -1)
+        self.label_2 = QLabel(self.dialogContents)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout.addWidget(self.label_2)
+
+        self.coupledBoundary = QLineEdit(self.dialogContents)
+        self.coupledBoundary.setObjectName(u"coupledBoundary")
+        self.coupledBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.coupledBoundary)
+
+        self.select = QPushButton(self.dialogContents)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(CyclicDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(CyclicDialog)
+        self.buttonBox.accepted.connect(CyclicDialog.accept)
+        self.buttonBox.rejected.connect(CyclicDialog.reject)
+
+        QMetaObject.connectSlotsByName(CyclicDialog)
+    # setupUi
+
+    def retranslateUi(self, CyclicDialog):
+        CyclicDialog.setWindowTitle(QCoreApplication.translate("CyclicDialog", u"Cyclic Boundary Condition", None))
+        self.label_2.setText(QCoreApplication.translate("CyclicDialog", u"Coupled Boundary", None))
+        self.select.setText(QCoreApplication.translate("CyclicDialog", u"Select", None))
+    # retranslateUi
+
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'exhaust_fan_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QGroupBox, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_ExhaustFanDialog(object):
+    def setupUi(self, ExhaustFanDialog):
+        if not ExhaustFanDialog.objectName():
+            ExhaustFanDialog.setObjectName(u"ExhaustFanDialog")
+        ExhaustFanDialog.resize(265, 166)
+        self.verticalLayout = QVBoxLayout(ExhaustFanDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(ExhaustFanDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_4 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.pressure = QGroupBox(self.dialogContents)
+        self.pressure.setObjectName(u"pressure")
+        self.verticalLayout_3 = QVBoxLayout(self.pressure)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.widget_3 = QWidget(self.pressure)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label = QLabel(self.widget_3)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_4.addWidget(self.label)
+
+        self.totalPressure = BatchableFloatEdit(self.widget_3)
+        self.totalPressure.setObjectName(u"totalPressure")
+
+        self.horizontalLayout_4.addWidget(self.totalPressure)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+        self.widget = QWidget(self.pressure)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout.addWidget(self.label_2)
+
+        self.editFanCurve = QPushButton(self.widget)
+        self.editFanCurve.setObjectName(u"editFanCurve")
+
+        self.horizontalLayout.addWidget(self.editFanCurve)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+
+        self.verticalLayout_4.addWidget(self.pressure)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(ExhaustFanDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_5.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_5.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_4)
+
+
+        self.retranslateUi(ExhaustFanDialog)
+
+        QMetaObject.connectSlotsByName(ExhaustFanDialog)
+    # setupUi
+
+    def retranslateUi(self, ExhaustFanDialog):
+        ExhaustFanDialog.setWindowTitle(QCoreApplication.translate("ExhaustFanDialog", u"Exhaust FAN Boundary Condition", None))
+        self.pressure.setTitle(QCoreApplication.translate("ExhaustFanDialog", u"Pressure", None))
+        self.label.setText(QCoreApplication.translate("ExhaustFanDialog", u"Total Pressure (Pa)", None))
+        self.label_2.setText(QCoreApplication.translate("ExhaustFanDialog", u"FAN Curve (PQ Curve) :", None))
+        self.editFanCurve.setText(QCoreApplication.translate("ExhaustFanDialog", u"Show/Edit", None))
+        self.ok.setText(QCoreApplication.translate("ExhaustFanDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ExhaustFanDialog", u"Cancel", None))
+    # retranslateUi
+
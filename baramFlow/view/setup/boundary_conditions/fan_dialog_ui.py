@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'fan_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_FanDialog(object):
+    def setupUi(self, FanDialog):
+        if not FanDialog.objectName():
+            FanDialog.setObjectName(u"FanDialog")
+        FanDialog.resize(400, 142)
+        FanDialog.setMinimumSize(QSize(400, 0))
+        self.verticalLayout_2 = QVBoxLayout(FanDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogConetns = QWidget(FanDialog)
+        self.dialogConetns.setObjectName(u"dialogConetns")
+        self.verticalLayout = QVBoxLayout(self.dialogConetns)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogConetns)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout.addWidget(self.label_2)
+
+        self.coupledBoundary = QLineEdit(self.widget)
+        self.coupledBoundary.setObjectName(u"coupledBoundary")
+        self.coupledBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.coupledBoundary)
+
+        self.coupledBoundarySelect = QPushButton(self.widget)
+        self.coupledBoundarySelect.setObjectName(u"coupledBoundarySelect")
+
+        self.horizontalLayout.addWidget(self.coupledBoundarySelect)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.editFanCurve = QPushButton(self.widget)
+        self.editFanCurve.setObjectName(u"editFanCurve")
+
+        self.horizontalLayout_2.addWidget(self.editFanCurve)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_2)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogConetns)
+
+        self.widget_4 = QWidget(FanDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_5.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_5.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.retranslateUi(FanDialog)
+
+        QMetaObject.connectSlotsByName(FanDialog)
+    # setupUi
+
+    def retranslateUi(self, FanDialog):
+        FanDialog.setWindowTitle(QCoreApplication.translate("FanDialog", u"Fan Boundary Condition", None))
+        self.label_2.setText(QCoreApplication.translate("FanDialog", u"Coupled Boundary", None))
+        self.coupledBoundarySelect.setText(QCoreApplication.translate("FanDialog", u"Select", None))
+        self.label.setText(QCoreApplication.translate("FanDialog", u"FAN Curve (PQ Curve) :", None))
+        self.editFanCurve.setText(QCoreApplication.translate("FanDialog", u"Show/Edit", None))
+        self.ok.setText(QCoreApplication.translate("FanDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("FanDialog", u"Cancel", None))
+    # retranslateUi
+
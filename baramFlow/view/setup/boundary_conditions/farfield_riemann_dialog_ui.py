@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'farfield_riemann_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGridLayout, QGroupBox, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_FarfieldRiemannDialog(object):
+    def setupUi(self, FarfieldRiemannDialog):
+        if not FarfieldRiemannDialog.objectName():
+            FarfieldRiemannDialog.setObjectName(u"FarfieldRiemannDialog")
+        FarfieldRiemannDialog.resize(420, 518)
+        FarfieldRiemannDialog.setMinimumSize(QSize(420, 0))
+        FarfieldRiemannDialog.setMaximumSize(QSize(420, 16777215))
+        self.verticalLayout_2 = QVBoxLayout(FarfieldRiemannDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(FarfieldRiemannDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_2 = QGroupBox(self.dialogContents)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget_2 = QWidget(self.groupBox_2)
+        self.widget_2.setObjectName(u"widget_2")
+        self.formLayout_2 = QFormLayout(self.widget_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label_4 = QLabel(self.widget_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.specificationMethod = PythonComboBox(self.widget_2)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+        self.directFlowDirection = QGroupBox(self.groupBox_2)
+        self.directFlowDirection.setObjectName(u"directFlowDirection")
+        self.verticalLayout_4 = QVBoxLayout(self.directFlowDirection)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_3 = QWidget(self.directFlowDirection)
+        self.widget_3.setObjectName(u"widget_3")
+        self.gridLayout = QGridLayout(self.widget_3)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(0, 0, 0, -1)
+        self.flowDirectionY = QLineEdit(self.widget_3)
+        self.flowDirectionY.setObjectName(u"flowDirectionY")
+
+        self.gridLayout.addWidget(self.flowDirectionY, 1, 2, 1, 1)
+
+        self.flowDirectionZ = QLineEdit(self.widget_3)
+        self.flowDirectionZ.setObjectName(u"flowDirectionZ")
+
+        self.gridLayout.addWidget(self.flowDirectionZ, 1, 3, 1, 1)
+
+        self.label_5 = QLabel(self.widget_3)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_5, 0, 3, 1, 1)
+
+        self.label_10 = QLabel(self.widget_3)
+        self.label_10.setObjectName(u"label_10")
+        self.label_10.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_10, 0, 2, 1, 1)
+
+        self.label_11 = QLabel(self.widget_3)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.flowDirectionX = QLineEdit(self.widget_3)
+        self.flowDirectionX.setObjectName(u"flowDirectionX")
+
+        self.gridLayout.addWidget(self.flowDirectionX, 1, 1, 1, 1)
+
+        self.label_6 = QLabel(self.widget_3)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_6, 0, 1, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.widget_3)
+
+
+        self.verticalLayout_3.addWidget(self.directFlowDirection)
+
+        self.anglesFlowDirection = QWidget(self.groupBox_2)
+        self.anglesFlowDirection.setObjectName(u"anglesFlowDirection")
+        self.verticalLayout_6 = QVBoxLayout(self.anglesFlowDirection)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, -1, 0, -1)
+        self.groupBox = QGroupBox(self.anglesFlowDirection)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_4 = QWidget(self.groupBox)
+        self.widget_4.setObjectName(u"widget_4")
+        self.gridLayout_2 = QGridLayout(self.widget_4)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.gridLayout_2.setContentsMargins(0, 0, 0, -1)
+        self.label_13 = QLabel(self.widget_4)
+        self.label_13.setObjectName(u"label_13")
+        self.label_13.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_13, 0, 3, 1, 1)
+
+        self.label_14 = QLabel(self.widget_4)
+        self.label_14.setObjectName(u"label_14")
+        self.label_14.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_14, 0, 1, 1, 1)
+
+        self.dragDirectionX = QLineEdit(self.widget_4)
+        self.dragDirectionX.setObjectName(u"dragDirectionX")
+
+        self.gridLayout_2.addWidget(self.dragDirectionX, 1, 1, 1, 1)
+
+        self.label_15 = QLabel(self.widget_4)
+        self.label_15.setObjectName(u"label_15")
+        self.label_15.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_2.addWidget(self.label_15, 0, 2, 1, 1)
+
+        self.dragDirectionZ = QLineEdit(self.widget_4)
+        self.dragDirectionZ.setObjectName(u"dragDirectionZ")
+
+        self.gridLayout_2.addWidget(self.dragDirectionZ, 1, 3, 1, 1)
+
+        self.dragDirectionY = QLineEdit(self.widget_4)
+        self.dragDirectionY.setObjectName(u"dragDirectionY")
+
+        self.gridLayout_2.addWidget(self.dragDirectionY, 1, 2, 1, 1)
+
+        self.label_16 = QLabel(self.widget_4)
+        self.label_16.setObjectName(u"label_16")
+
+        self.gridLayout_2.addWidget(self.label_16, 1, 0, 1, 1)
+
+        self.label_17 = QLabel(self.widget_4)
+        self.label_17.setObjectName(u"label_17")
+
+        self.gridLayout_2.addWidget(self.label_17, 2, 0, 1, 1)
+
+        self.liftDirectionX = QLineEdit(self.widget_4)
+        self.liftDirectionX.setObjectName(u"liftDirectionX")
+
+        self.gridLayout_2.addWidget(self.liftDirectionX, 2, 1, 1, 1)
+
+        self.liftDirectionY = QLineEdit(self.widget_4)
+        self.liftDirectionY.setObjectName(u"liftDirectionY")
+
+        self.gridLayout_2.addWidget(self.liftDirectionY, 2, 2, 1, 1)
+
+        self.liftDirectionZ = QLineEdit(self.widget_4)
+        self.liftDirectionZ.setObjectName(u"liftDirectionZ")
+
+        self.gridLayout_2.addWidget(self.liftDirectionZ, 2, 3, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.widget_4)
+
+
+        self.verticalLayout_6.addWidget(self.groupBox)
+
+        self.widget_5 = QWidget(self.anglesFlowDirection)
+        self.widget_5.setObjectName(u"widget_5")
+        self.formLayout_4 = QFormLayout(self.widget_5)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.formLayout_4.setContentsMargins(0, -1, 0, 0)
+        self.label_18 = QLabel(self.widget_5)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_18)
+
+        self.AoA = QLineEdit(self.widget_5)
+        self.AoA.setObjectName(u"AoA")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.AoA)
+
+        self.label_19 = QLabel(self.widget_5)
+        self.label_19.setObjectName(u"label_19")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_19)
+
+        self.AoS = QLineEdit(self.widget_5)
+        self.AoS.setObjectName(u"AoS")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.AoS)
+
+
+        self.verticalLayout_6.addWidget(self.widget_5)
+
+
+        self.verticalLayout_3.addWidget(self.anglesFlowDirection)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_3 = QFormLayout(self.widget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.machNumber = QLineEdit(self.widget)
+        self.machNumber.setObjectName(u"machNumber")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.machNumber)
+
+        self.label_7 = QLabel(self.widget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.staticPressure = QLineEdit(self.widget)
+        self.staticPressure.setObjectName(u"staticPressure")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.staticPressure)
+
+        self.label_8 = QLabel(self.widget)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.staticTemperature = QLineEdit(self.widget)
+        self.staticTemperature.setObjectName(u"staticTemperature")
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.staticTemperature)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(FarfieldRiemannDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+        QWidget.setTabOrder(self.specificationMethod, self.flowDirectionX)
+        QWidget.setTabOrder(self.flowDirectionX, self.flowDirectionY)
+        QWidget.setTabOrder(self.flowDirectionY, self.flowDirectionZ)
+        QWidget.setTabOrder(self.flowDirectionZ, self.dragDirectionX)
+        QWidget.setTabOrder(self.dragDirectionX, self.dragDirectionY)
+        QWidget.setTabOrder(self.dragDirectionY, self.dragDirectionZ)
+        QWidget.setTabOrder(self.dragDirectionZ, self.liftDirectionX)
+        QWidget.setTabOrder(self.liftDirectionX, self.liftDirectionY)
+        QWidget.setTabOrder(self.liftDirectionY, self.liftDirectionZ)
+        QWidget.setTabOrder(self.liftDirectionZ, self.AoA)
+        QWidget.setTabOrder(self.AoA, self.AoS)
+        QWidget.setTabOrder(self.AoS, self.machNumber)
+        QWidget.setTabOrder(self.machNumber, self.staticPressure)
+        QWidget.setTabOrder(self.staticPressure, self.staticTemperature)
+
+        self.retranslateUi(FarfieldRiemannDialog)
+        self.buttonBox.accepted.connect(FarfieldRiemannDialog.accept)
+        self.buttonBox.rejected.connect(FarfieldRiemannDialog.reject)
+
+        QMetaObject.connectSlotsByName(FarfieldRiemannDialog)
+    # setupUi
+
+    def retranslateUi(self, FarfieldRiemannDialog):
+        FarfieldRiemannDialog.setWindowTitle(QCoreApplication.translate("FarfieldRiemannDialog", u"Farfield Riemann Boundary Condition", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("FarfieldRiemannDialog", u"Flow Direction", None))
+        self.label_4.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Specification Method", None))
+        self.directFlowDirection.setTitle(QCoreApplication.translate("FarfieldRiemannDialog", u"Direction", None))
+        self.label_5.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Z", None))
+        self.label_10.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Y", None))
+        self.label_11.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Flow Direction", None))
+        self.label_6.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"X", None))
+        self.groupBox.setTitle(QCoreApplication.translate("FarfieldRiemannDialog", u"Direction at AOA=0, AOS=0", None))
+        self.label_13.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Z", None))
+        self.label_14.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"X", None))
+        self.label_15.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Y", None))
+        self.label_16.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Drag Direction", None))
+        self.label_17.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Lift Direction", None))
+        self.label_18.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Angle of Attack, AOA (degree)", None))
+        self.label_19.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Angle of Sideslip, AOS (degree)", None))
+        self.label_9.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Mach Number, M<sub>\u221e</sub>", None))
+        self.label_7.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Static (Gauge) Pressure, P<sub>\u221e</sub> (Pa)", None))
+        self.label_8.setText(QCoreApplication.translate("FarfieldRiemannDialog", u"Static Temperature, T<sub>\u221e</sub> (K)", None))
+    # retranslateUi
+
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'flow_rate_inlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_FlowRateInletDialog(object):
+    def setupUi(self, FlowRateInletDialog):
+        if not FlowRateInletDialog.objectName():
+            FlowRateInletDialog.setObjectName(u"FlowRateInletDialog")
+        FlowRateInletDialog.resize(420, 218)
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(FlowRateInletDialog.sizePolicy().hasHeightForWidth())
+        FlowRateInletDialog.setSizePolicy(sizePolicy)
+        FlowRateInletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(FlowRateInletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(FlowRateInletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        sizePolicy.setHeightForWidth(self.dialogContents.sizePolicy().hasHeightForWidth())
+        self.dialogContents.setSizePolicy(sizePolicy)
+        self.verticalLayout_3 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.flowRate = QGroupBox(self.dialogContents)
+        self.flowRate.setObjectName(u"flowRate")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.flowRate.sizePolicy().hasHeightForWidth())
+        self.flowRate.setSizePolicy(sizePolicy1)
+        self.verticalLayout = QVBoxLayout(self.flowRate)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_3 = QWidget(self.flowRate)
+        self.widget_3.setObjectName(u"widget_3")
+        self.formLayout = QFormLayout(self.widget_3)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_3)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.flowRateSpecificationMethod = QComboBox(self.widget_3)
+        self.flowRateSpecificationMethod.setObjectName(u"flowRateSpecificationMethod")
+        sizePolicy1.setHeightForWidth(self.flowRateSpecificationMethod.sizePolicy().hasHeightForWidth())
+        self.flowRateSpecificationMethod.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.flowRateSpecificationMethod)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.volumeFlowRateWidget = QWidget(self.flowRate)
+        self.volumeFlowRateWidget.setObjectName(u"volumeFlowRateWidget")
+        self.formLayout_2 = QFormLayout(self.volumeFlowRateWidget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.volumeFlowRateWidget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.volumeFlowRate = BatchableFloatEdit(self.volumeFlowRateWidget)
+        self.volumeFlowRate.setObjectName(u"volumeFlowRate")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.volumeFlowRate.sizePolicy().hasHeightForWidth())
+        self.volumeFlowRate.setSizePolicy(sizePolicy2)
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.volumeFlowRate)
+
+
+        self.verticalLayout.addWidget(self.volumeFlowRateWidget)
+
+        self.massFlowRateWidget = QWidget(self.flowRate)
+        self.massFlowRateWidget.setObjectName(u"massFlowRateWidget")
+        self.formLayout_3 = QFormLayout(self.massFlowRateWidget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_3 = QLabel(self.massFlowRateWidget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.massFlowRate = BatchableFloatEdit(self.massFlowRateWidget)
+        self.massFlowRate.setObjectName(u"massFlowRate")
+        sizePolicy2.setHeightForWidth(self.massFlowRate.sizePolicy().hasHeightForWidth())
+        self.massFlowRate.setSizePolicy(sizePolicy2)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.massFlowRate)
+
+
+        self.verticalLayout.addWidget(self.massFlowRateWidget)
+
+
+        self.verticalLayout_3.addWidget(self.flowRate)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(FlowRateInletDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.retranslateUi(FlowRateInletDialog)
+        self.cancel.clicked.connect(FlowRateInletDialog.reject)
+
+        QMetaObject.connectSlotsByName(FlowRateInletDialog)
+    # setupUi
+
+    def retranslateUi(self, FlowRateInletDialog):
+        FlowRateInletDialog.setWindowTitle(QCoreApplication.translate("FlowRateInletDialog", u"Flow Rate Inlet Boundary Condition", None))
+        self.flowRate.setTitle(QCoreApplication.translate("FlowRateInletDialog", u"Flow Rate", None))
+        self.label.setText(QCoreApplication.translate("FlowRateInletDialog", u"Flow Rate Specification Method", None))
+        self.label_2.setText(QCoreApplication.translate("FlowRateInletDialog", u"Volume Flow Rate (m3/s)", None))
+        self.label_3.setText(QCoreApplication.translate("FlowRateInletDialog", u"Mass Flow Rate (kg/s)", None))
+        self.ok.setText(QCoreApplication.translate("FlowRateInletDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("FlowRateInletDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'free_stream_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGridLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_FreeStreamDialog(object):
+    def setupUi(self, FreeStreamDialog):
+        if not FreeStreamDialog.objectName():
+            FreeStreamDialog.setObjectName(u"FreeStreamDialog")
+        FreeStreamDialog.resize(420, 499)
+        FreeStreamDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(FreeStreamDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox_2 = QGroupBox(FreeStreamDialog)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.groupBox_2.setMaximumSize(QSize(420, 16777215))
+        self.verticalLayout_8 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.widget_7 = QWidget(self.groupBox_2)
+        self.widget_7.setObjectName(u"widget_7")
+        self.formLayout_5 = QFormLayout(self.widget_7)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label_7 = QLabel(self.widget_7)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_7)
+
+        self.specificationMethod = PythonComboBox(self.widget_7)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout_8.addWidget(self.widget_7)
+
+        self.directFlowDirection = QGroupBox(self.groupBox_2)
+        self.directFlowDirection.setObjectName(u"directFlowDirection")
+        self.verticalLayout_9 = QVBoxLayout(self.directFlowDirection)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.widget_8 = QWidget(self.directFlowDirection)
+        self.widget_8.setObjectName(u"widget_8")
+        self.gridLayout_3 = QGridLayout(self.widget_8)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.gridLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.flowDirectionY = QLineEdit(self.widget_8)
+        self.flowDirectionY.setObjectName(u"flowDirectionY")
+
+        self.gridLayout_3.addWidget(self.flowDirectionY, 1, 2, 1, 1)
+
+        self.flowDirectionZ = QLineEdit(self.widget_8)
+        self.flowDirectionZ.setObjectName(u"flowDirectionZ")
+
+        self.gridLayout_3.addWidget(self.flowDirectionZ, 1, 3, 1, 1)
+
+        self.label_8 = QLabel(self.widget_8)
+        self.label_8.setObjectName(u"label_8")
+        self.label_8.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_8, 0, 3, 1, 1)
+
+        self.label_12 = QLabel(self.widget_8)
+        self.label_12.setObjectName(u"label_12")
+        self.label_12.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_12, 0, 2, 1, 1)
+
+        self.label_20 = QLabel(self.widget_8)
+        self.label_20.setObjectName(u"label_20")
+
+        self.gridLayout_3.addWidget(self.label_20, 1, 0, 1, 1)
+
+        self.flowDirectionX = QLineEdit(self.widget_8)
+        self.flowDirectionX.setObjectName(u"flowDirectionX")
+
+        self.gridLayout_3.addWidget(self.flowDirectionX, 1, 1, 1, 1)
+
+        self.label_21 = QLabel(self.widget_8)
+        self.label_21.setObjectName(u"label_21")
+        self.label_21.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_21, 0, 1, 1, 1)
+
+
+        self.verticalLayout_9.addWidget(self.widget_8)
+
+
+        self.verticalLayout_8.addWidget(self.directFlowDirection)
+
+        self.anglesFlowDirection = QWidget(self.groupBox_2)
+        self.anglesFlowDirection.setObjectName(u"anglesFlowDirection")
+        self.verticalLayout_10 = QVBoxLayout(self.anglesFlowDirection)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.verticalLayout_10.setContentsMargins(0, -1, 0, -1)
+        self.groupBox_4 = QGroupBox(self.anglesFlowDirection)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.verticalLayout_11 = QVBoxLayout(self.groupBox_4)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.widget_9 = QWidget(self.groupBox_4)
+        self.widget_9.setObjectName(u"widget_9")
+        self.gridLayout_4 = QGridLayout(self.widget_9)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.gridLayout_4.setContentsMargins(0, 0, 0, -1)
+        self.label_22 = QLabel(self.widget_9)
+        self.label_22.setObjectName(u"label_22")
+        self.label_22.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_4.addWidget(self.label_22, 0, 3, 1, 1)
+
+        self.label_23 = QLabel(self.widget_9)
+        self.label_23.setObjectName(u"label_23")
+        self.label_23.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_4.addWidget(self.label_23, 0, 1, 1, 1)
+
+        self.dragDirectionX = QLineEdit(self.widget_9)
+        self.dragDirectionX.setObjectName(u"dragDirectionX")
+
+        self.gridLayout_4.addWidget(self.dragDirectionX, 1, 1, 1, 1)
+
+        self.label_24 = QLabel(self.widget_9)
+        self.label_24.setObjectName(u"label_24")
+        self.label_24.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_4.addWidget(self.label_24, 0, 2, 1, 1)
+
+        self.dragDirectionZ = QLineEdit(self.widget_9)
+        self.dragDirectionZ.setObjectName(u"dragDirectionZ")
+
+        self.gridLayout_4.addWidget(self.dragDirectionZ, 1, 3, 1, 1)
+
+        self.dragDirectionY = QLineEdit(self.widget_9)
+        self.dragDirectionY.setObjectName(u"dragDirectionY")
+
+        self.gridLayout_4.addWidget(self.dragDirectionY, 1, 2, 1, 1)
+
+        self.label_25 = QLabel(self.widget_9)
+        self.label_25.setObjectName(u"label_25")
+
+        self.gridLayout_4.addWidget(self.label_25, 1, 0, 1, 1)
+
+        self.label_26 = QLabel(self.widget_9)
+        self.label_26.setObjectName(u"label_26")
+
+        self.gridLayout_4.addWidget(self.label_26, 2, 0, 1, 1)
+
+        self.liftDirectionX = QLineEdit(self.widget_9)
+        self.liftDirectionX.setObjectName(u"liftDirectionX")
+
+        self.gridLayout_4.addWidget(self.liftDirectionX, 2, 1, 1, 1)
+
+        self.liftDirectionY = QLineEdit(self.widget_9)
+        self.liftDirectionY.setObjectName(u"liftDirectionY")
+
+        self.gridLayout_4.addWidget(self.liftDirectionY, 2, 2, 1, 1)
+
+        self.liftDirectionZ = QLineEdit(self.widget_9)
+        self.liftDirectionZ.setObjectName(u"liftDirectionZ")
+
+        self.gridLayout_4.addWidget(self.liftDirectionZ, 2, 3, 1, 1)
+
+
+        self.verticalLayout_11.addWidget(self.widget_9)
+
+
+        self.verticalLayout_10.addWidget(self.groupBox_4)
+
+        self.widget_10 = QWidget(self.anglesFlowDirection)
+        self.widget_10.setObjectName(u"widget_10")
+        self.formLayout_6 = QFormLayout(self.widget_10)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(0, -1, 0, 0)
+        self.label_27 = QLabel(self.widget_10)
+        self.label_27.setObjectName(u"label_27")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_27)
+
+        self.AoA = QLineEdit(self.widget_10)
+        self.AoA.setObjectName(u"AoA")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.AoA)
+
+        self.label_28 = QLabel(self.widget_10)
+        self.label_28.setObjectName(u"label_28")
+
+        self.formLayout_6.setWidget(1, QFormLayout.LabelRole, self.label_28)
+
+        self.AoS = QLineEdit(self.widget_10)
+        self.AoS.setObjectName(u"AoS")
+
+        self.formLayout_6.setWidget(1, QFormLayout.FieldRole, self.AoS)
+
+
+        self.verticalLayout_10.addWidget(self.widget_10)
+
+
+        self.verticalLayout_8.addWidget(self.anglesFlowDirection)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_2)
+
+        self.dialogContents = QWidget(FreeStreamDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_3 = QFormLayout(self.widget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_9)
+
+        self.pressure = QLineEdit(self.widget)
+        self.pressure.setObjectName(u"pressure")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pressure.sizePolicy().hasHeightForWidth())
+        self.pressure.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.pressure)
+
+        self.label_10 = QLabel(self.widget)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_10)
+
+        self.speed = QLineEdit(self.widget)
+        self.speed.setObjectName(u"speed")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.speed)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(FreeStreamDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+        QWidget.setTabOrder(self.specificationMethod, self.flowDirectionX)
+        QWidget.setTabOrder(self.flowDirectionX, self.flowDirectionY)
+        QWidget.setTabOrder(self.flowDirectionY, self.flowDirectionZ)
+        QWidget.setTabOrder(self.flowDirectionZ, self.dragDirectionX)
+        QWidget.setTabOrder(self.dragDirectionX, self.dragDirectionY)
+        QWidget.setTabOrder(self.dragDirectionY, self.dragDirectionZ)
+        QWidget.setTabOrder(self.dragDirectionZ, self.liftDirectionX)
+        QWidget.setTabOrder(self.liftDirectionX, self.liftDirectionY)
+        QWidget.setTabOrder(self.liftDirectionY, self.liftDirectionZ)
+        QWidget.setTabOrder(self.liftDirectionZ, self.AoA)
+        QWidget.setTabOrder(self.AoA, self.AoS)
+        QWidget.setTabOrder(self.AoS, self.speed)
+        QWidget.setTabOrder(self.speed, self.pressure)
+        QWidget.setTabOrder(self.pressure, self.ok)
+        QWidget.setTabOrder(self.ok, self.cancel)
+
+        self.retranslateUi(FreeStreamDialog)
+        self.cancel.clicked.connect(FreeStreamDialog.reject)
+
+        QMetaObject.connectSlotsByName(FreeStreamDialog)
+    # setupUi
+
+    def retranslateUi(self, FreeStreamDialog):
+        FreeStreamDialog.setWindowTitle(QCoreApplication.translate("FreeStreamDialog", u"Free Stream Boundary Condition", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("FreeStreamDialog", u"Direction", None))
+        self.label_7.setText(QCoreApplication.translate("FreeStreamDialog", u"Specification Method", None))
+        self.directFlowDirection.setTitle(QCoreApplication.translate("FreeStreamDialog", u"Direction", None))
+        self.label_8.setText(QCoreApplication.translate("FreeStreamDialog", u"Z", None))
+        self.label_12.setText(QCoreApplication.translate("FreeStreamDialog", u"Y", None))
+        self.label_20.setText(QCoreApplication.translate("FreeStreamDialog", u"Flow Direction", None))
+        self.label_21.setText(QCoreApplication.translate("FreeStreamDialog", u"X", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("FreeStreamDialog", u"Direction at AOA=0, AOS=0", None))
+        self.label_22.setText(QCoreApplication.translate("FreeStreamDialog", u"Z", None))
+        self.label_23.setText(QCoreApplication.translate("FreeStreamDialog", u"X", None))
+        self.label_24.setText(QCoreApplication.translate("FreeStreamDialog", u"Y", None))
+        self.label_25.setText(QCoreApplication.translate("FreeStreamDialog", u"Drag Direction", None))
+        self.label_26.setText(QCoreApplication.translate("FreeStreamDialog", u"Lift Direction", None))
+        self.label_27.setText(QCoreApplication.translate("FreeStreamDialog", u"Angle of Attack, AOA (degree)", None))
+        self.label_28.setText(QCoreApplication.translate("FreeStreamDialog", u"Angle of Sideslip, AOS (degree)", None))
+        self.label_9.setText(QCoreApplication.translate("FreeStreamDialog", u"Pressure (Pa)", None))
+        self.label_10.setText(QCoreApplication.translate("FreeStreamDialog", u"Speed (m/s)", None))
+        self.ok.setText(QCoreApplication.translate("FreeStreamDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("FreeStreamDialog", u"Cancel", None))
+    # retranslateUi
+
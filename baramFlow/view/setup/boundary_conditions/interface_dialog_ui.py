@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'interface_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_InterfaceDialog(object):
+    def setupUi(self, InterfaceDialog):
+        if not InterfaceDialog.objectName():
+            InterfaceDialog.setObjectName(u"InterfaceDialog")
+        InterfaceDialog.resize(400, 475)
+        InterfaceDialog.setMinimumSize(QSize(400, 0))
+        self.verticalLayout = QVBoxLayout(InterfaceDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(InterfaceDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.mode = EnumComboBox(self.widget)
+        self.mode.setObjectName(u"mode")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.mode)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.widget_3 = QWidget(self.widget)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout = QHBoxLayout(self.widget_3)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.coupledBoundary = QLineEdit(self.widget_3)
+        self.coupledBoundary.setObjectName(u"coupledBoundary")
+        self.coupledBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.coupledBoundary)
+
+        self.select = QPushButton(self.widget_3)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.widget_3)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.rotationalPeriodic = QWidget(InterfaceDialog)
+        self.rotationalPeriodic.setObjectName(u"rotationalPeriodic")
+        self.verticalLayout_3 = QVBoxLayout(self.rotationalPeriodic)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_2 = QGroupBox(self.rotationalPeriodic)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_3 = QFormLayout(self.groupBox_2)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.rotationAxisX = QLineEdit(self.groupBox_2)
+        self.rotationAxisX.setObjectName(u"rotationAxisX")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.rotationAxisX.sizePolicy().hasHeightForWidth())
+        self.rotationAxisX.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.rotationAxisX)
+
+        self.label_7 = QLabel(self.groupBox_2)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.rotationAxisY = QLineEdit(self.groupBox_2)
+        self.rotationAxisY.setObjectName(u"rotationAxisY")
+        sizePolicy.setHeightForWidth(self.rotationAxisY.sizePolicy().hasHeightForWidth())
+        self.rotationAxisY.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.rotationAxisY)
+
+        self.label_8 = QLabel(self.groupBox_2)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.rotationAxisZ = QLineEdit(self.groupBox_2)
+        self.rotationAxisZ.setObjectName(u"rotationAxisZ")
+        sizePolicy.setHeightForWidth(self.rotationAxisZ.sizePolicy().hasHeightForWidth())
+        self.rotationAxisZ.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.rotationAxisZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.rotationalPeriodic)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_4 = QFormLayout(self.groupBox_3)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_9 = QLabel(self.groupBox_3)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.rotationDirectionX = QLineEdit(self.groupBox_3)
+        self.rotationDirectionX.setObjectName(u"rotationDirectionX")
+        sizePolicy.setHeightForWidth(self.rotationDirectionX.sizePolicy().hasHeightForWidth())
+        self.rotationDirectionX.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.rotationDirectionX)
+
+        self.label_10 = QLabel(self.groupBox_3)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_10)
+
+        self.rotationDirectionY = QLineEdit(self.groupBox_3)
+        self.rotationDirectionY.setObjectName(u"rotationDirectionY")
+        sizePolicy.setHeightForWidth(self.rotationDirectionY.sizePolicy().hasHeightForWidth())
+        self.rotationDirectionY.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.rotationDirectionY)
+
+        self.label_11 = QLabel(self.groupBox_3)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_11)
+
+        self.rotationDirectionZ = QLineEdit(self.groupBox_3)
+        self.rotationDirectionZ.setObjectName(u"rotationDirectionZ")
+        sizePolicy.setHeightForWidth(self.rotationDirectionZ.sizePolicy().hasHeightForWidth())
+        self.rotationDirectionZ.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.rotationDirectionZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout.addWidget(self.rotationalPeriodic)
+
+        self.dialogContents = QWidget(InterfaceDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_5 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, -1)
+        self.translationalPeriodic = QWidget(self.dialogContents)
+        self.translationalPeriodic.setObjectName(u"translationalPeriodic")
+        self.verticalLayout_2 = QVBoxLayout(self.translationalPeriodic)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.translationalPeriodic)
+        self.groupBox.setObjectName(u"groupBox")
+        self.formLayout_6 = QFormLayout(self.groupBox)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.label_15 = QLabel(self.groupBox)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.translationVectorX = QLineEdit(self.groupBox)
+        self.translationVectorX.setObjectName(u"translationVectorX")
+        sizePolicy.setHeightForWidth(self.translationVectorX.sizePolicy().hasHeightForWidth())
+        self.translationVectorX.setSizePolicy(sizePolicy)
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.translationVectorX)
+
+        self.label_16 = QLabel(self.groupBox)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_6.setWidget(1, QFormLayout.LabelRole, self.label_16)
+
+        self.translationVectorY = QLineEdit(self.groupBox)
+        self.translationVectorY.setObjectName(u"translationVectorY")
+        sizePolicy.setHeightForWidth(self.translationVectorY.sizePolicy().hasHeightForWidth())
+        self.translationVectorY.setSizePolicy(sizePolicy)
+
+        self.formLayout_6.setWidget(1, QFormLayout.FieldRole, self.translationVectorY)
+
+        self.label_17 = QLabel(self.groupBox)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_6.setWidget(2, QFormLayout.LabelRole, self.label_17)
+
+        self.translationVectorZ = QLineEdit(self.groupBox)
+        self.translationVectorZ.setObjectName(u"translationVectorZ")
+        sizePolicy.setHeightForWidth(self.translationVectorZ.sizePolicy().hasHeightForWidth())
+        self.translationVectorZ.setSizePolicy(sizePolicy)
+
+        self.formLayout_6.setWidget(2, QFormLayout.FieldRole, self.translationVectorZ)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.verticalLayout_5.addWidget(self.translationalPeriodic)
+
+        self.widget_2 = QWidget(self.dialogContents)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_4 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+
+        self.verticalLayout_5.addWidget(self.widget_2)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(InterfaceDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(InterfaceDialog)
+        self.buttonBox.accepted.connect(InterfaceDialog.accept)
+        self.buttonBox.rejected.connect(InterfaceDialog.reject)
+
+        QMetaObject.connectSlotsByName(InterfaceDialog)
+    # setupUi
+
+    def retranslateUi(self, InterfaceDialog):
+        InterfaceDialog.setWindowTitle(QCoreApplication.translate("InterfaceDialog", u"Interface Boundary Condition", None))
+        self.label.setText(QCoreApplication.translate("InterfaceDialog", u"Mode", None))
+        self.label_2.setText(QCoreApplication.translate("InterfaceDialog", u"Coupled Boundary", None))
+        self.select.setText(QCoreApplication.translate("InterfaceDialog", u"Select", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("InterfaceDialog", u"Rotation-Axis Origin", None))
+        self.label_6.setText(QCoreApplication.translate("InterfaceDialog", u"X (m)", None))
+        self.label_7.setText(QCoreApplication.translate("InterfaceDialog", u"Y (m)", None))
+        self.label_8.setText(QCoreApplication.translate("InterfaceDialog", u"Z (m)", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("InterfaceDialog", u"Rotation-Axis Direction", None))
+        self.label_9.setText(QCoreApplication.translate("InterfaceDialog", u"X", None))
+        self.label_10.setText(QCoreApplication.translate("InterfaceDialog", u"Y", None))
+        self.label_11.setText(QCoreApplication.translate("InterfaceDialog", u"Z", None))
+        self.groupBox.setTitle(QCoreApplication.translate("InterfaceDialog", u"Translation Vector", None))
+        self.label_15.setText(QCoreApplication.translate("InterfaceDialog", u"X (m)", None))
+        self.label_16.setText(QCoreApplication.translate("InterfaceDialog", u"Y (m)", None))
+        self.label_17.setText(QCoreApplication.translate("InterfaceDialog", u"Z (m)", None))
+    # retranslateUi
+
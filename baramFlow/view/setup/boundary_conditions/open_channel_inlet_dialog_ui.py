@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'open_channel_inlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_OpenChannelInletDialog(object):
+    def setupUi(self, OpenChannelInletDialog):
+        if not OpenChannelInletDialog.objectName():
+            OpenChannelInletDialog.setObjectName(u"OpenChannelInletDialog")
+        OpenChannelInletDialog.resize(420, 106)
+        OpenChannelInletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(OpenChannelInletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(OpenChannelInletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_4 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.volumeFlowRate = QLineEdit(self.widget)
+        self.volumeFlowRate.setObjectName(u"volumeFlowRate")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.volumeFlowRate)
+
+
+        self.verticalLayout_4.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(OpenChannelInletDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.retranslateUi(OpenChannelInletDialog)
+        self.cancel.clicked.connect(OpenChannelInletDialog.reject)
+
+        QMetaObject.connectSlotsByName(OpenChannelInletDialog)
+    # setupUi
+
+    def retranslateUi(self, OpenChannelInletDialog):
+        OpenChannelInletDialog.setWindowTitle(QCoreApplication.translate("OpenChannelInletDialog", u"Open Channel Inlet Boundary Condition", None))
+        self.label.setText(QCoreApplication.translate("OpenChannelInletDialog", u"Volume Flow Rate (m3/s)", None))
+        self.ok.setText(QCoreApplication.translate("OpenChannelInletDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("OpenChannelInletDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'open_channel_outlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QLabel, QLineEdit, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_OpenChannelOutletDialog(object):
+    def setupUi(self, OpenChannelOutletDialog):
+        if not OpenChannelOutletDialog.objectName():
+            OpenChannelOutletDialog.setObjectName(u"OpenChannelOutletDialog")
+        OpenChannelOutletDialog.resize(420, 88)
+        OpenChannelOutletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(OpenChannelOutletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(OpenChannelOutletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_4 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.meanVelocity = QLineEdit(self.widget)
+        self.meanVelocity.setObjectName(u"meanVelocity")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.meanVelocity)
+
+
+        self.verticalLayout_4.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(OpenChannelOutletDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(OpenChannelOutletDialog)
+        self.buttonBox.accepted.connect(OpenChannelOutletDialog.accept)
+        self.buttonBox.rejected.connect(OpenChannelOutletDialog.reject)
+
+        QMetaObject.connectSlotsByName(OpenChannelOutletDialog)
+    # setupUi
+
+    def retranslateUi(self, OpenChannelOutletDialog):
+        OpenChannelOutletDialog.setWindowTitle(QCoreApplication.translate("OpenChannelOutletDialog", u"Open Channel Outlet Boundary Condition", None))
+        self.label.setText(QCoreApplication.translate("OpenChannelOutletDialog", u"Mean Velocity, U<sub>mean</sub> (m/s)", None))
+    # retranslateUi
+
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'patch_interaction_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QRadioButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_PatchInteractionWidget(object):
+    def setupUi(self, PatchInteractionWidget):
+        if not PatchInteractionWidget.objectName():
+            PatchInteractionWidget.setObjectName(u"PatchInteractionWidget")
+        PatchInteractionWidget.resize(400, 317)
+        self.verticalLayout = QVBoxLayout(PatchInteractionWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(PatchInteractionWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_8 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.none = QRadioButton(self.groupBox)
+        self.none.setObjectName(u"none")
+
+        self.verticalLayout_8.addWidget(self.none)
+
+        self.reflect = QRadioButton(self.groupBox)
+        self.reflect.setObjectName(u"reflect")
+
+        self.verticalLayout_8.addWidget(self.reflect)
+
+        self.coefficientOfResititution = QGroupBox(self.groupBox)
+        self.coefficientOfResititution.setObjectName(u"coefficientOfResititution")
+        self.formLayout = QFormLayout(self.coefficientOfResititution)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.coefficientOfResititution)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.normal = BatchableFloatEdit(self.coefficientOfResititution)
+        self.normal.setObjectName(u"normal")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.normal.sizePolicy().hasHeightForWidth())
+        self.normal.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.normal)
+
+        self.label_2 = QLabel(self.coefficientOfResititution)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.tangential = BatchableFloatEdit(self.coefficientOfResititution)
+        self.tangential.setObjectName(u"tangential")
+        sizePolicy.setHeightForWidth(self.tangential.sizePolicy().hasHeightForWidth())
+        self.tangential.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.tangential)
+
+
+        self.verticalLayout_8.addWidget(self.coefficientOfResititution)
+
+        self.escape = QRadioButton(self.groupBox)
+        self.escape.setObjectName(u"escape")
+
+        self.verticalLayout_8.addWidget(self.escape)
+
+        self.trap = QRadioButton(self.groupBox)
+        self.trap.setObjectName(u"trap")
+
+        self.verticalLayout_8.addWidget(self.trap)
+
+        self.recycle = QRadioButton(self.groupBox)
+        self.recycle.setObjectName(u"recycle")
+
+        self.verticalLayout_8.addWidget(self.recycle)
+
+        self.recycleParameters = QWidget(self.groupBox)
+        self.recycleParameters.setObjectName(u"recycleParameters")
+        self.formLayout_2 = QFormLayout(self.recycleParameters)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.label_3 = QLabel(self.recycleParameters)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.label_4 = QLabel(self.recycleParameters)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.recycleFraction = BatchableFloatEdit(self.recycleParameters)
+        self.recycleFraction.setObjectName(u"recycleFraction")
+        sizePolicy.setHeightForWidth(self.recycleFraction.sizePolicy().hasHeightForWidth())
+        self.recycleFraction.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.recycleFraction)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.recycleBoundary = QLineEdit(self.recycleParameters)
+        self.recycleBoundary.setObjectName(u"recycleBoundary")
+        self.recycleBoundary.setEnabled(False)
+
+        self.horizontalLayout_4.addWidget(self.recycleBoundary)
+
+        self.selectBoundary = QPushButton(self.recycleParameters)
+        self.selectBoundary.setObjectName(u"selectBoundary")
+
+        self.horizontalLayout_4.addWidget(self.selectBoundary)
+
+
+        self.formLayout_2.setLayout(0, QFormLayout.FieldRole, self.horizontalLayout_4)
+
+
+        self.verticalLayout_8.addWidget(self.recycleParameters)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.retranslateUi(PatchInteractionWidget)
+
+        QMetaObject.connectSlotsByName(PatchInteractionWidget)
+    # setupUi
+
+    def retranslateUi(self, PatchInteractionWidget):
+        PatchInteractionWidget.setWindowTitle(QCoreApplication.translate("PatchInteractionWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("PatchInteractionWidget", u"Wall Injection", None))
+        self.none.setText(QCoreApplication.translate("PatchInteractionWidget", u"None", None))
+        self.reflect.setText(QCoreApplication.translate("PatchInteractionWidget", u"Reflect", None))
+        self.coefficientOfResititution.setTitle(QCoreApplication.translate("PatchInteractionWidget", u"Coefficient of Restitution", None))
+        self.label.setText(QCoreApplication.translate("PatchInteractionWidget", u"Normal (0~1)", None))
+        self.label_2.setText(QCoreApplication.translate("PatchInteractionWidget", u"Tangential (0~1)", None))
+        self.escape.setText(QCoreApplication.translate("PatchInteractionWidget", u"Escape", None))
+        self.trap.setText(QCoreApplication.translate("PatchInteractionWidget", u"Trap", None))
+        self.recycle.setText(QCoreApplication.translate("PatchInteractionWidget", u"Recycle", None))
+        self.label_3.setText(QCoreApplication.translate("PatchInteractionWidget", u"Recycle Boundary", None))
+        self.label_4.setText(QCoreApplication.translate("PatchInteractionWidget", u"Recycle Fraction (0~1)", None))
+        self.selectBoundary.setText(QCoreApplication.translate("PatchInteractionWidget", u"Select", None))
+    # retranslateUi
+
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'porous_jump_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_PorousJumpDialog(object):
+    def setupUi(self, PorousJumpDialog):
+        if not PorousJumpDialog.objectName():
+            PorousJumpDialog.setObjectName(u"PorousJumpDialog")
+        PorousJumpDialog.resize(480, 174)
+        PorousJumpDialog.setMinimumSize(QSize(480, 0))
+        self.verticalLayout = QVBoxLayout(PorousJumpDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(PorousJumpDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.formLayout = QFormLayout(self.dialogContents)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.dialogContents)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.darcyCoefficient = QLineEdit(self.dialogContents)
+        self.darcyCoefficient.setObjectName(u"darcyCoefficient")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.darcyCoefficient)
+
+        self.label_2 = QLabel(self.dialogContents)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.inertialCoefficient = QLineEdit(self.dialogContents)
+        self.inertialCoefficient.setObjectName(u"inertialCoefficient")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.inertialCoefficient)
+
+        self.label_3 = QLabel(self.dialogContents)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.porousMedieThickness = QLineEdit(self.dialogContents)
+        self.porousMedieThickness.setObjectName(u"porousMedieThickness")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.porousMedieThickness)
+
+        self.label_4 = QLabel(self.dialogContents)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.coupledBoundary = QLineEdit(self.widget)
+        self.coupledBoundary.setObjectName(u"coupledBoundary")
+        self.coupledBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.coupledBoundary)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.widget)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(PorousJumpDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(PorousJumpDialog)
+        self.buttonBox.accepted.connect(PorousJumpDialog.accept)
+        self.buttonBox.rejected.connect(PorousJumpDialog.reject)
+
+        QMetaObject.connectSlotsByName(PorousJumpDialog)
+    # setupUi
+
+    def retranslateUi(self, PorousJumpDialog):
+        PorousJumpDialog.setWindowTitle(QCoreApplication.translate("PorousJumpDialog", u"Porous Jump Boundary Condition", None))
+        self.label.setText(QCoreApplication.translate("PorousJumpDialog", u"Darcy Coefficient (1/\u33a1)", None))
+        self.label_2.setText(QCoreApplication.translate("PorousJumpDialog", u"Inertial Coefficient (1/m)", None))
+        self.label_3.setText(QCoreApplication.translate("PorousJumpDialog", u"Porous Media Thickness (m)", None))
+        self.label_4.setText(QCoreApplication.translate("PorousJumpDialog", u"Coupled Boundary", None))
+        self.select.setText(QCoreApplication.translate("PorousJumpDialog", u"Select", None))
+    # retranslateUi
+
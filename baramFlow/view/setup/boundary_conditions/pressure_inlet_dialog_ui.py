@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'pressure_inlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_PressureInletDialog(object):
+    def setupUi(self, PressureInletDialog):
+        if not PressureInletDialog.objectName():
+            PressureInletDialog.setObjectName(u"PressureInletDialog")
+        PressureInletDialog.resize(420, 124)
+        PressureInletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(PressureInletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(PressureInletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_4 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.pressure = QGroupBox(self.dialogContents)
+        self.pressure.setObjectName(u"pressure")
+        self.formLayout = QFormLayout(self.pressure)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.pressure)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.totalPressure = QLineEdit(self.pressure)
+        self.totalPressure.setObjectName(u"totalPressure")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.totalPressure)
+
+
+        self.verticalLayout_4.addWidget(self.pressure)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(PressureInletDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.retranslateUi(PressureInletDialog)
+        self.cancel.clicked.connect(PressureInletDialog.reject)
+
+        QMetaObject.connectSlotsByName(PressureInletDialog)
+    # setupUi
+
+    def retranslateUi(self, PressureInletDialog):
+        PressureInletDialog.setWindowTitle(QCoreApplication.translate("PressureInletDialog", u"Pressure Inlet Boundary Condition", None))
+        self.pressure.setTitle(QCoreApplication.translate("PressureInletDialog", u"Pressure", None))
+        self.label.setText(QCoreApplication.translate("PressureInletDialog", u"Total Pressure (Pa)", None))
+        self.ok.setText(QCoreApplication.translate("PressureInletDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("PressureInletDialog", u"Cancel", None))
+    # retranslateUi
+
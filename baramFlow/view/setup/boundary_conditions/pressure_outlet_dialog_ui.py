@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'pressure_outlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_PressureOutletDialog(object):
+    def setupUi(self, PressureOutletDialog):
+        if not PressureOutletDialog.objectName():
+            PressureOutletDialog.setObjectName(u"PressureOutletDialog")
+        PressureOutletDialog.resize(420, 250)
+        PressureOutletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(PressureOutletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(PressureOutletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.pressure = QGroupBox(self.dialogContents)
+        self.pressure.setObjectName(u"pressure")
+        self.formLayout = QFormLayout(self.pressure)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.pressure)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.totalPressure = QLineEdit(self.pressure)
+        self.totalPressure.setObjectName(u"totalPressure")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.totalPressure)
+
+
+        self.verticalLayout.addWidget(self.pressure)
+
+        self.NRB = QWidget(self.dialogContents)
+        self.NRB.setObjectName(u"NRB")
+        self.verticalLayout_4 = QVBoxLayout(self.NRB)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.nonReflectingBoundary = QCheckBox(self.NRB)
+        self.nonReflectingBoundary.setObjectName(u"nonReflectingBoundary")
+
+        self.verticalLayout_4.addWidget(self.nonReflectingBoundary)
+
+
+        self.verticalLayout.addWidget(self.NRB)
+
+        self.calculateBackflow = QGroupBox(self.dialogContents)
+        self.calculateBackflow.setObjectName(u"calculateBackflow")
+        self.calculateBackflow.setCheckable(True)
+        self.calculateBackflow.setChecked(False)
+        self.verticalLayout_3 = QVBoxLayout(self.calculateBackflow)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.backflowTotalTemperatureWidget = QWidget(self.calculateBackflow)
+        self.backflowTotalTemperatureWidget.setObjectName(u"backflowTotalTemperatureWidget")
+        self.formLayout_2 = QFormLayout(self.backflowTotalTemperatureWidget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.backflowTotalTemperatureWidget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.backflowTotalTemperature = QLineEdit(self.backflowTotalTemperatureWidget)
+        self.backflowTotalTemperature.setObjectName(u"backflowTotalTemperature")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.backflowTotalTemperature)
+
+
+        self.verticalLayout_3.addWidget(self.backflowTotalTemperatureWidget)
+
+
+        self.verticalLayout.addWidget(self.calculateBackflow)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(PressureOutletDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.retranslateUi(PressureOutletDialog)
+        self.cancel.clicked.connect(PressureOutletDialog.reject)
+
+        QMetaObject.connectSlotsByName(PressureOutletDialog)
+    # setupUi
+
+    def retranslateUi(self, PressureOutletDialog):
+        PressureOutletDialog.setWindowTitle(QCoreApplication.translate("PressureOutletDialog", u"Pressure Outlet Boundary Condition", None))
+        self.pressure.setTitle(QCoreApplication.translate("PressureOutletDialog", u"Pressure", None))
+        self.label.setText(QCoreApplication.translate("PressureOutletDialog", u"Pressure (Pa)", None))
+        self.nonReflectingBoundary.setText(QCoreApplication.translate("PressureOutletDialog", u"Non-Reflecting Boundary", None))
+        self.calculateBackflow.setTitle(QCoreApplication.translate("PressureOutletDialog", u"Specify Backflow Properties", None))
+        self.label_2.setText(QCoreApplication.translate("PressureOutletDialog", u"Backflow Total Temperature (K)", None))
+        self.ok.setText(QCoreApplication.translate("PressureOutletDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("PressureOutletDialog", u"Cancel", None))
+    # retranslateUi
+
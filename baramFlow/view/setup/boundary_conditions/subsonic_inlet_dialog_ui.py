@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'subsonic_inlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGroupBox, QLabel, QLineEdit,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_SubsonicInletDialog(object):
+    def setupUi(self, SubsonicInletDialog):
+        if not SubsonicInletDialog.objectName():
+            SubsonicInletDialog.setObjectName(u"SubsonicInletDialog")
+        SubsonicInletDialog.resize(420, 236)
+        SubsonicInletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(SubsonicInletDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(SubsonicInletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.formLayout = QFormLayout(self.groupBox)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.xComponent = QLineEdit(self.groupBox)
+        self.xComponent.setObjectName(u"xComponent")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.xComponent.sizePolicy().hasHeightForWidth())
+        self.xComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.xComponent)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.yComponent = QLineEdit(self.groupBox)
+        self.yComponent.setObjectName(u"yComponent")
+        sizePolicy.setHeightForWidth(self.yComponent.sizePolicy().hasHeightForWidth())
+        self.yComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.yComponent)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.zComponent = QLineEdit(self.groupBox)
+        self.zComponent.setObjectName(u"zComponent")
+        sizePolicy.setHeightForWidth(self.zComponent.sizePolicy().hasHeightForWidth())
+        self.zComponent.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.zComponent)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_3 = QFormLayout(self.widget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.totalPressure = QLineEdit(self.widget)
+        self.totalPressure.setObjectName(u"totalPressure")
+        sizePolicy.setHeightForWidth(self.totalPressure.sizePolicy().hasHeightForWidth())
+        self.totalPressure.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.totalPressure)
+
+        self.label_7 = QLabel(self.widget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.totalTemperature = QLineEdit(self.widget)
+        self.totalTemperature.setObjectName(u"totalTemperature")
+        sizePolicy.setHeightForWidth(self.totalTemperature.sizePolicy().hasHeightForWidth())
+        self.totalTemperature.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.totalTemperature)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(SubsonicInletDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(SubsonicInletDialog)
+        self.buttonBox.accepted.connect(SubsonicInletDialog.accept)
+        self.buttonBox.rejected.connect(SubsonicInletDialog.reject)
+
+        QMetaObject.connectSlotsByName(SubsonicInletDialog)
+    # setupUi
+
+    def retranslateUi(self, SubsonicInletDialog):
+        SubsonicInletDialog.setWindowTitle(QCoreApplication.translate("SubsonicInletDialog", u"Subsonic Inlet Boundary Condition", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SubsonicInletDialog", u"Flow Direction", None))
+        self.label.setText(QCoreApplication.translate("SubsonicInletDialog", u"X-Component", None))
+        self.label_2.setText(QCoreApplication.translate("SubsonicInletDialog", u"Y-Component", None))
+        self.label_3.setText(QCoreApplication.translate("SubsonicInletDialog", u"Z-Component", None))
+        self.label_9.setText(QCoreApplication.translate("SubsonicInletDialog", u"Total (Stagnation) Pressure, P<sub>0</sub> (Pa)", None))
+        self.label_7.setText(QCoreApplication.translate("SubsonicInletDialog", u"Total Temperature, T<sub>0</sub> (K)", None))
+    # retranslateUi
+
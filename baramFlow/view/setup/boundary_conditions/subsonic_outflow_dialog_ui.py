@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'subsonic_outflow_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QLabel, QLineEdit, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_SubsonicOutflowDialog(object):
+    def setupUi(self, SubsonicOutflowDialog):
+        if not SubsonicOutflowDialog.objectName():
+            SubsonicOutflowDialog.setObjectName(u"SubsonicOutflowDialog")
+        SubsonicOutflowDialog.resize(306, 88)
+        self.verticalLayout_2 = QVBoxLayout(SubsonicOutflowDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(SubsonicOutflowDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_3 = QFormLayout(self.widget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.pressure = QLineEdit(self.widget)
+        self.pressure.setObjectName(u"pressure")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.pressure)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(SubsonicOutflowDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(SubsonicOutflowDialog)
+        self.buttonBox.accepted.connect(SubsonicOutflowDialog.accept)
+        self.buttonBox.rejected.connect(SubsonicOutflowDialog.reject)
+
+        QMetaObject.connectSlotsByName(SubsonicOutflowDialog)
+    # setupUi
+
+    def retranslateUi(self, SubsonicOutflowDialog):
+        SubsonicOutflowDialog.setWindowTitle(QCoreApplication.translate("SubsonicOutflowDialog", u"Subsonic Outflow Boundary Condition", None))
+        self.label_9.setText(QCoreApplication.translate("SubsonicOutflowDialog", u"Static Pressure, P<sub>Exit</sub> (Pa)", None))
+    # retranslateUi
+
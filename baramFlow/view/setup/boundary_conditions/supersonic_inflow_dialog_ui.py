@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'supersonic_inflow_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGroupBox, QLabel, QLineEdit,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_SupersonicInflowDialog(object):
+    def setupUi(self, SupersonicInflowDialog):
+        if not SupersonicInflowDialog.objectName():
+            SupersonicInflowDialog.setObjectName(u"SupersonicInflowDialog")
+        SupersonicInflowDialog.resize(420, 236)
+        SupersonicInflowDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_2 = QVBoxLayout(SupersonicInflowDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(SupersonicInflowDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout = QVBoxLayout(self.dialogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.formLayout = QFormLayout(self.groupBox)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.xVelocity = QLineEdit(self.groupBox)
+        self.xVelocity.setObjectName(u"xVelocity")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.xVelocity.sizePolicy().hasHeightForWidth())
+        self.xVelocity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.xVelocity)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.yVelocity = QLineEdit(self.groupBox)
+        self.yVelocity.setObjectName(u"yVelocity")
+        sizePolicy.setHeightForWidth(self.yVelocity.sizePolicy().hasHeightForWidth())
+        self.yVelocity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.yVelocity)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.zVelocity = QLineEdit(self.groupBox)
+        self.zVelocity.setObjectName(u"zVelocity")
+        sizePolicy.setHeightForWidth(self.zVelocity.sizePolicy().hasHeightForWidth())
+        self.zVelocity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.zVelocity)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.staticPressure = QLineEdit(self.widget)
+        self.staticPressure.setObjectName(u"staticPressure")
+        sizePolicy.setHeightForWidth(self.staticPressure.sizePolicy().hasHeightForWidth())
+        self.staticPressure.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.staticPressure)
+
+        self.label_5 = QLabel(self.widget)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.staticTemperature = QLineEdit(self.widget)
+        self.staticTemperature.setObjectName(u"staticTemperature")
+        sizePolicy.setHeightForWidth(self.staticTemperature.sizePolicy().hasHeightForWidth())
+        self.staticTemperature.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.staticTemperature)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.buttonBox = QDialogButtonBox(SupersonicInflowDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(SupersonicInflowDialog)
+        self.buttonBox.accepted.connect(SupersonicInflowDialog.accept)
+        self.buttonBox.rejected.connect(SupersonicInflowDialog.reject)
+
+        QMetaObject.connectSlotsByName(SupersonicInflowDialog)
+    # setupUi
+
+    def retranslateUi(self, SupersonicInflowDialog):
+        SupersonicInflowDialog.setWindowTitle(QCoreApplication.translate("SupersonicInflowDialog", u"Supersonic Inflow Boundary Condition", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SupersonicInflowDialog", u"Velocity", None))
+        self.label.setText(QCoreApplication.translate("SupersonicInflowDialog", u"X-Velocity, Ux (m/s)", None))
+        self.label_2.setText(QCoreApplication.translate("SupersonicInflowDialog", u"Y-Velocity, Uy (m/s)", None))
+        self.label_3.setText(QCoreApplication.translate("SupersonicInflowDialog", u"Z-Velocity, Uz (m/s)", None))
+        self.label_4.setText(QCoreApplication.translate("SupersonicInflowDialog", u"Static Pressure, P (Pa)", None))
+        self.label_5.setText(QCoreApplication.translate("SupersonicInflowDialog", u"Static Temperature, T (K)", None))
+    # retranslateUi
+
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'temperature_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QComboBox, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QRadioButton, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_temperatureWidget(object):
+    def setupUi(self, temperatureWidget):
+        if not temperatureWidget.objectName():
+            temperatureWidget.setObjectName(u"temperatureWidget")
+        temperatureWidget.resize(338, 230)
+        self.verticalLayout_3 = QVBoxLayout(temperatureWidget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(temperatureWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.profileType = QComboBox(self.widget)
+        self.profileType.setObjectName(u"profileType")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.profileType.sizePolicy().hasHeightForWidth())
+        self.profileType.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.profileType)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.constant = QWidget(self.groupBox)
+        self.constant.setObjectName(u"constant")
+        self.formLayout_2 = QFormLayout(self.constant)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_3 = QLabel(self.constant)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.temperature = QLineEdit(self.constant)
+        self.temperature.setObjectName(u"temperature")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.temperature.sizePolicy().hasHeightForWidth())
+        self.temperature.setSizePolicy(sizePolicy1)
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.temperature)
+
+
+        self.verticalLayout_2.addWidget(self.constant)
+
+        self.spatialDistribution = QWidget(self.groupBox)
+        self.spatialDistribution.setObjectName(u"spatialDistribution")
+        self.horizontalLayout = QHBoxLayout(self.spatialDistribution)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_6 = QLabel(self.spatialDistribution)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout.addWidget(self.label_6)
+
+        self.spatialDistributionFileName = QLineEdit(self.spatialDistribution)
+        self.spatialDistributionFileName.setObjectName(u"spatialDistributionFileName")
+        self.spatialDistributionFileName.setEnabled(False)
+        sizePolicy2 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.spatialDistributionFileName.sizePolicy().hasHeightForWidth())
+        self.spatialDistributionFileName.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout.addWidget(self.spatialDistributionFileName)
+
+        self.spatialDistributionFileSelect = QPushButton(self.spatialDistribution)
+        self.spatialDistributionFileSelect.setObjectName(u"spatialDistributionFileSelect")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.spatialDistributionFileSelect.sizePolicy().hasHeightForWidth())
+        self.spatialDistributionFileSelect.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout.addWidget(self.spatialDistributionFileSelect)
+
+
+        self.verticalLayout_2.addWidget(self.spatialDistribution)
+
+        self.temporalDistribution = QWidget(self.groupBox)
+        self.temporalDistribution.setObjectName(u"temporalDistribution")
+        self.verticalLayout = QVBoxLayout(self.temporalDistribution)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_3 = QWidget(self.temporalDistribution)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.piecewiseLinear = QRadioButton(self.widget_3)
+        self.temporalDistributionRadioGroup = QButtonGroup(temperatureWidget)
+        self.temporalDistributionRadioGroup.setObjectName(u"temporalDistributionRadioGroup")
+        self.temporalDistributionRadioGroup.addButton(self.piecewiseLinear)
+        self.piecewiseLinear.setObjectName(u"piecewiseLinear")
+        sizePolicy2.setHeightForWidth(self.piecewiseLinear.sizePolicy().hasHeightForWidth())
+        self.piecewiseLinear.setSizePolicy(sizePolicy2)
+        self.piecewiseLinear.setChecked(True)
+
+        self.horizontalLayout_2.addWidget(self.piecewiseLinear)
+
+        self.piecewiseLinearEdit = QPushButton(self.widget_3)
+        self.piecewiseLinearEdit.setObjectName(u"piecewiseLinearEdit")
+
+        self.horizontalLayout_2.addWidget(self.piecewiseLinearEdit)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.widget_4 = QWidget(self.temporalDistribution)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.polynomial = QRadioButton(self.widget_4)
+        self.temporalDistributionRadioGroup.addButton(self.polynomial)
+        self.polynomial.setObjectName(u"polynomial")
+        sizePolicy2.setHeightForWidth(self.polynomial.sizePolicy().hasHeightForWidth())
+        self.polynomial.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_4.addWidget(self.polynomial)
+
+        self.polynomialEdit = QPushButton(self.widget_4)
+        self.polynomialEdit.setObjectName(u"polynomialEdit")
+
+        self.horizontalLayout_4.addWidget(self.polynomialEdit)
+
+
+        self.verticalLayout.addWidget(self.widget_4)
+
+
+        self.verticalLayout_2.addWidget(self.temporalDistribution)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+
+        self.retranslateUi(temperatureWidget)
+
+        QMetaObject.connectSlotsByName(temperatureWidget)
+    # setupUi
+
+    def retranslateUi(self, temperatureWidget):
+        temperatureWidget.setWindowTitle(QCoreApplication.translate("temperatureWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("temperatureWidget", u"Temperature", None))
+        self.label_2.setText(QCoreApplication.translate("temperatureWidget", u"Profile Type", None))
+        self.label_3.setText(QCoreApplication.translate("temperatureWidget", u"Temperature (K)", None))
+        self.label_6.setText(QCoreApplication.translate("temperatureWidget", u"CSV File Name", None))
+        self.spatialDistributionFileSelect.setText(QCoreApplication.translate("temperatureWidget", u"Select", None))
+        self.piecewiseLinear.setText(QCoreApplication.translate("temperatureWidget", u"Piecewise Linear", None))
+        self.piecewiseLinearEdit.setText(QCoreApplication.translate("temperatureWidget", u"Edit", None))
+        self.polynomial.setText(QCoreApplication.translate("temperatureWidget", u"Polynomial", None))
+        self.polynomialEdit.setText(QCoreApplication.translate("temperatureWidget", u"Edit", None))
+    # retranslateUi
+
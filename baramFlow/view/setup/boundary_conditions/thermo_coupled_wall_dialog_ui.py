@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'thermo_coupled_wall_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+
+from baramFlow.view.setup.boundary_conditions.wall_layers_widget import WallLayersBox
+import resource_rc
+
+class Ui_ThermoCoupledWallDailog(object):
+    def setupUi(self, ThermoCoupledWallDailog):
+        if not ThermoCoupledWallDailog.objectName():
+            ThermoCoupledWallDailog.setObjectName(u"ThermoCoupledWallDailog")
+        ThermoCoupledWallDailog.resize(400, 148)
+        ThermoCoupledWallDailog.setMinimumSize(QSize(400, 0))
+        self.verticalLayout_2 = QVBoxLayout(ThermoCoupledWallDailog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dialogContents = QWidget(ThermoCoupledWallDailog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.horizontalLayout = QHBoxLayout(self.dialogContents)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, -1)
+        self.label_2 = QLabel(self.dialogContents)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout.addWidget(self.label_2)
+
+        self.coupledBoundary = QLineEdit(self.dialogContents)
+        self.coupledBoundary.setObjectName(u"coupledBoundary")
+        self.coupledBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.coupledBoundary)
+
+        self.select = QPushButton(self.dialogContents)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.dialogContents)
+
+        self.temperatureGroup = QGroupBox(ThermoCoupledWallDailog)
+        self.temperatureGroup.setObjectName(u"temperatureGroup")
+        self.verticalLayout_5 = QVBoxLayout(self.temperatureGroup)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.wallLayers = WallLayersBox(self.temperatureGroup)
+        self.wallLayers.setObjectName(u"wallLayers")
+        self.wallLayers.setCheckable(True)
+        self.wallLayers.setChecked(False)
+
+        self.verticalLayout_5.addWidget(self.wallLayers)
+
+
+        self.verticalLayout_2.addWidget(self.temperatureGroup)
+
+        self.buttonBox = QDialogButtonBox(ThermoCoupledWallDailog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Cancel|QDialogButtonBox.StandardButton.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(ThermoCoupledWallDailog)
+        self.buttonBox.accepted.connect(ThermoCoupledWallDailog.accept)
+        self.buttonBox.rejected.connect(ThermoCoupledWallDailog.reject)
+
+        QMetaObject.connectSlotsByName(ThermoCoupledWallDailog)
+    # setupUi
+
+    def retranslateUi(self, ThermoCoupledWallDailog):
+        ThermoCoupledWallDailog.setWindowTitle(QCoreApplication.translate("ThermoCoupledWallDailog", u"Thermo-Coupled Wall", None))
+        self.label_2.setText(QCoreApplication.translate("ThermoCoupledWallDailog", u"Coupled Boundary", None))
+        self.select.setText(QCoreApplication.translate("ThermoCoupledWallDailog", u"Select", None))
+        self.temperatureGroup.setTitle(QCoreApplication.translate("ThermoCoupledWallDailog", u"Temperature", None))
+        self.wallLayers.setTitle(QCoreApplication.translate("ThermoCoupledWallDailog", u"Wall Layers", None))
+    # retranslateUi
+
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'turbulence_LES_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_TurbulenceLESWidget(object):
+    def setupUi(self, TurbulenceLESWidget):
+        if not TurbulenceLESWidget.objectName():
+            TurbulenceLESWidget.setObjectName(u"TurbulenceLESWidget")
+        TurbulenceLESWidget.resize(400, 184)
+        self.verticalLayout_2 = QVBoxLayout(TurbulenceLESWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(TurbulenceLESWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy)
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.specificationMethod = EnumComboBox(self.widget)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.kAndEpsilon = QWidget(self.groupBox)
+        self.kAndEpsilon.setObjectName(u"kAndEpsilon")
+        self.parametersLayout = QFormLayout(self.kAndEpsilon)
+        self.parametersLayout.setObjectName(u"parametersLayout")
+        self.label_2 = QLabel(self.kAndEpsilon)
+        self.label_2.setObjectName(u"label_2")
+
+        self.parametersLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.kineticEnergy = QLineEdit(self.kAndEpsilon)
+        self.kineticEnergy.setObjectName(u"kineticEnergy")
+
+        self.parametersLayout.setWidget(0, QFormLayout.FieldRole, self.kineticEnergy)
+
+        self.label_3 = QLabel(self.kAndEpsilon)
+        self.label_3.setObjectName(u"label_3")
+
+        self.parametersLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.turbulentIntensity = QLineEdit(self.kAndEpsilon)
+        self.turbulentIntensity.setObjectName(u"turbulentIntensity")
+
+        self.parametersLayout.setWidget(1, QFormLayout.FieldRole, self.turbulentIntensity)
+
+        self.label_5 = QLabel(self.kAndEpsilon)
+        self.label_5.setObjectName(u"label_5")
+
+        self.parametersLayout.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.turbulentViscosityRatio = QLineEdit(self.kAndEpsilon)
+        self.turbulentViscosityRatio.setObjectName(u"turbulentViscosityRatio")
+
+        self.parametersLayout.setWidget(2, QFormLayout.FieldRole, self.turbulentViscosityRatio)
+
+
+        self.verticalLayout.addWidget(self.kAndEpsilon)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.retranslateUi(TurbulenceLESWidget)
+
+        QMetaObject.connectSlotsByName(TurbulenceLESWidget)
+    # setupUi
+
+    def retranslateUi(self, TurbulenceLESWidget):
+        TurbulenceLESWidget.setWindowTitle(QCoreApplication.translate("TurbulenceLESWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("TurbulenceLESWidget", u"Turbulence", None))
+        self.label.setText(QCoreApplication.translate("TurbulenceLESWidget", u"Subgrid Kinetic Energy Specification Method", None))
+        self.label_2.setText(QCoreApplication.translate("TurbulenceLESWidget", u"Subgrid Kinetic Energy, k (\u33a1/s<sup>2</sup>)", None))
+        self.label_3.setText(QCoreApplication.translate("TurbulenceLESWidget", u"Subgrid Turbulent Intensity (%)", None))
+        self.label_5.setText(QCoreApplication.translate("TurbulenceLESWidget", u"Turbulent Viscosity Ratio", None))
+    # retranslateUi
+
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'turbulence_k_epsilon_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_turbulenceKEpsilonWidget(object):
+    def setupUi(self, turbulenceKEpsilonWidget):
+        if not turbulenceKEpsilonWidget.objectName():
+            turbulenceKEpsilonWidget.setObjectName(u"turbulenceKEpsilonWidget")
+        turbulenceKEpsilonWidget.resize(319, 206)
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(turbulenceKEpsilonWidget.sizePolicy().hasHeightForWidth())
+        turbulenceKEpsilonWidget.setSizePolicy(sizePolicy)
+        self.verticalLayout_2 = QVBoxLayout(turbulenceKEpsilonWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(turbulenceKEpsilonWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy1)
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.specificationMethod = QComboBox(self.widget)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.kAndEpsilon = QWidget(self.groupBox)
+        self.kAndEpsilon.setObjectName(u"kAndEpsilon")
+        self.formLayout = QFormLayout(self.kAndEpsilon)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.kAndEpsilon)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.turbulentKineticEnergy = QLineEdit(self.kAndEpsilon)
+        self.turbulentKineticEnergy.setObjectName(u"turbulentKineticEnergy")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.turbulentKineticEnergy)
+
+        self.label_3 = QLabel(self.kAndEpsilon)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.turbuelnetDissipationRate = QLineEdit(self.kAndEpsilon)
+        self.turbuelnetDissipationRate.setObjectName(u"turbuelnetDissipationRate")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.turbuelnetDissipationRate)
+
+
+        self.verticalLayout.addWidget(self.kAndEpsilon)
+
+        self.intensityAndViscocityRatio = QWidget(self.groupBox)
+        self.intensityAndViscocityRatio.setObjectName(u"intensityAndViscocityRatio")
+        self.formLayout_3 = QFormLayout(self.intensityAndViscocityRatio)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_4 = QLabel(self.intensityAndViscocityRatio)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.turbulentIntensity = QLineEdit(self.intensityAndViscocityRatio)
+        self.turbulentIntensity.setObjectName(u"turbulentIntensity")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.turbulentIntensity)
+
+        self.label_5 = QLabel(self.intensityAndViscocityRatio)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.turbulentViscosityRatio = QLineEdit(self.intensityAndViscocityRatio)
+        self.turbulentViscosityRatio.setObjectName(u"turbulentViscosityRatio")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.turbulentViscosityRatio)
+
+
+        self.verticalLayout.addWidget(self.intensityAndViscocityRatio)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.retranslateUi(turbulenceKEpsilonWidget)
+
+        QMetaObject.connectSlotsByName(turbulenceKEpsilonWidget)
+    # setupUi
+
+    def retranslateUi(self, turbulenceKEpsilonWidget):
+        turbulenceKEpsilonWidget.setWindowTitle(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Turbulence", None))
+        self.label.setText(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Specification method", None))
+        self.label_2.setText(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Turbulent Kinetic Energy, k (\u33a1/s<sup>2</sup>)", None))
+        self.label_3.setText(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Turbulent Dissipation Rate(\u33a1/s<sup>3</sup>)", None))
+        self.label_4.setText(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Turbulent Intensity (%)", None))
+        self.label_5.setText(QCoreApplication.translate("turbulenceKEpsilonWidget", u"Turbulent Viscosity Ratio", None))
+    # retranslateUi
+
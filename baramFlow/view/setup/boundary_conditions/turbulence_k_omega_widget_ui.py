@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'turbulence_k_omega_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_turbulenceKOmegaWidget(object):
+    def setupUi(self, turbulenceKOmegaWidget):
+        if not turbulenceKOmegaWidget.objectName():
+            turbulenceKOmegaWidget.setObjectName(u"turbulenceKOmegaWidget")
+        turbulenceKOmegaWidget.resize(319, 206)
+        self.verticalLayout_2 = QVBoxLayout(turbulenceKOmegaWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(turbulenceKOmegaWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.specificationMethod = QComboBox(self.widget)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.kAndOmega = QWidget(self.groupBox)
+        self.kAndOmega.setObjectName(u"kAndOmega")
+        self.formLayout_4 = QFormLayout(self.kAndOmega)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_2 = QLabel(self.kAndOmega)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.turbulentKineticEnergy = QLineEdit(self.kAndOmega)
+        self.turbulentKineticEnergy.setObjectName(u"turbulentKineticEnergy")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.turbulentKineticEnergy)
+
+        self.label_3 = QLabel(self.kAndOmega)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.specificDissipationRate = QLineEdit(self.kAndOmega)
+        self.specificDissipationRate.setObjectName(u"specificDissipationRate")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.specificDissipationRate)
+
+
+        self.verticalLayout.addWidget(self.kAndOmega)
+
+        self.intensityAndViscocityRatio = QWidget(self.groupBox)
+        self.intensityAndViscocityRatio.setObjectName(u"intensityAndViscocityRatio")
+        self.formLayout_3 = QFormLayout(self.intensityAndViscocityRatio)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_4 = QLabel(self.intensityAndViscocityRatio)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.turbulentIntensity = QLineEdit(self.intensityAndViscocityRatio)
+        self.turbulentIntensity.setObjectName(u"turbulentIntensity")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.turbulentIntensity)
+
+        self.label_5 = QLabel(self.intensityAndViscocityRatio)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.turbulentViscosityRatio = QLineEdit(self.intensityAndViscocityRatio)
+        self.turbulentViscosityRatio.setObjectName(u"turbulentViscosityRatio")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.turbulentViscosityRatio)
+
+
+        self.verticalLayout.addWidget(self.intensityAndViscocityRatio)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.retranslateUi(turbulenceKOmegaWidget)
+
+        QMetaObject.connectSlotsByName(turbulenceKOmegaWidget)
+    # setupUi
+
+    def retranslateUi(self, turbulenceKOmegaWidget):
+        turbulenceKOmegaWidget.setWindowTitle(QCoreApplication.translate("turbulenceKOmegaWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("turbulenceKOmegaWidget", u"Turbulence", None))
+        self.label.setText(QCoreApplication.translate("turbulenceKOmegaWidget", u"Specification method", None))
+        self.label_2.setText(QCoreApplication.translate("turbulenceKOmegaWidget", u"Turbulent Kinetic Energy, k (m<sup>2</sup>/s<sup>2</sup>)", None))
+        self.label_3.setText(QCoreApplication.translate("turbulenceKOmegaWidget", u"Specific Dissipation Rate (1/s)", None))
+        self.label_4.setText(QCoreApplication.translate("turbulenceKOmegaWidget", u"Turbulent Intensity (%)", None))
+        self.label_5.setText(QCoreApplication.translate("turbulenceKOmegaWidget", u"Turbulent Viscosity Ratio", None))
+    # retranslateUi
+
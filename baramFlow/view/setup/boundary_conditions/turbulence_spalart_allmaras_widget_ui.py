@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'turbulence_spalart_allmaras_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_turbulenceSpalartAllmarasWidget(object):
+    def setupUi(self, turbulenceSpalartAllmarasWidget):
+        if not turbulenceSpalartAllmarasWidget.objectName():
+            turbulenceSpalartAllmarasWidget.setObjectName(u"turbulenceSpalartAllmarasWidget")
+        turbulenceSpalartAllmarasWidget.resize(320, 150)
+        self.verticalLayout_2 = QVBoxLayout(turbulenceSpalartAllmarasWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(turbulenceSpalartAllmarasWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.specificationMethod = QComboBox(self.widget)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.modifiedTurbulentViscosityWidget = QWidget(self.groupBox)
+        self.modifiedTurbulentViscosityWidget.setObjectName(u"modifiedTurbulentViscosityWidget")
+        self.formLayout = QFormLayout(self.modifiedTurbulentViscosityWidget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.modifiedTurbulentViscosityWidget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.modifiedTurbulentViscosity = QLineEdit(self.modifiedTurbulentViscosityWidget)
+        self.modifiedTurbulentViscosity.setObjectName(u"modifiedTurbulentViscosity")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.modifiedTurbulentViscosity.sizePolicy().hasHeightForWidth())
+        self.modifiedTurbulentViscosity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.modifiedTurbulentViscosity)
+
+
+        self.verticalLayout.addWidget(self.modifiedTurbulentViscosityWidget)
+
+        self.turbulentViscosityRatioWidget = QWidget(self.groupBox)
+        self.turbulentViscosityRatioWidget.setObjectName(u"turbulentViscosityRatioWidget")
+        self.formLayout_3 = QFormLayout(self.turbulentViscosityRatioWidget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_5 = QLabel(self.turbulentViscosityRatioWidget)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.turbulentViscosityRatio = QLineEdit(self.turbulentViscosityRatioWidget)
+        self.turbulentViscosityRatio.setObjectName(u"turbulentViscosityRatio")
+        sizePolicy.setHeightForWidth(self.turbulentViscosityRatio.sizePolicy().hasHeightForWidth())
+        self.turbulentViscosityRatio.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.turbulentViscosityRatio)
+
+
+        self.verticalLayout.addWidget(self.turbulentViscosityRatioWidget)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.retranslateUi(turbulenceSpalartAllmarasWidget)
+
+        QMetaObject.connectSlotsByName(turbulenceSpalartAllmarasWidget)
+    # setupUi
+
+    def retranslateUi(self, turbulenceSpalartAllmarasWidget):
+        turbulenceSpalartAllmarasWidget.setWindowTitle(QCoreApplication.translate("turbulenceSpalartAllmarasWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("turbulenceSpalartAllmarasWidget", u"Turbulence", None))
+        self.label.setText(QCoreApplication.translate("turbulenceSpalartAllmarasWidget", u"Specification method", None))
+        self.label_2.setText(QCoreApplication.translate("turbulenceSpalartAllmarasWidget", u"Modified Turbulent Viscosity", None))
+        self.label_5.setText(QCoreApplication.translate("turbulenceSpalartAllmarasWidget", u"Turbulent Viscosity Ratio", None))
+    # retranslateUi
+
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'velocity_inlet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_VelocityInletDialog(object):
+    def setupUi(self, VelocityInletDialog):
+        if not VelocityInletDialog.objectName():
+            VelocityInletDialog.setObjectName(u"VelocityInletDialog")
+        VelocityInletDialog.resize(420, 411)
+        VelocityInletDialog.setMinimumSize(QSize(420, 0))
+        self.verticalLayout_3 = QVBoxLayout(VelocityInletDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.dialogContents = QWidget(VelocityInletDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_4 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.velocity = QGroupBox(self.dialogContents)
+        self.velocity.setObjectName(u"velocity")
+        self.verticalLayout_2 = QVBoxLayout(self.velocity)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.velocity)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.velocitySpecificationMethod = QComboBox(self.widget)
+        self.velocitySpecificationMethod.setObjectName(u"velocitySpecificationMethod")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.velocitySpecificationMethod)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.profileType = QComboBox(self.widget)
+        self.profileType.setObjectName(u"profileType")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.profileType)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.componentConstant = QWidget(self.velocity)
+        self.componentConstant.setObjectName(u"componentConstant")
+        self.formLayout_2 = QFormLayout(self.componentConstant)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_3 = QLabel(self.componentConstant)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.xVelocity = QLineEdit(self.componentConstant)
+        self.xVelocity.setObjectName(u"xVelocity")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.xVelocity)
+
+        self.label_4 = QLabel(self.componentConstant)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.yVelocity = QLineEdit(self.componentConstant)
+        self.yVelocity.setObjectName(u"yVelocity")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.yVelocity)
+
+        self.label_5 = QLabel(self.componentConstant)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.zVelocity = QLineEdit(self.componentConstant)
+        self.zVelocity.setObjectName(u"zVelocity")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.zVelocity)
+
+
+        self.verticalLayout_2.addWidget(self.componentConstant)
+
+        self.magnitudeConsant = QWidget(self.velocity)
+        self.magnitudeConsant.setObjectName(u"magnitudeConsant")
+        self.formLayout_3 = QFormLayout(self.magnitudeConsant)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_6 = QLabel(self.magnitudeConsant)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.velocityMagnitude = QLineEdit(self.magnitudeConsant)
+        self.velocityMagnitude.setObjectName(u"velocityMagnitude")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.velocityMagnitude)
+
+
+        self.verticalLayout_2.addWidget(self.magnitudeConsant)
+
+        self.spatialDistribution = QWidget(self.velocity)
+        self.spatialDistribution.setObjectName(u"spatialDistribution")
+        self.horizontalLayout = QHBoxLayout(self.spatialDistribution)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_7 = QLabel(self.spatialDistribution)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout.addWidget(self.label_7)
+
+        self.spatialDistributionFileName = QLineEdit(self.spatialDistribution)
+        self.spatialDistributionFileName.setObjectName(u"spatialDistributionFileName")
+        self.spatialDistributionFileName.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.spatialDistributionFileName)
+
+        self.spatialDistributionFileSelect = QPushButton(self.spatialDistribution)
+        self.spatialDistributionFileSelect.setObjectName(u"spatialDistributionFileSelect")
+
+        self.horizontalLayout.addWidget(self.spatialDistributionFileSelect)
+
+
+        self.verticalLayout_2.addWidget(self.spatialDistribution)
+
+        self.temporalDistribution = QWidget(self.velocity)
+        self.temporalDistribution.setObjectName(u"temporalDistribution")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.temporalDistribution.sizePolicy().hasHeightForWidth())
+        self.temporalDistribution.setSizePolicy(sizePolicy)
+        self.verticalLayout = QVBoxLayout(self.temporalDistribution)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_3 = QWidget(self.temporalDistribution)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 9)
+        self.label_8 = QLabel(self.widget_3)
+        self.label_8.setObjectName(u"label_8")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label_8.sizePolicy().hasHeightForWidth())
+        self.label_8.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_2.addWidget(self.label_8)
+
+        self.temporalDistributionEdit = QPushButton(self.widget_3)
+        self.temporalDistributionEdit.setObjectName(u"temporalDistributionEdit")
+
+        self.horizontalLayout_2.addWidget(self.temporalDistributionEdit)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+
+        self.verticalLayout_2.addWidget(self.temporalDistribution)
+
+
+        self.verticalLayout_4.addWidget(self.velocity)
+
+
+        self.verticalLayout_3.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(VelocityInletDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_3.addWidget(self.widget_4)
+
+
+        self.retranslateUi(VelocityInletDialog)
+        self.cancel.clicked.connect(VelocityInletDialog.reject)
+
+        QMetaObject.connectSlotsByName(VelocityInletDialog)
+    # setupUi
+
+    def retranslateUi(self, VelocityInletDialog):
+        VelocityInletDialog.setWindowTitle(QCoreApplication.translate("VelocityInletDialog", u"Velocity Inlet Boundary Condition", None))
+        self.velocity.setTitle(QCoreApplication.translate("VelocityInletDialog", u"Velocity", None))
+        self.label.setText(QCoreApplication.translate("VelocityInletDialog", u"Velocity Specification Method", None))
+        self.label_2.setText(QCoreApplication.translate("VelocityInletDialog", u"Profile Type", None))
+        self.label_3.setText(QCoreApplication.translate("VelocityInletDialog", u"X-Velocity, Ux (m/s)", None))
+        self.label_4.setText(QCoreApplication.translate("VelocityInletDialog", u"Y-Velocity, Uy (m/s)", None))
+        self.label_5.setText(QCoreApplication.translate("VelocityInletDialog", u"Z-Velocity, Uz (m/s)", None))
+        self.label_6.setText(QCoreApplication.translate("VelocityInletDialog", u"Velocity Magnitude (m/s)", None))
+        self.label_7.setText(QCoreApplication.translate("VelocityInletDialog", u"CSV File Name", None))
+        self.spatialDistributionFileSelect.setText(QCoreApplication.translate("VelocityInletDialog", u"Select", None))
+        self.label_8.setText(QCoreApplication.translate("VelocityInletDialog", u"Piecewise Linear", None))
+        self.temporalDistributionEdit.setText(QCoreApplication.translate("VelocityInletDialog", u"Edit", None))
+        self.ok.setText(QCoreApplication.translate("VelocityInletDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("VelocityInletDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,590 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'wall_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QPushButton,
+    QRadioButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from baramFlow.view.setup.boundary_conditions.wall_layers_widget import WallLayersBox
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+from widgets.python_combo_box import PythonComboBox
+import resource_rc
+
+class Ui_WallDialog(object):
+    def setupUi(self, WallDialog):
+        if not WallDialog.objectName():
+            WallDialog.setObjectName(u"WallDialog")
+        WallDialog.resize(469, 1115)
+        WallDialog.setMinimumSize(QSize(400, 0))
+        self.verticalLayout_4 = QVBoxLayout(WallDialog)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.dialogContents = QWidget(WallDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_3 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.velocityGroup = QGroupBox(self.dialogContents)
+        self.velocityGroup.setObjectName(u"velocityGroup")
+        self.verticalLayout = QVBoxLayout(self.velocityGroup)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox = QGroupBox(self.velocityGroup)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_10 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.stationaryWall = QRadioButton(self.groupBox)
+        self.stationaryWall.setObjectName(u"stationaryWall")
+
+        self.verticalLayout_10.addWidget(self.stationaryWall)
+
+        self.widget_8 = QWidget(self.groupBox)
+        self.widget_8.setObjectName(u"widget_8")
+        self.verticalLayout_11 = QVBoxLayout(self.widget_8)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.verticalLayout_11.setContentsMargins(-1, 0, -1, -1)
+        self.atmosphericWall = QCheckBox(self.widget_8)
+        self.atmosphericWall.setObjectName(u"atmosphericWall")
+
+        self.verticalLayout_11.addWidget(self.atmosphericWall)
+
+
+        self.verticalLayout_10.addWidget(self.widget_8)
+
+        self.movingWall = QRadioButton(self.groupBox)
+        self.movingWall.setObjectName(u"movingWall")
+
+        self.verticalLayout_10.addWidget(self.movingWall)
+
+        self.widget_9 = QWidget(self.groupBox)
+        self.widget_9.setObjectName(u"widget_9")
+        self.verticalLayout_12 = QVBoxLayout(self.widget_9)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.verticalLayout_12.setContentsMargins(-1, 0, -1, 0)
+        self.movingWallMotion = PythonComboBox(self.widget_9)
+        self.movingWallMotion.setObjectName(u"movingWallMotion")
+
+        self.verticalLayout_12.addWidget(self.movingWallMotion)
+
+        self.translationalMovingWall = QGroupBox(self.widget_9)
+        self.translationalMovingWall.setObjectName(u"translationalMovingWall")
+        self.formLayout = QFormLayout(self.translationalMovingWall)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.translationalMovingWall)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.xVelocity = BatchableFloatEdit(self.translationalMovingWall)
+        self.xVelocity.setObjectName(u"xVelocity")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.xVelocity.sizePolicy().hasHeightForWidth())
+        self.xVelocity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.xVelocity)
+
+        self.label_3 = QLabel(self.translationalMovingWall)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.yVelocity = BatchableFloatEdit(self.translationalMovingWall)
+        self.yVelocity.setObjectName(u"yVelocity")
+        sizePolicy.setHeightForWidth(self.yVelocity.sizePolicy().hasHeightForWidth())
+        self.yVelocity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.yVelocity)
+
+        self.label_4 = QLabel(self.translationalMovingWall)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.zVelocity = BatchableFloatEdit(self.translationalMovingWall)
+        self.zVelocity.setObjectName(u"zVelocity")
+        sizePolicy.setHeightForWidth(self.zVelocity.sizePolicy().hasHeightForWidth())
+        self.zVelocity.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.zVelocity)
+
+
+        self.verticalLayout_12.addWidget(self.translationalMovingWall)
+
+
+        self.verticalLayout_10.addWidget(self.widget_9)
+
+        self.rotationalMovingWall = QWidget(self.groupBox)
+        self.rotationalMovingWall.setObjectName(u"rotationalMovingWall")
+        self.verticalLayout_2 = QVBoxLayout(self.rotationalMovingWall)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.widget_2 = QWidget(self.rotationalMovingWall)
+        self.widget_2.setObjectName(u"widget_2")
+        self.formLayout_2 = QFormLayout(self.widget_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(-1, -1, -1, 0)
+        self.label_5 = QLabel(self.widget_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.speed = BatchableFloatEdit(self.widget_2)
+        self.speed.setObjectName(u"speed")
+        sizePolicy.setHeightForWidth(self.speed.sizePolicy().hasHeightForWidth())
+        self.speed.setSizePolicy(sizePolicy)
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.speed)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.widget_6 = QWidget(self.rotationalMovingWall)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout = QHBoxLayout(self.widget_6)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(-1, -1, -1, 0)
+        self.groupBox_2 = QGroupBox(self.widget_6)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_3 = QFormLayout(self.groupBox_2)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.rotationAxisOriginX = BatchableFloatEdit(self.groupBox_2)
+        self.rotationAxisOriginX.setObjectName(u"rotationAxisOriginX")
+        sizePolicy.setHeightForWidth(self.rotationAxisOriginX.sizePolicy().hasHeightForWidth())
+        self.rotationAxisOriginX.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.rotationAxisOriginX)
+
+        self.label_7 = QLabel(self.groupBox_2)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.rotationAxisOriginY = BatchableFloatEdit(self.groupBox_2)
+        self.rotationAxisOriginY.setObjectName(u"rotationAxisOriginY")
+        sizePolicy.setHeightForWidth(self.rotationAxisOriginY.sizePolicy().hasHeightForWidth())
+        self.rotationAxisOriginY.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.rotationAxisOriginY)
+
+        self.label_8 = QLabel(self.groupBox_2)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.rotationAxisOriginZ = BatchableFloatEdit(self.groupBox_2)
+        self.rotationAxisOriginZ.setObjectName(u"rotationAxisOriginZ")
+        sizePolicy.setHeightForWidth(self.rotationAxisOriginZ.sizePolicy().hasHeightForWidth())
+        self.rotationAxisOriginZ.setSizePolicy(sizePolicy)
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.rotationAxisOriginZ)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.widget_6)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_4 = QFormLayout(self.groupBox_3)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_9 = QLabel(self.groupBox_3)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.rotationDirectionX = BatchableFloatEdit(self.groupBox_3)
+        self.rotationDirectionX.setObjectName(u"rotationDirectionX")
+        sizePolicy.setHeightForWidth(self.rotationDirectionX.sizePolicy().hasHeightForWidth())
+        self.rotationDirectionX.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.rotationDirectionX)
+
+        self.label_10 = QLabel(self.groupBox_3)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_10)
+
+        self.rotationDirectionY = BatchableFloatEdit(self.groupBox_3)
+        self.rotationDirectionY.setObjectName(u"rotationDirectionY")
+        sizePolicy.setHeightForWidth(self.rotationDirectionY.sizePolicy().hasHeightForWidth())
+        self.rotationDirectionY.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.rotationDirectionY)
+
+        self.label_11 = QLabel(self.groupBox_3)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_11)
+
+        self.rotationDirectionZ = BatchableFloatEdit(self.groupBox_3)
+        self.rotationDirectionZ.setObjectName(u"rotationDirectionZ")
+        sizePolicy.setHeightForWidth(self.rotationDirectionZ.sizePolicy().hasHeightForWidth())
+        self.rotationDirectionZ.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.rotationDirectionZ)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout_2.addWidget(self.widget_6)
+
+
+        self.verticalLayout_10.addWidget(self.rotationalMovingWall)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.widget_7 = QWidget(self.velocityGroup)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.shearCondition = QGroupBox(self.widget_7)
+        self.shearCondition.setObjectName(u"shearCondition")
+        self.verticalLayout_13 = QVBoxLayout(self.shearCondition)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.noSlip = QRadioButton(self.shearCondition)
+        self.noSlip.setObjectName(u"noSlip")
+
+        self.verticalLayout_13.addWidget(self.noSlip)
+
+        self.slip = QRadioButton(self.shearCondition)
+        self.slip.setObjectName(u"slip")
+
+        self.verticalLayout_13.addWidget(self.slip)
+
+
+        self.horizontalLayout_2.addWidget(self.shearCondition)
+
+        self.wallRoughness = QGroupBox(self.widget_7)
+        self.wallRoughness.setObjectName(u"wallRoughness")
+        self.verticalLayout_15 = QVBoxLayout(self.wallRoughness)
+        self.verticalLayout_15.setObjectName(u"verticalLayout_15")
+        self.verticalLayout_15.setContentsMargins(0, -1, 0, -1)
+        self.widget_10 = QWidget(self.wallRoughness)
+        self.widget_10.setObjectName(u"widget_10")
+        self.formLayout_6 = QFormLayout(self.widget_10)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.label = QLabel(self.widget_10)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.roughnessHeight = BatchableFloatEdit(self.widget_10)
+        self.roughnessHeight.setObjectName(u"roughnessHeight")
+        sizePolicy.setHeightForWidth(self.roughnessHeight.sizePolicy().hasHeightForWidth())
+        self.roughnessHeight.setSizePolicy(sizePolicy)
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.roughnessHeight)
+
+        self.label_16 = QLabel(self.widget_10)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_6.setWidget(1, QFormLayout.LabelRole, self.label_16)
+
+        self.roughnessConstant = BatchableFloatEdit(self.widget_10)
+        self.roughnessConstant.setObjectName(u"roughnessConstant")
+        sizePolicy.setHeightForWidth(self.roughnessConstant.sizePolicy().hasHeightForWidth())
+        self.roughnessConstant.setSizePolicy(sizePolicy)
+
+        self.formLayout_6.setWidget(1, QFormLayout.FieldRole, self.roughnessConstant)
+
+
+        self.verticalLayout_15.addWidget(self.widget_10)
+
+
+        self.horizontalLayout_2.addWidget(self.wallRoughness)
+
+
+        self.verticalLayout.addWidget(self.widget_7)
+
+
+        self.verticalLayout_3.addWidget(self.velocityGroup)
+
+        self.temperatureGroup = QGroupBox(self.dialogContents)
+        self.temperatureGroup.setObjectName(u"temperatureGroup")
+        self.verticalLayout_5 = QVBoxLayout(self.temperatureGroup)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget = QWidget(self.temperatureGroup)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_8 = QFormLayout(self.widget)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.formLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.label_12 = QLabel(self.widget)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_12)
+
+        self.temperatureType = PythonComboBox(self.widget)
+        self.temperatureType.setObjectName(u"temperatureType")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.temperatureType)
+
+
+        self.verticalLayout_5.addWidget(self.widget)
+
+        self.constantTemperature = QWidget(self.temperatureGroup)
+        self.constantTemperature.setObjectName(u"constantTemperature")
+        self.formLayout_9 = QFormLayout(self.constantTemperature)
+        self.formLayout_9.setObjectName(u"formLayout_9")
+        self.formLayout_9.setContentsMargins(0, -1, 0, -1)
+        self.temperatureLabel = QLabel(self.constantTemperature)
+        self.temperatureLabel.setObjectName(u"temperatureLabel")
+
+        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.temperatureLabel)
+
+        self.temperature = BatchableFloatEdit(self.constantTemperature)
+        self.temperature.setObjectName(u"temperature")
+        sizePolicy.setHeightForWidth(self.temperature.sizePolicy().hasHeightForWidth())
+        self.temperature.setSizePolicy(sizePolicy)
+
+        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.temperature)
+
+
+        self.verticalLayout_5.addWidget(self.constantTemperature)
+
+        self.constantHeatFlux = QWidget(self.temperatureGroup)
+        self.constantHeatFlux.setObjectName(u"constantHeatFlux")
+        self.formLayout_10 = QFormLayout(self.constantHeatFlux)
+        self.formLayout_10.setObjectName(u"formLayout_10")
+        self.formLayout_10.setContentsMargins(0, -1, 0, -1)
+        self.heatFluxLabel = QLabel(self.constantHeatFlux)
+        self.heatFluxLabel.setObjectName(u"heatFluxLabel")
+
+        self.formLayout_10.setWidget(0, QFormLayout.LabelRole, self.heatFluxLabel)
+
+        self.heatFlux = BatchableFloatEdit(self.constantHeatFlux)
+        self.heatFlux.setObjectName(u"heatFlux")
+        sizePolicy.setHeightForWidth(self.heatFlux.sizePolicy().hasHeightForWidth())
+        self.heatFlux.setSizePolicy(sizePolicy)
+
+        self.formLayout_10.setWidget(0, QFormLayout.FieldRole, self.heatFlux)
+
+
+        self.verticalLayout_5.addWidget(self.constantHeatFlux)
+
+        self.convection = QWidget(self.temperatureGroup)
+        self.convection.setObjectName(u"convection")
+        self.verticalLayout_7 = QVBoxLayout(self.convection)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.widget_5 = QWidget(self.convection)
+        self.widget_5.setObjectName(u"widget_5")
+        self.formLayout_11 = QFormLayout(self.widget_5)
+        self.formLayout_11.setObjectName(u"formLayout_11")
+        self.formLayout_11.setContentsMargins(0, -1, 0, -1)
+        self.heatTransferCoefficientLabel = QLabel(self.widget_5)
+        self.heatTransferCoefficientLabel.setObjectName(u"heatTransferCoefficientLabel")
+
+        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.heatTransferCoefficientLabel)
+
+        self.heatTransferCoefficient = BatchableFloatEdit(self.widget_5)
+        self.heatTransferCoefficient.setObjectName(u"heatTransferCoefficient")
+        sizePolicy.setHeightForWidth(self.heatTransferCoefficient.sizePolicy().hasHeightForWidth())
+        self.heatTransferCoefficient.setSizePolicy(sizePolicy)
+
+        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.heatTransferCoefficient)
+
+        self.freeStreamTemperatureLabel = QLabel(self.widget_5)
+        self.freeStreamTemperatureLabel.setObjectName(u"freeStreamTemperatureLabel")
+
+        self.formLayout_11.setWidget(1, QFormLayout.LabelRole, self.freeStreamTemperatureLabel)
+
+        self.freeStreamTemperature = BatchableFloatEdit(self.widget_5)
+        self.freeStreamTemperature.setObjectName(u"freeStreamTemperature")
+        sizePolicy.setHeightForWidth(self.freeStreamTemperature.sizePolicy().hasHeightForWidth())
+        self.freeStreamTemperature.setSizePolicy(sizePolicy)
+
+        self.formLayout_11.setWidget(1, QFormLayout.FieldRole, self.freeStreamTemperature)
+
+        self.label_15 = QLabel(self.widget_5)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_11.setWidget(2, QFormLayout.LabelRole, self.label_15)
+
+        self.externalEmissivity = BatchableFloatEdit(self.widget_5)
+        self.externalEmissivity.setObjectName(u"externalEmissivity")
+        sizePolicy.setHeightForWidth(self.externalEmissivity.sizePolicy().hasHeightForWidth())
+        self.externalEmissivity.setSizePolicy(sizePolicy)
+
+        self.formLayout_11.setWidget(2, QFormLayout.FieldRole, self.externalEmissivity)
+
+
+        self.verticalLayout_7.addWidget(self.widget_5)
+
+        self.wallLayers = WallLayersBox(self.convection)
+        self.wallLayers.setObjectName(u"wallLayers")
+        self.wallLayers.setCheckable(True)
+        self.wallLayers.setChecked(False)
+
+        self.verticalLayout_7.addWidget(self.wallLayers)
+
+
+        self.verticalLayout_5.addWidget(self.convection)
+
+
+        self.verticalLayout_3.addWidget(self.temperatureGroup)
+
+        self.contactAngleGroup = QGroupBox(self.dialogContents)
+        self.contactAngleGroup.setObjectName(u"contactAngleGroup")
+        self.verticalLayout_6 = QVBoxLayout(self.contactAngleGroup)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.widget_4 = QWidget(self.contactAngleGroup)
+        self.widget_4.setObjectName(u"widget_4")
+        self.contactAngleFormLayout = QFormLayout(self.widget_4)
+        self.contactAngleFormLayout.setObjectName(u"contactAngleFormLayout")
+        self.contactAngleFormLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_13 = QLabel(self.widget_4)
+        self.label_13.setObjectName(u"label_13")
+
+        self.contactAngleFormLayout.setWidget(0, QFormLayout.LabelRole, self.label_13)
+
+        self.contactAngleModel = PythonComboBox(self.widget_4)
+        self.contactAngleModel.setObjectName(u"contactAngleModel")
+
+        self.contactAngleFormLayout.setWidget(0, QFormLayout.FieldRole, self.contactAngleModel)
+
+        self.contactAngleLimitLabel = QLabel(self.widget_4)
+        self.contactAngleLimitLabel.setObjectName(u"contactAngleLimitLabel")
+
+        self.contactAngleFormLayout.setWidget(1, QFormLayout.LabelRole, self.contactAngleLimitLabel)
+
+        self.contactAngleLimit = PythonComboBox(self.widget_4)
+        self.contactAngleLimit.setObjectName(u"contactAngleLimit")
+
+        self.contactAngleFormLayout.setWidget(1, QFormLayout.FieldRole, self.contactAngleLimit)
+
+
+        self.verticalLayout_6.addWidget(self.widget_4)
+
+
+        self.verticalLayout_3.addWidget(self.contactAngleGroup)
+
+        self.radiation = QGroupBox(self.dialogContents)
+        self.radiation.setObjectName(u"radiation")
+        self.formLayout_7 = QFormLayout(self.radiation)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.label_17 = QLabel(self.radiation)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_17)
+
+        self.wallEmissivity = BatchableFloatEdit(self.radiation)
+        self.wallEmissivity.setObjectName(u"wallEmissivity")
+        sizePolicy.setHeightForWidth(self.wallEmissivity.sizePolicy().hasHeightForWidth())
+        self.wallEmissivity.setSizePolicy(sizePolicy)
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.wallEmissivity)
+
+        self.label_18 = QLabel(self.radiation)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout_7.setWidget(1, QFormLayout.LabelRole, self.label_18)
+
+        self.radiativeFluxRelaxation = BatchableFloatEdit(self.radiation)
+        self.radiativeFluxRelaxation.setObjectName(u"radiativeFluxRelaxation")
+        sizePolicy.setHeightForWidth(self.radiativeFluxRelaxation.sizePolicy().hasHeightForWidth())
+        self.radiativeFluxRelaxation.setSizePolicy(sizePolicy)
+
+        self.formLayout_7.setWidget(1, QFormLayout.FieldRole, self.radiativeFluxRelaxation)
+
+
+        self.verticalLayout_3.addWidget(self.radiation)
+
+
+        self.verticalLayout_4.addWidget(self.dialogContents)
+
+        self.widget_3 = QWidget(WallDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_4.addWidget(self.widget_3)
+
+
+        self.retranslateUi(WallDialog)
+        self.cancel.clicked.connect(WallDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(WallDialog)
+    # setupUi
+
+    def retranslateUi(self, WallDialog):
+        WallDialog.setWindowTitle(QCoreApplication.translate("WallDialog", u"Wall Boundary Condition", None))
+        self.velocityGroup.setTitle(QCoreApplication.translate("WallDialog", u"Momentum", None))
+        self.groupBox.setTitle(QCoreApplication.translate("WallDialog", u"Wall Motion", None))
+        self.stationaryWall.setText(QCoreApplication.translate("WallDialog", u"Stationary Wall", None))
+        self.atmosphericWall.setText(QCoreApplication.translate("WallDialog", u"Atmospheric Wall", None))
+        self.movingWall.setText(QCoreApplication.translate("WallDialog", u"Moving Wall", None))
+        self.translationalMovingWall.setTitle(QCoreApplication.translate("WallDialog", u"Velocity", None))
+        self.label_2.setText(QCoreApplication.translate("WallDialog", u"X-Velocity (m/s)", None))
+        self.label_3.setText(QCoreApplication.translate("WallDialog", u"Y-Velocity (m/s)", None))
+        self.label_4.setText(QCoreApplication.translate("WallDialog", u"Z-Velocity (m/s)", None))
+        self.label_5.setText(QCoreApplication.translate("WallDialog", u"Speed (RPM)", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("WallDialog", u"Rotation-Axis Origin", None))
+        self.label_6.setText(QCoreApplication.translate("WallDialog", u"X (m)", None))
+        self.label_7.setText(QCoreApplication.translate("WallDialog", u"Y (m)", None))
+        self.label_8.setText(QCoreApplication.translate("WallDialog", u"Z (m)", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("WallDialog", u"Rotation-Axis Direction", None))
+        self.label_9.setText(QCoreApplication.translate("WallDialog", u"X", None))
+        self.label_10.setText(QCoreApplication.translate("WallDialog", u"Y", None))
+        self.label_11.setText(QCoreApplication.translate("WallDialog", u"Z", None))
+        self.shearCondition.setTitle(QCoreApplication.translate("WallDialog", u"Shear Condition", None))
+        self.noSlip.setText(QCoreApplication.translate("WallDialog", u"No Slip", None))
+        self.slip.setText(QCoreApplication.translate("WallDialog", u"Slip", None))
+        self.wallRoughness.setTitle(QCoreApplication.translate("WallDialog", u"Wall Roughness", None))
+        self.label.setText(QCoreApplication.translate("WallDialog", u"Roughness Height, K<sub>S</sub> (m)", None))
+        self.label_16.setText(QCoreApplication.translate("WallDialog", u"Roughtness Constant, C<sub>S</sub>", None))
+        self.temperatureGroup.setTitle(QCoreApplication.translate("WallDialog", u"Temperature", None))
+        self.label_12.setText(QCoreApplication.translate("WallDialog", u"Temperature", None))
+        self.temperatureLabel.setText(QCoreApplication.translate("WallDialog", u"Temperature (K)", None))
+        self.heatFluxLabel.setText(QCoreApplication.translate("WallDialog", u"Heat Flux (W/\u33a1)", None))
+        self.heatTransferCoefficientLabel.setText(QCoreApplication.translate("WallDialog", u"Heat Transfer Coefficient (W/\u33a1\u22c5K)", None))
+        self.freeStreamTemperatureLabel.setText(QCoreApplication.translate("WallDialog", u"Free Stream Temperature (K)", None))
+        self.label_15.setText(QCoreApplication.translate("WallDialog", u"External Emissivity (0~1)", None))
+        self.wallLayers.setTitle(QCoreApplication.translate("WallDialog", u"Wall Layers", None))
+        self.contactAngleGroup.setTitle(QCoreApplication.translate("WallDialog", u"Contact Angle", None))
+        self.label_13.setText(QCoreApplication.translate("WallDialog", u"Contact Angle", None))
+        self.contactAngleLimitLabel.setText(QCoreApplication.translate("WallDialog", u"Limit", None))
+        self.radiation.setTitle(QCoreApplication.translate("WallDialog", u"Radiation", None))
+        self.label_17.setText(QCoreApplication.translate("WallDialog", u"Wall Emissivity (0~1)", None))
+        self.label_18.setText(QCoreApplication.translate("WallDialog", u"Radiative Flux Relaxation (0~1)", None))
+        self.ok.setText(QCoreApplication.translate("WallDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("WallDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'wall_layers_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QGridLayout, QLabel,
+    QScrollArea, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from widgets.flat_push_button import FlatPushButton
+import resource_rc
+
+class Ui_WallLayersWidget(object):
+    def setupUi(self, WallLayersWidget):
+        if not WallLayersWidget.objectName():
+            WallLayersWidget.setObjectName(u"WallLayersWidget")
+        WallLayersWidget.resize(400, 182)
+        self.verticalLayout = QVBoxLayout(WallLayersWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.scrollArea = QScrollArea(WallLayersWidget)
+        self.scrollArea.setObjectName(u"scrollArea")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.scrollArea.sizePolicy().hasHeightForWidth())
+        self.scrollArea.setSizePolicy(sizePolicy)
+        self.scrollArea.setMinimumSize(QSize(0, 160))
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 398, 158))
+        self.verticalLayout_11 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.verticalLayout_11.setContentsMargins(0, 0, 0, 9)
+        self.wallLayersTable = QFrame(self.scrollAreaWidgetContents)
+        self.wallLayersTable.setObjectName(u"wallLayersTable")
+        self.wallLayersTable.setStyleSheet(u"")
+        self.wallLayersTable.setFrameShadow(QFrame.Shadow.Raised)
+        self.gridLayout_3 = QGridLayout(self.wallLayersTable)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.gridLayout_3.setVerticalSpacing(2)
+        self.label_2 = QLabel(self.wallLayersTable)
+        self.label_2.setObjectName(u"label_2")
+        font = QFont()
+        font.setBold(True)
+        self.label_2.setFont(font)
+
+        self.gridLayout_3.addWidget(self.label_2, 0, 2, 1, 1)
+
+        self.addWallLayer = FlatPushButton(self.wallLayersTable)
+        self.addWallLayer.setObjectName(u"addWallLayer")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.addWallLayer.sizePolicy().hasHeightForWidth())
+        self.addWallLayer.setSizePolicy(sizePolicy1)
+        icon = QIcon()
+        icon.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.addWallLayer.setIcon(icon)
+
+        self.gridLayout_3.addWidget(self.addWallLayer, 0, 3, 1, 1)
+
+        self.label_3 = QLabel(self.wallLayersTable)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setFont(font)
+
+        self.gridLayout_3.addWidget(self.label_3, 0, 0, 1, 1)
+
+        self.label = QLabel(self.wallLayersTable)
+        self.label.setObjectName(u"label")
+        self.label.setFont(font)
+
+        self.gridLayout_3.addWidget(self.label, 0, 1, 1, 1)
+
+
+        self.verticalLayout_11.addWidget(self.wallLayersTable)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.verticalLayout_11.addItem(self.verticalSpacer)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout.addWidget(self.scrollArea)
+
+        self.label_4 = QLabel(WallLayersWidget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.verticalLayout.addWidget(self.label_4)
+
+
+        self.retranslateUi(WallLayersWidget)
+
+        QMetaObject.connectSlotsByName(WallLayersWidget)
+    # setupUi
+
+    def retranslateUi(self, WallLayersWidget):
+        WallLayersWidget.setWindowTitle(QCoreApplication.translate("WallLayersWidget", u"Form", None))
+        self.label_2.setText(QCoreApplication.translate("WallLayersWidget", u"Thermal Conductivity, K<br/>(W/m\u22c5K)", None))
+        self.addWallLayer.setText("")
+        self.label_3.setText("")
+        self.label.setText(QCoreApplication.translate("WallLayersWidget", u"Thickness, t<br/>(m)", None))
+        self.label_4.setText(QCoreApplication.translate("WallLayersWidget", u"The first line is for the closest layer to the flow.", None))
+    # retranslateUi
+
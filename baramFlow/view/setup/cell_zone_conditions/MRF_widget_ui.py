@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'MRF_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_MRFWidget(object):
+    def setupUi(self, MRFWidget):
+        if not MRFWidget.objectName():
+            MRFWidget.setObjectName(u"MRFWidget")
+        MRFWidget.resize(202, 414)
+        self.verticalLayout = QVBoxLayout(MRFWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupbox = QGroupBox(MRFWidget)
+        self.groupbox.setObjectName(u"groupbox")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupbox.sizePolicy().hasHeightForWidth())
+        self.groupbox.setSizePolicy(sizePolicy)
+        self.verticalLayout_2 = QVBoxLayout(self.groupbox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_3 = QWidget(self.groupbox)
+        self.widget_3.setObjectName(u"widget_3")
+        self.formLayout = QFormLayout(self.widget_3)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_3)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.rotatingSpeed = QLineEdit(self.widget_3)
+        self.rotatingSpeed.setObjectName(u"rotatingSpeed")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.rotatingSpeed)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+        self.groupBox_3 = QGroupBox(self.groupbox)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_2 = QFormLayout(self.groupBox_3)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.rotationAxisOriginX = QLineEdit(self.groupBox_3)
+        self.rotationAxisOriginX.setObjectName(u"rotationAxisOriginX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.rotationAxisOriginX)
+
+        self.label_3 = QLabel(self.groupBox_3)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.rotationAxisOriginY = QLineEdit(self.groupBox_3)
+        self.rotationAxisOriginY.setObjectName(u"rotationAxisOriginY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.rotationAxisOriginY)
+
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.rotationAxisOriginZ = QLineEdit(self.groupBox_3)
+        self.rotationAxisOriginZ.setObjectName(u"rotationAxisOriginZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.rotationAxisOriginZ)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_3)
+
+        self.groupBox_4 = QGroupBox(self.groupbox)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.formLayout_3 = QFormLayout(self.groupBox_4)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_5 = QLabel(self.groupBox_4)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.rotationAxisDirectionX = QLineEdit(self.groupBox_4)
+        self.rotationAxisDirectionX.setObjectName(u"rotationAxisDirectionX")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.rotationAxisDirectionX)
+
+        self.label_6 = QLabel(self.groupBox_4)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.rotationAxisDirectionY = QLineEdit(self.groupBox_4)
+        self.rotationAxisDirectionY.setObjectName(u"rotationAxisDirectionY")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.rotationAxisDirectionY)
+
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.rotationAxisDirectionZ = QLineEdit(self.groupBox_4)
+        self.rotationAxisDirectionZ.setObjectName(u"rotationAxisDirectionZ")
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.rotationAxisDirectionZ)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_4)
+
+        self.widget = QWidget(self.groupbox)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_8 = QLabel(self.widget)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout.addWidget(self.label_8)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.staticBoundary = QListWidget(self.groupbox)
+        self.staticBoundary.setObjectName(u"staticBoundary")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.staticBoundary.sizePolicy().hasHeightForWidth())
+        self.staticBoundary.setSizePolicy(sizePolicy1)
+
+        self.verticalLayout_2.addWidget(self.staticBoundary)
+
+
+        self.verticalLayout.addWidget(self.groupbox)
+
+
+        self.retranslateUi(MRFWidget)
+
+        QMetaObject.connectSlotsByName(MRFWidget)
+    # setupUi
+
+    def retranslateUi(self, MRFWidget):
+        MRFWidget.setWindowTitle(QCoreApplication.translate("MRFWidget", u"Form", None))
+        self.groupbox.setTitle(QCoreApplication.translate("MRFWidget", u"Multiple Refrence Frame", None))
+        self.label.setText(QCoreApplication.translate("MRFWidget", u"Rotating Speed (RPM)", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("MRFWidget", u"Rotation-Axis Origin", None))
+        self.label_2.setText(QCoreApplication.translate("MRFWidget", u"X (m)", None))
+        self.label_3.setText(QCoreApplication.translate("MRFWidget", u"Y (m)", None))
+        self.label_4.setText(QCoreApplication.translate("MRFWidget", u"Z (m)", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("MRFWidget", u"Rotation-Axis Direction", None))
+        self.label_5.setText(QCoreApplication.translate("MRFWidget", u"X", None))
+        self.label_6.setText(QCoreApplication.translate("MRFWidget", u"Y", None))
+        self.label_7.setText(QCoreApplication.translate("MRFWidget", u"Z", None))
+        self.label_8.setText(QCoreApplication.translate("MRFWidget", u"Static Boundary", None))
+        self.select.setText(QCoreApplication.translate("MRFWidget", u"Select", None))
+    # retranslateUi
+
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'actuator_disk_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QRadioButton, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_ActuatorDiskWidget(object):
+    def setupUi(self, ActuatorDiskWidget):
+        if not ActuatorDiskWidget.objectName():
+            ActuatorDiskWidget.setObjectName(u"ActuatorDiskWidget")
+        ActuatorDiskWidget.resize(216, 460)
+        self.verticalLayout_2 = QVBoxLayout(ActuatorDiskWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(ActuatorDiskWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.groupBox_3 = QGroupBox(self.groupBox)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_2 = QFormLayout(self.groupBox_3)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_8 = QLabel(self.groupBox_3)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_8)
+
+        self.diskDirectionX = QLineEdit(self.groupBox_3)
+        self.diskDirectionX.setObjectName(u"diskDirectionX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.diskDirectionX)
+
+        self.label_3 = QLabel(self.groupBox_3)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.diskDirectionY = QLineEdit(self.groupBox_3)
+        self.diskDirectionY.setObjectName(u"diskDirectionY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.diskDirectionY)
+
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.diskDirectionZ = QLineEdit(self.groupBox_3)
+        self.diskDirectionZ.setObjectName(u"diskDirectionZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.diskDirectionZ)
+
+
+        self.verticalLayout.addWidget(self.groupBox_3)
+
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.powerCoefficient = QLineEdit(self.widget)
+        self.powerCoefficient.setObjectName(u"powerCoefficient")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.powerCoefficient)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.thrustCoefficient = QLineEdit(self.widget)
+        self.thrustCoefficient.setObjectName(u"thrustCoefficient")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.thrustCoefficient)
+
+        self.label_5 = QLabel(self.widget)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.diskArea = QLineEdit(self.widget)
+        self.diskArea.setObjectName(u"diskArea")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.diskArea)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox_5 = QGroupBox(self.groupBox)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.formLayout_4 = QFormLayout(self.groupBox_5)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_10 = QLabel(self.groupBox_5)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_10)
+
+        self.upstreamPointX = QLineEdit(self.groupBox_5)
+        self.upstreamPointX.setObjectName(u"upstreamPointX")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.upstreamPointX)
+
+        self.label_11 = QLabel(self.groupBox_5)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_11)
+
+        self.upstreamPointY = QLineEdit(self.groupBox_5)
+        self.upstreamPointY.setObjectName(u"upstreamPointY")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.upstreamPointY)
+
+        self.label_12 = QLabel(self.groupBox_5)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_12)
+
+        self.upstreamPointZ = QLineEdit(self.groupBox_5)
+        self.upstreamPointZ.setObjectName(u"upstreamPointZ")
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.upstreamPointZ)
+
+
+        self.verticalLayout.addWidget(self.groupBox_5)
+
+        self.groupBox_4 = QGroupBox(self.groupBox)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox_4)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.froude = QRadioButton(self.groupBox_4)
+        self.forceComputationRadioGroup = QButtonGroup(ActuatorDiskWidget)
+        self.forceComputationRadioGroup.setObjectName(u"forceComputationRadioGroup")
+        self.forceComputationRadioGroup.addButton(self.froude)
+        self.froude.setObjectName(u"froude")
+
+        self.verticalLayout_3.addWidget(self.froude)
+
+        self.variableScaling = QRadioButton(self.groupBox_4)
+        self.forceComputationRadioGroup.addButton(self.variableScaling)
+        self.variableScaling.setObjectName(u"variableScaling")
+
+        self.verticalLayout_3.addWidget(self.variableScaling)
+
+
+        self.verticalLayout.addWidget(self.groupBox_4)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.retranslateUi(ActuatorDiskWidget)
+
+        QMetaObject.connectSlotsByName(ActuatorDiskWidget)
+    # setupUi
+
+    def retranslateUi(self, ActuatorDiskWidget):
+        ActuatorDiskWidget.setWindowTitle(QCoreApplication.translate("ActuatorDiskWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("ActuatorDiskWidget", u"Actuator Disk", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("ActuatorDiskWidget", u"Disk Direction", None))
+        self.label_8.setText(QCoreApplication.translate("ActuatorDiskWidget", u"X", None))
+        self.label_3.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Y", None))
+        self.label_4.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Z", None))
+        self.label.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Power Coefficient, C<sub>p</sub>", None))
+        self.label_2.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Thrust Coefficient, C<sub>t</sub>", None))
+        self.label_5.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Disk Area (m<sup>2</sup>)", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("ActuatorDiskWidget", u"Upstream Point", None))
+        self.label_10.setText(QCoreApplication.translate("ActuatorDiskWidget", u"X", None))
+        self.label_11.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Y", None))
+        self.label_12.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Z", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("ActuatorDiskWidget", u"Force Computation", None))
+        self.froude.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Froude", None))
+        self.variableScaling.setText(QCoreApplication.translate("ActuatorDiskWidget", u"Variable Scaling", None))
+    # retranslateUi
+
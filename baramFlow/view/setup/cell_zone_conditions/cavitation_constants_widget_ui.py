@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'cavitation_constants_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_CavitationConstantsWidget(object):
+    def setupUi(self, CavitationConstantsWidget):
+        if not CavitationConstantsWidget.objectName():
+            CavitationConstantsWidget.setObjectName(u"CavitationConstantsWidget")
+        CavitationConstantsWidget.resize(400, 226)
+        self.verticalLayout = QVBoxLayout(CavitationConstantsWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(CavitationConstantsWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.constantsLayout = QFormLayout(self.groupBox)
+        self.constantsLayout.setObjectName(u"constantsLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.constantsLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.evaporationCoefficient = QLineEdit(self.groupBox)
+        self.evaporationCoefficient.setObjectName(u"evaporationCoefficient")
+
+        self.constantsLayout.setWidget(0, QFormLayout.FieldRole, self.evaporationCoefficient)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.constantsLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.constantsLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.label_4 = QLabel(self.groupBox)
+        self.label_4.setObjectName(u"label_4")
+
+        self.constantsLayout.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.label_5 = QLabel(self.groupBox)
+        self.label_5.setObjectName(u"label_5")
+
+        self.constantsLayout.setWidget(4, QFormLayout.LabelRole, self.label_5)
+
+        self.label_6 = QLabel(self.groupBox)
+        self.label_6.setObjectName(u"label_6")
+
+        self.constantsLayout.setWidget(5, QFormLayout.LabelRole, self.label_6)
+
+        self.label_7 = QLabel(self.groupBox)
+        self.label_7.setObjectName(u"label_7")
+
+        self.constantsLayout.setWidget(6, QFormLayout.LabelRole, self.label_7)
+
+        self.condensationCoefficient = QLineEdit(self.groupBox)
+        self.condensationCoefficient.setObjectName(u"condensationCoefficient")
+
+        self.constantsLayout.setWidget(1, QFormLayout.FieldRole, self.condensationCoefficient)
+
+        self.bubbleDiameter = QLineEdit(self.groupBox)
+        self.bubbleDiameter.setObjectName(u"bubbleDiameter")
+
+        self.constantsLayout.setWidget(2, QFormLayout.FieldRole, self.bubbleDiameter)
+
+        self.bubbleNumberDensity = QLineEdit(self.groupBox)
+        self.bubbleNumberDensity.setObjectName(u"bubbleNumberDensity")
+
+        self.constantsLayout.setWidget(3, QFormLayout.FieldRole, self.bubbleNumberDensity)
+
+        self.nucleationSiteVolumeFraction = QLineEdit(self.groupBox)
+        self.nucleationSiteVolumeFraction.setObjectName(u"nucleationSiteVolumeFraction")
+
+        self.constantsLayout.setWidget(4, QFormLayout.FieldRole, self.nucleationSiteVolumeFraction)
+
+        self.meanFlowTimeScale = QLineEdit(self.groupBox)
+        self.meanFlowTimeScale.setObjectName(u"meanFlowTimeScale")
+
+        self.constantsLayout.setWidget(5, QFormLayout.FieldRole, self.meanFlowTimeScale)
+
+        self.freeStreamVelocity = QLineEdit(self.groupBox)
+        self.freeStreamVelocity.setObjectName(u"freeStreamVelocity")
+
+        self.constantsLayout.setWidget(6, QFormLayout.FieldRole, self.freeStreamVelocity)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.retranslateUi(CavitationConstantsWidget)
+
+        QMetaObject.connectSlotsByName(CavitationConstantsWidget)
+    # setupUi
+
+    def retranslateUi(self, CavitationConstantsWidget):
+        CavitationConstantsWidget.setWindowTitle(QCoreApplication.translate("CavitationConstantsWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("CavitationConstantsWidget", u"Model Constants", None))
+        self.label.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Evaporation Coefficent", None))
+        self.label_2.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Condensation Coefficent", None))
+        self.label_3.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Bubble Diameter", None))
+        self.label_4.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Bubble Number Density", None))
+        self.label_5.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Nucleation Site Volume Fraction", None))
+        self.label_6.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Mean Flow Time Scale", None))
+        self.label_7.setText(QCoreApplication.translate("CavitationConstantsWidget", u"Free Stream Velocity", None))
+    # retranslateUi
+
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'cell_zone_condition_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractScrollArea, QApplication, QButtonGroup, QDialog,
+    QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QRadioButton, QScrollArea,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_CellZoneConditionDialog(object):
+    def setupUi(self, CellZoneConditionDialog):
+        if not CellZoneConditionDialog.objectName():
+            CellZoneConditionDialog.setObjectName(u"CellZoneConditionDialog")
+        CellZoneConditionDialog.resize(1018, 800)
+        self.verticalLayout_6 = QVBoxLayout(CellZoneConditionDialog)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.zoneName = QLabel(CellZoneConditionDialog)
+        self.zoneName.setObjectName(u"zoneName")
+        font = QFont()
+        font.setBold(True)
+        self.zoneName.setFont(font)
+
+        self.verticalLayout_6.addWidget(self.zoneName)
+
+        self.scrollArea = QScrollArea(CellZoneConditionDialog)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 998, 710))
+        self.horizontalLayout_5 = QHBoxLayout(self.scrollAreaWidgetContents)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.widget = QWidget(self.scrollAreaWidgetContents)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_2 = QVBoxLayout(self.widget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.setting = QWidget(self.widget)
+        self.setting.setObjectName(u"setting")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.setting.sizePolicy().hasHeightForWidth())
+        self.setting.setSizePolicy(sizePolicy)
+        self.setting.setMinimumSize(QSize(300, 0))
+        self.verticalLayout_3 = QVBoxLayout(self.setting)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.zoneType = QGroupBox(self.setting)
+        self.zoneType.setObjectName(u"zoneType")
+        self.verticalLayout = QVBoxLayout(self.zoneType)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.none = QRadioButton(self.zoneType)
+        self.zoneTypeRadioGroup = QButtonGroup(CellZoneConditionDialog)
+        self.zoneTypeRadioGroup.setObjectName(u"zoneTypeRadioGroup")
+        self.zoneTypeRadioGroup.addButton(self.none)
+        self.none.setObjectName(u"none")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.none.sizePolicy().hasHeightForWidth())
+        self.none.setSizePolicy(sizePolicy1)
+
+        self.verticalLayout.addWidget(self.none)
+
+        self.MRF = QRadioButton(self.zoneType)
+        self.zoneTypeRadioGroup.addButton(self.MRF)
+        self.MRF.setObjectName(u"MRF")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.MRF.sizePolicy().hasHeightForWidth())
+        self.MRF.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout.addWidget(self.MRF)
+
+        self.porousZone = QRadioButton(self.zoneType)
+        self.zoneTypeRadioGroup.addButton(self.porousZone)
+        self.porousZone.setObjectName(u"porousZone")
+
+        self.verticalLayout.addWidget(self.porousZone)
+
+        self.slidingMesh = QRadioButton(self.zoneType)
+        self.zoneTypeRadioGroup.addButton(self.slidingMesh)
+        self.slidingMesh.setObjectName(u"slidingMesh")
+        sizePolicy1.setHeightForWidth(self.slidingMesh.sizePolicy().hasHeightForWidth())
+        self.slidingMesh.setSizePolicy(sizePolicy1)
+
+        self.verticalLayout.addWidget(self.slidingMesh)
+
+        self.actuatorDisk = QRadioButton(self.zoneType)
+        self.zoneTypeRadioGroup.addButton(self.actuatorDisk)
+        self.actuatorDisk.setObjectName(u"actuatorDisk")
+        sizePolicy.setHeightForWidth(self.actuatorDisk.sizePolicy().hasHeightForWidth())
+        self.actuatorDisk.setSizePolicy(sizePolicy)
+
+        self.verticalLayout.addWidget(self.actuatorDisk)
+
+
+        self.verticalLayout_3.addWidget(self.zoneType)
+
+
+        self.verticalLayout_2.addWidget(self.setting)
+
+        self.verticalSpacer = QSpacerItem(20, 1, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout_5.addWidget(self.widget)
+
+        self.sourceTerms = QGroupBox(self.scrollAreaWidgetContents)
+        self.sourceTerms.setObjectName(u"sourceTerms")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.sourceTerms.sizePolicy().hasHeightForWidth())
+        self.sourceTerms.setSizePolicy(sizePolicy3)
+        self.verticalLayout_5 = QVBoxLayout(self.sourceTerms)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+
+        self.horizontalLayout_5.addWidget(self.sourceTerms)
+
+        self.fixedValues = QGroupBox(self.scrollAreaWidgetContents)
+        self.fixedValues.setObjectName(u"fixedValues")
+        sizePolicy3.setHeightForWidth(self.fixedValues.sizePolicy().hasHeightForWidth())
+        self.fixedValues.setSizePolicy(sizePolicy3)
+        self.verticalLayout_4 = QVBoxLayout(self.fixedValues)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.velocityGroup = QGroupBox(self.fixedValues)
+        self.velocityGroup.setObjectName(u"velocityGroup")
+        self.velocityGroup.setCheckable(True)
+        self.velocityGroup.setChecked(False)
+        self.formLayout = QFormLayout(self.velocityGroup)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_21 = QLabel(self.velocityGroup)
+        self.label_21.setObjectName(u"label_21")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_21)
+
+        self.xVelocity = QLineEdit(self.velocityGroup)
+        self.xVelocity.setObjectName(u"xVelocity")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.xVelocity)
+
+        self.label_23 = QLabel(self.velocityGroup)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_23)
+
+        self.yVelocity = QLineEdit(self.velocityGroup)
+        self.yVelocity.setObjectName(u"yVelocity")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.yVelocity)
+
+        self.label_24 = QLabel(self.velocityGroup)
+        self.label_24.setObjectName(u"label_24")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_24)
+
+        self.zVelocity = QLineEdit(self.velocityGroup)
+        self.zVelocity.setObjectName(u"zVelocity")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.zVelocity)
+
+        self.label_22 = QLabel(self.velocityGroup)
+        self.label_22.setObjectName(u"label_22")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_22)
+
+        self.relaxation = QLineEdit(self.velocityGroup)
+        self.relaxation.setObjectName(u"relaxation")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.relaxation)
+
+
+        self.verticalLayout_4.addWidget(self.velocityGroup)
+
+
+        self.horizontalLayout_5.addWidget(self.fixedValues)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_6.addWidget(self.scrollArea)
+
+        self.widget_4 = QWidget(CellZoneConditionDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_6.addWidget(self.widget_4)
+
+
+        self.retranslateUi(CellZoneConditionDialog)
+        self.cancel.clicked.connect(CellZoneConditionDialog.reject)
+
+        QMetaObject.connectSlotsByName(CellZoneConditionDialog)
+    # setupUi
+
+    def retranslateUi(self, CellZoneConditionDialog):
+        CellZoneConditionDialog.setWindowTitle(QCoreApplication.translate("CellZoneConditionDialog", u"Cell Zone Condtion", None))
+        self.zoneName.setText(QCoreApplication.translate("CellZoneConditionDialog", u"TextLabel", None))
+        self.zoneType.setTitle(QCoreApplication.translate("CellZoneConditionDialog", u"Zone Type", None))
+        self.none.setText(QCoreApplication.translate("CellZoneConditionDialog", u"None", None))
+        self.MRF.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Multiple Refernce Frame, MRF", None))
+        self.porousZone.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Porous Zone", None))
+        self.slidingMesh.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Sliding Mesh", None))
+        self.actuatorDisk.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Actuator Disk", None))
+        self.sourceTerms.setTitle(QCoreApplication.translate("CellZoneConditionDialog", u"Source Terms", None))
+        self.fixedValues.setTitle(QCoreApplication.translate("CellZoneConditionDialog", u"Fixed Values", None))
+        self.velocityGroup.setTitle(QCoreApplication.translate("CellZoneConditionDialog", u"Velocity", None))
+        self.label_21.setText(QCoreApplication.translate("CellZoneConditionDialog", u"X-Velocity, U<sub>x</sub> (m/s)", None))
+        self.label_23.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Y-Velocity, U<sub>y</sub> (m/s)", None))
+        self.label_24.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Z-Velocity, U<sub>z</sub> (m/s)", None))
+        self.label_22.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Relaxation (0~1)", None))
+        self.ok.setText(QCoreApplication.translate("CellZoneConditionDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("CellZoneConditionDialog", u"Cancel", None))
+    # retranslateUi
+
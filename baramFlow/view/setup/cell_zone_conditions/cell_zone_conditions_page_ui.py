@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'cell_zone_conditions_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QHeaderView,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_CellZoneConditionsPage(object):
+    def setupUi(self, CellZoneConditionsPage):
+        if not CellZoneConditionsPage.objectName():
+            CellZoneConditionsPage.setObjectName(u"CellZoneConditionsPage")
+        CellZoneConditionsPage.resize(283, 500)
+        self.verticalLayout = QVBoxLayout(CellZoneConditionsPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, -1, -1, 9)
+        self.title = QLabel(CellZoneConditionsPage)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout.addWidget(self.title)
+
+        self.line = QFrame(CellZoneConditionsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.cellZones = QTreeWidget(CellZoneConditionsPage)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(2, u"3");
+        __qtreewidgetitem.setText(1, u"2");
+        __qtreewidgetitem.setText(0, u"1");
+        self.cellZones.setHeaderItem(__qtreewidgetitem)
+        self.cellZones.setObjectName(u"cellZones")
+        self.cellZones.setAnimated(True)
+        self.cellZones.setExpandsOnDoubleClick(False)
+        self.cellZones.setColumnCount(3)
+        self.cellZones.header().setVisible(False)
+
+        self.verticalLayout.addWidget(self.cellZones)
+
+        self.widget_5 = QWidget(CellZoneConditionsPage)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.copy = QPushButton(self.widget_5)
+        self.copy.setObjectName(u"copy")
+
+        self.horizontalLayout_4.addWidget(self.copy)
+
+        self.horizontalSpacer = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.widget_5)
+        self.edit.setObjectName(u"edit")
+        self.edit.setEnabled(True)
+
+        self.horizontalLayout_4.addWidget(self.edit)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+
+        self.retranslateUi(CellZoneConditionsPage)
+
+        QMetaObject.connectSlotsByName(CellZoneConditionsPage)
+    # setupUi
+
+    def retranslateUi(self, CellZoneConditionsPage):
+        CellZoneConditionsPage.setWindowTitle(QCoreApplication.translate("CellZoneConditionsPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("CellZoneConditionsPage", u"Cell Zone Conditions", None))
+        self.copy.setText(QCoreApplication.translate("CellZoneConditionsPage", u"Copy", None))
+        self.edit.setText(QCoreApplication.translate("CellZoneConditionsPage", u"&Edit", None))
+    # retranslateUi
+
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'constant_source_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_ConstantSourceWidget(object):
+    def setupUi(self, ConstantSourceWidget):
+        if not ConstantSourceWidget.objectName():
+            ConstantSourceWidget.setObjectName(u"ConstantSourceWidget")
+        ConstantSourceWidget.resize(306, 86)
+        self.verticalLayout = QVBoxLayout(ConstantSourceWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(ConstantSourceWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.groupBox.setCheckable(True)
+        self.groupBox.setChecked(False)
+        self.formLayout_3 = QFormLayout(self.groupBox)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_5 = QLabel(self.groupBox)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.specificationMethod = EnumComboBox(self.groupBox)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+        self.specificationMethod.setMinimumSize(QSize(165, 0))
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label)
+
+        self.value = QLineEdit(self.groupBox)
+        self.value.setObjectName(u"value")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.value)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.retranslateUi(ConstantSourceWidget)
+
+        QMetaObject.connectSlotsByName(ConstantSourceWidget)
+    # setupUi
+
+    def retranslateUi(self, ConstantSourceWidget):
+        ConstantSourceWidget.setWindowTitle(QCoreApplication.translate("ConstantSourceWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("ConstantSourceWidget", u"GroupBox", None))
+        self.label_5.setText(QCoreApplication.translate("ConstantSourceWidget", u"Specification Method", None))
+        self.label.setText(QCoreApplication.translate("ConstantSourceWidget", u"k (\u33a1/s<sup>2</sup>)", None))
+    # retranslateUi
+
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'copy_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QHBoxLayout,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_CopyDialog(object):
+    def setupUi(self, CopyDialog):
+        if not CopyDialog.objectName():
+            CopyDialog.setObjectName(u"CopyDialog")
+        CopyDialog.resize(400, 300)
+        self.verticalLayout_3 = QVBoxLayout(CopyDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget_3 = QWidget(CopyDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout = QHBoxLayout(self.widget_3)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.widget_3)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 4, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.sourceFilter = QLineEdit(self.widget)
+        self.sourceFilter.setObjectName(u"sourceFilter")
+
+        self.verticalLayout.addWidget(self.sourceFilter)
+
+        self.source = QListWidget(self.widget)
+        self.source.setObjectName(u"source")
+        self.source.setSortingEnabled(True)
+
+        self.verticalLayout.addWidget(self.source)
+
+
+        self.horizontalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(self.widget_3)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(4, 0, 0, -1)
+        self.label_2 = QLabel(self.widget_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.verticalLayout_2.addWidget(self.label_2)
+
+        self.targetFilter = QLineEdit(self.widget_2)
+        self.targetFilter.setObjectName(u"targetFilter")
+
+        self.verticalLayout_2.addWidget(self.targetFilter)
+
+        self.targets = QListWidget(self.widget_2)
+        self.targets.setObjectName(u"targets")
+        self.targets.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.targets.setSortingEnabled(True)
+
+        self.verticalLayout_2.addWidget(self.targets)
+
+
+        self.horizontalLayout.addWidget(self.widget_2)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+        self.widget_4 = QWidget(CopyDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.copy = QPushButton(self.widget_4)
+        self.copy.setObjectName(u"copy")
+
+        self.horizontalLayout_3.addWidget(self.copy)
+
+        self.close = QPushButton(self.widget_4)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout_3.addWidget(self.close)
+
+
+        self.verticalLayout_3.addWidget(self.widget_4)
+
+
+        self.retranslateUi(CopyDialog)
+
+        self.copy.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(CopyDialog)
+    # setupUi
+
+    def retranslateUi(self, CopyDialog):
+        CopyDialog.setWindowTitle(QCoreApplication.translate("CopyDialog", u"Copy Cell Zone Conditions", None))
+        self.label.setText(QCoreApplication.translate("CopyDialog", u"Source", None))
+        self.label_2.setText(QCoreApplication.translate("CopyDialog", u"Targets", None))
+        self.copy.setText(QCoreApplication.translate("CopyDialog", u"Copy", None))
+        self.close.setText(QCoreApplication.translate("CopyDialog", u"Close", None))
+    # retranslateUi
+
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'fixed_value_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_FixedValueWidget(object):
+    def setupUi(self, FixedValueWidget):
+        if not FixedValueWidget.objectName():
+            FixedValueWidget.setObjectName(u"FixedValueWidget")
+        FixedValueWidget.resize(108, 58)
+        self.verticalLayout = QVBoxLayout(FixedValueWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(FixedValueWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.groupBox.setCheckable(True)
+        self.groupBox.setChecked(False)
+        self.horizontalLayout = QHBoxLayout(self.groupBox)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.value = QLineEdit(self.groupBox)
+        self.value.setObjectName(u"value")
+
+        self.horizontalLayout.addWidget(self.value)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.retranslateUi(FixedValueWidget)
+
+        QMetaObject.connectSlotsByName(FixedValueWidget)
+    # setupUi
+
+    def retranslateUi(self, FixedValueWidget):
+        FixedValueWidget.setWindowTitle(QCoreApplication.translate("FixedValueWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("FixedValueWidget", u"groupBox", None))
+        self.label.setText(QCoreApplication.translate("FixedValueWidget", u"label", None))
+        self.value.setText(QCoreApplication.translate("FixedValueWidget", u"0", None))
+    # retranslateUi
+
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'materials_selector_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QDialog,
+    QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_MaterialsSelectorDialog(object):
+    def setupUi(self, MaterialsSelectorDialog):
+        if not MaterialsSelectorDialog.objectName():
+            MaterialsSelectorDialog.setObjectName(u"MaterialsSelectorDialog")
+        MaterialsSelectorDialog.resize(375, 280)
+        self.verticalLayout_3 = QVBoxLayout(MaterialsSelectorDialog)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, 4, -1, -1)
+        self.widget_4 = QWidget(MaterialsSelectorDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout = QFormLayout(self.widget_4)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.widget_4)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.primary = QComboBox(self.widget_4)
+        self.primary.setObjectName(u"primary")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.primary)
+
+
+        self.verticalLayout_3.addWidget(self.widget_4)
+
+        self.secondariesSelector = QGroupBox(MaterialsSelectorDialog)
+        self.secondariesSelector.setObjectName(u"secondariesSelector")
+        self.secondariesSelector.setEnabled(False)
+        self.horizontalLayout_2 = QHBoxLayout(self.secondariesSelector)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.widget = QWidget(self.secondariesSelector)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.filter = QLineEdit(self.widget)
+        self.filter.setObjectName(u"filter")
+
+        self.verticalLayout.addWidget(self.filter)
+
+        self.list = QListWidget(self.widget)
+        self.list.setObjectName(u"list")
+        self.list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+        self.verticalLayout.addWidget(self.list)
+
+
+        self.horizontalLayout_2.addWidget(self.widget)
+
+        self.widget_2 = QWidget(self.secondariesSelector)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_2.setSpacing(10)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalSpacer = QSpacerItem(20, 53, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.add = QPushButton(self.widget_2)
+        self.add.setObjectName(u"add")
+        icon = QIcon()
+        icon.addFile(u":/icons/caret-forward.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.add.setIcon(icon)
+
+        self.verticalLayout_2.addWidget(self.add)
+
+        self.remove = QPushButton(self.widget_2)
+        self.remove.setObjectName(u"remove")
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/caret-back.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.remove.setIcon(icon1)
+
+        self.verticalLayout_2.addWidget(self.remove)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 53, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout_2.addWidget(self.widget_2)
+
+        self.secondaries = QListWidget(self.secondariesSelector)
+        self.secondaries.setObjectName(u"secondaries")
+        self.secondaries.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+        self.horizontalLayout_2.addWidget(self.secondaries)
+
+
+        self.verticalLayout_3.addWidget(self.secondariesSelector)
+
+        self.widget_5 = QWidget(MaterialsSelectorDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_3 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_3)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_4.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_4.addWidget(self.cancel)
+
+
+        self.verticalLayout_3.addWidget(self.widget_5)
+
+
+        self.retranslateUi(MaterialsSelectorDialog)
+        self.cancel.clicked.connect(MaterialsSelectorDialog.reject)
+
+        QMetaObject.connectSlotsByName(MaterialsSelectorDialog)
+    # setupUi
+
+    def retranslateUi(self, MaterialsSelectorDialog):
+        MaterialsSelectorDialog.setWindowTitle(QCoreApplication.translate("MaterialsSelectorDialog", u"Multiphase Materials", None))
+        self.label.setText(QCoreApplication.translate("MaterialsSelectorDialog", u"Primary Material", None))
+        self.secondariesSelector.setTitle(QCoreApplication.translate("MaterialsSelectorDialog", u"Secondary Materials", None))
+        self.add.setText("")
+        self.remove.setText("")
+        self.ok.setText(QCoreApplication.translate("MaterialsSelectorDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("MaterialsSelectorDialog", u"Cancel", None))
+    # retranslateUi
+
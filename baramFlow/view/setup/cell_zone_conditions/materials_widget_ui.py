@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'materials_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QListWidget, QListWidgetItem, QPushButton, QRadioButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_MaterialsWidget(object):
+    def setupUi(self, MaterialsWidget):
+        if not MaterialsWidget.objectName():
+            MaterialsWidget.setObjectName(u"MaterialsWidget")
+        MaterialsWidget.resize(298, 493)
+        self.verticalLayout = QVBoxLayout(MaterialsWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(MaterialsWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.singlephase = QWidget(self.groupBox)
+        self.singlephase.setObjectName(u"singlephase")
+        self.formLayout = QFormLayout(self.singlephase)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_3 = QLabel(self.singlephase)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.material = QComboBox(self.singlephase)
+        self.material.setObjectName(u"material")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.material)
+
+
+        self.verticalLayout_2.addWidget(self.singlephase)
+
+        self.multiphase = QWidget(self.groupBox)
+        self.multiphase.setObjectName(u"multiphase")
+        self.verticalLayout_4 = QVBoxLayout(self.multiphase)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 9)
+        self.widget_2 = QWidget(self.multiphase)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.primaryMaterial = QLineEdit(self.widget_2)
+        self.primaryMaterial.setObjectName(u"primaryMaterial")
+        self.primaryMaterial.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.primaryMaterial)
+
+        self.materialsSelect = QPushButton(self.widget_2)
+        self.materialsSelect.setObjectName(u"materialsSelect")
+
+        self.horizontalLayout.addWidget(self.materialsSelect)
+
+
+        self.verticalLayout_4.addWidget(self.widget_2)
+
+        self.fluid = QWidget(self.multiphase)
+        self.fluid.setObjectName(u"fluid")
+        self.verticalLayout_3 = QVBoxLayout(self.fluid)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label_2 = QLabel(self.fluid)
+        self.label_2.setObjectName(u"label_2")
+
+        self.verticalLayout_3.addWidget(self.label_2)
+
+        self.secondaryMaterials = QListWidget(self.fluid)
+        self.secondaryMaterials.setObjectName(u"secondaryMaterials")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.secondaryMaterials.sizePolicy().hasHeightForWidth())
+        self.secondaryMaterials.setSizePolicy(sizePolicy)
+        self.secondaryMaterials.setMaximumSize(QSize(16777215, 100))
+        self.secondaryMaterials.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.secondaryMaterials.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout_3.addWidget(self.secondaryMaterials)
+
+        self.surfaceTension = QGroupBox(self.fluid)
+        self.surfaceTension.setObjectName(u"surfaceTension")
+
+        self.verticalLayout_3.addWidget(self.surfaceTension)
+
+
+        self.verticalLayout_4.addWidget(self.fluid)
+
+        self.cavitation = QGroupBox(self.multiphase)
+        self.cavitation.setObjectName(u"cavitation")
+        self.cavitation.setCheckable(True)
+        self.cavitation.setChecked(False)
+        self.verticalLayout_7 = QVBoxLayout(self.cavitation)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.groupBox_2 = QGroupBox(self.cavitation)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.schnerrSauer = QRadioButton(self.groupBox_2)
+        self.schnerrSauer.setObjectName(u"schnerrSauer")
+
+        self.verticalLayout_6.addWidget(self.schnerrSauer)
+
+        self.kunz = QRadioButton(self.groupBox_2)
+        self.kunz.setObjectName(u"kunz")
+
+        self.verticalLayout_6.addWidget(self.kunz)
+
+        self.merkle = QRadioButton(self.groupBox_2)
+        self.merkle.setObjectName(u"merkle")
+
+        self.verticalLayout_6.addWidget(self.merkle)
+
+        self.zwartGerberBelamri = QRadioButton(self.groupBox_2)
+        self.zwartGerberBelamri.setObjectName(u"zwartGerberBelamri")
+
+        self.verticalLayout_6.addWidget(self.zwartGerberBelamri)
+
+
+        self.verticalLayout_7.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.cavitation)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_2 = QFormLayout(self.groupBox_3)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.vaporizationPressure = QLineEdit(self.groupBox_3)
+        self.vaporizationPressure.setObjectName(u"vaporizationPressure")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.vaporizationPressure)
+
+
+        self.verticalLayout_7.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout_4.addWidget(self.cavitation)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer)
+
+
+        self.verticalLayout_2.addWidget(self.multiphase)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.retranslateUi(MaterialsWidget)
+
+        QMetaObject.connectSlotsByName(MaterialsWidget)
+    # setupUi
+
+    def retranslateUi(self, MaterialsWidget):
+        MaterialsWidget.setWindowTitle(QCoreApplication.translate("MaterialsWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MaterialsWidget", u"Materials", None))
+        self.label_3.setText(QCoreApplication.translate("MaterialsWidget", u"Material", None))
+        self.label.setText(QCoreApplication.translate("MaterialsWidget", u"Primary Material", None))
+        self.materialsSelect.setText(QCoreApplication.translate("MaterialsWidget", u"Select", None))
+        self.label_2.setText(QCoreApplication.translate("MaterialsWidget", u"Secondary Materials", None))
+        self.surfaceTension.setTitle(QCoreApplication.translate("MaterialsWidget", u"Surface Tension", None))
+        self.cavitation.setTitle(QCoreApplication.translate("MaterialsWidget", u"Cavitation", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("MaterialsWidget", u"Model", None))
+        self.schnerrSauer.setText(QCoreApplication.translate("MaterialsWidget", u"Schnerr-Sauer", None))
+        self.kunz.setText(QCoreApplication.translate("MaterialsWidget", u"Kunz", None))
+        self.merkle.setText(QCoreApplication.translate("MaterialsWidget", u"Merkle", None))
+        self.zwartGerberBelamri.setText(QCoreApplication.translate("MaterialsWidget", u"Zwart-Gerber-Belamri", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("MaterialsWidget", u"Cavitation Properties", None))
+        self.label_4.setText(QCoreApplication.translate("MaterialsWidget", u"Vaporization Pressure (Pa)", None))
+    # retranslateUi
+
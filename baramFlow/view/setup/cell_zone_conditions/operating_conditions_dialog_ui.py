@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'operating_conditions_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_OperatingConditionsDialog(object):
+    def setupUi(self, OperatingConditionsDialog):
+        if not OperatingConditionsDialog.objectName():
+            OperatingConditionsDialog.setObjectName(u"OperatingConditionsDialog")
+        OperatingConditionsDialog.resize(495, 198)
+        self.verticalLayout_2 = QVBoxLayout(OperatingConditionsDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(OperatingConditionsDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.horizontalLayout = QHBoxLayout(self.groupBox)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.operationPressure = QLineEdit(self.widget)
+        self.operationPressure.setObjectName(u"operationPressure")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.operationPressure)
+
+
+        self.horizontalLayout.addWidget(self.widget)
+
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_2 = QFormLayout(self.groupBox_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.groupBox_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.referencePressureLocationX = QLineEdit(self.groupBox_2)
+        self.referencePressureLocationX.setObjectName(u"referencePressureLocationX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.referencePressureLocationX)
+
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.referencePressureLocationY = QLineEdit(self.groupBox_2)
+        self.referencePressureLocationY.setObjectName(u"referencePressureLocationY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.referencePressureLocationY)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.referencePressureLocationZ = QLineEdit(self.groupBox_2)
+        self.referencePressureLocationZ.setObjectName(u"referencePressureLocationZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.referencePressureLocationZ)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_2)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(OperatingConditionsDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(OperatingConditionsDialog)
+        self.buttonBox.accepted.connect(OperatingConditionsDialog.accept)
+        self.buttonBox.rejected.connect(OperatingConditionsDialog.reject)
+
+        QMetaObject.connectSlotsByName(OperatingConditionsDialog)
+    # setupUi
+
+    def retranslateUi(self, OperatingConditionsDialog):
+        OperatingConditionsDialog.setWindowTitle(QCoreApplication.translate("OperatingConditionsDialog", u"Cell Zone Operating Conditions", None))
+        self.groupBox.setTitle(QCoreApplication.translate("OperatingConditionsDialog", u"Pressure", None))
+        self.label.setText(QCoreApplication.translate("OperatingConditionsDialog", u"Operation Pressure (Pa)", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("OperatingConditionsDialog", u"Reference Pressure Location", None))
+        self.label_2.setText(QCoreApplication.translate("OperatingConditionsDialog", u"X (m)", None))
+        self.label_3.setText(QCoreApplication.translate("OperatingConditionsDialog", u"Y (m)", None))
+        self.label_4.setText(QCoreApplication.translate("OperatingConditionsDialog", u"Z (m)", None))
+    # retranslateUi
+
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'porous_zone_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_porousZoneWidget(object):
+    def setupUi(self, porousZoneWidget):
+        if not porousZoneWidget.objectName():
+            porousZoneWidget.setObjectName(u"porousZoneWidget")
+        porousZoneWidget.resize(222, 666)
+        self.verticalLayout_2 = QVBoxLayout(porousZoneWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(porousZoneWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_6 = QFormLayout(self.widget)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.model = EnumComboBox(self.widget)
+        self.model.setObjectName(u"model")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.model)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.darcyForchheimer = QGroupBox(self.groupBox)
+        self.darcyForchheimer.setObjectName(u"darcyForchheimer")
+        self.verticalLayout_3 = QVBoxLayout(self.darcyForchheimer)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.groupBox_3 = QGroupBox(self.darcyForchheimer)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_2 = QFormLayout(self.groupBox_3)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.direction1VectorX = QLineEdit(self.groupBox_3)
+        self.direction1VectorX.setObjectName(u"direction1VectorX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.direction1VectorX)
+
+        self.label_3 = QLabel(self.groupBox_3)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.direction1VectorY = QLineEdit(self.groupBox_3)
+        self.direction1VectorY.setObjectName(u"direction1VectorY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.direction1VectorY)
+
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.direction1VectorZ = QLineEdit(self.groupBox_3)
+        self.direction1VectorZ.setObjectName(u"direction1VectorZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.direction1VectorZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+        self.groupBox_4 = QGroupBox(self.darcyForchheimer)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.formLayout_3 = QFormLayout(self.groupBox_4)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_5 = QLabel(self.groupBox_4)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.direction2VectorX = QLineEdit(self.groupBox_4)
+        self.direction2VectorX.setObjectName(u"direction2VectorX")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.direction2VectorX)
+
+        self.label_6 = QLabel(self.groupBox_4)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.direction2VectorY = QLineEdit(self.groupBox_4)
+        self.direction2VectorY.setObjectName(u"direction2VectorY")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.direction2VectorY)
+
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.direction2VectorZ = QLineEdit(self.groupBox_4)
+        self.direction2VectorZ.setObjectName(u"direction2VectorZ")
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.direction2VectorZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_4)
+
+        self.groupBox_6 = QGroupBox(self.darcyForchheimer)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.formLayout_5 = QFormLayout(self.groupBox_6)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.label_11 = QLabel(self.groupBox_6)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_11)
+
+        self.inertialResistanceCoefficientX = QLineEdit(self.groupBox_6)
+        self.inertialResistanceCoefficientX.setObjectName(u"inertialResistanceCoefficientX")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.inertialResistanceCoefficientX)
+
+        self.label_12 = QLabel(self.groupBox_6)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_12)
+
+        self.inertialResistanceCoefficientY = QLineEdit(self.groupBox_6)
+        self.inertialResistanceCoefficientY.setObjectName(u"inertialResistanceCoefficientY")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.inertialResistanceCoefficientY)
+
+        self.label_13 = QLabel(self.groupBox_6)
+        self.label_13.setObjectName(u"label_13")
+
+        self.formLayout_5.setWidget(2, QFormLayout.LabelRole, self.label_13)
+
+        self.inertialResistanceCoefficientZ = QLineEdit(self.groupBox_6)
+        self.inertialResistanceCoefficientZ.setObjectName(u"inertialResistanceCoefficientZ")
+
+        self.formLayout_5.setWidget(2, QFormLayout.FieldRole, self.inertialResistanceCoefficientZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_6)
+
+        self.groupBox_5 = QGroupBox(self.darcyForchheimer)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.formLayout_4 = QFormLayout(self.groupBox_5)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_8 = QLabel(self.groupBox_5)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_8)
+
+        self.viscousResistanceCoefficientX = QLineEdit(self.groupBox_5)
+        self.viscousResistanceCoefficientX.setObjectName(u"viscousResistanceCoefficientX")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.viscousResistanceCoefficientX)
+
+        self.label_9 = QLabel(self.groupBox_5)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_9)
+
+        self.viscousResistanceCoefficientY = QLineEdit(self.groupBox_5)
+        self.viscousResistanceCoefficientY.setObjectName(u"viscousResistanceCoefficientY")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.viscousResistanceCoefficientY)
+
+        self.label_10 = QLabel(self.groupBox_5)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_10)
+
+        self.viscousResistanceCoefficientZ = QLineEdit(self.groupBox_5)
+        self.viscousResistanceCoefficientZ.setObjectName(u"viscousResistanceCoefficientZ")
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.viscousResistanceCoefficientZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_5)
+
+
+        self.verticalLayout.addWidget(self.darcyForchheimer)
+
+        self.powerLaw = QGroupBox(self.groupBox)
+        self.powerLaw.setObjectName(u"powerLaw")
+        self.formLayout = QFormLayout(self.powerLaw)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_14 = QLabel(self.powerLaw)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_14)
+
+        self.c0 = QLineEdit(self.powerLaw)
+        self.c0.setObjectName(u"c0")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.c0)
+
+        self.label_15 = QLabel(self.powerLaw)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_15)
+
+        self.c1 = QLineEdit(self.powerLaw)
+        self.c1.setObjectName(u"c1")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.c1)
+
+
+        self.verticalLayout.addWidget(self.powerLaw)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+
+        self.retranslateUi(porousZoneWidget)
+
+        QMetaObject.connectSlotsByName(porousZoneWidget)
+    # setupUi
+
+    def retranslateUi(self, porousZoneWidget):
+        porousZoneWidget.setWindowTitle(QCoreApplication.translate("porousZoneWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("porousZoneWidget", u"Porous Zone", None))
+        self.label.setText(QCoreApplication.translate("porousZoneWidget", u"Model", None))
+        self.darcyForchheimer.setTitle(QCoreApplication.translate("porousZoneWidget", u"Darcy-Forchheimer", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("porousZoneWidget", u"Direction-1 Vector", None))
+        self.label_2.setText(QCoreApplication.translate("porousZoneWidget", u"X", None))
+        self.label_3.setText(QCoreApplication.translate("porousZoneWidget", u"Y", None))
+        self.label_4.setText(QCoreApplication.translate("porousZoneWidget", u"Z", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("porousZoneWidget", u"Direction-2 Vector", None))
+        self.label_5.setText(QCoreApplication.translate("porousZoneWidget", u"X", None))
+        self.label_6.setText(QCoreApplication.translate("porousZoneWidget", u"Y", None))
+        self.label_7.setText(QCoreApplication.translate("porousZoneWidget", u"Z", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("porousZoneWidget", u"Inertial Resistance Coefficient", None))
+        self.label_11.setText(QCoreApplication.translate("porousZoneWidget", u"X (1/m)", None))
+        self.label_12.setText(QCoreApplication.translate("porousZoneWidget", u"Y (1/m)", None))
+        self.label_13.setText(QCoreApplication.translate("porousZoneWidget", u"Z (1/m)", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("porousZoneWidget", u"Viscous Resistance Coefficient", None))
+        self.label_8.setText(QCoreApplication.translate("porousZoneWidget", u"X (1/m<sup>2</sup>)", None))
+        self.label_9.setText(QCoreApplication.translate("porousZoneWidget", u"Y (1/m<sup>2</sup>)", None))
+        self.label_10.setText(QCoreApplication.translate("porousZoneWidget", u"Z (1/m<sup>2</sup>)", None))
+        self.powerLaw.setTitle(QCoreApplication.translate("porousZoneWidget", u"Power Law", None))
+        self.label_14.setText(QCoreApplication.translate("porousZoneWidget", u"C0", None))
+        self.label_15.setText(QCoreApplication.translate("porousZoneWidget", u"C1", None))
+    # retranslateUi
+
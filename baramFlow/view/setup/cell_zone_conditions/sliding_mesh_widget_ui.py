@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'sliding_mesh_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QLabel,
+    QLineEdit, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_SlidingMeshWidget(object):
+    def setupUi(self, SlidingMeshWidget):
+        if not SlidingMeshWidget.objectName():
+            SlidingMeshWidget.setObjectName(u"SlidingMeshWidget")
+        SlidingMeshWidget.resize(202, 298)
+        self.verticalLayout = QVBoxLayout(SlidingMeshWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupbox = QGroupBox(SlidingMeshWidget)
+        self.groupbox.setObjectName(u"groupbox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupbox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_3 = QWidget(self.groupbox)
+        self.widget_3.setObjectName(u"widget_3")
+        self.formLayout = QFormLayout(self.widget_3)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_3)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.rotatingSpeed = QLineEdit(self.widget_3)
+        self.rotatingSpeed.setObjectName(u"rotatingSpeed")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.rotatingSpeed)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+        self.groupBox_3 = QGroupBox(self.groupbox)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_2 = QFormLayout(self.groupBox_3)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.rotationAxisOriginX = QLineEdit(self.groupBox_3)
+        self.rotationAxisOriginX.setObjectName(u"rotationAxisOriginX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.rotationAxisOriginX)
+
+        self.label_3 = QLabel(self.groupBox_3)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.rotationAxisOriginY = QLineEdit(self.groupBox_3)
+        self.rotationAxisOriginY.setObjectName(u"rotationAxisOriginY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.rotationAxisOriginY)
+
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.rotationAxisOriginZ = QLineEdit(self.groupBox_3)
+        self.rotationAxisOriginZ.setObjectName(u"rotationAxisOriginZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.rotationAxisOriginZ)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_3)
+
+        self.groupBox_4 = QGroupBox(self.groupbox)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.formLayout_3 = QFormLayout(self.groupBox_4)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_5 = QLabel(self.groupBox_4)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.rotationAxisDirectionX = QLineEdit(self.groupBox_4)
+        self.rotationAxisDirectionX.setObjectName(u"rotationAxisDirectionX")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.rotationAxisDirectionX)
+
+        self.label_6 = QLabel(self.groupBox_4)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.rotationAxisDirectionY = QLineEdit(self.groupBox_4)
+        self.rotationAxisDirectionY.setObjectName(u"rotationAxisDirectionY")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.rotationAxisDirectionY)
+
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.rotationAxisDirectionZ = QLineEdit(self.groupBox_4)
+        self.rotationAxisDirectionZ.setObjectName(u"rotationAxisDirectionZ")
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.rotationAxisDirectionZ)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_4)
+
+
+        self.verticalLayout.addWidget(self.groupbox)
+
+
+        self.retranslateUi(SlidingMeshWidget)
+
+        QMetaObject.connectSlotsByName(SlidingMeshWidget)
+    # setupUi
+
+    def retranslateUi(self, SlidingMeshWidget):
+        SlidingMeshWidget.setWindowTitle(QCoreApplication.translate("SlidingMeshWidget", u"Form", None))
+        self.groupbox.setTitle(QCoreApplication.translate("SlidingMeshWidget", u"Sliding Mesh", None))
+        self.label.setText(QCoreApplication.translate("SlidingMeshWidget", u"Rotating Speed (RPM)", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("SlidingMeshWidget", u"Rotation-Axis Origin", None))
+        self.label_2.setText(QCoreApplication.translate("SlidingMeshWidget", u"X (m)", None))
+        self.label_3.setText(QCoreApplication.translate("SlidingMeshWidget", u"Y (m)", None))
+        self.label_4.setText(QCoreApplication.translate("SlidingMeshWidget", u"Z (m)", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("SlidingMeshWidget", u"Rotation-Axis Direction", None))
+        self.label_5.setText(QCoreApplication.translate("SlidingMeshWidget", u"X", None))
+        self.label_6.setText(QCoreApplication.translate("SlidingMeshWidget", u"Y", None))
+        self.label_7.setText(QCoreApplication.translate("SlidingMeshWidget", u"Z", None))
+    # retranslateUi
+
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'variable_source_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_VariableSourceWidget(object):
+    def setupUi(self, VariableSourceWidget):
+        if not VariableSourceWidget.objectName():
+            VariableSourceWidget.setObjectName(u"VariableSourceWidget")
+        VariableSourceWidget.resize(428, 116)
+        self.verticalLayout = QVBoxLayout(VariableSourceWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(VariableSourceWidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.groupBox.setCheckable(True)
+        self.groupBox.setChecked(False)
+        self.formLayout = QFormLayout(self.groupBox)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_1 = QLabel(self.groupBox)
+        self.label_1.setObjectName(u"label_1")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_1)
+
+        self.specificationMethod = EnumComboBox(self.groupBox)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+        self.specificationMethod.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.widget_4 = QWidget(self.groupBox)
+        self.widget_4.setObjectName(u"widget_4")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_4)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.widget_3 = QWidget(self.widget_4)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout = QHBoxLayout(self.widget_3)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.temporalProfileType = EnumComboBox(self.widget_3)
+        self.temporalProfileType.setObjectName(u"temporalProfileType")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.temporalProfileType.sizePolicy().hasHeightForWidth())
+        self.temporalProfileType.setSizePolicy(sizePolicy)
+        self.temporalProfileType.setMinimumSize(QSize(0, 0))
+
+        self.horizontalLayout.addWidget(self.temporalProfileType)
+
+        self.edit = QPushButton(self.widget_3)
+        self.edit.setObjectName(u"edit")
+
+        self.horizontalLayout.addWidget(self.edit)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.widget_4)
+
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label)
+
+        self.constantValue = QLineEdit(self.groupBox)
+        self.constantValue.setObjectName(u"constantValue")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.constantValue)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.retranslateUi(VariableSourceWidget)
+
+        QMetaObject.connectSlotsByName(VariableSourceWidget)
+    # setupUi
+
+    def retranslateUi(self, VariableSourceWidget):
+        VariableSourceWidget.setWindowTitle(QCoreApplication.translate("VariableSourceWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("VariableSourceWidget", u"GroupBox", None))
+        self.label_1.setText(QCoreApplication.translate("VariableSourceWidget", u"Specification Method", None))
+        self.label_2.setText(QCoreApplication.translate("VariableSourceWidget", u"Temporal Profile Type", None))
+        self.edit.setText(QCoreApplication.translate("VariableSourceWidget", u"Edit", None))
+        self.label.setText(QCoreApplication.translate("VariableSourceWidget", u"Value", None))
+        self.constantValue.setText(QCoreApplication.translate("VariableSourceWidget", u"0", None))
+    # retranslateUi
+
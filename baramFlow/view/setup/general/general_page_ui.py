@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'general_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QFrame, QGroupBox,
+    QLabel, QLineEdit, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_GeneralPage(object):
+    def setupUi(self, GeneralPage):
+        if not GeneralPage.objectName():
+            GeneralPage.setObjectName(u"GeneralPage")
+        GeneralPage.resize(250, 500)
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(GeneralPage.sizePolicy().hasHeightForWidth())
+        GeneralPage.setSizePolicy(sizePolicy)
+        GeneralPage.setMinimumSize(QSize(0, 0))
+        self.verticalLayout_2 = QVBoxLayout(GeneralPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.title = QLabel(GeneralPage)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout_2.addWidget(self.title)
+
+        self.line = QFrame(GeneralPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_2.addWidget(self.line)
+
+        self.groupBox = QGroupBox(GeneralPage)
+        self.groupBox.setObjectName(u"groupBox")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy1)
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.steady = QRadioButton(self.groupBox)
+        self.steady.setObjectName(u"steady")
+
+        self.verticalLayout.addWidget(self.steady)
+
+        self.transient_ = QRadioButton(self.groupBox)
+        self.transient_.setObjectName(u"transient_")
+
+        self.verticalLayout.addWidget(self.transient_)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.gravity = QGroupBox(GeneralPage)
+        self.gravity.setObjectName(u"gravity")
+        self.formLayout = QFormLayout(self.gravity)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_x = QLabel(self.gravity)
+        self.label_x.setObjectName(u"label_x")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.label_x.sizePolicy().hasHeightForWidth())
+        self.label_x.setSizePolicy(sizePolicy2)
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_x)
+
+        self.gravityX = QLineEdit(self.gravity)
+        self.gravityX.setObjectName(u"gravityX")
+        self.gravityX.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.gravityX)
+
+        self.label_y = QLabel(self.gravity)
+        self.label_y.setObjectName(u"label_y")
+        sizePolicy2.setHeightForWidth(self.label_y.sizePolicy().hasHeightForWidth())
+        self.label_y.setSizePolicy(sizePolicy2)
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_y)
+
+        self.gravityY = QLineEdit(self.gravity)
+        self.gravityY.setObjectName(u"gravityY")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.gravityY)
+
+        self.label_z = QLabel(self.gravity)
+        self.label_z.setObjectName(u"label_z")
+        sizePolicy2.setHeightForWidth(self.label_z.sizePolicy().hasHeightForWidth())
+        self.label_z.setSizePolicy(sizePolicy2)
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_z)
+
+        self.gravityZ = QLineEdit(self.gravity)
+        self.gravityZ.setObjectName(u"gravityZ")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.gravityZ)
+
+
+        self.verticalLayout_2.addWidget(self.gravity)
+
+        self.groupBox_2 = QGroupBox(GeneralPage)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget = QWidget(self.groupBox_2)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+        sizePolicy2.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy2)
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.operatingPressure = QLineEdit(self.widget)
+        self.operatingPressure.setObjectName(u"operatingPressure")
+        self.operatingPressure.setEnabled(True)
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.operatingPressure)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_2)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(GeneralPage)
+
+        QMetaObject.connectSlotsByName(GeneralPage)
+    # setupUi
+
+    def retranslateUi(self, GeneralPage):
+        GeneralPage.setWindowTitle(QCoreApplication.translate("GeneralPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("GeneralPage", u"General", None))
+        self.groupBox.setTitle(QCoreApplication.translate("GeneralPage", u"Time", None))
+        self.steady.setText(QCoreApplication.translate("GeneralPage", u"Steady", None))
+        self.transient_.setText(QCoreApplication.translate("GeneralPage", u"Transient", None))
+        self.gravity.setTitle(QCoreApplication.translate("GeneralPage", u"Gravity", None))
+        self.label_x.setText(QCoreApplication.translate("GeneralPage", u"X(m/s<sup>2</sup>)", None))
+        self.gravityX.setText("")
+        self.label_y.setText(QCoreApplication.translate("GeneralPage", u"Y(m/s<sup>2</sup>)", None))
+        self.gravityY.setText("")
+        self.label_z.setText(QCoreApplication.translate("GeneralPage", u"Z(m/s<sup>2</sup>)", None))
+        self.gravityZ.setText("")
+        self.groupBox_2.setTitle(QCoreApplication.translate("GeneralPage", u"Operating Conditions", None))
+        self.label.setText(QCoreApplication.translate("GeneralPage", u"Operating Pressure (Pa)", None))
+        self.operatingPressure.setText("")
+    # retranslateUi
+
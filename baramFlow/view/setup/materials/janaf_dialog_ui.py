@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'janaf_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_JanafDialog(object):
+    def setupUi(self, JanafDialog):
+        if not JanafDialog.objectName():
+            JanafDialog.setObjectName(u"JanafDialog")
+        JanafDialog.resize(400, 418)
+        self.verticalLayout = QVBoxLayout(JanafDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(JanafDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.dialogContents.sizePolicy().hasHeightForWidth())
+        self.dialogContents.setSizePolicy(sizePolicy)
+        self.verticalLayout_2 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout = QGridLayout(self.groupBox)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 0, 1, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 0, 2, 1, 1)
+
+        self.tLow = BatchableFloatEdit(self.groupBox)
+        self.tLow.setObjectName(u"tLow")
+
+        self.gridLayout.addWidget(self.tLow, 1, 0, 1, 1)
+
+        self.tCommon = BatchableFloatEdit(self.groupBox)
+        self.tCommon.setObjectName(u"tCommon")
+
+        self.gridLayout.addWidget(self.tCommon, 1, 1, 1, 1)
+
+        self.tHigh = BatchableFloatEdit(self.groupBox)
+        self.tHigh.setObjectName(u"tHigh")
+
+        self.gridLayout.addWidget(self.tHigh, 1, 2, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(self.dialogContents)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_2 = QGridLayout(self.groupBox_2)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout_2.addWidget(self.label_4, 0, 1, 1, 2)
+
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_2.addWidget(self.label_5, 0, 3, 1, 1)
+
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_2.addWidget(self.label_6, 1, 0, 1, 1)
+
+        self.a0Low = BatchableFloatEdit(self.groupBox_2)
+        self.a0Low.setObjectName(u"a0Low")
+
+        self.gridLayout_2.addWidget(self.a0Low, 1, 1, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_2)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_2.addWidget(self.label_7, 1, 2, 1, 1)
+
+        self.a0High = BatchableFloatEdit(self.groupBox_2)
+        self.a0High.setObjectName(u"a0High")
+
+        self.gridLayout_2.addWidget(self.a0High, 1, 3, 1, 1)
+
+        self.label_9 = QLabel(self.groupBox_2)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout_2.addWidget(self.label_9, 2, 0, 1, 1)
+
+        self.a1Low = BatchableFloatEdit(self.groupBox_2)
+        self.a1Low.setObjectName(u"a1Low")
+
+        self.gridLayout_2.addWidget(self.a1Low, 2, 1, 1, 1)
+
+        self.label_8 = QLabel(self.groupBox_2)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout_2.addWidget(self.label_8, 2, 2, 1, 1)
+
+        self.a1High = BatchableFloatEdit(self.groupBox_2)
+        self.a1High.setObjectName(u"a1High")
+
+        self.gridLayout_2.addWidget(self.a1High, 2, 3, 1, 1)
+
+        self.label_11 = QLabel(self.groupBox_2)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_2.addWidget(self.label_11, 3, 0, 1, 1)
+
+        self.a2Low = BatchableFloatEdit(self.groupBox_2)
+        self.a2Low.setObjectName(u"a2Low")
+
+        self.gridLayout_2.addWidget(self.a2Low, 3, 1, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox_2)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout_2.addWidget(self.label_10, 3, 2, 1, 1)
+
+        self.a2High = BatchableFloatEdit(self.groupBox_2)
+        self.a2High.setObjectName(u"a2High")
+
+        self.gridLayout_2.addWidget(self.a2High, 3, 3, 1, 1)
+
+        self.label_13 = QLabel(self.groupBox_2)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_2.addWidget(self.label_13, 4, 0, 1, 1)
+
+        self.a3Low = BatchableFloatEdit(self.groupBox_2)
+        self.a3Low.setObjectName(u"a3Low")
+
+        self.gridLayout_2.addWidget(self.a3Low, 4, 1, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox_2)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_2.addWidget(self.label_12, 4, 2, 1, 1)
+
+        self.a3High = BatchableFloatEdit(self.groupBox_2)
+        self.a3High.setObjectName(u"a3High")
+
+        self.gridLayout_2.addWidget(self.a3High, 4, 3, 1, 1)
+
+        self.label_15 = QLabel(self.groupBox_2)
+        self.label_15.setObjectName(u"label_15")
+
+        self.gridLayout_2.addWidget(self.label_15, 5, 0, 1, 1)
+
+        self.a4Low = BatchableFloatEdit(self.groupBox_2)
+        self.a4Low.setObjectName(u"a4Low")
+
+        self.gridLayout_2.addWidget(self.a4Low, 5, 1, 1, 1)
+
+        self.label_14 = QLabel(self.groupBox_2)
+        self.label_14.setObjectName(u"label_14")
+
+        self.gridLayout_2.addWidget(self.label_14, 5, 2, 1, 1)
+
+        self.a4High = BatchableFloatEdit(self.groupBox_2)
+        self.a4High.setObjectName(u"a4High")
+
+        self.gridLayout_2.addWidget(self.a4High, 5, 3, 1, 1)
+
+        self.label_17 = QLabel(self.groupBox_2)
+        self.label_17.setObjectName(u"label_17")
+
+        self.gridLayout_2.addWidget(self.label_17, 6, 0, 1, 1)
+
+        self.a5Low = BatchableFloatEdit(self.groupBox_2)
+        self.a5Low.setObjectName(u"a5Low")
+
+        self.gridLayout_2.addWidget(self.a5Low, 6, 1, 1, 1)
+
+        self.label_16 = QLabel(self.groupBox_2)
+        self.label_16.setObjectName(u"label_16")
+
+        self.gridLayout_2.addWidget(self.label_16, 6, 2, 1, 1)
+
+        self.a5High = BatchableFloatEdit(self.groupBox_2)
+        self.a5High.setObjectName(u"a5High")
+
+        self.gridLayout_2.addWidget(self.a5High, 6, 3, 1, 1)
+
+        self.label_18 = QLabel(self.groupBox_2)
+        self.label_18.setObjectName(u"label_18")
+
+        self.gridLayout_2.addWidget(self.label_18, 7, 0, 1, 1)
+
+        self.a6Low = BatchableFloatEdit(self.groupBox_2)
+        self.a6Low.setObjectName(u"a6Low")
+
+        self.gridLayout_2.addWidget(self.a6Low, 7, 1, 1, 1)
+
+        self.label_19 = QLabel(self.groupBox_2)
+        self.label_19.setObjectName(u"label_19")
+
+        self.gridLayout_2.addWidget(self.label_19, 7, 2, 1, 1)
+
+        self.a6High = BatchableFloatEdit(self.groupBox_2)
+        self.a6High.setObjectName(u"a6High")
+
+        self.gridLayout_2.addWidget(self.a6High, 7, 3, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_2)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.widget = QWidget(JanafDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(JanafDialog)
+        self.cancel.clicked.connect(JanafDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(JanafDialog)
+    # setupUi
+
+    def retranslateUi(self, JanafDialog):
+        JanafDialog.setWindowTitle(QCoreApplication.translate("JanafDialog", u"Dialog", None))
+        self.groupBox.setTitle(QCoreApplication.translate("JanafDialog", u"Temperature Range", None))
+        self.label.setText(QCoreApplication.translate("JanafDialog", u"T<sub>Low</sub> (K)", None))
+        self.label_2.setText(QCoreApplication.translate("JanafDialog", u"T<sub>Common</sub> (K)", None))
+        self.label_3.setText(QCoreApplication.translate("JanafDialog", u"T<sub>High</sub> (K)", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("JanafDialog", u"Coefficients", None))
+        self.label_4.setText(QCoreApplication.translate("JanafDialog", u"T &lt; T<sub>Common</sub>", None))
+        self.label_5.setText(QCoreApplication.translate("JanafDialog", u"T<sub>Common</sub> &lt; T", None))
+        self.label_6.setText(QCoreApplication.translate("JanafDialog", u"a0", None))
+        self.label_7.setText(QCoreApplication.translate("JanafDialog", u"  a0", None))
+        self.label_9.setText(QCoreApplication.translate("JanafDialog", u"a1", None))
+        self.label_8.setText(QCoreApplication.translate("JanafDialog", u"  a1", None))
+        self.label_11.setText(QCoreApplication.translate("JanafDialog", u"a2", None))
+        self.label_10.setText(QCoreApplication.translate("JanafDialog", u"  a2", None))
+        self.label_13.setText(QCoreApplication.translate("JanafDialog", u"a3", None))
+        self.label_12.setText(QCoreApplication.translate("JanafDialog", u"  a3", None))
+        self.label_15.setText(QCoreApplication.translate("JanafDialog", u"a4", None))
+        self.label_14.setText(QCoreApplication.translate("JanafDialog", u"  a4", None))
+        self.label_17.setText(QCoreApplication.translate("JanafDialog", u"a5", None))
+        self.label_16.setText(QCoreApplication.translate("JanafDialog", u"  a5", None))
+        self.label_18.setText(QCoreApplication.translate("JanafDialog", u"a6", None))
+        self.label_19.setText(QCoreApplication.translate("JanafDialog", u"  a6", None))
+        self.ok.setText(QCoreApplication.translate("JanafDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("JanafDialog", u"Cancel", None))
+    # retranslateUi
+
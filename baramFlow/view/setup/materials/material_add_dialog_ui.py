@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'material_add_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QHBoxLayout,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_MaterialAddDialog(object):
+    def setupUi(self, MaterialAddDialog):
+        if not MaterialAddDialog.objectName():
+            MaterialAddDialog.setObjectName(u"MaterialAddDialog")
+        MaterialAddDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(MaterialAddDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_2 = QWidget(MaterialAddDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.manageDatabase = QPushButton(self.widget_2)
+        self.manageDatabase.setObjectName(u"manageDatabase")
+
+        self.horizontalLayout.addWidget(self.manageDatabase)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.filter = QLineEdit(MaterialAddDialog)
+        self.filter.setObjectName(u"filter")
+
+        self.verticalLayout.addWidget(self.filter)
+
+        self.list = QListWidget(MaterialAddDialog)
+        self.list.setObjectName(u"list")
+        self.list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+        self.verticalLayout.addWidget(self.list)
+
+        self.widget = QWidget(MaterialAddDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.createMixture = QPushButton(self.widget)
+        self.createMixture.setObjectName(u"createMixture")
+        self.createMixture.setEnabled(False)
+
+        self.horizontalLayout_2.addWidget(self.createMixture)
+
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+        self.addMaterials = QPushButton(self.widget)
+        self.addMaterials.setObjectName(u"addMaterials")
+        self.addMaterials.setEnabled(False)
+
+        self.horizontalLayout_2.addWidget(self.addMaterials)
+
+        self.cancel = QPushButton(self.widget)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(MaterialAddDialog)
+        self.cancel.clicked.connect(MaterialAddDialog.reject)
+
+        QMetaObject.connectSlotsByName(MaterialAddDialog)
+    # setupUi
+
+    def retranslateUi(self, MaterialAddDialog):
+        MaterialAddDialog.setWindowTitle(QCoreApplication.translate("MaterialAddDialog", u"Add Mateiral", None))
+        self.label.setText(QCoreApplication.translate("MaterialAddDialog", u"Select material to add", None))
+        self.manageDatabase.setText(QCoreApplication.translate("MaterialAddDialog", u"Manage Database", None))
+        self.createMixture.setText(QCoreApplication.translate("MaterialAddDialog", u"Create Mixture", None))
+        self.addMaterials.setText(QCoreApplication.translate("MaterialAddDialog", u"Add Material(s)", None))
+        self.cancel.setText(QCoreApplication.translate("MaterialAddDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'material_card.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+import resource_rc
+
+class Ui_MaterialCard(object):
+    def setupUi(self, MaterialCard):
+        if not MaterialCard.objectName():
+            MaterialCard.setObjectName(u"MaterialCard")
+        MaterialCard.resize(279, 182)
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MaterialCard.sizePolicy().hasHeightForWidth())
+        MaterialCard.setSizePolicy(sizePolicy)
+        self.verticalLayout_3 = QVBoxLayout(MaterialCard)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(9, 0, 9, -1)
+        self.frame = QFrame(MaterialCard)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.Box)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_2 = QVBoxLayout(self.frame)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.widget = QWidget(self.frame)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setSpacing(2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.name = QLabel(self.widget)
+        self.name.setObjectName(u"name")
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setUnderline(True)
+        self.name.setFont(font)
+
+        self.horizontalLayout.addWidget(self.name)
+
+        self.phase = QLabel(self.widget)
+        self.phase.setObjectName(u"phase")
+        font1 = QFont()
+        font1.setPointSize(11)
+        self.phase.setFont(font1)
+
+        self.horizontalLayout.addWidget(self.phase)
+
+        self.horizontalSpacer = QSpacerItem(23, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.edit.sizePolicy().hasHeightForWidth())
+        self.edit.setSizePolicy(sizePolicy1)
+        icon = QIcon()
+        icon.addFile(u":/icons/create-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.edit.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.edit)
+
+        self.remove = QPushButton(self.widget)
+        self.remove.setObjectName(u"remove")
+        sizePolicy1.setHeightForWidth(self.remove.sizePolicy().hasHeightForWidth())
+        self.remove.setSizePolicy(sizePolicy1)
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/trash-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.remove.setIcon(icon1)
+
+        self.horizontalLayout.addWidget(self.remove)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.widget_6 = QWidget(self.frame)
+        self.widget_6.setObjectName(u"widget_6")
+        self.verticalLayout = QVBoxLayout(self.widget_6)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, 0, -1, -1)
+        self.widget_2 = QWidget(self.widget_6)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 0)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.density = QLabel(self.widget_2)
+        self.density.setObjectName(u"density")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.density.sizePolicy().hasHeightForWidth())
+        self.density.setSizePolicy(sizePolicy2)
+        self.density.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_2.addWidget(self.density)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.specificHeatWidget = QWidget(self.widget_6)
+        self.specificHeatWidget.setObjectName(u"specificHeatWidget")
+        self.horizontalLayout_3 = QHBoxLayout(self.specificHeatWidget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, -1, 0)
+        self.label_4 = QLabel(self.specificHeatWidget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_3.addWidget(self.label_4)
+
+        self.specificHeat = QLabel(self.specificHeatWidget)
+        self.specificHeat.setObjectName(u"specificHeat")
+        sizePolicy2.setHeightForWidth(self.specificHeat.sizePolicy().hasHeightForWidth())
+        self.specificHeat.setSizePolicy(sizePolicy2)
+        self.specificHeat.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_3.addWidget(self.specificHeat)
+
+
+        self.verticalLayout.addWidget(self.specificHeatWidget)
+
+        self.viscosistyWidget = QWidget(self.widget_6)
+        self.viscosistyWidget.setObjectName(u"viscosistyWidget")
+        self.horizontalLayout_4 = QHBoxLayout(self.viscosistyWidget)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(-1, -1, -1, 0)
+        self.label_7 = QLabel(self.viscosistyWidget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout_4.addWidget(self.label_7)
+
+        self.viscosity = QLabel(self.viscosistyWidget)
+        self.viscosity.setObjectName(u"viscosity")
+        sizePolicy2.setHeightForWidth(self.viscosity.sizePolicy().hasHeightForWidth())
+        self.viscosity.setSizePolicy(sizePolicy2)
+        self.viscosity.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_4.addWidget(self.viscosity)
+
+
+        self.verticalLayout.addWidget(self.viscosistyWidget)
+
+        self.thermalConductivityWidget = QWidget(self.widget_6)
+        self.thermalConductivityWidget.setObjectName(u"thermalConductivityWidget")
+        self.horizontalLayout_5 = QHBoxLayout(self.thermalConductivityWidget)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, -1, -1, 0)
+        self.label_3 = QLabel(self.thermalConductivityWidget)
+        self.label_3.setObjectName(u"label_3")
+        sizePolicy1.setHeightForWidth(self.label_3.sizePolicy().hasHeightForWidth())
+        self.label_3.setSizePolicy(sizePolicy1)
+        self.label_3.setWordWrap(True)
+
+        self.horizontalLayout_5.addWidget(self.label_3)
+
+        self.thermalConductivity = QLabel(self.thermalConductivityWidget)
+        self.thermalConductivity.setObjectName(u"thermalConductivity")
+        sizePolicy2.setHeightForWidth(self.thermalConductivity.sizePolicy().hasHeightForWidth())
+        self.thermalConductivity.setSizePolicy(sizePolicy2)
+        self.thermalConductivity.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_5.addWidget(self.thermalConductivity)
+
+
+        self.verticalLayout.addWidget(self.thermalConductivityWidget)
+
+
+        self.verticalLayout_2.addWidget(self.widget_6)
+
+
+        self.verticalLayout_3.addWidget(self.frame)
+
+
+        self.retranslateUi(MaterialCard)
+
+        QMetaObject.connectSlotsByName(MaterialCard)
+    # setupUi
+
+    def retranslateUi(self, MaterialCard):
+        MaterialCard.setWindowTitle(QCoreApplication.translate("MaterialCard", u"Form", None))
+        self.name.setText(QCoreApplication.translate("MaterialCard", u"TextLabel", None))
+        self.phase.setText(QCoreApplication.translate("MaterialCard", u"TextLabel", None))
+        self.edit.setText("")
+        self.remove.setText("")
+        self.label.setText(QCoreApplication.translate("MaterialCard", u"Density", None))
+        self.density.setText(QCoreApplication.translate("MaterialCard", u"TextLabel", None))
+        self.label_4.setText(QCoreApplication.translate("MaterialCard", u"Specific Heat, C<sub>P</sub>", None))
+        self.specificHeat.setText(QCoreApplication.translate("MaterialCard", u"TextLabel", None))
+        self.label_7.setText(QCoreApplication.translate("MaterialCard", u"Viscosity", None))
+        self.viscosity.setText(QCoreApplication.translate("MaterialCard", u"TextLabel", None))
+        self.label_3.setText(QCoreApplication.translate("MaterialCard", u"Thermal Conductivity", None))
+        self.thermalConductivity.setText(QCoreApplication.translate("MaterialCard", u"TextLabel", None))
+    # retranslateUi
+
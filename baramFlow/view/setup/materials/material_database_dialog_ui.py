@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'material_database_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QGroupBox,
+    QHBoxLayout, QHeaderView, QPushButton, QSizePolicy,
+    QSpacerItem, QTreeWidget, QTreeWidgetItem, QVBoxLayout,
+    QWidget)
+
+class Ui_MaterialDatabaseDialog(object):
+    def setupUi(self, MaterialDatabaseDialog):
+        if not MaterialDatabaseDialog.objectName():
+            MaterialDatabaseDialog.setObjectName(u"MaterialDatabaseDialog")
+        MaterialDatabaseDialog.resize(833, 386)
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MaterialDatabaseDialog.sizePolicy().hasHeightForWidth())
+        MaterialDatabaseDialog.setSizePolicy(sizePolicy)
+        self.verticalLayout = QVBoxLayout(MaterialDatabaseDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_3 = QGroupBox(MaterialDatabaseDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        sizePolicy.setHeightForWidth(self.widget_3.sizePolicy().hasHeightForWidth())
+        self.widget_3.setSizePolicy(sizePolicy)
+        self.verticalLayout_2 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.list = QTreeWidget(self.widget_3)
+        self.list.setObjectName(u"list")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.list.sizePolicy().hasHeightForWidth())
+        self.list.setSizePolicy(sizePolicy1)
+        self.list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.list.setAutoScroll(False)
+        self.list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.list.setColumnCount(0)
+
+        self.verticalLayout_2.addWidget(self.list)
+
+        self.widget_2 = QWidget(self.widget_3)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, 0, 0, 0)
+        self.horizontalSpacer_2 = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.delete_ = QPushButton(self.widget_2)
+        self.delete_.setObjectName(u"delete_")
+        self.delete_.setEnabled(False)
+
+        self.horizontalLayout_2.addWidget(self.delete_)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.widget = QWidget(MaterialDatabaseDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.export_ = QPushButton(self.widget)
+        self.export_.setObjectName(u"export_")
+
+        self.horizontalLayout_3.addWidget(self.export_)
+
+        self.import_ = QPushButton(self.widget)
+        self.import_.setObjectName(u"import_")
+
+        self.horizontalLayout_3.addWidget(self.import_)
+
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(MaterialDatabaseDialog)
+        self.cancel.clicked.connect(MaterialDatabaseDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(MaterialDatabaseDialog)
+    # setupUi
+
+    def retranslateUi(self, MaterialDatabaseDialog):
+        MaterialDatabaseDialog.setWindowTitle(QCoreApplication.translate("MaterialDatabaseDialog", u"Material Database", None))
+        self.widget_3.setTitle(QCoreApplication.translate("MaterialDatabaseDialog", u"Materials", None))
+        self.delete_.setText(QCoreApplication.translate("MaterialDatabaseDialog", u"Delete", None))
+        self.export_.setText(QCoreApplication.translate("MaterialDatabaseDialog", u"Export", None))
+        self.import_.setText(QCoreApplication.translate("MaterialDatabaseDialog", u"Import", None))
+        self.ok.setText(QCoreApplication.translate("MaterialDatabaseDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("MaterialDatabaseDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,651 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'material_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGridLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.setup.models.DPM.function1_widget import Function1ScalarWidget
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_MaterialDialog(object):
+    def setupUi(self, MaterialDialog):
+        if not MaterialDialog.objectName():
+            MaterialDialog.setObjectName(u"MaterialDialog")
+        MaterialDialog.resize(309, 835)
+        self.verticalLayout = QVBoxLayout(MaterialDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(MaterialDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_3 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_6 = QFormLayout(self.widget)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(0, 0, 0, -1)
+        self.label_7 = QLabel(self.widget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_7)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.widget_2 = QWidget(self.groupBox)
+        self.widget_2.setObjectName(u"widget_2")
+        self.formLayout_7 = QFormLayout(self.widget_2)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.formLayout_7.setContentsMargins(0, -1, 0, 0)
+        self.label_2 = QLabel(self.widget_2)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.label_4 = QLabel(self.widget_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_7.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.constantDensity = QLineEdit(self.widget_2)
+        self.constantDensity.setObjectName(u"constantDensity")
+
+        self.formLayout_7.setWidget(1, QFormLayout.FieldRole, self.constantDensity)
+
+        self.widget_90 = QWidget(self.widget_2)
+        self.widget_90.setObjectName(u"widget_90")
+        self.horizontalLayout = QHBoxLayout(self.widget_90)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(-1, 0, -1, 0)
+        self.densitySpec = PythonComboBox(self.widget_90)
+        self.densitySpec.setObjectName(u"densitySpec")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.densitySpec.sizePolicy().hasHeightForWidth())
+        self.densitySpec.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout.addWidget(self.densitySpec)
+
+        self.densityEdit = QPushButton(self.widget_90)
+        self.densityEdit.setObjectName(u"densityEdit")
+
+        self.horizontalLayout.addWidget(self.densityEdit)
+
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.widget_90)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.boussinesq = QWidget(self.groupBox)
+        self.boussinesq.setObjectName(u"boussinesq")
+        self.formLayout_9 = QFormLayout(self.boussinesq)
+        self.formLayout_9.setObjectName(u"formLayout_9")
+        self.formLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.label_12 = QLabel(self.boussinesq)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.label_12)
+
+        self.boussinesqRho0 = QLineEdit(self.boussinesq)
+        self.boussinesqRho0.setObjectName(u"boussinesqRho0")
+
+        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.boussinesqRho0)
+
+        self.label_13 = QLabel(self.boussinesq)
+        self.label_13.setObjectName(u"label_13")
+
+        self.formLayout_9.setWidget(1, QFormLayout.LabelRole, self.label_13)
+
+        self.boussinesqT0 = QLineEdit(self.boussinesq)
+        self.boussinesqT0.setObjectName(u"boussinesqT0")
+
+        self.formLayout_9.setWidget(1, QFormLayout.FieldRole, self.boussinesqT0)
+
+        self.label_14 = QLabel(self.boussinesq)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_9.setWidget(2, QFormLayout.LabelRole, self.label_14)
+
+        self.boussinesqBeta = QLineEdit(self.boussinesq)
+        self.boussinesqBeta.setObjectName(u"boussinesqBeta")
+
+        self.formLayout_9.setWidget(2, QFormLayout.FieldRole, self.boussinesqBeta)
+
+
+        self.verticalLayout_2.addWidget(self.boussinesq)
+
+        self.perfectFluid = QWidget(self.groupBox)
+        self.perfectFluid.setObjectName(u"perfectFluid")
+        self.formLayout_11 = QFormLayout(self.perfectFluid)
+        self.formLayout_11.setObjectName(u"formLayout_11")
+        self.formLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.label_18 = QLabel(self.perfectFluid)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.label_18)
+
+        self.perfectFluidRho0 = QLineEdit(self.perfectFluid)
+        self.perfectFluidRho0.setObjectName(u"perfectFluidRho0")
+
+        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.perfectFluidRho0)
+
+        self.label_19 = QLabel(self.perfectFluid)
+        self.label_19.setObjectName(u"label_19")
+
+        self.formLayout_11.setWidget(1, QFormLayout.LabelRole, self.label_19)
+
+        self.perfectFluidT = QLineEdit(self.perfectFluid)
+        self.perfectFluidT.setObjectName(u"perfectFluidT")
+
+        self.formLayout_11.setWidget(1, QFormLayout.FieldRole, self.perfectFluidT)
+
+        self.label_20 = QLabel(self.perfectFluid)
+        self.label_20.setObjectName(u"label_20")
+
+        self.formLayout_11.setWidget(2, QFormLayout.LabelRole, self.label_20)
+
+        self.perfectFluidBeta = QLineEdit(self.perfectFluid)
+        self.perfectFluidBeta.setObjectName(u"perfectFluidBeta")
+
+        self.formLayout_11.setWidget(2, QFormLayout.FieldRole, self.perfectFluidBeta)
+
+
+        self.verticalLayout_2.addWidget(self.perfectFluid)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.specificHeatGroup = QGroupBox(self.dialogContents)
+        self.specificHeatGroup.setObjectName(u"specificHeatGroup")
+        self.formLayout_3 = QFormLayout(self.specificHeatGroup)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_5 = QLabel(self.specificHeatGroup)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.constantSpecificHeat = QLineEdit(self.specificHeatGroup)
+        self.constantSpecificHeat.setObjectName(u"constantSpecificHeat")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.constantSpecificHeat)
+
+        self.label_3 = QLabel(self.specificHeatGroup)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.widget_7 = QWidget(self.specificHeatGroup)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.specificHeatSpec = PythonComboBox(self.widget_7)
+        self.specificHeatSpec.setObjectName(u"specificHeatSpec")
+        sizePolicy.setHeightForWidth(self.specificHeatSpec.sizePolicy().hasHeightForWidth())
+        self.specificHeatSpec.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_5.addWidget(self.specificHeatSpec)
+
+        self.specificHeatEdit = QPushButton(self.widget_7)
+        self.specificHeatEdit.setObjectName(u"specificHeatEdit")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.specificHeatEdit.sizePolicy().hasHeightForWidth())
+        self.specificHeatEdit.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_5.addWidget(self.specificHeatEdit)
+
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.widget_7)
+
+
+        self.verticalLayout_3.addWidget(self.specificHeatGroup)
+
+        self.transportGroup = QGroupBox(self.dialogContents)
+        self.transportGroup.setObjectName(u"transportGroup")
+        self.verticalLayout_4 = QVBoxLayout(self.transportGroup)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_3 = QWidget(self.transportGroup)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label_15 = QLabel(self.widget_3)
+        self.label_15.setObjectName(u"label_15")
+
+        self.horizontalLayout_2.addWidget(self.label_15)
+
+        self.transportSpec = PythonComboBox(self.widget_3)
+        self.transportSpec.setObjectName(u"transportSpec")
+
+        self.horizontalLayout_2.addWidget(self.transportSpec)
+
+
+        self.verticalLayout_4.addWidget(self.widget_3)
+
+        self.viscosityGroup = QWidget(self.transportGroup)
+        self.viscosityGroup.setObjectName(u"viscosityGroup")
+        self.verticalLayout_5 = QVBoxLayout(self.viscosityGroup)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.viscosityConstantGroup = QWidget(self.viscosityGroup)
+        self.viscosityConstantGroup.setObjectName(u"viscosityConstantGroup")
+        self.gridLayout = QGridLayout(self.viscosityConstantGroup)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_16 = QLabel(self.viscosityConstantGroup)
+        self.label_16.setObjectName(u"label_16")
+
+        self.gridLayout.addWidget(self.label_16, 1, 1, 1, 1)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.gridLayout.addItem(self.horizontalSpacer, 1, 2, 1, 1)
+
+        self.viscosityConstant = QLineEdit(self.viscosityConstantGroup)
+        self.viscosityConstant.setObjectName(u"viscosityConstant")
+
+        self.gridLayout.addWidget(self.viscosityConstant, 1, 3, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.viscosityConstantGroup)
+
+        self.viscosityEditGroup = QWidget(self.viscosityGroup)
+        self.viscosityEditGroup.setObjectName(u"viscosityEditGroup")
+        self.gridLayout_3 = QGridLayout(self.viscosityEditGroup)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.gridLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.viscosityEdit = QPushButton(self.viscosityEditGroup)
+        self.viscosityEdit.setObjectName(u"viscosityEdit")
+        sizePolicy1.setHeightForWidth(self.viscosityEdit.sizePolicy().hasHeightForWidth())
+        self.viscosityEdit.setSizePolicy(sizePolicy1)
+
+        self.gridLayout_3.addWidget(self.viscosityEdit, 0, 2, 1, 1)
+
+        self.label_21 = QLabel(self.viscosityEditGroup)
+        self.label_21.setObjectName(u"label_21")
+
+        self.gridLayout_3.addWidget(self.label_21, 0, 0, 1, 1)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.gridLayout_3.addItem(self.horizontalSpacer_4, 0, 1, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.viscosityEditGroup)
+
+        self.viscositySutherlandGroup = QWidget(self.viscosityGroup)
+        self.viscositySutherlandGroup.setObjectName(u"viscositySutherlandGroup")
+        self.gridLayout_2 = QGridLayout(self.viscositySutherlandGroup)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.gridLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.viscositySutherlandGroup)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout_2.addWidget(self.label, 0, 0, 1, 1)
+
+        self.sutherlandCoefficient = QLineEdit(self.viscositySutherlandGroup)
+        self.sutherlandCoefficient.setObjectName(u"sutherlandCoefficient")
+
+        self.gridLayout_2.addWidget(self.sutherlandCoefficient, 0, 1, 1, 1)
+
+        self.label_6 = QLabel(self.viscositySutherlandGroup)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_2.addWidget(self.label_6, 1, 0, 1, 1)
+
+        self.sutherlandTemperature = QLineEdit(self.viscositySutherlandGroup)
+        self.sutherlandTemperature.setObjectName(u"sutherlandTemperature")
+
+        self.gridLayout_2.addWidget(self.sutherlandTemperature, 1, 1, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.viscositySutherlandGroup)
+
+
+        self.verticalLayout_4.addWidget(self.viscosityGroup)
+
+        self.thermalConductivityGroup = QWidget(self.transportGroup)
+        self.thermalConductivityGroup.setObjectName(u"thermalConductivityGroup")
+        self.verticalLayout_6 = QVBoxLayout(self.thermalConductivityGroup)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.thermalConductivityConstantGroup = QWidget(self.thermalConductivityGroup)
+        self.thermalConductivityConstantGroup.setObjectName(u"thermalConductivityConstantGroup")
+        self.horizontalLayout_6 = QHBoxLayout(self.thermalConductivityConstantGroup)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label_17 = QLabel(self.thermalConductivityConstantGroup)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout_6.addWidget(self.label_17)
+
+        self.thermalConductivityConstant = QLineEdit(self.thermalConductivityConstantGroup)
+        self.thermalConductivityConstant.setObjectName(u"thermalConductivityConstant")
+
+        self.horizontalLayout_6.addWidget(self.thermalConductivityConstant)
+
+
+        self.verticalLayout_6.addWidget(self.thermalConductivityConstantGroup)
+
+        self.thermalConductivityEditGroup = QWidget(self.thermalConductivityGroup)
+        self.thermalConductivityEditGroup.setObjectName(u"thermalConductivityEditGroup")
+        self.horizontalLayout_7 = QHBoxLayout(self.thermalConductivityEditGroup)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.label_22 = QLabel(self.thermalConductivityEditGroup)
+        self.label_22.setObjectName(u"label_22")
+
+        self.horizontalLayout_7.addWidget(self.label_22)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_3)
+
+        self.thermalConductivityEdit = QPushButton(self.thermalConductivityEditGroup)
+        self.thermalConductivityEdit.setObjectName(u"thermalConductivityEdit")
+        sizePolicy1.setHeightForWidth(self.thermalConductivityEdit.sizePolicy().hasHeightForWidth())
+        self.thermalConductivityEdit.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_7.addWidget(self.thermalConductivityEdit)
+
+
+        self.verticalLayout_6.addWidget(self.thermalConductivityEditGroup)
+
+
+        self.verticalLayout_4.addWidget(self.thermalConductivityGroup)
+
+
+        self.verticalLayout_3.addWidget(self.transportGroup)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.otherPropertiesContainer = QScrollArea(MaterialDialog)
+        self.otherPropertiesContainer.setObjectName(u"otherPropertiesContainer")
+        self.otherPropertiesContainer.setWidgetResizable(True)
+        self.otherProperties = QWidget()
+        self.otherProperties.setObjectName(u"otherProperties")
+        self.otherProperties.setGeometry(QRect(0, 0, 272, 442))
+        self.formLayout = QFormLayout(self.otherProperties)
+        self.formLayout.setObjectName(u"formLayout")
+        self.molecularWeightLabel = QLabel(self.otherProperties)
+        self.molecularWeightLabel.setObjectName(u"molecularWeightLabel")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.molecularWeightLabel)
+
+        self.molecularWeight = QLineEdit(self.otherProperties)
+        self.molecularWeight.setObjectName(u"molecularWeight")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.molecularWeight)
+
+        self.label_8 = QLabel(self.otherProperties)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_8)
+
+        self.criticalTemperature = QLineEdit(self.otherProperties)
+        self.criticalTemperature.setObjectName(u"criticalTemperature")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.criticalTemperature)
+
+        self.label_9 = QLabel(self.otherProperties)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_9)
+
+        self.criticalPressure = QLineEdit(self.otherProperties)
+        self.criticalPressure.setObjectName(u"criticalPressure")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.criticalPressure)
+
+        self.label_10 = QLabel(self.otherProperties)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_10)
+
+        self.criticalSpecificVolume = QLineEdit(self.otherProperties)
+        self.criticalSpecificVolume.setObjectName(u"criticalSpecificVolume")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.criticalSpecificVolume)
+
+        self.label_11 = QLabel(self.otherProperties)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout.setWidget(4, QFormLayout.LabelRole, self.label_11)
+
+        self.acentricFactor = QLineEdit(self.otherProperties)
+        self.acentricFactor.setObjectName(u"acentricFactor")
+
+        self.formLayout.setWidget(4, QFormLayout.FieldRole, self.acentricFactor)
+
+        self.label_23 = QLabel(self.otherProperties)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout.setWidget(5, QFormLayout.LabelRole, self.label_23)
+
+        self.tripleTemperature = QLineEdit(self.otherProperties)
+        self.tripleTemperature.setObjectName(u"tripleTemperature")
+
+        self.formLayout.setWidget(5, QFormLayout.FieldRole, self.tripleTemperature)
+
+        self.label_24 = QLabel(self.otherProperties)
+        self.label_24.setObjectName(u"label_24")
+
+        self.formLayout.setWidget(6, QFormLayout.LabelRole, self.label_24)
+
+        self.triplePressure = QLineEdit(self.otherProperties)
+        self.triplePressure.setObjectName(u"triplePressure")
+
+        self.formLayout.setWidget(6, QFormLayout.FieldRole, self.triplePressure)
+
+        self.saturationPressureLabel = QLabel(self.otherProperties)
+        self.saturationPressureLabel.setObjectName(u"saturationPressureLabel")
+
+        self.formLayout.setWidget(7, QFormLayout.LabelRole, self.saturationPressureLabel)
+
+        self.label_25 = QLabel(self.otherProperties)
+        self.label_25.setObjectName(u"label_25")
+
+        self.formLayout.setWidget(8, QFormLayout.LabelRole, self.label_25)
+
+        self.emissivityLabel = QLabel(self.otherProperties)
+        self.emissivityLabel.setObjectName(u"emissivityLabel")
+
+        self.formLayout.setWidget(9, QFormLayout.LabelRole, self.emissivityLabel)
+
+        self.emissivity = QLineEdit(self.otherProperties)
+        self.emissivity.setObjectName(u"emissivity")
+
+        self.formLayout.setWidget(9, QFormLayout.FieldRole, self.emissivity)
+
+        self.absorptionCoefficientLabel = QLabel(self.otherProperties)
+        self.absorptionCoefficientLabel.setObjectName(u"absorptionCoefficientLabel")
+
+        self.formLayout.setWidget(10, QFormLayout.LabelRole, self.absorptionCoefficientLabel)
+
+        self.absorptionCoefficient = QLineEdit(self.otherProperties)
+        self.absorptionCoefficient.setObjectName(u"absorptionCoefficient")
+
+        self.formLayout.setWidget(10, QFormLayout.FieldRole, self.absorptionCoefficient)
+
+        self.label_27 = QLabel(self.otherProperties)
+        self.label_27.setObjectName(u"label_27")
+
+        self.formLayout.setWidget(11, QFormLayout.LabelRole, self.label_27)
+
+        self.label_26 = QLabel(self.otherProperties)
+        self.label_26.setObjectName(u"label_26")
+
+        self.formLayout.setWidget(12, QFormLayout.LabelRole, self.label_26)
+
+        self.boilingTemperature = QLineEdit(self.otherProperties)
+        self.boilingTemperature.setObjectName(u"boilingTemperature")
+
+        self.formLayout.setWidget(12, QFormLayout.FieldRole, self.boilingTemperature)
+
+        self.label_28 = QLabel(self.otherProperties)
+        self.label_28.setObjectName(u"label_28")
+
+        self.formLayout.setWidget(13, QFormLayout.LabelRole, self.label_28)
+
+        self.virialCoeff = QLineEdit(self.otherProperties)
+        self.virialCoeff.setObjectName(u"virialCoeff")
+
+        self.formLayout.setWidget(13, QFormLayout.FieldRole, self.virialCoeff)
+
+        self.label_29 = QLabel(self.otherProperties)
+        self.label_29.setObjectName(u"label_29")
+
+        self.formLayout.setWidget(14, QFormLayout.LabelRole, self.label_29)
+
+        self.standardStateEnthalpy = QLineEdit(self.otherProperties)
+        self.standardStateEnthalpy.setObjectName(u"standardStateEnthalpy")
+
+        self.formLayout.setWidget(14, QFormLayout.FieldRole, self.standardStateEnthalpy)
+
+        self.label_30 = QLabel(self.otherProperties)
+        self.label_30.setObjectName(u"label_30")
+
+        self.formLayout.setWidget(15, QFormLayout.LabelRole, self.label_30)
+
+        self.referenceTemperature = QLineEdit(self.otherProperties)
+        self.referenceTemperature.setObjectName(u"referenceTemperature")
+
+        self.formLayout.setWidget(15, QFormLayout.FieldRole, self.referenceTemperature)
+
+        self.saturationPressure = Function1ScalarWidget(self.otherProperties)
+        self.saturationPressure.setObjectName(u"saturationPressure")
+
+        self.formLayout.setWidget(7, QFormLayout.FieldRole, self.saturationPressure)
+
+        self.enthalpyOfVaporization = Function1ScalarWidget(self.otherProperties)
+        self.enthalpyOfVaporization.setObjectName(u"enthalpyOfVaporization")
+
+        self.formLayout.setWidget(11, QFormLayout.FieldRole, self.enthalpyOfVaporization)
+
+        self.dropletSurfaceTension = Function1ScalarWidget(self.otherProperties)
+        self.dropletSurfaceTension.setObjectName(u"dropletSurfaceTension")
+
+        self.formLayout.setWidget(8, QFormLayout.FieldRole, self.dropletSurfaceTension)
+
+        self.otherPropertiesContainer.setWidget(self.otherProperties)
+
+        self.verticalLayout.addWidget(self.otherPropertiesContainer)
+
+        self.widget_4 = QWidget(MaterialDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_4)
+
+        QWidget.setTabOrder(self.name, self.densitySpec)
+        QWidget.setTabOrder(self.densitySpec, self.densityEdit)
+        QWidget.setTabOrder(self.densityEdit, self.constantDensity)
+        QWidget.setTabOrder(self.constantDensity, self.specificHeatSpec)
+        QWidget.setTabOrder(self.specificHeatSpec, self.specificHeatEdit)
+        QWidget.setTabOrder(self.specificHeatEdit, self.constantSpecificHeat)
+        QWidget.setTabOrder(self.constantSpecificHeat, self.ok)
+        QWidget.setTabOrder(self.ok, self.cancel)
+
+        self.retranslateUi(MaterialDialog)
+        self.cancel.clicked.connect(MaterialDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(MaterialDialog)
+    # setupUi
+
+    def retranslateUi(self, MaterialDialog):
+        MaterialDialog.setWindowTitle(QCoreApplication.translate("MaterialDialog", u"Material", None))
+        self.label_7.setText(QCoreApplication.translate("MaterialDialog", u"Name", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MaterialDialog", u"Density", None))
+        self.label_2.setText(QCoreApplication.translate("MaterialDialog", u"Density", None))
+        self.label_4.setText(QCoreApplication.translate("MaterialDialog", u"Value (kg/m<sup>3</sup>)", None))
+        self.densityEdit.setText(QCoreApplication.translate("MaterialDialog", u"Edit", None))
+        self.label_12.setText(QCoreApplication.translate("MaterialDialog", u"Reference Density, \u03c1 (kg/m3)", None))
+        self.label_13.setText(QCoreApplication.translate("MaterialDialog", u"Reference Temperature, T (K)", None))
+        self.label_14.setText(QCoreApplication.translate("MaterialDialog", u"Thermal Expansion Coefficient, \u03b2 (1/K)", None))
+        self.label_18.setText(QCoreApplication.translate("MaterialDialog", u"Reference Density, \u03c1 (kg/m3)", None))
+        self.label_19.setText(QCoreApplication.translate("MaterialDialog", u"Reference Temperature, T (K)", None))
+        self.label_20.setText(QCoreApplication.translate("MaterialDialog", u"Compressibility, \u03b2 (1/K)", None))
+        self.specificHeatGroup.setTitle(QCoreApplication.translate("MaterialDialog", u"Specific Heat", None))
+        self.label_5.setText(QCoreApplication.translate("MaterialDialog", u"<html><head/><body><p>Value (J/kg\u00b7K)</p></body></html>", None))
+        self.label_3.setText(QCoreApplication.translate("MaterialDialog", u"<html><head/><body><p>Specific Heat, C<span style=\" vertical-align:sub;\">P</span></p></body></html>", None))
+        self.specificHeatEdit.setText(QCoreApplication.translate("MaterialDialog", u"Edit", None))
+        self.transportGroup.setTitle(QCoreApplication.translate("MaterialDialog", u"Transport", None))
+        self.label_15.setText(QCoreApplication.translate("MaterialDialog", u"Transport Specification", None))
+        self.label_16.setText(QCoreApplication.translate("MaterialDialog", u"Viscosity (kg/m\u00b7s)", None))
+        self.viscosityEdit.setText(QCoreApplication.translate("MaterialDialog", u"Edit", None))
+        self.label_21.setText(QCoreApplication.translate("MaterialDialog", u"Viscosity (kg/m\u00b7s)", None))
+        self.label.setText(QCoreApplication.translate("MaterialDialog", u"Sutherland Coefficient, C<sub>1</sub>", None))
+        self.label_6.setText(QCoreApplication.translate("MaterialDialog", u"Sutherland Temperature, S (K)", None))
+        self.label_17.setText(QCoreApplication.translate("MaterialDialog", u"Thermal Conductivity (W/m\u00b7K)", None))
+        self.label_22.setText(QCoreApplication.translate("MaterialDialog", u"Thermal Conductivity (W/m\u00b7K)", None))
+        self.thermalConductivityEdit.setText(QCoreApplication.translate("MaterialDialog", u"Edit", None))
+        self.molecularWeightLabel.setText(QCoreApplication.translate("MaterialDialog", u"Molecular Weight (kg/kmol)", None))
+        self.label_8.setText(QCoreApplication.translate("MaterialDialog", u"Critical Temperature (K)", None))
+        self.label_9.setText(QCoreApplication.translate("MaterialDialog", u"Critical Pressure (Pa)", None))
+        self.label_10.setText(QCoreApplication.translate("MaterialDialog", u"<html><head/><body><p>Critical Specific Volume (m<span style=\" vertical-align:super;\">3</span>/kg)</p></body></html>", None))
+        self.label_11.setText(QCoreApplication.translate("MaterialDialog", u"Acentric Factor", None))
+        self.label_23.setText(QCoreApplication.translate("MaterialDialog", u"Triple Point Temperature (K)", None))
+        self.label_24.setText(QCoreApplication.translate("MaterialDialog", u"Triple Point Pressure (Pa)", None))
+        self.saturationPressureLabel.setText(QCoreApplication.translate("MaterialDialog", u"Saturation Pressure (Pa)", None))
+        self.label_25.setText(QCoreApplication.translate("MaterialDialog", u"Surface Tension (N/m)", None))
+        self.emissivityLabel.setText(QCoreApplication.translate("MaterialDialog", u"Emissivity", None))
+        self.absorptionCoefficientLabel.setText(QCoreApplication.translate("MaterialDialog", u"Absorption Coefficient", None))
+        self.label_27.setText(QCoreApplication.translate("MaterialDialog", u"Latent Heat (J/kg)", None))
+        self.label_26.setText(QCoreApplication.translate("MaterialDialog", u"Boiling Point Temperature [K]", None))
+        self.label_28.setText(QCoreApplication.translate("MaterialDialog", u"<html><head/><body><p>Second Virial Coefficient (m<span style=\" vertical-align:super;\">3</span>/kg)</p></body></html>", None))
+        self.label_29.setText(QCoreApplication.translate("MaterialDialog", u"Standard State Enthalpy (J/kg)", None))
+        self.label_30.setText(QCoreApplication.translate("MaterialDialog", u"Reference Temperature (K)", None))
+        self.ok.setText(QCoreApplication.translate("MaterialDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("MaterialDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'material_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_MaterialPage(object):
+    def setupUi(self, MaterialPage):
+        if not MaterialPage.objectName():
+            MaterialPage.setObjectName(u"MaterialPage")
+        MaterialPage.resize(250, 500)
+        self.verticalLayout = QVBoxLayout(MaterialPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, 9, -1, -1)
+        self.widget = QWidget(MaterialPage)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.title = QLabel(self.widget)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.horizontalLayout.addWidget(self.title)
+
+        self.horizontalSpacer = QSpacerItem(120, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.add = QPushButton(self.widget)
+        self.add.setObjectName(u"add")
+        icon = QIcon()
+        icon.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.add.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.add)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.line = QFrame(MaterialPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.scrollArea = QScrollArea(MaterialPage)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setWidgetResizable(True)
+        self.cardList = QWidget()
+        self.cardList.setObjectName(u"cardList")
+        self.cardList.setGeometry(QRect(0, 0, 232, 443))
+        self.scrollArea.setWidget(self.cardList)
+
+        self.verticalLayout.addWidget(self.scrollArea)
+
+
+        self.retranslateUi(MaterialPage)
+
+        QMetaObject.connectSlotsByName(MaterialPage)
+    # setupUi
+
+    def retranslateUi(self, MaterialPage):
+        MaterialPage.setWindowTitle(QCoreApplication.translate("MaterialPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("MaterialPage", u"Materials", None))
+        self.add.setText("")
+    # retranslateUi
+
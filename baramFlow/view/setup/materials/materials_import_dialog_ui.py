@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'materials_import_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QDialog,
+    QDialogButtonBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_MaterialsImportDialog(object):
+    def setupUi(self, MaterialsImportDialog):
+        if not MaterialsImportDialog.objectName():
+            MaterialsImportDialog.setObjectName(u"MaterialsImportDialog")
+        MaterialsImportDialog.resize(400, 134)
+        self.verticalLayout_2 = QVBoxLayout(MaterialsImportDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget = QWidget(MaterialsImportDialog)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.file = QLineEdit(self.widget_2)
+        self.file.setObjectName(u"file")
+        self.file.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.file)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.overwrite = QCheckBox(self.widget)
+        self.overwrite.setObjectName(u"overwrite")
+
+        self.verticalLayout.addWidget(self.overwrite)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.buttonBox = QDialogButtonBox(MaterialsImportDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(MaterialsImportDialog)
+        self.buttonBox.accepted.connect(MaterialsImportDialog.accept)
+        self.buttonBox.rejected.connect(MaterialsImportDialog.reject)
+
+        QMetaObject.connectSlotsByName(MaterialsImportDialog)
+    # setupUi
+
+    def retranslateUi(self, MaterialsImportDialog):
+        MaterialsImportDialog.setWindowTitle(QCoreApplication.translate("MaterialsImportDialog", u"Import Materials", None))
+        self.label.setText(QCoreApplication.translate("MaterialsImportDialog", u"File", None))
+        self.select.setText(QCoreApplication.translate("MaterialsImportDialog", u"Slelect", None))
+        self.overwrite.setText(QCoreApplication.translate("MaterialsImportDialog", u"Clear old materials", None))
+    # retranslateUi
+
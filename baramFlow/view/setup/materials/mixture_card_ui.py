@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mixture_card.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+import resource_rc
+
+class Ui_MixtureCard(object):
+    def setupUi(self, MixtureCard):
+        if not MixtureCard.objectName():
+            MixtureCard.setObjectName(u"MixtureCard")
+        MixtureCard.resize(303, 231)
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MixtureCard.sizePolicy().hasHeightForWidth())
+        MixtureCard.setSizePolicy(sizePolicy)
+        self.verticalLayout_3 = QVBoxLayout(MixtureCard)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, 0, 9, -1)
+        self.frame = QFrame(MixtureCard)
+        self.frame.setObjectName(u"frame")
+        self.frame.setFrameShape(QFrame.Box)
+        self.frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_2 = QVBoxLayout(self.frame)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, -1, 0, 0)
+        self.widget = QWidget(self.frame)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setSpacing(2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.name = QLabel(self.widget)
+        self.name.setObjectName(u"name")
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setUnderline(True)
+        self.name.setFont(font)
+
+        self.horizontalLayout.addWidget(self.name)
+
+        self.phase = QLabel(self.widget)
+        self.phase.setObjectName(u"phase")
+        font1 = QFont()
+        font1.setPointSize(11)
+        self.phase.setFont(font1)
+
+        self.horizontalLayout.addWidget(self.phase)
+
+        self.horizontalSpacer = QSpacerItem(23, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.edit.sizePolicy().hasHeightForWidth())
+        self.edit.setSizePolicy(sizePolicy1)
+        icon = QIcon()
+        icon.addFile(u":/icons/create-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.edit.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.edit)
+
+        self.remove = QPushButton(self.widget)
+        self.remove.setObjectName(u"remove")
+        sizePolicy1.setHeightForWidth(self.remove.sizePolicy().hasHeightForWidth())
+        self.remove.setSizePolicy(sizePolicy1)
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/trash-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.remove.setIcon(icon1)
+
+        self.horizontalLayout.addWidget(self.remove)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.widget_2 = QWidget(self.frame)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout = QVBoxLayout(self.widget_2)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, 0, -1, -1)
+        self.widget_3 = QWidget(self.widget_2)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 0)
+        self.label = QLabel(self.widget_3)
+        self.label.setObjectName(u"label")
+        self.label.setWordWrap(True)
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.densitySpec = QLabel(self.widget_3)
+        self.densitySpec.setObjectName(u"densitySpec")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.densitySpec.sizePolicy().hasHeightForWidth())
+        self.densitySpec.setSizePolicy(sizePolicy2)
+        self.densitySpec.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_2.addWidget(self.densitySpec)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.specificHeatWidget = QWidget(self.widget_2)
+        self.specificHeatWidget.setObjectName(u"specificHeatWidget")
+        self.horizontalLayout_3 = QHBoxLayout(self.specificHeatWidget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, -1, 0)
+        self.label_2 = QLabel(self.specificHeatWidget)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setWordWrap(True)
+
+        self.horizontalLayout_3.addWidget(self.label_2)
+
+        self.specificHeatSpec = QLabel(self.specificHeatWidget)
+        self.specificHeatSpec.setObjectName(u"specificHeatSpec")
+        sizePolicy2.setHeightForWidth(self.specificHeatSpec.sizePolicy().hasHeightForWidth())
+        self.specificHeatSpec.setSizePolicy(sizePolicy2)
+        self.specificHeatSpec.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_3.addWidget(self.specificHeatSpec)
+
+
+        self.verticalLayout.addWidget(self.specificHeatWidget)
+
+        self.transportWidget = QWidget(self.widget_2)
+        self.transportWidget.setObjectName(u"transportWidget")
+        self.horizontalLayout_4 = QHBoxLayout(self.transportWidget)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(-1, -1, -1, 0)
+        self.label_3 = QLabel(self.transportWidget)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setWordWrap(True)
+
+        self.horizontalLayout_4.addWidget(self.label_3)
+
+        self.transportSpec = QLabel(self.transportWidget)
+        self.transportSpec.setObjectName(u"transportSpec")
+        sizePolicy2.setHeightForWidth(self.transportSpec.sizePolicy().hasHeightForWidth())
+        self.transportSpec.setSizePolicy(sizePolicy2)
+        self.transportSpec.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_4.addWidget(self.transportSpec)
+
+
+        self.verticalLayout.addWidget(self.transportWidget)
+
+        self.widget_6 = QWidget(self.widget_2)
+        self.widget_6.setObjectName(u"widget_6")
+        sizePolicy2.setHeightForWidth(self.widget_6.sizePolicy().hasHeightForWidth())
+        self.widget_6.setSizePolicy(sizePolicy2)
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(-1, -1, -1, 0)
+        self.label_4 = QLabel(self.widget_6)
+        self.label_4.setObjectName(u"label_4")
+        sizePolicy2.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_6.addWidget(self.label_4)
+
+        self.massDiffusivity = QLabel(self.widget_6)
+        self.massDiffusivity.setObjectName(u"massDiffusivity")
+        sizePolicy2.setHeightForWidth(self.massDiffusivity.sizePolicy().hasHeightForWidth())
+        self.massDiffusivity.setSizePolicy(sizePolicy2)
+        self.massDiffusivity.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_6.addWidget(self.massDiffusivity)
+
+
+        self.verticalLayout.addWidget(self.widget_6)
+
+        self.widget_7 = QWidget(self.widget_2)
+        self.widget_7.setObjectName(u"widget_7")
+        sizePolicy2.setHeightForWidth(self.widget_7.sizePolicy().hasHeightForWidth())
+        self.widget_7.setSizePolicy(sizePolicy2)
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(-1, -1, -1, 0)
+        self.label_5 = QLabel(self.widget_7)
+        self.label_5.setObjectName(u"label_5")
+        sizePolicy2.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_7.addWidget(self.label_5)
+
+        self.primarySpecie = QLabel(self.widget_7)
+        self.primarySpecie.setObjectName(u"primarySpecie")
+        sizePolicy2.setHeightForWidth(self.primarySpecie.sizePolicy().hasHeightForWidth())
+        self.primarySpecie.setSizePolicy(sizePolicy2)
+        self.primarySpecie.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.horizontalLayout_7.addWidget(self.primarySpecie)
+
+
+        self.verticalLayout.addWidget(self.widget_7)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.widget_4 = QWidget(self.frame)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_5.setSpacing(2)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.label_8 = QLabel(self.widget_4)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout_5.addWidget(self.label_8)
+
+        self.addSpecies = QPushButton(self.widget_4)
+        self.addSpecies.setObjectName(u"addSpecies")
+        sizePolicy1.setHeightForWidth(self.addSpecies.sizePolicy().hasHeightForWidth())
+        self.addSpecies.setSizePolicy(sizePolicy1)
+        icon2 = QIcon()
+        icon2.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.addSpecies.setIcon(icon2)
+
+        self.horizontalLayout_5.addWidget(self.addSpecies)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+
+        self.verticalLayout_3.addWidget(self.frame)
+
+
+        self.retranslateUi(MixtureCard)
+
+        QMetaObject.connectSlotsByName(MixtureCard)
+    # setupUi
+
+    def retranslateUi(self, MixtureCard):
+        MixtureCard.setWindowTitle(QCoreApplication.translate("MixtureCard", u"Form", None))
+        self.name.setText(QCoreApplication.translate("MixtureCard", u"TextLabel", None))
+        self.phase.setText(QCoreApplication.translate("MixtureCard", u"(Mixture)", None))
+        self.edit.setText("")
+        self.remove.setText("")
+        self.label.setText(QCoreApplication.translate("MixtureCard", u"Density Spec.", None))
+        self.densitySpec.setText(QCoreApplication.translate("MixtureCard", u"TextLabel", None))
+        self.label_2.setText(QCoreApplication.translate("MixtureCard", u"Specific Heat Spec.", None))
+        self.specificHeatSpec.setText(QCoreApplication.translate("MixtureCard", u"TextLabel", None))
+        self.label_3.setText(QCoreApplication.translate("MixtureCard", u"Transport Spec.", None))
+        self.transportSpec.setText(QCoreApplication.translate("MixtureCard", u"TextLabel", None))
+        self.label_4.setText(QCoreApplication.translate("MixtureCard", u"Mass Diffusivity (m<sup>2</sup>/s)", None))
+        self.massDiffusivity.setText(QCoreApplication.translate("MixtureCard", u"TextLabel", None))
+        self.label_5.setText(QCoreApplication.translate("MixtureCard", u"Primary Specie", None))
+        self.primarySpecie.setText(QCoreApplication.translate("MixtureCard", u"TextLabel", None))
+        self.label_8.setText(QCoreApplication.translate("MixtureCard", u"Species", None))
+        self.addSpecies.setText("")
+    # retranslateUi
+
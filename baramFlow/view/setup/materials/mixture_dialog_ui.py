@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mixture_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDialog, QFormLayout,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_MixtureDialog(object):
+    def setupUi(self, MixtureDialog):
+        if not MixtureDialog.objectName():
+            MixtureDialog.setObjectName(u"MixtureDialog")
+        MixtureDialog.resize(377, 264)
+        self.verticalLayout = QVBoxLayout(MixtureDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(MixtureDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_2 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_6 = QFormLayout(self.widget)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.properties = QWidget(self.dialogContents)
+        self.properties.setObjectName(u"properties")
+        self.formLayout_7 = QFormLayout(self.properties)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.label_2 = QLabel(self.properties)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.densitySpec = PythonComboBox(self.properties)
+        self.densitySpec.setObjectName(u"densitySpec")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.densitySpec.sizePolicy().hasHeightForWidth())
+        self.densitySpec.setSizePolicy(sizePolicy)
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.densitySpec)
+
+        self.label_3 = QLabel(self.properties)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_7.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.specificHeatSpec = PythonComboBox(self.properties)
+        self.specificHeatSpec.setObjectName(u"specificHeatSpec")
+        sizePolicy.setHeightForWidth(self.specificHeatSpec.sizePolicy().hasHeightForWidth())
+        self.specificHeatSpec.setSizePolicy(sizePolicy)
+
+        self.formLayout_7.setWidget(1, QFormLayout.FieldRole, self.specificHeatSpec)
+
+        self.label_4 = QLabel(self.properties)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_7.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.transportSpec = PythonComboBox(self.properties)
+        self.transportSpec.setObjectName(u"transportSpec")
+        sizePolicy.setHeightForWidth(self.transportSpec.sizePolicy().hasHeightForWidth())
+        self.transportSpec.setSizePolicy(sizePolicy)
+        self.transportSpec.setMinimumSize(QSize(92, 0))
+
+        self.formLayout_7.setWidget(2, QFormLayout.FieldRole, self.transportSpec)
+
+        self.label_5 = QLabel(self.properties)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_7.setWidget(3, QFormLayout.LabelRole, self.label_5)
+
+        self.massDiffusivity = QLineEdit(self.properties)
+        self.massDiffusivity.setObjectName(u"massDiffusivity")
+
+        self.formLayout_7.setWidget(3, QFormLayout.FieldRole, self.massDiffusivity)
+
+        self.label_6 = QLabel(self.properties)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_7.setWidget(4, QFormLayout.LabelRole, self.label_6)
+
+        self.primarySpecie = QComboBox(self.properties)
+        self.primarySpecie.setObjectName(u"primarySpecie")
+        sizePolicy.setHeightForWidth(self.primarySpecie.sizePolicy().hasHeightForWidth())
+        self.primarySpecie.setSizePolicy(sizePolicy)
+
+        self.formLayout_7.setWidget(4, QFormLayout.FieldRole, self.primarySpecie)
+
+
+        self.verticalLayout_2.addWidget(self.properties)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.widget_4 = QWidget(MixtureDialog)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_4)
+
+
+        self.retranslateUi(MixtureDialog)
+        self.cancel.clicked.connect(MixtureDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(MixtureDialog)
+    # setupUi
+
+    def retranslateUi(self, MixtureDialog):
+        MixtureDialog.setWindowTitle(QCoreApplication.translate("MixtureDialog", u"Material", None))
+        self.label.setText(QCoreApplication.translate("MixtureDialog", u"Name", None))
+        self.label_2.setText(QCoreApplication.translate("MixtureDialog", u"Density Spec.", None))
+        self.label_3.setText(QCoreApplication.translate("MixtureDialog", u"Specific Heat, Spec.", None))
+        self.label_4.setText(QCoreApplication.translate("MixtureDialog", u"Transport Spec.", None))
+        self.label_5.setText(QCoreApplication.translate("MixtureDialog", u"Mass Diffusivity, D (m<sup>2</sup>/s)", None))
+        self.label_6.setText(QCoreApplication.translate("MixtureDialog", u"Primary Specie", None))
+        self.ok.setText(QCoreApplication.translate("MixtureDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("MixtureDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'thermos_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QFrame,
+    QHBoxLayout, QHeaderView, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QTableWidget, QTableWidgetItem,
+    QVBoxLayout, QWidget)
+
+class Ui_ThermosDialog(object):
+    def setupUi(self, ThermosDialog):
+        if not ThermosDialog.objectName():
+            ThermosDialog.setObjectName(u"ThermosDialog")
+        ThermosDialog.resize(546, 370)
+        self.verticalLayout = QVBoxLayout(ThermosDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(ThermosDialog)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.thermosTable = QTableWidget(ThermosDialog)
+        self.thermosTable.setObjectName(u"thermosTable")
+        self.thermosTable.setFrameShadow(QFrame.Plain)
+        self.thermosTable.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.thermosTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.thermosTable.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.thermosTable.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.thermosTable.verticalHeader().setVisible(False)
+
+        self.verticalLayout.addWidget(self.thermosTable)
+
+        self.widget = QWidget(ThermosDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.Ok = QPushButton(self.widget)
+        self.Ok.setObjectName(u"Ok")
+
+        self.horizontalLayout.addWidget(self.Ok)
+
+        self.Cancel = QPushButton(self.widget)
+        self.Cancel.setObjectName(u"Cancel")
+
+        self.horizontalLayout.addWidget(self.Cancel)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(ThermosDialog)
+
+        QMetaObject.connectSlotsByName(ThermosDialog)
+    # setupUi
+
+    def retranslateUi(self, ThermosDialog):
+        ThermosDialog.setWindowTitle(QCoreApplication.translate("ThermosDialog", u"Dialog", None))
+        self.label.setText(QCoreApplication.translate("ThermosDialog", u"Only the following combinations of specifications are allowed.\n"
+"Select a row that fits in with the case.", None))
+        self.Ok.setText(QCoreApplication.translate("ThermosDialog", u"Ok", None))
+        self.Cancel.setText(QCoreApplication.translate("ThermosDialog", u"Cancel", None))
+    # retranslateUi
+
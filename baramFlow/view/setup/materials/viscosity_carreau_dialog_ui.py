@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'viscosity_carreau_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_ViscosityCarreauDialog(object):
+    def setupUi(self, ViscosityCarreauDialog):
+        if not ViscosityCarreauDialog.objectName():
+            ViscosityCarreauDialog.setObjectName(u"ViscosityCarreauDialog")
+        ViscosityCarreauDialog.resize(400, 240)
+        self.verticalLayout = QVBoxLayout(ViscosityCarreauDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ViscosityCarreauDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.zeroShearViscosity = BatchableFloatEdit(self.widget)
+        self.zeroShearViscosity.setObjectName(u"zeroShearViscosity")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.zeroShearViscosity)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.infiniteShearViscosity = BatchableFloatEdit(self.widget)
+        self.infiniteShearViscosity.setObjectName(u"infiniteShearViscosity")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.infiniteShearViscosity)
+
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.relaxationTime = BatchableFloatEdit(self.widget)
+        self.relaxationTime.setObjectName(u"relaxationTime")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.relaxationTime)
+
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.powerLawIndex = BatchableFloatEdit(self.widget)
+        self.powerLawIndex.setObjectName(u"powerLawIndex")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.powerLawIndex)
+
+        self.label_5 = QLabel(self.widget)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(4, QFormLayout.LabelRole, self.label_5)
+
+        self.linearityDeviation = BatchableFloatEdit(self.widget)
+        self.linearityDeviation.setObjectName(u"linearityDeviation")
+
+        self.formLayout.setWidget(4, QFormLayout.FieldRole, self.linearityDeviation)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.label_6 = QLabel(ViscosityCarreauDialog)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.label_6)
+
+        self.widget_2 = QWidget(ViscosityCarreauDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(ViscosityCarreauDialog)
+        self.cancel.clicked.connect(ViscosityCarreauDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(ViscosityCarreauDialog)
+    # setupUi
+
+    def retranslateUi(self, ViscosityCarreauDialog):
+        ViscosityCarreauDialog.setWindowTitle(QCoreApplication.translate("ViscosityCarreauDialog", u"Bird-Carreau Viscosity", None))
+        self.label.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Zero Shear Viscosity (m<sup>2</sup>/s)", None))
+        self.label_2.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Infinite Shear Viscosity (m<sup>2</sup>/s)", None))
+        self.label_3.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Relaxation Time (s)", None))
+        self.label_4.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Power-Law Index", None))
+        self.label_5.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Linearity Deviation", None))
+        self.label_6.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Parameters for \"Bird-Carreau\" viscosity models are shared among all the species in the mixture.", None))
+        self.ok.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ViscosityCarreauDialog", u"Cancel", None))
+    # retranslateUi
+
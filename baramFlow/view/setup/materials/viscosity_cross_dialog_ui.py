@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'viscosity_cross_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_ViscosityCrossDialog(object):
+    def setupUi(self, ViscosityCrossDialog):
+        if not ViscosityCrossDialog.objectName():
+            ViscosityCrossDialog.setObjectName(u"ViscosityCrossDialog")
+        ViscosityCrossDialog.resize(400, 212)
+        self.verticalLayout = QVBoxLayout(ViscosityCrossDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ViscosityCrossDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.zeroShearViscosity = BatchableFloatEdit(self.widget)
+        self.zeroShearViscosity.setObjectName(u"zeroShearViscosity")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.zeroShearViscosity)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.infiniteShearViscosity = BatchableFloatEdit(self.widget)
+        self.infiniteShearViscosity.setObjectName(u"infiniteShearViscosity")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.infiniteShearViscosity)
+
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.naturalTime = BatchableFloatEdit(self.widget)
+        self.naturalTime.setObjectName(u"naturalTime")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.naturalTime)
+
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.powerLawIndex = BatchableFloatEdit(self.widget)
+        self.powerLawIndex.setObjectName(u"powerLawIndex")
+
+        self.formLayout_2.setWidget(3, QFormLayout.FieldRole, self.powerLawIndex)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.label_6 = QLabel(ViscosityCrossDialog)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.label_6)
+
+        self.widget_2 = QWidget(ViscosityCrossDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(ViscosityCrossDialog)
+        self.cancel.clicked.connect(ViscosityCrossDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(ViscosityCrossDialog)
+    # setupUi
+
+    def retranslateUi(self, ViscosityCrossDialog):
+        ViscosityCrossDialog.setWindowTitle(QCoreApplication.translate("ViscosityCrossDialog", u"Crosss Viscosity", None))
+        self.label.setText(QCoreApplication.translate("ViscosityCrossDialog", u"Zero Shear Viscosity (m<sup>2</sup>/s)", None))
+        self.label_2.setText(QCoreApplication.translate("ViscosityCrossDialog", u"Infinite Shear Viscosity (m<sup>2</sup>/s)", None))
+        self.label_3.setText(QCoreApplication.translate("ViscosityCrossDialog", u"Natural Time (s)", None))
+        self.label_4.setText(QCoreApplication.translate("ViscosityCrossDialog", u"Power-Law Index", None))
+        self.label_6.setText(QCoreApplication.translate("ViscosityCrossDialog", u"Parameters for \"Cross\" viscosity model are shared among all the species in the mixture.", None))
+        self.ok.setText(QCoreApplication.translate("ViscosityCrossDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ViscosityCrossDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'viscosity_herschel_bulkley_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_ViscosityHerschelBulkleyDialog(object):
+    def setupUi(self, ViscosityHerschelBulkleyDialog):
+        if not ViscosityHerschelBulkleyDialog.objectName():
+            ViscosityHerschelBulkleyDialog.setObjectName(u"ViscosityHerschelBulkleyDialog")
+        ViscosityHerschelBulkleyDialog.resize(400, 212)
+        self.verticalLayout = QVBoxLayout(ViscosityHerschelBulkleyDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ViscosityHerschelBulkleyDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.zeroShearViscosity = BatchableFloatEdit(self.widget)
+        self.zeroShearViscosity.setObjectName(u"zeroShearViscosity")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.zeroShearViscosity)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.yieldStressThreshold = BatchableFloatEdit(self.widget)
+        self.yieldStressThreshold.setObjectName(u"yieldStressThreshold")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.yieldStressThreshold)
+
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.consistencyIndex = BatchableFloatEdit(self.widget)
+        self.consistencyIndex.setObjectName(u"consistencyIndex")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.consistencyIndex)
+
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.powerLawIndex = BatchableFloatEdit(self.widget)
+        self.powerLawIndex.setObjectName(u"powerLawIndex")
+
+        self.formLayout_2.setWidget(3, QFormLayout.FieldRole, self.powerLawIndex)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.label_5 = QLabel(ViscosityHerschelBulkleyDialog)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.label_5)
+
+        self.widget_2 = QWidget(ViscosityHerschelBulkleyDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(ViscosityHerschelBulkleyDialog)
+        self.cancel.clicked.connect(ViscosityHerschelBulkleyDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(ViscosityHerschelBulkleyDialog)
+    # setupUi
+
+    def retranslateUi(self, ViscosityHerschelBulkleyDialog):
+        ViscosityHerschelBulkleyDialog.setWindowTitle(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"Herschel-bulkley Viscosity", None))
+        self.label.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"Zero Shear Viscosity (m<sup>2</sup>/s)", None))
+        self.label_2.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"<html><head/><body><p>Yield Stress Threshold (m<span style=\" vertical-align:super;\">2</span>/s<sup>2</sup>)</p></body></html>", None))
+        self.label_3.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"Consistency Index (m<sup>2</sup>/s)", None))
+        self.label_4.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"Power-Law Index", None))
+        self.label_5.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"Parameters for \"Herschel-bulkley\" viscosity model are shared among all the species in the mixture.", None))
+        self.ok.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ViscosityHerschelBulkleyDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'viscosity_non_newtonian_power_law_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QHBoxLayout,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+
+class Ui_ViscosityNonNewtonianPowerLaw(object):
+    def setupUi(self, ViscosityNonNewtonianPowerLaw):
+        if not ViscosityNonNewtonianPowerLaw.objectName():
+            ViscosityNonNewtonianPowerLaw.setObjectName(u"ViscosityNonNewtonianPowerLaw")
+        ViscosityNonNewtonianPowerLaw.resize(400, 212)
+        self.verticalLayout = QVBoxLayout(ViscosityNonNewtonianPowerLaw)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ViscosityNonNewtonianPowerLaw)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_2 = QFormLayout(self.widget)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.maximumViscosity = BatchableFloatEdit(self.widget)
+        self.maximumViscosity.setObjectName(u"maximumViscosity")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.maximumViscosity)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.minimumViscosity = BatchableFloatEdit(self.widget)
+        self.minimumViscosity.setObjectName(u"minimumViscosity")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.minimumViscosity)
+
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.consistencyIndex = BatchableFloatEdit(self.widget)
+        self.consistencyIndex.setObjectName(u"consistencyIndex")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.consistencyIndex)
+
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.powerLawIndex = BatchableFloatEdit(self.widget)
+        self.powerLawIndex.setObjectName(u"powerLawIndex")
+
+        self.formLayout_2.setWidget(3, QFormLayout.FieldRole, self.powerLawIndex)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.label_5 = QLabel(ViscosityNonNewtonianPowerLaw)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.label_5)
+
+        self.widget_2 = QWidget(ViscosityNonNewtonianPowerLaw)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(ViscosityNonNewtonianPowerLaw)
+        self.cancel.clicked.connect(ViscosityNonNewtonianPowerLaw.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(ViscosityNonNewtonianPowerLaw)
+    # setupUi
+
+    def retranslateUi(self, ViscosityNonNewtonianPowerLaw):
+        ViscosityNonNewtonianPowerLaw.setWindowTitle(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Non-newtonian-power-law Viscosity", None))
+        self.label.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Maximum Viscosity (m<sup>2</sup>/s)", None))
+        self.label_2.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Minimum Viscosity (m<sup>2</sup>/s)", None))
+        self.label_3.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Consistency Index (m<sup>2</sup>/s)", None))
+        self.label_4.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Power-Law Index", None))
+        self.label_5.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Parameters for \"Non-newtonian-power-law\" viscosity model are shared among all the species in the mixture.", None))
+        self.ok.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ViscosityNonNewtonianPowerLaw", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,775 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'DPM_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDialog,
+    QFormLayout, QGroupBox, QHBoxLayout, QHeaderView,
+    QLabel, QLineEdit, QPushButton, QRadioButton,
+    QSizePolicy, QSpacerItem, QTabWidget, QTreeWidget,
+    QTreeWidgetItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+import resource_rc
+
+class Ui_DPMdialog(object):
+    def setupUi(self, DPMdialog):
+        if not DPMdialog.objectName():
+            DPMdialog.setObjectName(u"DPMdialog")
+        DPMdialog.resize(583, 931)
+        self.verticalLayout_6 = QVBoxLayout(DPMdialog)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.dialogContents = QWidget(DPMdialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_5 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.horizontalLayout = QHBoxLayout(self.groupBox)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(-1, 6, -1, 6)
+        self.none = QRadioButton(self.groupBox)
+        self.none.setObjectName(u"none")
+
+        self.horizontalLayout.addWidget(self.none)
+
+        self.inertButton = QRadioButton(self.groupBox)
+        self.inertButton.setObjectName(u"inertButton")
+
+        self.horizontalLayout.addWidget(self.inertButton)
+
+        self.dropletButton = QRadioButton(self.groupBox)
+        self.dropletButton.setObjectName(u"dropletButton")
+
+        self.horizontalLayout.addWidget(self.dropletButton)
+
+        self.combustingButton = QRadioButton(self.groupBox)
+        self.combustingButton.setObjectName(u"combustingButton")
+
+        self.horizontalLayout.addWidget(self.combustingButton)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox)
+
+        self.properties = QWidget(self.dialogContents)
+        self.properties.setObjectName(u"properties")
+        self.horizontalLayout_6 = QHBoxLayout(self.properties)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.widget_14 = QWidget(self.properties)
+        self.widget_14.setObjectName(u"widget_14")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_14)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.inertParticleGroup = QGroupBox(self.widget_14)
+        self.inertParticleGroup.setObjectName(u"inertParticleGroup")
+        self.horizontalLayout_3 = QHBoxLayout(self.inertParticleGroup)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.inertParticle = QLineEdit(self.inertParticleGroup)
+        self.inertParticle.setObjectName(u"inertParticle")
+        self.inertParticle.setReadOnly(True)
+
+        self.horizontalLayout_3.addWidget(self.inertParticle)
+
+        self.inertParticleChange = QPushButton(self.inertParticleGroup)
+        self.inertParticleChange.setObjectName(u"inertParticleChange")
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.inertParticleChange.sizePolicy().hasHeightForWidth())
+        self.inertParticleChange.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_3.addWidget(self.inertParticleChange)
+
+
+        self.verticalLayout_2.addWidget(self.inertParticleGroup)
+
+        self.dropletGroup = QGroupBox(self.widget_14)
+        self.dropletGroup.setObjectName(u"dropletGroup")
+        self.verticalLayout_3 = QVBoxLayout(self.dropletGroup)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, 6, 9, 6)
+        self.groupBox_2 = QGroupBox(self.dropletGroup)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.composition = QTreeWidget(self.groupBox_2)
+        self.composition.setObjectName(u"composition")
+        self.composition.setMinimumSize(QSize(280, 0))
+
+        self.verticalLayout.addWidget(self.composition)
+
+        self.widget = QWidget(self.groupBox_2)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_8 = QHBoxLayout(self.widget)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_3)
+
+        self.label_6 = QLabel(self.widget)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_8.addWidget(self.label_6)
+
+        self.totalComposition = QLineEdit(self.widget)
+        self.totalComposition.setObjectName(u"totalComposition")
+        self.totalComposition.setEnabled(False)
+
+        self.horizontalLayout_8.addWidget(self.totalComposition)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+
+        self.verticalLayout_2.addWidget(self.dropletGroup)
+
+        self.temperatureWidget = QWidget(self.widget_14)
+        self.temperatureWidget.setObjectName(u"temperatureWidget")
+        self.horizontalLayout_9 = QHBoxLayout(self.temperatureWidget)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.label_12 = QLabel(self.temperatureWidget)
+        self.label_12.setObjectName(u"label_12")
+
+        self.horizontalLayout_9.addWidget(self.label_12)
+
+        self.temperature = BatchableFloatEdit(self.temperatureWidget)
+        self.temperature.setObjectName(u"temperature")
+
+        self.horizontalLayout_9.addWidget(self.temperature)
+
+
+        self.verticalLayout_2.addWidget(self.temperatureWidget)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout_6.addWidget(self.widget_14)
+
+        self.widget_7 = QWidget(self.properties)
+        self.widget_7.setObjectName(u"widget_7")
+        self.verticalLayout_7 = QVBoxLayout(self.widget_7)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_3 = QGroupBox(self.widget_7)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_4 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.interactionWithContinuousPhase = QCheckBox(self.groupBox_3)
+        self.interactionWithContinuousPhase.setObjectName(u"interactionWithContinuousPhase")
+
+        self.verticalLayout_4.addWidget(self.interactionWithContinuousPhase)
+
+        self.maxParticleCourantNumberWidget = QWidget(self.groupBox_3)
+        self.maxParticleCourantNumberWidget.setObjectName(u"maxParticleCourantNumberWidget")
+        self.formLayout_4 = QFormLayout(self.maxParticleCourantNumberWidget)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.formLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.label_7 = QLabel(self.maxParticleCourantNumberWidget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_7)
+
+        self.maxParticleCourantNumber = BatchableFloatEdit(self.maxParticleCourantNumberWidget)
+        self.maxParticleCourantNumber.setObjectName(u"maxParticleCourantNumber")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.maxParticleCourantNumber)
+
+
+        self.verticalLayout_4.addWidget(self.maxParticleCourantNumberWidget)
+
+        self.DPMIterationIntervalWidget = QWidget(self.groupBox_3)
+        self.DPMIterationIntervalWidget.setObjectName(u"DPMIterationIntervalWidget")
+        self.formLayout_7 = QFormLayout(self.DPMIterationIntervalWidget)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.formLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.label_15 = QLabel(self.DPMIterationIntervalWidget)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.DPMIterationInterval = BatchableFloatEdit(self.DPMIterationIntervalWidget)
+        self.DPMIterationInterval.setObjectName(u"DPMIterationInterval")
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.DPMIterationInterval)
+
+
+        self.verticalLayout_4.addWidget(self.DPMIterationIntervalWidget)
+
+        self.nodeBasedAveraging = QCheckBox(self.groupBox_3)
+        self.nodeBasedAveraging.setObjectName(u"nodeBasedAveraging")
+
+        self.verticalLayout_4.addWidget(self.nodeBasedAveraging)
+
+        self.widget_4 = QWidget(self.groupBox_3)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_5 = QFormLayout(self.widget_4)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, 6, 0, 0)
+        self.label_8 = QLabel(self.widget_4)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_8)
+
+        self.trackingScheme = QComboBox(self.widget_4)
+        self.trackingScheme.setObjectName(u"trackingScheme")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.trackingScheme)
+
+
+        self.verticalLayout_4.addWidget(self.widget_4)
+
+
+        self.verticalLayout_7.addWidget(self.groupBox_3)
+
+        self.widget_5 = QWidget(self.widget_7)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, -1, 9, -1)
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_2)
+
+        self.injections = QPushButton(self.widget_5)
+        self.injections.setObjectName(u"injections")
+
+        self.horizontalLayout_5.addWidget(self.injections)
+
+
+        self.verticalLayout_7.addWidget(self.widget_5)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout_6.addWidget(self.widget_7)
+
+
+        self.verticalLayout_5.addWidget(self.properties)
+
+
+        self.verticalLayout_6.addWidget(self.dialogContents)
+
+        self.tabWidget = QTabWidget(DPMdialog)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.kinematicTab = QWidget()
+        self.kinematicTab.setObjectName(u"kinematicTab")
+        self.verticalLayout_8 = QVBoxLayout(self.kinematicTab)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.label_10 = QLabel(self.kinematicTab)
+        self.label_10.setObjectName(u"label_10")
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setKerning(False)
+        self.label_10.setFont(font)
+
+        self.verticalLayout_8.addWidget(self.label_10)
+
+        self.widget_8 = QWidget(self.kinematicTab)
+        self.widget_8.setObjectName(u"widget_8")
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_8)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_4 = QGroupBox(self.widget_8)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.verticalLayout_9 = QVBoxLayout(self.groupBox_4)
+        self.verticalLayout_9.setSpacing(3)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.dragForceSpherical = QRadioButton(self.groupBox_4)
+        self.dragForceSpherical.setObjectName(u"dragForceSpherical")
+
+        self.verticalLayout_9.addWidget(self.dragForceSpherical)
+
+        self.dragForceNonSpherical = QRadioButton(self.groupBox_4)
+        self.dragForceNonSpherical.setObjectName(u"dragForceNonSpherical")
+
+        self.verticalLayout_9.addWidget(self.dragForceNonSpherical)
+
+        self.widget_13 = QWidget(self.groupBox_4)
+        self.widget_13.setObjectName(u"widget_13")
+        self.formLayout_6 = QFormLayout(self.widget_13)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(27, 0, -1, 0)
+        self.label_9 = QLabel(self.widget_13)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.shapeFactor = BatchableFloatEdit(self.widget_13)
+        self.shapeFactor.setObjectName(u"shapeFactor")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.shapeFactor)
+
+
+        self.verticalLayout_9.addWidget(self.widget_13)
+
+        self.dragForceDistortedSphere = QRadioButton(self.groupBox_4)
+        self.dragForceDistortedSphere.setObjectName(u"dragForceDistortedSphere")
+
+        self.verticalLayout_9.addWidget(self.dragForceDistortedSphere)
+
+        self.dragForceWenAndYu = QRadioButton(self.groupBox_4)
+        self.dragForceWenAndYu.setObjectName(u"dragForceWenAndYu")
+
+        self.verticalLayout_9.addWidget(self.dragForceWenAndYu)
+
+        self.dragForceGidaspow = QRadioButton(self.groupBox_4)
+        self.dragForceGidaspow.setObjectName(u"dragForceGidaspow")
+
+        self.verticalLayout_9.addWidget(self.dragForceGidaspow)
+
+        self.dragForceDuPlesisAndMailyah = QRadioButton(self.groupBox_4)
+        self.dragForceDuPlesisAndMailyah.setObjectName(u"dragForceDuPlesisAndMailyah")
+
+        self.verticalLayout_9.addWidget(self.dragForceDuPlesisAndMailyah)
+
+        self.dragForceTomiyama = QRadioButton(self.groupBox_4)
+        self.dragForceTomiyama.setObjectName(u"dragForceTomiyama")
+
+        self.verticalLayout_9.addWidget(self.dragForceTomiyama)
+
+        self.dragForceTomiyamaParams = QWidget(self.groupBox_4)
+        self.dragForceTomiyamaParams.setObjectName(u"dragForceTomiyamaParams")
+        self.verticalLayout_22 = QVBoxLayout(self.dragForceTomiyamaParams)
+        self.verticalLayout_22.setObjectName(u"verticalLayout_22")
+        self.verticalLayout_22.setContentsMargins(27, 0, 0, 0)
+        self.widget_16 = QWidget(self.dragForceTomiyamaParams)
+        self.widget_16.setObjectName(u"widget_16")
+        self.horizontalLayout_10 = QHBoxLayout(self.widget_16)
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.horizontalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.label_13 = QLabel(self.widget_16)
+        self.label_13.setObjectName(u"label_13")
+
+        self.horizontalLayout_10.addWidget(self.label_13)
+
+        self.dragTomiyamaSurfaceTension = BatchableFloatEdit(self.widget_16)
+        self.dragTomiyamaSurfaceTension.setObjectName(u"dragTomiyamaSurfaceTension")
+
+        self.horizontalLayout_10.addWidget(self.dragTomiyamaSurfaceTension)
+
+
+        self.verticalLayout_22.addWidget(self.widget_16)
+
+        self.groupBox_6 = QGroupBox(self.dragForceTomiyamaParams)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.verticalLayout_23 = QVBoxLayout(self.groupBox_6)
+        self.verticalLayout_23.setSpacing(0)
+        self.verticalLayout_23.setObjectName(u"verticalLayout_23")
+        self.noContamination = QRadioButton(self.groupBox_6)
+        self.noContamination.setObjectName(u"noContamination")
+
+        self.verticalLayout_23.addWidget(self.noContamination)
+
+        self.slightContamination = QRadioButton(self.groupBox_6)
+        self.slightContamination.setObjectName(u"slightContamination")
+
+        self.verticalLayout_23.addWidget(self.slightContamination)
+
+        self.fullContamination = QRadioButton(self.groupBox_6)
+        self.fullContamination.setObjectName(u"fullContamination")
+
+        self.verticalLayout_23.addWidget(self.fullContamination)
+
+
+        self.verticalLayout_22.addWidget(self.groupBox_6)
+
+
+        self.verticalLayout_9.addWidget(self.dragForceTomiyamaParams)
+
+
+        self.horizontalLayout_7.addWidget(self.groupBox_4)
+
+        self.widget_9 = QWidget(self.widget_8)
+        self.widget_9.setObjectName(u"widget_9")
+        self.verticalLayout_10 = QVBoxLayout(self.widget_9)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.verticalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_5 = QGroupBox(self.widget_9)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.verticalLayout_11 = QVBoxLayout(self.groupBox_5)
+        self.verticalLayout_11.setSpacing(3)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.liftForceNone = QRadioButton(self.groupBox_5)
+        self.liftForceNone.setObjectName(u"liftForceNone")
+
+        self.verticalLayout_11.addWidget(self.liftForceNone)
+
+        self.liftForceSaffmanMei = QRadioButton(self.groupBox_5)
+        self.liftForceSaffmanMei.setObjectName(u"liftForceSaffmanMei")
+
+        self.verticalLayout_11.addWidget(self.liftForceSaffmanMei)
+
+        self.liftForceTomiyama = QRadioButton(self.groupBox_5)
+        self.liftForceTomiyama.setObjectName(u"liftForceTomiyama")
+
+        self.verticalLayout_11.addWidget(self.liftForceTomiyama)
+
+        self.liftForceTomiyamaParams = QWidget(self.groupBox_5)
+        self.liftForceTomiyamaParams.setObjectName(u"liftForceTomiyamaParams")
+        self.horizontalLayout_4 = QHBoxLayout(self.liftForceTomiyamaParams)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(27, 0, -1, 0)
+        self.label_14 = QLabel(self.liftForceTomiyamaParams)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_4.addWidget(self.label_14)
+
+        self.liftTomiyamaSurfaceTension = BatchableFloatEdit(self.liftForceTomiyamaParams)
+        self.liftTomiyamaSurfaceTension.setObjectName(u"liftTomiyamaSurfaceTension")
+
+        self.horizontalLayout_4.addWidget(self.liftTomiyamaSurfaceTension)
+
+
+        self.verticalLayout_11.addWidget(self.liftForceTomiyamaParams)
+
+
+        self.verticalLayout_10.addWidget(self.groupBox_5)
+
+        self.widget_10 = QWidget(self.widget_9)
+        self.widget_10.setObjectName(u"widget_10")
+        self.verticalLayout_12 = QVBoxLayout(self.widget_10)
+        self.verticalLayout_12.setSpacing(3)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.gravity = QCheckBox(self.widget_10)
+        self.gravity.setObjectName(u"gravity")
+
+        self.verticalLayout_12.addWidget(self.gravity)
+
+        self.pressureGradient = QCheckBox(self.widget_10)
+        self.pressureGradient.setObjectName(u"pressureGradient")
+
+        self.verticalLayout_12.addWidget(self.pressureGradient)
+
+
+        self.verticalLayout_10.addWidget(self.widget_10)
+
+        self.verticalSpacer_6 = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_10.addItem(self.verticalSpacer_6)
+
+
+        self.horizontalLayout_7.addWidget(self.widget_9)
+
+
+        self.verticalLayout_8.addWidget(self.widget_8)
+
+        self.brownianMotionForce = QGroupBox(self.kinematicTab)
+        self.brownianMotionForce.setObjectName(u"brownianMotionForce")
+        self.brownianMotionForce.setToolTipDuration(-1)
+        self.brownianMotionForce.setCheckable(True)
+        self.brownianMotionForce.setChecked(False)
+        self.verticalLayout_13 = QVBoxLayout(self.brownianMotionForce)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(9, 9, 9, 9)
+        self.widget_11 = QWidget(self.brownianMotionForce)
+        self.widget_11.setObjectName(u"widget_11")
+        self.formLayout_8 = QFormLayout(self.widget_11)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.formLayout_8.setHorizontalSpacing(0)
+        self.formLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.label_11 = QLabel(self.widget_11)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_11)
+
+        self.molecularFreePathLength = BatchableFloatEdit(self.widget_11)
+        self.molecularFreePathLength.setObjectName(u"molecularFreePathLength")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.molecularFreePathLength)
+
+
+        self.verticalLayout_13.addWidget(self.widget_11)
+
+        self.useTurtulence = QCheckBox(self.brownianMotionForce)
+        self.useTurtulence.setObjectName(u"useTurtulence")
+
+        self.verticalLayout_13.addWidget(self.useTurtulence)
+
+
+        self.verticalLayout_8.addWidget(self.brownianMotionForce)
+
+        self.tabWidget.addTab(self.kinematicTab, "")
+        self.turbulentDispersionTab = QWidget()
+        self.turbulentDispersionTab.setObjectName(u"turbulentDispersionTab")
+        self.verticalLayout_15 = QVBoxLayout(self.turbulentDispersionTab)
+        self.verticalLayout_15.setObjectName(u"verticalLayout_15")
+        self.groupBox_7 = QGroupBox(self.turbulentDispersionTab)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.verticalLayout_14 = QVBoxLayout(self.groupBox_7)
+        self.verticalLayout_14.setSpacing(3)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.noneDispersion = QRadioButton(self.groupBox_7)
+        self.noneDispersion.setObjectName(u"noneDispersion")
+
+        self.verticalLayout_14.addWidget(self.noneDispersion)
+
+        self.stochasticDispersion = QRadioButton(self.groupBox_7)
+        self.stochasticDispersion.setObjectName(u"stochasticDispersion")
+
+        self.verticalLayout_14.addWidget(self.stochasticDispersion)
+
+        self.gradientDispersion = QRadioButton(self.groupBox_7)
+        self.gradientDispersion.setObjectName(u"gradientDispersion")
+
+        self.verticalLayout_14.addWidget(self.gradientDispersion)
+
+
+        self.verticalLayout_15.addWidget(self.groupBox_7)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_15.addItem(self.verticalSpacer_3)
+
+        self.tabWidget.addTab(self.turbulentDispersionTab, "")
+        self.heatTransfreTab = QWidget()
+        self.heatTransfreTab.setObjectName(u"heatTransfreTab")
+        self.verticalLayout_18 = QVBoxLayout(self.heatTransfreTab)
+        self.verticalLayout_18.setObjectName(u"verticalLayout_18")
+        self.groupBox_8 = QGroupBox(self.heatTransfreTab)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.verticalLayout_17 = QVBoxLayout(self.groupBox_8)
+        self.verticalLayout_17.setSpacing(3)
+        self.verticalLayout_17.setObjectName(u"verticalLayout_17")
+        self.heatTransferNone = QRadioButton(self.groupBox_8)
+        self.heatTransferNone.setObjectName(u"heatTransferNone")
+
+        self.verticalLayout_17.addWidget(self.heatTransferNone)
+
+        self.heatTransferRanzMarshall = QRadioButton(self.groupBox_8)
+        self.heatTransferRanzMarshall.setObjectName(u"heatTransferRanzMarshall")
+
+        self.verticalLayout_17.addWidget(self.heatTransferRanzMarshall)
+
+        self.widget_12 = QWidget(self.groupBox_8)
+        self.widget_12.setObjectName(u"widget_12")
+        self.verticalLayout_16 = QVBoxLayout(self.widget_12)
+        self.verticalLayout_16.setObjectName(u"verticalLayout_16")
+        self.verticalLayout_16.setContentsMargins(27, 0, -1, 0)
+        self.birdCorrection = QCheckBox(self.widget_12)
+        self.birdCorrection.setObjectName(u"birdCorrection")
+
+        self.verticalLayout_16.addWidget(self.birdCorrection)
+
+
+        self.verticalLayout_17.addWidget(self.widget_12)
+
+
+        self.verticalLayout_18.addWidget(self.groupBox_8)
+
+        self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_18.addItem(self.verticalSpacer_4)
+
+        self.tabWidget.addTab(self.heatTransfreTab, "")
+        self.evaporationTab = QWidget()
+        self.evaporationTab.setObjectName(u"evaporationTab")
+        self.verticalLayout_21 = QVBoxLayout(self.evaporationTab)
+        self.verticalLayout_21.setObjectName(u"verticalLayout_21")
+        self.groupBox_9 = QGroupBox(self.evaporationTab)
+        self.groupBox_9.setObjectName(u"groupBox_9")
+        self.verticalLayout_19 = QVBoxLayout(self.groupBox_9)
+        self.verticalLayout_19.setSpacing(3)
+        self.verticalLayout_19.setObjectName(u"verticalLayout_19")
+        self.evaporationNone = QRadioButton(self.groupBox_9)
+        self.evaporationNone.setObjectName(u"evaporationNone")
+
+        self.verticalLayout_19.addWidget(self.evaporationNone)
+
+        self.evaporationDiffusionControlled = QRadioButton(self.groupBox_9)
+        self.evaporationDiffusionControlled.setObjectName(u"evaporationDiffusionControlled")
+
+        self.verticalLayout_19.addWidget(self.evaporationDiffusionControlled)
+
+        self.evaporationConvectionDdiffusionControlled = QRadioButton(self.groupBox_9)
+        self.evaporationConvectionDdiffusionControlled.setObjectName(u"evaporationConvectionDdiffusionControlled")
+
+        self.verticalLayout_19.addWidget(self.evaporationConvectionDdiffusionControlled)
+
+
+        self.verticalLayout_21.addWidget(self.groupBox_9)
+
+        self.groupBox_10 = QGroupBox(self.evaporationTab)
+        self.groupBox_10.setObjectName(u"groupBox_10")
+        self.verticalLayout_20 = QVBoxLayout(self.groupBox_10)
+        self.verticalLayout_20.setSpacing(3)
+        self.verticalLayout_20.setObjectName(u"verticalLayout_20")
+        self.enthalpyDiference = QRadioButton(self.groupBox_10)
+        self.enthalpyDiference.setObjectName(u"enthalpyDiference")
+
+        self.verticalLayout_20.addWidget(self.enthalpyDiference)
+
+        self.latetHeat = QRadioButton(self.groupBox_10)
+        self.latetHeat.setObjectName(u"latetHeat")
+
+        self.verticalLayout_20.addWidget(self.latetHeat)
+
+
+        self.verticalLayout_21.addWidget(self.groupBox_10)
+
+        self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_21.addItem(self.verticalSpacer_5)
+
+        self.tabWidget.addTab(self.evaporationTab, "")
+
+        self.verticalLayout_6.addWidget(self.tabWidget)
+
+        self.widget_3 = QWidget(DPMdialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_6.addWidget(self.widget_3)
+
+
+        self.retranslateUi(DPMdialog)
+        self.cancel.clicked.connect(DPMdialog.reject)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(DPMdialog)
+    # setupUi
+
+    def retranslateUi(self, DPMdialog):
+        DPMdialog.setWindowTitle(QCoreApplication.translate("DPMdialog", u"DPM Model", None))
+        self.groupBox.setTitle(QCoreApplication.translate("DPMdialog", u"Particle Type", None))
+        self.none.setText(QCoreApplication.translate("DPMdialog", u"None", None))
+#if QT_CONFIG(tooltip)
+        self.inertButton.setToolTip(QCoreApplication.translate("DPMdialog", u"\"Inert\" Particle Type requires Liquid or Solid Material.\n"
+"It does not support multi-phase case nor multi-region case.", None))
+#endif // QT_CONFIG(tooltip)
+        self.inertButton.setText(QCoreApplication.translate("DPMdialog", u"Inert", None))
+#if QT_CONFIG(tooltip)
+        self.dropletButton.setToolTip(QCoreApplication.translate("DPMdialog", u"\"Droplet\" Particle Type requires Liquid Material and its Gas phase specie in the mixture of the region.\n"
+"It does not support multi-phase case nor multi-region case.\n"
+"Energy model should be included in calculation.", None))
+#endif // QT_CONFIG(tooltip)
+        self.dropletButton.setText(QCoreApplication.translate("DPMdialog", u"Droplet", None))
+        self.combustingButton.setText(QCoreApplication.translate("DPMdialog", u"Combusting", None))
+        self.inertParticleGroup.setTitle(QCoreApplication.translate("DPMdialog", u"Inert Particle", None))
+        self.inertParticleChange.setText(QCoreApplication.translate("DPMdialog", u"Change", None))
+        self.dropletGroup.setTitle(QCoreApplication.translate("DPMdialog", u"Droplet", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("DPMdialog", u"Composition", None))
+        ___qtreewidgetitem = self.composition.headerItem()
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("DPMdialog", u"Composition", None));
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("DPMdialog", u"Material", None));
+        self.label_6.setText(QCoreApplication.translate("DPMdialog", u"Total", None))
+        self.totalComposition.setText("")
+        self.label_12.setText(QCoreApplication.translate("DPMdialog", u"Temperature, T<sub>0<m/sub> (K)", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("DPMdialog", u"Numerical Conditions", None))
+        self.interactionWithContinuousPhase.setText(QCoreApplication.translate("DPMdialog", u"Interaction with Continuous Phase", None))
+        self.label_7.setText(QCoreApplication.translate("DPMdialog", u"Max. Particle Courant Number", None))
+        self.label_15.setText(QCoreApplication.translate("DPMdialog", u"DPM Iteration Interval", None))
+        self.nodeBasedAveraging.setText(QCoreApplication.translate("DPMdialog", u"Node Based Averaging", None))
+        self.label_8.setText(QCoreApplication.translate("DPMdialog", u"Tracking Scheme", None))
+        self.injections.setText(QCoreApplication.translate("DPMdialog", u"Injections", None))
+        self.label_10.setText(QCoreApplication.translate("DPMdialog", u"Kinematic Model", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("DPMdialog", u"Drag Force", None))
+#if QT_CONFIG(tooltip)
+        self.dragForceSpherical.setToolTip(QCoreApplication.translate("DPMdialog", u"Particle-drag model wherein drag forces (per unit carrier-fluid velocity) are dynamically computed based on empirical expressions.", None))
+#endif // QT_CONFIG(tooltip)
+        self.dragForceSpherical.setText(QCoreApplication.translate("DPMdialog", u"Spherical", None))
+#if QT_CONFIG(tooltip)
+        self.dragForceNonSpherical.setToolTip(QCoreApplication.translate("DPMdialog", u"Particle-drag model wherein drag forces (per unit carrier-fluid velocity) are dynamically computed based on empirical expressions using a four-parameter general drag correlation for non-spherical particles.", None))
+#endif // QT_CONFIG(tooltip)
+        self.dragForceNonSpherical.setText(QCoreApplication.translate("DPMdialog", u"Non-Spherical Shape Factor", None))
+#if QT_CONFIG(tooltip)
+        self.widget_13.setToolTip(QCoreApplication.translate("DPMdialog", u"Ratio of surface area of sphere having samevolume as particle to actual surface area ofparticle", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_9.setText(QCoreApplication.translate("DPMdialog", u"Shape Factor", None))
+        self.dragForceDistortedSphere.setText(QCoreApplication.translate("DPMdialog", u"Distorted Sphere", None))
+        self.dragForceWenAndYu.setText(QCoreApplication.translate("DPMdialog", u"Wen && Yu", None))
+        self.dragForceGidaspow.setText(QCoreApplication.translate("DPMdialog", u"Gidaspow", None))
+        self.dragForceDuPlesisAndMailyah.setText(QCoreApplication.translate("DPMdialog", u"Du Plessis && Masilyah", None))
+        self.dragForceTomiyama.setText(QCoreApplication.translate("DPMdialog", u"Tomiyama", None))
+        self.label_13.setText(QCoreApplication.translate("DPMdialog", u"Surface Tension (N/m)", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("DPMdialog", u"Contamination", None))
+        self.noContamination.setText(QCoreApplication.translate("DPMdialog", u"No Contamination", None))
+        self.slightContamination.setText(QCoreApplication.translate("DPMdialog", u"Slight Contamination", None))
+        self.fullContamination.setText(QCoreApplication.translate("DPMdialog", u"Full Contamination", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("DPMdialog", u"Lift Force", None))
+        self.liftForceNone.setText(QCoreApplication.translate("DPMdialog", u"None", None))
+#if QT_CONFIG(tooltip)
+        self.liftForceSaffmanMei.setToolTip(QCoreApplication.translate("DPMdialog", u"Saffman-Mei particle lift force model applicable to spherical particles.", None))
+#endif // QT_CONFIG(tooltip)
+        self.liftForceSaffmanMei.setText(QCoreApplication.translate("DPMdialog", u"Saffman Mei", None))
+        self.liftForceTomiyama.setText(QCoreApplication.translate("DPMdialog", u"Tomiyama", None))
+        self.label_14.setText(QCoreApplication.translate("DPMdialog", u"Surface Tension (N/m)", None))
+        self.gravity.setText(QCoreApplication.translate("DPMdialog", u"Gravity", None))
+        self.pressureGradient.setText(QCoreApplication.translate("DPMdialog", u"Pressure Gradient", None))
+#if QT_CONFIG(tooltip)
+        self.brownianMotionForce.setToolTip(QCoreApplication.translate("DPMdialog", u"Calculates particle Brownian motion force.\n"
+"It is for laminar flow when energy model is turned on.", None))
+#endif // QT_CONFIG(tooltip)
+        self.brownianMotionForce.setTitle(QCoreApplication.translate("DPMdialog", u"Brownian Motion Force", None))
+        self.label_11.setText(QCoreApplication.translate("DPMdialog", u"Molecular Free Path Length, lambda (m)", None))
+        self.useTurtulence.setText(QCoreApplication.translate("DPMdialog", u"Use Turbulence", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.kinematicTab), QCoreApplication.translate("DPMdialog", u"Kinematic", None))
+        self.groupBox_7.setTitle(QCoreApplication.translate("DPMdialog", u"Turbulent Dispersion", None))
+        self.noneDispersion.setText(QCoreApplication.translate("DPMdialog", u"None", None))
+#if QT_CONFIG(tooltip)
+        self.stochasticDispersion.setToolTip(QCoreApplication.translate("DPMdialog", u"The velocity is perturbed in random direction, with a Gaussian random number distribution with variance sigma.", None))
+#endif // QT_CONFIG(tooltip)
+        self.stochasticDispersion.setText(QCoreApplication.translate("DPMdialog", u"Stochastic Dispersion", None))
+#if QT_CONFIG(tooltip)
+        self.gradientDispersion.setToolTip(QCoreApplication.translate("DPMdialog", u"The velocity is perturbed in the direction of -grad(k), with a Gaussian random number distribution with variance sigma.", None))
+#endif // QT_CONFIG(tooltip)
+        self.gradientDispersion.setText(QCoreApplication.translate("DPMdialog", u"Gradient Dispersion", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.turbulentDispersionTab), QCoreApplication.translate("DPMdialog", u"Turbulent Dispersion", None))
+        self.groupBox_8.setTitle(QCoreApplication.translate("DPMdialog", u"Heat Transfer", None))
+        self.heatTransferNone.setText(QCoreApplication.translate("DPMdialog", u"None", None))
+        self.heatTransferRanzMarshall.setText(QCoreApplication.translate("DPMdialog", u"Ranz-Marshall", None))
+        self.birdCorrection.setText(QCoreApplication.translate("DPMdialog", u"Bird Correction", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.heatTransfreTab), QCoreApplication.translate("DPMdialog", u"Heat Transfer", None))
+        self.groupBox_9.setTitle(QCoreApplication.translate("DPMdialog", u"Evaporation", None))
+        self.evaporationNone.setText(QCoreApplication.translate("DPMdialog", u"None", None))
+        self.evaporationDiffusionControlled.setText(QCoreApplication.translate("DPMdialog", u"Diffusion-Controlled", None))
+        self.evaporationConvectionDdiffusionControlled.setText(QCoreApplication.translate("DPMdialog", u"Convection/Diffusion-Controlled", None))
+        self.groupBox_10.setTitle(QCoreApplication.translate("DPMdialog", u"Enthalpy Transfer Type", None))
+        self.enthalpyDiference.setText(QCoreApplication.translate("DPMdialog", u"Enthalpy Difference", None))
+        self.latetHeat.setText(QCoreApplication.translate("DPMdialog", u"Latent Heat", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.evaporationTab), QCoreApplication.translate("DPMdialog", u"Evaporation", None))
+        self.ok.setText(QCoreApplication.translate("DPMdialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("DPMdialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,620 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'injection_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QTabWidget,
+    QVBoxLayout, QWidget)
+
+from baramFlow.view.setup.models.DPM.function1_widget import (Function1ScalarWidget, Function1VectorWidget)
+from baramFlow.view.setup.models.DPM.vector_widget import VectorWidget
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_InjectionDialog(object):
+    def setupUi(self, InjectionDialog):
+        if not InjectionDialog.objectName():
+            InjectionDialog.setObjectName(u"InjectionDialog")
+        InjectionDialog.resize(328, 1093)
+        self.verticalLayout_2 = QVBoxLayout(InjectionDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.dicalogContents = QWidget(InjectionDialog)
+        self.dicalogContents.setObjectName(u"dicalogContents")
+        self.verticalLayout = QVBoxLayout(self.dicalogContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(self.dicalogContents)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.name = QLineEdit(self.widget)
+        self.name.setObjectName(u"name")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.tabWidget = QTabWidget(self.dicalogContents)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.tab = QWidget()
+        self.tab.setObjectName(u"tab")
+        self.verticalLayout_4 = QVBoxLayout(self.tab)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_8 = QWidget(self.tab)
+        self.widget_8.setObjectName(u"widget_8")
+        self.formLayout_7 = QFormLayout(self.widget_8)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.label_20 = QLabel(self.widget_8)
+        self.label_20.setObjectName(u"label_20")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_20)
+
+        self.injectionType = PythonComboBox(self.widget_8)
+        self.injectionType.setObjectName(u"injectionType")
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.injectionType)
+
+
+        self.verticalLayout_4.addWidget(self.widget_8)
+
+        self.pointInjection = QWidget(self.tab)
+        self.pointInjection.setObjectName(u"pointInjection")
+        self.formLayout_2 = QFormLayout(self.pointInjection)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.pointInjection)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.numberOfParticlesPerPoint = BatchableFloatEdit(self.pointInjection)
+        self.numberOfParticlesPerPoint.setObjectName(u"numberOfParticlesPerPoint")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.numberOfParticlesPerPoint)
+
+        self.label_3 = QLabel(self.pointInjection)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.injectionTime = BatchableFloatEdit(self.pointInjection)
+        self.injectionTime.setObjectName(u"injectionTime")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.injectionTime)
+
+        self.label_4 = QLabel(self.pointInjection)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.label_5 = QLabel(self.pointInjection)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(3, QFormLayout.LabelRole, self.label_5)
+
+        self.pointParticleVelocity = VectorWidget(self.pointInjection)
+        self.pointParticleVelocity.setObjectName(u"pointParticleVelocity")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.pointParticleVelocity)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.editPosition = QPushButton(self.pointInjection)
+        self.editPosition.setObjectName(u"editPosition")
+
+        self.horizontalLayout_3.addWidget(self.editPosition)
+
+
+        self.formLayout_2.setLayout(3, QFormLayout.FieldRole, self.horizontalLayout_3)
+
+
+        self.verticalLayout_4.addWidget(self.pointInjection)
+
+        self.flowRate = QWidget(self.tab)
+        self.flowRate.setObjectName(u"flowRate")
+        self.verticalLayout_3 = QVBoxLayout(self.flowRate)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.widget_4 = QWidget(self.flowRate)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_3 = QFormLayout(self.widget_4)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_11 = QLabel(self.widget_4)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_11)
+
+        self.flowRateSpec = PythonComboBox(self.widget_4)
+        self.flowRateSpec.setObjectName(u"flowRateSpec")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.flowRateSpec)
+
+
+        self.verticalLayout_3.addWidget(self.widget_4)
+
+        self.particleCountParameters = QGroupBox(self.flowRate)
+        self.particleCountParameters.setObjectName(u"particleCountParameters")
+        self.formLayout_4 = QFormLayout(self.particleCountParameters)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_12 = QLabel(self.particleCountParameters)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_12)
+
+        self.countParcelPerSecond = BatchableFloatEdit(self.particleCountParameters)
+        self.countParcelPerSecond.setObjectName(u"countParcelPerSecond")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.countParcelPerSecond)
+
+        self.label_13 = QLabel(self.particleCountParameters)
+        self.label_13.setObjectName(u"label_13")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_13)
+
+        self.numberOfParticlesPerParcel = BatchableFloatEdit(self.particleCountParameters)
+        self.numberOfParticlesPerParcel.setObjectName(u"numberOfParticlesPerParcel")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.numberOfParticlesPerParcel)
+
+
+        self.verticalLayout_3.addWidget(self.particleCountParameters)
+
+        self.particleVolumeParameters = QGroupBox(self.flowRate)
+        self.particleVolumeParameters.setObjectName(u"particleVolumeParameters")
+        self.formLayout_5 = QFormLayout(self.particleVolumeParameters)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.label_14 = QLabel(self.particleVolumeParameters)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_14)
+
+        self.volumeParcelPerSecond = BatchableFloatEdit(self.particleVolumeParameters)
+        self.volumeParcelPerSecond.setObjectName(u"volumeParcelPerSecond")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.volumeParcelPerSecond)
+
+        self.label_15 = QLabel(self.particleVolumeParameters)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_15)
+
+        self.totalMass = BatchableFloatEdit(self.particleVolumeParameters)
+        self.totalMass.setObjectName(u"totalMass")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.totalMass)
+
+        self.label_16 = QLabel(self.particleVolumeParameters)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_5.setWidget(2, QFormLayout.LabelRole, self.label_16)
+
+        self.volumeFlowRate = Function1ScalarWidget(self.particleVolumeParameters)
+        self.volumeFlowRate.setObjectName(u"volumeFlowRate")
+
+        self.formLayout_5.setWidget(2, QFormLayout.FieldRole, self.volumeFlowRate)
+
+        self.label_26 = QLabel(self.particleVolumeParameters)
+        self.label_26.setObjectName(u"label_26")
+
+        self.formLayout_5.setWidget(3, QFormLayout.LabelRole, self.label_26)
+
+        self.massFlowRate = BatchableFloatEdit(self.particleVolumeParameters)
+        self.massFlowRate.setObjectName(u"massFlowRate")
+
+        self.formLayout_5.setWidget(3, QFormLayout.FieldRole, self.massFlowRate)
+
+
+        self.verticalLayout_3.addWidget(self.particleVolumeParameters)
+
+        self.startStopTime = QWidget(self.flowRate)
+        self.startStopTime.setObjectName(u"startStopTime")
+        self.formLayout_6 = QFormLayout(self.startStopTime)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.label_17 = QLabel(self.startStopTime)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_17)
+
+        self.startTime = BatchableFloatEdit(self.startStopTime)
+        self.startTime.setObjectName(u"startTime")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.startTime)
+
+        self.label_18 = QLabel(self.startStopTime)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout_6.setWidget(1, QFormLayout.LabelRole, self.label_18)
+
+        self.stopTime = BatchableFloatEdit(self.startStopTime)
+        self.stopTime.setObjectName(u"stopTime")
+
+        self.formLayout_6.setWidget(1, QFormLayout.FieldRole, self.stopTime)
+
+
+        self.verticalLayout_3.addWidget(self.startStopTime)
+
+
+        self.verticalLayout_4.addWidget(self.flowRate)
+
+        self.surfaceInjection = QWidget(self.tab)
+        self.surfaceInjection.setObjectName(u"surfaceInjection")
+        self.formLayout_10 = QFormLayout(self.surfaceInjection)
+        self.formLayout_10.setObjectName(u"formLayout_10")
+        self.label_39 = QLabel(self.surfaceInjection)
+        self.label_39.setObjectName(u"label_39")
+
+        self.formLayout_10.setWidget(1, QFormLayout.LabelRole, self.label_39)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.surfaceParticleVelocityType = PythonComboBox(self.surfaceInjection)
+        self.surfaceParticleVelocityType.setObjectName(u"surfaceParticleVelocityType")
+
+        self.horizontalLayout.addWidget(self.surfaceParticleVelocityType)
+
+        self.surfaceParticleVelocity = VectorWidget(self.surfaceInjection)
+        self.surfaceParticleVelocity.setObjectName(u"surfaceParticleVelocity")
+
+        self.horizontalLayout.addWidget(self.surfaceParticleVelocity)
+
+
+        self.formLayout_10.setLayout(1, QFormLayout.FieldRole, self.horizontalLayout)
+
+        self.label_40 = QLabel(self.surfaceInjection)
+        self.label_40.setObjectName(u"label_40")
+
+        self.formLayout_10.setWidget(0, QFormLayout.LabelRole, self.label_40)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.surface = QLineEdit(self.surfaceInjection)
+        self.surface.setObjectName(u"surface")
+        self.surface.setEnabled(False)
+
+        self.horizontalLayout_4.addWidget(self.surface)
+
+        self.surfaceSelect = QPushButton(self.surfaceInjection)
+        self.surfaceSelect.setObjectName(u"surfaceSelect")
+
+        self.horizontalLayout_4.addWidget(self.surfaceSelect)
+
+
+        self.formLayout_10.setLayout(0, QFormLayout.FieldRole, self.horizontalLayout_4)
+
+
+        self.verticalLayout_4.addWidget(self.surfaceInjection)
+
+        self.coneInjection = QWidget(self.tab)
+        self.coneInjection.setObjectName(u"coneInjection")
+        self.formLayout_11 = QFormLayout(self.coneInjection)
+        self.formLayout_11.setObjectName(u"formLayout_11")
+        self.label_6 = QLabel(self.coneInjection)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.coneInjectorType = PythonComboBox(self.coneInjection)
+        self.coneInjectorType.setObjectName(u"coneInjectorType")
+
+        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.coneInjectorType)
+
+        self.label_7 = QLabel(self.coneInjection)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_11.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.conePosition = Function1VectorWidget(self.coneInjection)
+        self.conePosition.setObjectName(u"conePosition")
+
+        self.formLayout_11.setWidget(1, QFormLayout.FieldRole, self.conePosition)
+
+        self.label_8 = QLabel(self.coneInjection)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_11.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.coneAxis = Function1VectorWidget(self.coneInjection)
+        self.coneAxis.setObjectName(u"coneAxis")
+
+        self.formLayout_11.setWidget(2, QFormLayout.FieldRole, self.coneAxis)
+
+        self.label_9 = QLabel(self.coneInjection)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_11.setWidget(3, QFormLayout.LabelRole, self.label_9)
+
+        self.outerConeAngle = Function1ScalarWidget(self.coneInjection)
+        self.outerConeAngle.setObjectName(u"outerConeAngle")
+
+        self.formLayout_11.setWidget(3, QFormLayout.FieldRole, self.outerConeAngle)
+
+        self.label_10 = QLabel(self.coneInjection)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_11.setWidget(4, QFormLayout.LabelRole, self.label_10)
+
+        self.innerConeAngle = Function1ScalarWidget(self.coneInjection)
+        self.innerConeAngle.setObjectName(u"innerConeAngle")
+
+        self.formLayout_11.setWidget(4, QFormLayout.FieldRole, self.innerConeAngle)
+
+        self.label_30 = QLabel(self.coneInjection)
+        self.label_30.setObjectName(u"label_30")
+
+        self.formLayout_11.setWidget(5, QFormLayout.LabelRole, self.label_30)
+
+        self.outerRadius = BatchableFloatEdit(self.coneInjection)
+        self.outerRadius.setObjectName(u"outerRadius")
+
+        self.formLayout_11.setWidget(5, QFormLayout.FieldRole, self.outerRadius)
+
+        self.label_31 = QLabel(self.coneInjection)
+        self.label_31.setObjectName(u"label_31")
+
+        self.formLayout_11.setWidget(6, QFormLayout.LabelRole, self.label_31)
+
+        self.innerRadius = BatchableFloatEdit(self.coneInjection)
+        self.innerRadius.setObjectName(u"innerRadius")
+
+        self.formLayout_11.setWidget(6, QFormLayout.FieldRole, self.innerRadius)
+
+        self.label_32 = QLabel(self.coneInjection)
+        self.label_32.setObjectName(u"label_32")
+
+        self.formLayout_11.setWidget(7, QFormLayout.LabelRole, self.label_32)
+
+        self.swirlVelocity = Function1ScalarWidget(self.coneInjection)
+        self.swirlVelocity.setObjectName(u"swirlVelocity")
+
+        self.formLayout_11.setWidget(7, QFormLayout.FieldRole, self.swirlVelocity)
+
+        self.label_33 = QLabel(self.coneInjection)
+        self.label_33.setObjectName(u"label_33")
+
+        self.formLayout_11.setWidget(8, QFormLayout.LabelRole, self.label_33)
+
+        self.coneParticleSpeed = PythonComboBox(self.coneInjection)
+        self.coneParticleSpeed.setObjectName(u"coneParticleSpeed")
+
+        self.formLayout_11.setWidget(8, QFormLayout.FieldRole, self.coneParticleSpeed)
+
+        self.label_34 = QLabel(self.coneInjection)
+        self.label_34.setObjectName(u"label_34")
+
+        self.formLayout_11.setWidget(9, QFormLayout.LabelRole, self.label_34)
+
+        self.injectionSpeed = BatchableFloatEdit(self.coneInjection)
+        self.injectionSpeed.setObjectName(u"injectionSpeed")
+
+        self.formLayout_11.setWidget(9, QFormLayout.FieldRole, self.injectionSpeed)
+
+        self.label_35 = QLabel(self.coneInjection)
+        self.label_35.setObjectName(u"label_35")
+
+        self.formLayout_11.setWidget(10, QFormLayout.LabelRole, self.label_35)
+
+        self.injectorPressure = Function1ScalarWidget(self.coneInjection)
+        self.injectorPressure.setObjectName(u"injectorPressure")
+
+        self.formLayout_11.setWidget(10, QFormLayout.FieldRole, self.injectorPressure)
+
+        self.label_36 = QLabel(self.coneInjection)
+        self.label_36.setObjectName(u"label_36")
+
+        self.formLayout_11.setWidget(11, QFormLayout.LabelRole, self.label_36)
+
+        self.dischargeCoeff = Function1ScalarWidget(self.coneInjection)
+        self.dischargeCoeff.setObjectName(u"dischargeCoeff")
+
+        self.formLayout_11.setWidget(11, QFormLayout.FieldRole, self.dischargeCoeff)
+
+
+        self.verticalLayout_4.addWidget(self.coneInjection)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer)
+
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+        self.verticalLayout_6 = QVBoxLayout(self.tab_2)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.widget_16 = QWidget(self.tab_2)
+        self.widget_16.setObjectName(u"widget_16")
+        self.formLayout_8 = QFormLayout(self.widget_16)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.label_21 = QLabel(self.widget_16)
+        self.label_21.setObjectName(u"label_21")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_21)
+
+        self.diameterDistribution = QComboBox(self.widget_16)
+        self.diameterDistribution.setObjectName(u"diameterDistribution")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.diameterDistribution)
+
+
+        self.verticalLayout_6.addWidget(self.widget_16)
+
+        self.diameterParameters = QGroupBox(self.tab_2)
+        self.diameterParameters.setObjectName(u"diameterParameters")
+        self.formLayout_9 = QFormLayout(self.diameterParameters)
+        self.formLayout_9.setObjectName(u"formLayout_9")
+        self.label_22 = QLabel(self.diameterParameters)
+        self.label_22.setObjectName(u"label_22")
+
+        self.formLayout_9.setWidget(1, QFormLayout.LabelRole, self.label_22)
+
+        self.minDiameter = BatchableFloatEdit(self.diameterParameters)
+        self.minDiameter.setObjectName(u"minDiameter")
+
+        self.formLayout_9.setWidget(1, QFormLayout.FieldRole, self.minDiameter)
+
+        self.label_23 = QLabel(self.diameterParameters)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout_9.setWidget(2, QFormLayout.LabelRole, self.label_23)
+
+        self.maxDiameter = BatchableFloatEdit(self.diameterParameters)
+        self.maxDiameter.setObjectName(u"maxDiameter")
+
+        self.formLayout_9.setWidget(2, QFormLayout.FieldRole, self.maxDiameter)
+
+        self.label_24 = QLabel(self.diameterParameters)
+        self.label_24.setObjectName(u"label_24")
+
+        self.formLayout_9.setWidget(3, QFormLayout.LabelRole, self.label_24)
+
+        self.meanDiameter = BatchableFloatEdit(self.diameterParameters)
+        self.meanDiameter.setObjectName(u"meanDiameter")
+
+        self.formLayout_9.setWidget(3, QFormLayout.FieldRole, self.meanDiameter)
+
+        self.label_25 = QLabel(self.diameterParameters)
+        self.label_25.setObjectName(u"label_25")
+
+        self.formLayout_9.setWidget(4, QFormLayout.LabelRole, self.label_25)
+
+        self.spreadParameter = BatchableFloatEdit(self.diameterParameters)
+        self.spreadParameter.setObjectName(u"spreadParameter")
+
+        self.formLayout_9.setWidget(4, QFormLayout.FieldRole, self.spreadParameter)
+
+        self.label_19 = QLabel(self.diameterParameters)
+        self.label_19.setObjectName(u"label_19")
+
+        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.label_19)
+
+        self.diameter = BatchableFloatEdit(self.diameterParameters)
+        self.diameter.setObjectName(u"diameter")
+
+        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.diameter)
+
+        self.label_29 = QLabel(self.diameterParameters)
+        self.label_29.setObjectName(u"label_29")
+
+        self.formLayout_9.setWidget(5, QFormLayout.LabelRole, self.label_29)
+
+        self.stdDeviation = BatchableFloatEdit(self.diameterParameters)
+        self.stdDeviation.setObjectName(u"stdDeviation")
+
+        self.formLayout_9.setWidget(5, QFormLayout.FieldRole, self.stdDeviation)
+
+
+        self.verticalLayout_6.addWidget(self.diameterParameters)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_6.addItem(self.verticalSpacer_2)
+
+        self.tabWidget.addTab(self.tab_2, "")
+
+        self.verticalLayout.addWidget(self.tabWidget)
+
+
+        self.verticalLayout_2.addWidget(self.dicalogContents)
+
+        self.widget_3 = QWidget(InjectionDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+
+        self.retranslateUi(InjectionDialog)
+        self.cancel.clicked.connect(InjectionDialog.reject)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(InjectionDialog)
+    # setupUi
+
+    def retranslateUi(self, InjectionDialog):
+        InjectionDialog.setWindowTitle(QCoreApplication.translate("InjectionDialog", u"Injection", None))
+        self.label.setText(QCoreApplication.translate("InjectionDialog", u"Injection Name", None))
+        self.label_20.setText(QCoreApplication.translate("InjectionDialog", u"Injection Type", None))
+        self.label_2.setText(QCoreApplication.translate("InjectionDialog", u"Number of Particles per Point", None))
+        self.label_3.setText(QCoreApplication.translate("InjectionDialog", u"Injection Time (s)", None))
+        self.label_4.setText(QCoreApplication.translate("InjectionDialog", u"Particle Velocity (m/s)", None))
+        self.label_5.setText(QCoreApplication.translate("InjectionDialog", u"Positions", None))
+        self.editPosition.setText(QCoreApplication.translate("InjectionDialog", u"Show/Edit", None))
+        self.label_11.setText(QCoreApplication.translate("InjectionDialog", u"Flow Rate Spec.", None))
+        self.particleCountParameters.setTitle(QCoreApplication.translate("InjectionDialog", u"Particle Count Parameters", None))
+        self.label_12.setText(QCoreApplication.translate("InjectionDialog", u"Parcels per Second", None))
+        self.label_13.setText(QCoreApplication.translate("InjectionDialog", u"Number of Particles per Parcel", None))
+        self.particleVolumeParameters.setTitle(QCoreApplication.translate("InjectionDialog", u"Particle Volume Parameters", None))
+        self.label_14.setText(QCoreApplication.translate("InjectionDialog", u"Parcels per Second", None))
+        self.label_15.setText(QCoreApplication.translate("InjectionDialog", u"Total Mass (kg)", None))
+        self.label_16.setText(QCoreApplication.translate("InjectionDialog", u"Volume Flow Rate (m<sup>3</sup>/s)", None))
+        self.label_26.setText(QCoreApplication.translate("InjectionDialog", u"Mass Flow Rate (kg/s)", None))
+        self.label_17.setText(QCoreApplication.translate("InjectionDialog", u"Start Time (s)", None))
+        self.label_18.setText(QCoreApplication.translate("InjectionDialog", u"Stop Time (s)", None))
+        self.label_39.setText(QCoreApplication.translate("InjectionDialog", u"Particle Velocity (m/s)", None))
+        self.label_40.setText(QCoreApplication.translate("InjectionDialog", u"Surface", None))
+        self.surfaceSelect.setText(QCoreApplication.translate("InjectionDialog", u"Select", None))
+        self.label_6.setText(QCoreApplication.translate("InjectionDialog", u"Injector Type", None))
+        self.label_7.setText(QCoreApplication.translate("InjectionDialog", u"Position", None))
+        self.label_8.setText(QCoreApplication.translate("InjectionDialog", u"Axis", None))
+        self.label_9.setText(QCoreApplication.translate("InjectionDialog", u"Outer Cone Angle (deg)", None))
+        self.label_10.setText(QCoreApplication.translate("InjectionDialog", u"Inner Cone Angle (deg)", None))
+        self.label_30.setText(QCoreApplication.translate("InjectionDialog", u"Outer Radius (m)", None))
+        self.label_31.setText(QCoreApplication.translate("InjectionDialog", u"Inner Radius (m)", None))
+        self.label_32.setText(QCoreApplication.translate("InjectionDialog", u"Swirl Velocity (rad/s)", None))
+        self.label_33.setText(QCoreApplication.translate("InjectionDialog", u"Particle Speed", None))
+        self.label_34.setText(QCoreApplication.translate("InjectionDialog", u"Injection Speed (m/s)", None))
+        self.label_35.setText(QCoreApplication.translate("InjectionDialog", u"Injector Pressure (Pa)", None))
+        self.label_36.setText(QCoreApplication.translate("InjectionDialog", u"Descharge Coeff, Cd", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), QCoreApplication.translate("InjectionDialog", u"Injector Propertries", None))
+        self.label_21.setText(QCoreApplication.translate("InjectionDialog", u"Diameter Distribution", None))
+        self.diameterParameters.setTitle(QCoreApplication.translate("InjectionDialog", u"Parameters", None))
+        self.label_22.setText(QCoreApplication.translate("InjectionDialog", u"Min. Diameter", None))
+        self.label_23.setText(QCoreApplication.translate("InjectionDialog", u"Max. Diameter", None))
+        self.label_24.setText(QCoreApplication.translate("InjectionDialog", u"Mean Diameter", None))
+        self.label_25.setText(QCoreApplication.translate("InjectionDialog", u"Spread Parameter", None))
+        self.label_19.setText(QCoreApplication.translate("InjectionDialog", u"Diameter", None))
+        self.label_29.setText(QCoreApplication.translate("InjectionDialog", u"Std. Deviation", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), QCoreApplication.translate("InjectionDialog", u"Diameter Distribution", None))
+        self.ok.setText(QCoreApplication.translate("InjectionDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("InjectionDialog", u"Cancel", None))
+    # retranslateUi
+
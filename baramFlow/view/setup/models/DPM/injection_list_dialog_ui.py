@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'injection_list_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QListWidget,
+    QListWidgetItem, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_InjectionListDialog(object):
+    def setupUi(self, InjectionListDialog):
+        if not InjectionListDialog.objectName():
+            InjectionListDialog.setObjectName(u"InjectionListDialog")
+        InjectionListDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(InjectionListDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.list = QListWidget(InjectionListDialog)
+        self.list.setObjectName(u"list")
+
+        self.verticalLayout.addWidget(self.list)
+
+        self.widget = QWidget(InjectionListDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_2)
+
+        self.add = QPushButton(self.widget)
+        self.add.setObjectName(u"add")
+
+        self.horizontalLayout_5.addWidget(self.add)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        self.edit.setEnabled(False)
+
+        self.horizontalLayout_5.addWidget(self.edit)
+
+        self.delete_ = QPushButton(self.widget)
+        self.delete_.setObjectName(u"delete_")
+        self.delete_.setEnabled(False)
+
+        self.horizontalLayout_5.addWidget(self.delete_)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(InjectionListDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+        self.ok.setEnabled(False)
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(InjectionListDialog)
+        self.cancel.clicked.connect(InjectionListDialog.reject)
+        self.ok.clicked.connect(InjectionListDialog.accept)
+
+        QMetaObject.connectSlotsByName(InjectionListDialog)
+    # setupUi
+
+    def retranslateUi(self, InjectionListDialog):
+        InjectionListDialog.setWindowTitle(QCoreApplication.translate("InjectionListDialog", u"Injections", None))
+        self.add.setText(QCoreApplication.translate("InjectionListDialog", u"Add", None))
+        self.edit.setText(QCoreApplication.translate("InjectionListDialog", u"Edit", None))
+        self.delete_.setText(QCoreApplication.translate("InjectionListDialog", u"Delete", None))
+        self.ok.setText(QCoreApplication.translate("InjectionListDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("InjectionListDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'energy_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QGroupBox, QRadioButton, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_EnergyDialog(object):
+    def setupUi(self, EnergyDialog):
+        if not EnergyDialog.objectName():
+            EnergyDialog.setObjectName(u"EnergyDialog")
+        EnergyDialog.resize(174, 130)
+        self.verticalLayout_2 = QVBoxLayout(EnergyDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(EnergyDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.include = QRadioButton(self.groupBox)
+        self.include.setObjectName(u"include")
+
+        self.verticalLayout.addWidget(self.include)
+
+        self.notInclude = QRadioButton(self.groupBox)
+        self.notInclude.setObjectName(u"notInclude")
+
+        self.verticalLayout.addWidget(self.notInclude)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.buttonBox = QDialogButtonBox(EnergyDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(EnergyDialog)
+        self.buttonBox.accepted.connect(EnergyDialog.accept)
+        self.buttonBox.rejected.connect(EnergyDialog.reject)
+
+        QMetaObject.connectSlotsByName(EnergyDialog)
+    # setupUi
+
+    def retranslateUi(self, EnergyDialog):
+        EnergyDialog.setWindowTitle(QCoreApplication.translate("EnergyDialog", u"Energy Model", None))
+        self.groupBox.setTitle(QCoreApplication.translate("EnergyDialog", u"Model", None))
+        self.include.setText(QCoreApplication.translate("EnergyDialog", u"Include", None))
+        self.notInclude.setText(QCoreApplication.translate("EnergyDialog", u"Not Include", None))
+    # retranslateUi
+
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'models_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QFrame, QHBoxLayout,
+    QLabel, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_ModelsPage(object):
+    def setupUi(self, ModelsPage):
+        if not ModelsPage.objectName():
+            ModelsPage.setObjectName(u"ModelsPage")
+        ModelsPage.resize(250, 500)
+        self.verticalLayout = QVBoxLayout(ModelsPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.title = QLabel(ModelsPage)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout.addWidget(self.title)
+
+        self.line = QFrame(ModelsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.list = QListWidget(ModelsPage)
+        self.list.setObjectName(u"list")
+        self.list.setMinimumSize(QSize(0, 240))
+        self.list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        self.verticalLayout.addWidget(self.list)
+
+        self.widget = QWidget(ModelsPage)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(130, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        self.edit.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.edit)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.verticalSpacer = QSpacerItem(20, 163, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(ModelsPage)
+
+        QMetaObject.connectSlotsByName(ModelsPage)
+    # setupUi
+
+    def retranslateUi(self, ModelsPage):
+        ModelsPage.setWindowTitle(QCoreApplication.translate("ModelsPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("ModelsPage", u"Models", None))
+        self.edit.setText(QCoreApplication.translate("ModelsPage", u"&Edit", None))
+    # retranslateUi
+
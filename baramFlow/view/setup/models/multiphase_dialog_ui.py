@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'multiphase_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QButtonGroup, QDialog,
+    QDialogButtonBox, QGroupBox, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_MultiphaseDialog(object):
+    def setupUi(self, MultiphaseDialog):
+        if not MultiphaseDialog.objectName():
+            MultiphaseDialog.setObjectName(u"MultiphaseDialog")
+        MultiphaseDialog.resize(200, 162)
+        self.verticalLayout_2 = QVBoxLayout(MultiphaseDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(MultiphaseDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.off = QRadioButton(self.groupBox)
+        self.modelRadioGroup = QButtonGroup(MultiphaseDialog)
+        self.modelRadioGroup.setObjectName(u"modelRadioGroup")
+        self.modelRadioGroup.addButton(self.off)
+        self.off.setObjectName(u"off")
+
+        self.verticalLayout.addWidget(self.off)
+
+        self.volumeOfFluid = QRadioButton(self.groupBox)
+        self.modelRadioGroup.addButton(self.volumeOfFluid)
+        self.volumeOfFluid.setObjectName(u"volumeOfFluid")
+
+        self.verticalLayout.addWidget(self.volumeOfFluid)
+
+        self.mixture = QRadioButton(self.groupBox)
+        self.modelRadioGroup.addButton(self.mixture)
+        self.mixture.setObjectName(u"mixture")
+
+        self.verticalLayout.addWidget(self.mixture)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.verticalSpacer = QSpacerItem(20, 23, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.buttonBox = QDialogButtonBox(MultiphaseDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(MultiphaseDialog)
+        self.buttonBox.accepted.connect(MultiphaseDialog.accept)
+        self.buttonBox.rejected.connect(MultiphaseDialog.reject)
+
+        QMetaObject.connectSlotsByName(MultiphaseDialog)
+    # setupUi
+
+    def retranslateUi(self, MultiphaseDialog):
+        MultiphaseDialog.setWindowTitle(QCoreApplication.translate("MultiphaseDialog", u"Multiphase Model", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MultiphaseDialog", u"Model", None))
+        self.off.setText(QCoreApplication.translate("MultiphaseDialog", u"Off", None))
+        self.volumeOfFluid.setText(QCoreApplication.translate("MultiphaseDialog", u"Volume of Fluid", None))
+        self.mixture.setText(QCoreApplication.translate("MultiphaseDialog", u"Mixture (cavitation)", None))
+    # retranslateUi
+
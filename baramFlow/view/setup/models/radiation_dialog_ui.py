@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'radiation_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QButtonGroup, QDialog,
+    QDialogButtonBox, QFormLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_RadiationDialog(object):
+    def setupUi(self, RadiationDialog):
+        if not RadiationDialog.objectName():
+            RadiationDialog.setObjectName(u"RadiationDialog")
+        RadiationDialog.resize(579, 252)
+        self.verticalLayout_4 = QVBoxLayout(RadiationDialog)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_5 = QWidget(RadiationDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout = QHBoxLayout(self.widget_5)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.modelWidget = QWidget(self.widget_5)
+        self.modelWidget.setObjectName(u"modelWidget")
+        self.verticalLayout_2 = QVBoxLayout(self.modelWidget)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.modelGroup = QGroupBox(self.modelWidget)
+        self.modelGroup.setObjectName(u"modelGroup")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.modelGroup.sizePolicy().hasHeightForWidth())
+        self.modelGroup.setSizePolicy(sizePolicy)
+        self.verticalLayout = QVBoxLayout(self.modelGroup)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.off = QRadioButton(self.modelGroup)
+        self.modelRadioGroup = QButtonGroup(RadiationDialog)
+        self.modelRadioGroup.setObjectName(u"modelRadioGroup")
+        self.modelRadioGroup.addButton(self.off)
+        self.off.setObjectName(u"off")
+
+        self.verticalLayout.addWidget(self.off)
+
+        self.p1 = QRadioButton(self.modelGroup)
+        self.modelRadioGroup.addButton(self.p1)
+        self.p1.setObjectName(u"p1")
+
+        self.verticalLayout.addWidget(self.p1)
+
+        self.DO = QRadioButton(self.modelGroup)
+        self.modelRadioGroup.addButton(self.DO)
+        self.DO.setObjectName(u"DO")
+
+        self.verticalLayout.addWidget(self.DO)
+
+
+        self.verticalLayout_2.addWidget(self.modelGroup)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout.addWidget(self.modelWidget)
+
+        self.parametersWidget = QWidget(self.widget_5)
+        self.parametersWidget.setObjectName(u"parametersWidget")
+        self.verticalLayout_3 = QVBoxLayout(self.parametersWidget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.parametersGroup = QGroupBox(self.parametersWidget)
+        self.parametersGroup.setObjectName(u"parametersGroup")
+        sizePolicy.setHeightForWidth(self.parametersGroup.sizePolicy().hasHeightForWidth())
+        self.parametersGroup.setSizePolicy(sizePolicy)
+        self.formLayout = QFormLayout(self.parametersGroup)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.parametersGroup)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.absorptionCoefficient = QLineEdit(self.parametersGroup)
+        self.absorptionCoefficient.setObjectName(u"absorptionCoefficient")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.absorptionCoefficient.sizePolicy().hasHeightForWidth())
+        self.absorptionCoefficient.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.absorptionCoefficient)
+
+        self.phiDivisionsLabel = QLabel(self.parametersGroup)
+        self.phiDivisionsLabel.setObjectName(u"phiDivisionsLabel")
+        self.phiDivisionsLabel.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.phiDivisionsLabel)
+
+        self.thetaDivisions = QLineEdit(self.parametersGroup)
+        self.thetaDivisions.setObjectName(u"thetaDivisions")
+        sizePolicy1.setHeightForWidth(self.thetaDivisions.sizePolicy().hasHeightForWidth())
+        self.thetaDivisions.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.thetaDivisions)
+
+        self.residualConvergenceCriteria = QLineEdit(self.parametersGroup)
+        self.residualConvergenceCriteria.setObjectName(u"residualConvergenceCriteria")
+        sizePolicy1.setHeightForWidth(self.residualConvergenceCriteria.sizePolicy().hasHeightForWidth())
+        self.residualConvergenceCriteria.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(4, QFormLayout.FieldRole, self.residualConvergenceCriteria)
+
+        self.maximumNumberOfRadiationIterations = QLineEdit(self.parametersGroup)
+        self.maximumNumberOfRadiationIterations.setObjectName(u"maximumNumberOfRadiationIterations")
+        sizePolicy1.setHeightForWidth(self.maximumNumberOfRadiationIterations.sizePolicy().hasHeightForWidth())
+        self.maximumNumberOfRadiationIterations.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(5, QFormLayout.FieldRole, self.maximumNumberOfRadiationIterations)
+
+        self.flowIterationsPerRadiationIterationLabel = QLabel(self.parametersGroup)
+        self.flowIterationsPerRadiationIterationLabel.setObjectName(u"flowIterationsPerRadiationIterationLabel")
+        self.flowIterationsPerRadiationIterationLabel.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.flowIterationsPerRadiationIterationLabel)
+
+        self.flowIterationsPerRadiationIteration = QLineEdit(self.parametersGroup)
+        self.flowIterationsPerRadiationIteration.setObjectName(u"flowIterationsPerRadiationIteration")
+        sizePolicy1.setHeightForWidth(self.flowIterationsPerRadiationIteration.sizePolicy().hasHeightForWidth())
+        self.flowIterationsPerRadiationIteration.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.flowIterationsPerRadiationIteration)
+
+        self.maximumNumberOfRadiationIterationsLabel = QLabel(self.parametersGroup)
+        self.maximumNumberOfRadiationIterationsLabel.setObjectName(u"maximumNumberOfRadiationIterationsLabel")
+        self.maximumNumberOfRadiationIterationsLabel.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(5, QFormLayout.LabelRole, self.maximumNumberOfRadiationIterationsLabel)
+
+        self.residualConvergenceCriteriaLabel = QLabel(self.parametersGroup)
+        self.residualConvergenceCriteriaLabel.setObjectName(u"residualConvergenceCriteriaLabel")
+        self.residualConvergenceCriteriaLabel.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(4, QFormLayout.LabelRole, self.residualConvergenceCriteriaLabel)
+
+        self.thetaDivisionsLabel = QLabel(self.parametersGroup)
+        self.thetaDivisionsLabel.setObjectName(u"thetaDivisionsLabel")
+        self.thetaDivisionsLabel.setMinimumSize(QSize(0, 0))
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.thetaDivisionsLabel)
+
+        self.phiDivisions = QLineEdit(self.parametersGroup)
+        self.phiDivisions.setObjectName(u"phiDivisions")
+        sizePolicy1.setHeightForWidth(self.phiDivisions.sizePolicy().hasHeightForWidth())
+        self.phiDivisions.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.phiDivisions)
+
+
+        self.verticalLayout_3.addWidget(self.parametersGroup)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout.addWidget(self.parametersWidget)
+
+
+        self.verticalLayout_4.addWidget(self.widget_5)
+
+        self.buttonBox = QDialogButtonBox(RadiationDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_4.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(RadiationDialog)
+        self.buttonBox.accepted.connect(RadiationDialog.accept)
+        self.buttonBox.rejected.connect(RadiationDialog.reject)
+
+        QMetaObject.connectSlotsByName(RadiationDialog)
+    # setupUi
+
+    def retranslateUi(self, RadiationDialog):
+        RadiationDialog.setWindowTitle(QCoreApplication.translate("RadiationDialog", u"Radiation Model", None))
+        self.modelGroup.setTitle(QCoreApplication.translate("RadiationDialog", u"Model", None))
+        self.off.setText(QCoreApplication.translate("RadiationDialog", u"Off", None))
+        self.p1.setText(QCoreApplication.translate("RadiationDialog", u"P1", None))
+        self.DO.setText(QCoreApplication.translate("RadiationDialog", u"Discrete Ordinates(DO)", None))
+        self.parametersGroup.setTitle(QCoreApplication.translate("RadiationDialog", u"Parameters", None))
+        self.label_2.setText(QCoreApplication.translate("RadiationDialog", u"Absorption Coefficient", None))
+        self.phiDivisionsLabel.setText(QCoreApplication.translate("RadiationDialog", u"Phi Divisions ", None))
+        self.flowIterationsPerRadiationIterationLabel.setText(QCoreApplication.translate("RadiationDialog", u"Flow Iterations per Radiation Iteration", None))
+        self.maximumNumberOfRadiationIterationsLabel.setText(QCoreApplication.translate("RadiationDialog", u"Maximum Number of Radiation Iterations ", None))
+        self.residualConvergenceCriteriaLabel.setText(QCoreApplication.translate("RadiationDialog", u"Residual Convergence Criteria ", None))
+        self.thetaDivisionsLabel.setText(QCoreApplication.translate("RadiationDialog", u"Theta Divisions", None))
+    # retranslateUi
+
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'species_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QGroupBox, QHBoxLayout,
+    QPushButton, QRadioButton, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_SpeciesDialog(object):
+    def setupUi(self, SpeciesDialog):
+        if not SpeciesDialog.objectName():
+            SpeciesDialog.setObjectName(u"SpeciesDialog")
+        SpeciesDialog.resize(174, 148)
+        self.verticalLayout_2 = QVBoxLayout(SpeciesDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(SpeciesDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.include = QRadioButton(self.groupBox)
+        self.include.setObjectName(u"include")
+
+        self.verticalLayout.addWidget(self.include)
+
+        self.notInclude = QRadioButton(self.groupBox)
+        self.notInclude.setObjectName(u"notInclude")
+
+        self.verticalLayout.addWidget(self.notInclude)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.widget = QWidget(SpeciesDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, -1, 0, -1)
+        self.ok = QPushButton(self.widget)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+
+        self.retranslateUi(SpeciesDialog)
+        self.cancel.clicked.connect(SpeciesDialog.reject)
+
+        QMetaObject.connectSlotsByName(SpeciesDialog)
+    # setupUi
+
+    def retranslateUi(self, SpeciesDialog):
+        SpeciesDialog.setWindowTitle(QCoreApplication.translate("SpeciesDialog", u"Species Model", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SpeciesDialog", u"Model", None))
+        self.include.setText(QCoreApplication.translate("SpeciesDialog", u"Include", None))
+        self.notInclude.setText(QCoreApplication.translate("SpeciesDialog", u"Not Include", None))
+        self.ok.setText(QCoreApplication.translate("SpeciesDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("SpeciesDialog", u"Cancel", None))
+    # retranslateUi
+
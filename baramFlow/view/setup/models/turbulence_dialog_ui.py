@@ -0,0 +1,577 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'turbulence_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QRadioButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_TurbulenceDialog(object):
+    def setupUi(self, TurbulenceDialog):
+        if not TurbulenceDialog.objectName():
+            TurbulenceDialog.setObjectName(u"TurbulenceDialog")
+        TurbulenceDialog.resize(552, 1258)
+        TurbulenceDialog.setMinimumSize(QSize(265, 0))
+        self.verticalLayout_7 = QVBoxLayout(TurbulenceDialog)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.widget_2 = QWidget(TurbulenceDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.widget_2)
+        self.widget.setObjectName(u"widget")
+        self.widget.setMinimumSize(QSize(240, 0))
+        self.verticalLayout_8 = QVBoxLayout(self.widget)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.verticalLayout_8.setContentsMargins(0, 0, 0, -1)
+        self.groupBox = QGroupBox(self.widget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.inviscid = QRadioButton(self.groupBox)
+        self.inviscid.setObjectName(u"inviscid")
+
+        self.verticalLayout.addWidget(self.inviscid)
+
+        self.laminar = QRadioButton(self.groupBox)
+        self.laminar.setObjectName(u"laminar")
+
+        self.verticalLayout.addWidget(self.laminar)
+
+        self.spalartAllmaras = QRadioButton(self.groupBox)
+        self.spalartAllmaras.setObjectName(u"spalartAllmaras")
+
+        self.verticalLayout.addWidget(self.spalartAllmaras)
+
+        self.kEpsilon = QRadioButton(self.groupBox)
+        self.kEpsilon.setObjectName(u"kEpsilon")
+
+        self.verticalLayout.addWidget(self.kEpsilon)
+
+        self.kOmega = QRadioButton(self.groupBox)
+        self.kOmega.setObjectName(u"kOmega")
+
+        self.verticalLayout.addWidget(self.kOmega)
+
+        self.DES = QRadioButton(self.groupBox)
+        self.DES.setObjectName(u"DES")
+
+        self.verticalLayout.addWidget(self.DES)
+
+        self.LES = QRadioButton(self.groupBox)
+        self.LES.setObjectName(u"LES")
+
+        self.verticalLayout.addWidget(self.LES)
+
+
+        self.verticalLayout_8.addWidget(self.groupBox)
+
+        self.kEpsilonModel = QWidget(self.widget)
+        self.kEpsilonModel.setObjectName(u"kEpsilonModel")
+        self.verticalLayout_3 = QVBoxLayout(self.kEpsilonModel)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.groupBox_2 = QGroupBox(self.kEpsilonModel)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.standard = QRadioButton(self.groupBox_2)
+        self.standard.setObjectName(u"standard")
+
+        self.verticalLayout_2.addWidget(self.standard)
+
+        self.RNG = QRadioButton(self.groupBox_2)
+        self.RNG.setObjectName(u"RNG")
+
+        self.verticalLayout_2.addWidget(self.RNG)
+
+        self.realizable = QRadioButton(self.groupBox_2)
+        self.realizable.setObjectName(u"realizable")
+
+        self.verticalLayout_2.addWidget(self.realizable)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_2)
+
+        self.nearWallTreatment = QGroupBox(self.kEpsilonModel)
+        self.nearWallTreatment.setObjectName(u"nearWallTreatment")
+        self.verticalLayout_5 = QVBoxLayout(self.nearWallTreatment)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.standardWallFunction = QRadioButton(self.nearWallTreatment)
+        self.standardWallFunction.setObjectName(u"standardWallFunction")
+
+        self.verticalLayout_5.addWidget(self.standardWallFunction)
+
+        self.enhancedWallTreatment = QRadioButton(self.nearWallTreatment)
+        self.enhancedWallTreatment.setObjectName(u"enhancedWallTreatment")
+
+        self.verticalLayout_5.addWidget(self.enhancedWallTreatment)
+
+        self.modelWidget = QWidget(self.nearWallTreatment)
+        self.modelWidget.setObjectName(u"modelWidget")
+        self.modelWidget.setMinimumSize(QSize(0, 0))
+        self.verticalLayout_6 = QVBoxLayout(self.modelWidget)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+
+        self.verticalLayout_5.addWidget(self.modelWidget)
+
+
+        self.verticalLayout_3.addWidget(self.nearWallTreatment)
+
+
+        self.verticalLayout_8.addWidget(self.kEpsilonModel)
+
+        self.kOmegaModel = QGroupBox(self.widget)
+        self.kOmegaModel.setObjectName(u"kOmegaModel")
+        self.verticalLayout_4 = QVBoxLayout(self.kOmegaModel)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.SST = QRadioButton(self.kOmegaModel)
+        self.SST.setObjectName(u"SST")
+        self.SST.setChecked(True)
+
+        self.verticalLayout_4.addWidget(self.SST)
+
+
+        self.verticalLayout_8.addWidget(self.kOmegaModel)
+
+        self.DESModel = QWidget(self.widget)
+        self.DESModel.setObjectName(u"DESModel")
+        self.verticalLayout_17 = QVBoxLayout(self.DESModel)
+        self.verticalLayout_17.setObjectName(u"verticalLayout_17")
+        self.verticalLayout_17.setContentsMargins(0, 0, 0, -1)
+        self.groupBox_6 = QGroupBox(self.DESModel)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.verticalLayout_18 = QVBoxLayout(self.groupBox_6)
+        self.verticalLayout_18.setObjectName(u"verticalLayout_18")
+        self.RANSSpalartAllmaras = QRadioButton(self.groupBox_6)
+        self.RANSSpalartAllmaras.setObjectName(u"RANSSpalartAllmaras")
+
+        self.verticalLayout_18.addWidget(self.RANSSpalartAllmaras)
+
+        self.RANSKOmegaSST = QRadioButton(self.groupBox_6)
+        self.RANSKOmegaSST.setObjectName(u"RANSKOmegaSST")
+
+        self.verticalLayout_18.addWidget(self.RANSKOmegaSST)
+
+
+        self.verticalLayout_17.addWidget(self.groupBox_6)
+
+        self.sparlartAllmarasOptions = QGroupBox(self.DESModel)
+        self.sparlartAllmarasOptions.setObjectName(u"sparlartAllmarasOptions")
+        self.verticalLayout_19 = QVBoxLayout(self.sparlartAllmarasOptions)
+        self.verticalLayout_19.setObjectName(u"verticalLayout_19")
+        self.lowReDamping = QCheckBox(self.sparlartAllmarasOptions)
+        self.lowReDamping.setObjectName(u"lowReDamping")
+
+        self.verticalLayout_19.addWidget(self.lowReDamping)
+
+
+        self.verticalLayout_17.addWidget(self.sparlartAllmarasOptions)
+
+        self.DESOptions = QGroupBox(self.DESModel)
+        self.DESOptions.setObjectName(u"DESOptions")
+        self.verticalLayout_21 = QVBoxLayout(self.DESOptions)
+        self.verticalLayout_21.setObjectName(u"verticalLayout_21")
+        self.delayedDES = QCheckBox(self.DESOptions)
+        self.delayedDES.setObjectName(u"delayedDES")
+
+        self.verticalLayout_21.addWidget(self.delayedDES)
+
+
+        self.verticalLayout_17.addWidget(self.DESOptions)
+
+        self.shieldingFunctions = QGroupBox(self.DESModel)
+        self.shieldingFunctions.setObjectName(u"shieldingFunctions")
+        self.verticalLayout_14 = QVBoxLayout(self.shieldingFunctions)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.DDES = QRadioButton(self.shieldingFunctions)
+        self.DDES.setObjectName(u"DDES")
+
+        self.verticalLayout_14.addWidget(self.DDES)
+
+        self.IDDES = QRadioButton(self.shieldingFunctions)
+        self.IDDES.setObjectName(u"IDDES")
+
+        self.verticalLayout_14.addWidget(self.IDDES)
+
+
+        self.verticalLayout_17.addWidget(self.shieldingFunctions)
+
+        self.DESLengthScaleModel = QGroupBox(self.DESModel)
+        self.DESLengthScaleModel.setObjectName(u"DESLengthScaleModel")
+        self.verticalLayout_15 = QVBoxLayout(self.DESLengthScaleModel)
+        self.verticalLayout_15.setObjectName(u"verticalLayout_15")
+        self.DESCubeRootVolume = QRadioButton(self.DESLengthScaleModel)
+        self.DESCubeRootVolume.setObjectName(u"DESCubeRootVolume")
+
+        self.verticalLayout_15.addWidget(self.DESCubeRootVolume)
+
+        self.DESVanDriest = QRadioButton(self.DESLengthScaleModel)
+        self.DESVanDriest.setObjectName(u"DESVanDriest")
+
+        self.verticalLayout_15.addWidget(self.DESVanDriest)
+
+        self.DESSmooth = QRadioButton(self.DESLengthScaleModel)
+        self.DESSmooth.setObjectName(u"DESSmooth")
+
+        self.verticalLayout_15.addWidget(self.DESSmooth)
+
+
+        self.verticalLayout_17.addWidget(self.DESLengthScaleModel)
+
+
+        self.verticalLayout_8.addWidget(self.DESModel)
+
+        self.LESModel = QWidget(self.widget)
+        self.LESModel.setObjectName(u"LESModel")
+        self.verticalLayout_10 = QVBoxLayout(self.LESModel)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.verticalLayout_10.setContentsMargins(0, 0, 0, -1)
+        self.groupBox_4 = QGroupBox(self.LESModel)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.verticalLayout_11 = QVBoxLayout(self.groupBox_4)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.smagorinskyLilly = QRadioButton(self.groupBox_4)
+        self.smagorinskyLilly.setObjectName(u"smagorinskyLilly")
+
+        self.verticalLayout_11.addWidget(self.smagorinskyLilly)
+
+        self.WALE = QRadioButton(self.groupBox_4)
+        self.WALE.setObjectName(u"WALE")
+
+        self.verticalLayout_11.addWidget(self.WALE)
+
+        self.kineticEnergyTransport = QRadioButton(self.groupBox_4)
+        self.kineticEnergyTransport.setObjectName(u"kineticEnergyTransport")
+
+        self.verticalLayout_11.addWidget(self.kineticEnergyTransport)
+
+        self.oneEquationEddyViscosity = QRadioButton(self.groupBox_4)
+        self.oneEquationEddyViscosity.setObjectName(u"oneEquationEddyViscosity")
+
+        self.verticalLayout_11.addWidget(self.oneEquationEddyViscosity)
+
+
+        self.verticalLayout_10.addWidget(self.groupBox_4)
+
+        self.groupBox_5 = QGroupBox(self.LESModel)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.verticalLayout_12 = QVBoxLayout(self.groupBox_5)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.LESCubeRootVolume = QRadioButton(self.groupBox_5)
+        self.LESCubeRootVolume.setObjectName(u"LESCubeRootVolume")
+
+        self.verticalLayout_12.addWidget(self.LESCubeRootVolume)
+
+        self.LESVanDriest = QRadioButton(self.groupBox_5)
+        self.LESVanDriest.setObjectName(u"LESVanDriest")
+
+        self.verticalLayout_12.addWidget(self.LESVanDriest)
+
+        self.LESSmooth = QRadioButton(self.groupBox_5)
+        self.LESSmooth.setObjectName(u"LESSmooth")
+
+        self.verticalLayout_12.addWidget(self.LESSmooth)
+
+
+        self.verticalLayout_10.addWidget(self.groupBox_5)
+
+
+        self.verticalLayout_8.addWidget(self.LESModel)
+
+
+        self.horizontalLayout.addWidget(self.widget)
+
+        self.widget_4 = QWidget(self.widget_2)
+        self.widget_4.setObjectName(u"widget_4")
+        self.verticalLayout_16 = QVBoxLayout(self.widget_4)
+        self.verticalLayout_16.setObjectName(u"verticalLayout_16")
+        self.verticalLayout_16.setContentsMargins(-1, 0, 0, -1)
+        self.RASModelConstants = QWidget(self.widget_4)
+        self.RASModelConstants.setObjectName(u"RASModelConstants")
+        self.verticalLayout_9 = QVBoxLayout(self.RASModelConstants)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.verticalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_3 = QGroupBox(self.RASModelConstants)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout = QFormLayout(self.groupBox_3)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.groupBox_3)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.energyPrandtlNumber = QLineEdit(self.groupBox_3)
+        self.energyPrandtlNumber.setObjectName(u"energyPrandtlNumber")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.energyPrandtlNumber)
+
+        self.label_2 = QLabel(self.groupBox_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.wallPrandtlNumber = QLineEdit(self.groupBox_3)
+        self.wallPrandtlNumber.setObjectName(u"wallPrandtlNumber")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.wallPrandtlNumber)
+
+
+        self.verticalLayout_9.addWidget(self.groupBox_3)
+
+        self.reynoldsGroup = QGroupBox(self.RASModelConstants)
+        self.reynoldsGroup.setObjectName(u"reynoldsGroup")
+        self.formLayout_2 = QFormLayout(self.reynoldsGroup)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_3 = QLabel(self.reynoldsGroup)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.threshold = QLineEdit(self.reynoldsGroup)
+        self.threshold.setObjectName(u"threshold")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.threshold)
+
+        self.label_4 = QLabel(self.reynoldsGroup)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.blendingWidth = QLineEdit(self.reynoldsGroup)
+        self.blendingWidth.setObjectName(u"blendingWidth")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.blendingWidth)
+
+
+        self.verticalLayout_9.addWidget(self.reynoldsGroup)
+
+
+        self.verticalLayout_16.addWidget(self.RASModelConstants)
+
+        self.DESModelConstants = QGroupBox(self.widget_4)
+        self.DESModelConstants.setObjectName(u"DESModelConstants")
+        self.DESConstantsLayout = QFormLayout(self.DESModelConstants)
+        self.DESConstantsLayout.setObjectName(u"DESConstantsLayout")
+        self.label_8 = QLabel(self.DESModelConstants)
+        self.label_8.setObjectName(u"label_8")
+
+        self.DESConstantsLayout.setWidget(0, QFormLayout.LabelRole, self.label_8)
+
+        self.cDES = QLineEdit(self.DESModelConstants)
+        self.cDES.setObjectName(u"cDES")
+
+        self.DESConstantsLayout.setWidget(0, QFormLayout.FieldRole, self.cDES)
+
+        self.label_9 = QLabel(self.DESModelConstants)
+        self.label_9.setObjectName(u"label_9")
+
+        self.DESConstantsLayout.setWidget(1, QFormLayout.LabelRole, self.label_9)
+
+        self.cDESKOmega = QLineEdit(self.DESModelConstants)
+        self.cDESKOmega.setObjectName(u"cDESKOmega")
+
+        self.DESConstantsLayout.setWidget(1, QFormLayout.FieldRole, self.cDESKOmega)
+
+        self.label_10 = QLabel(self.DESModelConstants)
+        self.label_10.setObjectName(u"label_10")
+
+        self.DESConstantsLayout.setWidget(2, QFormLayout.LabelRole, self.label_10)
+
+        self.cDESKEpsilon = QLineEdit(self.DESModelConstants)
+        self.cDESKEpsilon.setObjectName(u"cDESKEpsilon")
+
+        self.DESConstantsLayout.setWidget(2, QFormLayout.FieldRole, self.cDESKEpsilon)
+
+
+        self.verticalLayout_16.addWidget(self.DESModelConstants)
+
+        self.LESModelConstants = QGroupBox(self.widget_4)
+        self.LESModelConstants.setObjectName(u"LESModelConstants")
+        self.LESConstantsLayout = QFormLayout(self.LESModelConstants)
+        self.LESConstantsLayout.setObjectName(u"LESConstantsLayout")
+        self.label_5 = QLabel(self.LESModelConstants)
+        self.label_5.setObjectName(u"label_5")
+
+        self.LESConstantsLayout.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.ck = QLineEdit(self.LESModelConstants)
+        self.ck.setObjectName(u"ck")
+
+        self.LESConstantsLayout.setWidget(0, QFormLayout.FieldRole, self.ck)
+
+        self.label_6 = QLabel(self.LESModelConstants)
+        self.label_6.setObjectName(u"label_6")
+
+        self.LESConstantsLayout.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.ce = QLineEdit(self.LESModelConstants)
+        self.ce.setObjectName(u"ce")
+
+        self.LESConstantsLayout.setWidget(1, QFormLayout.FieldRole, self.ce)
+
+        self.label_7 = QLabel(self.LESModelConstants)
+        self.label_7.setObjectName(u"label_7")
+
+        self.LESConstantsLayout.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.cw = QLineEdit(self.LESModelConstants)
+        self.cw.setObjectName(u"cw")
+
+        self.LESConstantsLayout.setWidget(2, QFormLayout.FieldRole, self.cw)
+
+
+        self.verticalLayout_16.addWidget(self.LESModelConstants)
+
+        self.schmidtNumber = QGroupBox(self.widget_4)
+        self.schmidtNumber.setObjectName(u"schmidtNumber")
+        self.formLayout_3 = QFormLayout(self.schmidtNumber)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_11 = QLabel(self.schmidtNumber)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_11)
+
+        self.turbulentSchmidtNumber = QLineEdit(self.schmidtNumber)
+        self.turbulentSchmidtNumber.setObjectName(u"turbulentSchmidtNumber")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.turbulentSchmidtNumber)
+
+
+        self.verticalLayout_16.addWidget(self.schmidtNumber)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_16.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout.addWidget(self.widget_4)
+
+
+        self.verticalLayout_7.addWidget(self.widget_2)
+
+        self.verticalSpacer = QSpacerItem(20, 2, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer)
+
+        self.widget_3 = QWidget(TurbulenceDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_7.addWidget(self.widget_3)
+
+        QWidget.setTabOrder(self.inviscid, self.laminar)
+        QWidget.setTabOrder(self.laminar, self.spalartAllmaras)
+        QWidget.setTabOrder(self.spalartAllmaras, self.kEpsilon)
+        QWidget.setTabOrder(self.kEpsilon, self.kOmega)
+        QWidget.setTabOrder(self.kOmega, self.LES)
+        QWidget.setTabOrder(self.LES, self.standard)
+        QWidget.setTabOrder(self.standard, self.RNG)
+        QWidget.setTabOrder(self.RNG, self.realizable)
+        QWidget.setTabOrder(self.realizable, self.standardWallFunction)
+        QWidget.setTabOrder(self.standardWallFunction, self.enhancedWallTreatment)
+        QWidget.setTabOrder(self.enhancedWallTreatment, self.SST)
+        QWidget.setTabOrder(self.SST, self.energyPrandtlNumber)
+        QWidget.setTabOrder(self.energyPrandtlNumber, self.wallPrandtlNumber)
+
+        self.retranslateUi(TurbulenceDialog)
+        self.cancel.clicked.connect(TurbulenceDialog.reject)
+
+        QMetaObject.connectSlotsByName(TurbulenceDialog)
+    # setupUi
+
+    def retranslateUi(self, TurbulenceDialog):
+        TurbulenceDialog.setWindowTitle(QCoreApplication.translate("TurbulenceDialog", u"Turbulence Model", None))
+        self.groupBox.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Model", None))
+        self.inviscid.setText(QCoreApplication.translate("TurbulenceDialog", u"Inviscid", None))
+        self.laminar.setText(QCoreApplication.translate("TurbulenceDialog", u"Laminar", None))
+        self.spalartAllmaras.setText(QCoreApplication.translate("TurbulenceDialog", u"Spalart-Allmaras", None))
+        self.kEpsilon.setText(QCoreApplication.translate("TurbulenceDialog", u"k-epsilon", None))
+        self.kOmega.setText(QCoreApplication.translate("TurbulenceDialog", u"k-omega", None))
+        self.DES.setText(QCoreApplication.translate("TurbulenceDialog", u"DES, Detached Eddy Simulation", None))
+        self.LES.setText(QCoreApplication.translate("TurbulenceDialog", u"LES, Large Eddy Simulation", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("TurbulenceDialog", u"k-epsilon Model", None))
+        self.standard.setText(QCoreApplication.translate("TurbulenceDialog", u"Standard", None))
+        self.RNG.setText(QCoreApplication.translate("TurbulenceDialog", u"RNG", None))
+        self.realizable.setText(QCoreApplication.translate("TurbulenceDialog", u"Realizable", None))
+        self.nearWallTreatment.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Near-Wall Treatment", None))
+        self.standardWallFunction.setText(QCoreApplication.translate("TurbulenceDialog", u"Standard Wall Functions", None))
+        self.enhancedWallTreatment.setText(QCoreApplication.translate("TurbulenceDialog", u"Enhanced Wall Treatment (two layer)", None))
+        self.kOmegaModel.setTitle(QCoreApplication.translate("TurbulenceDialog", u"k-omega Model", None))
+        self.SST.setText(QCoreApplication.translate("TurbulenceDialog", u"SST", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("TurbulenceDialog", u"RANS Model", None))
+        self.RANSSpalartAllmaras.setText(QCoreApplication.translate("TurbulenceDialog", u"Spalart-Allmaras", None))
+        self.RANSKOmegaSST.setText(QCoreApplication.translate("TurbulenceDialog", u"k-omega SST", None))
+        self.sparlartAllmarasOptions.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Sparlart-Allmaras Options", None))
+        self.lowReDamping.setText(QCoreApplication.translate("TurbulenceDialog", u"Low-Re Damping", None))
+        self.DESOptions.setTitle(QCoreApplication.translate("TurbulenceDialog", u"DES Options", None))
+        self.delayedDES.setText(QCoreApplication.translate("TurbulenceDialog", u"Delayed DES", None))
+        self.shieldingFunctions.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Shielding Functions", None))
+        self.DDES.setText(QCoreApplication.translate("TurbulenceDialog", u"DDES", None))
+        self.IDDES.setText(QCoreApplication.translate("TurbulenceDialog", u"IDDES", None))
+        self.DESLengthScaleModel.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Length-Scale Model", None))
+        self.DESCubeRootVolume.setText(QCoreApplication.translate("TurbulenceDialog", u"Cube-root Volume", None))
+        self.DESVanDriest.setText(QCoreApplication.translate("TurbulenceDialog", u"Van Driest", None))
+        self.DESSmooth.setText(QCoreApplication.translate("TurbulenceDialog", u"smooth", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Subgrid-Scale Model", None))
+        self.smagorinskyLilly.setText(QCoreApplication.translate("TurbulenceDialog", u"Smagorinsky-Lilly", None))
+        self.WALE.setText(QCoreApplication.translate("TurbulenceDialog", u"WALE", None))
+        self.kineticEnergyTransport.setText(QCoreApplication.translate("TurbulenceDialog", u"Kinetic-Energy Transport", None))
+        self.oneEquationEddyViscosity.setText(QCoreApplication.translate("TurbulenceDialog", u"One Equation Eddy Viscosity", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Length-Scale Model", None))
+        self.LESCubeRootVolume.setText(QCoreApplication.translate("TurbulenceDialog", u"Cube-root Volume", None))
+        self.LESVanDriest.setText(QCoreApplication.translate("TurbulenceDialog", u"Van Driest", None))
+        self.LESSmooth.setText(QCoreApplication.translate("TurbulenceDialog", u"smooth", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Turbulent Prandtl Number", None))
+        self.label.setText(QCoreApplication.translate("TurbulenceDialog", u"for Internal Field", None))
+        self.label_2.setText(QCoreApplication.translate("TurbulenceDialog", u"for Wall Function", None))
+        self.reynoldsGroup.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Reynolds Parameters for Two-Layer Model", None))
+        self.label_3.setText(QCoreApplication.translate("TurbulenceDialog", u"Threshold, Re<sub>y</sub><sup>*<sup>", None))
+        self.label_4.setText(QCoreApplication.translate("TurbulenceDialog", u"Blending Width, \u0394Re<sub>y</sub>", None))
+        self.DESModelConstants.setTitle(QCoreApplication.translate("TurbulenceDialog", u"DES Model Constants", None))
+        self.label_8.setText(QCoreApplication.translate("TurbulenceDialog", u"C<sub>DES</sub>", None))
+        self.label_9.setText(QCoreApplication.translate("TurbulenceDialog", u"C<sub>DES</sub> (k-omega)", None))
+        self.label_10.setText(QCoreApplication.translate("TurbulenceDialog", u"C<sub>DES</sub> (k-epsilon)", None))
+        self.LESModelConstants.setTitle(QCoreApplication.translate("TurbulenceDialog", u"LES Model Constants", None))
+        self.label_5.setText(QCoreApplication.translate("TurbulenceDialog", u"C<sub>k</sub>", None))
+        self.label_6.setText(QCoreApplication.translate("TurbulenceDialog", u"C<sub>e</sub>", None))
+        self.label_7.setText(QCoreApplication.translate("TurbulenceDialog", u"C<sub>w</sub>", None))
+        self.schmidtNumber.setTitle(QCoreApplication.translate("TurbulenceDialog", u"Turbulent Schmidt Number", None))
+        self.label_11.setText(QCoreApplication.translate("TurbulenceDialog", u"Turbulent Schmidt Number", None))
+        self.ok.setText(QCoreApplication.translate("TurbulenceDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("TurbulenceDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'user_defined_scalar_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+from widgets.enum_combo_box import EnumComboBox
+
+class Ui_UserDefinedScalarDialog(object):
+    def setupUi(self, UserDefinedScalarDialog):
+        if not UserDefinedScalarDialog.objectName():
+            UserDefinedScalarDialog.setObjectName(u"UserDefinedScalarDialog")
+        UserDefinedScalarDialog.resize(400, 318)
+        self.verticalLayout = QVBoxLayout(UserDefinedScalarDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.form = QWidget(UserDefinedScalarDialog)
+        self.form.setObjectName(u"form")
+        self.verticalLayout_3 = QVBoxLayout(self.form)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.widget = QWidget(self.form)
+        self.widget.setObjectName(u"widget")
+        self.basicsLayout = QFormLayout(self.widget)
+        self.basicsLayout.setObjectName(u"basicsLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.basicsLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.fieldName = QLineEdit(self.widget)
+        self.fieldName.setObjectName(u"fieldName")
+
+        self.basicsLayout.setWidget(0, QFormLayout.FieldRole, self.fieldName)
+
+        self.targetLabel = QLabel(self.widget)
+        self.targetLabel.setObjectName(u"targetLabel")
+
+        self.basicsLayout.setWidget(1, QFormLayout.LabelRole, self.targetLabel)
+
+        self.target = QComboBox(self.widget)
+        self.target.setObjectName(u"target")
+
+        self.basicsLayout.setWidget(1, QFormLayout.FieldRole, self.target)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(self.form)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_3 = QWidget(self.groupBox)
+        self.widget_3.setObjectName(u"widget_3")
+        self.formLayout_2 = QFormLayout(self.widget_3)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.targetLabel_2 = QLabel(self.widget_3)
+        self.targetLabel_2.setObjectName(u"targetLabel_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.targetLabel_2)
+
+        self.specificationMethod = EnumComboBox(self.widget_3)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+        self.constant = QWidget(self.groupBox)
+        self.constant.setObjectName(u"constant")
+        self.formLayout_3 = QFormLayout(self.constant)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.label_2 = QLabel(self.constant)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.diffusivity = BatchableFloatEdit(self.constant)
+        self.diffusivity.setObjectName(u"diffusivity")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.diffusivity)
+
+
+        self.verticalLayout_2.addWidget(self.constant)
+
+        self.laminarAndTurbulentViscosity = QWidget(self.groupBox)
+        self.laminarAndTurbulentViscosity.setObjectName(u"laminarAndTurbulentViscosity")
+        self.formLayout_5 = QFormLayout(self.laminarAndTurbulentViscosity)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(-1, 0, -1, -1)
+        self.label_4 = QLabel(self.laminarAndTurbulentViscosity)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.laminarViscosityCoefficient = BatchableFloatEdit(self.laminarAndTurbulentViscosity)
+        self.laminarViscosityCoefficient.setObjectName(u"laminarViscosityCoefficient")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.laminarViscosityCoefficient)
+
+        self.label_5 = QLabel(self.laminarAndTurbulentViscosity)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.turbulentViscosityCoefficient = BatchableFloatEdit(self.laminarAndTurbulentViscosity)
+        self.turbulentViscosityCoefficient.setObjectName(u"turbulentViscosityCoefficient")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.turbulentViscosityCoefficient)
+
+
+        self.verticalLayout_2.addWidget(self.laminarAndTurbulentViscosity)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+
+        self.verticalLayout.addWidget(self.form)
+
+        self.widget_2 = QWidget(UserDefinedScalarDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(UserDefinedScalarDialog)
+        self.cancel.clicked.connect(UserDefinedScalarDialog.reject)
+
+        QMetaObject.connectSlotsByName(UserDefinedScalarDialog)
+    # setupUi
+
+    def retranslateUi(self, UserDefinedScalarDialog):
+        UserDefinedScalarDialog.setWindowTitle(QCoreApplication.translate("UserDefinedScalarDialog", u"User-defined Scalar", None))
+        self.label.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"Field Name", None))
+        self.targetLabel.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"Region", None))
+        self.groupBox.setTitle(QCoreApplication.translate("UserDefinedScalarDialog", u"Diffusivity", None))
+        self.targetLabel_2.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"SpecificationMethod", None))
+        self.label_2.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"Diffusivity, D (m<sup>2</sup>/s)", None))
+        self.label_4.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"Laminar Viscosity Coefficient", None))
+        self.label_5.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"Turbulent Viscosity Coefficient", None))
+        self.ok.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("UserDefinedScalarDialog", u"Cancel", None))
+    # retranslateUi
+
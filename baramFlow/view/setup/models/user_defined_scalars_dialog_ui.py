@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'user_defined_scalars_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QHeaderView,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+
+from widgets.flat_push_button import FlatPushButton
+import resource_rc
+
+class Ui_UserDefinedScalarsDialog(object):
+    def setupUi(self, UserDefinedScalarsDialog):
+        if not UserDefinedScalarsDialog.objectName():
+            UserDefinedScalarsDialog.setObjectName(u"UserDefinedScalarsDialog")
+        UserDefinedScalarsDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(UserDefinedScalarsDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(UserDefinedScalarsDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, -1, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.add = FlatPushButton(self.widget)
+        self.add.setObjectName(u"add")
+        icon = QIcon()
+        icon.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.add.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.add)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.scalars = QTreeWidget(UserDefinedScalarsDialog)
+        self.scalars.headerItem().setText(3, "")
+        self.scalars.setObjectName(u"scalars")
+        self.scalars.setColumnCount(4)
+
+        self.verticalLayout.addWidget(self.scalars)
+
+        self.widget_2 = QWidget(UserDefinedScalarsDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(UserDefinedScalarsDialog)
+        self.cancel.clicked.connect(UserDefinedScalarsDialog.reject)
+
+        QMetaObject.connectSlotsByName(UserDefinedScalarsDialog)
+    # setupUi
+
+    def retranslateUi(self, UserDefinedScalarsDialog):
+        UserDefinedScalarsDialog.setWindowTitle(QCoreApplication.translate("UserDefinedScalarsDialog", u"User-defined Scalars", None))
+        self.label.setText(QCoreApplication.translate("UserDefinedScalarsDialog", u"User-defined Scalars", None))
+        self.add.setText("")
+        ___qtreewidgetitem = self.scalars.headerItem()
+        ___qtreewidgetitem.setText(2, QCoreApplication.translate("UserDefinedScalarsDialog", u"Diffusivity", None));
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("UserDefinedScalarsDialog", u"Material", None));
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("UserDefinedScalarsDialog", u"Field Name", None));
+        self.ok.setText(QCoreApplication.translate("UserDefinedScalarsDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("UserDefinedScalarsDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'reference_values_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QFrame, QLabel,
+    QLineEdit, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_ReferenceValuesPage(object):
+    def setupUi(self, ReferenceValuesPage):
+        if not ReferenceValuesPage.objectName():
+            ReferenceValuesPage.setObjectName(u"ReferenceValuesPage")
+        ReferenceValuesPage.resize(240, 579)
+        self.verticalLayout = QVBoxLayout(ReferenceValuesPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.title = QLabel(ReferenceValuesPage)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout.addWidget(self.title)
+
+        self.line = QFrame(ReferenceValuesPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.widget_2 = QWidget(ReferenceValuesPage)
+        self.widget_2.setObjectName(u"widget_2")
+        self.formLayout_3 = QFormLayout(self.widget_2)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label = QLabel(self.widget_2)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.area = QLineEdit(self.widget_2)
+        self.area.setObjectName(u"area")
+        self.area.setEnabled(True)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.area)
+
+        self.label_7 = QLabel(self.widget_2)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.density = QLineEdit(self.widget_2)
+        self.density.setObjectName(u"density")
+        self.density.setEnabled(True)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.density)
+
+        self.label_8 = QLabel(self.widget_2)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.length = QLineEdit(self.widget_2)
+        self.length.setObjectName(u"length")
+        self.length.setEnabled(True)
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.length)
+
+        self.label_9 = QLabel(self.widget_2)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(3, QFormLayout.LabelRole, self.label_9)
+
+        self.pressure = QLineEdit(self.widget_2)
+        self.pressure.setObjectName(u"pressure")
+        self.pressure.setEnabled(True)
+
+        self.formLayout_3.setWidget(3, QFormLayout.FieldRole, self.pressure)
+
+        self.label_10 = QLabel(self.widget_2)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_3.setWidget(4, QFormLayout.LabelRole, self.label_10)
+
+        self.velocity = QLineEdit(self.widget_2)
+        self.velocity.setObjectName(u"velocity")
+        self.velocity.setEnabled(True)
+
+        self.formLayout_3.setWidget(4, QFormLayout.FieldRole, self.velocity)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(ReferenceValuesPage)
+
+        QMetaObject.connectSlotsByName(ReferenceValuesPage)
+    # setupUi
+
+    def retranslateUi(self, ReferenceValuesPage):
+        ReferenceValuesPage.setWindowTitle(QCoreApplication.translate("ReferenceValuesPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("ReferenceValuesPage", u"Reference Values", None))
+        self.label.setText(QCoreApplication.translate("ReferenceValuesPage", u"Area (m<sup>2</sup>)", None))
+        self.area.setText("")
+        self.label_7.setText(QCoreApplication.translate("ReferenceValuesPage", u"Density (kg/m<sup>3</sup>)", None))
+        self.density.setText("")
+        self.label_8.setText(QCoreApplication.translate("ReferenceValuesPage", u"Length (m)", None))
+        self.length.setText("")
+        self.label_9.setText(QCoreApplication.translate("ReferenceValuesPage", u"Pressure (Pa)", None))
+        self.pressure.setText("")
+        self.label_10.setText(QCoreApplication.translate("ReferenceValuesPage", u"Velocity (m/s)", None))
+        self.velocity.setText("")
+    # retranslateUi
+
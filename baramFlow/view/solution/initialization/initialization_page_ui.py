@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'initialization_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSpacerItem, QTabWidget,
+    QVBoxLayout, QWidget)
+
+class Ui_InitializationPage(object):
+    def setupUi(self, InitializationPage):
+        if not InitializationPage.objectName():
+            InitializationPage.setObjectName(u"InitializationPage")
+        InitializationPage.resize(380, 762)
+        self.verticalLayout_4 = QVBoxLayout(InitializationPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.label = QLabel(InitializationPage)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.label)
+
+        self.line = QFrame(InitializationPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.tabWidget = QTabWidget(InitializationPage)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.tabWidget.setTabPosition(QTabWidget.South)
+
+        self.verticalLayout_4.addWidget(self.tabWidget)
+
+        self.widget_5 = QWidget(InitializationPage)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer_2 = QSpacerItem(260, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.initialize = QPushButton(self.widget_5)
+        self.initialize.setObjectName(u"initialize")
+
+        self.horizontalLayout_3.addWidget(self.initialize)
+
+
+        self.verticalLayout_4.addWidget(self.widget_5)
+
+
+        self.retranslateUi(InitializationPage)
+
+        QMetaObject.connectSlotsByName(InitializationPage)
+    # setupUi
+
+    def retranslateUi(self, InitializationPage):
+        InitializationPage.setWindowTitle(QCoreApplication.translate("InitializationPage", u"Form", None))
+        self.label.setText(QCoreApplication.translate("InitializationPage", u"Initialization", None))
+        self.initialize.setText(QCoreApplication.translate("InitializationPage", u"&Initialize", None))
+    # retranslateUi
+
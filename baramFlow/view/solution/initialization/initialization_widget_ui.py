@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'initialization_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QFrame,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_initializationWidget(object):
+    def setupUi(self, initializationWidget):
+        if not initializationWidget.objectName():
+            initializationWidget.setObjectName(u"initializationWidget")
+        initializationWidget.resize(505, 560)
+        self.verticalLayout_4 = QVBoxLayout(initializationWidget)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.scrollArea = QScrollArea(initializationWidget)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 487, 542))
+        self.verticalLayout_5 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 9, 0)
+        self.initialValues = QGroupBox(self.scrollAreaWidgetContents)
+        self.initialValues.setObjectName(u"initialValues")
+        self.initialValuesLayout = QVBoxLayout(self.initialValues)
+        self.initialValuesLayout.setObjectName(u"initialValuesLayout")
+        self.widget = QWidget(self.initialValues)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.computeFrom = QComboBox(self.widget)
+        self.computeFrom.setObjectName(u"computeFrom")
+
+        self.horizontalLayout_2.addWidget(self.computeFrom)
+
+        self.horizontalLayout_2.setStretch(1, 1)
+
+        self.initialValuesLayout.addWidget(self.widget)
+
+        self.velocity = QGroupBox(self.initialValues)
+        self.velocity.setObjectName(u"velocity")
+        self.formLayout = QFormLayout(self.velocity)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.velocity)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.xVelocity = QLineEdit(self.velocity)
+        self.xVelocity.setObjectName(u"xVelocity")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.xVelocity)
+
+        self.label_3 = QLabel(self.velocity)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.yVelocity = QLineEdit(self.velocity)
+        self.yVelocity.setObjectName(u"yVelocity")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.yVelocity)
+
+        self.label_4 = QLabel(self.velocity)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.zVelocity = QLineEdit(self.velocity)
+        self.zVelocity.setObjectName(u"zVelocity")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.zVelocity)
+
+
+        self.initialValuesLayout.addWidget(self.velocity)
+
+        self.properties = QWidget(self.initialValues)
+        self.properties.setObjectName(u"properties")
+        self.formLayout_2 = QFormLayout(self.properties)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_5 = QLabel(self.properties)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.pressure = QLineEdit(self.properties)
+        self.pressure.setObjectName(u"pressure")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.pressure)
+
+        self.label_6 = QLabel(self.properties)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.temperature = QLineEdit(self.properties)
+        self.temperature.setObjectName(u"temperature")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.temperature)
+
+
+        self.initialValuesLayout.addWidget(self.properties)
+
+        self.turbulence = QGroupBox(self.initialValues)
+        self.turbulence.setObjectName(u"turbulence")
+        self.formLayout_3 = QFormLayout(self.turbulence)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_7 = QLabel(self.turbulence)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_7)
+
+        self.scaleOfVelocity = QLineEdit(self.turbulence)
+        self.scaleOfVelocity.setObjectName(u"scaleOfVelocity")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.scaleOfVelocity)
+
+        self.label_8 = QLabel(self.turbulence)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_8)
+
+        self.turbulentIntensity = QLineEdit(self.turbulence)
+        self.turbulentIntensity.setObjectName(u"turbulentIntensity")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.turbulentIntensity)
+
+        self.label_9 = QLabel(self.turbulence)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_9)
+
+        self.turbulentViscosityRatio = QLineEdit(self.turbulence)
+        self.turbulentViscosityRatio.setObjectName(u"turbulentViscosityRatio")
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.turbulentViscosityRatio)
+
+
+        self.initialValuesLayout.addWidget(self.turbulence)
+
+
+        self.verticalLayout_5.addWidget(self.initialValues)
+
+        self.advanced = QGroupBox(self.scrollAreaWidgetContents)
+        self.advanced.setObjectName(u"advanced")
+        self.verticalLayout_2 = QVBoxLayout(self.advanced)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.sections = QGroupBox(self.advanced)
+        self.sections.setObjectName(u"sections")
+        self.verticalLayout_3 = QVBoxLayout(self.sections)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.sectionList = QWidget(self.sections)
+        self.sectionList.setObjectName(u"sectionList")
+        self.sectionListLayout = QVBoxLayout(self.sectionList)
+        self.sectionListLayout.setObjectName(u"sectionListLayout")
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.sectionListLayout.addItem(self.verticalSpacer)
+
+
+        self.verticalLayout_3.addWidget(self.sectionList)
+
+        self.widget_3 = QWidget(self.sections)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout = QHBoxLayout(self.widget_3)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.create = QPushButton(self.widget_3)
+        self.create.setObjectName(u"create")
+
+        self.horizontalLayout.addWidget(self.create)
+
+        self.delete_ = QPushButton(self.widget_3)
+        self.delete_.setObjectName(u"delete_")
+
+        self.horizontalLayout.addWidget(self.delete_)
+
+        self.edit = QPushButton(self.widget_3)
+        self.edit.setObjectName(u"edit")
+
+        self.horizontalLayout.addWidget(self.edit)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+
+        self.verticalLayout_2.addWidget(self.sections)
+
+
+        self.verticalLayout_5.addWidget(self.advanced)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_4.addWidget(self.scrollArea)
+
+
+        self.retranslateUi(initializationWidget)
+
+        QMetaObject.connectSlotsByName(initializationWidget)
+    # setupUi
+
+    def retranslateUi(self, initializationWidget):
+        initializationWidget.setWindowTitle(QCoreApplication.translate("initializationWidget", u"Form", None))
+        self.initialValues.setTitle(QCoreApplication.translate("initializationWidget", u"Initial Values", None))
+        self.label.setText(QCoreApplication.translate("initializationWidget", u"Compute from", None))
+        self.velocity.setTitle(QCoreApplication.translate("initializationWidget", u"Velocity", None))
+        self.label_2.setText(QCoreApplication.translate("initializationWidget", u"X-Velocity (m/s)", None))
+        self.label_3.setText(QCoreApplication.translate("initializationWidget", u"Y-Velocity (m/s)", None))
+        self.label_4.setText(QCoreApplication.translate("initializationWidget", u"Z-Velocity (m/s)", None))
+        self.label_5.setText(QCoreApplication.translate("initializationWidget", u"Pressure (Pa)", None))
+        self.label_6.setText(QCoreApplication.translate("initializationWidget", u"Temperature (K)", None))
+        self.turbulence.setTitle(QCoreApplication.translate("initializationWidget", u"Turbulence", None))
+        self.label_7.setText(QCoreApplication.translate("initializationWidget", u"Scale of Velocity (m/s)", None))
+        self.label_8.setText(QCoreApplication.translate("initializationWidget", u"Turbulent Intensity (%)", None))
+        self.label_9.setText(QCoreApplication.translate("initializationWidget", u"Turbulent Viscosity Ratio", None))
+        self.advanced.setTitle(QCoreApplication.translate("initializationWidget", u"Advanced", None))
+        self.sections.setTitle(QCoreApplication.translate("initializationWidget", u"Sections", None))
+        self.create.setText(QCoreApplication.translate("initializationWidget", u"Create", None))
+        self.delete_.setText(QCoreApplication.translate("initializationWidget", u"Delete", None))
+        self.edit.setText(QCoreApplication.translate("initializationWidget", u"Edit", None))
+    # retranslateUi
+
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'option_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QComboBox,
+    QDialog, QDialogButtonBox, QFormLayout, QHBoxLayout,
+    QLabel, QLineEdit, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_OptionDialog(object):
+    def setupUi(self, OptionDialog):
+        if not OptionDialog.objectName():
+            OptionDialog.setObjectName(u"OptionDialog")
+        OptionDialog.resize(400, 408)
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(OptionDialog.sizePolicy().hasHeightForWidth())
+        OptionDialog.setSizePolicy(sizePolicy)
+        OptionDialog.setMinimumSize(QSize(400, 0))
+        OptionDialog.setMaximumSize(QSize(400, 16777215))
+        self.verticalLayout = QVBoxLayout(OptionDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_9 = QWidget(OptionDialog)
+        self.widget_9.setObjectName(u"widget_9")
+        self.formLayout_4 = QFormLayout(self.widget_9)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.formLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_9)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.name = QLineEdit(self.widget_9)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.name)
+
+        self.label_2 = QLabel(self.widget_9)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.type = QComboBox(self.widget_9)
+        self.type.addItem("")
+        self.type.addItem("")
+        self.type.addItem("")
+        self.type.setObjectName(u"type")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.type)
+
+
+        self.verticalLayout.addWidget(self.widget_9)
+
+        self.typeProperties = QWidget(OptionDialog)
+        self.typeProperties.setObjectName(u"typeProperties")
+        self.verticalLayout_2 = QVBoxLayout(self.typeProperties)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.box = QWidget(self.typeProperties)
+        self.box.setObjectName(u"box")
+        self.formLayout = QFormLayout(self.box)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(9, 9, 9, 9)
+        self.label_3 = QLabel(self.box)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.widget_3 = QWidget(self.box)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout = QHBoxLayout(self.widget_3)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.minPointX = QLineEdit(self.widget_3)
+        self.minPointX.setObjectName(u"minPointX")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.minPointX.sizePolicy().hasHeightForWidth())
+        self.minPointX.setSizePolicy(sizePolicy1)
+        self.minPointX.setMaximumSize(QSize(80, 16777215))
+
+        self.horizontalLayout.addWidget(self.minPointX)
+
+        self.minPointY = QLineEdit(self.widget_3)
+        self.minPointY.setObjectName(u"minPointY")
+        sizePolicy1.setHeightForWidth(self.minPointY.sizePolicy().hasHeightForWidth())
+        self.minPointY.setSizePolicy(sizePolicy1)
+        self.minPointY.setMaximumSize(QSize(80, 16777215))
+
+        self.horizontalLayout.addWidget(self.minPointY)
+
+        self.minPointZ = QLineEdit(self.widget_3)
+        self.minPointZ.setObjectName(u"minPointZ")
+        sizePolicy1.setHeightForWidth(self.minPointZ.sizePolicy().hasHeightForWidth())
+        self.minPointZ.setSizePolicy(sizePolicy1)
+        self.minPointZ.setMaximumSize(QSize(80, 16777215))
+
+        self.horizontalLayout.addWidget(self.minPointZ)
+
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.widget_3)
+
+        self.label_4 = QLabel(self.box)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.widget_4 = QWidget(self.box)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.maxPointX = QLineEdit(self.widget_4)
+        self.maxPointX.setObjectName(u"maxPointX")
+        sizePolicy1.setHeightForWidth(self.maxPointX.sizePolicy().hasHeightForWidth())
+        self.maxPointX.setSizePolicy(sizePolicy1)
+        self.maxPointX.setMaximumSize(QSize(80, 16777215))
+
+        self.horizontalLayout_2.addWidget(self.maxPointX)
+
+        self.maxPointY = QLineEdit(self.widget_4)
+        self.maxPointY.setObjectName(u"maxPointY")
+        sizePolicy1.setHeightForWidth(self.maxPointY.sizePolicy().hasHeightForWidth())
+        self.maxPointY.setSizePolicy(sizePolicy1)
+        self.maxPointY.setMaximumSize(QSize(80, 16777215))
+
+        self.horizontalLayout_2.addWidget(self.maxPointY)
+
+        self.maxPointZ = QLineEdit(self.widget_4)
+        self.maxPointZ.setObjectName(u"maxPointZ")
+        sizePolicy1.setHeightForWidth(self.maxPointZ.sizePolicy().hasHeightForWidth())
+        self.maxPointZ.setSizePolicy(sizePolicy1)
+        self.maxPointZ.setMaximumSize(QSize(80, 16777215))
+
+        self.horizontalLayout_2.addWidget(self.maxPointZ)
+
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.widget_4)
+
+
+        self.verticalLayout_2.addWidget(self.box)
+
+        self.cylinder = QWidget(self.typeProperties)
+        self.cylinder.setObjectName(u"cylinder")
+        self.formLayout_2 = QFormLayout(self.cylinder)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.label_5 = QLabel(self.cylinder)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.widget_6 = QWidget(self.cylinder)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.lowerCenterX = QLineEdit(self.widget_6)
+        self.lowerCenterX.setObjectName(u"lowerCenterX")
+        sizePolicy1.setHeightForWidth(self.lowerCenterX.sizePolicy().hasHeightForWidth())
+        self.lowerCenterX.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_3.addWidget(self.lowerCenterX)
+
+        self.lowerCenterY = QLineEdit(self.widget_6)
+        self.lowerCenterY.setObjectName(u"lowerCenterY")
+        sizePolicy1.setHeightForWidth(self.lowerCenterY.sizePolicy().hasHeightForWidth())
+        self.lowerCenterY.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_3.addWidget(self.lowerCenterY)
+
+        self.lowerCenterZ = QLineEdit(self.widget_6)
+        self.lowerCenterZ.setObjectName(u"lowerCenterZ")
+        sizePolicy1.setHeightForWidth(self.lowerCenterZ.sizePolicy().hasHeightForWidth())
+        self.lowerCenterZ.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_3.addWidget(self.lowerCenterZ)
+
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.widget_6)
+
+        self.label_6 = QLabel(self.cylinder)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.widget_7 = QWidget(self.cylinder)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.upperCenterX = QLineEdit(self.widget_7)
+        self.upperCenterX.setObjectName(u"upperCenterX")
+        sizePolicy1.setHeightForWidth(self.upperCenterX.sizePolicy().hasHeightForWidth())
+        self.upperCenterX.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_4.addWidget(self.upperCenterX)
+
+        self.upperCenterY = QLineEdit(self.widget_7)
+        self.upperCenterY.setObjectName(u"upperCenterY")
+        sizePolicy1.setHeightForWidth(self.upperCenterY.sizePolicy().hasHeightForWidth())
+        self.upperCenterY.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_4.addWidget(self.upperCenterY)
+
+        self.upperCenterZ = QLineEdit(self.widget_7)
+        self.upperCenterZ.setObjectName(u"upperCenterZ")
+        sizePolicy1.setHeightForWidth(self.upperCenterZ.sizePolicy().hasHeightForWidth())
+        self.upperCenterZ.setSizePolicy(sizePolicy1)
+
+        self.horizontalLayout_4.addWidget(self.upperCenterZ)
+
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.widget_7)
+
+        self.label_7 = QLabel(self.cylinder)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.radius = QLineEdit(self.cylinder)
+        self.radius.setObjectName(u"radius")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.radius)
+
+
+        self.verticalLayout_2.addWidget(self.cylinder)
+
+        self.cellZone = QWidget(self.typeProperties)
+        self.cellZone.setObjectName(u"cellZone")
+        self.formLayout_3 = QFormLayout(self.cellZone)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(9, 9, 9, 9)
+        self.label_8 = QLabel(self.cellZone)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_8)
+
+        self.zoneName = QComboBox(self.cellZone)
+        self.zoneName.setObjectName(u"zoneName")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.zoneName)
+
+
+        self.verticalLayout_2.addWidget(self.cellZone)
+
+
+        self.verticalLayout.addWidget(self.typeProperties)
+
+        self.widget_10 = QWidget(OptionDialog)
+        self.widget_10.setObjectName(u"widget_10")
+        self.formLayout_5 = QFormLayout(self.widget_10)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label_10 = QLabel(self.widget_10)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_10)
+
+        self.field = QComboBox(self.widget_10)
+        self.field.setObjectName(u"field")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.field)
+
+        self.label_11 = QLabel(self.widget_10)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_11)
+
+        self.fixValue = QLineEdit(self.widget_10)
+        self.fixValue.setObjectName(u"fixValue")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.fixValue)
+
+
+        self.verticalLayout.addWidget(self.widget_10)
+
+        self.overrideBoundaryValue = QCheckBox(OptionDialog)
+        self.overrideBoundaryValue.setObjectName(u"overrideBoundaryValue")
+
+        self.verticalLayout.addWidget(self.overrideBoundaryValue)
+
+        self.buttonBox = QDialogButtonBox(OptionDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(OptionDialog)
+        self.buttonBox.accepted.connect(OptionDialog.accept)
+        self.buttonBox.rejected.connect(OptionDialog.reject)
+
+        QMetaObject.connectSlotsByName(OptionDialog)
+    # setupUi
+
+    def retranslateUi(self, OptionDialog):
+        OptionDialog.setWindowTitle(QCoreApplication.translate("OptionDialog", u"Initialization Option", None))
+        self.label.setText(QCoreApplication.translate("OptionDialog", u"Name", None))
+        self.label_2.setText(QCoreApplication.translate("OptionDialog", u"Type", None))
+        self.type.setItemText(0, QCoreApplication.translate("OptionDialog", u"box", None))
+        self.type.setItemText(1, QCoreApplication.translate("OptionDialog", u"cylinder", None))
+        self.type.setItemText(2, QCoreApplication.translate("OptionDialog", u"cell zone", None))
+
+        self.label_3.setText(QCoreApplication.translate("OptionDialog", u"Min. Point (vector)", None))
+        self.label_4.setText(QCoreApplication.translate("OptionDialog", u"Max. Point (vector)", None))
+        self.label_5.setText(QCoreApplication.translate("OptionDialog", u"Lower Center (vector)", None))
+        self.label_6.setText(QCoreApplication.translate("OptionDialog", u"Upper Center (vector)", None))
+        self.label_7.setText(QCoreApplication.translate("OptionDialog", u"Radius", None))
+        self.label_8.setText(QCoreApplication.translate("OptionDialog", u"Zone Name", None))
+        self.label_10.setText(QCoreApplication.translate("OptionDialog", u"Field", None))
+        self.label_11.setText(QCoreApplication.translate("OptionDialog", u"Fix Value", None))
+        self.overrideBoundaryValue.setText(QCoreApplication.translate("OptionDialog", u"Override Boundary Value", None))
+    # retranslateUi
+
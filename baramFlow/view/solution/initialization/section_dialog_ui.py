@@ -0,0 +1,647 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'section_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QRadioButton, QSizePolicy,
+    QSpacerItem, QStackedWidget, QVBoxLayout, QWidget)
+
+class Ui_sectionDialog(object):
+    def setupUi(self, sectionDialog):
+        if not sectionDialog.objectName():
+            sectionDialog.setObjectName(u"sectionDialog")
+        sectionDialog.resize(278, 579)
+        self.verticalLayout = QVBoxLayout(sectionDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.stackedWidget = QStackedWidget(sectionDialog)
+        self.stackedWidget.setObjectName(u"stackedWidget")
+        self.creatPage = QWidget()
+        self.creatPage.setObjectName(u"creatPage")
+        self.verticalLayout_10 = QVBoxLayout(self.creatPage)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.widget_2 = QWidget(self.creatPage)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label_7 = QLabel(self.widget_2)
+        self.label_7.setObjectName(u"label_7")
+        font = QFont()
+        font.setBold(False)
+        self.label_7.setFont(font)
+
+        self.horizontalLayout_5.addWidget(self.label_7)
+
+        self.sectionNameInput = QLineEdit(self.widget_2)
+        self.sectionNameInput.setObjectName(u"sectionNameInput")
+
+        self.horizontalLayout_5.addWidget(self.sectionNameInput)
+
+
+        self.verticalLayout_10.addWidget(self.widget_2)
+
+        self.groupBox = QGroupBox(self.creatPage)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_9 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.hexType = QRadioButton(self.groupBox)
+        self.hexType.setObjectName(u"hexType")
+        self.hexType.setChecked(True)
+
+        self.verticalLayout_9.addWidget(self.hexType)
+
+        self.cylinderType = QRadioButton(self.groupBox)
+        self.cylinderType.setObjectName(u"cylinderType")
+
+        self.verticalLayout_9.addWidget(self.cylinderType)
+
+        self.sphereType = QRadioButton(self.groupBox)
+        self.sphereType.setObjectName(u"sphereType")
+
+        self.verticalLayout_9.addWidget(self.sphereType)
+
+        self.cellZoneType = QRadioButton(self.groupBox)
+        self.cellZoneType.setObjectName(u"cellZoneType")
+
+        self.verticalLayout_9.addWidget(self.cellZoneType)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_9.addItem(self.verticalSpacer)
+
+
+        self.verticalLayout_10.addWidget(self.groupBox)
+
+        self.layout = QWidget(self.creatPage)
+        self.layout.setObjectName(u"layout")
+        self.horizontalLayout_6 = QHBoxLayout(self.layout)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(-1, -1, 0, 0)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer)
+
+        self.nextButton = QPushButton(self.layout)
+        self.nextButton.setObjectName(u"nextButton")
+
+        self.horizontalLayout_6.addWidget(self.nextButton)
+
+        self.cancelButton = QPushButton(self.layout)
+        self.cancelButton.setObjectName(u"cancelButton")
+
+        self.horizontalLayout_6.addWidget(self.cancelButton)
+
+
+        self.verticalLayout_10.addWidget(self.layout)
+
+        self.stackedWidget.addWidget(self.creatPage)
+        self.editPage = QWidget()
+        self.editPage.setObjectName(u"editPage")
+        self.verticalLayout_11 = QVBoxLayout(self.editPage)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.widget_1 = QWidget(self.editPage)
+        self.widget_1.setObjectName(u"widget_1")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_1)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_1)
+        self.label.setObjectName(u"label")
+        sizePolicy = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setFont(font)
+
+        self.horizontalLayout_4.addWidget(self.label)
+
+        self.sectionName = QLabel(self.widget_1)
+        self.sectionName.setObjectName(u"sectionName")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(1)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.sectionName.sizePolicy().hasHeightForWidth())
+        self.sectionName.setSizePolicy(sizePolicy1)
+        font1 = QFont()
+        font1.setBold(True)
+        self.sectionName.setFont(font1)
+
+        self.horizontalLayout_4.addWidget(self.sectionName)
+
+
+        self.verticalLayout_11.addWidget(self.widget_1)
+
+        self.editForm = QWidget(self.editPage)
+        self.editForm.setObjectName(u"editForm")
+        self.verticalLayout_4 = QVBoxLayout(self.editForm)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.sectionStack = QStackedWidget(self.editForm)
+        self.sectionStack.setObjectName(u"sectionStack")
+        self.sectionStack.setFont(font)
+        self.page_0 = QWidget()
+        self.page_0.setObjectName(u"page_0")
+        self.verticalLayout_6 = QVBoxLayout(self.page_0)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.hexGroup = QGroupBox(self.page_0)
+        self.hexGroup.setObjectName(u"hexGroup")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.hexGroup.sizePolicy().hasHeightForWidth())
+        self.hexGroup.setSizePolicy(sizePolicy2)
+        self.gridLayout = QGridLayout(self.hexGroup)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(9, 9, 9, 9)
+        self.label_4 = QLabel(self.hexGroup)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 5, 0, 1, 1)
+
+        self.minPointY = QLineEdit(self.hexGroup)
+        self.minPointY.setObjectName(u"minPointY")
+
+        self.gridLayout.addWidget(self.minPointY, 5, 1, 1, 1)
+
+        self.label_9 = QLabel(self.hexGroup)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout.addWidget(self.label_9, 6, 0, 1, 1)
+
+        self.maxPointZ = QLineEdit(self.hexGroup)
+        self.maxPointZ.setObjectName(u"maxPointZ")
+
+        self.gridLayout.addWidget(self.maxPointZ, 6, 2, 1, 1)
+
+        self.maxPointY = QLineEdit(self.hexGroup)
+        self.maxPointY.setObjectName(u"maxPointY")
+
+        self.gridLayout.addWidget(self.maxPointY, 5, 2, 1, 1)
+
+        self.minPointX = QLineEdit(self.hexGroup)
+        self.minPointX.setObjectName(u"minPointX")
+
+        self.gridLayout.addWidget(self.minPointX, 4, 1, 1, 1)
+
+        self.label_13 = QLabel(self.hexGroup)
+        self.label_13.setObjectName(u"label_13")
+        sizePolicy2.setHeightForWidth(self.label_13.sizePolicy().hasHeightForWidth())
+        self.label_13.setSizePolicy(sizePolicy2)
+        self.label_13.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_13, 1, 2, 1, 1)
+
+        self.label_2 = QLabel(self.hexGroup)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy2.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy2)
+        self.label_2.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_2, 1, 1, 1, 1)
+
+        self.minPointZ = QLineEdit(self.hexGroup)
+        self.minPointZ.setObjectName(u"minPointZ")
+
+        self.gridLayout.addWidget(self.minPointZ, 6, 1, 1, 1)
+
+        self.label_3 = QLabel(self.hexGroup)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 4, 0, 1, 1)
+
+        self.maxPointX = QLineEdit(self.hexGroup)
+        self.maxPointX.setObjectName(u"maxPointX")
+
+        self.gridLayout.addWidget(self.maxPointX, 4, 2, 1, 1)
+
+
+        self.verticalLayout_6.addWidget(self.hexGroup)
+
+        self.sectionStack.addWidget(self.page_0)
+        self.page_1 = QWidget()
+        self.page_1.setObjectName(u"page_1")
+        self.verticalLayout_5 = QVBoxLayout(self.page_1)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.cylinderGroup = QGroupBox(self.page_1)
+        self.cylinderGroup.setObjectName(u"cylinderGroup")
+        sizePolicy2.setHeightForWidth(self.cylinderGroup.sizePolicy().hasHeightForWidth())
+        self.cylinderGroup.setSizePolicy(sizePolicy2)
+        self.verticalLayout_3 = QVBoxLayout(self.cylinderGroup)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.horizontalWidget = QWidget(self.cylinderGroup)
+        self.horizontalWidget.setObjectName(u"horizontalWidget")
+        self.horizontalLayout_3 = QHBoxLayout(self.horizontalWidget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.axisPoint1 = QGroupBox(self.horizontalWidget)
+        self.axisPoint1.setObjectName(u"axisPoint1")
+        self.formLayout_2 = QFormLayout(self.axisPoint1)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.xLabel = QLabel(self.axisPoint1)
+        self.xLabel.setObjectName(u"xLabel")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.xLabel)
+
+        self.p1x = QLineEdit(self.axisPoint1)
+        self.p1x.setObjectName(u"p1x")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.p1x)
+
+        self.yLabel = QLabel(self.axisPoint1)
+        self.yLabel.setObjectName(u"yLabel")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.yLabel)
+
+        self.p1y = QLineEdit(self.axisPoint1)
+        self.p1y.setObjectName(u"p1y")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.p1y)
+
+        self.zLabel = QLabel(self.axisPoint1)
+        self.zLabel.setObjectName(u"zLabel")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.zLabel)
+
+        self.p1z = QLineEdit(self.axisPoint1)
+        self.p1z.setObjectName(u"p1z")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.p1z)
+
+
+        self.horizontalLayout_3.addWidget(self.axisPoint1)
+
+        self.axisPoint2 = QGroupBox(self.horizontalWidget)
+        self.axisPoint2.setObjectName(u"axisPoint2")
+        self.formLayout = QFormLayout(self.axisPoint2)
+        self.formLayout.setObjectName(u"formLayout")
+        self.yLabel_2 = QLabel(self.axisPoint2)
+        self.yLabel_2.setObjectName(u"yLabel_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.yLabel_2)
+
+        self.p2y = QLineEdit(self.axisPoint2)
+        self.p2y.setObjectName(u"p2y")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.p2y)
+
+        self.zLabel_2 = QLabel(self.axisPoint2)
+        self.zLabel_2.setObjectName(u"zLabel_2")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.zLabel_2)
+
+        self.p2z = QLineEdit(self.axisPoint2)
+        self.p2z.setObjectName(u"p2z")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.p2z)
+
+        self.p2x = QLineEdit(self.axisPoint2)
+        self.p2x.setObjectName(u"p2x")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.p2x)
+
+        self.xLabel_2 = QLabel(self.axisPoint2)
+        self.xLabel_2.setObjectName(u"xLabel_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.xLabel_2)
+
+
+        self.horizontalLayout_3.addWidget(self.axisPoint2)
+
+
+        self.verticalLayout_3.addWidget(self.horizontalWidget)
+
+        self.radiousGroup = QGroupBox(self.cylinderGroup)
+        self.radiousGroup.setObjectName(u"radiousGroup")
+        sizePolicy2.setHeightForWidth(self.radiousGroup.sizePolicy().hasHeightForWidth())
+        self.radiousGroup.setSizePolicy(sizePolicy2)
+        self.formLayout_6 = QFormLayout(self.radiousGroup)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.radiusLabel = QLabel(self.radiousGroup)
+        self.radiusLabel.setObjectName(u"radiusLabel")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.radiusLabel)
+
+        self.cylinderRadius = QLineEdit(self.radiousGroup)
+        self.cylinderRadius.setObjectName(u"cylinderRadius")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.cylinderRadius)
+
+
+        self.verticalLayout_3.addWidget(self.radiousGroup)
+
+
+        self.verticalLayout_5.addWidget(self.cylinderGroup)
+
+        self.sectionStack.addWidget(self.page_1)
+        self.page_2 = QWidget()
+        self.page_2.setObjectName(u"page_2")
+        self.verticalLayout_7 = QVBoxLayout(self.page_2)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.sphereGroup = QGroupBox(self.page_2)
+        self.sphereGroup.setObjectName(u"sphereGroup")
+        sizePolicy2.setHeightForWidth(self.sphereGroup.sizePolicy().hasHeightForWidth())
+        self.sphereGroup.setSizePolicy(sizePolicy2)
+        self.verticalLayout_2 = QVBoxLayout(self.sphereGroup)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.centerGroup = QGroupBox(self.sphereGroup)
+        self.centerGroup.setObjectName(u"centerGroup")
+        self.formLayout_7 = QFormLayout(self.centerGroup)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.xLabel_4 = QLabel(self.centerGroup)
+        self.xLabel_4.setObjectName(u"xLabel_4")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.xLabel_4)
+
+        self.cx = QLineEdit(self.centerGroup)
+        self.cx.setObjectName(u"cx")
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.cx)
+
+        self.yLabel_4 = QLabel(self.centerGroup)
+        self.yLabel_4.setObjectName(u"yLabel_4")
+
+        self.formLayout_7.setWidget(1, QFormLayout.LabelRole, self.yLabel_4)
+
+        self.cy = QLineEdit(self.centerGroup)
+        self.cy.setObjectName(u"cy")
+
+        self.formLayout_7.setWidget(1, QFormLayout.FieldRole, self.cy)
+
+        self.zLabel_4 = QLabel(self.centerGroup)
+        self.zLabel_4.setObjectName(u"zLabel_4")
+
+        self.formLayout_7.setWidget(2, QFormLayout.LabelRole, self.zLabel_4)
+
+        self.cz = QLineEdit(self.centerGroup)
+        self.cz.setObjectName(u"cz")
+
+        self.formLayout_7.setWidget(2, QFormLayout.FieldRole, self.cz)
+
+
+        self.verticalLayout_2.addWidget(self.centerGroup)
+
+        self.radiousGroup_2 = QGroupBox(self.sphereGroup)
+        self.radiousGroup_2.setObjectName(u"radiousGroup_2")
+        sizePolicy2.setHeightForWidth(self.radiousGroup_2.sizePolicy().hasHeightForWidth())
+        self.radiousGroup_2.setSizePolicy(sizePolicy2)
+        self.formLayout_8 = QFormLayout(self.radiousGroup_2)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.radiusLabel_2 = QLabel(self.radiousGroup_2)
+        self.radiusLabel_2.setObjectName(u"radiusLabel_2")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.radiusLabel_2)
+
+        self.sphereRadius = QLineEdit(self.radiousGroup_2)
+        self.sphereRadius.setObjectName(u"sphereRadius")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.sphereRadius)
+
+
+        self.verticalLayout_2.addWidget(self.radiousGroup_2)
+
+
+        self.verticalLayout_7.addWidget(self.sphereGroup)
+
+        self.sectionStack.addWidget(self.page_2)
+        self.page_3 = QWidget()
+        self.page_3.setObjectName(u"page_3")
+        self.verticalLayout_8 = QVBoxLayout(self.page_3)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.verticalLayout_8.setContentsMargins(0, 0, 0, -1)
+        self.cellZoneGroup = QGroupBox(self.page_3)
+        self.cellZoneGroup.setObjectName(u"cellZoneGroup")
+        sizePolicy2.setHeightForWidth(self.cellZoneGroup.sizePolicy().hasHeightForWidth())
+        self.cellZoneGroup.setSizePolicy(sizePolicy2)
+        self.cellZoneGroupLayout = QVBoxLayout(self.cellZoneGroup)
+        self.cellZoneGroupLayout.setObjectName(u"cellZoneGroupLayout")
+
+        self.verticalLayout_8.addWidget(self.cellZoneGroup)
+
+        self.sectionStack.addWidget(self.page_3)
+
+        self.verticalLayout_4.addWidget(self.sectionStack)
+
+        self.widget_10 = QWidget(self.editForm)
+        self.widget_10.setObjectName(u"widget_10")
+        self.initialValuesLayout = QVBoxLayout(self.widget_10)
+        self.initialValuesLayout.setObjectName(u"initialValuesLayout")
+        self.initialValuesLayout.setContentsMargins(0, 0, 0, 0)
+        self.velocityGroup = QGroupBox(self.widget_10)
+        self.velocityGroup.setObjectName(u"velocityGroup")
+        self.velocityGroup.setCheckable(True)
+        self.velocityGroup.setChecked(False)
+        self.formLayout_4 = QFormLayout(self.velocityGroup)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_1 = QLabel(self.velocityGroup)
+        self.label_1.setObjectName(u"label_1")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_1)
+
+        self.ux = QLineEdit(self.velocityGroup)
+        self.ux.setObjectName(u"ux")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.ux)
+
+        self.label_5 = QLabel(self.velocityGroup)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.uy = QLineEdit(self.velocityGroup)
+        self.uy.setObjectName(u"uy")
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.uy)
+
+        self.label_6 = QLabel(self.velocityGroup)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_4.setWidget(3, QFormLayout.LabelRole, self.label_6)
+
+        self.uz = QLineEdit(self.velocityGroup)
+        self.uz.setObjectName(u"uz")
+
+        self.formLayout_4.setWidget(3, QFormLayout.FieldRole, self.uz)
+
+
+        self.initialValuesLayout.addWidget(self.velocityGroup)
+
+        self.properties = QWidget(self.widget_10)
+        self.properties.setObjectName(u"properties")
+        self.formLayout_3 = QFormLayout(self.properties)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(0, -1, 0, -1)
+        self.pressureCheckBox = QCheckBox(self.properties)
+        self.pressureCheckBox.setObjectName(u"pressureCheckBox")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.pressureCheckBox)
+
+        self.pressure = QLineEdit(self.properties)
+        self.pressure.setObjectName(u"pressure")
+        self.pressure.setEnabled(False)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.pressure)
+
+        self.temperatureCheckBox = QCheckBox(self.properties)
+        self.temperatureCheckBox.setObjectName(u"temperatureCheckBox")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.temperatureCheckBox)
+
+        self.temperature = QLineEdit(self.properties)
+        self.temperature.setObjectName(u"temperature")
+        self.temperature.setEnabled(False)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.temperature)
+
+
+        self.initialValuesLayout.addWidget(self.properties)
+
+
+        self.verticalLayout_4.addWidget(self.widget_10)
+
+        self.overrideBoundaryValue = QCheckBox(self.editForm)
+        self.overrideBoundaryValue.setObjectName(u"overrideBoundaryValue")
+
+        self.verticalLayout_4.addWidget(self.overrideBoundaryValue)
+
+
+        self.verticalLayout_11.addWidget(self.editForm)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_11.addItem(self.verticalSpacer_2)
+
+        self.widget_4 = QWidget(self.editPage)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(-1, -1, 0, 0)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_4)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_7.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_4)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_7.addWidget(self.cancel)
+
+
+        self.verticalLayout_11.addWidget(self.widget_4)
+
+        self.stackedWidget.addWidget(self.editPage)
+
+        self.verticalLayout.addWidget(self.stackedWidget)
+
+        QWidget.setTabOrder(self.sectionNameInput, self.hexType)
+        QWidget.setTabOrder(self.hexType, self.cylinderType)
+        QWidget.setTabOrder(self.cylinderType, self.sphereType)
+        QWidget.setTabOrder(self.sphereType, self.cellZoneType)
+        QWidget.setTabOrder(self.cellZoneType, self.minPointX)
+        QWidget.setTabOrder(self.minPointX, self.minPointY)
+        QWidget.setTabOrder(self.minPointY, self.minPointZ)
+        QWidget.setTabOrder(self.minPointZ, self.maxPointX)
+        QWidget.setTabOrder(self.maxPointX, self.maxPointY)
+        QWidget.setTabOrder(self.maxPointY, self.maxPointZ)
+        QWidget.setTabOrder(self.maxPointZ, self.p1x)
+        QWidget.setTabOrder(self.p1x, self.p1y)
+        QWidget.setTabOrder(self.p1y, self.p1z)
+        QWidget.setTabOrder(self.p1z, self.p2x)
+        QWidget.setTabOrder(self.p2x, self.p2y)
+        QWidget.setTabOrder(self.p2y, self.p2z)
+        QWidget.setTabOrder(self.p2z, self.cylinderRadius)
+        QWidget.setTabOrder(self.cylinderRadius, self.cx)
+        QWidget.setTabOrder(self.cx, self.cy)
+        QWidget.setTabOrder(self.cy, self.cz)
+        QWidget.setTabOrder(self.cz, self.sphereRadius)
+        QWidget.setTabOrder(self.sphereRadius, self.velocityGroup)
+        QWidget.setTabOrder(self.velocityGroup, self.ux)
+        QWidget.setTabOrder(self.ux, self.uy)
+        QWidget.setTabOrder(self.uy, self.uz)
+        QWidget.setTabOrder(self.uz, self.pressureCheckBox)
+        QWidget.setTabOrder(self.pressureCheckBox, self.pressure)
+        QWidget.setTabOrder(self.pressure, self.temperatureCheckBox)
+        QWidget.setTabOrder(self.temperatureCheckBox, self.temperature)
+        QWidget.setTabOrder(self.temperature, self.overrideBoundaryValue)
+        QWidget.setTabOrder(self.overrideBoundaryValue, self.nextButton)
+        QWidget.setTabOrder(self.nextButton, self.cancelButton)
+
+        self.retranslateUi(sectionDialog)
+        self.pressureCheckBox.toggled.connect(self.pressure.setEnabled)
+        self.temperatureCheckBox.toggled.connect(self.temperature.setEnabled)
+        self.cancel.clicked.connect(sectionDialog.reject)
+
+        self.stackedWidget.setCurrentIndex(1)
+        self.sectionStack.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(sectionDialog)
+    # setupUi
+
+    def retranslateUi(self, sectionDialog):
+        sectionDialog.setWindowTitle(QCoreApplication.translate("sectionDialog", u"Initialization Option", None))
+        self.label_7.setText(QCoreApplication.translate("sectionDialog", u"Section Name :", None))
+        self.groupBox.setTitle(QCoreApplication.translate("sectionDialog", u"Section Type", None))
+        self.hexType.setText(QCoreApplication.translate("sectionDialog", u"Hex", None))
+        self.cylinderType.setText(QCoreApplication.translate("sectionDialog", u"Cylinder", None))
+        self.sphereType.setText(QCoreApplication.translate("sectionDialog", u"Sphere", None))
+        self.cellZoneType.setText(QCoreApplication.translate("sectionDialog", u"Cell Zone", None))
+        self.nextButton.setText(QCoreApplication.translate("sectionDialog", u"Next", None))
+        self.cancelButton.setText(QCoreApplication.translate("sectionDialog", u"Cancel", None))
+        self.label.setText(QCoreApplication.translate("sectionDialog", u"Section Name :", None))
+        self.sectionName.setText(QCoreApplication.translate("sectionDialog", u"Section Name", None))
+        self.hexGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Hex Geometry", None))
+        self.label_4.setText(QCoreApplication.translate("sectionDialog", u"Y", None))
+        self.label_9.setText(QCoreApplication.translate("sectionDialog", u"Z", None))
+        self.label_13.setText(QCoreApplication.translate("sectionDialog", u"Max", None))
+        self.label_2.setText(QCoreApplication.translate("sectionDialog", u"Min", None))
+        self.label_3.setText(QCoreApplication.translate("sectionDialog", u"X", None))
+        self.cylinderGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Cylinder Geometry", None))
+        self.axisPoint1.setTitle(QCoreApplication.translate("sectionDialog", u"Axis Point 1", None))
+        self.xLabel.setText(QCoreApplication.translate("sectionDialog", u"X", None))
+        self.yLabel.setText(QCoreApplication.translate("sectionDialog", u"Y", None))
+        self.zLabel.setText(QCoreApplication.translate("sectionDialog", u"Z", None))
+        self.axisPoint2.setTitle(QCoreApplication.translate("sectionDialog", u"Axis Point 2", None))
+        self.yLabel_2.setText(QCoreApplication.translate("sectionDialog", u"Y", None))
+        self.zLabel_2.setText(QCoreApplication.translate("sectionDialog", u"Z", None))
+        self.xLabel_2.setText(QCoreApplication.translate("sectionDialog", u"X", None))
+        self.radiousGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Radius", None))
+        self.radiusLabel.setText(QCoreApplication.translate("sectionDialog", u"R", None))
+        self.sphereGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Sphere Geometry", None))
+        self.centerGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Center Point", None))
+        self.xLabel_4.setText(QCoreApplication.translate("sectionDialog", u"X", None))
+        self.yLabel_4.setText(QCoreApplication.translate("sectionDialog", u"Y", None))
+        self.zLabel_4.setText(QCoreApplication.translate("sectionDialog", u"Z", None))
+        self.radiousGroup_2.setTitle(QCoreApplication.translate("sectionDialog", u"Radius", None))
+        self.radiusLabel_2.setText(QCoreApplication.translate("sectionDialog", u"R", None))
+        self.cellZoneGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Cell Zone", None))
+        self.velocityGroup.setTitle(QCoreApplication.translate("sectionDialog", u"Velocity", None))
+        self.label_1.setText(QCoreApplication.translate("sectionDialog", u"X-Velocity (m/s)", None))
+        self.label_5.setText(QCoreApplication.translate("sectionDialog", u"Y-Velocity (m/s)", None))
+        self.label_6.setText(QCoreApplication.translate("sectionDialog", u"Z-Velocity (m/s)", None))
+        self.pressureCheckBox.setText(QCoreApplication.translate("sectionDialog", u"Pressure (Pa)", None))
+        self.temperatureCheckBox.setText(QCoreApplication.translate("sectionDialog", u"Temperature (K)", None))
+        self.overrideBoundaryValue.setText(QCoreApplication.translate("sectionDialog", u"Override Boundary Value", None))
+        self.ok.setText(QCoreApplication.translate("sectionDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("sectionDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'force_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QFormLayout,
+    QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QListWidget, QListWidgetItem, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.batchable_float_edit import BatchableFloatEdit
+from widgets.enum_combo_box import EnumComboBox
+from widgets.typed_edit import (FloatEdit, MonitorNameEdit)
+
+class Ui_ForceDialog(object):
+    def setupUi(self, ForceDialog):
+        if not ForceDialog.objectName():
+            ForceDialog.setObjectName(u"ForceDialog")
+        ForceDialog.resize(364, 647)
+        self.verticalLayout_2 = QVBoxLayout(ForceDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.nameWidget = QWidget(ForceDialog)
+        self.nameWidget.setObjectName(u"nameWidget")
+        self.formLayout_6 = QFormLayout(self.nameWidget)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label_1 = QLabel(self.nameWidget)
+        self.label_1.setObjectName(u"label_1")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_1)
+
+        self.name = MonitorNameEdit(self.nameWidget)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_2.addWidget(self.nameWidget)
+
+        self.monitor = QGroupBox(ForceDialog)
+        self.monitor.setObjectName(u"monitor")
+        self.verticalLayout = QVBoxLayout(self.monitor)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_3 = QWidget(self.monitor)
+        self.widget_3.setObjectName(u"widget_3")
+        self.formLayout = QFormLayout(self.widget_3)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 9)
+        self.label_2 = QLabel(self.widget_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.writeInterval = FloatEdit(self.widget_3)
+        self.writeInterval.setObjectName(u"writeInterval")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.writeInterval)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.groupBox_2 = QGroupBox(self.monitor)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_4 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_4 = QWidget(self.groupBox_2)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_2 = QFormLayout(self.widget_4)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label_4 = QLabel(self.widget_4)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.specificationMethod = EnumComboBox(self.widget_4)
+        self.specificationMethod.setObjectName(u"specificationMethod")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.specificationMethod)
+
+
+        self.verticalLayout_4.addWidget(self.widget_4)
+
+        self.direction = QGroupBox(self.groupBox_2)
+        self.direction.setObjectName(u"direction")
+        self.verticalLayout_5 = QVBoxLayout(self.direction)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_5 = QWidget(self.direction)
+        self.widget_5.setObjectName(u"widget_5")
+        self.gridLayout = QGridLayout(self.widget_5)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setContentsMargins(-1, 0, -1, -1)
+        self.label_5 = QLabel(self.widget_5)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_5, 0, 3, 1, 1)
+
+        self.label_6 = QLabel(self.widget_5)
+        self.label_6.setObjectName(u"label_6")
+        self.label_6.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_6, 0, 1, 1, 1)
+
+        self.dragDirectionX = FloatEdit(self.widget_5)
+        self.dragDirectionX.setObjectName(u"dragDirectionX")
+
+        self.gridLayout.addWidget(self.dragDirectionX, 1, 1, 1, 1)
+
+        self.label_10 = QLabel(self.widget_5)
+        self.label_10.setObjectName(u"label_10")
+        self.label_10.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_10, 0, 2, 1, 1)
+
+        self.dragDirectionZ = FloatEdit(self.widget_5)
+        self.dragDirectionZ.setObjectName(u"dragDirectionZ")
+
+        self.gridLayout.addWidget(self.dragDirectionZ, 1, 3, 1, 1)
+
+        self.dragDirectionY = FloatEdit(self.widget_5)
+        self.dragDirectionY.setObjectName(u"dragDirectionY")
+
+        self.gridLayout.addWidget(self.dragDirectionY, 1, 2, 1, 1)
+
+        self.label_11 = QLabel(self.widget_5)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout.addWidget(self.label_11, 1, 0, 1, 1)
+
+        self.label_12 = QLabel(self.widget_5)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout.addWidget(self.label_12, 2, 0, 1, 1)
+
+        self.liftDirectionX = FloatEdit(self.widget_5)
+        self.liftDirectionX.setObjectName(u"liftDirectionX")
+
+        self.gridLayout.addWidget(self.liftDirectionX, 2, 1, 1, 1)
+
+        self.liftDirectionY = FloatEdit(self.widget_5)
+        self.liftDirectionY.setObjectName(u"liftDirectionY")
+
+        self.gridLayout.addWidget(self.liftDirectionY, 2, 2, 1, 1)
+
+        self.liftDirectionZ = FloatEdit(self.widget_5)
+        self.liftDirectionZ.setObjectName(u"liftDirectionZ")
+
+        self.gridLayout.addWidget(self.liftDirectionZ, 2, 3, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.widget_5)
+
+
+        self.verticalLayout_4.addWidget(self.direction)
+
+        self.angles = QWidget(self.groupBox_2)
+        self.angles.setObjectName(u"angles")
+        self.formLayout_4 = QFormLayout(self.angles)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.formLayout_4.setContentsMargins(0, -1, 0, -1)
+        self.label_22 = QLabel(self.angles)
+        self.label_22.setObjectName(u"label_22")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_22)
+
+        self.AoA = BatchableFloatEdit(self.angles)
+        self.AoA.setObjectName(u"AoA")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.AoA)
+
+        self.label_23 = QLabel(self.angles)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_23)
+
+        self.AoS = BatchableFloatEdit(self.angles)
+        self.AoS.setObjectName(u"AoS")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.AoS)
+
+
+        self.verticalLayout_4.addWidget(self.angles)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.widget_2 = QWidget(self.monitor)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.groupBox_5 = QGroupBox(self.widget_2)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.formLayout_5 = QFormLayout(self.groupBox_5)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.label_14 = QLabel(self.groupBox_5)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_14)
+
+        self.centerOfRotationX = FloatEdit(self.groupBox_5)
+        self.centerOfRotationX.setObjectName(u"centerOfRotationX")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.centerOfRotationX)
+
+        self.label_15 = QLabel(self.groupBox_5)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_15)
+
+        self.centerOfRotationY = FloatEdit(self.groupBox_5)
+        self.centerOfRotationY.setObjectName(u"centerOfRotationY")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.centerOfRotationY)
+
+        self.label_16 = QLabel(self.groupBox_5)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_5.setWidget(2, QFormLayout.LabelRole, self.label_16)
+
+        self.centerOfRotationZ = FloatEdit(self.groupBox_5)
+        self.centerOfRotationZ.setObjectName(u"centerOfRotationZ")
+
+        self.formLayout_5.setWidget(2, QFormLayout.FieldRole, self.centerOfRotationZ)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_5)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.widget = QWidget(self.monitor)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_17 = QLabel(self.widget)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout.addWidget(self.label_17)
+
+        self.horizontalSpacer = QSpacerItem(123, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.boundaries = QListWidget(self.monitor)
+        self.boundaries.setObjectName(u"boundaries")
+        self.boundaries.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+
+        self.verticalLayout.addWidget(self.boundaries)
+
+
+        self.verticalLayout_2.addWidget(self.monitor)
+
+        self.widget_6 = QWidget(ForceDialog)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_6)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_6)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_6)
+
+        QWidget.setTabOrder(self.name, self.writeInterval)
+        QWidget.setTabOrder(self.writeInterval, self.specificationMethod)
+        QWidget.setTabOrder(self.specificationMethod, self.dragDirectionX)
+        QWidget.setTabOrder(self.dragDirectionX, self.dragDirectionY)
+        QWidget.setTabOrder(self.dragDirectionY, self.dragDirectionZ)
+        QWidget.setTabOrder(self.dragDirectionZ, self.liftDirectionX)
+        QWidget.setTabOrder(self.liftDirectionX, self.liftDirectionY)
+        QWidget.setTabOrder(self.liftDirectionY, self.liftDirectionZ)
+        QWidget.setTabOrder(self.liftDirectionZ, self.AoA)
+        QWidget.setTabOrder(self.AoA, self.AoS)
+        QWidget.setTabOrder(self.AoS, self.centerOfRotationX)
+        QWidget.setTabOrder(self.centerOfRotationX, self.centerOfRotationY)
+        QWidget.setTabOrder(self.centerOfRotationY, self.centerOfRotationZ)
+        QWidget.setTabOrder(self.centerOfRotationZ, self.select)
+        QWidget.setTabOrder(self.select, self.boundaries)
+
+        self.retranslateUi(ForceDialog)
+        self.cancel.clicked.connect(ForceDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(ForceDialog)
+    # setupUi
+
+    def retranslateUi(self, ForceDialog):
+        ForceDialog.setWindowTitle(QCoreApplication.translate("ForceDialog", u"Force Monitor", None))
+        self.label_1.setText(QCoreApplication.translate("ForceDialog", u"Name", None))
+        self.monitor.setTitle(QCoreApplication.translate("ForceDialog", u"Force Monitor", None))
+        self.label_2.setText(QCoreApplication.translate("ForceDialog", u"Write Interval", None))
+        self.writeInterval.setText("")
+        self.groupBox_2.setTitle(QCoreApplication.translate("ForceDialog", u"Flow Direction", None))
+        self.label_4.setText(QCoreApplication.translate("ForceDialog", u"Specification Method", None))
+        self.direction.setTitle(QCoreApplication.translate("ForceDialog", u"Direction", None))
+        self.label_5.setText(QCoreApplication.translate("ForceDialog", u"Z", None))
+        self.label_6.setText(QCoreApplication.translate("ForceDialog", u"X", None))
+        self.label_10.setText(QCoreApplication.translate("ForceDialog", u"Y", None))
+        self.label_11.setText(QCoreApplication.translate("ForceDialog", u"Drag Direction", None))
+        self.label_12.setText(QCoreApplication.translate("ForceDialog", u"Lift Direction", None))
+        self.label_22.setText(QCoreApplication.translate("ForceDialog", u"Angle of Attack, AOA (degree)", None))
+        self.label_23.setText(QCoreApplication.translate("ForceDialog", u"Angle of Sideslip, AOS (degree)", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("ForceDialog", u"Center of Rotation", None))
+        self.label_14.setText(QCoreApplication.translate("ForceDialog", u"X", None))
+        self.label_15.setText(QCoreApplication.translate("ForceDialog", u"Y", None))
+        self.label_16.setText(QCoreApplication.translate("ForceDialog", u"Z", None))
+        self.label_17.setText(QCoreApplication.translate("ForceDialog", u"Boundaries", None))
+        self.select.setText(QCoreApplication.translate("ForceDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("ForceDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ForceDialog", u"Cancel", None))
+    # retranslateUi
+
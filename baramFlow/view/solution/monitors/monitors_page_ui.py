@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'monitors_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QListWidget, QListWidgetItem, QPushButton, QSizePolicy,
+    QSpacerItem, QToolButton, QVBoxLayout, QWidget)
+
+class Ui_MonitorsPage(object):
+    def setupUi(self, MonitorsPage):
+        if not MonitorsPage.objectName():
+            MonitorsPage.setObjectName(u"MonitorsPage")
+        MonitorsPage.resize(283, 500)
+        self.verticalLayout = QVBoxLayout(MonitorsPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, -1, -1, 9)
+        self.title = QLabel(MonitorsPage)
+        self.title.setObjectName(u"title")
+        self.title.setMinimumSize(QSize(0, 24))
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout.addWidget(self.title)
+
+        self.line = QFrame(MonitorsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.list = QListWidget(MonitorsPage)
+        self.list.setObjectName(u"list")
+
+        self.verticalLayout.addWidget(self.list)
+
+        self.widget = QWidget(MonitorsPage)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalSpacer = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer)
+
+        self.add = QToolButton(self.widget)
+        self.add.setObjectName(u"add")
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(75)
+        sizePolicy.setVerticalStretch(24)
+        sizePolicy.setHeightForWidth(self.add.sizePolicy().hasHeightForWidth())
+        self.add.setSizePolicy(sizePolicy)
+        self.add.setMinimumSize(QSize(75, 24))
+        self.add.setMaximumSize(QSize(75, 24))
+        self.add.setPopupMode(QToolButton.InstantPopup)
+
+        self.horizontalLayout_4.addWidget(self.add)
+
+        self.edit = QPushButton(self.widget)
+        self.edit.setObjectName(u"edit")
+        self.edit.setEnabled(False)
+
+        self.horizontalLayout_4.addWidget(self.edit)
+
+        self.delete_ = QPushButton(self.widget)
+        self.delete_.setObjectName(u"delete_")
+        self.delete_.setEnabled(False)
+
+        self.horizontalLayout_4.addWidget(self.delete_)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(MonitorsPage)
+
+        QMetaObject.connectSlotsByName(MonitorsPage)
+    # setupUi
+
+    def retranslateUi(self, MonitorsPage):
+        MonitorsPage.setWindowTitle(QCoreApplication.translate("MonitorsPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("MonitorsPage", u"Monitors", None))
+        self.add.setText(QCoreApplication.translate("MonitorsPage", u"&Add", None))
+        self.edit.setText(QCoreApplication.translate("MonitorsPage", u"&Edit", None))
+        self.delete_.setText(QCoreApplication.translate("MonitorsPage", u"&Delete", None))
+    # retranslateUi
+
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'point_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+from widgets.python_combo_box import PythonComboBox
+from widgets.typed_edit import (FloatEdit, MonitorNameEdit)
+
+class Ui_PointDialog(object):
+    def setupUi(self, PointDialog):
+        if not PointDialog.objectName():
+            PointDialog.setObjectName(u"PointDialog")
+        PointDialog.resize(374, 398)
+        self.verticalLayout_2 = QVBoxLayout(PointDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.nameWidget = QWidget(PointDialog)
+        self.nameWidget.setObjectName(u"nameWidget")
+        self.formLayout_8 = QFormLayout(self.nameWidget)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.formLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.label_1 = QLabel(self.nameWidget)
+        self.label_1.setObjectName(u"label_1")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_1)
+
+        self.name = MonitorNameEdit(self.nameWidget)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_2.addWidget(self.nameWidget)
+
+        self.monitor = QGroupBox(PointDialog)
+        self.monitor.setObjectName(u"monitor")
+        self.verticalLayout = QVBoxLayout(self.monitor)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.propeties = QWidget(self.monitor)
+        self.propeties.setObjectName(u"propeties")
+        self.formLayout = QFormLayout(self.propeties)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.propeties)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.writeInterval = FloatEdit(self.propeties)
+        self.writeInterval.setObjectName(u"writeInterval")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.writeInterval)
+
+        self.label = QLabel(self.propeties)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label)
+
+        self.field = PythonComboBox(self.propeties)
+        self.field.setObjectName(u"field")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.field)
+
+        self.label_7 = QLabel(self.propeties)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.fieldComponent = VectorComponentComboBox(self.propeties)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.fieldComponent)
+
+
+        self.verticalLayout.addWidget(self.propeties)
+
+        self.groupBox_2 = QGroupBox(self.monitor)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_2 = QFormLayout(self.groupBox_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(9, 9, 9, 9)
+        self.label_3 = QLabel(self.groupBox_2)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.coordinateX = FloatEdit(self.groupBox_2)
+        self.coordinateX.setObjectName(u"coordinateX")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.coordinateX)
+
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.coordinateY = FloatEdit(self.groupBox_2)
+        self.coordinateY.setObjectName(u"coordinateY")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.coordinateY)
+
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.coordinateZ = FloatEdit(self.groupBox_2)
+        self.coordinateZ.setObjectName(u"coordinateZ")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.coordinateZ)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.widget_2 = QWidget(self.monitor)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(9, 9, 9, 9)
+        self.label_6 = QLabel(self.widget_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout.addWidget(self.label_6)
+
+        self.snapOntoBoundary = QLineEdit(self.widget_2)
+        self.snapOntoBoundary.setObjectName(u"snapOntoBoundary")
+        self.snapOntoBoundary.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.snapOntoBoundary)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.verticalLayout_2.addWidget(self.monitor)
+
+        self.widget_3 = QWidget(PointDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_3)
+
+
+        self.retranslateUi(PointDialog)
+        self.cancel.clicked.connect(PointDialog.reject)
+
+        QMetaObject.connectSlotsByName(PointDialog)
+    # setupUi
+
+    def retranslateUi(self, PointDialog):
+        PointDialog.setWindowTitle(QCoreApplication.translate("PointDialog", u"Point Monitor", None))
+        self.label_1.setText(QCoreApplication.translate("PointDialog", u"Name", None))
+        self.monitor.setTitle(QCoreApplication.translate("PointDialog", u"Point Monitor", None))
+        self.label_2.setText(QCoreApplication.translate("PointDialog", u"Write Interval", None))
+        self.writeInterval.setText("")
+        self.label.setText(QCoreApplication.translate("PointDialog", u"Field", None))
+        self.label_7.setText(QCoreApplication.translate("PointDialog", u"Component", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("PointDialog", u"Coordinate", None))
+        self.label_3.setText(QCoreApplication.translate("PointDialog", u"X (m)", None))
+        self.label_4.setText(QCoreApplication.translate("PointDialog", u"Y (m)", None))
+        self.label_5.setText(QCoreApplication.translate("PointDialog", u"Z (m)", None))
+        self.label_6.setText(QCoreApplication.translate("PointDialog", u"Snap onto Boundary", None))
+        self.select.setText(QCoreApplication.translate("PointDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("PointDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("PointDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'volume_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from baramFlow.view.widgets.vector_component_combo_box import VectorComponentComboBox
+from widgets.python_combo_box import PythonComboBox
+from widgets.typed_edit import (FloatEdit, MonitorNameEdit)
+
+class Ui_VolumeDialog(object):
+    def setupUi(self, VolumeDialog):
+        if not VolumeDialog.objectName():
+            VolumeDialog.setObjectName(u"VolumeDialog")
+        VolumeDialog.resize(310, 290)
+        self.verticalLayout = QVBoxLayout(VolumeDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.nameWidget = QWidget(VolumeDialog)
+        self.nameWidget.setObjectName(u"nameWidget")
+        self.formLayout_8 = QFormLayout(self.nameWidget)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.formLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.label_1 = QLabel(self.nameWidget)
+        self.label_1.setObjectName(u"label_1")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_1)
+
+        self.name = MonitorNameEdit(self.nameWidget)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout.addWidget(self.nameWidget)
+
+        self.monitor = QGroupBox(VolumeDialog)
+        self.monitor.setObjectName(u"monitor")
+        self.verticalLayout_2 = QVBoxLayout(self.monitor)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.properties = QWidget(self.monitor)
+        self.properties.setObjectName(u"properties")
+        self.formLayout = QFormLayout(self.properties)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(-1, -1, -1, 0)
+        self.label_5 = QLabel(self.properties)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.writeInterval = FloatEdit(self.properties)
+        self.writeInterval.setObjectName(u"writeInterval")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.writeInterval)
+
+        self.label = QLabel(self.properties)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label)
+
+        self.reportType = PythonComboBox(self.properties)
+        self.reportType.setObjectName(u"reportType")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.reportType)
+
+        self.label_2 = QLabel(self.properties)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_2)
+
+        self.field = PythonComboBox(self.properties)
+        self.field.setObjectName(u"field")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.field)
+
+        self.label_7 = QLabel(self.properties)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_7)
+
+        self.fieldComponent = VectorComponentComboBox(self.properties)
+        self.fieldComponent.setObjectName(u"fieldComponent")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.fieldComponent)
+
+
+        self.verticalLayout_2.addWidget(self.properties)
+
+        self.widget = QWidget(self.monitor)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(9, 0, 9, 9)
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_2.addWidget(self.label_3)
+
+        self.volume = QLineEdit(self.widget)
+        self.volume.setObjectName(u"volume")
+        self.volume.setEnabled(False)
+
+        self.horizontalLayout_2.addWidget(self.volume)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout_2.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+
+        self.verticalLayout.addWidget(self.monitor)
+
+        self.widget_3 = QWidget(VolumeDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_3)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_3.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_3)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_3.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+
+        self.retranslateUi(VolumeDialog)
+        self.cancel.clicked.connect(VolumeDialog.reject)
+
+        QMetaObject.connectSlotsByName(VolumeDialog)
+    # setupUi
+
+    def retranslateUi(self, VolumeDialog):
+        VolumeDialog.setWindowTitle(QCoreApplication.translate("VolumeDialog", u"Volume Monitor", None))
+        self.label_1.setText(QCoreApplication.translate("VolumeDialog", u"Name", None))
+        self.monitor.setTitle(QCoreApplication.translate("VolumeDialog", u"Volume Monitor", None))
+        self.label_5.setText(QCoreApplication.translate("VolumeDialog", u"Write Interval", None))
+        self.writeInterval.setText("")
+        self.label.setText(QCoreApplication.translate("VolumeDialog", u"Report Type", None))
+        self.label_2.setText(QCoreApplication.translate("VolumeDialog", u"Field", None))
+        self.label_7.setText(QCoreApplication.translate("VolumeDialog", u"Component", None))
+        self.label_3.setText(QCoreApplication.translate("VolumeDialog", u"Volumes", None))
+        self.select.setText(QCoreApplication.translate("VolumeDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("VolumeDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("VolumeDialog", u"Cancel", None))
+    # retranslateUi
+
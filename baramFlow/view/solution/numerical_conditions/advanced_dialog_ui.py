@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'advanced_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_AdvancedDialog(object):
+    def setupUi(self, AdvancedDialog):
+        if not AdvancedDialog.objectName():
+            AdvancedDialog.setObjectName(u"AdvancedDialog")
+        AdvancedDialog.resize(280, 664)
+        self.verticalLayout = QVBoxLayout(AdvancedDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(AdvancedDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_5 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.formLayout = QFormLayout(self.groupBox)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.minimumStaticTemperature = QLineEdit(self.groupBox)
+        self.minimumStaticTemperature.setObjectName(u"minimumStaticTemperature")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.minimumStaticTemperature)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.maximumStaticTemperature = QLineEdit(self.groupBox)
+        self.maximumStaticTemperature.setObjectName(u"maximumStaticTemperature")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.maximumStaticTemperature)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.maximumViscosityRatio = QLineEdit(self.groupBox)
+        self.maximumViscosityRatio.setObjectName(u"maximumViscosityRatio")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.maximumViscosityRatio)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(self.dialogContents)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.equationFlow = QCheckBox(self.groupBox_2)
+        self.equationFlow.setObjectName(u"equationFlow")
+
+        self.verticalLayout_2.addWidget(self.equationFlow)
+
+        self.equationEnergy = QCheckBox(self.groupBox_2)
+        self.equationEnergy.setObjectName(u"equationEnergy")
+
+        self.verticalLayout_2.addWidget(self.equationEnergy)
+
+        self.energyTerms = QWidget(self.groupBox_2)
+        self.energyTerms.setObjectName(u"energyTerms")
+        self.verticalLayout_4 = QVBoxLayout(self.energyTerms)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(-1, 0, -1, 0)
+        self.includeViscousDissipationTerms = QCheckBox(self.energyTerms)
+        self.includeViscousDissipationTerms.setObjectName(u"includeViscousDissipationTerms")
+
+        self.verticalLayout_4.addWidget(self.includeViscousDissipationTerms)
+
+        self.includeKineticEnergyTerms = QCheckBox(self.energyTerms)
+        self.includeKineticEnergyTerms.setObjectName(u"includeKineticEnergyTerms")
+
+        self.verticalLayout_4.addWidget(self.includeKineticEnergyTerms)
+
+        self.includePressureWorkTerms = QCheckBox(self.energyTerms)
+        self.includePressureWorkTerms.setObjectName(u"includePressureWorkTerms")
+
+        self.verticalLayout_4.addWidget(self.includePressureWorkTerms)
+
+
+        self.verticalLayout_2.addWidget(self.energyTerms)
+
+        self.equationUDS = QCheckBox(self.groupBox_2)
+        self.equationUDS.setObjectName(u"equationUDS")
+
+        self.verticalLayout_2.addWidget(self.equationUDS)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.dialogContents)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_3 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.collateralAge = QCheckBox(self.groupBox_3)
+        self.collateralAge.setObjectName(u"collateralAge")
+
+        self.verticalLayout_3.addWidget(self.collateralAge)
+
+        self.collateralHeatTransferCoefficient = QCheckBox(self.groupBox_3)
+        self.collateralHeatTransferCoefficient.setObjectName(u"collateralHeatTransferCoefficient")
+
+        self.verticalLayout_3.addWidget(self.collateralHeatTransferCoefficient)
+
+        self.collateralMachNumber = QCheckBox(self.groupBox_3)
+        self.collateralMachNumber.setObjectName(u"collateralMachNumber")
+
+        self.verticalLayout_3.addWidget(self.collateralMachNumber)
+
+        self.collateralQ = QCheckBox(self.groupBox_3)
+        self.collateralQ.setObjectName(u"collateralQ")
+
+        self.verticalLayout_3.addWidget(self.collateralQ)
+
+        self.collateralTotalPressure = QCheckBox(self.groupBox_3)
+        self.collateralTotalPressure.setObjectName(u"collateralTotalPressure")
+
+        self.verticalLayout_3.addWidget(self.collateralTotalPressure)
+
+        self.collateralVorticity = QCheckBox(self.groupBox_3)
+        self.collateralVorticity.setObjectName(u"collateralVorticity")
+
+        self.verticalLayout_3.addWidget(self.collateralVorticity)
+
+        self.collateralWallHeatFlux = QCheckBox(self.groupBox_3)
+        self.collateralWallHeatFlux.setObjectName(u"collateralWallHeatFlux")
+
+        self.verticalLayout_3.addWidget(self.collateralWallHeatFlux)
+
+        self.collateralWallShearStress = QCheckBox(self.groupBox_3)
+        self.collateralWallShearStress.setObjectName(u"collateralWallShearStress")
+
+        self.verticalLayout_3.addWidget(self.collateralWallShearStress)
+
+        self.collateralWallYPlus = QCheckBox(self.groupBox_3)
+        self.collateralWallYPlus.setObjectName(u"collateralWallYPlus")
+
+        self.verticalLayout_3.addWidget(self.collateralWallYPlus)
+
+        self.label_4 = QLabel(self.groupBox_3)
+        self.label_4.setObjectName(u"label_4")
+        self.label_4.setWordWrap(True)
+
+        self.verticalLayout_3.addWidget(self.label_4)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.widget_5 = QWidget(AdvancedDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+
+        self.retranslateUi(AdvancedDialog)
+        self.cancel.clicked.connect(AdvancedDialog.reject)
+
+        QMetaObject.connectSlotsByName(AdvancedDialog)
+    # setupUi
+
+    def retranslateUi(self, AdvancedDialog):
+        AdvancedDialog.setWindowTitle(QCoreApplication.translate("AdvancedDialog", u"Advanced Numerical Condtions", None))
+        self.groupBox.setTitle(QCoreApplication.translate("AdvancedDialog", u"Limits", None))
+        self.label.setText(QCoreApplication.translate("AdvancedDialog", u"Minimum Static Temperature (K)", None))
+        self.label_2.setText(QCoreApplication.translate("AdvancedDialog", u"Maximum Static Temperature (K)", None))
+        self.label_3.setText(QCoreApplication.translate("AdvancedDialog", u"Maximum Viscosity Ratio", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("AdvancedDialog", u"Equations", None))
+        self.equationFlow.setText(QCoreApplication.translate("AdvancedDialog", u"Flow", None))
+        self.equationEnergy.setText(QCoreApplication.translate("AdvancedDialog", u"Energy", None))
+        self.includeViscousDissipationTerms.setText(QCoreApplication.translate("AdvancedDialog", u"Include Viscous Dissipation Terms", None))
+        self.includeKineticEnergyTerms.setText(QCoreApplication.translate("AdvancedDialog", u"Include Kinetic Energy Terms", None))
+        self.includePressureWorkTerms.setText(QCoreApplication.translate("AdvancedDialog", u"Include Pressure Work Terms", None))
+        self.equationUDS.setText(QCoreApplication.translate("AdvancedDialog", u"User-defined Scalar", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("AdvancedDialog", u"Collateral Fields", None))
+        self.collateralAge.setText(QCoreApplication.translate("AdvancedDialog", u"Age", None))
+        self.collateralHeatTransferCoefficient.setText(QCoreApplication.translate("AdvancedDialog", u"Heat Transfer Coefficient", None))
+        self.collateralMachNumber.setText(QCoreApplication.translate("AdvancedDialog", u"Mach Number", None))
+        self.collateralQ.setText(QCoreApplication.translate("AdvancedDialog", u"Q", None))
+        self.collateralTotalPressure.setText(QCoreApplication.translate("AdvancedDialog", u"Total Pressure", None))
+        self.collateralVorticity.setText(QCoreApplication.translate("AdvancedDialog", u"Vorticity", None))
+        self.collateralWallHeatFlux.setText(QCoreApplication.translate("AdvancedDialog", u"Wall Heat Flux", None))
+        self.collateralWallShearStress.setText(QCoreApplication.translate("AdvancedDialog", u"Wall Shear Stress", None))
+        self.collateralWallYPlus.setText(QCoreApplication.translate("AdvancedDialog", u"Wall y plus", None))
+        self.label_4.setText(QCoreApplication.translate("AdvancedDialog", u"Selected field values will be written into time folders during calcuation, yet only the last time folder will have values in steady cases.", None))
+        self.ok.setText(QCoreApplication.translate("AdvancedDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("AdvancedDialog", u"Cancel", None))
+    # retranslateUi
+
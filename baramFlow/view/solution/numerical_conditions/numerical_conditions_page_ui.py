@@ -0,0 +1,762 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'numerical_conditions_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractScrollArea, QApplication, QCheckBox, QFormLayout,
+    QFrame, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QRadioButton,
+    QScrollArea, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from widgets.enum_combo_box import EnumComboBox
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_NumericalConditionsPage(object):
+    def setupUi(self, NumericalConditionsPage):
+        if not NumericalConditionsPage.objectName():
+            NumericalConditionsPage.setObjectName(u"NumericalConditionsPage")
+        NumericalConditionsPage.resize(360, 776)
+        self.verticalLayout_2 = QVBoxLayout(NumericalConditionsPage)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.label = QLabel(NumericalConditionsPage)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayout_2.addWidget(self.label)
+
+        self.line = QFrame(NumericalConditionsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_2.addWidget(self.line)
+
+        self.scrollArea = QScrollArea(NumericalConditionsPage)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 338, 1366))
+        self.verticalLayout = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 9, 0)
+        self.pressureVelocity = QWidget(self.scrollAreaWidgetContents)
+        self.pressureVelocity.setObjectName(u"pressureVelocity")
+        self.formLayout = QFormLayout(self.pressureVelocity)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_2 = QLabel(self.pressureVelocity)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.pressureVelocityCouplingScheme = EnumComboBox(self.pressureVelocity)
+        self.pressureVelocityCouplingScheme.setObjectName(u"pressureVelocityCouplingScheme")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.pressureVelocityCouplingScheme)
+
+
+        self.verticalLayout.addWidget(self.pressureVelocity)
+
+        self.densityBasedSolverParameters = QWidget(self.scrollAreaWidgetContents)
+        self.densityBasedSolverParameters.setObjectName(u"densityBasedSolverParameters")
+        self.densityBasedSolverParametersLayout = QFormLayout(self.densityBasedSolverParameters)
+        self.densityBasedSolverParametersLayout.setObjectName(u"densityBasedSolverParametersLayout")
+        self.densityBasedSolverParametersLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_5 = QLabel(self.densityBasedSolverParameters)
+        self.label_5.setObjectName(u"label_5")
+
+        self.densityBasedSolverParametersLayout.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.formulation = EnumComboBox(self.densityBasedSolverParameters)
+        self.formulation.setObjectName(u"formulation")
+
+        self.densityBasedSolverParametersLayout.setWidget(0, QFormLayout.FieldRole, self.formulation)
+
+        self.label_6 = QLabel(self.densityBasedSolverParameters)
+        self.label_6.setObjectName(u"label_6")
+
+        self.densityBasedSolverParametersLayout.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.fluxType = EnumComboBox(self.densityBasedSolverParameters)
+        self.fluxType.setObjectName(u"fluxType")
+
+        self.densityBasedSolverParametersLayout.setWidget(1, QFormLayout.FieldRole, self.fluxType)
+
+        self.label_10 = QLabel(self.densityBasedSolverParameters)
+        self.label_10.setObjectName(u"label_10")
+
+        self.densityBasedSolverParametersLayout.setWidget(2, QFormLayout.LabelRole, self.label_10)
+
+        self.label_12 = QLabel(self.densityBasedSolverParameters)
+        self.label_12.setObjectName(u"label_12")
+
+        self.densityBasedSolverParametersLayout.setWidget(3, QFormLayout.LabelRole, self.label_12)
+
+        self.entropyFixCoefficient = QLineEdit(self.densityBasedSolverParameters)
+        self.entropyFixCoefficient.setObjectName(u"entropyFixCoefficient")
+
+        self.densityBasedSolverParametersLayout.setWidget(2, QFormLayout.FieldRole, self.entropyFixCoefficient)
+
+        self.cutOffMachNumber = QLineEdit(self.densityBasedSolverParameters)
+        self.cutOffMachNumber.setObjectName(u"cutOffMachNumber")
+
+        self.densityBasedSolverParametersLayout.setWidget(3, QFormLayout.FieldRole, self.cutOffMachNumber)
+
+
+        self.verticalLayout.addWidget(self.densityBasedSolverParameters)
+
+        self.useMomentumPredictor = QCheckBox(self.scrollAreaWidgetContents)
+        self.useMomentumPredictor.setObjectName(u"useMomentumPredictor")
+
+        self.verticalLayout.addWidget(self.useMomentumPredictor)
+
+        self.discretizationSchemes = QGroupBox(self.scrollAreaWidgetContents)
+        self.discretizationSchemes.setObjectName(u"discretizationSchemes")
+        self.discretizationSchemes.setLayoutDirection(Qt.LeftToRight)
+        self.discretizationSchemesLayout = QFormLayout(self.discretizationSchemes)
+        self.discretizationSchemesLayout.setObjectName(u"discretizationSchemesLayout")
+        self.label_20 = QLabel(self.discretizationSchemes)
+        self.label_20.setObjectName(u"label_20")
+
+        self.discretizationSchemesLayout.setWidget(0, QFormLayout.LabelRole, self.label_20)
+
+        self.discretizationSchemeTime = PythonComboBox(self.discretizationSchemes)
+        self.discretizationSchemeTime.setObjectName(u"discretizationSchemeTime")
+
+        self.discretizationSchemesLayout.setWidget(0, QFormLayout.FieldRole, self.discretizationSchemeTime)
+
+        self.discretizationSchemesMomentumLabel = QLabel(self.discretizationSchemes)
+        self.discretizationSchemesMomentumLabel.setObjectName(u"discretizationSchemesMomentumLabel")
+
+        self.discretizationSchemesLayout.setWidget(2, QFormLayout.LabelRole, self.discretizationSchemesMomentumLabel)
+
+        self.discretizationSchemeMomentum = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemeMomentum.setObjectName(u"discretizationSchemeMomentum")
+
+        self.discretizationSchemesLayout.setWidget(2, QFormLayout.FieldRole, self.discretizationSchemeMomentum)
+
+        self.label_19 = QLabel(self.discretizationSchemes)
+        self.label_19.setObjectName(u"label_19")
+
+        self.discretizationSchemesLayout.setWidget(3, QFormLayout.LabelRole, self.label_19)
+
+        self.discretizationSchemeEnergy = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemeEnergy.setObjectName(u"discretizationSchemeEnergy")
+
+        self.discretizationSchemesLayout.setWidget(3, QFormLayout.FieldRole, self.discretizationSchemeEnergy)
+
+        self.label_22 = QLabel(self.discretizationSchemes)
+        self.label_22.setObjectName(u"label_22")
+
+        self.discretizationSchemesLayout.setWidget(4, QFormLayout.LabelRole, self.label_22)
+
+        self.discretizationSchemeTurbulence = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemeTurbulence.setObjectName(u"discretizationSchemeTurbulence")
+
+        self.discretizationSchemesLayout.setWidget(4, QFormLayout.FieldRole, self.discretizationSchemeTurbulence)
+
+        self.label_3 = QLabel(self.discretizationSchemes)
+        self.label_3.setObjectName(u"label_3")
+
+        self.discretizationSchemesLayout.setWidget(5, QFormLayout.LabelRole, self.label_3)
+
+        self.discretizationSchemeVolumeFraction = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemeVolumeFraction.setObjectName(u"discretizationSchemeVolumeFraction")
+
+        self.discretizationSchemesLayout.setWidget(5, QFormLayout.FieldRole, self.discretizationSchemeVolumeFraction)
+
+        self.label_4 = QLabel(self.discretizationSchemes)
+        self.label_4.setObjectName(u"label_4")
+
+        self.discretizationSchemesLayout.setWidget(1, QFormLayout.LabelRole, self.label_4)
+
+        self.discretizationSchemePressure = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemePressure.setObjectName(u"discretizationSchemePressure")
+
+        self.discretizationSchemesLayout.setWidget(1, QFormLayout.FieldRole, self.discretizationSchemePressure)
+
+        self.label_14 = QLabel(self.discretizationSchemes)
+        self.label_14.setObjectName(u"label_14")
+
+        self.discretizationSchemesLayout.setWidget(6, QFormLayout.LabelRole, self.label_14)
+
+        self.discretizationSchemeScalar = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemeScalar.setObjectName(u"discretizationSchemeScalar")
+
+        self.discretizationSchemesLayout.setWidget(6, QFormLayout.FieldRole, self.discretizationSchemeScalar)
+
+        self.label_37 = QLabel(self.discretizationSchemes)
+        self.label_37.setObjectName(u"label_37")
+
+        self.discretizationSchemesLayout.setWidget(7, QFormLayout.LabelRole, self.label_37)
+
+        self.discretizationSchemeSpecies = EnumComboBox(self.discretizationSchemes)
+        self.discretizationSchemeSpecies.setObjectName(u"discretizationSchemeSpecies")
+
+        self.discretizationSchemesLayout.setWidget(7, QFormLayout.FieldRole, self.discretizationSchemeSpecies)
+
+
+        self.verticalLayout.addWidget(self.discretizationSchemes)
+
+        self.underRelaxationFactors = QGroupBox(self.scrollAreaWidgetContents)
+        self.underRelaxationFactors.setObjectName(u"underRelaxationFactors")
+        self.underRelaxationFactorsLayout = QGridLayout(self.underRelaxationFactors)
+        self.underRelaxationFactorsLayout.setObjectName(u"underRelaxationFactorsLayout")
+        self.label_13 = QLabel(self.underRelaxationFactors)
+        self.label_13.setObjectName(u"label_13")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_13, 4, 0, 1, 1)
+
+        self.underRelaxationFactorScalar = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorScalar.setObjectName(u"underRelaxationFactorScalar")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorScalar, 7, 1, 1, 1)
+
+        self.underRelaxationFactorVolumeFractionFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorVolumeFractionFinal.setObjectName(u"underRelaxationFactorVolumeFractionFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorVolumeFractionFinal, 6, 2, 1, 1)
+
+        self.label_26 = QLabel(self.underRelaxationFactors)
+        self.label_26.setObjectName(u"label_26")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_26, 7, 0, 1, 1)
+
+        self.label_29 = QLabel(self.underRelaxationFactors)
+        self.label_29.setObjectName(u"label_29")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_29, 5, 0, 1, 1)
+
+        self.underRelaxationFactorPressureFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorPressureFinal.setObjectName(u"underRelaxationFactorPressureFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorPressureFinal, 1, 2, 1, 1)
+
+        self.underRelaxationFactorEnergy = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorEnergy.setObjectName(u"underRelaxationFactorEnergy")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorEnergy, 3, 1, 1, 1)
+
+        self.underRelaxationFactorDensity = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorDensity.setObjectName(u"underRelaxationFactorDensity")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorDensity, 5, 1, 1, 1)
+
+        self.underRelaxationFactorDensityFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorDensityFinal.setObjectName(u"underRelaxationFactorDensityFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorDensityFinal, 5, 2, 1, 1)
+
+        self.label_31 = QLabel(self.underRelaxationFactors)
+        self.label_31.setObjectName(u"label_31")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_31, 6, 0, 1, 1)
+
+        self.label_9 = QLabel(self.underRelaxationFactors)
+        self.label_9.setObjectName(u"label_9")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_9, 2, 0, 1, 1)
+
+        self.underRelaxationFactorTurbulenceFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorTurbulenceFinal.setObjectName(u"underRelaxationFactorTurbulenceFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorTurbulenceFinal, 4, 2, 1, 1)
+
+        self.underRelaxationFactorVolumeFraction = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorVolumeFraction.setObjectName(u"underRelaxationFactorVolumeFraction")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorVolumeFraction, 6, 1, 1, 1)
+
+        self.label_11 = QLabel(self.underRelaxationFactors)
+        self.label_11.setObjectName(u"label_11")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_11, 3, 0, 1, 1)
+
+        self.underRelaxationFactorMomentum = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorMomentum.setObjectName(u"underRelaxationFactorMomentum")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorMomentum, 2, 1, 1, 1)
+
+        self.label_8 = QLabel(self.underRelaxationFactors)
+        self.label_8.setObjectName(u"label_8")
+        self.label_8.setAlignment(Qt.AlignCenter)
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_8, 0, 2, 1, 1)
+
+        self.underRelaxationFactorPressure = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorPressure.setObjectName(u"underRelaxationFactorPressure")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorPressure, 1, 1, 1, 1)
+
+        self.underRelaxationFactorTurbulence = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorTurbulence.setObjectName(u"underRelaxationFactorTurbulence")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorTurbulence, 4, 1, 1, 1)
+
+        self.underRelaxationFactorScalarFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorScalarFinal.setObjectName(u"underRelaxationFactorScalarFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorScalarFinal, 7, 2, 1, 1)
+
+        self.underRelaxationFactorMomentumFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorMomentumFinal.setObjectName(u"underRelaxationFactorMomentumFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorMomentumFinal, 2, 2, 1, 1)
+
+        self.label_7 = QLabel(self.underRelaxationFactors)
+        self.label_7.setObjectName(u"label_7")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_7, 1, 0, 1, 1)
+
+        self.underRelaxationFactorEnergyFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorEnergyFinal.setObjectName(u"underRelaxationFactorEnergyFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorEnergyFinal, 3, 2, 1, 1)
+
+        self.underRelaxationFactorSpecies = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorSpecies.setObjectName(u"underRelaxationFactorSpecies")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorSpecies, 8, 1, 1, 1)
+
+        self.underRelaxationFactorSpeciesFinal = QLineEdit(self.underRelaxationFactors)
+        self.underRelaxationFactorSpeciesFinal.setObjectName(u"underRelaxationFactorSpeciesFinal")
+
+        self.underRelaxationFactorsLayout.addWidget(self.underRelaxationFactorSpeciesFinal, 8, 2, 1, 1)
+
+        self.label_38 = QLabel(self.underRelaxationFactors)
+        self.label_38.setObjectName(u"label_38")
+
+        self.underRelaxationFactorsLayout.addWidget(self.label_38, 8, 0, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.underRelaxationFactors)
+
+        self.improveStablitiy = QGroupBox(self.scrollAreaWidgetContents)
+        self.improveStablitiy.setObjectName(u"improveStablitiy")
+        self.improveStablitiy.setCheckable(True)
+        self.formLayout_2 = QFormLayout(self.improveStablitiy)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_32 = QLabel(self.improveStablitiy)
+        self.label_32.setObjectName(u"label_32")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_32)
+
+        self.limitingFactor = QLineEdit(self.improveStablitiy)
+        self.limitingFactor.setObjectName(u"limitingFactor")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.limitingFactor)
+
+
+        self.verticalLayout.addWidget(self.improveStablitiy)
+
+        self.widget_3 = QWidget(self.scrollAreaWidgetContents)
+        self.widget_3.setObjectName(u"widget_3")
+        self.formLayout_4 = QFormLayout(self.widget_3)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_15 = QLabel(self.widget_3)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.maxIterationsPerTimeStep = QLineEdit(self.widget_3)
+        self.maxIterationsPerTimeStep.setObjectName(u"maxIterationsPerTimeStep")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.maxIterationsPerTimeStep)
+
+        self.label_16 = QLabel(self.widget_3)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_16)
+
+        self.numberOfCorrectors = QLineEdit(self.widget_3)
+        self.numberOfCorrectors.setObjectName(u"numberOfCorrectors")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.numberOfCorrectors)
+
+        self.label_40 = QLabel(self.widget_3)
+        self.label_40.setObjectName(u"label_40")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_40)
+
+        self.numberOfNonOrthogonalCorrectors = QLineEdit(self.widget_3)
+        self.numberOfNonOrthogonalCorrectors.setObjectName(u"numberOfNonOrthogonalCorrectors")
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.numberOfNonOrthogonalCorrectors)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.multiphase = QGroupBox(self.scrollAreaWidgetContents)
+        self.multiphase.setObjectName(u"multiphase")
+        self.verticalLayout_3 = QVBoxLayout(self.multiphase)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(9, 9, 9, 9)
+        self.widget_6 = QWidget(self.multiphase)
+        self.widget_6.setObjectName(u"widget_6")
+        self.formLayout_10 = QFormLayout(self.widget_6)
+        self.formLayout_10.setObjectName(u"formLayout_10")
+        self.formLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.label_33 = QLabel(self.widget_6)
+        self.label_33.setObjectName(u"label_33")
+
+        self.formLayout_10.setWidget(0, QFormLayout.LabelRole, self.label_33)
+
+        self.multiphaseMaxIterationsPerTimeStep = QLineEdit(self.widget_6)
+        self.multiphaseMaxIterationsPerTimeStep.setObjectName(u"multiphaseMaxIterationsPerTimeStep")
+
+        self.formLayout_10.setWidget(0, QFormLayout.FieldRole, self.multiphaseMaxIterationsPerTimeStep)
+
+        self.multiphaseNumberOfCorrectors = QLineEdit(self.widget_6)
+        self.multiphaseNumberOfCorrectors.setObjectName(u"multiphaseNumberOfCorrectors")
+
+        self.formLayout_10.setWidget(1, QFormLayout.FieldRole, self.multiphaseNumberOfCorrectors)
+
+        self.label_34 = QLabel(self.widget_6)
+        self.label_34.setObjectName(u"label_34")
+
+        self.formLayout_10.setWidget(1, QFormLayout.LabelRole, self.label_34)
+
+
+        self.verticalLayout_3.addWidget(self.widget_6)
+
+        self.groupBox_9 = QGroupBox(self.multiphase)
+        self.groupBox_9.setObjectName(u"groupBox_9")
+        self.horizontalLayout_3 = QHBoxLayout(self.groupBox_9)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.mullesExplicit = QRadioButton(self.groupBox_9)
+        self.mullesExplicit.setObjectName(u"mullesExplicit")
+
+        self.horizontalLayout_3.addWidget(self.mullesExplicit)
+
+        self.mulesSemiImplicit = QRadioButton(self.groupBox_9)
+        self.mulesSemiImplicit.setObjectName(u"mulesSemiImplicit")
+
+        self.horizontalLayout_3.addWidget(self.mulesSemiImplicit)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_9)
+
+        self.widget_7 = QWidget(self.multiphase)
+        self.widget_7.setObjectName(u"widget_7")
+        self.formLayout_11 = QFormLayout(self.widget_7)
+        self.formLayout_11.setObjectName(u"formLayout_11")
+        self.formLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.label_35 = QLabel(self.widget_7)
+        self.label_35.setObjectName(u"label_35")
+
+        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.label_35)
+
+        self.phaseInterfaceCompressionFactor = QLineEdit(self.widget_7)
+        self.phaseInterfaceCompressionFactor.setObjectName(u"phaseInterfaceCompressionFactor")
+
+        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.phaseInterfaceCompressionFactor)
+
+        self.label_36 = QLabel(self.widget_7)
+        self.label_36.setObjectName(u"label_36")
+
+        self.formLayout_11.setWidget(1, QFormLayout.LabelRole, self.label_36)
+
+        self.numberOfMulesIterations = QLineEdit(self.widget_7)
+        self.numberOfMulesIterations.setObjectName(u"numberOfMulesIterations")
+
+        self.formLayout_11.setWidget(1, QFormLayout.FieldRole, self.numberOfMulesIterations)
+
+
+        self.verticalLayout_3.addWidget(self.widget_7)
+
+
+        self.verticalLayout.addWidget(self.multiphase)
+
+        self.convergenceCriteria = QGroupBox(self.scrollAreaWidgetContents)
+        self.convergenceCriteria.setObjectName(u"convergenceCriteria")
+        self.convergenceCriteriaLyaout = QGridLayout(self.convergenceCriteria)
+        self.convergenceCriteriaLyaout.setObjectName(u"convergenceCriteriaLyaout")
+        self.absoluteDensity = QLineEdit(self.convergenceCriteria)
+        self.absoluteDensity.setObjectName(u"absoluteDensity")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteDensity, 2, 1, 1, 1)
+
+        self.relativeMomentum = QLineEdit(self.convergenceCriteria)
+        self.relativeMomentum.setObjectName(u"relativeMomentum")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeMomentum, 3, 2, 1, 1)
+
+        self.label_30 = QLabel(self.convergenceCriteria)
+        self.label_30.setObjectName(u"label_30")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_30, 7, 0, 1, 1)
+
+        self.label_17 = QLabel(self.convergenceCriteria)
+        self.label_17.setObjectName(u"label_17")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_17, 1, 0, 1, 1)
+
+        self.label_24 = QLabel(self.convergenceCriteria)
+        self.label_24.setObjectName(u"label_24")
+        self.label_24.setAlignment(Qt.AlignCenter)
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_24, 0, 2, 1, 1)
+
+        self.absoluteMomentum = QLineEdit(self.convergenceCriteria)
+        self.absoluteMomentum.setObjectName(u"absoluteMomentum")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteMomentum, 3, 1, 1, 1)
+
+        self.absolutePressure = QLineEdit(self.convergenceCriteria)
+        self.absolutePressure.setObjectName(u"absolutePressure")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absolutePressure, 1, 1, 1, 1)
+
+        self.relativeVolumeFraction = QLineEdit(self.convergenceCriteria)
+        self.relativeVolumeFraction.setObjectName(u"relativeVolumeFraction")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeVolumeFraction, 6, 2, 1, 1)
+
+        self.absoluteTurbulence = QLineEdit(self.convergenceCriteria)
+        self.absoluteTurbulence.setObjectName(u"absoluteTurbulence")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteTurbulence, 5, 1, 1, 1)
+
+        self.label_23 = QLabel(self.convergenceCriteria)
+        self.label_23.setObjectName(u"label_23")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_23, 3, 0, 1, 1)
+
+        self.relativeTurbulence = QLineEdit(self.convergenceCriteria)
+        self.relativeTurbulence.setObjectName(u"relativeTurbulence")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeTurbulence, 5, 2, 1, 1)
+
+        self.absoluteEnergy = QLineEdit(self.convergenceCriteria)
+        self.absoluteEnergy.setObjectName(u"absoluteEnergy")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteEnergy, 4, 1, 1, 1)
+
+        self.relativePressure = QLineEdit(self.convergenceCriteria)
+        self.relativePressure.setObjectName(u"relativePressure")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativePressure, 1, 2, 1, 1)
+
+        self.label_27 = QLabel(self.convergenceCriteria)
+        self.label_27.setObjectName(u"label_27")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_27, 5, 0, 1, 1)
+
+        self.label_25 = QLabel(self.convergenceCriteria)
+        self.label_25.setObjectName(u"label_25")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_25, 4, 0, 1, 1)
+
+        self.relativeEnergy = QLineEdit(self.convergenceCriteria)
+        self.relativeEnergy.setObjectName(u"relativeEnergy")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeEnergy, 4, 2, 1, 1)
+
+        self.absoluteScalar = QLineEdit(self.convergenceCriteria)
+        self.absoluteScalar.setObjectName(u"absoluteScalar")
+        self.absoluteScalar.setEnabled(False)
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteScalar, 7, 1, 1, 1)
+
+        self.label_28 = QLabel(self.convergenceCriteria)
+        self.label_28.setObjectName(u"label_28")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_28, 6, 0, 1, 1)
+
+        self.label_21 = QLabel(self.convergenceCriteria)
+        self.label_21.setObjectName(u"label_21")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_21, 2, 0, 1, 1)
+
+        self.label_18 = QLabel(self.convergenceCriteria)
+        self.label_18.setObjectName(u"label_18")
+        self.label_18.setAlignment(Qt.AlignCenter)
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_18, 0, 1, 1, 1)
+
+        self.relativeScalar = QLineEdit(self.convergenceCriteria)
+        self.relativeScalar.setObjectName(u"relativeScalar")
+        self.relativeScalar.setEnabled(False)
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeScalar, 7, 2, 1, 1)
+
+        self.relativeDensity = QLineEdit(self.convergenceCriteria)
+        self.relativeDensity.setObjectName(u"relativeDensity")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeDensity, 2, 2, 1, 1)
+
+        self.absoluteVolumeFraction = QLineEdit(self.convergenceCriteria)
+        self.absoluteVolumeFraction.setObjectName(u"absoluteVolumeFraction")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteVolumeFraction, 6, 1, 1, 1)
+
+        self.label_39 = QLabel(self.convergenceCriteria)
+        self.label_39.setObjectName(u"label_39")
+
+        self.convergenceCriteriaLyaout.addWidget(self.label_39, 8, 0, 1, 1)
+
+        self.absoluteSpecies = QLineEdit(self.convergenceCriteria)
+        self.absoluteSpecies.setObjectName(u"absoluteSpecies")
+
+        self.convergenceCriteriaLyaout.addWidget(self.absoluteSpecies, 8, 1, 1, 1)
+
+        self.relativeSpecies = QLineEdit(self.convergenceCriteria)
+        self.relativeSpecies.setObjectName(u"relativeSpecies")
+
+        self.convergenceCriteriaLyaout.addWidget(self.relativeSpecies, 8, 2, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.convergenceCriteria)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_2.addWidget(self.scrollArea)
+
+        self.widget_2 = QWidget(NumericalConditionsPage)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.advanced = QPushButton(self.widget_2)
+        self.advanced.setObjectName(u"advanced")
+
+        self.horizontalLayout.addWidget(self.advanced)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        QWidget.setTabOrder(self.pressureVelocityCouplingScheme, self.formulation)
+        QWidget.setTabOrder(self.formulation, self.fluxType)
+        QWidget.setTabOrder(self.fluxType, self.entropyFixCoefficient)
+        QWidget.setTabOrder(self.entropyFixCoefficient, self.cutOffMachNumber)
+        QWidget.setTabOrder(self.cutOffMachNumber, self.useMomentumPredictor)
+        QWidget.setTabOrder(self.useMomentumPredictor, self.discretizationSchemeTime)
+        QWidget.setTabOrder(self.discretizationSchemeTime, self.discretizationSchemePressure)
+        QWidget.setTabOrder(self.discretizationSchemePressure, self.discretizationSchemeMomentum)
+        QWidget.setTabOrder(self.discretizationSchemeMomentum, self.discretizationSchemeEnergy)
+        QWidget.setTabOrder(self.discretizationSchemeEnergy, self.discretizationSchemeTurbulence)
+        QWidget.setTabOrder(self.discretizationSchemeTurbulence, self.discretizationSchemeVolumeFraction)
+        QWidget.setTabOrder(self.discretizationSchemeVolumeFraction, self.underRelaxationFactorPressure)
+        QWidget.setTabOrder(self.underRelaxationFactorPressure, self.underRelaxationFactorPressureFinal)
+        QWidget.setTabOrder(self.underRelaxationFactorPressureFinal, self.underRelaxationFactorMomentum)
+        QWidget.setTabOrder(self.underRelaxationFactorMomentum, self.underRelaxationFactorMomentumFinal)
+        QWidget.setTabOrder(self.underRelaxationFactorMomentumFinal, self.underRelaxationFactorEnergy)
+        QWidget.setTabOrder(self.underRelaxationFactorEnergy, self.underRelaxationFactorEnergyFinal)
+        QWidget.setTabOrder(self.underRelaxationFactorEnergyFinal, self.underRelaxationFactorTurbulence)
+        QWidget.setTabOrder(self.underRelaxationFactorTurbulence, self.underRelaxationFactorTurbulenceFinal)
+        QWidget.setTabOrder(self.underRelaxationFactorTurbulenceFinal, self.underRelaxationFactorDensity)
+        QWidget.setTabOrder(self.underRelaxationFactorDensity, self.underRelaxationFactorDensityFinal)
+        QWidget.setTabOrder(self.underRelaxationFactorDensityFinal, self.underRelaxationFactorVolumeFraction)
+        QWidget.setTabOrder(self.underRelaxationFactorVolumeFraction, self.underRelaxationFactorVolumeFractionFinal)
+        QWidget.setTabOrder(self.underRelaxationFactorVolumeFractionFinal, self.improveStablitiy)
+        QWidget.setTabOrder(self.improveStablitiy, self.limitingFactor)
+        QWidget.setTabOrder(self.limitingFactor, self.maxIterationsPerTimeStep)
+        QWidget.setTabOrder(self.maxIterationsPerTimeStep, self.numberOfCorrectors)
+        QWidget.setTabOrder(self.numberOfCorrectors, self.multiphaseMaxIterationsPerTimeStep)
+        QWidget.setTabOrder(self.multiphaseMaxIterationsPerTimeStep, self.multiphaseNumberOfCorrectors)
+        QWidget.setTabOrder(self.multiphaseNumberOfCorrectors, self.mullesExplicit)
+        QWidget.setTabOrder(self.mullesExplicit, self.mulesSemiImplicit)
+        QWidget.setTabOrder(self.mulesSemiImplicit, self.phaseInterfaceCompressionFactor)
+        QWidget.setTabOrder(self.phaseInterfaceCompressionFactor, self.numberOfMulesIterations)
+        QWidget.setTabOrder(self.numberOfMulesIterations, self.absolutePressure)
+        QWidget.setTabOrder(self.absolutePressure, self.relativePressure)
+        QWidget.setTabOrder(self.relativePressure, self.absoluteDensity)
+        QWidget.setTabOrder(self.absoluteDensity, self.relativeDensity)
+        QWidget.setTabOrder(self.relativeDensity, self.absoluteMomentum)
+        QWidget.setTabOrder(self.absoluteMomentum, self.relativeMomentum)
+        QWidget.setTabOrder(self.relativeMomentum, self.absoluteEnergy)
+        QWidget.setTabOrder(self.absoluteEnergy, self.relativeEnergy)
+        QWidget.setTabOrder(self.relativeEnergy, self.absoluteTurbulence)
+        QWidget.setTabOrder(self.absoluteTurbulence, self.relativeTurbulence)
+        QWidget.setTabOrder(self.relativeTurbulence, self.absoluteVolumeFraction)
+        QWidget.setTabOrder(self.absoluteVolumeFraction, self.relativeVolumeFraction)
+        QWidget.setTabOrder(self.relativeVolumeFraction, self.advanced)
+        QWidget.setTabOrder(self.advanced, self.scrollArea)
+
+        self.retranslateUi(NumericalConditionsPage)
+
+        QMetaObject.connectSlotsByName(NumericalConditionsPage)
+    # setupUi
+
+    def retranslateUi(self, NumericalConditionsPage):
+        NumericalConditionsPage.setWindowTitle(QCoreApplication.translate("NumericalConditionsPage", u"Form", None))
+        self.label.setText(QCoreApplication.translate("NumericalConditionsPage", u"Numerical Conditions", None))
+        self.label_2.setText(QCoreApplication.translate("NumericalConditionsPage", u"Pressure-Velocity Coupling Scheme", None))
+        self.label_5.setText(QCoreApplication.translate("NumericalConditionsPage", u"Formulation", None))
+        self.label_6.setText(QCoreApplication.translate("NumericalConditionsPage", u"Flux Type", None))
+        self.label_10.setText(QCoreApplication.translate("NumericalConditionsPage", u"Entropy Fix Coefficient, \u03b5 ( 0<\u03b5<1)", None))
+        self.label_12.setText(QCoreApplication.translate("NumericalConditionsPage", u"Cut-off Mach Number, M<sub>\u221e</sub> (0&lt; M<sub>\u221e</sub>&lt;10)", None))
+        self.useMomentumPredictor.setText(QCoreApplication.translate("NumericalConditionsPage", u"Use Momentum Predictor", None))
+        self.discretizationSchemes.setTitle(QCoreApplication.translate("NumericalConditionsPage", u"Discretization Schemes", None))
+        self.label_20.setText(QCoreApplication.translate("NumericalConditionsPage", u"Time", None))
+        self.discretizationSchemesMomentumLabel.setText(QCoreApplication.translate("NumericalConditionsPage", u"Momentum", None))
+        self.label_19.setText(QCoreApplication.translate("NumericalConditionsPage", u"Energy", None))
+        self.label_22.setText(QCoreApplication.translate("NumericalConditionsPage", u"Turbulence", None))
+        self.label_3.setText(QCoreApplication.translate("NumericalConditionsPage", u"Volume Fraction", None))
+        self.label_4.setText(QCoreApplication.translate("NumericalConditionsPage", u"Pressure", None))
+        self.label_14.setText(QCoreApplication.translate("NumericalConditionsPage", u"Scalar", None))
+        self.label_37.setText(QCoreApplication.translate("NumericalConditionsPage", u"Species", None))
+        self.underRelaxationFactors.setTitle(QCoreApplication.translate("NumericalConditionsPage", u"Under-Relaxation Factors (0 < R \u2264 1)", None))
+        self.label_13.setText(QCoreApplication.translate("NumericalConditionsPage", u"Turbulence", None))
+        self.label_26.setText(QCoreApplication.translate("NumericalConditionsPage", u"Scalar", None))
+        self.label_29.setText(QCoreApplication.translate("NumericalConditionsPage", u"Density", None))
+        self.label_31.setText(QCoreApplication.translate("NumericalConditionsPage", u"Volume Fraction", None))
+        self.label_9.setText(QCoreApplication.translate("NumericalConditionsPage", u"Momentum", None))
+        self.label_11.setText(QCoreApplication.translate("NumericalConditionsPage", u"Energy", None))
+        self.label_8.setText(QCoreApplication.translate("NumericalConditionsPage", u"Final", None))
+        self.label_7.setText(QCoreApplication.translate("NumericalConditionsPage", u"Pressure", None))
+        self.label_38.setText(QCoreApplication.translate("NumericalConditionsPage", u"Species", None))
+        self.improveStablitiy.setTitle(QCoreApplication.translate("NumericalConditionsPage", u"Improve Stability", None))
+        self.label_32.setText(QCoreApplication.translate("NumericalConditionsPage", u"Limiting Factor", None))
+        self.label_15.setText(QCoreApplication.translate("NumericalConditionsPage", u"Max Iterations per Time Step", None))
+        self.label_16.setText(QCoreApplication.translate("NumericalConditionsPage", u"Number of Correctors", None))
+        self.label_40.setText(QCoreApplication.translate("NumericalConditionsPage", u"Number of non-orthogonal Correctors (0~10)", None))
+        self.multiphase.setTitle(QCoreApplication.translate("NumericalConditionsPage", u"Multiphase", None))
+        self.label_33.setText(QCoreApplication.translate("NumericalConditionsPage", u"Max Iterations per Time Step", None))
+        self.label_34.setText(QCoreApplication.translate("NumericalConditionsPage", u"Number of Correctors", None))
+        self.groupBox_9.setTitle(QCoreApplication.translate("NumericalConditionsPage", u"MULES Variant", None))
+        self.mullesExplicit.setText(QCoreApplication.translate("NumericalConditionsPage", u"Explicit", None))
+        self.mulesSemiImplicit.setText(QCoreApplication.translate("NumericalConditionsPage", u"Semi-implicit", None))
+        self.label_35.setText(QCoreApplication.translate("NumericalConditionsPage", u"Phase Interface Compression Factor", None))
+        self.label_36.setText(QCoreApplication.translate("NumericalConditionsPage", u"Number of MULES iterations over the limiter", None))
+        self.convergenceCriteria.setTitle(QCoreApplication.translate("NumericalConditionsPage", u"Convergence Criteria (range of values: 0~1)", None))
+        self.label_30.setText(QCoreApplication.translate("NumericalConditionsPage", u"Scalar", None))
+        self.label_17.setText(QCoreApplication.translate("NumericalConditionsPage", u"Pressure", None))
+        self.label_24.setText(QCoreApplication.translate("NumericalConditionsPage", u"Relative", None))
+        self.label_23.setText(QCoreApplication.translate("NumericalConditionsPage", u"Momentum", None))
+        self.label_27.setText(QCoreApplication.translate("NumericalConditionsPage", u"Turbulence", None))
+        self.label_25.setText(QCoreApplication.translate("NumericalConditionsPage", u"Energy", None))
+        self.label_28.setText(QCoreApplication.translate("NumericalConditionsPage", u"Volume Fraction", None))
+        self.label_21.setText(QCoreApplication.translate("NumericalConditionsPage", u"Density", None))
+        self.label_18.setText(QCoreApplication.translate("NumericalConditionsPage", u"Absolute", None))
+        self.label_39.setText(QCoreApplication.translate("NumericalConditionsPage", u"Species", None))
+        self.advanced.setText(QCoreApplication.translate("NumericalConditionsPage", u"&Advanced", None))
+    # retranslateUi
+
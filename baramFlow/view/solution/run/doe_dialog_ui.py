@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'doe_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QDialog,
+    QDialogButtonBox, QGroupBox, QHBoxLayout, QHeaderView,
+    QLabel, QPlainTextEdit, QRadioButton, QSizePolicy,
+    QSpacerItem, QSpinBox, QStackedWidget, QTableWidget,
+    QTableWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_DoEDialog(object):
+    def setupUi(self, DoEDialog):
+        if not DoEDialog.objectName():
+            DoEDialog.setObjectName(u"DoEDialog")
+        DoEDialog.resize(500, 800)
+        self.vboxLayout = QVBoxLayout(DoEDialog)
+        self.vboxLayout.setObjectName(u"vboxLayout")
+        self.methodGroup = QGroupBox(DoEDialog)
+        self.methodGroup.setObjectName(u"methodGroup")
+        self.hboxLayout = QHBoxLayout(self.methodGroup)
+        self.hboxLayout.setObjectName(u"hboxLayout")
+        self.rbLHS = QRadioButton(self.methodGroup)
+        self.rbLHS.setObjectName(u"rbLHS")
+        self.rbLHS.setChecked(True)
+
+        self.hboxLayout.addWidget(self.rbLHS)
+
+        self.rbSobol = QRadioButton(self.methodGroup)
+        self.rbSobol.setObjectName(u"rbSobol")
+
+        self.hboxLayout.addWidget(self.rbSobol)
+
+        self.rbFullFact = QRadioButton(self.methodGroup)
+        self.rbFullFact.setObjectName(u"rbFullFact")
+
+        self.hboxLayout.addWidget(self.rbFullFact)
+
+
+        self.vboxLayout.addWidget(self.methodGroup)
+
+        self.stackMethod = QStackedWidget(DoEDialog)
+        self.stackMethod.setObjectName(u"stackMethod")
+        self.pageSpaceFilling = QWidget()
+        self.pageSpaceFilling.setObjectName(u"pageSpaceFilling")
+        self.hboxLayout1 = QHBoxLayout(self.pageSpaceFilling)
+        self.hboxLayout1.setObjectName(u"hboxLayout1")
+        self.spnSamples = QSpinBox(self.pageSpaceFilling)
+        self.spnSamples.setObjectName(u"spnSamples")
+        self.spnSamples.setMinimum(1)
+        self.spnSamples.setMaximum(1000)
+        self.spnSamples.setValue(30)
+
+        self.hboxLayout1.addWidget(self.spnSamples)
+
+        self.label = QLabel(self.pageSpaceFilling)
+        self.label.setObjectName(u"label")
+
+        self.hboxLayout1.addWidget(self.label)
+
+        self.stackMethod.addWidget(self.pageSpaceFilling)
+        self.pageFullFact = QWidget()
+        self.pageFullFact.setObjectName(u"pageFullFact")
+        self.vboxLayout1 = QVBoxLayout(self.pageFullFact)
+        self.vboxLayout1.setObjectName(u"vboxLayout1")
+        self.stackMethod.addWidget(self.pageFullFact)
+
+        self.vboxLayout.addWidget(self.stackMethod)
+
+        self.varsGroup = QGroupBox(DoEDialog)
+        self.varsGroup.setObjectName(u"varsGroup")
+        self.vboxLayout2 = QVBoxLayout(self.varsGroup)
+        self.vboxLayout2.setObjectName(u"vboxLayout2")
+        self.tblVars = QTableWidget(self.varsGroup)
+        if (self.tblVars.columnCount() < 5):
+            self.tblVars.setColumnCount(5)
+        __qtablewidgetitem = QTableWidgetItem()
+        self.tblVars.setHorizontalHeaderItem(0, __qtablewidgetitem)
+        __qtablewidgetitem1 = QTableWidgetItem()
+        self.tblVars.setHorizontalHeaderItem(1, __qtablewidgetitem1)
+        __qtablewidgetitem2 = QTableWidgetItem()
+        self.tblVars.setHorizontalHeaderItem(2, __qtablewidgetitem2)
+        __qtablewidgetitem3 = QTableWidgetItem()
+        self.tblVars.setHorizontalHeaderItem(3, __qtablewidgetitem3)
+        __qtablewidgetitem4 = QTableWidgetItem()
+        self.tblVars.setHorizontalHeaderItem(4, __qtablewidgetitem4)
+        self.tblVars.setObjectName(u"tblVars")
+
+        self.vboxLayout2.addWidget(self.tblVars)
+
+
+        self.vboxLayout.addWidget(self.varsGroup)
+
+        self.previewGroup = QGroupBox(DoEDialog)
+        self.previewGroup.setObjectName(u"previewGroup")
+        self.vboxLayout3 = QVBoxLayout(self.previewGroup)
+        self.vboxLayout3.setObjectName(u"vboxLayout3")
+        self.txtPreview = QPlainTextEdit(self.previewGroup)
+        self.txtPreview.setObjectName(u"txtPreview")
+
+        self.vboxLayout3.addWidget(self.txtPreview)
+
+
+        self.vboxLayout.addWidget(self.previewGroup)
+
+        self.clearOldCases = QCheckBox(DoEDialog)
+        self.clearOldCases.setObjectName(u"clearOldCases")
+
+        self.vboxLayout.addWidget(self.clearOldCases)
+
+        self.hboxLayout2 = QHBoxLayout()
+        self.hboxLayout2.setObjectName(u"hboxLayout2")
+        self.spacerItem = QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.hboxLayout2.addItem(self.spacerItem)
+
+        self.buttonBox = QDialogButtonBox(DoEDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.hboxLayout2.addWidget(self.buttonBox)
+
+
+        self.vboxLayout.addLayout(self.hboxLayout2)
+
+
+        self.retranslateUi(DoEDialog)
+
+        QMetaObject.connectSlotsByName(DoEDialog)
+    # setupUi
+
+    def retranslateUi(self, DoEDialog):
+        DoEDialog.setWindowTitle(QCoreApplication.translate("DoEDialog", u"Generate Samples", None))
+        self.methodGroup.setTitle(QCoreApplication.translate("DoEDialog", u"Design Method", None))
+        self.rbLHS.setText(QCoreApplication.translate("DoEDialog", u"Maximin LHS", None))
+        self.rbSobol.setText(QCoreApplication.translate("DoEDialog", u"Sobol", None))
+        self.rbFullFact.setText(QCoreApplication.translate("DoEDialog", u"Full Factorial", None))
+        self.label.setText(QCoreApplication.translate("DoEDialog", u"Samples", None))
+        self.varsGroup.setTitle(QCoreApplication.translate("DoEDialog", u"Variables", None))
+        ___qtablewidgetitem = self.tblVars.horizontalHeaderItem(0)
+        ___qtablewidgetitem.setText(QCoreApplication.translate("DoEDialog", u"Name", None));
+        ___qtablewidgetitem1 = self.tblVars.horizontalHeaderItem(1)
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("DoEDialog", u"Min", None));
+        ___qtablewidgetitem2 = self.tblVars.horizontalHeaderItem(2)
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("DoEDialog", u"Max", None));
+        ___qtablewidgetitem3 = self.tblVars.horizontalHeaderItem(3)
+        ___qtablewidgetitem3.setText(QCoreApplication.translate("DoEDialog", u"Levels", None));
+        ___qtablewidgetitem4 = self.tblVars.horizontalHeaderItem(4)
+        ___qtablewidgetitem4.setText(QCoreApplication.translate("DoEDialog", u"Scale", None));
+        self.previewGroup.setTitle(QCoreApplication.translate("DoEDialog", u"Preview", None))
+        self.clearOldCases.setText(QCoreApplication.translate("DoEDialog", u"Clear old cases", None))
+    # retranslateUi
+
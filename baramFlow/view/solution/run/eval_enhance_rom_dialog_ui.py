@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'eval_enhance_rom_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QComboBox, QDialog,
+    QDialogButtonBox, QFormLayout, QGroupBox, QHBoxLayout,
+    QLabel, QSizePolicy, QSpacerItem, QSpinBox,
+    QVBoxLayout, QWidget)
+
+class Ui_EvalNEnhanceROMDialog(object):
+    def setupUi(self, EvalNEnhanceROMDialog):
+        if not EvalNEnhanceROMDialog.objectName():
+            EvalNEnhanceROMDialog.setObjectName(u"EvalNEnhanceROMDialog")
+        EvalNEnhanceROMDialog.resize(420, 60)
+        self.verticalLayout = QVBoxLayout(EvalNEnhanceROMDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.formLayoutNumEval = QFormLayout()
+        self.formLayoutNumEval.setObjectName(u"formLayoutNumEval")
+        self.labelNumEval = QLabel(EvalNEnhanceROMDialog)
+        self.labelNumEval.setObjectName(u"labelNumEval")
+
+        self.formLayoutNumEval.setWidget(0, QFormLayout.LabelRole, self.labelNumEval)
+
+        self.spnNumEval = QSpinBox(EvalNEnhanceROMDialog)
+        self.spnNumEval.setObjectName(u"spnNumEval")
+        self.spnNumEval.setMinimum(1)
+        self.spnNumEval.setMaximum(999)
+        self.spnNumEval.setValue(1)
+
+        self.formLayoutNumEval.setWidget(0, QFormLayout.FieldRole, self.spnNumEval)
+
+
+        self.verticalLayout.addLayout(self.formLayoutNumEval)
+
+        self.grpQuantities = QGroupBox(EvalNEnhanceROMDialog)
+        self.grpQuantities.setObjectName(u"grpQuantities")
+        self.verticalLayoutQuantities = QVBoxLayout(self.grpQuantities)
+        self.verticalLayoutQuantities.setObjectName(u"verticalLayoutQuantities")
+        self.layoutTypeSelector = QHBoxLayout()
+        self.layoutTypeSelector.setObjectName(u"layoutTypeSelector")
+        self.horizontalSpacerType = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.layoutTypeSelector.addItem(self.horizontalSpacerType)
+
+        self.cmbType = QComboBox(self.grpQuantities)
+        self.cmbType.setObjectName(u"cmbType")
+        self.cmbType.setMinimumWidth(220)
+        self.cmbType.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+
+        self.layoutTypeSelector.addWidget(self.cmbType)
+
+
+        self.verticalLayoutQuantities.addLayout(self.layoutTypeSelector)
+
+        self.layoutItems = QVBoxLayout()
+        self.layoutItems.setObjectName(u"layoutItems")
+
+        self.verticalLayoutQuantities.addLayout(self.layoutItems)
+
+
+        self.verticalLayout.addWidget(self.grpQuantities)
+
+        self.buttonBox = QDialogButtonBox(EvalNEnhanceROMDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(EvalNEnhanceROMDialog)
+
+        QMetaObject.connectSlotsByName(EvalNEnhanceROMDialog)
+    # setupUi
+
+    def retranslateUi(self, EvalNEnhanceROMDialog):
+        EvalNEnhanceROMDialog.setWindowTitle(QCoreApplication.translate("EvalNEnhanceROMDialog", u"Eval & Enhance Settings", None))
+        self.labelNumEval.setText(QCoreApplication.translate("EvalNEnhanceROMDialog", u"Number of evaluation runs:", None))
+        self.grpQuantities.setTitle(QCoreApplication.translate("EvalNEnhanceROMDialog", u"Quantities to Evaluate", None))
+    # retranslateUi
+
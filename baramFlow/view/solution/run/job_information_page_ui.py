@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'job_information_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QFrame, QGroupBox,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_JobInformationPage(object):
+    def setupUi(self, JobInformationPage):
+        if not JobInformationPage.objectName():
+            JobInformationPage.setObjectName(u"JobInformationPage")
+        JobInformationPage.resize(390, 487)
+        self.verticalLayout_4 = QVBoxLayout(JobInformationPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.title = QLabel(JobInformationPage)
+        self.title.setObjectName(u"title")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.title)
+
+        self.line = QFrame(JobInformationPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.groupBox_2 = QGroupBox(JobInformationPage)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.transientConditions = QWidget(self.groupBox_2)
+        self.transientConditions.setObjectName(u"transientConditions")
+        self.timeConditionLayout = QFormLayout(self.transientConditions)
+        self.timeConditionLayout.setObjectName(u"timeConditionLayout")
+        self.timeConditionLayout.setContentsMargins(0, -1, 0, -1)
+        self.label_2 = QLabel(self.transientConditions)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy)
+        self.label_2.setScaledContents(False)
+        self.label_2.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.id = QLabel(self.transientConditions)
+        self.id.setObjectName(u"id")
+        self.id.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(0, QFormLayout.FieldRole, self.id)
+
+        self.label_3 = QLabel(self.transientConditions)
+        self.label_3.setObjectName(u"label_3")
+        self.label_3.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.timeConditionLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.label_4 = QLabel(self.transientConditions)
+        self.label_4.setObjectName(u"label_4")
+        self.label_4.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.status = QLabel(self.transientConditions)
+        self.status.setObjectName(u"status")
+        self.status.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(3, QFormLayout.FieldRole, self.status)
+
+        self.label_5 = QLabel(self.transientConditions)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.createTime = QLabel(self.transientConditions)
+        self.createTime.setObjectName(u"createTime")
+        self.createTime.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(2, QFormLayout.FieldRole, self.createTime)
+
+        self.name = QLineEdit(self.transientConditions)
+        self.name.setObjectName(u"name")
+
+        self.timeConditionLayout.setWidget(1, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_5.addWidget(self.transientConditions)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(JobInformationPage)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.submitJob = QPushButton(self.groupBox_3)
+        self.submitJob.setObjectName(u"submitJob")
+        self.submitJob.setMinimumSize(QSize(0, 60))
+
+        self.verticalLayout_6.addWidget(self.submitJob)
+
+        self.cancelJob = QPushButton(self.groupBox_3)
+        self.cancelJob.setObjectName(u"cancelJob")
+        self.cancelJob.setMinimumSize(QSize(0, 60))
+
+        self.verticalLayout_6.addWidget(self.cancelJob)
+
+        self.saveAndStopCalculation = QPushButton(self.groupBox_3)
+        self.saveAndStopCalculation.setObjectName(u"saveAndStopCalculation")
+        self.saveAndStopCalculation.setEnabled(True)
+        self.saveAndStopCalculation.setMinimumSize(QSize(0, 60))
+
+        self.verticalLayout_6.addWidget(self.saveAndStopCalculation)
+
+        self.updateConfiguration = QPushButton(self.groupBox_3)
+        self.updateConfiguration.setObjectName(u"updateConfiguration")
+        self.updateConfiguration.setEnabled(True)
+        self.updateConfiguration.setMinimumSize(QSize(0, 60))
+        self.updateConfiguration.setToolTipDuration(10)
+
+        self.verticalLayout_6.addWidget(self.updateConfiguration)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_3)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer)
+
+
+        self.retranslateUi(JobInformationPage)
+
+        QMetaObject.connectSlotsByName(JobInformationPage)
+    # setupUi
+
+    def retranslateUi(self, JobInformationPage):
+        JobInformationPage.setWindowTitle(QCoreApplication.translate("JobInformationPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("JobInformationPage", u"Job Information", None))
+        self.groupBox_2.setTitle("")
+        self.label_2.setText(QCoreApplication.translate("JobInformationPage", u"ID :", None))
+        self.id.setText(QCoreApplication.translate("JobInformationPage", u"-", None))
+        self.label_3.setText(QCoreApplication.translate("JobInformationPage", u"Name :", None))
+        self.label_4.setText(QCoreApplication.translate("JobInformationPage", u"Status :", None))
+        self.status.setText(QCoreApplication.translate("JobInformationPage", u"Not Running", None))
+        self.label_5.setText(QCoreApplication.translate("JobInformationPage", u"Started :", None))
+        self.createTime.setText(QCoreApplication.translate("JobInformationPage", u"-", None))
+        self.groupBox_3.setTitle("")
+        self.submitJob.setText(QCoreApplication.translate("JobInformationPage", u"Submit Job", None))
+        self.cancelJob.setText(QCoreApplication.translate("JobInformationPage", u"Cancel Job", None))
+#if QT_CONFIG(tooltip)
+        self.saveAndStopCalculation.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.saveAndStopCalculation.setText(QCoreApplication.translate("JobInformationPage", u"Save and Stop Calculation\n"
+"(Calculation stops after finishing current iteration)", None))
+#if QT_CONFIG(tooltip)
+        self.updateConfiguration.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.updateConfiguration.setStatusTip("")
+#endif // QT_CONFIG(statustip)
+#if QT_CONFIG(whatsthis)
+        self.updateConfiguration.setWhatsThis("")
+#endif // QT_CONFIG(whatsthis)
+        self.updateConfiguration.setText(QCoreApplication.translate("JobInformationPage", u"Update Configuration\n"
+"(Applied to the Calculation on the fly)", None))
+    # retranslateUi
+
@@ -1029,7 +1029,8 @@ class PODROMPage(ContentPage):
             self.tr(f"ROM Enhancement: running CFD case {caseName} ({enhanceIndex+1})")
         )
         runParams = {k: str(v) for k, v in paramsAll.items()}
-        await self._caseManager.batchRun([BatchCase(caseName, runParams)])
+        await self._caseManager.batchRun([BatchCase(caseName, runParams)],
+                                         parallel.getBatchPacking(), parallel.getBatchCoreBudget())
 
         progressDialog.setLabelText(
             self.tr(f"ROM Enhancement: evaluating CFD for {caseName} ({enhanceIndex+1})")
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'pod_rom_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QFrame, QGroupBox,
+    QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+    QPushButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QTableWidget, QTableWidgetItem, QTreeWidget, QTreeWidgetItem,
+    QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_PODROMPage(object):
+    def setupUi(self, PODROMPage):
+        if not PODROMPage.objectName():
+            PODROMPage.setObjectName(u"PODROMPage")
+        PODROMPage.resize(466, 815)
+        self.verticalLayout_4 = QVBoxLayout(PODROMPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(-1, -1, 9, -1)
+        self.title = QLabel(PODROMPage)
+        self.title.setObjectName(u"title")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.title)
+
+        self.line = QFrame(PODROMPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.scrollArea = QScrollArea(PODROMPage)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 448, 768))
+        self.verticalLayout_PODROMpage = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_PODROMpage.setObjectName(u"verticalLayout_PODROMpage")
+        self.verticalLayout_PODROMpage.setContentsMargins(0, 0, 10, 0)
+        self.groupBox_ROMBuildAndSnapshots = QGroupBox(self.scrollAreaWidgetContents)
+        self.groupBox_ROMBuildAndSnapshots.setObjectName(u"groupBox_ROMBuildAndSnapshots")
+        self.verticalLayout_ROMGroup = QVBoxLayout(self.groupBox_ROMBuildAndSnapshots)
+        self.verticalLayout_ROMGroup.setObjectName(u"verticalLayout_ROMGroup")
+        self.widgetBuildROM = QWidget(self.groupBox_ROMBuildAndSnapshots)
+        self.widgetBuildROM.setObjectName(u"widgetBuildROM")
+        self.horizontalLayoutBuildRom = QHBoxLayout(self.widgetBuildROM)
+        self.horizontalLayoutBuildRom.setObjectName(u"horizontalLayoutBuildRom")
+        self.horizontalLayoutBuildRom.setContentsMargins(-1, -1, 0, -1)
+        self.labelBuildROM = QLabel(self.widgetBuildROM)
+        self.labelBuildROM.setObjectName(u"labelBuildROM")
+
+        self.horizontalLayoutBuildRom.addWidget(self.labelBuildROM)
+
+        self.horizontalSpacer_31 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayoutBuildRom.addItem(self.horizontalSpacer_31)
+
+        self.buildROM = QPushButton(self.widgetBuildROM)
+        self.buildROM.setObjectName(u"buildROM")
+        self.buildROM.setStyleSheet(u"padding: 10px")
+
+        self.horizontalLayoutBuildRom.addWidget(self.buildROM)
+
+
+        self.verticalLayout_ROMGroup.addWidget(self.widgetBuildROM)
+
+        self.snapshotCases = QGroupBox(self.groupBox_ROMBuildAndSnapshots)
+        self.snapshotCases.setObjectName(u"snapshotCases")
+        self.verticalLayout_2 = QVBoxLayout(self.snapshotCases)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.snapshotCaseList = QTreeWidget(self.snapshotCases)
+        self.snapshotCaseList.headerItem().setText(0, "")
+        self.snapshotCaseList.setObjectName(u"snapshotCaseList")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.snapshotCaseList.sizePolicy().hasHeightForWidth())
+        self.snapshotCaseList.setSizePolicy(sizePolicy)
+        self.snapshotCaseList.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.snapshotCaseList.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.snapshotCaseList.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.snapshotCaseList.setAutoScroll(False)
+        self.snapshotCaseList.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.snapshotCaseList.setIndentation(0)
+        self.snapshotCaseList.setColumnCount(4)
+
+        self.verticalLayout_2.addWidget(self.snapshotCaseList)
+
+
+        self.verticalLayout_ROMGroup.addWidget(self.snapshotCases)
+
+
+        self.verticalLayout_PODROMpage.addWidget(self.groupBox_ROMBuildAndSnapshots)
+
+        self.groupBox_Reconstruction = QGroupBox(self.scrollAreaWidgetContents)
+        self.groupBox_Reconstruction.setObjectName(u"groupBox_Reconstruction")
+        self.verticalLayout_ReconstructGroup = QVBoxLayout(self.groupBox_Reconstruction)
+        self.verticalLayout_ReconstructGroup.setObjectName(u"verticalLayout_ReconstructGroup")
+        self.runningMode = QWidget(self.groupBox_Reconstruction)
+        self.runningMode.setObjectName(u"runningMode")
+        self.horizontalLayout_3 = QHBoxLayout(self.runningMode)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.nameCaseToReconstruct = QLineEdit(self.runningMode)
+        self.nameCaseToReconstruct.setObjectName(u"nameCaseToReconstruct")
+
+        self.horizontalLayout_3.addWidget(self.nameCaseToReconstruct)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_3)
+
+        self.ROMReconstruct = QPushButton(self.runningMode)
+        self.ROMReconstruct.setObjectName(u"ROMReconstruct")
+        self.ROMReconstruct.setStyleSheet(u"padding: 10px")
+
+        self.horizontalLayout_3.addWidget(self.ROMReconstruct)
+
+
+        self.verticalLayout_ReconstructGroup.addWidget(self.runningMode)
+
+
+        self.verticalLayout_PODROMpage.addWidget(self.groupBox_Reconstruction)
+
+        self.groupBox_Enhance = QGroupBox(self.scrollAreaWidgetContents)
+        self.groupBox_Enhance.setObjectName(u"groupBox_Enhance")
+        self.verticalLayout_EnhanceGroup = QVBoxLayout(self.groupBox_Enhance)
+        self.verticalLayout_EnhanceGroup.setObjectName(u"verticalLayout_EnhanceGroup")
+        self.enhanceWidget = QWidget(self.groupBox_Enhance)
+        self.enhanceWidget.setObjectName(u"enhanceWidget")
+        self.horizontalLayout_333 = QHBoxLayout(self.enhanceWidget)
+        self.horizontalLayout_333.setObjectName(u"horizontalLayout_333")
+        self.horizontalLayout_333.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_333 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_333.addItem(self.horizontalSpacer_333)
+
+        self.EvalNEnhanceROM = QPushButton(self.enhanceWidget)
+        self.EvalNEnhanceROM.setObjectName(u"EvalNEnhanceROM")
+        self.EvalNEnhanceROM.setStyleSheet(u"padding: 10px")
+
+        self.horizontalLayout_333.addWidget(self.EvalNEnhanceROM)
+
+
+        self.verticalLayout_EnhanceGroup.addWidget(self.enhanceWidget)
+
+        self.EnhanceReport = QWidget(self.groupBox_Enhance)
+        self.EnhanceReport.setObjectName(u"EnhanceReport")
+        self.verticalLayout_33 = QVBoxLayout(self.EnhanceReport)
+        self.verticalLayout_33.setObjectName(u"verticalLayout_33")
+        self.verticalLayout_33.setContentsMargins(-1, -1, 0, -1)
+        self.tblRomEval = QTableWidget(self.EnhanceReport)
+        self.tblRomEval.setObjectName(u"tblRomEval")
+        self.tblRomEval.setVisible(True)
+        self.tblRomEval.setColumnCount(3)
+        self.tblRomEval.setRowCount(6)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(1)
+        sizePolicy1.setHeightForWidth(self.tblRomEval.sizePolicy().hasHeightForWidth())
+        self.tblRomEval.setSizePolicy(sizePolicy1)
+        self.tblRomEval.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tblRomEval.setMinimumHeight(200)
+
+        self.verticalLayout_33.addWidget(self.tblRomEval)
+
+
+        self.verticalLayout_EnhanceGroup.addWidget(self.EnhanceReport)
+
+        self.enhanceWidget2 = QWidget(self.groupBox_Enhance)
+        self.enhanceWidget2.setObjectName(u"enhanceWidget2")
+        self.horizontalLayout_3333 = QHBoxLayout(self.enhanceWidget2)
+        self.horizontalLayout_3333.setObjectName(u"horizontalLayout_3333")
+        self.horizontalLayout_3333.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_3333 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3333.addItem(self.horizontalSpacer_3333)
+
+        self.exportEvalROM = QPushButton(self.enhanceWidget2)
+        self.exportEvalROM.setObjectName(u"exportEvalROM")
+        self.exportEvalROM.setStyleSheet(u"padding: 10px")
+
+        self.horizontalLayout_3333.addWidget(self.exportEvalROM)
+
+
+        self.verticalLayout_EnhanceGroup.addWidget(self.enhanceWidget2)
+
+
+        self.verticalLayout_PODROMpage.addWidget(self.groupBox_Enhance)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_PODROMpage.addItem(self.verticalSpacer)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_4.addWidget(self.scrollArea)
+
+
+        self.retranslateUi(PODROMPage)
+
+        QMetaObject.connectSlotsByName(PODROMPage)
+    # setupUi
+
+    def retranslateUi(self, PODROMPage):
+        PODROMPage.setWindowTitle(QCoreApplication.translate("PODROMPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("PODROMPage", u"Reduced Order Model", None))
+        self.groupBox_ROMBuildAndSnapshots.setTitle(QCoreApplication.translate("PODROMPage", u"Build Model", None))
+        self.labelBuildROM.setText(QCoreApplication.translate("PODROMPage", u"ROM Status", None))
+        self.buildROM.setText(QCoreApplication.translate("PODROMPage", u"Build ROM", None))
+        self.snapshotCases.setTitle(QCoreApplication.translate("PODROMPage", u"Snapshot Cases", None))
+        ___qtreewidgetitem = self.snapshotCaseList.headerItem()
+        ___qtreewidgetitem.setText(3, QCoreApplication.translate("PODROMPage", u"Result", None));
+        ___qtreewidgetitem.setText(2, QCoreApplication.translate("PODROMPage", u"Calc.", None));
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("PODROMPage", u"Case", None));
+        self.groupBox_Reconstruction.setTitle(QCoreApplication.translate("PODROMPage", u"Reconstruct from Model", None))
+        self.nameCaseToReconstruct.setText("")
+        self.nameCaseToReconstruct.setPlaceholderText(QCoreApplication.translate("PODROMPage", u"Case name", None))
+        self.ROMReconstruct.setText(QCoreApplication.translate("PODROMPage", u"Reconstruct case with ROM", None))
+        self.groupBox_Enhance.setTitle(QCoreApplication.translate("PODROMPage", u"Model Enhancement", None))
+        self.EvalNEnhanceROM.setText(QCoreApplication.translate("PODROMPage", u"Evaluate / Enhance ROM", None))
+        self.exportEvalROM.setText(QCoreApplication.translate("PODROMPage", u"Export", None))
+    # retranslateUi
+
@@ -28,8 +28,11 @@ from baramFlow.case_manager import CaseManager, BatchCase
 from baramFlow.coredb import coredb
 from baramFlow.coredb.coredb_reader import CoreDBReader
 from baramFlow.coredb.project import Project, SolverStatus
+from baramFlow.openfoam import parallel
+from baramFlow.openfoam.batch_scheduler import BatchPacking, defaultCoreBudget
 from baramFlow.openfoam.case_generator import CanceledException
 from baramFlow.openfoam.constant.turbulence_properties import TurbulenceProperties
+from baramFlow.openfoam.redistribution_task import DEFAULT_CONCURRENCY
 from baramFlow.openfoam.solver import SolverNotFound
 from baramFlow.openfoam.system.control_dict import ControlDict
 from baramFlow.openfoam.system.fv_options import FvOptions
@@ -71,6 +74,9 @@ class ProcessInformationPage(ContentPage):
 
         self._caseManager = CaseManager()
 
+        self._ui.batchPacking.addItem(self.tr('One'), BatchPacking.SEQUENTIAL)
+        self._ui.batchPacking.addItem(self.tr('As Many as the Core Budget Allows'), BatchPacking.PACKED)
+
         self._ui.calculation.setMinimumWidth(self.parent().width() - 30)
         self._connectSignalsSlots()
 
@@ -93,6 +99,7 @@ class ProcessInformationPage(ContentPage):
 
         self._statusChanged(self._caseManager.status(), None, False)
         self._updateUserParameters()
+        self._loadBatchScheduling()
 
     def _connectSignalsSlots(self):
         self._ui.startCalculation.clicked.connect(self._startCalculationClicked)
@@ -106,6 +113,9 @@ class ProcessInformationPage(ContentPage):
         self._ui.generateSamples.clicked.connect(self._openDoEDialog)
         self._ui.exportBatchCase.clicked.connect(self._openExportDialog)
         self._ui.importBatchCases.clicked.connect(self._openImportDialog)
+        self._ui.batchPacking.activated.connect(self._batchSchedulingChanged)
+        self._ui.batchCoreBudget.editingFinished.connect(self._batchSchedulingChanged)
+        self._ui.redistributionConcurrency.editingFinished.connect(self._redistributionConcurrencyChanged)
 
         self._project.solverStatusChanged.connect(self._statusChanged)
         self._caseManager.caseLoaded.connect(self._caseLoaded)
@@ -170,7 +180,8 @@ class ProcessInformationPage(ContentPage):
 
             try:
                 self._updateStatus(SolverStatus.RUNNING)
-                await self._caseManager.batchRun([BatchCase(name, parameters) for name, parameters in cases])
+                await self._caseManager.batchRun([BatchCase(name, parameters) for name, parameters in cases],
+                                                 parallel.getBatchPacking(), parallel.getBatchCoreBudget())
             except CanceledException:
                 return
             except Exception as ex:
@@ -189,7 +200,7 @@ class ProcessInformationPage(ContentPage):
             controlDict.writeAtomic()
 
         if self._runningMode == RunningMode.BATCH_RUNNING_MODE:
-            self._caseManager.stopBatchRun()
+            self._caseManager.stopBatchRun('noWriteNow')
 
         self._waitingStop()
 
@@ -203,7 +214,7 @@ class ProcessInformationPage(ContentPage):
             controlDict.writeAtomic()
 
         if self._runningMode == RunningMode.BATCH_RUNNING_MODE:
-            self._caseManager.stopBatchRun()
+            self._caseManager.stopBatchRun('writeNow')
 
         self._waitingStop()
 
@@ -350,6 +361,24 @@ class ProcessInformationPage(ContentPage):
             self._ui.batchCases.setEnabled(True)
             self._ui.runningMode.setEnabled(True)
 
+    def _loadBatchScheduling(self):
+        self._ui.batchPacking.setCurrentIndex(self._ui.batchPacking.findData(parallel.getBatchPacking()))
+
+        coreBudget = parallel.getBatchCoreBudget()
+        self._ui.batchCoreBudget.setValue(defaultCoreBudget() if coreBudget is None else coreBudget)
+        self._ui.batchCoreBudget.setEnabled(parallel.getBatchPacking() == BatchPacking.PACKED)
+
+        concurrency = parallel.getRedistributionConcurrency()
+        self._ui.redistributionConcurrency.setValue(DEFAULT_CONCURRENCY if concurrency is None else concurrency)
+
+    def _batchSchedulingChanged(self):
+        packing = self._ui.batchPacking.currentData()
+        parallel.setBatchScheduling(packing, self._ui.batchCoreBudget.value())
+        self._ui.batchCoreBudget.setEnabled(packing == BatchPacking.PACKED)
+
+    def _redistributionConcurrencyChanged(self):
+        parallel.setRedistributionConcurrency(self._ui.redistributionConcurrency.value())
+
     @qasync.asyncSlot()
     async def _caseLoaded(self, name):
         self._batchCaseList.setCurrentCase(name)
@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'process_information_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QFormLayout, QFrame, QGridLayout, QGroupBox,
+    QHBoxLayout, QHeaderView, QLabel, QPushButton,
+    QScrollArea, QSizePolicy, QSpacerItem, QSpinBox,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+
+from widgets.list_table import ListTable
+import resource_rc
+
+class Ui_ProcessInformationPage(object):
+    def setupUi(self, ProcessInformationPage):
+        if not ProcessInformationPage.objectName():
+            ProcessInformationPage.setObjectName(u"ProcessInformationPage")
+        ProcessInformationPage.resize(466, 815)
+        self.verticalLayout_4 = QVBoxLayout(ProcessInformationPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(-1, -1, 9, -1)
+        self.title = QLabel(ProcessInformationPage)
+        self.title.setObjectName(u"title")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.title.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.title)
+
+        self.line = QFrame(ProcessInformationPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.scrollArea = QScrollArea(ProcessInformationPage)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 448, 761))
+        self.verticalLayout_7 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 10, 0)
+        self.widget_3 = QWidget(self.scrollAreaWidgetContents)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.calculation = QWidget(self.widget_3)
+        self.calculation.setObjectName(u"calculation")
+        self.verticalLayout_9 = QVBoxLayout(self.calculation)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.verticalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_2 = QGroupBox(self.calculation)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(-1, 0, -1, -1)
+        self.transientConditions = QWidget(self.groupBox_2)
+        self.transientConditions.setObjectName(u"transientConditions")
+        self.timeConditionLayout = QFormLayout(self.transientConditions)
+        self.timeConditionLayout.setObjectName(u"timeConditionLayout")
+        self.timeConditionLayout.setContentsMargins(0, -1, 0, -1)
+        self.label_2 = QLabel(self.transientConditions)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setScaledContents(False)
+        self.label_2.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.timeConditionLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.id = QLabel(self.transientConditions)
+        self.id.setObjectName(u"id")
+        self.id.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(0, QFormLayout.FieldRole, self.id)
+
+        self.label_3 = QLabel(self.transientConditions)
+        self.label_3.setObjectName(u"label_3")
+
+        self.timeConditionLayout.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.createTime = QLabel(self.transientConditions)
+        self.createTime.setObjectName(u"createTime")
+        self.createTime.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(1, QFormLayout.FieldRole, self.createTime)
+
+        self.label_4 = QLabel(self.transientConditions)
+        self.label_4.setObjectName(u"label_4")
+
+        self.timeConditionLayout.setWidget(2, QFormLayout.LabelRole, self.label_4)
+
+        self.status = QLabel(self.transientConditions)
+        self.status.setObjectName(u"status")
+        self.status.setAlignment(Qt.AlignCenter)
+
+        self.timeConditionLayout.setWidget(2, QFormLayout.FieldRole, self.status)
+
+
+        self.verticalLayout_5.addWidget(self.transientConditions)
+
+
+        self.verticalLayout_9.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.calculation)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.startCalculation = QPushButton(self.groupBox_3)
+        self.startCalculation.setObjectName(u"startCalculation")
+        self.startCalculation.setMinimumSize(QSize(0, 60))
+
+        self.verticalLayout_6.addWidget(self.startCalculation)
+
+        self.cancelCalculation = QPushButton(self.groupBox_3)
+        self.cancelCalculation.setObjectName(u"cancelCalculation")
+        self.cancelCalculation.setMinimumSize(QSize(0, 60))
+
+        self.verticalLayout_6.addWidget(self.cancelCalculation)
+
+        self.runSolverOnlyWidget = QWidget(self.groupBox_3)
+        self.runSolverOnlyWidget.setObjectName(u"runSolverOnlyWidget")
+        self.horizontalLayout_5 = QHBoxLayout(self.runSolverOnlyWidget)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_5)
+
+        self.runSolverOnly = QCheckBox(self.runSolverOnlyWidget)
+        self.runSolverOnly.setObjectName(u"runSolverOnly")
+
+        self.horizontalLayout_5.addWidget(self.runSolverOnly)
+
+
+        self.verticalLayout_6.addWidget(self.runSolverOnlyWidget)
+
+        self.saveAndStopCalculation = QPushButton(self.groupBox_3)
+        self.saveAndStopCalculation.setObjectName(u"saveAndStopCalculation")
+        self.saveAndStopCalculation.setEnabled(True)
+        self.saveAndStopCalculation.setMinimumSize(QSize(0, 60))
+
+        self.verticalLayout_6.addWidget(self.saveAndStopCalculation)
+
+        self.updateConfiguration = QPushButton(self.groupBox_3)
+        self.updateConfiguration.setObjectName(u"updateConfiguration")
+        self.updateConfiguration.setEnabled(True)
+        self.updateConfiguration.setMinimumSize(QSize(0, 60))
+        self.updateConfiguration.setToolTipDuration(10)
+
+        self.verticalLayout_6.addWidget(self.updateConfiguration)
+
+        self.userParametersGroup = QGroupBox(self.groupBox_3)
+        self.userParametersGroup.setObjectName(u"userParametersGroup")
+        self.userParametersGroup.setStyleSheet(u"QGroupBox {spacing: 5px;}\n"
+"QGroupBox::indicator {width: 14px; height: 14px;}\n"
+"QGroupBox::indicator:unchecked {image: url(:/icons/chevron-forward.svg);}\n"
+"QGroupBox::indicator:checked {image: url(:icons/chevron-down.svg);}")
+        self.userParametersGroup.setCheckable(True)
+        self.verticalLayout = QVBoxLayout(self.userParametersGroup)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.userParameters = QWidget(self.userParametersGroup)
+        self.userParameters.setObjectName(u"userParameters")
+        self.verticalLayout_3 = QVBoxLayout(self.userParameters)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.userParameters)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(-1, 0, 0, 0)
+        self.horizontalSpacer = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.editUserParametrer = QPushButton(self.widget)
+        self.editUserParametrer.setObjectName(u"editUserParametrer")
+
+        self.horizontalLayout.addWidget(self.editUserParametrer)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+        self.userParameterList = ListTable(self.userParameters)
+        self.userParameterList.setObjectName(u"userParameterList")
+        self.userParameterList.setStyleSheet(u"")
+        self.userParameterList.setFrameShape(QFrame.Box)
+        self.userParameterList.setFrameShadow(QFrame.Raised)
+        self.gridLayout_3 = QGridLayout(self.userParameterList)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.label_47 = QLabel(self.userParameterList)
+        self.label_47.setObjectName(u"label_47")
+        font1 = QFont()
+        font1.setBold(True)
+        self.label_47.setFont(font1)
+
+        self.gridLayout_3.addWidget(self.label_47, 0, 1, 1, 1)
+
+        self.label_48 = QLabel(self.userParameterList)
+        self.label_48.setObjectName(u"label_48")
+        self.label_48.setFont(font1)
+
+        self.gridLayout_3.addWidget(self.label_48, 0, 0, 1, 1)
+
+        self.line_2 = QFrame(self.userParameterList)
+        self.line_2.setObjectName(u"line_2")
+        self.line_2.setFrameShape(QFrame.HLine)
+        self.line_2.setFrameShadow(QFrame.Sunken)
+
+        self.gridLayout_3.addWidget(self.line_2, 1, 0, 1, 2)
+
+
+        self.verticalLayout_3.addWidget(self.userParameterList)
+
+
+        self.verticalLayout.addWidget(self.userParameters)
+
+
+        self.verticalLayout_6.addWidget(self.userParametersGroup)
+
+
+        self.verticalLayout_9.addWidget(self.groupBox_3)
+
+
+        self.horizontalLayout_4.addWidget(self.calculation)
+
+        self.horizontalSpacer_4 = QSpacerItem(0, 20, QSizePolicy.MinimumExpanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_4)
+
+
+        self.verticalLayout_7.addWidget(self.widget_3)
+
+        self.batchCases = QGroupBox(self.scrollAreaWidgetContents)
+        self.batchCases.setObjectName(u"batchCases")
+        self.verticalLayout_2 = QVBoxLayout(self.batchCases)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_2 = QWidget(self.batchCases)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, 0, 0, 0)
+        self.horizontalSpacer_2 = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.generateSamples = QPushButton(self.widget_2)
+        self.generateSamples.setObjectName(u"generateSamples")
+
+        self.horizontalLayout_2.addWidget(self.generateSamples)
+
+        self.exportBatchCase = QPushButton(self.widget_2)
+        self.exportBatchCase.setObjectName(u"exportBatchCase")
+
+        self.horizontalLayout_2.addWidget(self.exportBatchCase)
+
+        self.importBatchCases = QPushButton(self.widget_2)
+        self.importBatchCases.setObjectName(u"importBatchCases")
+
+        self.horizontalLayout_2.addWidget(self.importBatchCases)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.batchCaseList = QTreeWidget(self.batchCases)
+        self.batchCaseList.headerItem().setText(0, "")
+        self.batchCaseList.setObjectName(u"batchCaseList")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.batchCaseList.sizePolicy().hasHeightForWidth())
+        self.batchCaseList.setSizePolicy(sizePolicy)
+        self.batchCaseList.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.batchCaseList.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.batchCaseList.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.batchCaseList.setAutoScroll(False)
+        self.batchCaseList.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.batchCaseList.setIndentation(0)
+        self.batchCaseList.setColumnCount(4)
+
+        self.verticalLayout_2.addWidget(self.batchCaseList)
+
+        self.batchScheduling = QWidget(self.batchCases)
+        self.batchScheduling.setObjectName(u"batchScheduling")
+        self.batchSchedulingLayout = QFormLayout(self.batchScheduling)
+        self.batchSchedulingLayout.setObjectName(u"batchSchedulingLayout")
+        self.batchSchedulingLayout.setContentsMargins(0, 0, 0, 0)
+        self.label_5 = QLabel(self.batchScheduling)
+        self.label_5.setObjectName(u"label_5")
+
+        self.batchSchedulingLayout.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.batchPacking = QComboBox(self.batchScheduling)
+        self.batchPacking.setObjectName(u"batchPacking")
+
+        self.batchSchedulingLayout.setWidget(0, QFormLayout.FieldRole, self.batchPacking)
+
+        self.label_6 = QLabel(self.batchScheduling)
+        self.label_6.setObjectName(u"label_6")
+
+        self.batchSchedulingLayout.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.batchCoreBudget = QSpinBox(self.batchScheduling)
+        self.batchCoreBudget.setObjectName(u"batchCoreBudget")
+        self.batchCoreBudget.setMinimum(1)
+        self.batchCoreBudget.setMaximum(100000)
+
+        self.batchSchedulingLayout.setWidget(1, QFormLayout.FieldRole, self.batchCoreBudget)
+
+        self.label_7 = QLabel(self.batchScheduling)
+        self.label_7.setObjectName(u"label_7")
+
+        self.batchSchedulingLayout.setWidget(2, QFormLayout.LabelRole, self.label_7)
+
+        self.redistributionConcurrency = QSpinBox(self.batchScheduling)
+        self.redistributionConcurrency.setObjectName(u"redistributionConcurrency")
+        self.redistributionConcurrency.setMinimum(1)
+        self.redistributionConcurrency.setMaximum(1000)
+
+        self.batchSchedulingLayout.setWidget(2, QFormLayout.FieldRole, self.redistributionConcurrency)
+
+
+        self.verticalLayout_2.addWidget(self.batchScheduling)
+
+
+        self.verticalLayout_7.addWidget(self.batchCases)
+
+        self.runningMode = QWidget(self.scrollAreaWidgetContents)
+        self.runningMode.setObjectName(u"runningMode")
+        self.horizontalLayout_3 = QHBoxLayout(self.runningMode)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_3)
+
+        self.toBatchMode = QPushButton(self.runningMode)
+        self.toBatchMode.setObjectName(u"toBatchMode")
+        self.toBatchMode.setStyleSheet(u"padding: 10px")
+
+        self.horizontalLayout_3.addWidget(self.toBatchMode)
+
+        self.toLiveMode = QPushButton(self.runningMode)
+        self.toLiveMode.setObjectName(u"toLiveMode")
+        self.toLiveMode.setStyleSheet(u"padding: 10px")
+
+        self.horizontalLayout_3.addWidget(self.toLiveMode)
+
+
+        self.verticalLayout_7.addWidget(self.runningMode)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_4.addWidget(self.scrollArea)
+
+
+        self.retranslateUi(ProcessInformationPage)
+
+        QMetaObject.connectSlotsByName(ProcessInformationPage)
+    # setupUi
+
+    def retranslateUi(self, ProcessInformationPage):
+        ProcessInformationPage.setWindowTitle(QCoreApplication.translate("ProcessInformationPage", u"Form", None))
+        self.title.setText(QCoreApplication.translate("ProcessInformationPage", u"Process Information", None))
+        self.groupBox_2.setTitle("")
+        self.label_2.setText(QCoreApplication.translate("ProcessInformationPage", u"ID :", None))
+        self.id.setText(QCoreApplication.translate("ProcessInformationPage", u"-", None))
+        self.label_3.setText(QCoreApplication.translate("ProcessInformationPage", u"Started : ", None))
+        self.createTime.setText(QCoreApplication.translate("ProcessInformationPage", u"-", None))
+        self.label_4.setText(QCoreApplication.translate("ProcessInformationPage", u"Status :", None))
+        self.status.setText(QCoreApplication.translate("ProcessInformationPage", u"Not Running", None))
+        self.groupBox_3.setTitle("")
+        self.startCalculation.setText(QCoreApplication.translate("ProcessInformationPage", u"Start Calculation", None))
+        self.cancelCalculation.setText(QCoreApplication.translate("ProcessInformationPage", u"Cancel Calculation\n"
+"Calculation stops as soon as possible", None))
+        self.runSolverOnly.setText(QCoreApplication.translate("ProcessInformationPage", u"Run Solver only", None))
+#if QT_CONFIG(tooltip)
+        self.saveAndStopCalculation.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.saveAndStopCalculation.setText(QCoreApplication.translate("ProcessInformationPage", u"Save and Stop Calculation\n"
+"(Calculation stops after finishing current iteration)", None))
+#if QT_CONFIG(tooltip)
+        self.updateConfiguration.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.updateConfiguration.setStatusTip("")
+#endif // QT_CONFIG(statustip)
+#if QT_CONFIG(whatsthis)
+        self.updateConfiguration.setWhatsThis("")
+#endif // QT_CONFIG(whatsthis)
+        self.updateConfiguration.setText(QCoreApplication.translate("ProcessInformationPage", u"Update Configuration\n"
+"(Applied to the Calculation on the fly)", None))
+        self.userParametersGroup.setTitle(QCoreApplication.translate("ProcessInformationPage", u"User Parameters", None))
+        self.editUserParametrer.setText(QCoreApplication.translate("ProcessInformationPage", u"Edit", None))
+        self.label_47.setText(QCoreApplication.translate("ProcessInformationPage", u"Default Value", None))
+        self.label_48.setText(QCoreApplication.translate("ProcessInformationPage", u"Name(count)", None))
+        self.batchCases.setTitle(QCoreApplication.translate("ProcessInformationPage", u"Batch Cases", None))
+        self.generateSamples.setText(QCoreApplication.translate("ProcessInformationPage", u"Generate", None))
+        self.exportBatchCase.setText(QCoreApplication.translate("ProcessInformationPage", u"Export", None))
+        self.importBatchCases.setText(QCoreApplication.translate("ProcessInformationPage", u"Import", None))
+        ___qtreewidgetitem = self.batchCaseList.headerItem()
+        ___qtreewidgetitem.setText(3, QCoreApplication.translate("ProcessInformationPage", u"Result", None));
+        ___qtreewidgetitem.setText(2, QCoreApplication.translate("ProcessInformationPage", u"Calc.", None));
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("ProcessInformationPage", u"Case", None));
+        self.label_5.setText(QCoreApplication.translate("ProcessInformationPage", u"Cases Run at a Time", None))
+        self.label_6.setText(QCoreApplication.translate("ProcessInformationPage", u"Core Budget", None))
+        self.label_7.setText(QCoreApplication.translate("ProcessInformationPage", u"Cases Redistributed at a Time", None))
+        self.toBatchMode.setText(QCoreApplication.translate("ProcessInformationPage", u"Switch to Batch Running Mode", None))
+        self.toLiveMode.setText(QCoreApplication.translate("ProcessInformationPage", u"Switch to Live Running Mode", None))
+    # retranslateUi
+
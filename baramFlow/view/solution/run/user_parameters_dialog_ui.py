@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'user_parameters_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QHeaderView,
+    QLabel, QPushButton, QSizePolicy, QSpacerItem,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+
+from widgets.flat_push_button import FlatPushButton
+import resource_rc
+
+class Ui_UserParametersDialog(object):
+    def setupUi(self, UserParametersDialog):
+        if not UserParametersDialog.objectName():
+            UserParametersDialog.setObjectName(u"UserParametersDialog")
+        UserParametersDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(UserParametersDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(UserParametersDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, -1, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.add = FlatPushButton(self.widget)
+        self.add.setObjectName(u"add")
+        icon = QIcon()
+        icon.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.add.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.add)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.label_2 = QLabel(UserParametersDialog)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.label_2)
+
+        self.parameters = QTreeWidget(UserParametersDialog)
+        self.parameters.headerItem().setText(2, "")
+        self.parameters.setObjectName(u"parameters")
+        self.parameters.setIndentation(0)
+        self.parameters.setColumnCount(3)
+        self.parameters.header().setVisible(True)
+        self.parameters.header().setStretchLastSection(False)
+
+        self.verticalLayout.addWidget(self.parameters)
+
+        self.widget_2 = QWidget(UserParametersDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, -1, 0, -1)
+        self.horizontalSpacer_2 = QSpacerItem(208, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(UserParametersDialog)
+
+        QMetaObject.connectSlotsByName(UserParametersDialog)
+    # setupUi
+
+    def retranslateUi(self, UserParametersDialog):
+        UserParametersDialog.setWindowTitle(QCoreApplication.translate("UserParametersDialog", u"Edit Parameters", None))
+        self.label.setText(QCoreApplication.translate("UserParametersDialog", u"Parameter Values", None))
+        self.add.setText("")
+        self.label_2.setText(QCoreApplication.translate("UserParametersDialog", u"Parameter names consist solely of uppercase letters, digits, and the '_' (underscore), and it cannot begin with a digit.\n"
+"Parameter name should be prefixed with a dollar sign ($) when it is used.", None))
+        ___qtreewidgetitem = self.parameters.headerItem()
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("UserParametersDialog", u"Value", None));
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("UserParametersDialog", u"Name", None));
+        self.ok.setText(QCoreApplication.translate("UserParametersDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("UserParametersDialog", u"Cacncel", None))
+    # retranslateUi
+
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'run_conditions_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractScrollArea, QApplication, QFormLayout, QFrame,
+    QGridLayout, QGroupBox, QLabel, QLineEdit,
+    QScrollArea, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from widgets.python_combo_box import PythonComboBox
+
+class Ui_RunConditionsPage(object):
+    def setupUi(self, RunConditionsPage):
+        if not RunConditionsPage.objectName():
+            RunConditionsPage.setObjectName(u"RunConditionsPage")
+        RunConditionsPage.resize(429, 720)
+        self.verticalLayout_4 = QVBoxLayout(RunConditionsPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.label_22 = QLabel(RunConditionsPage)
+        self.label_22.setObjectName(u"label_22")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.label_22.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.label_22)
+
+        self.line = QFrame(RunConditionsPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.scrollArea = QScrollArea(RunConditionsPage)
+        self.scrollArea.setObjectName(u"scrollArea")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.scrollArea.sizePolicy().hasHeightForWidth())
+        self.scrollArea.setSizePolicy(sizePolicy)
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 411, 666))
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.scrollAreaWidgetContents.sizePolicy().hasHeightForWidth())
+        self.scrollAreaWidgetContents.setSizePolicy(sizePolicy1)
+        self.verticalLayout_3 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 9, -1)
+        self.groupBox = QGroupBox(self.scrollAreaWidgetContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(-1, -1, -1, 0)
+        self.iterationConditions = QWidget(self.groupBox)
+        self.iterationConditions.setObjectName(u"iterationConditions")
+        self.iterationConditionsLayout = QFormLayout(self.iterationConditions)
+        self.iterationConditionsLayout.setObjectName(u"iterationConditionsLayout")
+        self.iterationConditionsLayout.setRowWrapPolicy(QFormLayout.WrapLongRows)
+        self.iterationConditionsLayout.setContentsMargins(0, 0, 0, -1)
+        self.label_2 = QLabel(self.iterationConditions)
+        self.label_2.setObjectName(u"label_2")
+
+        self.iterationConditionsLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.timeSteppingMethod = PythonComboBox(self.iterationConditions)
+        self.timeSteppingMethod.setObjectName(u"timeSteppingMethod")
+
+        self.iterationConditionsLayout.setWidget(1, QFormLayout.FieldRole, self.timeSteppingMethod)
+
+        self.label_3 = QLabel(self.iterationConditions)
+        self.label_3.setObjectName(u"label_3")
+
+        self.iterationConditionsLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.timeStepSize = QLineEdit(self.iterationConditions)
+        self.timeStepSize.setObjectName(u"timeStepSize")
+
+        self.iterationConditionsLayout.setWidget(2, QFormLayout.FieldRole, self.timeStepSize)
+
+        self.label_13 = QLabel(self.iterationConditions)
+        self.label_13.setObjectName(u"label_13")
+
+        self.iterationConditionsLayout.setWidget(3, QFormLayout.LabelRole, self.label_13)
+
+        self.maxCourantNumber = QLineEdit(self.iterationConditions)
+        self.maxCourantNumber.setObjectName(u"maxCourantNumber")
+
+        self.iterationConditionsLayout.setWidget(3, QFormLayout.FieldRole, self.maxCourantNumber)
+
+        self.label_14 = QLabel(self.iterationConditions)
+        self.label_14.setObjectName(u"label_14")
+
+        self.iterationConditionsLayout.setWidget(4, QFormLayout.LabelRole, self.label_14)
+
+        self.label_4 = QLabel(self.iterationConditions)
+        self.label_4.setObjectName(u"label_4")
+
+        self.iterationConditionsLayout.setWidget(6, QFormLayout.LabelRole, self.label_4)
+
+        self.endTime = QLineEdit(self.iterationConditions)
+        self.endTime.setObjectName(u"endTime")
+
+        self.iterationConditionsLayout.setWidget(6, QFormLayout.FieldRole, self.endTime)
+
+        self.maxCourantNumberForVoF = QLineEdit(self.iterationConditions)
+        self.maxCourantNumberForVoF.setObjectName(u"maxCourantNumberForVoF")
+
+        self.iterationConditionsLayout.setWidget(4, QFormLayout.FieldRole, self.maxCourantNumberForVoF)
+
+        self.label = QLabel(self.iterationConditions)
+        self.label.setObjectName(u"label")
+
+        self.iterationConditionsLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.numberOfIterations = QLineEdit(self.iterationConditions)
+        self.numberOfIterations.setObjectName(u"numberOfIterations")
+
+        self.iterationConditionsLayout.setWidget(0, QFormLayout.FieldRole, self.numberOfIterations)
+
+        self.label_15 = QLabel(self.iterationConditions)
+        self.label_15.setObjectName(u"label_15")
+
+        self.iterationConditionsLayout.setWidget(5, QFormLayout.LabelRole, self.label_15)
+
+        self.maxDi = QLineEdit(self.iterationConditions)
+        self.maxDi.setObjectName(u"maxDi")
+
+        self.iterationConditionsLayout.setWidget(5, QFormLayout.FieldRole, self.maxDi)
+
+
+        self.verticalLayout.addWidget(self.iterationConditions)
+
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.steadyReportInterval = QWidget(self.groupBox_2)
+        self.steadyReportInterval.setObjectName(u"steadyReportInterval")
+        self.formLayout = QFormLayout(self.steadyReportInterval)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setRowWrapPolicy(QFormLayout.WrapLongRows)
+        self.label_5 = QLabel(self.steadyReportInterval)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.reportIntervalIterationSteps = QLineEdit(self.steadyReportInterval)
+        self.reportIntervalIterationSteps.setObjectName(u"reportIntervalIterationSteps")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.reportIntervalIterationSteps)
+
+
+        self.verticalLayout_5.addWidget(self.steadyReportInterval)
+
+        self.transientReportInterval = QWidget(self.groupBox_2)
+        self.transientReportInterval.setObjectName(u"transientReportInterval")
+        self.formLayout_9 = QFormLayout(self.transientReportInterval)
+        self.formLayout_9.setObjectName(u"formLayout_9")
+        self.formLayout_9.setRowWrapPolicy(QFormLayout.WrapLongRows)
+        self.label_6 = QLabel(self.transientReportInterval)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.reportIntervalSeconds = QLineEdit(self.transientReportInterval)
+        self.reportIntervalSeconds.setObjectName(u"reportIntervalSeconds")
+
+        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.reportIntervalSeconds)
+
+
+        self.verticalLayout_5.addWidget(self.transientReportInterval)
+
+
+        self.verticalLayout.addWidget(self.groupBox_2)
+
+        self.retainOnlyTheMostRecentFiles = QGroupBox(self.groupBox)
+        self.retainOnlyTheMostRecentFiles.setObjectName(u"retainOnlyTheMostRecentFiles")
+        self.retainOnlyTheMostRecentFiles.setCheckable(True)
+        self.formLayout_2 = QFormLayout(self.retainOnlyTheMostRecentFiles)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setRowWrapPolicy(QFormLayout.WrapLongRows)
+        self.label_7 = QLabel(self.retainOnlyTheMostRecentFiles)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_7)
+
+        self.maximumNumberODataFiles = QLineEdit(self.retainOnlyTheMostRecentFiles)
+        self.maximumNumberODataFiles.setObjectName(u"maximumNumberODataFiles")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.maximumNumberODataFiles)
+
+
+        self.verticalLayout.addWidget(self.retainOnlyTheMostRecentFiles)
+
+        self.widget = QWidget(self.groupBox)
+        self.widget.setObjectName(u"widget")
+        self.gridLayout = QGridLayout(self.widget)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setVerticalSpacing(9)
+        self.gridLayout.setContentsMargins(0, -1, 0, -1)
+        self.label_8 = QLabel(self.widget)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout.addWidget(self.label_8, 0, 0, 1, 1)
+
+        self.dataWriteFormat = PythonComboBox(self.widget)
+        self.dataWriteFormat.setObjectName(u"dataWriteFormat")
+
+        self.gridLayout.addWidget(self.dataWriteFormat, 0, 1, 1, 1)
+
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout.addWidget(self.label_9, 1, 0, 1, 1)
+
+        self.dataWritePrecision = QLineEdit(self.widget)
+        self.dataWritePrecision.setObjectName(u"dataWritePrecision")
+
+        self.gridLayout.addWidget(self.dataWritePrecision, 1, 1, 1, 1)
+
+        self.label_10 = QLabel(self.widget)
+        self.label_10.setObjectName(u"label_10")
+
+        self.gridLayout.addWidget(self.label_10, 2, 0, 1, 1)
+
+        self.timePrecision = QLineEdit(self.widget)
+        self.timePrecision.setObjectName(u"timePrecision")
+
+        self.gridLayout.addWidget(self.timePrecision, 2, 1, 1, 1)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_4.addWidget(self.scrollArea)
+
+        QWidget.setTabOrder(self.timeSteppingMethod, self.timeStepSize)
+        QWidget.setTabOrder(self.timeStepSize, self.maxCourantNumber)
+        QWidget.setTabOrder(self.maxCourantNumber, self.maxCourantNumberForVoF)
+        QWidget.setTabOrder(self.maxCourantNumberForVoF, self.endTime)
+        QWidget.setTabOrder(self.endTime, self.reportIntervalIterationSteps)
+        QWidget.setTabOrder(self.reportIntervalIterationSteps, self.reportIntervalSeconds)
+        QWidget.setTabOrder(self.reportIntervalSeconds, self.retainOnlyTheMostRecentFiles)
+        QWidget.setTabOrder(self.retainOnlyTheMostRecentFiles, self.maximumNumberODataFiles)
+        QWidget.setTabOrder(self.maximumNumberODataFiles, self.dataWriteFormat)
+        QWidget.setTabOrder(self.dataWriteFormat, self.dataWritePrecision)
+        QWidget.setTabOrder(self.dataWritePrecision, self.timePrecision)
+        QWidget.setTabOrder(self.timePrecision, self.scrollArea)
+
+        self.retranslateUi(RunConditionsPage)
+
+        QMetaObject.connectSlotsByName(RunConditionsPage)
+    # setupUi
+
+    def retranslateUi(self, RunConditionsPage):
+        RunConditionsPage.setWindowTitle(QCoreApplication.translate("RunConditionsPage", u"Form", None))
+        self.label_22.setText(QCoreApplication.translate("RunConditionsPage", u"Run Conditions", None))
+        self.groupBox.setTitle(QCoreApplication.translate("RunConditionsPage", u"Run Conditions", None))
+        self.label_2.setText(QCoreApplication.translate("RunConditionsPage", u"Time Stepping Method", None))
+        self.label_3.setText(QCoreApplication.translate("RunConditionsPage", u"Time Step Size", None))
+        self.label_13.setText(QCoreApplication.translate("RunConditionsPage", u"Courant Number", None))
+        self.label_14.setText(QCoreApplication.translate("RunConditionsPage", u"Courant Number For VoF", None))
+        self.label_4.setText(QCoreApplication.translate("RunConditionsPage", u"End Time", None))
+        self.label.setText(QCoreApplication.translate("RunConditionsPage", u"Number of Iterations", None))
+        self.label_15.setText(QCoreApplication.translate("RunConditionsPage", u"Maximum Diffusion Number", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("RunConditionsPage", u"Save Interval", None))
+        self.label_5.setText(QCoreApplication.translate("RunConditionsPage", u"Every (Iteration Steps)", None))
+        self.label_6.setText(QCoreApplication.translate("RunConditionsPage", u"Every (Seconds)", None))
+        self.retainOnlyTheMostRecentFiles.setTitle(QCoreApplication.translate("RunConditionsPage", u"Retain Only the Most Recent Files", None))
+        self.label_7.setText(QCoreApplication.translate("RunConditionsPage", u"Maximum Number of Data Files", None))
+        self.label_8.setText(QCoreApplication.translate("RunConditionsPage", u"Data Write Format", None))
+        self.label_9.setText(QCoreApplication.translate("RunConditionsPage", u"Data Write Precision\n"
+"(Number of Significant Figures)", None))
+        self.label_10.setText(QCoreApplication.translate("RunConditionsPage", u"Time Precision\n"
+"(Number of Significant Figures)", None))
+    # retranslateUi
+
@@ -17,10 +17,13 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QMenu
 from pyqtgraph import AxisItem
 from pyqtgraph.graphicsItems.PlotDataItem import PlotDataItem
 
+from libbaram.time_series import TimeSeriesBuffer, MinMaxLevels
 from widgets.simple_sheet_dialog import SimpleSheetDialog
 
 SIDE_MARGIN = 0.05  # 5% margin between line end and right axis
 
+DEFAULT_PLOT_WIDTH = 1000  # Number of buckets for level-of-detail when the plot is not laid out yet
+
 COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
 
 
@@ -42,7 +45,10 @@ class ChartWidget(QWidget):
     def __init__(self, width=10):
         super().__init__()
 
-        self._data = None
+        # Full resolution data is kept for "Export Data" only.
+        # Lines are drawn with O(width) points picked from min/max summaries of the visible rows.
+        self._series: typing.Dict[str, TimeSeriesBuffer] = {}
+        self._levels: typing.Dict[str, MinMaxLevels] = {}
 
         self._chart = None
         self._title = None
@@ -65,11 +71,10 @@ class ChartWidget(QWidget):
         self._chart.setLogMode(False, True)
 
     def fitChart(self):
-        if self._data is None:
+        if not self._hasData():
             return
 
-        minX = float(self._data.first_valid_index())
-        maxX = float(self._data.last_valid_index())
+        minX, maxX = self._timeRange()
 
         if maxX <= minX:
             maxX = minX + 1
@@ -82,28 +87,40 @@ class ChartWidget(QWidget):
         self._updateChart(1.0)
 
     def dataAppended(self, data: pd.DataFrame):
-        if self._data is None:
-            self._data = data
-        else:
-            self._data = pd.concat([self._data[self._data.index < data.first_valid_index()], data])
+        """Append rows to the lines of the columns in "data"
+
+        Each line keeps its own history, so rows of a line from the first time in "data" on are replaced
+        while other lines are left untouched.
+        """
+        if data.empty:
+            return
+
+        times = data.index.to_numpy(dtype=np.float64)
+        for c in data.columns.values.tolist():
+            if c not in self._series:
+                self._series[c] = TimeSeriesBuffer()
+                self._levels[c] = MinMaxLevels()
 
-        self._drawLines()
+            series = self._series[c]
+            series.append(times, [c], data[[c]].to_numpy(dtype=np.float64, na_value=np.nan))
+            self._levels[c].update(series.column(c), series.takeModifiedFrom())
 
-    def _drawLines(self):
-        times = self._data.index.to_numpy()
+        self._drawLines(data.columns.values.tolist())
 
-        for c in self._data.columns.values.tolist():
+    def _drawLines(self, columns):
+        for c in columns:
             if c not in self._lines:
                 self._lines[c] = self._chart.plot(
-                    times, self._data[c].to_numpy(), name=c, pen={'color': COLORS[len(self._lines) % 10], 'width': 2})
-            else:
-                self._lines[c].setData(times, self._data[c].to_numpy())
+                    name=c, pen={'color': COLORS[len(self._lines) % 10], 'width': 2}, connect='finite')
 
         self._updateChart(1.0)
 
     def dataUpdated(self, data: pd.DataFrame):
-        self._data = data
-        self._drawLines()
+        for c, series in self._series.items():
+            series.clear()
+            self._levels[c].update(series.column(c), series.takeModifiedFrom())
+
+        self.dataAppended(data)
 
     def _onScroll(self, ev: QWheelEvent):
         angle = ev.angleDelta().y() / 8.0
@@ -113,10 +130,11 @@ class ChartWidget(QWidget):
 
     @qasync.asyncSlot()
     async def _onExportData(self):
-        if self._data is None or self._data.empty:
+        if not self._hasData():
             return
 
-        dialog = SimpleSheetDialog(self, ['Time step'] + self._data.columns.tolist(), self._data.reset_index().values.tolist(), readOnly=False)
+        data = self._dataFrame()
+        dialog = SimpleSheetDialog(self, ['Time step'] + data.columns.tolist(), data.reset_index().values.tolist(), readOnly=False)
         try:
             await dialog.show()
         except asyncio.exceptions.CancelledError:
@@ -145,14 +163,54 @@ class ChartWidget(QWidget):
 
         menu.exec(self._chart.mapToGlobal(position))
 
+    def _hasData(self):
+        return any(len(series) > 0 for series in self._series.values())
+
+    def _timeRange(self):
+        minTime = min(series.firstTime() for series in self._series.values() if len(series) > 0)
+        maxTime = max(series.lastTime() for series in self._series.values() if len(series) > 0)
+
+        return minTime, maxTime
+
+    def _plotLines(self, left, right, minX, maxX):
+        """Set level-of-detail points of the lines between "left" and "right" and return the range of values
+
+        The range of values is taken from the points between "minX" and "maxX".
+        """
+        width = int(self._chart.getPlotItem().getViewBox().width()) or DEFAULT_PLOT_WIDTH
+
+        minY = np.nan
+        maxY = np.nan
+        for c, line in self._lines.items():
+            series = self._series[c]
+            times = series.times
+            values = series.column(c)
+
+            # One more row at each side to draw lines to the edges of the plot
+            start = max(int(np.searchsorted(times, left, side='left')) - 1, 0)
+            end = min(int(np.searchsorted(times, right, side='right')) + 1, len(times))
+
+            rows = self._levels[c].rows(values, start, end, width)
+            x = times[rows]
+            y = values[rows]
+            line.setData(x, y)
+
+            y = y[(x >= minX) & (x <= maxX) & np.isfinite(y)]
+            if y.size > 0:
+                minY = np.fmin(minY, y.min())
+                maxY = np.fmax(maxY, y.max())
+
+        return minY, maxY
+
+    def _dataFrame(self) -> pd.DataFrame:
+        data = pd.concat([series.toDataFrame() for series in self._series.values() if len(series) > 0], axis=1)
+        return data.sort_index()
+
     def _updateChart(self, scale: float):
-        if self._data is None:
+        if not self._hasData():
             return
 
-        data = self._data
-
-        minTime = float(data.first_valid_index())
-        maxTime = float(data.last_valid_index())
+        minTime, maxTime = self._timeRange()
 
         dataWidth = maxTime - minTime
 
@@ -174,9 +232,10 @@ class ChartWidget(QWidget):
         left = minX - margin
         right = maxX + margin
 
-        d = data[(data.index >= minX) & (data.index <= maxX)]
-        minY = d.min().min()
-        maxY = d.max().max()
+        minY, maxY = self._plotLines(left, right, minX, maxX)
+        if np.isnan(minY):  # No value to show in the window
+            self._chart.setXRange(left, right)
+            return
 
         if self._logScale:
             # value cannot be "0" or close to "0" in log scale chart
@@ -209,7 +268,8 @@ class ChartWidget(QWidget):
             self.layout().removeWidget(self._chart)
             self._chart.deleteLater()
 
-        self._data = None
+        self._series = {}
+        self._levels = {}
         self._lines = {}
 
         self._chart = WheelPlotWidget(enableMenu=False, background='w')
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'multi_selector_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractItemView, QApplication, QDialog,
+    QDialogButtonBox, QHBoxLayout, QLineEdit, QListWidget,
+    QListWidgetItem, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_MultiSelectorDialog(object):
+    def setupUi(self, MultiSelectorDialog):
+        if not MultiSelectorDialog.objectName():
+            MultiSelectorDialog.setObjectName(u"MultiSelectorDialog")
+        MultiSelectorDialog.resize(670, 304)
+        self.verticalLayout_3 = QVBoxLayout(MultiSelectorDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget_3 = QWidget(MultiSelectorDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout = QHBoxLayout(self.widget_3)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.widget = QWidget(self.widget_3)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.filter = QLineEdit(self.widget)
+        self.filter.setObjectName(u"filter")
+
+        self.verticalLayout.addWidget(self.filter)
+
+        self.list = QListWidget(self.widget)
+        self.list.setObjectName(u"list")
+        self.list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+        self.verticalLayout.addWidget(self.list)
+
+
+        self.horizontalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(self.widget_3)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_2.setSpacing(20)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalSpacer = QSpacerItem(20, 53, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.add = QPushButton(self.widget_2)
+        self.add.setObjectName(u"add")
+
+        self.verticalLayout_2.addWidget(self.add)
+
+        self.remove = QPushButton(self.widget_2)
+        self.remove.setObjectName(u"remove")
+
+        self.verticalLayout_2.addWidget(self.remove)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 53, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout.addWidget(self.widget_2)
+
+        self.selectedList = QListWidget(self.widget_3)
+        self.selectedList.setObjectName(u"selectedList")
+        self.selectedList.setSelectionMode(QAbstractItemView.ExtendedSelection)
+
+        self.horizontalLayout.addWidget(self.selectedList)
+
+
+        self.verticalLayout_3.addWidget(self.widget_3)
+
+        self.buttonBox = QDialogButtonBox(MultiSelectorDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_3.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(MultiSelectorDialog)
+        self.buttonBox.accepted.connect(MultiSelectorDialog.accept)
+        self.buttonBox.rejected.connect(MultiSelectorDialog.reject)
+
+        QMetaObject.connectSlotsByName(MultiSelectorDialog)
+    # setupUi
+
+    def retranslateUi(self, MultiSelectorDialog):
+        MultiSelectorDialog.setWindowTitle(QCoreApplication.translate("MultiSelectorDialog", u"Dialog", None))
+        self.add.setText(QCoreApplication.translate("MultiSelectorDialog", u"Add >>", None))
+        self.remove.setText(QCoreApplication.translate("MultiSelectorDialog", u"<< Remove", None))
+    # retranslateUi
+
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'new_project_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_NewProjectDialog(object):
+    def setupUi(self, NewProjectDialog):
+        if not NewProjectDialog.objectName():
+            NewProjectDialog.setObjectName(u"NewProjectDialog")
+        NewProjectDialog.resize(400, 140)
+        self.verticalLayout = QVBoxLayout(NewProjectDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(NewProjectDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, -1, 0, -1)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.projectName = QLineEdit(self.widget)
+        self.projectName.setObjectName(u"projectName")
+        self.projectName.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.projectName)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.projectLocation = QLineEdit(self.widget_2)
+        self.projectLocation.setObjectName(u"projectLocation")
+        self.projectLocation.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.projectLocation)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+        self.select.setMinimumSize(QSize(20, 0))
+        self.select.setMaximumSize(QSize(20, 16777215))
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.widget_2)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.validationMessage = QLabel(NewProjectDialog)
+        self.validationMessage.setObjectName(u"validationMessage")
+        self.validationMessage.setStyleSheet(u"color: red")
+
+        self.verticalLayout.addWidget(self.validationMessage)
+
+        self.buttonBox = QDialogButtonBox(NewProjectDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(NewProjectDialog)
+        self.buttonBox.accepted.connect(NewProjectDialog.accept)
+        self.buttonBox.rejected.connect(NewProjectDialog.reject)
+
+        QMetaObject.connectSlotsByName(NewProjectDialog)
+    # setupUi
+
+    def retranslateUi(self, NewProjectDialog):
+        NewProjectDialog.setWindowTitle(QCoreApplication.translate("NewProjectDialog", u"New Project", None))
+        self.label.setText(QCoreApplication.translate("NewProjectDialog", u"Project Name", None))
+        self.label_2.setText(QCoreApplication.translate("NewProjectDialog", u"Project Location", None))
+        self.select.setText(QCoreApplication.translate("NewProjectDialog", u"...", None))
+        self.validationMessage.setText("")
+    # retranslateUi
+
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'number_input_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QFrame, QHBoxLayout, QPushButton,
+    QScrollArea, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+import resource_rc
+
+class Ui_NumberInputDialog(object):
+    def setupUi(self, NumberInputDialog):
+        if not NumberInputDialog.objectName():
+            NumberInputDialog.setObjectName(u"NumberInputDialog")
+        NumberInputDialog.resize(279, 300)
+        NumberInputDialog.setMinimumSize(QSize(0, 300))
+        self.verticalLayout = QVBoxLayout(NumberInputDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.editArea = QScrollArea(NumberInputDialog)
+        self.editArea.setObjectName(u"editArea")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.editArea.sizePolicy().hasHeightForWidth())
+        self.editArea.setSizePolicy(sizePolicy)
+        self.editArea.setFrameShape(QFrame.Shape.NoFrame)
+        self.editArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.editArea.setWidgetResizable(True)
+        self.editArea.setAlignment(Qt.AlignmentFlag.AlignLeading|Qt.AlignmentFlag.AlignLeft|Qt.AlignmentFlag.AlignTop)
+        self.polynomialWidget = QWidget()
+        self.polynomialWidget.setObjectName(u"polynomialWidget")
+        self.polynomialWidget.setGeometry(QRect(0, 0, 261, 186))
+        self.formLayout = QFormLayout(self.polynomialWidget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.editArea.setWidget(self.polynomialWidget)
+
+        self.verticalLayout.addWidget(self.editArea)
+
+        self.widget = QWidget(NumberInputDialog)
+        self.widget.setObjectName(u"widget")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy1)
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.add = QPushButton(self.widget)
+        self.add.setObjectName(u"add")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.add.sizePolicy().hasHeightForWidth())
+        self.add.setSizePolicy(sizePolicy2)
+        icon = QIcon()
+        icon.addFile(u":/icons-white/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.add.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.add)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.widget_2 = QWidget(NumberInputDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        sizePolicy1.setHeightForWidth(self.widget_2.sizePolicy().hasHeightForWidth())
+        self.widget_2.setSizePolicy(sizePolicy1)
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.file = QPushButton(self.widget_2)
+        self.file.setObjectName(u"file")
+
+        self.horizontalLayout_2.addWidget(self.file)
+
+        self.buttonBox = QDialogButtonBox(self.widget_2)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.StandardButton.Cancel|QDialogButtonBox.StandardButton.Ok)
+
+        self.horizontalLayout_2.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(NumberInputDialog)
+        self.buttonBox.accepted.connect(NumberInputDialog.accept)
+        self.buttonBox.rejected.connect(NumberInputDialog.reject)
+
+        QMetaObject.connectSlotsByName(NumberInputDialog)
+    # setupUi
+
+    def retranslateUi(self, NumberInputDialog):
+        NumberInputDialog.setWindowTitle(QCoreApplication.translate("NumberInputDialog", u"Dialog", None))
+        self.add.setText("")
+        self.file.setText(QCoreApplication.translate("NumberInputDialog", u"File", None))
+    # retranslateUi
+
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'piecewise_linear_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QHeaderView, QSizePolicy, QSpacerItem,
+    QSplitter, QTableWidgetItem, QVBoxLayout, QWidget)
+
+from pyqtgraph import PlotWidget
+from widgets.simple_excel_sheet import SimpleExcelSheet
+import resource_rc
+
+class Ui_PiecewiseLinearDialog(object):
+    def setupUi(self, PiecewiseLinearDialog):
+        if not PiecewiseLinearDialog.objectName():
+            PiecewiseLinearDialog.setObjectName(u"PiecewiseLinearDialog")
+        PiecewiseLinearDialog.resize(442, 586)
+        PiecewiseLinearDialog.setMinimumSize(QSize(0, 300))
+        self.verticalLayout = QVBoxLayout(PiecewiseLinearDialog)
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(20, 20, 20, 20)
+        self.splitter = QSplitter(PiecewiseLinearDialog)
+        self.splitter.setObjectName(u"splitter")
+        self.splitter.setOrientation(Qt.Vertical)
+        self.splitter.setHandleWidth(10)
+        self.splitter.setChildrenCollapsible(True)
+        self.widget_1 = QWidget(self.splitter)
+        self.widget_1.setObjectName(u"widget_1")
+        self.widget_1.setAutoFillBackground(False)
+        self.widget_1.setStyleSheet(u"background-color: white;")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_1)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(20, 20, 50, 20)
+        self.plotWidget = PlotWidget(self.widget_1)
+        self.plotWidget.setObjectName(u"plotWidget")
+
+        self.verticalLayout_3.addWidget(self.plotWidget)
+
+        self.splitter.addWidget(self.widget_1)
+        self.tableWidget = SimpleExcelSheet(self.splitter)
+        self.tableWidget.setObjectName(u"tableWidget")
+        self.splitter.addWidget(self.tableWidget)
+
+        self.verticalLayout.addWidget(self.splitter)
+
+        self.widget_2 = QWidget(PiecewiseLinearDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget_2.sizePolicy().hasHeightForWidth())
+        self.widget_2.setSizePolicy(sizePolicy)
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.buttonBox = QDialogButtonBox(self.widget_2)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.horizontalLayout_2.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(PiecewiseLinearDialog)
+        self.buttonBox.accepted.connect(PiecewiseLinearDialog.accept)
+        self.buttonBox.rejected.connect(PiecewiseLinearDialog.reject)
+
+        QMetaObject.connectSlotsByName(PiecewiseLinearDialog)
+    # setupUi
+
+    def retranslateUi(self, PiecewiseLinearDialog):
+        PiecewiseLinearDialog.setWindowTitle(QCoreApplication.translate("PiecewiseLinearDialog", u"Piecewise Linear Parameters", None))
+    # retranslateUi
+
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'project_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QPushButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_ProjectWidget(object):
+    def setupUi(self, ProjectWidget):
+        if not ProjectWidget.objectName():
+            ProjectWidget.setObjectName(u"ProjectWidget")
+        ProjectWidget.resize(400, 57)
+        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(ProjectWidget.sizePolicy().hasHeightForWidth())
+        ProjectWidget.setSizePolicy(sizePolicy)
+        self.horizontalLayout_2 = QHBoxLayout(ProjectWidget)
+        self.horizontalLayout_2.setSpacing(6)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.widget_3 = QWidget(ProjectWidget)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_3.setSpacing(6)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(5, 5, 5, 5)
+        self.tag = QLabel(self.widget_3)
+        self.tag.setObjectName(u"tag")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.tag.sizePolicy().hasHeightForWidth())
+        self.tag.setSizePolicy(sizePolicy1)
+        self.tag.setMinimumSize(QSize(40, 40))
+        self.tag.setMaximumSize(QSize(40, 40))
+        self.tag.setStyleSheet(u"background-color:skyblue; margin:2")
+
+        self.horizontalLayout_3.addWidget(self.tag)
+
+        self.widget = QWidget(self.widget_3)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout = QVBoxLayout(self.widget)
+        self.verticalLayout.setSpacing(5)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.widget_2 = QWidget(self.widget)
+        self.widget_2.setObjectName(u"widget_2")
+        sizePolicy.setHeightForWidth(self.widget_2.sizePolicy().hasHeightForWidth())
+        self.widget_2.setSizePolicy(sizePolicy)
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setSpacing(16)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 9, 0)
+        self.name = QLabel(self.widget_2)
+        self.name.setObjectName(u"name")
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        self.name.setFont(font)
+        self.name.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignTop)
+
+        self.horizontalLayout.addWidget(self.name)
+
+        self.status = QLabel(self.widget_2)
+        self.status.setObjectName(u"status")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.status.sizePolicy().hasHeightForWidth())
+        self.status.setSizePolicy(sizePolicy2)
+        self.status.setStyleSheet(u"QLabel::enabled\n"
+"{\n"
+"    color:	grey;\n"
+"}")
+        self.status.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignTop)
+
+        self.horizontalLayout.addWidget(self.status)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.path = QLabel(self.widget)
+        self.path.setObjectName(u"path")
+        sizePolicy.setHeightForWidth(self.path.sizePolicy().hasHeightForWidth())
+        self.path.setSizePolicy(sizePolicy)
+        font1 = QFont()
+        font1.setPointSize(10)
+        font1.setItalic(False)
+        self.path.setFont(font1)
+        self.path.setStyleSheet(u"QLabel::enabled\n"
+"{\n"
+"    color:	boldgrey;\n"
+"}\n"
+"")
+        self.path.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignTop)
+
+        self.verticalLayout.addWidget(self.path)
+
+
+        self.horizontalLayout_3.addWidget(self.widget)
+
+        self.remove = QPushButton(self.widget_3)
+        self.remove.setObjectName(u"remove")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.remove.sizePolicy().hasHeightForWidth())
+        self.remove.setSizePolicy(sizePolicy3)
+        self.remove.setMinimumSize(QSize(24, 24))
+        self.remove.setMaximumSize(QSize(24, 24))
+        self.remove.setStyleSheet(u"QPushButton\n"
+"{\n"
+"	border: none;\n"
+"	border-width: 0;\n"
+"}\n"
+"QPushButton:hover\n"
+"{\n"
+"	background-color: rgba(0, 0, 0, 60);\n"
+"}")
+
+        self.horizontalLayout_3.addWidget(self.remove)
+
+
+        self.horizontalLayout_2.addWidget(self.widget_3)
+
+
+        self.retranslateUi(ProjectWidget)
+
+        QMetaObject.connectSlotsByName(ProjectWidget)
+    # setupUi
+
+    def retranslateUi(self, ProjectWidget):
+        ProjectWidget.setWindowTitle(QCoreApplication.translate("ProjectWidget", u"Form", None))
+        self.tag.setText("")
+        self.name.setText(QCoreApplication.translate("ProjectWidget", u"TextLabel", None))
+        self.status.setText("")
+        self.path.setText(QCoreApplication.translate("ProjectWidget", u"TextLabel", None))
+        self.remove.setText(QCoreApplication.translate("ProjectWidget", u"\u2715", None))
+    # retranslateUi
+
@@ -1,18 +1,24 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
 
 from libbaram.simple_db.simple_db import SimpleDB
 
 from .configurations_schema import schema
-from .file_db import writeConfigurations, readConfigurations, FileGroup, newFiles
+from .file_db import writeConfigurations, readConfigurations, FileGroup, newFiles, StoredPolyData
 from .migrate import migrate
 
 
 FILE_NAME = 'configurations.h5'
 DB_KEY = 'configurations'
 
+MAX_PREFETCH_WORKERS = 4
+
 
 class Configurations(SimpleDB):
     _geometryNextKey = 0
@@ -22,6 +28,8 @@ class Configurations(SimpleDB):
 
         self._path = None
         self._files = newFiles()
+        self._updatedGeometries = set()  # Keys of geometries changed since the last save
+        self._prefetcher = None
 
         self._defaults = None
 
@@ -31,15 +39,20 @@ class Configurations(SimpleDB):
         self._save()
 
     def load(self, path):
+        self._stopPrefetch()
+
         self._path = path / FILE_NAME
         data, files, maxIds = readConfigurations(self._path)
         self._content = self.validateData(migrate(yaml.full_load(data)))
         self._files = files
+        self._updatedGeometries = set()
         Configurations._geometryNextKey = maxIds[FileGroup.GEOMETRY_POLY_DATA.value]
 
+        self._startPrefetch()
+
     def save(self):
         if self.isModified():
-            self._save()
+            self._save(incremental=True)
 
     def saveAs(self, path):
         self._path = path / FILE_NAME
@@ -50,23 +63,53 @@ class Configurations(SimpleDB):
         key = f'Geometry{Configurations._geometryNextKey}'
 
         self._files['geometry'][key] = pd
+        self._updatedGeometries.add(key)
         self._modified = True
 
         return key
 
     def removeGeometryPolyData(self, key):
         self._files['geometry'][key] = None
+        self._updatedGeometries.add(key)
 
     def geometryPolyData(self, key):
-        return self._files['geometry'][key]
+        pd = self._files['geometry'][key]
+        if isinstance(pd, StoredPolyData):
+            pd = pd.polyData()
+            self._files['geometry'][key] = pd
+
+        return pd
+
+    async def geometryPolyDataAsync(self, key):
+        """Returns the poly data of the geometry, decoding it in a thread if it has not been decoded yet"""
+        pd = self._files['geometry'][key]
+        if isinstance(pd, StoredPolyData) and not pd.isLoaded():
+            await asyncio.to_thread(pd.polyData)
+
+        return self.geometryPolyData(key)
+
+    def isGeometryLoaded(self, key):
+        pd = self._files['geometry'][key]
+        return not isinstance(pd, StoredPolyData) or pd.isLoaded()
+
+    def geometryBounds(self, key) -> tuple:
+        """Returns bounds of the geometry, without decoding it if its metadata is in the file"""
+        pd = self._files['geometry'][key]
+        return pd.bounds() if isinstance(pd, StoredPolyData) else pd.GetBounds()
+
+    def geometryNumberOfCells(self, key) -> int:
+        pd = self._files['geometry'][key]
+        return pd.numberOfCells() if isinstance(pd, StoredPolyData) else pd.GetNumberOfCells()
 
     def updateGeometryPolyData(self, key, pd):
         self._files['geometry'][key] = pd
+        self._updatedGeometries.add(key)
         self._modified = True
 
     def commit(self, data):
         for key in data._files:
             self._files[key].update(data._files[key])
+        self._updatedGeometries.update(data._updatedGeometries)
 
         super().commit(data)
 
@@ -76,10 +119,35 @@ class Configurations(SimpleDB):
 
         return db
 
-    def _save(self):
-        writeConfigurations(self._path, self.toYaml(), self._files)
+    def _startPrefetch(self):
+        """Decodes geometries in the background, in the order of the keys, before they are requested"""
+        stored = [pd for pd in self._files['geometry'].values() if isinstance(pd, StoredPolyData) and not pd.isLoaded()]
+        if stored:
+            self._prefetcher = ThreadPoolExecutor(max_workers=min(MAX_PREFETCH_WORKERS, os.cpu_count() or 1),
+                                                  thread_name_prefix='GeometryPrefetch')
+            for pd in stored:
+                self._prefetcher.submit(pd.polyData)
+
+    def _stopPrefetch(self):
+        # Geometries waiting to be decoded would hold up writing the file
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=True, cancel_futures=True)
+            self._prefetcher = None
+
+    def _save(self, incremental=False):
+        self._stopPrefetch()
+        if not incremental:
+            # Geometries not decoded yet are read from the file before it is overwritten or another file is created
+            for key in self._files['geometry']:
+                self.geometryPolyData(key)
+
+        writeConfigurations(self._path, self.toYaml(), self._files, self._updatedGeometries if incremental else None)
+        self._updatedGeometries = set()
         self._modified = False
 
+        if incremental:
+            self._startPrefetch()
+
 
 defaultsDB = Configurations(schema)
 defaultsDB.createData()
@@ -2,14 +2,31 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum
+from pathlib import Path
+from threading import Lock
 
 import h5py
-from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter, vtkXMLPolyDataReader
+from vtkmodules.util.numpy_support import ID_TYPE_CODE, numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+from vtkmodules.vtkIOXML import vtkXMLPolyDataReader
 
 CONFIGURATIONS_KEY = 'configurations'
 
 POLYDATA_PREFIX = 'polyData'
 
+COMPRESSION = 'lzf'     # Fast enough not to slow down saving large geometries
+
+_CELL_TYPES = ['verts', 'lines', 'polys', 'strips']
+_ATTRIBUTE_TYPE = 'attributeType'
+
+# Metadata of geometries available without decoding them
+_BOUNDS = 'bounds'
+_NUMBER_OF_CELLS = 'numberOfCells'
+
+# HDF5 cannot open a file for writing while it is open for reading geometries in other threads
+_fileLock = Lock()
+
 
 class FileGroup(Enum):
     GEOMETRY_POLY_DATA = 'geometry'
@@ -21,24 +38,195 @@ def newFiles():
     }
 
 
-def writeConfigurations(path, configurations, files):
-    with h5py.File(path, 'w') as f:
+def _createDataset(group: h5py.Group, name: str, data):
+    return group.create_dataset(name, data=data, compression=COMPRESSION if data.size else None)
+
+
+def _writePolyData(group: h5py.Group, polyData: vtkPolyData):
+    group.attrs[_BOUNDS] = polyData.GetBounds()
+    group.attrs[_NUMBER_OF_CELLS] = polyData.GetNumberOfCells()
+
+    if polyData.GetPoints() is not None:
+        _createDataset(group, 'points', vtk_to_numpy(polyData.GetPoints().GetData()))
+
+    for name, cells in zip(_CELL_TYPES,
+                           [polyData.GetVerts(), polyData.GetLines(), polyData.GetPolys(), polyData.GetStrips()]):
+        if cells.GetNumberOfCells():
+            cellGroup = group.create_group(name)
+            _createDataset(cellGroup, 'offsets', vtk_to_numpy(cells.GetOffsetsArray()))
+            _createDataset(cellGroup, 'connectivity', vtk_to_numpy(cells.GetConnectivityArray()))
+
+    for name, attributes in [('pointData', polyData.GetPointData()), ('cellData', polyData.GetCellData())]:
+        attributesGroup = group.create_group(name)
+        for i in range(attributes.GetNumberOfArrays()):
+            array = attributes.GetArray(i)
+            if array is None or not array.GetName():  # Only named numeric arrays are stored
+                continue
+
+            dataset = _createDataset(attributesGroup, array.GetName(), vtk_to_numpy(array))
+            dataset.attrs[_ATTRIBUTE_TYPE] = attributes.IsArrayAnAttribute(i)
+
+
+def _readPolyData(group: h5py.Group) -> vtkPolyData:
+    polyData = vtkPolyData()
+
+    if 'points' in group:
+        points = vtkPoints()
+        points.SetData(numpy_to_vtk(group['points'][()], deep=1))
+        polyData.SetPoints(points)
+
+    for name in _CELL_TYPES:
+        if name in group:
+            cells = vtkCellArray()
+            cells.SetData(numpy_to_vtkIdTypeArray(group[name]['offsets'][()].astype(ID_TYPE_CODE), deep=1),
+                          numpy_to_vtkIdTypeArray(group[name]['connectivity'][()].astype(ID_TYPE_CODE), deep=1))
+            getattr(polyData, f'Set{name.capitalize()}')(cells)
+
+    for name, attributes in [('pointData', polyData.GetPointData()), ('cellData', polyData.GetCellData())]:
+        for arrayName, dataset in group[name].items():
+            array = numpy_to_vtk(dataset[()], deep=1)
+            array.SetName(arrayName)
+            attributes.AddArray(array)
+            if (attributeType := dataset.attrs.get(_ATTRIBUTE_TYPE, -1)) >= 0:
+                attributes.SetActiveAttribute(arrayName, int(attributeType))
+
+    return polyData
+
+
+def _readXMLPolyData(dataset: h5py.Dataset) -> vtkPolyData:
+    # Geometries were saved as XML strings before
+    reader = vtkXMLPolyDataReader()
+    reader.ReadFromInputStringOn()
+    reader.SetInputString(dataset[()])
+    reader.Update()
+
+    return reader.GetOutput()
+
+
+class StoredPolyData:
+    """Geometry in the project file, decoded on first access
+
+    Bounds and the number of cells are read from the metadata of the geometry without decoding it,
+    except for geometries saved as XML strings, which have no metadata.
+    polyData() can be called from any thread, and decodes the geometry only once.
+    """
+    def __init__(self, path: Path, key: str, item):
+        self._path = path
+        self._key = key
+        self._polyData = None
+        self._lock = Lock()
+
+        self._bounds = None
+        self._numberOfCells = None
+        if isinstance(item, h5py.Group) and _BOUNDS in item.attrs:
+            self._bounds = tuple(float(v) for v in item.attrs[_BOUNDS])
+            self._numberOfCells = int(item.attrs[_NUMBER_OF_CELLS])
+
+    def isLoaded(self):
+        return self._polyData is not None
+
+    def bounds(self) -> tuple:
+        return self.polyData().GetBounds() if self._bounds is None else self._bounds
+
+    def numberOfCells(self) -> int:
+        return self.polyData().GetNumberOfCells() if self._numberOfCells is None else self._numberOfCells
+
+    def polyData(self) -> vtkPolyData:
+        with self._lock:
+            if self._polyData is None:
+                with _fileLock, h5py.File(self._path, 'r') as f:
+                    item = f[FileGroup.GEOMETRY_POLY_DATA.value][self._key]
+                    if isinstance(item, h5py.Dataset):
+                        self._polyData = _readXMLPolyData(item)
+                    else:
+                        self._polyData = _readPolyData(item)
+
+            return self._polyData
+
+
+def writeConfigurations(path: Path, configurations, files, updatedGeometries: set = None):
+    """Writes configurations and geometries into the file
+
+    Geometries in files should be vtkPolyData, not StoredPolyData, when the file is rewritten.
+    The file is rewritten when updatedGeometries is None.
+    Otherwise, configurations and only the geometries of the keys in updatedGeometries are replaced in the file,
+    and geometries of the keys whose poly data is None are removed.
+    Files are created to reuse the space of removed geometries,
+    and files created before are repacked on the first incremental write.
+    """
+    with _fileLock:
+        _writeConfigurations(path, configurations, files, updatedGeometries)
+
+
+def _writeConfigurations(path: Path, configurations, files, updatedGeometries: set):
+    if updatedGeometries is None or not path.is_file():
+        with h5py.File(path, 'w', fs_strategy='fsm', fs_persist=True) as f:
+            f[CONFIGURATIONS_KEY] = configurations
+
+            geometryPolyData = f.create_group(FileGroup.GEOMETRY_POLY_DATA.value)
+            polyData = files[FileGroup.GEOMETRY_POLY_DATA.value]
+            for key in polyData:
+                if polyData[key]:
+                    _writePolyData(geometryPolyData.create_group(key), polyData[key])
+
+        return
+
+    with h5py.File(path, 'r') as f:
+        legacy = not _tracksFreeSpace(f)
+
+    if legacy:
+        _repack(path, configurations, files, updatedGeometries)
+        return
+
+    with h5py.File(path, 'a') as f:
+        del f[CONFIGURATIONS_KEY]
         f[CONFIGURATIONS_KEY] = configurations
 
-        geometryPolyData = f.create_group(FileGroup.GEOMETRY_POLY_DATA.value)
+        geometryPolyData = f[FileGroup.GEOMETRY_POLY_DATA.value]
         polyData = files[FileGroup.GEOMETRY_POLY_DATA.value]
-        for key in polyData:
-            if polyData[key]:
-                writer = vtkXMLPolyDataWriter()
-                writer.SetInputData(polyData[key])
-                writer.WriteToOutputStringOn()
-                writer.Update()
+        for key in updatedGeometries:
+            if key in geometryPolyData:
+                del geometryPolyData[key]
+            if polyData.get(key):
+                _writePolyData(geometryPolyData.create_group(key), polyData[key])
 
-                geometryPolyData[key] = writer.GetOutputString()
 
+def _tracksFreeSpace(f: h5py.File) -> bool:
+    # Files created before writing incrementally do not keep their free space across sessions
+    return bool(f.id.get_create_plist().get_file_space_strategy()[1])
 
-def readConfigurations(path):
-    with h5py.File(path, 'r') as f:
+
+def _repack(path: Path, configurations, files, updatedGeometries: set):
+    """Rewrites the file into one that reuses the space of removed geometries
+
+    Geometries not updated are copied without decoding, except those saved as XML strings, which are converted.
+    """
+    tmpPath = path.with_name(path.name + '.tmp')
+    with h5py.File(path, 'r') as src, h5py.File(tmpPath, 'w', fs_strategy='fsm', fs_persist=True) as dst:
+        dst[CONFIGURATIONS_KEY] = configurations
+
+        srcPolyData = src[FileGroup.GEOMETRY_POLY_DATA.value]
+        dstPolyData = dst.create_group(FileGroup.GEOMETRY_POLY_DATA.value)
+        for key, item in srcPolyData.items():
+            if key in updatedGeometries:
+                continue
+
+            if isinstance(item, h5py.Dataset):
+                _writePolyData(dstPolyData.create_group(key), _readXMLPolyData(item))
+            else:
+                src.copy(item, dstPolyData, name=key)
+
+        polyData = files[FileGroup.GEOMETRY_POLY_DATA.value]
+        for key in updatedGeometries:
+            if polyData.get(key):
+                _writePolyData(dstPolyData.create_group(key), polyData[key])
+
+    tmpPath.replace(path)
+
+
+def readConfigurations(path: Path):
+    """Reads configurations and the list of geometries, which are decoded later by StoredPolyData"""
+    with _fileLock, h5py.File(path, 'r') as f:
         configurations = f[CONFIGURATIONS_KEY][()]
 
         files = {}
@@ -48,12 +236,8 @@ def readConfigurations(path):
         polyData = {}
         maxIndex = 0
         prefixLen = len(POLYDATA_PREFIX)
-        for key in geometryPolyData.keys():
-            reader = vtkXMLPolyDataReader()
-            reader.ReadFromInputStringOn()
-            reader.SetInputString(geometryPolyData[key][()])
-            reader.Update()
-            polyData[key] = reader.GetOutput()
+        for key, item in geometryPolyData.items():
+            polyData[key] = StoredPolyData(path, key, item)
 
             index = int(key[prefixLen:])
             if index > maxIndex:
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import asyncio
 
+from libbaram.file_copy import CopyMode, MAX_COPY_WORKERS, copyTrees
 from libbaram.openfoam.polymesh import isPolyMesh
 from libbaram.utils import rmtree
 from libbaram.openfoam.constants import Directory, CASE_DIRECTORY_NAME, FOAM_FILE_NAME
@@ -124,12 +125,21 @@ class FileSystem:
         return targetFile
 
     async def copyTimeDirectory(self, srcTime, destTime, processorNo=None):
-        srcPath = self.timePath(srcTime, processorNo)
-        if not srcPath.is_dir():
-            return
+        await self.copyTimeDirectories(srcTime, destTime, [processorNo])
 
-        destPath = self.timePath(destTime, processorNo)
-        await asyncio.to_thread(shutil.copytree, srcPath, destPath)
+    async def copyTimeDirectories(self, srcTime, destTime, processorNos, concurrency=MAX_COPY_WORKERS):
+        """Copies the time directory of each processor, or of the case for None, concurrently
+
+        Files are cloned where the file system supports it.
+        They are not hard-linked because OpenFOAM utilities write mesh files of the target in place.
+        """
+        pairs = []
+        for no in processorNos:
+            srcPath = self.timePath(srcTime, no)
+            if srcPath.is_dir():
+                pairs.append((srcPath, self.timePath(destTime, no)))
+
+        await copyTrees(pairs, CopyMode.REFLINK, concurrency)
 
     def _setCaseRoot(self, path):
         self._casePath = path
@@ -100,7 +100,11 @@ class PolyMeshLoader(QObject):
 
         self._reader.AddObserver(vtkCommand.ProgressEvent, self._readerProgressed)
 
-    async def loadMesh(self, time):
+    async def loadMesh(self, time, cellArrays=True):
+        """Reads the mesh of the time, without the fields of the cells if cellArrays is False
+
+        Fields still being written by another process are skipped this way, and read later by loadCellArrays().
+        """
         if self._processorPath.is_dir():
             self._reader.SetCaseType(vtkPOpenFOAMReader.DECOMPOSED_CASE)
         else:
@@ -112,6 +116,9 @@ class PolyMeshLoader(QObject):
         if self._reader.GetTimeValue() != time:
             return None
 
+        if not cellArrays:
+            self._reader.DisableAllCellArrays()
+
         self._reader.Modified()
 
         self._progress_range = [0, 50]
@@ -120,6 +127,21 @@ class PolyMeshLoader(QObject):
         # Only one VTK can be allowed to keep integrity
         await asyncio.to_thread(self._reader.Update)
         self._progress_range = [50, 100]
+        return await asyncio.to_thread(self._getVtkMesh, self._buildPatchArrayStatus(), cellArrays)
+
+    async def loadCellArrays(self, time):
+        """Reads the mesh of the time again with the fields of the cells written after loadMesh()"""
+        # Field files are listed again only when the reader is refreshed
+        self._reader.SetRefresh()
+        self._reader.UpdateInformation()
+        self._reader.SetTimeValue(time)
+
+        if self._reader.GetTimeValue() != time:
+            return None
+
+        self._reader.EnableAllCellArrays()
+
+        self._progress_range = [0, 100]
         return await asyncio.to_thread(self._getVtkMesh, self._buildPatchArrayStatus())
 
     def _buildPatchArrayStatus(self):
@@ -138,7 +160,7 @@ class PolyMeshLoader(QObject):
 
         return statusConfig
 
-    def _getVtkMesh(self, statusConfig: dict):
+    def _getVtkMesh(self, statusConfig: dict, cellArrays=True):
         """
         VtkMesh dict
         {
@@ -165,7 +187,7 @@ class PolyMeshLoader(QObject):
 
         for i in range(self._reader.GetNumberOfCellArrays()):
             name = self._reader.GetCellArrayName(i)
-            self._reader.SetCellArrayStatus(name, 1)
+            self._reader.SetCellArrayStatus(name, 1 if cellArrays else 0)
 
         for i in range(self._reader.GetNumberOfPointArrays()):
             name = self._reader.GetPointArrayName(i)
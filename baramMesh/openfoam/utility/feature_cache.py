@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from libbaram.file_copy import CopyMode, copyFile
+
+
+CACHE_DIRECTORY_NAME = 'featureCache'
+
+FEATURE_FILE_SUFFIX = '.obj'
+
+
+def _hashPolyData(digest, pd):
+    if pd.GetPoints() is not None:
+        digest.update(vtk_to_numpy(pd.GetPoints().GetData()).tobytes())
+
+    for cells in [pd.GetVerts(), pd.GetLines(), pd.GetPolys(), pd.GetStrips()]:
+        digest.update(b'|')
+        if cells.GetNumberOfCells():
+            digest.update(vtk_to_numpy(cells.GetOffsetsArray()).tobytes())
+            digest.update(vtk_to_numpy(cells.GetConnectivityArray()).tobytes())
+
+
+class FeatureCache:
+    """Feature edge files of geometries kept in the project, keyed by a hash of the geometry and the parameters
+
+    Hashes of geometries are remembered for each poly data object until it is modified,
+    so unchanged geometries are not hashed again in later runs.
+    Files are cloned into and out of the cache, never linked, because feature files are written in place.
+    """
+    def __init__(self, path: Path):
+        self._path = path
+        self._geometryHashes = {}
+
+    def path(self):
+        return self._path
+
+    def key(self, pd, parameters: tuple) -> str:
+        address = pd.GetAddressAsString('vtkPolyData')
+        mTime = pd.GetMTime()
+        if (cached := self._geometryHashes.get(address)) is None or cached[0] != mTime:
+            digest = hashlib.blake2b(digest_size=32)
+            _hashPolyData(digest, pd)
+            self._geometryHashes[address] = (mTime, digest.hexdigest())
+
+        digest = hashlib.blake2b(self._geometryHashes[address][1].encode(), digest_size=32)
+        digest.update(repr(parameters).encode())
+
+        return digest.hexdigest()
+
+    def fetch(self, key: str, target: Path) -> bool:
+        """Copies the cached file of the key to the target, and returns False if it is not cached"""
+        cached = self._file(key)
+        if not cached.is_file():
+            return False
+
+        target.unlink(missing_ok=True)
+        copyFile(cached, target, CopyMode.REFLINK)
+
+        return True
+
+    def store(self, key: str, source: Path):
+        self._path.mkdir(parents=True, exist_ok=True)
+
+        # Renamed when complete, so that an interrupted copy is not taken as a cached file
+        fd, temporary = tempfile.mkstemp(dir=self._path, suffix='.tmp')
+        os.close(fd)
+        try:
+            copyFile(source, temporary, CopyMode.REFLINK)
+            os.replace(temporary, self._file(key))
+        except OSError:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def prune(self, keys):
+        """Removes cached files other than the ones of the keys"""
+        if not self._path.is_dir():
+            return
+
+        files = {self._file(key).name for key in keys}
+        for path in self._path.iterdir():
+            if path.name not in files:
+                path.unlink(missing_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self._path / f'{key}{FEATURE_FILE_SUFFIX}'
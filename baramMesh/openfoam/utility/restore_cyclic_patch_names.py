@@ -3,11 +3,9 @@
 
 from pathlib import Path
 
-from PyFoam.Basics.DataStructures import DictProxy
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict
-
 from baramMesh.app import app
 from baramMesh.db.configurations_schema import CFDType
+from libbaram.openfoam.poly_mesh_files import BoundaryFile
 
 
 class RestoreCyclicPatchNames:
@@ -19,8 +17,8 @@ class RestoreCyclicPatchNames:
         self._updateCyclicPatchNames(self._fileSystem.boundaryFilePath())
 
     def _updateCyclicPatchNames(self, path: Path):
-        boundaryDict: ParsedBoundaryDict = ParsedBoundaryDict(str(path), treatBinaryAsASCII=True)
-        boundaries = boundaryDict.content.keys()  # To save the order of boundaries
+        boundaryDict = BoundaryFile(path)
+        boundaries = list(boundaryDict.content.keys())  # To save the order of boundaries
         for interface in app.db.getElements(
                 'geometry', lambda i, e: e['cfdType'] == CFDType.INTERFACE.value and not e['interRegion'] and not e['nonConformal']).values():
             master = interface.value('name')
@@ -39,12 +37,8 @@ class RestoreCyclicPatchNames:
             boundaryDict.content[oldMaster]['type'] = 'patch'
             boundaryDict.content[oldSlave]['type'] = 'patch'
 
-            # xx[newKey] = xx.pop(oldKey) cannot be used here
-            # because boundaryDict is not a python dict but a PyFoam.Basics.DataStructures.DictProxy
-            boundaryDict.content[master] = boundaryDict.content[oldMaster]
-            boundaryDict.content[slave] = boundaryDict.content[oldSlave]
-            del boundaryDict.content[oldMaster]
-            del boundaryDict.content[oldSlave]
+            boundaryDict.content[master] = boundaryDict.content.pop(oldMaster)
+            boundaryDict.content[slave] = boundaryDict.content.pop(oldSlave)
 
             self._removeEntry(boundaryDict, master, 'inGroups')
             self._removeEntry(boundaryDict, slave,  'inGroups')
@@ -60,7 +54,7 @@ class RestoreCyclicPatchNames:
         #  Restore the original boundary order
         #
         oldContent = boundaryDict.content
-        boundaryDict.content = DictProxy()
+        boundaryDict.content = {}
         for oldName in boundaries:
             bName = oldName[len(self._prefix):] if oldName.startswith(self._prefix) else oldName
             boundaryDict.content[bName] = oldContent[bName]
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Signal
@@ -9,6 +12,7 @@ from vtkmodules.vtkFiltersCore import vtkFeatureEdges, vtkAppendPolyData, vtkTri
 from vtkmodules.vtkFiltersCore import vtkCleanPolyData
 from vtkmodules.vtkIOGeometry import vtkSTLWriter, vtkOBJWriter
 
+from libbaram.exception import CanceledException
 from libbaram.process import ProcessError
 from libbaram.run import RunParallelUtility
 
@@ -17,6 +21,7 @@ from baramMesh.db.configurations_schema import GeometryType, Shape, CFDType
 from baramMesh.openfoam.file_system import makeDir
 from baramMesh.openfoam.system.snappy_hex_mesh_dict import SnappyHexMeshDict
 from baramMesh.openfoam.system.topo_set_dict import TopoSetDict
+from baramMesh.openfoam.utility.feature_cache import CACHE_DIRECTORY_NAME, FeatureCache
 from libbaram.utils import copyOrLink
 
 
@@ -24,6 +29,11 @@ CASTELLATION_OUTPUT_TIME    = 1
 SNAP_OUTPUT_TIME            = 2
 BOUNDARY_LAYER_OUTPUT_TIME  = 3
 
+QUALITY_FIELDS = ['cellAspectRatio', 'cellVolume', 'nonOrthoAngle', 'skewness']
+
+
+logger = logging.getLogger(__name__)
+
 
 def Plane(ox, oy, oz, nx, ny, nz):
     plane = vtkPlane()
@@ -33,21 +43,32 @@ def Plane(ox, oy, oz, nx, ny, nz):
     return plane
 
 
-def _writeFeatureFile(path: Path, pd):
+def _featureParameters():
+    """Returns the parameters of feature extraction, which make the key of cached feature files with the geometry"""
+    _, geometry = app.window.geometryManager.getBoundingHex6()
+    boundingHex6 = None if geometry is None else (tuple(geometry.vector('point1')), tuple(geometry.vector('point2')))
+
+    return (bool(app.db.getValue('castellation/vtkNonManifoldEdges')),
+            bool(app.db.getValue('castellation/vtkBoundaryEdges')),
+            float(app.db.getValue('castellation/resolveFeatureAngle')),
+            boundingHex6)
+
+
+def _writeFeatureFile(path: Path, pd, parameters):
+    nonManifoldEdges, boundaryEdges, featureAngle, boundingHex6 = parameters
+
     edges = vtkFeatureEdges()
     edges.SetInputData(pd)
-    edges.SetNonManifoldEdges(app.db.getValue('castellation/vtkNonManifoldEdges'))
-    edges.SetBoundaryEdges(app.db.getValue('castellation/vtkBoundaryEdges'))
-    edges.SetFeatureAngle(float(app.db.getValue('castellation/resolveFeatureAngle')))
+    edges.SetNonManifoldEdges(nonManifoldEdges)
+    edges.SetBoundaryEdges(boundaryEdges)
+    edges.SetFeatureAngle(featureAngle)
     edges.Update()
 
     features = vtkAppendPolyData()
     features.AddInputData(edges.GetOutput())
 
-    _, geometry = app.window.geometryManager.getBoundingHex6()
-    if geometry is not None:  # boundingHex6 is configured
-        x1, y1, z1 = geometry.vector('point1')
-        x2, y2, z2 = geometry.vector('point2')
+    if boundingHex6 is not None:  # boundingHex6 is configured
+        (x1, y1, z1), (x2, y2, z2) = boundingHex6
 
         planes = [
             Plane(x1, 0, 0, -1, 0, 0),
@@ -89,8 +110,18 @@ class SnappyHexMesh(QObject):
     def __init__(self):
         super().__init__()
         self._cm = None
+        self._featureCache = None
+
+        # checkMesh runs in the background, writing the quality fields of a step while the next one is prepared
+        self._checkers = {}     # Tasks writing the quality fields of each time
+        self._checkProcesses = {}
+
+        # Parallel utilities run one at a time, not to start more MPI ranks than the parallel environment has
+        self._parallelLock = asyncio.Lock()
+        self._canceled = False
 
     async def castellation(self):
+        self._canceled = False
         time = CASTELLATION_OUTPUT_TIME
 
         try:
@@ -108,27 +139,22 @@ class SnappyHexMesh(QObject):
                                           parallel=app.project.parallelEnvironment())
             self._cm.output.connect(console.append)
             self._cm.errorOutput.connect(console.appendError)
-            await self._cm.start()
-            rc = await self._cm.wait()
+            async with self._processSlot(self._cm):
+                await self._cm.start()
+                rc = await self._cm.wait()
             if rc != 0:
                 raise ProcessError(rc)
 
-            self._cm = RunParallelUtility('checkMesh',
-                                          '-allRegions',
-                                          '-writeFields', '(cellAspectRatio cellVolume nonOrthoAngle skewness)',
-                                          '-time', str(time),
-                                          '-case', app.fileSystem.caseRoot(),
-                                          cwd=app.fileSystem.caseRoot(), parallel=app.project.parallelEnvironment())
-            self._cm.output.connect(console.append)
-            self._cm.errorOutput.connect(console.appendError)
-            await self._cm.start()
-            await self._cm.wait()
+            # Quality fields of intermediate steps are written on demand, if deferred
+            if not app.settings.isCheckMeshDeferred():
+                self._startChecking(time, self._checkMesh(time))
         except Exception as e:
             raise e
         finally:
             self._cm = None
 
     async def snap(self):
+        self._canceled = False
         time = SNAP_OUTPUT_TIME
 
         try:
@@ -145,8 +171,9 @@ class SnappyHexMesh(QObject):
             self._cm = RunParallelUtility('snappyHexMesh', cwd=app.fileSystem.caseRoot(), parallel=parallel)
             self._cm.output.connect(console.append)
             self._cm.errorOutput.connect(console.appendError)
-            await self._cm.start()
-            rc = await self._cm.wait()
+            async with self._processSlot(self._cm):
+                await self._cm.start()
+                rc = await self._cm.wait()
             if rc != 0:
                 raise ProcessError(rc)
 
@@ -156,8 +183,9 @@ class SnappyHexMesh(QObject):
                 self._cm = RunParallelUtility('topoSet', cwd=app.fileSystem.caseRoot(), parallel=parallel)
                 self._cm.output.connect(console.append)
                 self._cm.errorOutput.connect(console.appendError)
-                await self._cm.start()
-                rc = await self._cm.wait()
+                async with self._processSlot(self._cm):
+                    await self._cm.start()
+                    rc = await self._cm.wait()
                 if rc != 0:
                     raise ProcessError(rc)
 
@@ -168,27 +196,22 @@ class SnappyHexMesh(QObject):
                                                   parallel=parallel)
                     self._cm.output.connect(console.append)
                     self._cm.errorOutput.connect(console.appendError)
-                    await self._cm.start()
-                    rc = await self._cm.wait()
+                    async with self._processSlot(self._cm):
+                        await self._cm.start()
+                        rc = await self._cm.wait()
                     if rc != 0:
                         raise ProcessError(rc)
 
-            self._cm = RunParallelUtility('checkMesh',
-                                          '-allRegions',
-                                          '-writeFields', '(cellAspectRatio cellVolume nonOrthoAngle skewness)',
-                                          '-time', str(time),
-                                          '-case', app.fileSystem.caseRoot(),
-                                          cwd=app.fileSystem.caseRoot(), parallel=app.project.parallelEnvironment())
-            self._cm.output.connect(console.append)
-            self._cm.errorOutput.connect(console.appendError)
-            await self._cm.start()
-            await self._cm.wait()
+            # Quality fields of intermediate steps are written on demand, if deferred
+            if not app.settings.isCheckMeshDeferred():
+                self._startChecking(time, self._checkMesh(time))
         except Exception as e:
             raise e
         finally:
             self._cm = None
 
     async def addLayers(self):
+        self._canceled = False
         time = BOUNDARY_LAYER_OUTPUT_TIME
 
         try:
@@ -207,8 +230,9 @@ class SnappyHexMesh(QObject):
                                               parallel=app.project.parallelEnvironment())
                 self._cm.output.connect(console.append)
                 self._cm.errorOutput.connect(console.appendError)
-                await self._cm.start()
-                rc = await self._cm.wait()
+                async with self._processSlot(self._cm):
+                    await self._cm.start()
+                    rc = await self._cm.wait()
                 if rc != 0:
                     raise ProcessError(rc)
 
@@ -218,33 +242,9 @@ class SnappyHexMesh(QObject):
                 self._createOutputPath(time)
 
             if boundaryLayersAdded:
-                self._cm = RunParallelUtility('checkMesh',
-                                              '-allRegions',
-                                              '-writeFields', '(cellAspectRatio cellVolume nonOrthoAngle skewness)',
-                                              '-time', str(time),
-                                              '-case', app.fileSystem.caseRoot(),
-                                              cwd=app.fileSystem.caseRoot(), parallel=app.project.parallelEnvironment())
-                self._cm.output.connect(console.append)
-                self._cm.errorOutput.connect(console.appendError)
-                await self._cm.start()
-                await self._cm.wait()
+                self._startChecking(time, self._checkMesh(time))
             else:  # Mesh Quality information should be in this time folder
-                nProcFolders = app.fileSystem.numberOfProcessorFolders()
-                if nProcFolders == 0:
-                    source = app.fileSystem.timePath(time - 1)
-                    target = app.fileSystem.timePath(time)
-                    copyOrLink(source / 'cellAspectRatio', target / 'cellAspectRatio')
-                    copyOrLink(source / 'cellVolume', target / 'cellVolume')
-                    copyOrLink(source / 'nonOrthoAngle', target / 'nonOrthoAngle')
-                    copyOrLink(source / 'skewness', target / 'skewness')
-                else:
-                    for processorNo in range(nProcFolders):
-                        source = app.fileSystem.timePath(time - 1, processorNo)
-                        target = app.fileSystem.timePath(time, processorNo)
-                        copyOrLink(source / 'cellAspectRatio', target / 'cellAspectRatio')
-                        copyOrLink(source / 'cellVolume', target / 'cellVolume')
-                        copyOrLink(source / 'nonOrthoAngle', target / 'nonOrthoAngle')
-                        copyOrLink(source / 'skewness', target / 'skewness')
+                self._startChecking(time, self._linkQualityFields(time))
         except Exception as e:
             raise e
         finally:
@@ -261,13 +261,26 @@ class SnappyHexMesh(QObject):
         geometryManager = app.window.geometryManager
         geometries = app.db.getElements('geometry')
 
+        cachePath = app.project.path / CACHE_DIRECTORY_NAME
+        if self._featureCache is None or self._featureCache.path() != cachePath:
+            self._featureCache = FeatureCache(cachePath)
+        parameters = _featureParameters()
+        featureKeys = []
+
         for gId, geometry in geometries.items():
             if geometryManager.isBoundingHex6(gId):
                 continue
 
             if geometry.value('gType') == GeometryType.SURFACE.value:
                 polyData = geometryManager.polyData(gId)
-                _writeFeatureFile(filePath / f"{geometry.value('name')}.obj", polyData)
+
+                # Feature edges are extracted again only when the geometry or the parameters have changed
+                featureFile = filePath / f"{geometry.value('name')}.obj"
+                key = self._featureCache.key(polyData, parameters)
+                if not self._featureCache.fetch(key, featureFile):
+                    _writeFeatureFile(featureFile, polyData, parameters)
+                    self._featureCache.store(key, featureFile)
+                featureKeys.append(key)
 
                 if geometry.value('shape') == Shape.TRI_SURFACE_MESH.value:
                     volume = geometries[geometry.value('volume')] if geometry.value('volume') else None
@@ -289,13 +302,139 @@ class SnappyHexMesh(QObject):
 
                     writeGeometryFile(filePath / f"{geometry.value('name')}.stl", cleanFilter.GetOutput())
 
+        self._featureCache.prune(featureKeys)
+
     def isRunning(self):
         return self._cm is not None
 
     def cancel(self):
+        self._canceled = True
         if self._cm:
             self._cm.cancel()
 
+        for time in list(self._checkers):
+            self.cancelCheckMesh(time)
+
+    def isCheckingMesh(self, time) -> bool:
+        return time in self._checkers
+
+    async def checkMesh(self, time):
+        """Waits for the quality fields of the time, running checkMesh if they have not been written
+
+        Raises ProcessError if checkMesh fails, and CanceledException if it is canceled.
+        """
+        if time not in self._checkers and not self._hasQualityFields(time):
+            self._startChecking(time, self._checkMesh(time))
+
+        if (task := self._checkers.get(time)) is None:
+            return
+
+        await asyncio.wait([task])
+        if task.cancelled():
+            raise CanceledException
+
+        if task.exception() is not None:
+            raise task.exception()
+
+    async def waitForCheckMesh(self, time=None):
+        """Waits for checkMesh running in the background for the time, or for all the times if time is None"""
+        if time is None:
+            tasks = list(self._checkers.values())
+        else:
+            tasks = [self._checkers[time]] if time in self._checkers else []
+
+        if tasks:
+            # asyncio.wait does not cancel the checks when the waiter is canceled
+            await asyncio.wait(tasks)
+
+    def cancelCheckMesh(self, time):
+        # The process is terminated at once, not to write fields into the time folder after it is cleared
+        if time in self._checkProcesses:
+            self._checkProcesses.pop(time).cancel()
+
+        if time in self._checkers:
+            self._checkers.pop(time).cancel()
+
+    def _startChecking(self, time, coroutine):
+        self.cancelCheckMesh(time)
+
+        task = asyncio.create_task(coroutine)
+        task.add_done_callback(lambda t: self._checkFinished(time, t))
+        self._checkers[time] = task
+
+    def _checkFinished(self, time, task):
+        if self._checkers.get(time) is task:
+            del self._checkers[time]
+
+        if task.cancelled():
+            return
+
+        if (e := task.exception()) is not None and not isinstance(e, CanceledException):
+            logger.warning(f'Mesh quality check of time {time} failed: {e}')
+
+    async def _checkMesh(self, time):
+        console = app.consoleView
+
+        cm = RunParallelUtility('checkMesh',
+                                '-allRegions',
+                                '-writeFields', f'({" ".join(QUALITY_FIELDS)})',
+                                '-time', str(time),
+                                '-case', app.fileSystem.caseRoot(),
+                                cwd=app.fileSystem.caseRoot(), parallel=app.project.parallelEnvironment())
+        cm.output.connect(console.append)
+        cm.errorOutput.connect(console.appendError)
+
+        self._checkProcesses[time] = cm
+        try:
+            async with self._processSlot(cm):
+                await cm.start()
+                rc = await cm.wait()
+
+            if rc != 0:
+                raise ProcessError(rc)
+        except asyncio.CancelledError:
+            cm.cancel()
+            raise
+        finally:
+            if self._checkProcesses.get(time) is cm:
+                del self._checkProcesses[time]
+
+    @asynccontextmanager
+    async def _processSlot(self, cm):
+        if not app.project.parallelEnvironment().isParallelOn():
+            yield   # Serial utilities use a core each, and can run alongside
+            return
+
+        async with self._parallelLock:
+            # A step canceled while waiting for a background check should not start its process
+            if cm is self._cm and self._canceled:
+                raise CanceledException
+
+            yield
+
+    async def _linkQualityFields(self, time):
+        # The mesh is not changed without boundary layers, so are the quality fields
+        await self.checkMesh(time - 1)
+
+        nProcFolders = app.fileSystem.numberOfProcessorFolders()
+        if nProcFolders == 0:
+            pairs = [(app.fileSystem.timePath(time - 1), app.fileSystem.timePath(time))]
+        else:
+            pairs = [(app.fileSystem.timePath(time - 1, processorNo), app.fileSystem.timePath(time, processorNo))
+                     for processorNo in range(nProcFolders)]
+
+        for source, target in pairs:
+            for field in QUALITY_FIELDS:
+                copyOrLink(source / field, target / field)
+
+    def _hasQualityFields(self, time):
+        if app.fileSystem.numberOfProcessorFolders() == 0:
+            path = app.fileSystem.timePath(time)
+        else:
+            path = app.fileSystem.timePath(time, 0)
+
+        return all((path / field).is_file() for field in QUALITY_FIELDS)
+
     def _createOutputPath(self, time):
         output = str(time)
 
@@ -6,15 +6,23 @@ from dataclasses import dataclass
 
 from PySide6.QtGui import QColor
 from PySide6.QtCore import QObject, Signal
-from vtkmodules.vtkCommonDataModel import vtkDataObject, vtkPlane
-from vtkmodules.vtkFiltersCore import vtkClipPolyData, vtkThreshold, vtkPassThrough, vtkCutter
+from vtkmodules.vtkCommonDataModel import vtkPlane, vtkDataObject
+from vtkmodules.vtkFiltersCore import vtkClipPolyData, vtkPassThrough, vtkCutter, vtkQuadricClustering, vtkExtractCells
+from vtkmodules.vtkFiltersCore import vtkThreshold
 from vtkmodules.vtkFiltersExtraction import vtkExtractPolyDataGeometry, vtkExtractGeometry
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
 from vtkmodules.vtkRenderingCore import vtkPolyDataMapper, vtkDataSetMapper, vtkActor, vtkMapper
+from vtkmodules.vtkRenderingLOD import vtkLODActor
 from vtkmodules.vtkCommonColor import vtkNamedColors
 
 from libbaram.mesh import Bounds
 from libbaram.colormap import sequentialRedLut
 
+from baramMesh.rendering.mesh_quality import MeshQualityIndex, MeshQualityStatistics
+
+
+LOD_DIVISIONS = 128    # Divisions of the longest side of the bounds, in which points of the proxy are clustered
+
 
 class DisplayMode(Enum):
     WIREFRAME      = auto()  # noqa: E221
@@ -22,17 +30,6 @@ class DisplayMode(Enum):
     SURFACE_EDGE   = auto()  # noqa: E221
 
 
-class MeshQualityIndex(Enum):
-    ASPECT_RATIO = 'cellAspectRatio'
-    NON_ORTHO_ANGLE = 'nonOrthoAngle'
-    SKEWNESS = 'skewness'
-    VOLUME = 'cellVolume'
-
-    @classmethod
-    def values(cls):
-        return [c.value for c in cls]
-
-
 @dataclass
 class Properties:
     visibility: bool
@@ -81,13 +78,13 @@ class ActorInfo(QObject):
         self._mqLow = 0
 
         self._mapper: vtkMapper = self._initMapper()
-        self._mapper.SetInputConnection(self._cutFilters[0].GetOutputPort())
+        self._setMapperInput(self._cutFilters[0])
         self._mapper.ScalarVisibilityOff()
         self._mapper.SetScalarModeToUseCellFieldData()
         self._mapper.SetColorModeToMapScalars()
         self._mapper.SetLookupTable(sequentialRedLut)
 
-        self._actor = vtkActor()
+        self._actor = self._initActor()
         self._actor.SetMapper(self._mapper)
         self._actor.GetProperty().SetDiffuse(0.3)
         self._actor.GetProperty().SetAmbient(0.3)
@@ -186,7 +183,7 @@ class ActorInfo(QObject):
                 self._cutFilters.append(f)
                 inputFilter = f
 
-        self._mapper.SetInputConnection(inputFilter.GetOutputPort())
+        self._setMapperInput(inputFilter)
         self._mapper.Update()
 
     def slice(self, plane):
@@ -203,7 +200,7 @@ class ActorInfo(QObject):
             self._cutFilters.append(f)
             inputFilter = f
 
-        self._mapper.SetInputConnection(inputFilter.GetOutputPort())
+        self._setMapperInput(inputFilter)
         self._mapper.Update()
 
     def getScalarRange(self, index: MeshQualityIndex) -> (float, float):
@@ -250,16 +247,74 @@ class ActorInfo(QObject):
     def _initMapper(self):
         raise NotImplementedError
 
+    def _initActor(self) -> vtkActor:
+        return vtkActor()
+
+    def _setMapperInput(self, inputFilter):
+        self._mapper.SetInputConnection(inputFilter.GetOutputPort())
+
     def _clipFilter(self, cutter: vtkPlane):
         raise NotImplementedError
 
 
 class MeshActor(ActorInfo):
-    def __init__(self, dataSet, id_, name):
+    """Actor of the internal mesh
+
+    With level of detail, only the outer surface of the cells passing the cell filter and the cut is extracted,
+    and a proxy decimated from the surface is drawn instead while the camera moves faster than it can be rendered.
+    vtkLODActor switches to the proxy by the update rate the interactor requests during interaction,
+    and back to the full surface when the interaction ends.
+    Without level of detail, the mesh is drawn by vtkDataSetMapper.
+    """
+    def __init__(self, dataSet, id_, name, levelOfDetail=True):
+        self._levelOfDetail = levelOfDetail
+        self._surfaceFilter = None
+        self._lodMapper = None
+        self._quality = MeshQualityStatistics(dataSet)
+
         super().__init__(dataSet, id_, name, ActorType.MESH)
 
-    def _initMapper(self) -> vtkDataSetMapper:
-        return vtkDataSetMapper()
+        if levelOfDetail:
+            self._lodMapper.SetScalarModeToUseCellFieldData()
+            self._lodMapper.SetColorModeToMapScalars()
+            self._lodMapper.SetLookupTable(sequentialRedLut)
+            self._syncLODMapper()
+            self._actor.AddLODMapper(self._lodMapper)
+
+    def _initMapper(self) -> vtkMapper:
+        if not self._levelOfDetail:
+            return vtkDataSetMapper()
+
+        self._surfaceFilter = vtkGeometryFilter()
+
+        decimator = vtkQuadricClustering()
+        decimator.SetInputConnection(self._surfaceFilter.GetOutputPort())
+        decimator.AutoAdjustNumberOfDivisionsOn()
+        decimator.SetNumberOfDivisions(LOD_DIVISIONS, LOD_DIVISIONS, LOD_DIVISIONS)
+        decimator.CopyCellDataOn()
+
+        self._lodMapper = vtkPolyDataMapper()
+        self._lodMapper.SetInputConnection(decimator.GetOutputPort())
+
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputConnection(self._surfaceFilter.GetOutputPort())
+
+        return mapper
+
+    def _initActor(self) -> vtkActor:
+        return vtkLODActor() if self._levelOfDetail else vtkActor()
+
+    def _setMapperInput(self, inputFilter):
+        if self._levelOfDetail:
+            self._surfaceFilter.SetInputConnection(inputFilter.GetOutputPort())
+        else:
+            super()._setMapperInput(inputFilter)
+
+    def _syncLODMapper(self):
+        if self._levelOfDetail:
+            self._lodMapper.SetScalarVisibility(self._mapper.GetScalarVisibility())
+            self._lodMapper.SetScalarRange(self._mapper.GetScalarRange())
+            self._lodMapper.SelectColorArray(self._mapper.GetArrayName())
 
     def _clipFilter(self, cutter: vtkPlane):
         f = vtkExtractGeometry()
@@ -271,14 +326,21 @@ class MeshActor(ActorInfo):
     def getNumberOfDisplayedCells(self) -> int:
         return self._cutFilters[-1].GetOutput().GetNumberOfCells()
 
-    def getScalarRange(self, index: MeshQualityIndex) -> (float, float):
-        # print(f'Name: {self.name()} Field: {index.value}')
-        scalars = self._dataSet.GetCellData().GetScalars(index.value)
-        if scalars is None:
-            return 0, 1
+    def qualityStatistics(self) -> MeshQualityStatistics:
+        return self._quality
 
-        left, right = scalars.GetRange()
-        return left, right
+    def setDataSet(self, dataSet):
+        self._quality = MeshQualityStatistics(dataSet)
+
+        if self._mqEnabled:
+            # Ids of the cells in the band were taken from the previous mesh
+            self._dataSet = dataSet
+            self.applyCellFilter()
+
+        super().setDataSet(dataSet)
+
+    def getScalarRange(self, index: MeshQualityIndex) -> (float, float):
+        return self._quality.range(index)
 
     def setScalar(self, index: MeshQualityIndex):
         self._mqIndex = index
@@ -288,6 +350,7 @@ class MeshActor(ActorInfo):
         self._mqHigh = high
 
     def clearCellFilter(self):
+        self._mqEnabled = False
         self._cellFilter = vtkPassThrough()
 
         self._cellFilter.SetInputData(self._dataSet)
@@ -296,17 +359,32 @@ class MeshActor(ActorInfo):
         self._cutFilters[0].SetInputConnection(self._cellFilter.GetOutputPort())
 
         self._mapper.ScalarVisibilityOff()
+        self._syncLODMapper()
 
         self._mapper.Update()
 
     def applyCellFilter(self):
-        self._cellFilter = vtkThreshold()
-        self._cellFilter.AllScalarsOff()
-        self._cellFilter.SetThresholdFunction(vtkThreshold.THRESHOLD_BETWEEN)
-
-        self._cellFilter.SetLowerThreshold(self._mqLow)
-        self._cellFilter.SetUpperThreshold(self._mqHigh)
-        self._cellFilter.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, self._mqIndex.value)
+        """Shows the cells in the band only
+
+        The metric should be indexed beforehand, in a thread, for a large mesh.
+        Cells of a metric not indexed are tested one by one, not to sort the metric here.
+        """
+        self._mqEnabled = True
+
+        if self._quality.isIndexed(self._mqIndex):
+            # Cells in the band are found in the sorted values instead of testing every cell
+            cellIds = self._quality.cellIds(self._mqIndex, self._mqLow, self._mqHigh)
+            self._cellFilter = vtkExtractCells()
+            self._cellFilter.SetCellIds(cellIds, len(cellIds))
+            self._cellFilter.AssumeSortedAndUniqueIdsOn()
+        else:
+            self._cellFilter = vtkThreshold()
+            self._cellFilter.AllScalarsOff()
+            self._cellFilter.SetThresholdFunction(vtkThreshold.THRESHOLD_BETWEEN)
+            self._cellFilter.SetLowerThreshold(self._mqLow)
+            self._cellFilter.SetUpperThreshold(self._mqHigh)
+            self._cellFilter.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS,
+                                                    self._mqIndex.value)
 
         self._cellFilter.SetInputData(self._dataSet)
 
@@ -316,6 +394,7 @@ class MeshActor(ActorInfo):
         self._mapper.ScalarVisibilityOn()
         self._mapper.SetScalarRange(self._mqLow, self._mqHigh)
         self._mapper.SelectColorArray(self._mqIndex.value)
+        self._syncLODMapper()
 
         self._mapper.Update()
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+from vtkmodules.util.numpy_support import vtk_to_numpy, ID_TYPE_CODE
+
+
+# Bands with fewer cells than 1/SORTED_SLICE_RATIO of the mesh take their ids by sorting a slice of the order
+SORTED_SLICE_RATIO = 16
+
+
+class MeshQualityIndex(Enum):
+    ASPECT_RATIO = 'cellAspectRatio'
+    NON_ORTHO_ANGLE = 'nonOrthoAngle'
+    SKEWNESS = 'skewness'
+    VOLUME = 'cellVolume'
+
+    @classmethod
+    def values(cls):
+        return [c.value for c in cls]
+
+
+@dataclass
+class QualitySummary:
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    median: float
+
+
+class _SortedValues:
+    def __init__(self, values: np.ndarray):
+        # NaNs are sorted to the end, out of any band
+        labelType = np.int32 if len(values) < np.iinfo(np.int32).max else np.int64
+        self.order = np.argsort(values, kind='stable').astype(labelType, copy=False)
+        self.values = values[self.order]
+        self.ranks = np.empty(len(values), dtype=labelType)
+        self.ranks[self.order] = np.arange(len(values), dtype=labelType)
+        self.count = len(values) - int(np.count_nonzero(np.isnan(self.values)))
+        self.mean = float(self.values[:self.count].mean()) if self.count else 0.0
+
+    def band(self, low, high) -> (int, int):
+        """Returns the ranks of the first cell in the band and the one following the last, including both ends"""
+        start = int(np.searchsorted(self.values[:self.count], low, 'left'))
+        return start, max(start, int(np.searchsorted(self.values[:self.count], high, 'right')))
+
+
+class MeshQualityStatistics:
+    """Quality metrics of the cells of a mesh, sorted for band queries
+
+    Each metric is sorted once, on its first query, and the sorted values and the rank of each cell are kept.
+    Counts in a band take O(log n), and ids of the cells in a band O(log n) plus the size of the band.
+    index() can be called in a thread to sort a metric before it is queried.
+    """
+    def __init__(self, dataSet):
+        self._dataSet = dataSet
+        self._sorted = {}
+        self._lock = Lock()
+
+    def hasMetric(self, index: MeshQualityIndex) -> bool:
+        return self._dataSet.GetCellData().GetArray(index.value) is not None
+
+    def isIndexed(self, index: MeshQualityIndex) -> bool:
+        return index in self._sorted
+
+    def index(self, index: MeshQualityIndex) -> Optional[_SortedValues]:
+        with self._lock:
+            if index not in self._sorted:
+                array = self._dataSet.GetCellData().GetArray(index.value)
+                if array is None:
+                    return None
+
+                self._sorted[index] = _SortedValues(vtk_to_numpy(array).astype(np.float64))
+
+            return self._sorted[index]
+
+    def range(self, index: MeshQualityIndex) -> (float, float):
+        if self.isIndexed(index):
+            sortedValues = self._sorted[index]
+            if sortedValues.count:
+                return float(sortedValues.values[0]), float(sortedValues.values[sortedValues.count - 1])
+
+        array = self._dataSet.GetCellData().GetArray(index.value)
+        if array is None or array.GetNumberOfTuples() == 0:
+            return 0, 1
+
+        return array.GetRange()
+
+    def count(self, index: MeshQualityIndex, low, high) -> int:
+        if (sortedValues := self.index(index)) is None:
+            return 0
+
+        start, end = sortedValues.band(low, high)
+        return end - start
+
+    def cellIds(self, index: MeshQualityIndex, low, high) -> np.ndarray:
+        """Returns the sorted ids of the cells whose values are between low and high, inclusive"""
+        if (sortedValues := self.index(index)) is None:
+            return np.empty(0, dtype=ID_TYPE_CODE)
+
+        start, end = sortedValues.band(low, high)
+        if (end - start) * SORTED_SLICE_RATIO < len(sortedValues.ranks):
+            return np.sort(sortedValues.order[start:end]).astype(ID_TYPE_CODE)
+
+        return np.flatnonzero((sortedValues.ranks >= start) & (sortedValues.ranks < end)).astype(ID_TYPE_CODE)
+
+    def histogram(self, index: MeshQualityIndex, bins: int, low=None, high=None) -> (np.ndarray, np.ndarray):
+        """Returns counts of cells in bins of equal width between low and high, and the edges of the bins
+
+        The range of the metric is used for low and high if they are not given.
+        """
+        if (sortedValues := self.index(index)) is None or not sortedValues.count:
+            return np.zeros(bins, dtype=np.int64), np.linspace(0, 1, bins + 1)
+
+        minimum, maximum = self.range(index)
+        edges = np.linspace(minimum if low is None else low, maximum if high is None else high, bins + 1)
+        positions = np.searchsorted(sortedValues.values[:sortedValues.count], edges, 'left')
+        positions[-1] = np.searchsorted(sortedValues.values[:sortedValues.count], edges[-1], 'right')
+
+        return np.diff(positions), edges
+
+    def summary(self, index: MeshQualityIndex) -> Optional[QualitySummary]:
+        if (sortedValues := self.index(index)) is None or not sortedValues.count:
+            return None
+
+        values = sortedValues.values
+        return QualitySummary(sortedValues.count, float(values[0]), float(values[sortedValues.count - 1]),
+                              sortedValues.mean, float(values[sortedValues.count // 2]))
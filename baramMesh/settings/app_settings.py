@@ -27,6 +27,7 @@ class SettingKey(Enum):
     PARALLEL_NP = 'parallel_np'
     PARALLEL_TYPE = 'parallel_type'
     PARALLEL_HOSTFILE = 'parallel_hostfile'
+    DEFER_CHECK_MESH = 'defer_check_mesh'
 
 
 class AppSettings:
@@ -136,6 +137,12 @@ class AppSettings:
     def updateParaviewInstalledPath(self, path):
         self._set(SettingKey.PARAVIEW_INSTALLED_PATH, path)
 
+    def isCheckMeshDeferred(self):
+        return self._get(SettingKey.DEFER_CHECK_MESH, False)
+
+    def setCheckMeshDeferred(self, deferred):
+        return self._set(SettingKey.DEFER_CHECK_MESH, deferred)
+
     def _save(self):
         with open(self._settingsFile, 'w') as file:
             yaml.dump(self._settings, file)
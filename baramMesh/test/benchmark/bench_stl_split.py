@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Times StlImporter.load and split on a corrugated plate, whose folds make long feature edges
+
+    python -m baramMesh.test.benchmark.bench_stl_split [cells per side ...]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from vtkmodules.util.numpy_support import ID_TYPE_CODE, numpy_to_vtk, numpy_to_vtkIdTypeArray
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+from vtkmodules.vtkIOGeometry import vtkSTLWriter
+
+from baramMesh.view.geometry.stl_utility import StlImporter
+
+
+FOLD_PERIOD = 4     # Cells between folds, each of which splits the plate
+FEATURE_ANGLE = 30
+
+
+def writePlate(path: Path, n: int):
+    x, y = np.meshgrid(np.arange(n + 1, dtype=float), np.arange(n + 1, dtype=float), indexing='ij')
+    z = np.abs(x % (2 * FOLD_PERIOD) - FOLD_PERIOD)
+
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    a = (i * (n + 1) + j).ravel()
+    b = a + n + 1
+    triangles = np.concatenate([np.stack([a, b, b + 1], axis=1), np.stack([a, b + 1, a + 1], axis=1)])
+
+    points = vtkPoints()
+    points.SetData(numpy_to_vtk(np.stack([x.ravel(), y.ravel(), z.ravel()], axis=1), deep=1))
+
+    polys = vtkCellArray()
+    polys.SetData(numpy_to_vtkIdTypeArray(np.arange(0, triangles.size + 1, 3, dtype=ID_TYPE_CODE), deep=1),
+                  numpy_to_vtkIdTypeArray(triangles.ravel().astype(ID_TYPE_CODE), deep=1))
+
+    plate = vtkPolyData()
+    plate.SetPoints(points)
+    plate.SetPolys(polys)
+
+    writer = vtkSTLWriter()
+    writer.SetFileName(str(path))
+    writer.SetInputData(plate)
+    writer.SetFileTypeToBinary()
+    writer.Write()
+
+    return len(triangles)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [200, 500, 1000]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'plate.stl'
+        for n in sizes:
+            triangles = writePlate(path, n)
+
+            importer = StlImporter()
+            t = time.perf_counter()
+            importer.load([path])
+            loaded = time.perf_counter() - t
+
+            t = time.perf_counter()
+            segments, _, edges = importer.split(FEATURE_ANGLE, 0)
+            split = time.perf_counter() - t
+
+            print(f'{triangles} triangles: load {loaded:.2f}s, '
+                  f'split {split:.2f}s with {edges.GetNumberOfCells()} feature edges into {len(segments)} regions')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from vtkmodules.vtkFiltersSources import vtkConeSource, vtkCubeSource, vtkSphereSource
+
+from baramMesh.db.configurations import Configurations
+from baramMesh.db.configurations_schema import schema
+
+
+def _polyData(source):
+    source.Update()
+
+    return source.GetOutput()
+
+
+class TestConfigurations(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _load(self):
+        db = Configurations(schema)
+        db.load(self._path)
+
+        return db
+
+    def testSave(self):
+        sphere = _polyData(vtkSphereSource())
+        cube = _polyData(vtkCubeSource())
+        cone = _polyData(vtkConeSource())
+
+        db = Configurations(schema)
+        db.create(self._path)
+        data = db.checkout()
+        sphereKey = data.addGeometryPolyData(sphere)
+        cubeKey = data.addGeometryPolyData(cube)
+        db.commit(data)
+        db.save()
+
+        db = self._load()
+        self.assertEqual(sphere.GetBounds(), db.geometryBounds(sphereKey))
+        self.assertEqual(cube.GetNumberOfCells(), db.geometryNumberOfCells(cubeKey))
+
+        data = db.checkout()
+        data.removeGeometryPolyData(sphereKey)
+        data.updateGeometryPolyData(cubeKey, cone)
+        coneKey = data.addGeometryPolyData(cone)
+        db.commit(data)
+        db.save()
+
+        db = self._load()
+        self.assertEqual({cubeKey, coneKey}, set(db._files['geometry']))
+        self.assertEqual(cone.GetBounds(), db.geometryPolyData(cubeKey).GetBounds())
+        self.assertEqual(cone.GetNumberOfPoints(), db.geometryPolyData(coneKey).GetNumberOfPoints())
+        self.assertNotIn(db.addGeometryPolyData(sphere), {cubeKey, coneKey})
+
+
+if __name__ == '__main__':
+    unittest.main()
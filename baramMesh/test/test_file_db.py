@@ -0,0 +1,119 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import h5py
+from vtkmodules.vtkFiltersSources import vtkConeSource, vtkCubeSource, vtkSphereSource
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
+
+from baramMesh.db.file_db import FileGroup, StoredPolyData, newFiles, readConfigurations, writeConfigurations
+from baramMesh.db.file_db import CONFIGURATIONS_KEY, _tracksFreeSpace
+
+GEOMETRY = FileGroup.GEOMETRY_POLY_DATA.value
+
+
+def _polyData(source):
+    source.Update()
+
+    return source.GetOutput()
+
+
+class TestFileDB(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name) / 'configurations.h5'
+
+        self._sphere = _polyData(vtkSphereSource())
+        self._cube = _polyData(vtkCubeSource())
+        self._cone = _polyData(vtkConeSource())
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _files(self, **polyData):
+        files = newFiles()
+        files[GEOMETRY].update(polyData)
+
+        return files
+
+    def _assertGeometry(self, expected, stored: StoredPolyData):
+        self.assertIsInstance(stored, StoredPolyData)
+        self.assertEqual(expected.GetBounds(), stored.bounds())
+        self.assertEqual(expected.GetNumberOfCells(), stored.numberOfCells())
+
+        polyData = stored.polyData()
+        self.assertEqual(expected.GetNumberOfPoints(), polyData.GetNumberOfPoints())
+        self.assertEqual(expected.GetNumberOfCells(), polyData.GetNumberOfCells())
+        self.assertEqual(expected.GetBounds(), polyData.GetBounds())
+        self.assertEqual(expected.GetPointData().GetNumberOfArrays(), polyData.GetPointData().GetNumberOfArrays())
+
+    def testRoundTrip(self):
+        writeConfigurations(self._path, 'version: 1', self._files(polyData1=self._sphere, polyData2=self._cube))
+
+        configurations, files, maxIds = readConfigurations(self._path)
+        self.assertEqual(b'version: 1', configurations)
+        self.assertEqual({'polyData1', 'polyData2'}, set(files[GEOMETRY]))
+        self.assertEqual(2, maxIds[GEOMETRY])
+
+        stored = files[GEOMETRY]['polyData1']
+        stored.bounds()
+        stored.numberOfCells()
+        self.assertFalse(stored.isLoaded())
+
+        self._assertGeometry(self._sphere, files[GEOMETRY]['polyData1'])
+        self._assertGeometry(self._cube, files[GEOMETRY]['polyData2'])
+
+    def testIncrementalSave(self):
+        writeConfigurations(self._path, 'version: 1', self._files(polyData1=self._sphere, polyData2=self._cube))
+
+        _, files, _ = readConfigurations(self._path)
+        files[GEOMETRY].update(polyData2=self._cone, polyData3=self._cube, polyData1=None)
+        writeConfigurations(self._path, 'version: 2', files, {'polyData1', 'polyData2', 'polyData3'})
+
+        configurations, files, maxIds = readConfigurations(self._path)
+        self.assertEqual(b'version: 2', configurations)
+        self.assertEqual({'polyData2', 'polyData3'}, set(files[GEOMETRY]))
+        self.assertEqual(3, maxIds[GEOMETRY])
+        self._assertGeometry(self._cone, files[GEOMETRY]['polyData2'])
+        self._assertGeometry(self._cube, files[GEOMETRY]['polyData3'])
+
+    def testIncrementalSaveKeepsUnchangedGeometries(self):
+        writeConfigurations(self._path, 'version: 1', self._files(polyData1=self._sphere, polyData2=self._cube))
+
+        _, files, _ = readConfigurations(self._path)
+        writeConfigurations(self._path, 'version: 2', files, set())
+
+        _, files, _ = readConfigurations(self._path)
+        self._assertGeometry(self._sphere, files[GEOMETRY]['polyData1'])
+        self._assertGeometry(self._cube, files[GEOMETRY]['polyData2'])
+
+    def testLegacyFile(self):
+        writer = vtkXMLPolyDataWriter()
+        writer.SetInputData(self._sphere)
+        writer.WriteToOutputStringOn()
+        writer.Write()
+
+        with h5py.File(self._path, 'w') as f:
+            f[CONFIGURATIONS_KEY] = 'version: 1'
+            f.create_group(GEOMETRY)['polyData1'] = writer.GetOutputString()
+
+        configurations, files, maxIds = readConfigurations(self._path)
+        self.assertEqual(b'version: 1', configurations)
+        self.assertEqual(1, maxIds[GEOMETRY])
+        self._assertGeometry(self._sphere, files[GEOMETRY]['polyData1'])
+
+        _, files, _ = readConfigurations(self._path)
+        files[GEOMETRY]['polyData2'] = self._cube
+        writeConfigurations(self._path, 'version: 2', files, {'polyData2'})
+
+        with h5py.File(self._path, 'r') as f:
+            self.assertTrue(_tracksFreeSpace(f))
+            self.assertIsInstance(f[GEOMETRY]['polyData1'], h5py.Group)
+
+        _, files, _ = readConfigurations(self._path)
+        self._assertGeometry(self._sphere, files[GEOMETRY]['polyData1'])
+        self._assertGeometry(self._cube, files[GEOMETRY]['polyData2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
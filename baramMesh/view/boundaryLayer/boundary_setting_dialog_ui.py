@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'boundary_setting_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QButtonGroup, QCheckBox,
+    QDialog, QFormLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QRadioButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_BoundarySettingDialog(object):
+    def setupUi(self, BoundarySettingDialog):
+        if not BoundarySettingDialog.objectName():
+            BoundarySettingDialog.setObjectName(u"BoundarySettingDialog")
+        BoundarySettingDialog.resize(400, 646)
+        self.verticalLayout_3 = QVBoxLayout(BoundarySettingDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.settings = QWidget(BoundarySettingDialog)
+        self.settings.setObjectName(u"settings")
+        self.verticalLayout = QVBoxLayout(self.settings)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, -1)
+        self.widget = QWidget(self.settings)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.groupName = QLineEdit(self.widget)
+        self.groupName.setObjectName(u"groupName")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.groupName)
+
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label)
+
+        self.numberOfLayers = QLineEdit(self.widget)
+        self.numberOfLayers.setObjectName(u"numberOfLayers")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.numberOfLayers)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(self.settings)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_21 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_21.setObjectName(u"verticalLayout_21")
+        self.finalAndExpansion = QRadioButton(self.groupBox)
+        self.thicknessModelSpecificationRadios = QButtonGroup(BoundarySettingDialog)
+        self.thicknessModelSpecificationRadios.setObjectName(u"thicknessModelSpecificationRadios")
+        self.thicknessModelSpecificationRadios.addButton(self.finalAndExpansion)
+        self.finalAndExpansion.setObjectName(u"finalAndExpansion")
+
+        self.verticalLayout_21.addWidget(self.finalAndExpansion)
+
+        self.finalAndOverall = QRadioButton(self.groupBox)
+        self.thicknessModelSpecificationRadios.addButton(self.finalAndOverall)
+        self.finalAndOverall.setObjectName(u"finalAndOverall")
+
+        self.verticalLayout_21.addWidget(self.finalAndOverall)
+
+        self.firstAndExpansion = QRadioButton(self.groupBox)
+        self.thicknessModelSpecificationRadios.addButton(self.firstAndExpansion)
+        self.firstAndExpansion.setObjectName(u"firstAndExpansion")
+
+        self.verticalLayout_21.addWidget(self.firstAndExpansion)
+
+        self.firstAndOverall = QRadioButton(self.groupBox)
+        self.thicknessModelSpecificationRadios.addButton(self.firstAndOverall)
+        self.firstAndOverall.setObjectName(u"firstAndOverall")
+
+        self.verticalLayout_21.addWidget(self.firstAndOverall)
+
+        self.overallAndExpansion = QRadioButton(self.groupBox)
+        self.thicknessModelSpecificationRadios.addButton(self.overallAndExpansion)
+        self.overallAndExpansion.setObjectName(u"overallAndExpansion")
+
+        self.verticalLayout_21.addWidget(self.overallAndExpansion)
+
+        self.firstAndRelativeFinal = QRadioButton(self.groupBox)
+        self.thicknessModelSpecificationRadios.addButton(self.firstAndRelativeFinal)
+        self.firstAndRelativeFinal.setObjectName(u"firstAndRelativeFinal")
+
+        self.verticalLayout_21.addWidget(self.firstAndRelativeFinal)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+        self.thickness = QWidget(self.settings)
+        self.thickness.setObjectName(u"thickness")
+        self.formLayout_7 = QFormLayout(self.thickness)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.label_31 = QLabel(self.thickness)
+        self.label_31.setObjectName(u"label_31")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_31)
+
+        self.sizeSpecificationRelative = QCheckBox(self.thickness)
+        self.sizeSpecificationRelative.setObjectName(u"sizeSpecificationRelative")
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.sizeSpecificationRelative)
+
+        self.label_32 = QLabel(self.thickness)
+        self.label_32.setObjectName(u"label_32")
+
+        self.formLayout_7.setWidget(1, QFormLayout.LabelRole, self.label_32)
+
+        self.firstLayerThickness = QLineEdit(self.thickness)
+        self.firstLayerThickness.setObjectName(u"firstLayerThickness")
+
+        self.formLayout_7.setWidget(1, QFormLayout.FieldRole, self.firstLayerThickness)
+
+        self.finalLayerThickness = QLineEdit(self.thickness)
+        self.finalLayerThickness.setObjectName(u"finalLayerThickness")
+
+        self.formLayout_7.setWidget(2, QFormLayout.FieldRole, self.finalLayerThickness)
+
+        self.label_33 = QLabel(self.thickness)
+        self.label_33.setObjectName(u"label_33")
+
+        self.formLayout_7.setWidget(2, QFormLayout.LabelRole, self.label_33)
+
+        self.label_34 = QLabel(self.thickness)
+        self.label_34.setObjectName(u"label_34")
+
+        self.formLayout_7.setWidget(3, QFormLayout.LabelRole, self.label_34)
+
+        self.totalThickness = QLineEdit(self.thickness)
+        self.totalThickness.setObjectName(u"totalThickness")
+
+        self.formLayout_7.setWidget(3, QFormLayout.FieldRole, self.totalThickness)
+
+        self.label_35 = QLabel(self.thickness)
+        self.label_35.setObjectName(u"label_35")
+
+        self.formLayout_7.setWidget(4, QFormLayout.LabelRole, self.label_35)
+
+        self.expansionRatio = QLineEdit(self.thickness)
+        self.expansionRatio.setObjectName(u"expansionRatio")
+
+        self.formLayout_7.setWidget(4, QFormLayout.FieldRole, self.expansionRatio)
+
+        self.label_36 = QLabel(self.thickness)
+        self.label_36.setObjectName(u"label_36")
+
+        self.formLayout_7.setWidget(5, QFormLayout.LabelRole, self.label_36)
+
+        self.minTotalThickness = QLineEdit(self.thickness)
+        self.minTotalThickness.setObjectName(u"minTotalThickness")
+
+        self.formLayout_7.setWidget(5, QFormLayout.FieldRole, self.minTotalThickness)
+
+
+        self.verticalLayout.addWidget(self.thickness)
+
+
+        self.verticalLayout_3.addWidget(self.settings)
+
+        self.widget_2 = QWidget(BoundarySettingDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.widget_4 = QWidget(self.widget_2)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout = QHBoxLayout(self.widget_4)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, 0)
+        self.label_4 = QLabel(self.widget_4)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout.addWidget(self.label_4)
+
+        self.horizontalSpacer = QSpacerItem(229, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget_4)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+        self.boundaries = QListWidget(self.widget_2)
+        self.boundaries.setObjectName(u"boundaries")
+        self.boundaries.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout_2.addWidget(self.boundaries)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+        self.widget_5 = QWidget(BoundarySettingDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_3.addWidget(self.widget_5)
+
+
+        self.retranslateUi(BoundarySettingDialog)
+
+        QMetaObject.connectSlotsByName(BoundarySettingDialog)
+    # setupUi
+
+    def retranslateUi(self, BoundarySettingDialog):
+        BoundarySettingDialog.setWindowTitle(QCoreApplication.translate("BoundarySettingDialog", u"Boundary Setting", None))
+        self.label_2.setText(QCoreApplication.translate("BoundarySettingDialog", u"Group Name", None))
+        self.label.setText(QCoreApplication.translate("BoundarySettingDialog", u"Number of Layers", None))
+        self.groupBox.setTitle(QCoreApplication.translate("BoundarySettingDialog", u"Thickness Model Specification", None))
+        self.finalAndExpansion.setText(QCoreApplication.translate("BoundarySettingDialog", u"Final and Expansion", None))
+        self.finalAndOverall.setText(QCoreApplication.translate("BoundarySettingDialog", u"Final and Total", None))
+        self.firstAndExpansion.setText(QCoreApplication.translate("BoundarySettingDialog", u"First and Expansion", None))
+        self.firstAndOverall.setText(QCoreApplication.translate("BoundarySettingDialog", u"First and Total", None))
+        self.overallAndExpansion.setText(QCoreApplication.translate("BoundarySettingDialog", u"Total and Expansion", None))
+        self.firstAndRelativeFinal.setText(QCoreApplication.translate("BoundarySettingDialog", u"First and Relative Final", None))
+        self.label_31.setText(QCoreApplication.translate("BoundarySettingDialog", u"Size Specification", None))
+        self.sizeSpecificationRelative.setText(QCoreApplication.translate("BoundarySettingDialog", u"Relative", None))
+        self.label_32.setText(QCoreApplication.translate("BoundarySettingDialog", u"First Layer Thickness", None))
+        self.label_33.setText(QCoreApplication.translate("BoundarySettingDialog", u"Final Layer Thickness", None))
+        self.label_34.setText(QCoreApplication.translate("BoundarySettingDialog", u"Total Thickness", None))
+        self.label_35.setText(QCoreApplication.translate("BoundarySettingDialog", u"Expansion Ratio", None))
+        self.label_36.setText(QCoreApplication.translate("BoundarySettingDialog", u"Min. Total Thickness", None))
+        self.label_4.setText(QCoreApplication.translate("BoundarySettingDialog", u"Boundary", None))
+        self.select.setText(QCoreApplication.translate("BoundarySettingDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("BoundarySettingDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("BoundarySettingDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'surface_refinement_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QFormLayout,
+    QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+    QListWidget, QListWidgetItem, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_SurfaceRefinementDialog(object):
+    def setupUi(self, SurfaceRefinementDialog):
+        if not SurfaceRefinementDialog.objectName():
+            SurfaceRefinementDialog.setObjectName(u"SurfaceRefinementDialog")
+        SurfaceRefinementDialog.resize(400, 712)
+        self.verticalLayout = QVBoxLayout(SurfaceRefinementDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.parameters = QWidget(SurfaceRefinementDialog)
+        self.parameters.setObjectName(u"parameters")
+        self.verticalLayout_3 = QVBoxLayout(self.parameters)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, -1)
+        self.widget = QWidget(self.parameters)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.groupName = QLineEdit(self.widget)
+        self.groupName.setObjectName(u"groupName")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.groupName)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(self.parameters)
+        self.groupBox.setObjectName(u"groupBox")
+        self.formLayout_2 = QFormLayout(self.groupBox)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.minimumLevel = QLineEdit(self.groupBox)
+        self.minimumLevel.setObjectName(u"minimumLevel")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.minimumLevel)
+
+        self.label_5 = QLabel(self.groupBox)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_5)
+
+        self.maximumLevel = QLineEdit(self.groupBox)
+        self.maximumLevel.setObjectName(u"maximumLevel")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.maximumLevel)
+
+        self.minimumLevelCellSize = QLabel(self.groupBox)
+        self.minimumLevelCellSize.setObjectName(u"minimumLevelCellSize")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.minimumLevelCellSize)
+
+        self.maximumLevelCellSzie = QLabel(self.groupBox)
+        self.maximumLevelCellSzie.setObjectName(u"maximumLevelCellSzie")
+
+        self.formLayout_2.setWidget(3, QFormLayout.FieldRole, self.maximumLevelCellSzie)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox)
+
+        self.widget_4 = QWidget(self.parameters)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_3 = QFormLayout(self.widget_4)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(-1, -1, -1, 0)
+        self.featureEdgeRefinementLevel = QLineEdit(self.widget_4)
+        self.featureEdgeRefinementLevel.setObjectName(u"featureEdgeRefinementLevel")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.featureEdgeRefinementLevel)
+
+        self.label_3 = QLabel(self.widget_4)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_3)
+
+        self.featureEdgeLevelCellSize = QLabel(self.widget_4)
+        self.featureEdgeLevelCellSize.setObjectName(u"featureEdgeLevelCellSize")
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.featureEdgeLevelCellSize)
+
+
+        self.verticalLayout_3.addWidget(self.widget_4)
+
+        self.curvatureRefinement = QGroupBox(self.parameters)
+        self.curvatureRefinement.setObjectName(u"curvatureRefinement")
+        self.curvatureRefinement.setCheckable(True)
+        self.curvatureRefinement.setChecked(True)
+        self.verticalLayout_4 = QVBoxLayout(self.curvatureRefinement)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.label_6 = QLabel(self.curvatureRefinement)
+        self.label_6.setObjectName(u"label_6")
+
+        self.verticalLayout_4.addWidget(self.label_6)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.curvatureNumberOfCells = QLineEdit(self.curvatureRefinement)
+        self.curvatureNumberOfCells.setObjectName(u"curvatureNumberOfCells")
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.curvatureNumberOfCells.sizePolicy().hasHeightForWidth())
+        self.curvatureNumberOfCells.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_3.addWidget(self.curvatureNumberOfCells)
+
+        self.label_11 = QLabel(self.curvatureRefinement)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout_3.addWidget(self.label_11)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_3)
+
+        self.label_7 = QLabel(self.curvatureRefinement)
+        self.label_7.setObjectName(u"label_7")
+
+        self.verticalLayout_4.addWidget(self.label_7)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.curvatureMaximumCellLevel = QLineEdit(self.curvatureRefinement)
+        self.curvatureMaximumCellLevel.setObjectName(u"curvatureMaximumCellLevel")
+        sizePolicy.setHeightForWidth(self.curvatureMaximumCellLevel.sizePolicy().hasHeightForWidth())
+        self.curvatureMaximumCellLevel.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_4.addWidget(self.curvatureMaximumCellLevel)
+
+        self.curvatureCellSize = QLabel(self.curvatureRefinement)
+        self.curvatureCellSize.setObjectName(u"curvatureCellSize")
+
+        self.horizontalLayout_4.addWidget(self.curvatureCellSize)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_4)
+
+        self.excludeSharpSurface = QGroupBox(self.curvatureRefinement)
+        self.excludeSharpSurface.setObjectName(u"excludeSharpSurface")
+        self.excludeSharpSurface.setCheckable(True)
+        self.verticalLayout_5 = QVBoxLayout(self.excludeSharpSurface)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_6 = QWidget(self.excludeSharpSurface)
+        self.widget_6.setObjectName(u"widget_6")
+        self.formLayout_5 = QFormLayout(self.widget_6)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, -1, 0, -1)
+        self.label_9 = QLabel(self.widget_6)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_9)
+
+        self.curvatureMinimumRadius = QLineEdit(self.widget_6)
+        self.curvatureMinimumRadius.setObjectName(u"curvatureMinimumRadius")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.curvatureMinimumRadius)
+
+
+        self.verticalLayout_5.addWidget(self.widget_6)
+
+        self.label_10 = QLabel(self.excludeSharpSurface)
+        self.label_10.setObjectName(u"label_10")
+        self.label_10.setWordWrap(True)
+
+        self.verticalLayout_5.addWidget(self.label_10)
+
+
+        self.verticalLayout_4.addWidget(self.excludeSharpSurface)
+
+
+        self.verticalLayout_3.addWidget(self.curvatureRefinement)
+
+
+        self.verticalLayout.addWidget(self.parameters)
+
+        self.widget_3 = QWidget(SurfaceRefinementDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.widget_2 = QWidget(self.widget_3)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, 0)
+        self.label_4 = QLabel(self.widget_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout.addWidget(self.label_4)
+
+        self.horizontalSpacer = QSpacerItem(229, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.surfaces = QListWidget(self.widget_3)
+        self.surfaces.setObjectName(u"surfaces")
+        self.surfaces.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout_2.addWidget(self.surfaces)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.widget_5 = QWidget(SurfaceRefinementDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+
+        self.retranslateUi(SurfaceRefinementDialog)
+        self.cancel.clicked.connect(SurfaceRefinementDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(SurfaceRefinementDialog)
+    # setupUi
+
+    def retranslateUi(self, SurfaceRefinementDialog):
+        SurfaceRefinementDialog.setWindowTitle(QCoreApplication.translate("SurfaceRefinementDialog", u"Surface Refinement", None))
+        self.label.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Group Name", None))
+        self.groupBox.setTitle(QCoreApplication.translate("SurfaceRefinementDialog", u"Surface Refinement", None))
+        self.label_2.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Minimum Level", None))
+        self.label_5.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Maximum Level", None))
+        self.minimumLevelCellSize.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"TextLabel", None))
+        self.maximumLevelCellSzie.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"TextLabel", None))
+        self.label_3.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Feature Edge Refinemenet Level", None))
+        self.featureEdgeLevelCellSize.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"TextLabel", None))
+        self.curvatureRefinement.setTitle(QCoreApplication.translate("SurfaceRefinementDialog", u"Curvature Refinement", None))
+        self.label_6.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Number(N) of Cells per Radius(R) of Curvature", None))
+        self.label_11.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"cell size <b>(=R/N)</b>", None))
+        self.label_7.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Maximum Cell Level", None))
+        self.curvatureCellSize.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"TextLabel", None))
+        self.excludeSharpSurface.setTitle(QCoreApplication.translate("SurfaceRefinementDialog", u"Do not refine sharp surface", None))
+        self.label_9.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Minimum Radius of Curvature", None))
+        self.label_10.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Faces whose radius of curvature is smaller than this will not be refined.", None))
+        self.label_4.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Surfaces", None))
+        self.select.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("SurfaceRefinementDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'volume_refinement_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QDialog,
+    QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from widgets.python_combo_box import PythonComboBox
+from widgets.typed_edit import FloatEdit
+
+class Ui_VolumeeRefinementDialog(object):
+    def setupUi(self, VolumeeRefinementDialog):
+        if not VolumeeRefinementDialog.objectName():
+            VolumeeRefinementDialog.setObjectName(u"VolumeeRefinementDialog")
+        VolumeeRefinementDialog.resize(400, 824)
+        self.verticalLayout = QVBoxLayout(VolumeeRefinementDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.parameters = QWidget(VolumeeRefinementDialog)
+        self.parameters.setObjectName(u"parameters")
+        self.verticalLayout_7 = QVBoxLayout(self.parameters)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(-1, -1, -1, 0)
+        self.widget_7 = QWidget(self.parameters)
+        self.widget_7.setObjectName(u"widget_7")
+        self.formLayout = QFormLayout(self.widget_7)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_7)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.groupName = QLineEdit(self.widget_7)
+        self.groupName.setObjectName(u"groupName")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.groupName)
+
+
+        self.verticalLayout_7.addWidget(self.widget_7)
+
+        self.omnidirectional = QWidget(self.parameters)
+        self.omnidirectional.setObjectName(u"omnidirectional")
+        self.verticalLayout_3 = QVBoxLayout(self.omnidirectional)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, -1, 0, -1)
+        self.widget = QWidget(self.omnidirectional)
+        self.widget.setObjectName(u"widget")
+        self.formLayout_3 = QFormLayout(self.widget)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.volumeRefinementLevel = QLineEdit(self.widget)
+        self.volumeRefinementLevel.setObjectName(u"volumeRefinementLevel")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.volumeRefinementLevel)
+
+        self.cellSize = QLabel(self.widget)
+        self.cellSize.setObjectName(u"cellSize")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.cellSize)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+        self.gapRefinement = QGroupBox(self.omnidirectional)
+        self.gapRefinement.setObjectName(u"gapRefinement")
+        self.gapRefinement.setCheckable(True)
+        self.formLayout_2 = QFormLayout(self.gapRefinement)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.label_3 = QLabel(self.gapRefinement)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_3)
+
+        self.minCellLayers = QLineEdit(self.gapRefinement)
+        self.minCellLayers.setObjectName(u"minCellLayers")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.minCellLayers)
+
+        self.label_5 = QLabel(self.gapRefinement)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_5)
+
+        self.detectionStartLevel = QLineEdit(self.gapRefinement)
+        self.detectionStartLevel.setObjectName(u"detectionStartLevel")
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.detectionStartLevel)
+
+        self.label_6 = QLabel(self.gapRefinement)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_6)
+
+        self.maxRefinementLevel = QLineEdit(self.gapRefinement)
+        self.maxRefinementLevel.setObjectName(u"maxRefinementLevel")
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.maxRefinementLevel)
+
+        self.label_7 = QLabel(self.gapRefinement)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_2.setWidget(3, QFormLayout.LabelRole, self.label_7)
+
+        self.direction = PythonComboBox(self.gapRefinement)
+        self.direction.setObjectName(u"direction")
+
+        self.formLayout_2.setWidget(3, QFormLayout.FieldRole, self.direction)
+
+        self.gapSelf = QCheckBox(self.gapRefinement)
+        self.gapSelf.setObjectName(u"gapSelf")
+
+        self.formLayout_2.setWidget(4, QFormLayout.SpanningRole, self.gapSelf)
+
+
+        self.verticalLayout_3.addWidget(self.gapRefinement)
+
+
+        self.verticalLayout_7.addWidget(self.omnidirectional)
+
+        self.levelIncrement = QGroupBox(self.parameters)
+        self.levelIncrement.setObjectName(u"levelIncrement")
+        self.levelIncrement.setCheckable(True)
+        self.verticalLayout_8 = QVBoxLayout(self.levelIncrement)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.groupBox = QGroupBox(self.levelIncrement)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget_4 = QWidget(self.groupBox)
+        self.widget_4.setObjectName(u"widget_4")
+        self.formLayout_4 = QFormLayout(self.widget_4)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_15 = QLabel(self.widget_4)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.splitCountX = FloatEdit(self.widget_4)
+        self.splitCountX.setObjectName(u"splitCountX")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.splitCountX.sizePolicy().hasHeightForWidth())
+        self.splitCountX.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.splitCountX)
+
+        self.label_16 = QLabel(self.widget_4)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_16)
+
+        self.splitCountY = FloatEdit(self.widget_4)
+        self.splitCountY.setObjectName(u"splitCountY")
+        sizePolicy.setHeightForWidth(self.splitCountY.sizePolicy().hasHeightForWidth())
+        self.splitCountY.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.splitCountY)
+
+        self.label_17 = QLabel(self.widget_4)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_17)
+
+        self.splitCountZ = FloatEdit(self.widget_4)
+        self.splitCountZ.setObjectName(u"splitCountZ")
+        sizePolicy.setHeightForWidth(self.splitCountZ.sizePolicy().hasHeightForWidth())
+        self.splitCountZ.setSizePolicy(sizePolicy)
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.splitCountZ)
+
+
+        self.verticalLayout_5.addWidget(self.widget_4)
+
+        self.label_9 = QLabel(self.groupBox)
+        self.label_9.setObjectName(u"label_9")
+
+        self.verticalLayout_5.addWidget(self.label_9)
+
+
+        self.verticalLayout_8.addWidget(self.groupBox)
+
+        self.groupBox_2 = QGroupBox(self.levelIncrement)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.verticalLayout_6 = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.label_10 = QLabel(self.groupBox_2)
+        self.label_10.setObjectName(u"label_10")
+
+        self.verticalLayout_6.addWidget(self.label_10)
+
+        self.widget_6 = QWidget(self.groupBox_2)
+        self.widget_6.setObjectName(u"widget_6")
+        self.formLayout_5 = QFormLayout(self.widget_6)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.label_18 = QLabel(self.widget_6)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_18)
+
+        self.directionalMinLevel = FloatEdit(self.widget_6)
+        self.directionalMinLevel.setObjectName(u"directionalMinLevel")
+        sizePolicy.setHeightForWidth(self.directionalMinLevel.sizePolicy().hasHeightForWidth())
+        self.directionalMinLevel.setSizePolicy(sizePolicy)
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.directionalMinLevel)
+
+        self.label_19 = QLabel(self.widget_6)
+        self.label_19.setObjectName(u"label_19")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_19)
+
+        self.directionalMaxLevel = FloatEdit(self.widget_6)
+        self.directionalMaxLevel.setObjectName(u"directionalMaxLevel")
+        sizePolicy.setHeightForWidth(self.directionalMaxLevel.sizePolicy().hasHeightForWidth())
+        self.directionalMaxLevel.setSizePolicy(sizePolicy)
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.directionalMaxLevel)
+
+
+        self.verticalLayout_6.addWidget(self.widget_6)
+
+
+        self.verticalLayout_8.addWidget(self.groupBox_2)
+
+
+        self.verticalLayout_7.addWidget(self.levelIncrement)
+
+
+        self.verticalLayout.addWidget(self.parameters)
+
+        self.widget_3 = QWidget(VolumeeRefinementDialog)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout_2 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_2 = QWidget(self.widget_3)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, 0)
+        self.label_4 = QLabel(self.widget_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout.addWidget(self.label_4)
+
+        self.horizontalSpacer = QSpacerItem(232, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget_2)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.volumes = QListWidget(self.widget_3)
+        self.volumes.setObjectName(u"volumes")
+        self.volumes.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout_2.addWidget(self.volumes)
+
+
+        self.verticalLayout.addWidget(self.widget_3)
+
+        self.widget_5 = QWidget(VolumeeRefinementDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_5)
+
+
+        self.retranslateUi(VolumeeRefinementDialog)
+        self.cancel.clicked.connect(VolumeeRefinementDialog.reject)
+
+        self.ok.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(VolumeeRefinementDialog)
+    # setupUi
+
+    def retranslateUi(self, VolumeeRefinementDialog):
+        VolumeeRefinementDialog.setWindowTitle(QCoreApplication.translate("VolumeeRefinementDialog", u"Volume Refinement", None))
+        self.label.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Group Name", None))
+        self.label_2.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Volume Refinement Level", None))
+        self.cellSize.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"TextLabel", None))
+        self.gapRefinement.setTitle(QCoreApplication.translate("VolumeeRefinementDialog", u"Gap Refinement", None))
+        self.label_3.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Min. Cell Layers in a gap (n, n>3)", None))
+        self.label_5.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Gap Detection Start Level", None))
+        self.label_6.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Max. Refinement Level", None))
+        self.label_7.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Direction", None))
+        self.gapSelf.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Include surface's own gap", None))
+        self.levelIncrement.setTitle(QCoreApplication.translate("VolumeeRefinementDialog", u"Level Increment", None))
+        self.groupBox.setTitle(QCoreApplication.translate("VolumeeRefinementDialog", u"Split Count per Direction", None))
+        self.label_15.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"X (0~10)", None))
+        self.label_16.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Y (0~10)", None))
+        self.label_17.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Z (0~10)", None))
+        self.label_9.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Directional Refinement is applied after all other refinement.", None))
+        self.groupBox_2.setTitle("")
+        self.label_10.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Applied to the cells of refinement level in the range inclusive.", None))
+        self.label_18.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Min. Level (0~10)", None))
+        self.label_19.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Max. Level (0~10)", None))
+        self.label_4.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Volume", None))
+        self.select.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Select", None))
+        self.ok.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("VolumeeRefinementDialog", u"Cancel", None))
+    # retranslateUi
+
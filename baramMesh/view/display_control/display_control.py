@@ -176,6 +176,9 @@ class DisplayControl(QObject):
         else:
             self._meshQualityInfo.hide()
 
+    def meshQualityFieldsLoaded(self):
+        self._meshQualityInfo.refresh()
+
     def clear(self):
         self._ui.rendering.setChecked(True)
         self._cutTool.hide()
@@ -1,17 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+
+import qasync
 from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QLabel
 from superqt import QLabeledDoubleRangeSlider
 from vtkmodules.vtkRenderingAnnotation import vtkScalarBarActor
 
 from baramMesh.app import app
-from baramMesh.rendering.actor_info import MeshQualityIndex
+from baramMesh.rendering.mesh_quality import MeshQualityIndex
 from baramMesh.view.main_window.main_window_ui import Ui_MainWindow
 from libbaram.colormap import sequentialRedLut
+from widgets.histogram_widget import HistogramWidget
 from widgets.rendering.rendering_widget import RenderingWidget
 
 
+HISTOGRAM_BINS = 64
+
+
 class MeshQualityInfo(QObject):
     def __init__(self, ui: Ui_MainWindow):
         super().__init__()
@@ -38,6 +46,13 @@ class MeshQualityInfo(QObject):
         self._slider.setRange(0, 100)
         self._slider.setValue((10, 20))
 
+        # Distribution of the metric over the range of the slider, and the number of cells in the band
+        self._histogram = HistogramWidget(ui.meshQualityGroupBox)
+        self._bandInfo = QLabel(ui.meshQualityGroupBox)
+        layout = ui.meshQualityGroupBox.layout()
+        layout.insertWidget(layout.indexOf(ui.meshQualityApply.parentWidget()), self._bandInfo)
+        layout.insertWidget(layout.indexOf(self._bandInfo), self._histogram)
+
         self._legend = None
 
         self._connectSignalsSlots(ui)
@@ -53,23 +68,52 @@ class MeshQualityInfo(QObject):
         self._header.setChecked(False)
         self._widget.show()
 
+    def refresh(self):
+        if self._header.isChecked():
+            self._meshQualityIndexChanged(self._index.currentIndex())
+
     def _connectSignalsSlots(self, ui):
         self._header.toggled.connect(self._toggled)
         self._index.currentIndexChanged.connect(self._meshQualityIndexChanged)
+        self._slider.valueChanged.connect(self._bandChanged)
         self._applyButton.clicked.connect(self._apply)
 
     def _toggled(self, checked):
         if checked:
-            self._index.setCurrentIndex(0)
+            if self._index.currentIndex() == 0:
+                self._meshQualityIndexChanged(0)
+            else:
+                self._index.setCurrentIndex(0)
         else:
             self._clean()
 
         self._view.refresh()
 
-    def _meshQualityIndexChanged(self, index: int):
+    @qasync.asyncSlot()
+    async def _meshQualityIndexChanged(self, index: int):
         qualityIndex: MeshQualityIndex = self._index.itemData(index)
 
+        self._histogram.clear()
+        self._bandInfo.clear()
+
         if app.window.meshManager:
+            statistics = app.window.meshManager.qualityStatistics()
+            if statistics is not None and not statistics.hasMetric(qualityIndex):
+                # Quality fields of steps whose checkMesh was deferred are written when first looked at,
+                # and this is called again by refresh() when they are loaded
+                self._bandInfo.setText(self.tr('Checking mesh quality...'))
+                loaded = await app.window.meshManager.loadQualityFields()
+
+                statistics = app.window.meshManager.qualityStatistics() if app.window.meshManager else None
+                if self._index.currentData() == qualityIndex and (
+                        statistics is None or not statistics.hasMetric(qualityIndex)):
+                    if loaded:
+                        self._bandInfo.clear()
+                    else:
+                        self._bandInfo.setText(self.tr('Mesh quality check failed or was canceled.'))
+
+                return
+
             left, right = app.window.meshManager.getScalarRange(qualityIndex)
 
             # superqt Slider has an issue when left and right are same
@@ -84,8 +128,39 @@ class MeshQualityInfo(QObject):
             self._slider.setRange(left, right)
             self._slider.setValue((left, right))
 
-    def _apply(self):
+            # Sorting the values of a large mesh takes a while, but only once for each metric
+            if statistics is None:
+                return
+
+            await asyncio.to_thread(statistics.index, qualityIndex)
+            if self._index.currentData() == qualityIndex and app.window.meshManager:
+                self._histogram.setHistogram(*statistics.histogram(qualityIndex, HISTOGRAM_BINS, left, right))
+                self._bandChanged(self._slider.value())
+
+    def _bandChanged(self, band):
         qualityIndex: MeshQualityIndex = self._index.currentData()
+        if not app.window.meshManager or (statistics := app.window.meshManager.qualityStatistics()) is None:
+            return
+
+        if not statistics.isIndexed(qualityIndex):
+            return
+
+        low, high = band
+        count = statistics.count(qualityIndex, low, high)
+        summary = statistics.summary(qualityIndex)
+        total = summary.count if summary else 0
+        self._histogram.setBand(low, high)
+        self._bandInfo.setText(self.tr('{0:,} of {1:,} cells ({2:.1f}%)').format(
+            count, total, count / total * 100 if total else 0))
+
+    @qasync.asyncSlot()
+    async def _apply(self):
+        qualityIndex: MeshQualityIndex = self._index.currentData()
+
+        # The filter takes the cells of the band from the sorted metric, which is sorted in a thread if not yet
+        statistics = app.window.meshManager.qualityStatistics() if app.window.meshManager else None
+        if statistics is not None:
+            await asyncio.to_thread(statistics.index, qualityIndex)
 
         if app.window.meshManager:
             app.window.meshManager.setScalar(qualityIndex)
@@ -108,6 +183,9 @@ class MeshQualityInfo(QObject):
             self._view.removeActor(self._legend)
             self._legend = None
 
+        self._histogram.clear()
+        self._bandInfo.clear()
+
         if app.window.meshManager:
             app.window.meshManager.clearCellFilter()
 
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'export_2D_plane_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QFrame, QHBoxLayout, QLabel, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+from widgets.typed_edit import FloatEdit
+import resource_rc
+import resource_rc
+
+class Ui_Export2DPlaneDialog(object):
+    def setupUi(self, Export2DPlaneDialog):
+        if not Export2DPlaneDialog.objectName():
+            Export2DPlaneDialog.setObjectName(u"Export2DPlaneDialog")
+        Export2DPlaneDialog.resize(600, 201)
+        self.verticalLayout_2 = QVBoxLayout(Export2DPlaneDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.path = QFrame(Export2DPlaneDialog)
+        self.path.setObjectName(u"path")
+        self.path.setFrameShape(QFrame.Box)
+        self.path.setFrameShadow(QFrame.Raised)
+
+        self.verticalLayout_2.addWidget(self.path)
+
+        self.parameters = QFrame(Export2DPlaneDialog)
+        self.parameters.setObjectName(u"parameters")
+        self.parameters.setFrameShape(QFrame.Box)
+        self.parameters.setFrameShadow(QFrame.Raised)
+        self.verticalLayout = QVBoxLayout(self.parameters)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(self.parameters)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(0, -1, 0, 0)
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_4)
+
+        self.thickness = FloatEdit(self.widget)
+        self.thickness.setObjectName(u"thickness")
+        self.thickness.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.thickness)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.verticalLayout_2.addWidget(self.parameters)
+
+        self.widget_2 = QWidget(Export2DPlaneDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.run = QCheckBox(self.widget_2)
+        self.run.setObjectName(u"run")
+
+        self.horizontalLayout_6.addWidget(self.run)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_6.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_6.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+
+        self.retranslateUi(Export2DPlaneDialog)
+        self.cancel.clicked.connect(Export2DPlaneDialog.reject)
+
+        QMetaObject.connectSlotsByName(Export2DPlaneDialog)
+    # setupUi
+
+    def retranslateUi(self, Export2DPlaneDialog):
+        Export2DPlaneDialog.setWindowTitle(QCoreApplication.translate("Export2DPlaneDialog", u"Export as 2D Plane BaramFlow Project", None))
+        self.label_4.setText(QCoreApplication.translate("Export2DPlaneDialog", u"Thickness", None))
+        self.thickness.setText(QCoreApplication.translate("Export2DPlaneDialog", u"1", None))
+        self.run.setText(QCoreApplication.translate("Export2DPlaneDialog", u"Run BaramFlow on Exported Project", None))
+        self.ok.setText(QCoreApplication.translate("Export2DPlaneDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("Export2DPlaneDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'export_2D_wedge_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFormLayout,
+    QFrame, QGroupBox, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+from widgets.typed_edit import FloatEdit
+import resource_rc
+
+class Ui_Export2DWedgeDialog(object):
+    def setupUi(self, Export2DWedgeDialog):
+        if not Export2DWedgeDialog.objectName():
+            Export2DWedgeDialog.setObjectName(u"Export2DWedgeDialog")
+        Export2DWedgeDialog.resize(600, 366)
+        self.verticalLayout_3 = QVBoxLayout(Export2DWedgeDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.path = QFrame(Export2DWedgeDialog)
+        self.path.setObjectName(u"path")
+        self.path.setFrameShape(QFrame.Box)
+        self.path.setFrameShadow(QFrame.Raised)
+
+        self.verticalLayout_3.addWidget(self.path)
+
+        self.parameters = QFrame(Export2DWedgeDialog)
+        self.parameters.setObjectName(u"parameters")
+        self.parameters.setFrameShape(QFrame.Box)
+        self.parameters.setFrameShadow(QFrame.Raised)
+        self.verticalLayout = QVBoxLayout(self.parameters)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(self.parameters)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_5 = QLabel(self.widget)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.angle = FloatEdit(self.widget)
+        self.angle.setObjectName(u"angle")
+        self.angle.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.angle)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(self.parameters)
+        self.groupBox.setObjectName(u"groupBox")
+        self.horizontalLayout_5 = QHBoxLayout(self.groupBox)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.groupBox_2 = QGroupBox(self.groupBox)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_3 = QFormLayout(self.groupBox_2)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.originX = FloatEdit(self.groupBox_2)
+        self.originX.setObjectName(u"originX")
+        self.originX.setEnabled(True)
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.originX)
+
+        self.label_7 = QLabel(self.groupBox_2)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.originY = FloatEdit(self.groupBox_2)
+        self.originY.setObjectName(u"originY")
+        self.originY.setEnabled(True)
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.originY)
+
+        self.label_8 = QLabel(self.groupBox_2)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout_3.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.originZ = FloatEdit(self.groupBox_2)
+        self.originZ.setObjectName(u"originZ")
+        self.originZ.setEnabled(True)
+
+        self.formLayout_3.setWidget(2, QFormLayout.FieldRole, self.originZ)
+
+
+        self.horizontalLayout_5.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.groupBox)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_4 = QFormLayout(self.groupBox_3)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_9 = QLabel(self.groupBox_3)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.directionX = FloatEdit(self.groupBox_3)
+        self.directionX.setObjectName(u"directionX")
+        self.directionX.setEnabled(True)
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.directionX)
+
+        self.label_10 = QLabel(self.groupBox_3)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_10)
+
+        self.directionY = FloatEdit(self.groupBox_3)
+        self.directionY.setObjectName(u"directionY")
+        self.directionY.setEnabled(True)
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.directionY)
+
+        self.label_11 = QLabel(self.groupBox_3)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_11)
+
+        self.directionZ = FloatEdit(self.groupBox_3)
+        self.directionZ.setObjectName(u"directionZ")
+        self.directionZ.setEnabled(True)
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.directionZ)
+
+
+        self.horizontalLayout_5.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout.addWidget(self.groupBox)
+
+
+        self.verticalLayout_3.addWidget(self.parameters)
+
+        self.widget_2 = QWidget(Export2DWedgeDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.run = QCheckBox(self.widget_2)
+        self.run.setObjectName(u"run")
+
+        self.horizontalLayout_6.addWidget(self.run)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_6.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_6.addWidget(self.cancel)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+
+        self.retranslateUi(Export2DWedgeDialog)
+        self.cancel.clicked.connect(Export2DWedgeDialog.reject)
+
+        QMetaObject.connectSlotsByName(Export2DWedgeDialog)
+    # setupUi
+
+    def retranslateUi(self, Export2DWedgeDialog):
+        Export2DWedgeDialog.setWindowTitle(QCoreApplication.translate("Export2DWedgeDialog", u"Export as 2D Wedge BaramFlow Project", None))
+        self.label_5.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Angle (degree)", None))
+        self.angle.setText(QCoreApplication.translate("Export2DWedgeDialog", u"1", None))
+        self.groupBox.setTitle(QCoreApplication.translate("Export2DWedgeDialog", u"Axis", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("Export2DWedgeDialog", u"Origin", None))
+        self.label_6.setText(QCoreApplication.translate("Export2DWedgeDialog", u"X", None))
+        self.originX.setText(QCoreApplication.translate("Export2DWedgeDialog", u"0", None))
+        self.label_7.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Y", None))
+        self.originY.setText(QCoreApplication.translate("Export2DWedgeDialog", u"0", None))
+        self.label_8.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Z", None))
+        self.originZ.setText(QCoreApplication.translate("Export2DWedgeDialog", u"0", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("Export2DWedgeDialog", u"Direction", None))
+        self.label_9.setText(QCoreApplication.translate("Export2DWedgeDialog", u"X", None))
+        self.directionX.setText(QCoreApplication.translate("Export2DWedgeDialog", u"1", None))
+        self.label_10.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Y", None))
+        self.directionY.setText(QCoreApplication.translate("Export2DWedgeDialog", u"0", None))
+        self.label_11.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Z", None))
+        self.directionZ.setText(QCoreApplication.translate("Export2DWedgeDialog", u"0", None))
+        self.run.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Run BaramFlow on Exported Project", None))
+        self.ok.setText(QCoreApplication.translate("Export2DWedgeDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("Export2DWedgeDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'export_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QDialog, QFrame,
+    QHBoxLayout, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+
+class Ui_ExportDialog(object):
+    def setupUi(self, ExportDialog):
+        if not ExportDialog.objectName():
+            ExportDialog.setObjectName(u"ExportDialog")
+        ExportDialog.setWindowModality(Qt.ApplicationModal)
+        ExportDialog.resize(421, 140)
+        self.verticalLayout = QVBoxLayout(ExportDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.path = QFrame(ExportDialog)
+        self.path.setObjectName(u"path")
+        self.path.setFrameShape(QFrame.Box)
+        self.path.setFrameShadow(QFrame.Raised)
+
+        self.verticalLayout.addWidget(self.path)
+
+        self.widget_2 = QWidget(ExportDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.run = QCheckBox(self.widget_2)
+        self.run.setObjectName(u"run")
+
+        self.horizontalLayout_6.addWidget(self.run)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget_2)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_6.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_2)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_6.addWidget(self.cancel)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(ExportDialog)
+        self.cancel.clicked.connect(ExportDialog.reject)
+        self.ok.clicked.connect(ExportDialog.accept)
+
+        QMetaObject.connectSlotsByName(ExportDialog)
+    # setupUi
+
+    def retranslateUi(self, ExportDialog):
+        ExportDialog.setWindowTitle(QCoreApplication.translate("ExportDialog", u"Export as BaramFlow Project", None))
+        self.run.setText(QCoreApplication.translate("ExportDialog", u"Run BaramFlow on Exported Project", None))
+        self.ok.setText(QCoreApplication.translate("ExportDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("ExportDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -25,6 +25,7 @@ from baramMesh.openfoam.system.create_patch_dict import CreatePatchDict
 from baramMesh.openfoam.system.extrude_mesh_dict import ExtrudeMeshDict
 from baramMesh.openfoam.system.topo_set_dict import TopoSetDict
 from baramMesh.openfoam.utility.restore_cyclic_patch_names import RestoreCyclicPatchNames
+from baramMesh.openfoam.utility.snappy_hex_mesh import snappyHexMesh
 from baramMesh.view.step_page import StepPage
 from .export_dialog import ExportDialog
 from .export_2D_plane_dialog import Export2DPlaneDialog
@@ -77,6 +78,9 @@ class ExportPage(StepPage):
 
             self.clearResult()
 
+            # Quality fields of the last step are copied with the mesh
+            await snappyHexMesh.waitForCheckMesh()
+
             console = app.consoleView
             console.clear()
 
@@ -102,8 +106,7 @@ class ExportPage(StepPage):
                     lastMeshTime = self.OUTPUT_TIME - 2  # Snap step
 
                 if parallel.isParallelOn():
-                    for n in range(parallel.np()):
-                        await fileSystem.copyTimeDirectory(lastMeshTime, self.OUTPUT_TIME, n)
+                    await fileSystem.copyTimeDirectories(lastMeshTime, self.OUTPUT_TIME, range(parallel.np()))
                 else:
                     await fileSystem.copyTimeDirectory(lastMeshTime, self.OUTPUT_TIME)
 
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'geometry_add_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QDialog, QGroupBox,
+    QHBoxLayout, QPushButton, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_GeometryAddDialog(object):
+    def setupUi(self, GeometryAddDialog):
+        if not GeometryAddDialog.objectName():
+            GeometryAddDialog.setObjectName(u"GeometryAddDialog")
+        GeometryAddDialog.resize(238, 200)
+        self.verticalLayout_2 = QVBoxLayout(GeometryAddDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(GeometryAddDialog)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout = QVBoxLayout(self.groupBox)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.hex = QRadioButton(self.groupBox)
+        self.shapeRadios = QButtonGroup(GeometryAddDialog)
+        self.shapeRadios.setObjectName(u"shapeRadios")
+        self.shapeRadios.addButton(self.hex)
+        self.hex.setObjectName(u"hex")
+        self.hex.setChecked(True)
+
+        self.verticalLayout.addWidget(self.hex)
+
+        self.cylinder = QRadioButton(self.groupBox)
+        self.shapeRadios.addButton(self.cylinder)
+        self.cylinder.setObjectName(u"cylinder")
+
+        self.verticalLayout.addWidget(self.cylinder)
+
+        self.sphere = QRadioButton(self.groupBox)
+        self.shapeRadios.addButton(self.sphere)
+        self.sphere.setObjectName(u"sphere")
+
+        self.verticalLayout.addWidget(self.sphere)
+
+        self.hex6 = QRadioButton(self.groupBox)
+        self.shapeRadios.addButton(self.hex6)
+        self.hex6.setObjectName(u"hex6")
+
+        self.verticalLayout.addWidget(self.hex6)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.widget_6 = QWidget(GeometryAddDialog)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalSpacer = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer)
+
+        self.next = QPushButton(self.widget_6)
+        self.next.setObjectName(u"next")
+
+        self.horizontalLayout_4.addWidget(self.next)
+
+        self.cancel = QPushButton(self.widget_6)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_4.addWidget(self.cancel)
+
+
+        self.verticalLayout_2.addWidget(self.widget_6)
+
+
+        self.retranslateUi(GeometryAddDialog)
+        self.cancel.clicked.connect(GeometryAddDialog.reject)
+
+        QMetaObject.connectSlotsByName(GeometryAddDialog)
+    # setupUi
+
+    def retranslateUi(self, GeometryAddDialog):
+        GeometryAddDialog.setWindowTitle(QCoreApplication.translate("GeometryAddDialog", u"Add Geometry", None))
+        self.groupBox.setTitle(QCoreApplication.translate("GeometryAddDialog", u"Shape", None))
+        self.hex.setText(QCoreApplication.translate("GeometryAddDialog", u"Hex", None))
+        self.cylinder.setText(QCoreApplication.translate("GeometryAddDialog", u"Cylinder", None))
+        self.sphere.setText(QCoreApplication.translate("GeometryAddDialog", u"Sphere", None))
+        self.hex6.setText(QCoreApplication.translate("GeometryAddDialog", u"Hex6 (6 Sub-Surfaces)", None))
+        self.next.setText(QCoreApplication.translate("GeometryAddDialog", u"Next", None))
+        self.cancel.setText(QCoreApplication.translate("GeometryAddDialog", u"Cancel", None))
+    # retranslateUi
+
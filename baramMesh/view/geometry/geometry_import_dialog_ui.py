@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'geometry_import_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_ImportDialog(object):
+    def setupUi(self, ImportDialog):
+        if not ImportDialog.objectName():
+            ImportDialog.setObjectName(u"ImportDialog")
+        ImportDialog.resize(400, 260)
+        self.verticalLayout = QVBoxLayout(ImportDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ImportDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, 0)
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.select = QPushButton(self.widget)
+        self.select.setObjectName(u"select")
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.files = QListWidget(ImportDialog)
+        self.files.setObjectName(u"files")
+
+        self.verticalLayout.addWidget(self.files)
+
+        self.splitSurface = QGroupBox(ImportDialog)
+        self.splitSurface.setObjectName(u"splitSurface")
+        self.splitSurface.setCheckable(True)
+        self.splitSurface.setChecked(False)
+        self.formLayout = QFormLayout(self.splitSurface)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_2 = QLabel(self.splitSurface)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_2)
+
+        self.featureAngle = QLineEdit(self.splitSurface)
+        self.featureAngle.setObjectName(u"featureAngle")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.featureAngle)
+
+
+        self.verticalLayout.addWidget(self.splitSurface)
+
+        self.buttonBox = QDialogButtonBox(ImportDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(ImportDialog)
+        self.buttonBox.accepted.connect(ImportDialog.accept)
+        self.buttonBox.rejected.connect(ImportDialog.reject)
+
+        QMetaObject.connectSlotsByName(ImportDialog)
+    # setupUi
+
+    def retranslateUi(self, ImportDialog):
+        ImportDialog.setWindowTitle(QCoreApplication.translate("ImportDialog", u"Import STL", None))
+        self.label.setText(QCoreApplication.translate("ImportDialog", u"Files", None))
+        self.select.setText(QCoreApplication.translate("ImportDialog", u"&Select", None))
+        self.splitSurface.setTitle(QCoreApplication.translate("ImportDialog", u"Split Surface", None))
+        self.label_2.setText(QCoreApplication.translate("ImportDialog", u"Feature Angle", None))
+        self.featureAngle.setText(QCoreApplication.translate("ImportDialog", u"60", None))
+    # retranslateUi
+
@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+
 from PySide6.QtCore import Signal
 
+from libbaram.mesh import Bounds
+
 from baramMesh.app import app
 from baramMesh.db.configurations_schema import GeometryType, Shape
 from baramMesh.rendering.actor_info import GeometryActor
@@ -39,6 +43,10 @@ class GeometryManager(ActorManager):
 
         self._syncingMode = None
 
+        # Tri-surface meshes whose actors are added after their poly data is decoded in the background
+        self._pending = {}
+        self._loadingTasks = []
+
         self._displayControl.selectedActorsChanged.connect(self._selectedActorsChanged)
         self._displayControl.selectionApplied.connect(self._clearSyncingToDisplay)
 
@@ -46,7 +54,26 @@ class GeometryManager(ActorManager):
         return app.db.getElements('geometry', lambda i, e: e['volume'] == gId)
 
     def polyData(self, gId):
-        return self._actorInfos[gId].dataSet()
+        return self.actorInfo(gId).dataSet()
+
+    def actorInfo(self, key):
+        self._addPending(key)
+
+        return super().actorInfo(key)
+
+    def getBounds(self):
+        bounds = super().getBounds() if self._actorInfos else None
+        for geometry in self._pending.values():
+            pendingBounds = Bounds(*app.db.geometryBounds(geometry.value('path')))
+            if bounds is None:
+                bounds = pendingBounds
+            else:
+                bounds.merge(pendingBounds)
+
+        return bounds
+
+    def isEmpty(self):
+        return super().isEmpty() and not self._pending
 
     def load(self):
         self.clear()
@@ -54,10 +81,26 @@ class GeometryManager(ActorManager):
 
         geometries = app.db.getElements('geometry')
         for gId, geometry in geometries.items():
-            self._add(gId, geometry, geometries.get(geometry.value('volume')))
+            if (geometry.value('shape') == Shape.TRI_SURFACE_MESH.value
+                    and not app.db.isGeometryLoaded(geometry.value('path'))):
+                self._pending[gId] = geometry
+                self._loadingTasks.append(asyncio.create_task(self._addWhenLoaded(gId, geometry.value('path'))))
+            else:
+                self._add(gId, geometry, geometries.get(geometry.value('volume')))
 
         self.fitDisplay()
 
+    def clear(self):
+        self.cancelLoading()
+        super().clear()
+
+    def cancelLoading(self):
+        for task in self._loadingTasks:
+            task.cancel()
+
+        self._loadingTasks = []
+        self._pending = {}
+
     def addGeometry(self, gId, geometry, volume):
         self._add(gId, geometry, volume)
 
@@ -65,11 +108,13 @@ class GeometryManager(ActorManager):
 
     def updateCustomSurfaces(self, volume, surfaces):
         for gId, surface in surfaces.items():
+            self._addPending(gId)
             self.update(gId, self._surfaceToPolyData(surface, volume))
 
         self.applyToDisplay()
 
     def updateIndependentSurface(self, gId, surface):
+        self._addPending(gId)
         self._updateActorName(gId, surface.value('name'))
         self.update(gId, self._surfaceToPolyData(surface))
 
@@ -77,6 +122,7 @@ class GeometryManager(ActorManager):
 
     def removeGeometry(self, gIds):
         for gId in gIds:
+            self._pending.pop(gId, None)
             self.remove(gId)
 
         self.applyToDisplay()
@@ -153,6 +199,22 @@ class GeometryManager(ActorManager):
                 (z2 - z1) / baseGrid.float('numCellsZ'))
 
 
+    async def _addWhenLoaded(self, gId, key):
+        await app.db.geometryPolyDataAsync(key)
+        self._addPending(gId)
+
+        if self._pending or not self._visibility:
+            self.applyToDisplay()
+        else:
+            self.fitDisplay()
+
+    def _addPending(self, gId):
+        """Adds the actor of the geometry now if it is waiting for its poly data, decoding it if needed"""
+        if geometry := self._pending.pop(gId, None):
+            self._add(gId, geometry, None)
+            if not self._visibility:
+                self._displayControl.hide(self._actorInfos[gId])
+
     def _add(self, gId, geometry, volume):
         if geometry.value('gType') == GeometryType.SURFACE.value:
             self.add(GeometryActor(self._surfaceToPolyData(geometry, volume), gId, geometry.value('name')))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'geometry_page.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QFrame, QHBoxLayout,
+    QHeaderView, QLabel, QPushButton, QSizePolicy,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+import resource_rc
+
+class Ui_GeometryPage(object):
+    def setupUi(self, GeometryPage):
+        if not GeometryPage.objectName():
+            GeometryPage.setObjectName(u"GeometryPage")
+        GeometryPage.resize(400, 426)
+        self.verticalLayout = QVBoxLayout(GeometryPage)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(GeometryPage)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.line = QFrame(GeometryPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout.addWidget(self.line)
+
+        self.list = QTreeWidget(GeometryPage)
+        self.list.headerItem().setText(0, "")
+        self.list.headerItem().setText(1, "")
+        self.list.headerItem().setText(4, "")
+        self.list.headerItem().setText(5, "")
+        self.list.headerItem().setText(6, "")
+        self.list.setObjectName(u"list")
+        self.list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.list.setColumnCount(7)
+        self.list.header().setVisible(True)
+
+        self.verticalLayout.addWidget(self.list)
+
+        self.buttons = QWidget(GeometryPage)
+        self.buttons.setObjectName(u"buttons")
+        self.horizontalLayout = QHBoxLayout(self.buttons)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, -1, 0, -1)
+        self.import_ = QPushButton(self.buttons)
+        self.import_.setObjectName(u"import_")
+
+        self.horizontalLayout.addWidget(self.import_)
+
+        self.add = QPushButton(self.buttons)
+        self.add.setObjectName(u"add")
+
+        self.horizontalLayout.addWidget(self.add)
+
+        self.edit = QPushButton(self.buttons)
+        self.edit.setObjectName(u"edit")
+        self.edit.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.edit)
+
+        self.remove = QPushButton(self.buttons)
+        self.remove.setObjectName(u"remove")
+        self.remove.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.remove)
+
+
+        self.verticalLayout.addWidget(self.buttons)
+
+
+        self.retranslateUi(GeometryPage)
+
+        QMetaObject.connectSlotsByName(GeometryPage)
+    # setupUi
+
+    def retranslateUi(self, GeometryPage):
+        GeometryPage.setWindowTitle(QCoreApplication.translate("GeometryPage", u"Form", None))
+        self.label.setText(QCoreApplication.translate("GeometryPage", u"Geometry", None))
+        ___qtreewidgetitem = self.list.headerItem()
+        ___qtreewidgetitem.setText(3, QCoreApplication.translate("GeometryPage", u"Type", None));
+        ___qtreewidgetitem.setText(2, QCoreApplication.translate("GeometryPage", u"Name", None));
+        self.import_.setText(QCoreApplication.translate("GeometryPage", u"Import", None))
+        self.add.setText(QCoreApplication.translate("GeometryPage", u"Add", None))
+        self.edit.setText(QCoreApplication.translate("GeometryPage", u"Edit", None))
+        self.remove.setText(QCoreApplication.translate("GeometryPage", u"Remove", None))
+    # retranslateUi
+
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'split_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFrame, QGridLayout,
+    QGroupBox, QHBoxLayout, QHeaderView, QLabel,
+    QLineEdit, QPushButton, QSizePolicy, QSlider,
+    QSpacerItem, QSplitter, QTreeWidget, QTreeWidgetItem,
+    QVBoxLayout, QWidget)
+
+from superqt import QDoubleSlider
+from widgets.flat_push_button import FlatPushButton
+from widgets.rendering.rendering_widget import RenderingWidget
+import resource_rc
+
+class Ui_SplitDialog(object):
+    def setupUi(self, SplitDialog):
+        if not SplitDialog.objectName():
+            SplitDialog.setObjectName(u"SplitDialog")
+        SplitDialog.resize(988, 594)
+        self.verticalLayout_3 = QVBoxLayout(SplitDialog)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.splitter = QSplitter(SplitDialog)
+        self.splitter.setObjectName(u"splitter")
+        self.splitter.setOrientation(Qt.Horizontal)
+        self.splitter.setChildrenCollapsible(False)
+        self.groupBox = QGroupBox(self.splitter)
+        self.groupBox.setObjectName(u"groupBox")
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox_1 = QGroupBox(self.groupBox)
+        self.groupBox_1.setObjectName(u"groupBox_1")
+        self.gridLayout = QGridLayout(self.groupBox_1)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setVerticalSpacing(0)
+        self.widget_3 = QWidget(self.groupBox_1)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.widget_3)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_6.addWidget(self.label)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_6.addItem(self.horizontalSpacer_4)
+
+        self.label_2 = QLabel(self.widget_3)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_6.addWidget(self.label_2)
+
+
+        self.gridLayout.addWidget(self.widget_3, 0, 0, 1, 1)
+
+        self.featureAngleSlider = QSlider(self.groupBox_1)
+        self.featureAngleSlider.setObjectName(u"featureAngleSlider")
+        self.featureAngleSlider.setMaximum(180)
+        self.featureAngleSlider.setOrientation(Qt.Horizontal)
+        self.featureAngleSlider.setTickPosition(QSlider.TicksAbove)
+        self.featureAngleSlider.setTickInterval(10)
+
+        self.gridLayout.addWidget(self.featureAngleSlider, 1, 0, 1, 1)
+
+        self.featureAngleText = QLineEdit(self.groupBox_1)
+        self.featureAngleText.setObjectName(u"featureAngleText")
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.featureAngleText.sizePolicy().hasHeightForWidth())
+        self.featureAngleText.setSizePolicy(sizePolicy)
+        self.featureAngleText.setMaximumSize(QSize(48, 16777215))
+        self.featureAngleText.setText(u"30")
+        self.featureAngleText.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.gridLayout.addWidget(self.featureAngleText, 1, 1, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_1)
+
+        self.groupBox_3 = QGroupBox(self.groupBox)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.verticalLayout_4 = QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.widget_11 = QWidget(self.groupBox_3)
+        self.widget_11.setObjectName(u"widget_11")
+        self.gridLayout_2 = QGridLayout(self.widget_11)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.gridLayout_2.setVerticalSpacing(0)
+        self.gridLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.widget_6 = QWidget(self.widget_11)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.label_3 = QLabel(self.widget_6)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_2.addWidget(self.label_3)
+
+        self.horizontalSpacer_5 = QSpacerItem(232, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_5)
+
+        self.label_4 = QLabel(self.widget_6)
+        self.label_4.setObjectName(u"label_4")
+        self.label_4.setText(u"100")
+
+        self.horizontalLayout_2.addWidget(self.label_4)
+
+
+        self.gridLayout_2.addWidget(self.widget_6, 0, 0, 1, 1)
+
+        self.minAreaText = QLineEdit(self.widget_11)
+        self.minAreaText.setObjectName(u"minAreaText")
+        sizePolicy.setHeightForWidth(self.minAreaText.sizePolicy().hasHeightForWidth())
+        self.minAreaText.setSizePolicy(sizePolicy)
+        self.minAreaText.setMaximumSize(QSize(48, 16777215))
+        self.minAreaText.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
+
+        self.gridLayout_2.addWidget(self.minAreaText, 1, 1, 1, 1)
+
+        self.minAreaSlider = QDoubleSlider(self.widget_11)
+        self.minAreaSlider.setObjectName(u"minAreaSlider")
+        self.minAreaSlider.setMaximum(100)
+        self.minAreaSlider.setOrientation(Qt.Horizontal)
+        self.minAreaSlider.setTickPosition(QSlider.TicksAbove)
+        self.minAreaSlider.setTickInterval(10)
+
+        self.gridLayout_2.addWidget(self.minAreaSlider, 1, 0, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.widget_11)
+
+        self.label_5 = QLabel(self.groupBox_3)
+        self.label_5.setObjectName(u"label_5")
+        self.label_5.setTextFormat(Qt.MarkdownText)
+        self.label_5.setWordWrap(True)
+
+        self.verticalLayout_4.addWidget(self.label_5)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_3)
+
+        self.groupBox_8 = QGroupBox(self.groupBox)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.verticalLayout_5 = QVBoxLayout(self.groupBox_8)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget = QWidget(self.groupBox_8)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label_6 = QLabel(self.widget)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_3.addWidget(self.label_6)
+
+        self.numSegments = QLabel(self.widget)
+        self.numSegments.setObjectName(u"numSegments")
+        font = QFont()
+        font.setBold(True)
+        self.numSegments.setFont(font)
+        self.numSegments.setText(u"0")
+
+        self.horizontalLayout_3.addWidget(self.numSegments)
+
+
+        self.verticalLayout_5.addWidget(self.widget)
+
+        self.segments = QTreeWidget(self.groupBox_8)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(0, u"Segment");
+        self.segments.setHeaderItem(__qtreewidgetitem)
+        self.segments.setObjectName(u"segments")
+        self.segments.setFrameShadow(QFrame.Plain)
+
+        self.verticalLayout_5.addWidget(self.segments)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox_8)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.widget_7 = QWidget(self.groupBox)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_2)
+
+        self.apply = QPushButton(self.widget_7)
+        self.apply.setObjectName(u"apply")
+
+        self.horizontalLayout_5.addWidget(self.apply)
+
+
+        self.verticalLayout_2.addWidget(self.widget_7)
+
+        self.splitter.addWidget(self.groupBox)
+        self.groupBox_2 = QGroupBox(self.splitter)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(1)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.groupBox_2.sizePolicy().hasHeightForWidth())
+        self.groupBox_2.setSizePolicy(sizePolicy1)
+        self.verticalLayout = QVBoxLayout(self.groupBox_2)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.toolbar = QWidget(self.groupBox_2)
+        self.toolbar.setObjectName(u"toolbar")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.toolbar.sizePolicy().hasHeightForWidth())
+        self.toolbar.setSizePolicy(sizePolicy2)
+        self.horizontalLayout = QHBoxLayout(self.toolbar)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.axis = FlatPushButton(self.toolbar)
+        self.axis.setObjectName(u"axis")
+        self.axis.setMaximumSize(QSize(32, 32))
+        icon = QIcon()
+        icon.addFile(u":/graphicsIcons/noun-axis-405079", QSize(), QIcon.Normal, QIcon.Off)
+        self.axis.setIcon(icon)
+        self.axis.setIconSize(QSize(22, 22))
+        self.axis.setCheckable(True)
+        self.axis.setChecked(False)
+
+        self.horizontalLayout.addWidget(self.axis)
+
+        self.cubeAxis = FlatPushButton(self.toolbar)
+        self.cubeAxis.setObjectName(u"cubeAxis")
+        self.cubeAxis.setMaximumSize(QSize(32, 32))
+        icon1 = QIcon()
+        icon1.addFile(u":/graphicsIcons/ruler", QSize(), QIcon.Normal, QIcon.Off)
+        self.cubeAxis.setIcon(icon1)
+        self.cubeAxis.setIconSize(QSize(24, 24))
+        self.cubeAxis.setCheckable(True)
+
+        self.horizontalLayout.addWidget(self.cubeAxis)
+
+        self.perspective = FlatPushButton(self.toolbar)
+        self.perspective.setObjectName(u"perspective")
+        self.perspective.setMaximumSize(QSize(32, 32))
+        icon2 = QIcon()
+        icon2.addFile(u":/graphicsIcons/2d-label-icon.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.perspective.setIcon(icon2)
+        self.perspective.setIconSize(QSize(24, 24))
+        self.perspective.setCheckable(True)
+
+        self.horizontalLayout.addWidget(self.perspective)
+
+        self.fit = FlatPushButton(self.toolbar)
+        self.fit.setObjectName(u"fit")
+        self.fit.setMaximumSize(QSize(32, 32))
+        icon3 = QIcon()
+        icon3.addFile(u":/icons/expand.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.fit.setIcon(icon3)
+        self.fit.setIconSize(QSize(24, 24))
+
+        self.horizontalLayout.addWidget(self.fit)
+
+        self.alignAxis = FlatPushButton(self.toolbar)
+        self.alignAxis.setObjectName(u"alignAxis")
+        self.alignAxis.setMaximumSize(QSize(32, 32))
+        icon4 = QIcon()
+        icon4.addFile(u":/graphicsIcons/alignAxis.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.alignAxis.setIcon(icon4)
+        self.alignAxis.setIconSize(QSize(24, 24))
+
+        self.horizontalLayout.addWidget(self.alignAxis)
+
+        self.rotate = FlatPushButton(self.toolbar)
+        self.rotate.setObjectName(u"rotate")
+        self.rotate.setMaximumSize(QSize(32, 32))
+        icon5 = QIcon()
+        icon5.addFile(u":/icons/reload.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.rotate.setIcon(icon5)
+        self.rotate.setIconSize(QSize(24, 24))
+
+        self.horizontalLayout.addWidget(self.rotate)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout.addWidget(self.toolbar)
+
+        self.renderingView = RenderingWidget(self.groupBox_2)
+        self.renderingView.setObjectName(u"renderingView")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.renderingView.sizePolicy().hasHeightForWidth())
+        self.renderingView.setSizePolicy(sizePolicy3)
+        self.renderingView.setContextMenuPolicy(Qt.CustomContextMenu)
+
+        self.verticalLayout.addWidget(self.renderingView)
+
+        self.splitter.addWidget(self.groupBox_2)
+
+        self.verticalLayout_3.addWidget(self.splitter)
+
+        self.widget_5 = QWidget(SplitDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.widget_5.sizePolicy().hasHeightForWidth())
+        self.widget_5.setSizePolicy(sizePolicy4)
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalSpacer_3 = QSpacerItem(573, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_3)
+
+        self.okButton = QPushButton(self.widget_5)
+        self.okButton.setObjectName(u"okButton")
+
+        self.horizontalLayout_4.addWidget(self.okButton)
+
+        self.cancelButton = QPushButton(self.widget_5)
+        self.cancelButton.setObjectName(u"cancelButton")
+
+        self.horizontalLayout_4.addWidget(self.cancelButton)
+
+
+        self.verticalLayout_3.addWidget(self.widget_5)
+
+
+        self.retranslateUi(SplitDialog)
+
+        QMetaObject.connectSlotsByName(SplitDialog)
+    # setupUi
+
+    def retranslateUi(self, SplitDialog):
+        SplitDialog.setWindowTitle(QCoreApplication.translate("SplitDialog", u"Dialog", None))
+        self.groupBox_1.setTitle(QCoreApplication.translate("SplitDialog", u"Feature Angle (Degree)", None))
+        self.label.setText(QCoreApplication.translate("SplitDialog", u"0", None))
+        self.label_2.setText(QCoreApplication.translate("SplitDialog", u"180", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("SplitDialog", u"Area Threshold (%)", None))
+        self.label_3.setText(QCoreApplication.translate("SplitDialog", u"0", None))
+        self.minAreaText.setText(QCoreApplication.translate("SplitDialog", u"0", None))
+        self.label_5.setText(QCoreApplication.translate("SplitDialog", u"Segments smaller than this threshold are assimilated into larger segments **if possible**", None))
+        self.groupBox_8.setTitle(QCoreApplication.translate("SplitDialog", u"Segments", None))
+        self.label_6.setText(QCoreApplication.translate("SplitDialog", u"Number of Segments", None))
+        ___qtreewidgetitem = self.segments.headerItem()
+        ___qtreewidgetitem.setText(2, QCoreApplication.translate("SplitDialog", u"Area(%)", None));
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("SplitDialog", u"Color", None));
+        self.apply.setText(QCoreApplication.translate("SplitDialog", u"Apply", None))
+#if QT_CONFIG(tooltip)
+        self.axis.setToolTip(QCoreApplication.translate("SplitDialog", u" Set the axis direction based on the origin", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.cubeAxis.setToolTip(QCoreApplication.translate("SplitDialog", u" Display x,y and z axis coordinates", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.perspective.setToolTip(QCoreApplication.translate("SplitDialog", u" Toggle between Perspective and Orthogonal views", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.fit.setToolTip(QCoreApplication.translate("SplitDialog", u" Show the entire model in the windows to fit the view", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.alignAxis.setToolTip(QCoreApplication.translate("SplitDialog", u" View the model from cross-section of the closest-axis, aligning with current state", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.rotate.setToolTip(QCoreApplication.translate("SplitDialog", u" Rotate the model by 90 degrees", None))
+#endif // QT_CONFIG(tooltip)
+        self.okButton.setText(QCoreApplication.translate("SplitDialog", u"Ok", None))
+        self.cancelButton.setText(QCoreApplication.translate("SplitDialog", u"Cancel", None))
+    # retranslateUi
+
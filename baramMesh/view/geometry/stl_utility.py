@@ -1,16 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from vtkmodules.vtkCommonCore import vtkIdTypeArray, vtkIdList, vtkIntArray
-from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray, vtkCell, vtkLine, vtkDataObject
+import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy, ID_TYPE_CODE
+from vtkmodules.vtkCommonCore import VTK_INT, vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray, vtkDataObject, vtkDataSetAttributes
 from vtkmodules.vtkFiltersCore import vtkAppendPolyData, vtkIdFilter, vtkFeatureEdges, \
     vtkPolyDataEdgeConnectivityFilter, vtkThreshold, vtkCleanPolyData
 from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
-from vtkmodules.vtkFiltersModeling import vtkSelectEnclosedPoints
 from vtkmodules.vtkFiltersVerdict import vtkCellSizeFilter
 from vtkmodules.vtkIOGeometry import vtkSTLReader
 
@@ -44,49 +47,151 @@ class StlSurface:
         self.sIndex = sIndex
 
 
-def isClosed(surfaces):
-    if isinstance(surfaces, StlSurface):
-        return vtkSelectEnclosedPoints.IsSurfaceClosed(surfaces.polyData)
-    elif isinstance(surfaces, list):
-        if not len(surfaces) > 0:
-            return False
-        if len(surfaces) == 1:
-            return vtkSelectEnclosedPoints.IsSurfaceClosed(surfaces[0].polyData)
+def _gatherArrays(source: vtkDataSetAttributes, target: vtkDataSetAttributes, ids: np.ndarray):
+    for i in range(source.GetNumberOfArrays()):
+        if (array := source.GetArray(i)) is None:  # Not a vtkDataArray
+            continue
 
-        appendFilter = vtkAppendPolyData()
+        gathered = numpy_to_vtk(vtk_to_numpy(array)[ids], deep=1, array_type=array.GetDataType())
+        gathered.SetName(array.GetName())
+        target.AddArray(gathered)
 
-        for s in surfaces:
-            appendFilter.AddInputData(s.polyData)
 
-        appendFilter.Update()
+def splitByCellLabels(polyData: vtkPolyData, labels: np.ndarray) -> list[tuple[int, vtkPolyData]]:
+    """Splits polygons of polyData by the labels of the cells in a single pass
 
-        cleanFilter = vtkCleanPolyData()
-        cleanFilter.SetInputData(appendFilter.GetOutput())
-        cleanFilter.Update()
+    Cell ids are sorted by label once, and the cells, points and their arrays of each label are gathered at once,
+    instead of running vtkThreshold and vtkGeometryFilter over the whole data for each label.
+    Returns pairs of label and vtkPolyData in the order of labels, only for the labels that have cells.
+    polyData should have no cells other than polygons, as surfaces from STL files.
+    """
+    polys = polyData.GetPolys()
+    if polyData.GetNumberOfCells() != polys.GetNumberOfCells():
+        raise ValueError('Only polygons can be split')
 
-        if vtkSelectEnclosedPoints.IsSurfaceClosed(cleanFilter.GetOutput()):
-            return True
-        else:
-            return False
-    else:
-        raise ValueError
+    points = vtk_to_numpy(polyData.GetPoints().GetData())
+    offsets = vtk_to_numpy(polys.GetOffsetsArray()).astype(ID_TYPE_CODE)
+    connectivity = vtk_to_numpy(polys.GetConnectivityArray()).astype(ID_TYPE_CODE)
+    sizes = np.diff(offsets)
+
+    order = np.argsort(labels, kind='stable')
+    values, starts = np.unique(labels[order], return_index=True)
+
+    result = []
+    for value, cellIds in zip(values, np.split(order, starts[1:])):
+        # Point ids of the cells in order, gathered at once for cells of any size
+        cellSizes = sizes[cellIds]
+        cellOffsets = np.concatenate(([0], np.cumsum(cellSizes)))
+        pointIds = connectivity[np.repeat(offsets[cellIds] - cellOffsets[:-1], cellSizes)
+                                + np.arange(cellOffsets[-1], dtype=ID_TYPE_CODE)]
+
+        usedPointIds, newPointIds = np.unique(pointIds, return_inverse=True)
+
+        cells = vtkCellArray()
+        cells.SetData(numpy_to_vtkIdTypeArray(cellOffsets.astype(ID_TYPE_CODE), deep=1),
+                      numpy_to_vtkIdTypeArray(newPointIds.astype(ID_TYPE_CODE).ravel(), deep=1))
+
+        newPoints = vtkPoints()
+        newPoints.SetData(numpy_to_vtk(points[usedPointIds], deep=1))
 
+        part = vtkPolyData()
+        part.SetPoints(newPoints)
+        part.SetPolys(cells)
+        _gatherArrays(polyData.GetCellData(), part.GetCellData(), cellIds)
+        _gatherArrays(polyData.GetPointData(), part.GetPointData(), usedPointIds)
 
-def composeVolume(surfaces):
-    volumes = []
-    remains = []
+        result.append((int(value), part))
+
+    return result
+
+
+def _edgeUses(polyData: vtkPolyData, pointIds: np.ndarray, numPoints: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the edges of polygons as keys of their point ids in pointIds, and the number of polygons using each"""
+    polys = polyData.GetPolys()
+    offsets = vtk_to_numpy(polys.GetOffsetsArray())
+    connectivity = pointIds[vtk_to_numpy(polys.GetConnectivityArray())]
+
+    # Each point makes an edge with the next point of its polygon, and the last point with the first one
+    following = np.arange(1, len(connectivity) + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+
+    p1 = connectivity
+    p2 = connectivity[following]
+
+    return np.unique(np.minimum(p1, p2) * numPoints + np.maximum(p1, p2), return_counts=True)
+
+
+class ClosureIndex:
+    """Tells whether surfaces, or unions of them, are closed
+
+    Points of all the surfaces are merged by their coordinates into a shared index once,
+    and uses of the edges of each surface are counted once.
+    A union of surfaces is closed when every edge is used by two polygons in total,
+    which is what vtkSelectEnclosedPoints.IsSurfaceClosed checks after appending and cleaning the surfaces.
+    """
+    def __init__(self, surfaces: list[StlSurface]):
+        self._edges: dict[StlSurface, tuple[np.ndarray, np.ndarray]] = {}
+        self._pointIds: dict[StlSurface, np.ndarray] = {}
+        self._numPoints = 0
+
+        if not surfaces:
+            return
+
+        # Points are merged when their coordinates are equal, as vtkCleanPolyData does with zero tolerance
+        points = np.concatenate([vtk_to_numpy(s.polyData.GetPoints().GetData()) for s in surfaces])
+        order = np.lexsort(points.T[::-1])
+        sortedPoints = points[order]
+        first = np.concatenate(([True], np.any(sortedPoints[1:] != sortedPoints[:-1], axis=1)))
+        pointIds = np.empty(len(points), dtype=ID_TYPE_CODE)
+        pointIds[order] = np.cumsum(first) - 1
+        self._numPoints = int(first.sum())
+
+        start = 0
+        for s in surfaces:
+            end = start + s.polyData.GetNumberOfPoints()
+            self._pointIds[s] = pointIds[start:end]
+            start = end
+
+    def isClosed(self, surfaces) -> bool:
+        if isinstance(surfaces, StlSurface):
+            surfaces = [surfaces]
+        elif not isinstance(surfaces, list):
+            raise ValueError
+
+        if not surfaces:
+            return False
 
-    for s in surfaces:
-        if isClosed(s):
-            volumes.append([s])
+        uses = [self._edgeUses(s) for s in surfaces]
+        if len(uses) == 1:
+            counts = uses[0][1]
         else:
-            remains.append(s)
+            _, inverse = np.unique(np.concatenate([edges for edges, _ in uses]), return_inverse=True)
+            counts = np.bincount(inverse.ravel(), weights=np.concatenate([c for _, c in uses]))
 
-    if isClosed(remains):
-        volumes.append(remains)
+        return bool(np.all(counts == 2))
+
+    def composeVolume(self, surfaces):
+        volumes = []
         remains = []
 
-    return volumes, remains
+        for s in surfaces:
+            if self.isClosed(s):
+                volumes.append([s])
+            else:
+                remains.append(s)
+
+        if self.isClosed(remains):
+            volumes.append(remains)
+            remains = []
+
+        return volumes, remains
+
+    def _edgeUses(self, surface: StlSurface):
+        # Counted on first use, which can be in any of the threads evaluating files
+        if surface not in self._edges:
+            self._edges[surface] = _edgeUses(surface.polyData, self._pointIds[surface], self._numPoints)
+
+        return self._edges[surface]
 
 
 class StlImporter:
@@ -135,21 +240,14 @@ class StlImporter:
 
         edges: vtkPolyData = edgeFilter.GetOutput()
 
-        orgPtIdScalars: vtkIdTypeArray = edges.GetPointData().GetScalars("pointId")
+        # Point ids of the edges are mapped to the ones of the original surface all at once
+        orgPtIds = vtk_to_numpy(edges.GetPointData().GetScalars("pointId"))
+        edgeLines = edges.GetLines()
+        connectivity = orgPtIds[vtk_to_numpy(edgeLines.GetConnectivityArray())].astype(ID_TYPE_CODE)
+        offsets = vtk_to_numpy(edgeLines.GetOffsetsArray()).astype(ID_TYPE_CODE)
 
         lines = vtkCellArray()
-
-        for i in range(0, edges.GetNumberOfCells()):
-            cell: vtkCell = edges.GetCell(i)
-            pointIds: vtkIdList = cell.GetPointIds()
-
-            p1 = int(orgPtIdScalars.GetTuple(pointIds.GetId(0))[0])
-            p2 = int(orgPtIdScalars.GetTuple(pointIds.GetId(1))[0])
-
-            line = vtkLine()
-            line.GetPointIds().SetId(0, p1)
-            line.GetPointIds().SetId(1, p2)
-            lines.InsertNextCell(line)
+        lines.SetData(numpy_to_vtkIdTypeArray(offsets, deep=1), numpy_to_vtkIdTypeArray(connectivity, deep=1))
 
         # barrier should have the same points with original surface
         barrier = vtkPolyData()
@@ -175,23 +273,9 @@ class StlImporter:
         segments = []
         totalArea = conn.GetTotalArea()
         numRegions = conn.GetNumberOfExtractedRegions()
-        for rid in range(0, numRegions):
-            t = vtkThreshold()
-            t.SetInputData(regionedData)
-            t.SetLowerThreshold(rid - 0.5)
-            t.SetUpperThreshold(rid + 0.5)
-            t.SetThresholdFunction(vtkThreshold.THRESHOLD_BETWEEN)
-            t.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, 'RegionId')
-            t.Update()
-
-            # Output of vtkThreshold filter is Unstructured Grid
-            # Convert it to vtkPolyData by vtkGeometryFilter
-            geometry = vtkGeometryFilter()
-            geometry.SetInputData(t.GetOutput())
-            geometry.Update()
-
-            polyData: vtkPolyData = geometry.GetOutput()
-            if polyData.GetNumberOfCells() == 0:
+        regionIds = vtk_to_numpy(regionedData.GetCellData().GetArray('RegionId'))
+        for rid, polyData in splitByCellLabels(regionedData, regionIds):
+            if rid >= numRegions:
                 continue
 
             fIndex = polyData.GetCellData().GetAbstractArray("fIndex").GetValue(0)
@@ -273,24 +357,8 @@ class StlImporter:
             return [StlSurface(stl, fName, sName, sIndex)]
 
         solids = []
-        for sId in range(int(minSolid), int(maxSolid) + 1):
-            threshold = vtkThreshold()
-            threshold.SetInputData(stl)
-            threshold.SetLowerThreshold(sId - 0.5)
-            threshold.SetUpperThreshold(sId + 0.5)
-            threshold.SetThresholdFunction(vtkThreshold.THRESHOLD_BETWEEN)
-            threshold.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_CELLS, 'STLSolidLabeling')
-            threshold.Update()
-
-            # Output of vtkThreshold filter is Unstructured Grid
-            # Convert it to vtkPolyData by vtkGeometryFilter
-
-            geometryFilter = vtkGeometryFilter()
-            geometryFilter.SetInputData(threshold.GetOutput())
-            geometryFilter.Update()
-
-            solid = geometryFilter.GetOutput()
-
+        solidLabels = vtk_to_numpy(stl.GetCellData().GetArray('STLSolidLabeling'))
+        for sId, solid in splitByCellLabels(stl, solidLabels):
             sName = names[sId] if sId < len(names) and names[sId] else ''
             sIndex = self._addArray(solid, 'sIndex', sName, solid.GetNumberOfCells())
 
@@ -300,41 +368,48 @@ class StlImporter:
 
     def _addArray(self, polyData: vtkPolyData, arrayName: str, value: str, count: int):
         index = self._stringIndices.putString(value)
-        array = vtkIntArray()
+        array = numpy_to_vtk(np.full(count, index, dtype=np.intc), deep=1, array_type=VTK_INT)
         array.SetName(arrayName)
-        for i in range(0, count):
-            array.InsertNextValue(index)
         polyData.GetCellData().AddArray(array)
 
         return index
 
     def identifyVolumes(self):
-        volumes = []
-        surfaces = []
+        closure = ClosureIndex(self._surfaceList)
 
-        fileNames = set([s.fName for s in self._surfaceList])
-        for fName in fileNames:
+        def identifyInFile(fName):
             surfacesInFile = [s for s in self._surfaceList if s.fName == fName]
             sIndices = set([s.sIndex for s in surfacesInFile])
 
+            volumesInFile = []
             remains = []
             for sIndex in sIndices:
                 # identify segment volumes and solid volumes
                 surfacesInSolid = [s for s in surfacesInFile if s.sIndex == sIndex]
-                vList, sList = composeVolume(surfacesInSolid)
-                volumes.extend(vList)
+                vList, sList = closure.composeVolume(surfacesInSolid)
+                volumesInFile.extend(vList)
                 remains.extend(sList)
 
             # identify file volume
-            if isClosed(remains):
-                volumes.append(remains)
-            else:
-                surfaces.extend(remains)
+            if closure.isClosed(remains):
+                volumesInFile.append(remains)
+                remains = []
+
+            return volumesInFile, remains
+
+        volumes = []
+        surfaces = []
+
+        # Files are independent of each other, and evaluated in parallel
+        fileNames = list(dict.fromkeys(s.fName for s in self._surfaceList))
+        with ThreadPoolExecutor(max(1, min(len(fileNames), os.cpu_count() or 1))) as executor:
+            for vList, sList in executor.map(identifyInFile, fileNames):
+                volumes.extend(vList)
+                surfaces.extend(sList)
 
         # identify all selected files volume
-        if isClosed(surfaces):
+        if closure.isClosed(surfaces):
             volumes.append(surfaces)
             surfaces = []
 
         return volumes, surfaces
-
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'surface_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QCheckBox, QDialog,
+    QFormLayout, QFrame, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QRadioButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_SurfaceDialog(object):
+    def setupUi(self, SurfaceDialog):
+        if not SurfaceDialog.objectName():
+            SurfaceDialog.setObjectName(u"SurfaceDialog")
+        SurfaceDialog.resize(300, 294)
+        self.verticalLayout_10 = QVBoxLayout(SurfaceDialog)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.dialogContent = QWidget(SurfaceDialog)
+        self.dialogContent.setObjectName(u"dialogContent")
+        self.verticalLayout_9 = QVBoxLayout(self.dialogContent)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.nameSetting = QWidget(self.dialogContent)
+        self.nameSetting.setObjectName(u"nameSetting")
+        self.formLayout_3 = QFormLayout(self.nameSetting)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(0, 0, 0, 9)
+        self.label = QLabel(self.nameSetting)
+        self.label.setObjectName(u"label")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.name = QLineEdit(self.nameSetting)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_9.addWidget(self.nameSetting)
+
+        self.label_2 = QLabel(self.dialogContent)
+        self.label_2.setObjectName(u"label_2")
+
+        self.verticalLayout_9.addWidget(self.label_2)
+
+        self.line = QFrame(self.dialogContent)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_9.addWidget(self.line)
+
+        self.widget_2 = QWidget(self.dialogContent)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_11 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.boundary = QRadioButton(self.widget_2)
+        self.typeRadios = QButtonGroup(SurfaceDialog)
+        self.typeRadios.setObjectName(u"typeRadios")
+        self.typeRadios.addButton(self.boundary)
+        self.boundary.setObjectName(u"boundary")
+        self.boundary.setChecked(True)
+
+        self.verticalLayout_11.addWidget(self.boundary)
+
+        self.none = QRadioButton(self.widget_2)
+        self.typeRadios.addButton(self.none)
+        self.none.setObjectName(u"none")
+
+        self.verticalLayout_11.addWidget(self.none)
+
+        self.interface_ = QRadioButton(self.widget_2)
+        self.typeRadios.addButton(self.interface_)
+        self.interface_.setObjectName(u"interface_")
+
+        self.verticalLayout_11.addWidget(self.interface_)
+
+        self.interfaceType = QWidget(self.widget_2)
+        self.interfaceType.setObjectName(u"interfaceType")
+        self.interfaceType.setEnabled(False)
+        self.verticalLayout_8 = QVBoxLayout(self.interfaceType)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.verticalLayout_8.setContentsMargins(-1, 0, -1, 0)
+        self.nonConformal = QCheckBox(self.interfaceType)
+        self.nonConformal.setObjectName(u"nonConformal")
+
+        self.verticalLayout_8.addWidget(self.nonConformal)
+
+        self.interRegion = QCheckBox(self.interfaceType)
+        self.interRegion.setObjectName(u"interRegion")
+
+        self.verticalLayout_8.addWidget(self.interRegion)
+
+
+        self.verticalLayout_11.addWidget(self.interfaceType)
+
+
+        self.verticalLayout_9.addWidget(self.widget_2)
+
+
+        self.verticalLayout_10.addWidget(self.dialogContent)
+
+        self.widget_5 = QWidget(SurfaceDialog)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_5)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_2.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_5)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_2.addWidget(self.cancel)
+
+
+        self.verticalLayout_10.addWidget(self.widget_5)
+
+
+        self.retranslateUi(SurfaceDialog)
+
+        QMetaObject.connectSlotsByName(SurfaceDialog)
+    # setupUi
+
+    def retranslateUi(self, SurfaceDialog):
+        SurfaceDialog.setWindowTitle(QCoreApplication.translate("SurfaceDialog", u"Edit Surface", None))
+        self.label.setText(QCoreApplication.translate("SurfaceDialog", u"Name", None))
+        self.label_2.setText(QCoreApplication.translate("SurfaceDialog", u"Type", None))
+        self.boundary.setText(QCoreApplication.translate("SurfaceDialog", u"Boundary", None))
+        self.none.setText(QCoreApplication.translate("SurfaceDialog", u"None", None))
+        self.interface_.setText(QCoreApplication.translate("SurfaceDialog", u"Interface", None))
+        self.nonConformal.setText(QCoreApplication.translate("SurfaceDialog", u"Non-Conformal", None))
+        self.interRegion.setText(QCoreApplication.translate("SurfaceDialog", u"Inter-Region", None))
+        self.ok.setText(QCoreApplication.translate("SurfaceDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("SurfaceDialog", u"Cancel", None))
+    # retranslateUi
+
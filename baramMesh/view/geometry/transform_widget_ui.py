@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'transform_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QGridLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QTabWidget, QVBoxLayout,
+    QWidget)
+
+class Ui_TransformWidget(object):
+    def setupUi(self, TransformWidget):
+        if not TransformWidget.objectName():
+            TransformWidget.setObjectName(u"TransformWidget")
+        TransformWidget.resize(400, 256)
+        self.verticalLayout = QVBoxLayout(TransformWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.tabWidget = QTabWidget(TransformWidget)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.scaleTab = QWidget()
+        self.scaleTab.setObjectName(u"scaleTab")
+        self.verticalLayout_2 = QVBoxLayout(self.scaleTab)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.groupBox = QGroupBox(self.scaleTab)
+        self.groupBox.setObjectName(u"groupBox")
+        self.gridLayout = QGridLayout(self.groupBox)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(self.groupBox)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.scaleY = QLineEdit(self.groupBox)
+        self.scaleY.setObjectName(u"scaleY")
+
+        self.gridLayout.addWidget(self.scaleY, 1, 1, 1, 1)
+
+        self.label_3 = QLabel(self.groupBox)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+
+        self.scaleZ = QLineEdit(self.groupBox)
+        self.scaleZ.setObjectName(u"scaleZ")
+
+        self.gridLayout.addWidget(self.scaleZ, 2, 1, 1, 1)
+
+        self.scaleX = QLineEdit(self.groupBox)
+        self.scaleX.setObjectName(u"scaleX")
+
+        self.gridLayout.addWidget(self.scaleX, 0, 1, 1, 1)
+
+
+        self.verticalLayout_2.addWidget(self.groupBox)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.widget_5 = QWidget(self.scaleTab)
+        self.widget_5.setObjectName(u"widget_5")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_5)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.scale = QPushButton(self.widget_5)
+        self.scale.setObjectName(u"scale")
+
+        self.horizontalLayout_2.addWidget(self.scale)
+
+
+        self.verticalLayout_2.addWidget(self.widget_5)
+
+        self.tabWidget.addTab(self.scaleTab, "")
+        self.rotateTab = QWidget()
+        self.rotateTab.setObjectName(u"rotateTab")
+        self.verticalLayout_3 = QVBoxLayout(self.rotateTab)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.widget = QWidget(self.rotateTab)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_10 = QLabel(self.widget)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_10)
+
+        self.rotationAngle = QLineEdit(self.widget)
+        self.rotationAngle.setObjectName(u"rotationAngle")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.rotationAngle)
+
+
+        self.verticalLayout_3.addWidget(self.widget)
+
+        self.widget_2 = QWidget(self.rotateTab)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_2 = QGroupBox(self.widget_2)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.gridLayout_2 = QGridLayout(self.groupBox_2)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_4 = QLabel(self.groupBox_2)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout_2.addWidget(self.label_4, 0, 0, 1, 1)
+
+        self.label_5 = QLabel(self.groupBox_2)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_2.addWidget(self.label_5, 1, 0, 1, 1)
+
+        self.originY = QLineEdit(self.groupBox_2)
+        self.originY.setObjectName(u"originY")
+
+        self.gridLayout_2.addWidget(self.originY, 1, 1, 1, 1)
+
+        self.label_6 = QLabel(self.groupBox_2)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_2.addWidget(self.label_6, 2, 0, 1, 1)
+
+        self.originZ = QLineEdit(self.groupBox_2)
+        self.originZ.setObjectName(u"originZ")
+
+        self.gridLayout_2.addWidget(self.originZ, 2, 1, 1, 1)
+
+        self.originX = QLineEdit(self.groupBox_2)
+        self.originX.setObjectName(u"originX")
+
+        self.gridLayout_2.addWidget(self.originX, 0, 1, 1, 1)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_2)
+
+        self.groupBox_3 = QGroupBox(self.widget_2)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.gridLayout_3 = QGridLayout(self.groupBox_3)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.label_7 = QLabel(self.groupBox_3)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout_3.addWidget(self.label_7, 0, 0, 1, 1)
+
+        self.label_8 = QLabel(self.groupBox_3)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout_3.addWidget(self.label_8, 1, 0, 1, 1)
+
+        self.axisY = QLineEdit(self.groupBox_3)
+        self.axisY.setObjectName(u"axisY")
+
+        self.gridLayout_3.addWidget(self.axisY, 1, 1, 1, 1)
+
+        self.label_9 = QLabel(self.groupBox_3)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout_3.addWidget(self.label_9, 2, 0, 1, 1)
+
+        self.axisZ = QLineEdit(self.groupBox_3)
+        self.axisZ.setObjectName(u"axisZ")
+
+        self.gridLayout_3.addWidget(self.axisZ, 2, 1, 1, 1)
+
+        self.axisX = QLineEdit(self.groupBox_3)
+        self.axisX.setObjectName(u"axisX")
+
+        self.gridLayout_3.addWidget(self.axisX, 0, 1, 1, 1)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_3)
+
+
+        self.verticalLayout_3.addWidget(self.widget_2)
+
+        self.widget_6 = QWidget(self.rotateTab)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalSpacer_3 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_3)
+
+        self.rotate = QPushButton(self.widget_6)
+        self.rotate.setObjectName(u"rotate")
+
+        self.horizontalLayout_3.addWidget(self.rotate)
+
+
+        self.verticalLayout_3.addWidget(self.widget_6)
+
+        self.tabWidget.addTab(self.rotateTab, "")
+        self.translateTab = QWidget()
+        self.translateTab.setObjectName(u"translateTab")
+        self.verticalLayout_4 = QVBoxLayout(self.translateTab)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.groupBox_4 = QGroupBox(self.translateTab)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.gridLayout_4 = QGridLayout(self.groupBox_4)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.label_11 = QLabel(self.groupBox_4)
+        self.label_11.setObjectName(u"label_11")
+
+        self.gridLayout_4.addWidget(self.label_11, 0, 0, 1, 1)
+
+        self.translateX = QLineEdit(self.groupBox_4)
+        self.translateX.setObjectName(u"translateX")
+
+        self.gridLayout_4.addWidget(self.translateX, 0, 1, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox_4)
+        self.label_12.setObjectName(u"label_12")
+
+        self.gridLayout_4.addWidget(self.label_12, 1, 0, 1, 1)
+
+        self.translateY = QLineEdit(self.groupBox_4)
+        self.translateY.setObjectName(u"translateY")
+
+        self.gridLayout_4.addWidget(self.translateY, 1, 1, 1, 1)
+
+        self.label_13 = QLabel(self.groupBox_4)
+        self.label_13.setObjectName(u"label_13")
+
+        self.gridLayout_4.addWidget(self.label_13, 2, 0, 1, 1)
+
+        self.translateZ = QLineEdit(self.groupBox_4)
+        self.translateZ.setObjectName(u"translateZ")
+
+        self.gridLayout_4.addWidget(self.translateZ, 2, 1, 1, 1)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox_4)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer_2)
+
+        self.widget_7 = QWidget(self.translateTab)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalSpacer_4 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_4)
+
+        self.translate = QPushButton(self.widget_7)
+        self.translate.setObjectName(u"translate")
+
+        self.horizontalLayout_4.addWidget(self.translate)
+
+
+        self.verticalLayout_4.addWidget(self.widget_7)
+
+        self.tabWidget.addTab(self.translateTab, "")
+
+        self.verticalLayout.addWidget(self.tabWidget)
+
+
+        self.retranslateUi(TransformWidget)
+
+        self.tabWidget.setCurrentIndex(2)
+
+
+        QMetaObject.connectSlotsByName(TransformWidget)
+    # setupUi
+
+    def retranslateUi(self, TransformWidget):
+        TransformWidget.setWindowTitle(QCoreApplication.translate("TransformWidget", u"Form", None))
+        self.groupBox.setTitle(QCoreApplication.translate("TransformWidget", u"Scaling Factors", None))
+        self.label.setText(QCoreApplication.translate("TransformWidget", u"X", None))
+        self.label_2.setText(QCoreApplication.translate("TransformWidget", u"Y", None))
+        self.scaleY.setText(QCoreApplication.translate("TransformWidget", u"1", None))
+        self.label_3.setText(QCoreApplication.translate("TransformWidget", u"Z", None))
+        self.scaleZ.setText(QCoreApplication.translate("TransformWidget", u"1", None))
+        self.scaleX.setText(QCoreApplication.translate("TransformWidget", u"1", None))
+        self.scale.setText(QCoreApplication.translate("TransformWidget", u"Scale", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.scaleTab), QCoreApplication.translate("TransformWidget", u"Scale", None))
+        self.label_10.setText(QCoreApplication.translate("TransformWidget", u"Rotation Angle (deg)", None))
+        self.rotationAngle.setText(QCoreApplication.translate("TransformWidget", u"10", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("TransformWidget", u"Rotation Origin", None))
+        self.label_4.setText(QCoreApplication.translate("TransformWidget", u"X (m)", None))
+        self.label_5.setText(QCoreApplication.translate("TransformWidget", u"Y (m)", None))
+        self.originY.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.label_6.setText(QCoreApplication.translate("TransformWidget", u"Z (m)", None))
+        self.originZ.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.originX.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("TransformWidget", u"Rotation Axis", None))
+        self.label_7.setText(QCoreApplication.translate("TransformWidget", u"X", None))
+        self.label_8.setText(QCoreApplication.translate("TransformWidget", u"Y", None))
+        self.axisY.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.label_9.setText(QCoreApplication.translate("TransformWidget", u"Z", None))
+        self.axisZ.setText(QCoreApplication.translate("TransformWidget", u"1", None))
+        self.axisX.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.rotate.setText(QCoreApplication.translate("TransformWidget", u"Rotate", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.rotateTab), QCoreApplication.translate("TransformWidget", u"Rotate", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("TransformWidget", u"Translation Offsets", None))
+        self.label_11.setText(QCoreApplication.translate("TransformWidget", u"X (m)", None))
+        self.translateX.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.label_12.setText(QCoreApplication.translate("TransformWidget", u"Y (m)", None))
+        self.translateY.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.label_13.setText(QCoreApplication.translate("TransformWidget", u"Z (m)", None))
+        self.translateZ.setText(QCoreApplication.translate("TransformWidget", u"0", None))
+        self.translate.setText(QCoreApplication.translate("TransformWidget", u"Translate", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.translateTab), QCoreApplication.translate("TransformWidget", u"Translate", None))
+    # retranslateUi
+
@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'volume_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QDialog, QFormLayout,
+    QFrame, QGridLayout, QGroupBox, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QRadioButton,
+    QSizePolicy, QSpacerItem, QStackedWidget, QVBoxLayout,
+    QWidget)
+
+class Ui_VolumeDialog(object):
+    def setupUi(self, VolumeDialog):
+        if not VolumeDialog.objectName():
+            VolumeDialog.setObjectName(u"VolumeDialog")
+        VolumeDialog.resize(318, 550)
+        self.verticalLayout_6 = QVBoxLayout(VolumeDialog)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setContentsMargins(9, -1, 9, -1)
+        self.dialogContent = QWidget(VolumeDialog)
+        self.dialogContent.setObjectName(u"dialogContent")
+        self.verticalLayout_2 = QVBoxLayout(self.dialogContent)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.widget_5 = QWidget(self.dialogContent)
+        self.widget_5.setObjectName(u"widget_5")
+        self.formLayout_3 = QFormLayout(self.widget_5)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(0, 0, 0, 9)
+        self.label_11 = QLabel(self.widget_5)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_11)
+
+        self.name = QLineEdit(self.widget_5)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.name)
+
+
+        self.verticalLayout_2.addWidget(self.widget_5)
+
+        self.widget_2 = QWidget(self.dialogContent)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_3 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_3.setSpacing(6)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.label_12 = QLabel(self.widget_2)
+        self.label_12.setObjectName(u"label_12")
+
+        self.verticalLayout_3.addWidget(self.label_12)
+
+        self.line_2 = QFrame(self.widget_2)
+        self.line_2.setObjectName(u"line_2")
+        self.line_2.setFrameShape(QFrame.HLine)
+        self.line_2.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_3.addWidget(self.line_2)
+
+        self.widget_9 = QWidget(self.widget_2)
+        self.widget_9.setObjectName(u"widget_9")
+        self.verticalLayout_8 = QVBoxLayout(self.widget_9)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.none = QRadioButton(self.widget_9)
+        self.typeRadios = QButtonGroup(VolumeDialog)
+        self.typeRadios.setObjectName(u"typeRadios")
+        self.typeRadios.addButton(self.none)
+        self.none.setObjectName(u"none")
+        self.none.setChecked(True)
+
+        self.verticalLayout_8.addWidget(self.none)
+
+        self.cellZone = QRadioButton(self.widget_9)
+        self.typeRadios.addButton(self.cellZone)
+        self.cellZone.setObjectName(u"cellZone")
+
+        self.verticalLayout_8.addWidget(self.cellZone)
+
+
+        self.verticalLayout_3.addWidget(self.widget_9)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+        self.geometryStack = QStackedWidget(self.dialogContent)
+        self.geometryStack.setObjectName(u"geometryStack")
+        self.hex = QWidget()
+        self.hex.setObjectName(u"hex")
+        self.verticalLayout_12 = QVBoxLayout(self.hex)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.verticalLayout_12.setContentsMargins(0, -1, 0, -1)
+        self.label_13 = QLabel(self.hex)
+        self.label_13.setObjectName(u"label_13")
+
+        self.verticalLayout_12.addWidget(self.label_13)
+
+        self.line_3 = QFrame(self.hex)
+        self.line_3.setObjectName(u"line_3")
+        self.line_3.setFrameShape(QFrame.HLine)
+        self.line_3.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_12.addWidget(self.line_3)
+
+        self.widget_4 = QWidget(self.hex)
+        self.widget_4.setObjectName(u"widget_4")
+        self.gridLayout_3 = QGridLayout(self.widget_4)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.gridLayout_3.setContentsMargins(9, 9, 9, 9)
+        self.label = QLabel(self.widget_4)
+        self.label.setObjectName(u"label")
+        self.label.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label, 0, 1, 1, 1)
+
+        self.label_2 = QLabel(self.widget_4)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout_3.addWidget(self.label_2, 0, 2, 1, 1)
+
+        self.label_3 = QLabel(self.widget_4)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout_3.addWidget(self.label_3, 1, 0, 1, 1)
+
+        self.minX = QLineEdit(self.widget_4)
+        self.minX.setObjectName(u"minX")
+
+        self.gridLayout_3.addWidget(self.minX, 1, 1, 1, 1)
+
+        self.maxX = QLineEdit(self.widget_4)
+        self.maxX.setObjectName(u"maxX")
+
+        self.gridLayout_3.addWidget(self.maxX, 1, 2, 1, 1)
+
+        self.label_4 = QLabel(self.widget_4)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout_3.addWidget(self.label_4, 2, 0, 1, 1)
+
+        self.minY = QLineEdit(self.widget_4)
+        self.minY.setObjectName(u"minY")
+
+        self.gridLayout_3.addWidget(self.minY, 2, 1, 1, 1)
+
+        self.maxY = QLineEdit(self.widget_4)
+        self.maxY.setObjectName(u"maxY")
+
+        self.gridLayout_3.addWidget(self.maxY, 2, 2, 1, 1)
+
+        self.label_5 = QLabel(self.widget_4)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_3.addWidget(self.label_5, 3, 0, 1, 1)
+
+        self.minZ = QLineEdit(self.widget_4)
+        self.minZ.setObjectName(u"minZ")
+
+        self.gridLayout_3.addWidget(self.minZ, 3, 1, 1, 1)
+
+        self.maxZ = QLineEdit(self.widget_4)
+        self.maxZ.setObjectName(u"maxZ")
+
+        self.gridLayout_3.addWidget(self.maxZ, 3, 2, 1, 1)
+
+
+        self.verticalLayout_12.addWidget(self.widget_4)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_12.addItem(self.verticalSpacer_2)
+
+        self.geometryStack.addWidget(self.hex)
+        self.sphere = QWidget()
+        self.sphere.setObjectName(u"sphere")
+        self.verticalLayout_9 = QVBoxLayout(self.sphere)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.verticalLayout_9.setContentsMargins(0, -1, 0, -1)
+        self.label_14 = QLabel(self.sphere)
+        self.label_14.setObjectName(u"label_14")
+
+        self.verticalLayout_9.addWidget(self.label_14)
+
+        self.line_4 = QFrame(self.sphere)
+        self.line_4.setObjectName(u"line_4")
+        self.line_4.setFrameShape(QFrame.HLine)
+        self.line_4.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_9.addWidget(self.line_4)
+
+        self.widget_11 = QWidget(self.sphere)
+        self.widget_11.setObjectName(u"widget_11")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_11)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.widget = QWidget(self.widget_11)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_4 = QVBoxLayout(self.widget)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, -1, -1)
+        self.groupBox = QGroupBox(self.widget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.formLayout = QFormLayout(self.groupBox)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setContentsMargins(9, 0, -1, 9)
+        self.label_6 = QLabel(self.groupBox)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_6)
+
+        self.centerX = QLineEdit(self.groupBox)
+        self.centerX.setObjectName(u"centerX")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.centerX)
+
+        self.label_7 = QLabel(self.groupBox)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_7)
+
+        self.centerY = QLineEdit(self.groupBox)
+        self.centerY.setObjectName(u"centerY")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.centerY)
+
+        self.label_8 = QLabel(self.groupBox)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_8)
+
+        self.centerZ = QLineEdit(self.groupBox)
+        self.centerZ.setObjectName(u"centerZ")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.centerZ)
+
+
+        self.verticalLayout_4.addWidget(self.groupBox)
+
+        self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_4.addItem(self.verticalSpacer_4)
+
+
+        self.horizontalLayout_2.addWidget(self.widget)
+
+        self.widget_12 = QWidget(self.widget_11)
+        self.widget_12.setObjectName(u"widget_12")
+        self.verticalLayout_10 = QVBoxLayout(self.widget_12)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.verticalLayout_10.setContentsMargins(-1, 0, 0, -1)
+        self.groupBox_2 = QGroupBox(self.widget_12)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout_2 = QFormLayout(self.groupBox_2)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.label_9 = QLabel(self.groupBox_2)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_9)
+
+        self.sphereRadius = QLineEdit(self.groupBox_2)
+        self.sphereRadius.setObjectName(u"sphereRadius")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.sphereRadius)
+
+
+        self.verticalLayout_10.addWidget(self.groupBox_2)
+
+        self.verticalSpacer = QSpacerItem(20, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_10.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout_2.addWidget(self.widget_12)
+
+
+        self.verticalLayout_9.addWidget(self.widget_11)
+
+        self.geometryStack.addWidget(self.sphere)
+        self.cylinder = QWidget()
+        self.cylinder.setObjectName(u"cylinder")
+        self.verticalLayout_13 = QVBoxLayout(self.cylinder)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(0, -1, 0, -1)
+        self.label_15 = QLabel(self.cylinder)
+        self.label_15.setObjectName(u"label_15")
+
+        self.verticalLayout_13.addWidget(self.label_15)
+
+        self.line_5 = QFrame(self.cylinder)
+        self.line_5.setObjectName(u"line_5")
+        self.line_5.setFrameShape(QFrame.HLine)
+        self.line_5.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_13.addWidget(self.line_5)
+
+        self.widget_3 = QWidget(self.cylinder)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout_11 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.widget_7 = QWidget(self.widget_3)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout = QHBoxLayout(self.widget_7)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_3 = QGroupBox(self.widget_7)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_4 = QFormLayout(self.groupBox_3)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.formLayout_4.setContentsMargins(9, 0, -1, -1)
+        self.label_18 = QLabel(self.groupBox_3)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_18)
+
+        self.axis1X = QLineEdit(self.groupBox_3)
+        self.axis1X.setObjectName(u"axis1X")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.axis1X)
+
+        self.label_19 = QLabel(self.groupBox_3)
+        self.label_19.setObjectName(u"label_19")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_19)
+
+        self.axis1Y = QLineEdit(self.groupBox_3)
+        self.axis1Y.setObjectName(u"axis1Y")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.axis1Y)
+
+        self.label_20 = QLabel(self.groupBox_3)
+        self.label_20.setObjectName(u"label_20")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_20)
+
+        self.axis1Z = QLineEdit(self.groupBox_3)
+        self.axis1Z.setObjectName(u"axis1Z")
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.axis1Z)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_3)
+
+        self.groupBox_5 = QGroupBox(self.widget_7)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.formLayout_6 = QFormLayout(self.groupBox_5)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.formLayout_6.setContentsMargins(-1, 0, 9, -1)
+        self.label_24 = QLabel(self.groupBox_5)
+        self.label_24.setObjectName(u"label_24")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_24)
+
+        self.axis2X = QLineEdit(self.groupBox_5)
+        self.axis2X.setObjectName(u"axis2X")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.axis2X)
+
+        self.label_25 = QLabel(self.groupBox_5)
+        self.label_25.setObjectName(u"label_25")
+
+        self.formLayout_6.setWidget(1, QFormLayout.LabelRole, self.label_25)
+
+        self.axis2Y = QLineEdit(self.groupBox_5)
+        self.axis2Y.setObjectName(u"axis2Y")
+
+        self.formLayout_6.setWidget(1, QFormLayout.FieldRole, self.axis2Y)
+
+        self.label_26 = QLabel(self.groupBox_5)
+        self.label_26.setObjectName(u"label_26")
+
+        self.formLayout_6.setWidget(2, QFormLayout.LabelRole, self.label_26)
+
+        self.axis2Z = QLineEdit(self.groupBox_5)
+        self.axis2Z.setObjectName(u"axis2Z")
+
+        self.formLayout_6.setWidget(2, QFormLayout.FieldRole, self.axis2Z)
+
+
+        self.horizontalLayout.addWidget(self.groupBox_5)
+
+
+        self.verticalLayout_11.addWidget(self.widget_7)
+
+        self.singleRadius = QGroupBox(self.widget_3)
+        self.singleRadius.setObjectName(u"singleRadius")
+        self.formLayout_7 = QFormLayout(self.singleRadius)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.label_27 = QLabel(self.singleRadius)
+        self.label_27.setObjectName(u"label_27")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_27)
+
+        self.cylinderRadius = QLineEdit(self.singleRadius)
+        self.cylinderRadius.setObjectName(u"cylinderRadius")
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.cylinderRadius)
+
+
+        self.verticalLayout_11.addWidget(self.singleRadius)
+
+        self.annulusRadius = QGroupBox(self.widget_3)
+        self.annulusRadius.setObjectName(u"annulusRadius")
+        self.formLayout_8 = QFormLayout(self.annulusRadius)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.label_28 = QLabel(self.annulusRadius)
+        self.label_28.setObjectName(u"label_28")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_28)
+
+        self.innerRadius = QLineEdit(self.annulusRadius)
+        self.innerRadius.setObjectName(u"innerRadius")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.innerRadius)
+
+        self.label_29 = QLabel(self.annulusRadius)
+        self.label_29.setObjectName(u"label_29")
+
+        self.formLayout_8.setWidget(1, QFormLayout.LabelRole, self.label_29)
+
+        self.outerRadius = QLineEdit(self.annulusRadius)
+        self.outerRadius.setObjectName(u"outerRadius")
+
+        self.formLayout_8.setWidget(1, QFormLayout.FieldRole, self.outerRadius)
+
+
+        self.verticalLayout_11.addWidget(self.annulusRadius)
+
+
+        self.verticalLayout_13.addWidget(self.widget_3)
+
+        self.geometryStack.addWidget(self.cylinder)
+
+        self.verticalLayout_2.addWidget(self.geometryStack)
+
+
+        self.verticalLayout_6.addWidget(self.dialogContent)
+
+        self.widget_6 = QWidget(VolumeDialog)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_4 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.preview = QPushButton(self.widget_6)
+        self.preview.setObjectName(u"preview")
+
+        self.horizontalLayout_4.addWidget(self.preview)
+
+        self.horizontalSpacer_2 = QSpacerItem(181, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_2)
+
+        self.ok = QPushButton(self.widget_6)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout_4.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_6)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout_4.addWidget(self.cancel)
+
+
+        self.verticalLayout_6.addWidget(self.widget_6)
+
+        QWidget.setTabOrder(self.name, self.none)
+        QWidget.setTabOrder(self.none, self.cellZone)
+        QWidget.setTabOrder(self.cellZone, self.minX)
+        QWidget.setTabOrder(self.minX, self.maxX)
+        QWidget.setTabOrder(self.maxX, self.minY)
+        QWidget.setTabOrder(self.minY, self.maxY)
+        QWidget.setTabOrder(self.maxY, self.minZ)
+        QWidget.setTabOrder(self.minZ, self.maxZ)
+        QWidget.setTabOrder(self.maxZ, self.centerX)
+        QWidget.setTabOrder(self.centerX, self.centerY)
+        QWidget.setTabOrder(self.centerY, self.centerZ)
+        QWidget.setTabOrder(self.centerZ, self.sphereRadius)
+        QWidget.setTabOrder(self.sphereRadius, self.axis1X)
+        QWidget.setTabOrder(self.axis1X, self.axis2X)
+        QWidget.setTabOrder(self.axis2X, self.axis1Y)
+        QWidget.setTabOrder(self.axis1Y, self.axis2Y)
+        QWidget.setTabOrder(self.axis2Y, self.axis1Z)
+        QWidget.setTabOrder(self.axis1Z, self.axis2Z)
+        QWidget.setTabOrder(self.axis2Z, self.cylinderRadius)
+        QWidget.setTabOrder(self.cylinderRadius, self.innerRadius)
+        QWidget.setTabOrder(self.innerRadius, self.outerRadius)
+
+        self.retranslateUi(VolumeDialog)
+
+        self.geometryStack.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(VolumeDialog)
+    # setupUi
+
+    def retranslateUi(self, VolumeDialog):
+        VolumeDialog.setWindowTitle(QCoreApplication.translate("VolumeDialog", u"Edit Volume", None))
+        self.label_11.setText(QCoreApplication.translate("VolumeDialog", u"Name", None))
+        self.label_12.setText(QCoreApplication.translate("VolumeDialog", u"Type", None))
+        self.none.setText(QCoreApplication.translate("VolumeDialog", u"None", None))
+        self.cellZone.setText(QCoreApplication.translate("VolumeDialog", u"CellZone", None))
+        self.label_13.setText(QCoreApplication.translate("VolumeDialog", u"Hex Geometry", None))
+        self.label.setText(QCoreApplication.translate("VolumeDialog", u"Min.", None))
+        self.label_2.setText(QCoreApplication.translate("VolumeDialog", u"Max.", None))
+        self.label_3.setText(QCoreApplication.translate("VolumeDialog", u"X", None))
+        self.label_4.setText(QCoreApplication.translate("VolumeDialog", u"Y", None))
+        self.label_5.setText(QCoreApplication.translate("VolumeDialog", u"Z", None))
+        self.label_14.setText(QCoreApplication.translate("VolumeDialog", u"Sphere Geometry", None))
+        self.groupBox.setTitle(QCoreApplication.translate("VolumeDialog", u"Center Point", None))
+        self.label_6.setText(QCoreApplication.translate("VolumeDialog", u"X", None))
+        self.label_7.setText(QCoreApplication.translate("VolumeDialog", u"Y", None))
+        self.label_8.setText(QCoreApplication.translate("VolumeDialog", u"Z", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("VolumeDialog", u"Radius", None))
+        self.label_9.setText(QCoreApplication.translate("VolumeDialog", u"R", None))
+        self.label_15.setText(QCoreApplication.translate("VolumeDialog", u"Cylinder Geometry", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("VolumeDialog", u"Axis Point 1", None))
+        self.label_18.setText(QCoreApplication.translate("VolumeDialog", u"X", None))
+        self.label_19.setText(QCoreApplication.translate("VolumeDialog", u"Y", None))
+        self.label_20.setText(QCoreApplication.translate("VolumeDialog", u"Z", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("VolumeDialog", u"Axis Point 2", None))
+        self.label_24.setText(QCoreApplication.translate("VolumeDialog", u"X", None))
+        self.label_25.setText(QCoreApplication.translate("VolumeDialog", u"Y", None))
+        self.label_26.setText(QCoreApplication.translate("VolumeDialog", u"Z", None))
+        self.singleRadius.setTitle(QCoreApplication.translate("VolumeDialog", u"Radius", None))
+        self.label_27.setText(QCoreApplication.translate("VolumeDialog", u"R", None))
+        self.annulusRadius.setTitle(QCoreApplication.translate("VolumeDialog", u"Radius", None))
+        self.label_28.setText(QCoreApplication.translate("VolumeDialog", u"Inner R", None))
+        self.label_29.setText(QCoreApplication.translate("VolumeDialog", u"Outer R", None))
+        self.preview.setText(QCoreApplication.translate("VolumeDialog", u"Preview", None))
+        self.ok.setText(QCoreApplication.translate("VolumeDialog", u"OK", None))
+        self.cancel.setText(QCoreApplication.translate("VolumeDialog", u"Cancel", None))
+    # retranslateUi
+
@@ -58,6 +58,8 @@ class MainWindow(QMainWindow):
         self._recentFilesMenu = RecentFilesMenu(self._ui.menuOpen_Recent)
         self._recentFilesMenu.setRecents(app.settings.getRecentProjects())
 
+        self._ui.actionDeferCheckMesh.setChecked(app.settings.isCheckMeshDeferred())
+
         self._dockManager = CDockManager(self._ui.dockContainer)
 
         self._navigationView = NavigationView(self._ui)
@@ -158,6 +160,7 @@ class MainWindow(QMainWindow):
         self._ui.actionSaveAs.triggered.connect(self._actionSaveAs)
         self._ui.actionExit.triggered.connect(self.close)
         self._ui.actionParameters.triggered.connect(self._actionParameters)
+        self._ui.actionDeferCheckMesh.toggled.connect(app.settings.setCheckMeshDeferred)
         self._ui.actionParallelEnvironment.triggered.connect(self._openParallelEnvironmentDialog)
         self._ui.actionScale.triggered.connect(self._actionScale)
         self._ui.actionLanguage.triggered.connect(self._actionLanguage)
@@ -378,6 +381,7 @@ class MainWindow(QMainWindow):
         self._geometryManager = GeometryManager()
         self._meshManager = MeshManager()
         self._meshManager.cellCountChanged.connect(self._cellCountChanged)
+        self._meshManager.qualityFieldsLoaded.connect(self._displayControl.meshQualityFieldsLoaded)
 
         self._geometryManager.load()
         self._stepManager.load()
@@ -391,6 +395,9 @@ class MainWindow(QMainWindow):
         self._renderingTool.clear()
         self._displayControl.clear()
         self._consoleView.clear()
+        if self._geometryManager is not None:
+            self._geometryManager.cancelLoading()
+        snappyHexMesh.cancel()
         self._geometryManager = None
         self._meshManager = None
 
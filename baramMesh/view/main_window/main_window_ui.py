@@ -0,0 +1,2606 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QButtonGroup, QCheckBox,
+    QComboBox, QFormLayout, QFrame, QGridLayout,
+    QGroupBox, QHBoxLayout, QHeaderView, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QMainWindow,
+    QMenu, QMenuBar, QPushButton, QRadioButton,
+    QScrollArea, QSizePolicy, QSpacerItem, QSplitter,
+    QStackedWidget, QStatusBar, QTreeWidget, QTreeWidgetItem,
+    QVBoxLayout, QWidget)
+
+from baramMesh.view.widgets.folder_header import FolderHeader
+from superqt import QLabeledDoubleRangeSlider
+from widgets.enum_combo_box import EnumComboBox
+from widgets.flat_push_button import FlatPushButton
+from widgets.list_table import ListTable
+from widgets.rendering.rendering_widget import RenderingWidget
+from widgets.typed_edit import IntEdit
+import resource_rc
+import resource_rc
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1221, 1065)
+        self.actionNew = QAction(MainWindow)
+        self.actionNew.setObjectName(u"actionNew")
+        self.actionOpen = QAction(MainWindow)
+        self.actionOpen.setObjectName(u"actionOpen")
+        self.actionSave = QAction(MainWindow)
+        self.actionSave.setObjectName(u"actionSave")
+        self.actionSaveAs = QAction(MainWindow)
+        self.actionSaveAs.setObjectName(u"actionSaveAs")
+        self.actionExport = QAction(MainWindow)
+        self.actionExport.setObjectName(u"actionExport")
+        self.actionClose = QAction(MainWindow)
+        self.actionClose.setObjectName(u"actionClose")
+        self.actionExit = QAction(MainWindow)
+        self.actionExit.setObjectName(u"actionExit")
+        self.actionParameters = QAction(MainWindow)
+        self.actionParameters.setObjectName(u"actionParameters")
+        self.actionDeferCheckMesh = QAction(MainWindow)
+        self.actionDeferCheckMesh.setObjectName(u"actionDeferCheckMesh")
+        self.actionDeferCheckMesh.setCheckable(True)
+        self.actionScale = QAction(MainWindow)
+        self.actionScale.setObjectName(u"actionScale")
+        self.actionLanguage = QAction(MainWindow)
+        self.actionLanguage.setObjectName(u"actionLanguage")
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName(u"actionAbout")
+        self.action = QAction(MainWindow)
+        self.action.setObjectName(u"action")
+        self.actionParallelEnvironment = QAction(MainWindow)
+        self.actionParallelEnvironment.setObjectName(u"actionParallelEnvironment")
+        self.actionTutorials = QAction(MainWindow)
+        self.actionTutorials.setObjectName(u"actionTutorials")
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.verticalLayout_23 = QVBoxLayout(self.centralwidget)
+        self.verticalLayout_23.setObjectName(u"verticalLayout_23")
+        self.splitter = QSplitter(self.centralwidget)
+        self.splitter.setObjectName(u"splitter")
+        self.splitter.setOrientation(Qt.Vertical)
+        self.widget_23 = QWidget(self.splitter)
+        self.widget_23.setObjectName(u"widget_23")
+        self.verticalLayout_35 = QVBoxLayout(self.widget_23)
+        self.verticalLayout_35.setObjectName(u"verticalLayout_35")
+        self.verticalLayout_35.setContentsMargins(0, 0, 0, 0)
+        self.navigation = QGroupBox(self.widget_23)
+        self.navigation.setObjectName(u"navigation")
+        self.horizontalLayout_2 = QHBoxLayout(self.navigation)
+        self.horizontalLayout_2.setSpacing(6)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, 8, -1, 8)
+        self.geometryStep = QPushButton(self.navigation)
+        self.stepButtons = QButtonGroup(MainWindow)
+        self.stepButtons.setObjectName(u"stepButtons")
+        self.stepButtons.addButton(self.geometryStep)
+        self.geometryStep.setObjectName(u"geometryStep")
+        self.geometryStep.setMinimumSize(QSize(0, 32))
+        self.geometryStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.geometryStep)
+
+        self.label_54 = QLabel(self.navigation)
+        self.label_54.setObjectName(u"label_54")
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_54.sizePolicy().hasHeightForWidth())
+        self.label_54.setSizePolicy(sizePolicy)
+        self.label_54.setMinimumSize(QSize(32, 32))
+        self.label_54.setMaximumSize(QSize(32, 32))
+        self.label_54.setPixmap(QPixmap(u":/icons/chevron-forward.svg"))
+        self.label_54.setScaledContents(True)
+
+        self.horizontalLayout_2.addWidget(self.label_54)
+
+        self.regionStep = QPushButton(self.navigation)
+        self.stepButtons.addButton(self.regionStep)
+        self.regionStep.setObjectName(u"regionStep")
+        self.regionStep.setMinimumSize(QSize(0, 32))
+        self.regionStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.regionStep)
+
+        self.label_55 = QLabel(self.navigation)
+        self.label_55.setObjectName(u"label_55")
+        sizePolicy.setHeightForWidth(self.label_55.sizePolicy().hasHeightForWidth())
+        self.label_55.setSizePolicy(sizePolicy)
+        self.label_55.setMinimumSize(QSize(32, 32))
+        self.label_55.setMaximumSize(QSize(32, 32))
+        self.label_55.setPixmap(QPixmap(u":/icons/chevron-forward.svg"))
+        self.label_55.setScaledContents(True)
+
+        self.horizontalLayout_2.addWidget(self.label_55)
+
+        self.baseGridStep = QPushButton(self.navigation)
+        self.stepButtons.addButton(self.baseGridStep)
+        self.baseGridStep.setObjectName(u"baseGridStep")
+        self.baseGridStep.setMinimumSize(QSize(0, 32))
+        self.baseGridStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.baseGridStep)
+
+        self.label_57 = QLabel(self.navigation)
+        self.label_57.setObjectName(u"label_57")
+        sizePolicy.setHeightForWidth(self.label_57.sizePolicy().hasHeightForWidth())
+        self.label_57.setSizePolicy(sizePolicy)
+        self.label_57.setMinimumSize(QSize(32, 32))
+        self.label_57.setMaximumSize(QSize(32, 32))
+        self.label_57.setPixmap(QPixmap(u":/icons/chevron-forward.svg"))
+        self.label_57.setScaledContents(True)
+
+        self.horizontalLayout_2.addWidget(self.label_57)
+
+        self.castellationStep = QPushButton(self.navigation)
+        self.stepButtons.addButton(self.castellationStep)
+        self.castellationStep.setObjectName(u"castellationStep")
+        self.castellationStep.setMinimumSize(QSize(0, 32))
+        self.castellationStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.castellationStep)
+
+        self.label_59 = QLabel(self.navigation)
+        self.label_59.setObjectName(u"label_59")
+        sizePolicy.setHeightForWidth(self.label_59.sizePolicy().hasHeightForWidth())
+        self.label_59.setSizePolicy(sizePolicy)
+        self.label_59.setMinimumSize(QSize(32, 32))
+        self.label_59.setMaximumSize(QSize(32, 32))
+        self.label_59.setPixmap(QPixmap(u":/icons/chevron-forward.svg"))
+        self.label_59.setScaledContents(True)
+
+        self.horizontalLayout_2.addWidget(self.label_59)
+
+        self.snapStep = QPushButton(self.navigation)
+        self.stepButtons.addButton(self.snapStep)
+        self.snapStep.setObjectName(u"snapStep")
+        self.snapStep.setMinimumSize(QSize(0, 32))
+        self.snapStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.snapStep)
+
+        self.label_58 = QLabel(self.navigation)
+        self.label_58.setObjectName(u"label_58")
+        sizePolicy.setHeightForWidth(self.label_58.sizePolicy().hasHeightForWidth())
+        self.label_58.setSizePolicy(sizePolicy)
+        self.label_58.setMinimumSize(QSize(32, 32))
+        self.label_58.setMaximumSize(QSize(32, 32))
+        self.label_58.setPixmap(QPixmap(u":/icons/chevron-forward.svg"))
+        self.label_58.setScaledContents(True)
+
+        self.horizontalLayout_2.addWidget(self.label_58)
+
+        self.boundaryLayerStep = QPushButton(self.navigation)
+        self.stepButtons.addButton(self.boundaryLayerStep)
+        self.boundaryLayerStep.setObjectName(u"boundaryLayerStep")
+        self.boundaryLayerStep.setMinimumSize(QSize(0, 32))
+        self.boundaryLayerStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.boundaryLayerStep)
+
+        self.label_56 = QLabel(self.navigation)
+        self.label_56.setObjectName(u"label_56")
+        sizePolicy.setHeightForWidth(self.label_56.sizePolicy().hasHeightForWidth())
+        self.label_56.setSizePolicy(sizePolicy)
+        self.label_56.setMinimumSize(QSize(32, 32))
+        self.label_56.setMaximumSize(QSize(32, 32))
+        self.label_56.setPixmap(QPixmap(u":/icons/chevron-forward.svg"))
+        self.label_56.setScaledContents(True)
+
+        self.horizontalLayout_2.addWidget(self.label_56)
+
+        self.exportStep = QPushButton(self.navigation)
+        self.stepButtons.addButton(self.exportStep)
+        self.exportStep.setObjectName(u"exportStep")
+        self.exportStep.setMinimumSize(QSize(0, 32))
+        self.exportStep.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.exportStep)
+
+
+        self.verticalLayout_35.addWidget(self.navigation)
+
+        self.widget_5 = QWidget(self.widget_23)
+        self.widget_5.setObjectName(u"widget_5")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.widget_5.sizePolicy().hasHeightForWidth())
+        self.widget_5.setSizePolicy(sizePolicy1)
+        self.verticalLayout_25 = QVBoxLayout(self.widget_5)
+        self.verticalLayout_25.setObjectName(u"verticalLayout_25")
+        self.verticalLayout_25.setContentsMargins(0, -1, 0, 0)
+        self.centralSplitter = QSplitter(self.widget_5)
+        self.centralSplitter.setObjectName(u"centralSplitter")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.centralSplitter.sizePolicy().hasHeightForWidth())
+        self.centralSplitter.setSizePolicy(sizePolicy2)
+        self.centralSplitter.setOrientation(Qt.Horizontal)
+        self.groupBox_9 = QGroupBox(self.centralSplitter)
+        self.groupBox_9.setObjectName(u"groupBox_9")
+        self.groupBox_9.setMinimumSize(QSize(380, 0))
+        self.verticalLayout_2 = QVBoxLayout(self.groupBox_9)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, -1)
+        self.content = QStackedWidget(self.groupBox_9)
+        self.content.setObjectName(u"content")
+        sizePolicy2.setHeightForWidth(self.content.sizePolicy().hasHeightForWidth())
+        self.content.setSizePolicy(sizePolicy2)
+        self.geometryPage = QWidget()
+        self.geometryPage.setObjectName(u"geometryPage")
+        self.verticalLayout_4 = QVBoxLayout(self.geometryPage)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.label = QLabel(self.geometryPage)
+        self.label.setObjectName(u"label")
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.label.setFont(font)
+
+        self.verticalLayout_4.addWidget(self.label)
+
+        self.line = QFrame(self.geometryPage)
+        self.line.setObjectName(u"line")
+        self.line.setFrameShape(QFrame.HLine)
+        self.line.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_4.addWidget(self.line)
+
+        self.geometryList = QTreeWidget(self.geometryPage)
+        self.geometryList.setObjectName(u"geometryList")
+        self.geometryList.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.geometryList.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.geometryList.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.geometryList.setExpandsOnDoubleClick(False)
+        self.geometryList.setColumnCount(2)
+        self.geometryList.header().setVisible(True)
+        self.geometryList.header().setStretchLastSection(False)
+
+        self.verticalLayout_4.addWidget(self.geometryList)
+
+        self.geometryButtons = QWidget(self.geometryPage)
+        self.geometryButtons.setObjectName(u"geometryButtons")
+        self.horizontalLayout_4 = QHBoxLayout(self.geometryButtons)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, -1, 0, -1)
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_4.addItem(self.horizontalSpacer_4)
+
+        self.import_ = QPushButton(self.geometryButtons)
+        self.import_.setObjectName(u"import_")
+
+        self.horizontalLayout_4.addWidget(self.import_)
+
+        self.add = QPushButton(self.geometryButtons)
+        self.add.setObjectName(u"add")
+
+        self.horizontalLayout_4.addWidget(self.add)
+
+
+        self.verticalLayout_4.addWidget(self.geometryButtons)
+
+        self.content.addWidget(self.geometryPage)
+        self.regionPage = QWidget()
+        self.regionPage.setObjectName(u"regionPage")
+        self.verticalLayout_26 = QVBoxLayout(self.regionPage)
+        self.verticalLayout_26.setObjectName(u"verticalLayout_26")
+        self.widget_33 = QWidget(self.regionPage)
+        self.widget_33.setObjectName(u"widget_33")
+        self.horizontalLayout_18 = QHBoxLayout(self.widget_33)
+        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
+        self.horizontalLayout_18.setContentsMargins(0, 0, 0, 0)
+        self.label_38 = QLabel(self.widget_33)
+        self.label_38.setObjectName(u"label_38")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.label_38.sizePolicy().hasHeightForWidth())
+        self.label_38.setSizePolicy(sizePolicy3)
+        self.label_38.setFont(font)
+
+        self.horizontalLayout_18.addWidget(self.label_38)
+
+        self.regionAdd = FlatPushButton(self.widget_33)
+        self.regionAdd.setObjectName(u"regionAdd")
+        icon = QIcon()
+        icon.addFile(u":/icons/add-circle-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.regionAdd.setIcon(icon)
+
+        self.horizontalLayout_18.addWidget(self.regionAdd)
+
+
+        self.verticalLayout_26.addWidget(self.widget_33)
+
+        self.line_12 = QFrame(self.regionPage)
+        self.line_12.setObjectName(u"line_12")
+        self.line_12.setFrameShape(QFrame.HLine)
+        self.line_12.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_26.addWidget(self.line_12)
+
+        self.regionEmptyMessage = QLabel(self.regionPage)
+        self.regionEmptyMessage.setObjectName(u"regionEmptyMessage")
+        self.regionEmptyMessage.setStyleSheet(u"padding: 10px; border: 1px solid LightGrey")
+        self.regionEmptyMessage.setFrameShape(QFrame.NoFrame)
+        self.regionEmptyMessage.setWordWrap(True)
+
+        self.verticalLayout_26.addWidget(self.regionEmptyMessage)
+
+        self.regionArea = QScrollArea(self.regionPage)
+        self.regionArea.setObjectName(u"regionArea")
+        self.regionArea.setFrameShape(QFrame.NoFrame)
+        self.regionArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.regionArea.setWidgetResizable(True)
+        self.regionList = QWidget()
+        self.regionList.setObjectName(u"regionList")
+        self.regionList.setGeometry(QRect(0, 0, 449, 633))
+        self.regionArea.setWidget(self.regionList)
+
+        self.verticalLayout_26.addWidget(self.regionArea)
+
+        self.content.addWidget(self.regionPage)
+        self.baseGridPage = QWidget()
+        self.baseGridPage.setObjectName(u"baseGridPage")
+        self.verticalLayout_5 = QVBoxLayout(self.baseGridPage)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.label_2 = QLabel(self.baseGridPage)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setFont(font)
+
+        self.verticalLayout_5.addWidget(self.label_2)
+
+        self.line_2 = QFrame(self.baseGridPage)
+        self.line_2.setObjectName(u"line_2")
+        self.line_2.setFrameShape(QFrame.HLine)
+        self.line_2.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_5.addWidget(self.line_2)
+
+        self.groupBox_10 = QGroupBox(self.baseGridPage)
+        self.groupBox_10.setObjectName(u"groupBox_10")
+        self.verticalLayout_31 = QVBoxLayout(self.groupBox_10)
+        self.verticalLayout_31.setObjectName(u"verticalLayout_31")
+        self.frame = QFrame(self.groupBox_10)
+        self.frame.setObjectName(u"frame")
+        self.gridLayout = QGridLayout(self.frame)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.xMin = QLabel(self.frame)
+        self.xMin.setObjectName(u"xMin")
+
+        self.gridLayout.addWidget(self.xMin, 1, 1, 1, 1)
+
+        self.zMax = QLabel(self.frame)
+        self.zMax.setObjectName(u"zMax")
+
+        self.gridLayout.addWidget(self.zMax, 3, 2, 1, 1)
+
+        self.label_39 = QLabel(self.frame)
+        self.label_39.setObjectName(u"label_39")
+
+        self.gridLayout.addWidget(self.label_39, 0, 3, 1, 1)
+
+        self.label_4 = QLabel(self.frame)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 0, 2, 1, 1)
+
+        self.label_9 = QLabel(self.frame)
+        self.label_9.setObjectName(u"label_9")
+
+        self.gridLayout.addWidget(self.label_9, 3, 0, 1, 1)
+
+        self.zMin = QLabel(self.frame)
+        self.zMin.setObjectName(u"zMin")
+
+        self.gridLayout.addWidget(self.zMin, 3, 1, 1, 1)
+
+        self.yMin = QLabel(self.frame)
+        self.yMin.setObjectName(u"yMin")
+
+        self.gridLayout.addWidget(self.yMin, 2, 1, 1, 1)
+
+        self.yMax = QLabel(self.frame)
+        self.yMax.setObjectName(u"yMax")
+
+        self.gridLayout.addWidget(self.yMax, 2, 2, 1, 1)
+
+        self.label_3 = QLabel(self.frame)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 0, 1, 1, 1)
+
+        self.label_8 = QLabel(self.frame)
+        self.label_8.setObjectName(u"label_8")
+
+        self.gridLayout.addWidget(self.label_8, 2, 0, 1, 1)
+
+        self.xMax = QLabel(self.frame)
+        self.xMax.setObjectName(u"xMax")
+
+        self.gridLayout.addWidget(self.xMax, 1, 2, 1, 1)
+
+        self.label_7 = QLabel(self.frame)
+        self.label_7.setObjectName(u"label_7")
+
+        self.gridLayout.addWidget(self.label_7, 1, 0, 1, 1)
+
+        self.label_40 = QLabel(self.frame)
+        self.label_40.setObjectName(u"label_40")
+
+        self.gridLayout.addWidget(self.label_40, 0, 4, 1, 1)
+
+        self.xLen = QLabel(self.frame)
+        self.xLen.setObjectName(u"xLen")
+
+        self.gridLayout.addWidget(self.xLen, 1, 3, 1, 1)
+
+        self.yLen = QLabel(self.frame)
+        self.yLen.setObjectName(u"yLen")
+
+        self.gridLayout.addWidget(self.yLen, 2, 3, 1, 1)
+
+        self.zLen = QLabel(self.frame)
+        self.zLen.setObjectName(u"zLen")
+
+        self.gridLayout.addWidget(self.zLen, 3, 3, 1, 1)
+
+        self.xCell = QLabel(self.frame)
+        self.xCell.setObjectName(u"xCell")
+
+        self.gridLayout.addWidget(self.xCell, 1, 4, 1, 1)
+
+        self.yCell = QLabel(self.frame)
+        self.yCell.setObjectName(u"yCell")
+
+        self.gridLayout.addWidget(self.yCell, 2, 4, 1, 1)
+
+        self.zCell = QLabel(self.frame)
+        self.zCell.setObjectName(u"zCell")
+
+        self.gridLayout.addWidget(self.zCell, 3, 4, 1, 1)
+
+
+        self.verticalLayout_31.addWidget(self.frame)
+
+        self.useHex6 = QGroupBox(self.groupBox_10)
+        self.useHex6.setObjectName(u"useHex6")
+        self.useHex6.setCheckable(True)
+        self.useHex6.setChecked(False)
+        self.verticalLayout_32 = QVBoxLayout(self.useHex6)
+        self.verticalLayout_32.setObjectName(u"verticalLayout_32")
+        self.boundingHex6 = QComboBox(self.useHex6)
+        self.boundingHex6.setObjectName(u"boundingHex6")
+
+        self.verticalLayout_32.addWidget(self.boundingHex6)
+
+
+        self.verticalLayout_31.addWidget(self.useHex6)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_10)
+
+        self.groupBox_2 = QGroupBox(self.baseGridPage)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        self.formLayout = QFormLayout(self.groupBox_2)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_12 = QLabel(self.groupBox_2)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label_12)
+
+        self.numCellsX = IntEdit(self.groupBox_2)
+        self.numCellsX.setObjectName(u"numCellsX")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.numCellsX)
+
+        self.label_10 = QLabel(self.groupBox_2)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_10)
+
+        self.numCellsY = IntEdit(self.groupBox_2)
+        self.numCellsY.setObjectName(u"numCellsY")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.numCellsY)
+
+        self.label_11 = QLabel(self.groupBox_2)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_11)
+
+        self.numCellsZ = IntEdit(self.groupBox_2)
+        self.numCellsZ.setObjectName(u"numCellsZ")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.numCellsZ)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox_2)
+
+        self.widget_3 = QWidget(self.baseGridPage)
+        self.widget_3.setObjectName(u"widget_3")
+        self.horizontalLayout_5 = QHBoxLayout(self.widget_3)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_3)
+
+        self.generate = QPushButton(self.widget_3)
+        self.generate.setObjectName(u"generate")
+
+        self.horizontalLayout_5.addWidget(self.generate)
+
+        self.baseGridReset = QPushButton(self.widget_3)
+        self.baseGridReset.setObjectName(u"baseGridReset")
+
+        self.horizontalLayout_5.addWidget(self.baseGridReset)
+
+
+        self.verticalLayout_5.addWidget(self.widget_3)
+
+        self.verticalSpacer = QSpacerItem(20, 273, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_5.addItem(self.verticalSpacer)
+
+        self.content.addWidget(self.baseGridPage)
+        self.castellationPage = QWidget()
+        self.castellationPage.setObjectName(u"castellationPage")
+        self.verticalLayout_6 = QVBoxLayout(self.castellationPage)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.widget_41 = QWidget(self.castellationPage)
+        self.widget_41.setObjectName(u"widget_41")
+        self.horizontalLayout_30 = QHBoxLayout(self.widget_41)
+        self.horizontalLayout_30.setObjectName(u"horizontalLayout_30")
+        self.horizontalLayout_30.setContentsMargins(0, 0, 0, 0)
+        self.label_18 = QLabel(self.widget_41)
+        self.label_18.setObjectName(u"label_18")
+        self.label_18.setFont(font)
+
+        self.horizontalLayout_30.addWidget(self.label_18)
+
+        self.loadCastellationDefaults = FlatPushButton(self.widget_41)
+        self.loadCastellationDefaults.setObjectName(u"loadCastellationDefaults")
+        self.loadCastellationDefaults.setMaximumSize(QSize(16, 16))
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/arrow-undo-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.loadCastellationDefaults.setIcon(icon1)
+        self.loadCastellationDefaults.setIconSize(QSize(16, 16))
+        self.loadCastellationDefaults.setCheckable(True)
+
+        self.horizontalLayout_30.addWidget(self.loadCastellationDefaults)
+
+
+        self.verticalLayout_6.addWidget(self.widget_41)
+
+        self.line_6 = QFrame(self.castellationPage)
+        self.line_6.setObjectName(u"line_6")
+        self.line_6.setFrameShape(QFrame.HLine)
+        self.line_6.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_6.addWidget(self.line_6)
+
+        self.scrollArea_2 = QScrollArea(self.castellationPage)
+        self.scrollArea_2.setObjectName(u"scrollArea_2")
+        self.scrollArea_2.setFrameShape(QFrame.NoFrame)
+        self.scrollArea_2.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea_2.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 272, 592))
+        self.verticalLayout_8 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.verticalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.widget_11 = QWidget(self.scrollAreaWidgetContents)
+        self.widget_11.setObjectName(u"widget_11")
+        self.verticalLayout_9 = QVBoxLayout(self.widget_11)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.verticalLayout_9.setContentsMargins(-1, -1, -1, 9)
+        self.castellationConfigurationHeader = FolderHeader(self.widget_11)
+        self.castellationConfigurationHeader.setObjectName(u"castellationConfigurationHeader")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.castellationConfigurationHeader.sizePolicy().hasHeightForWidth())
+        self.castellationConfigurationHeader.setSizePolicy(sizePolicy4)
+        font1 = QFont()
+        font1.setBold(True)
+        self.castellationConfigurationHeader.setFont(font1)
+        self.castellationConfigurationHeader.setChecked(True)
+
+        self.verticalLayout_9.addWidget(self.castellationConfigurationHeader)
+
+        self.line_4 = QFrame(self.widget_11)
+        self.line_4.setObjectName(u"line_4")
+        self.line_4.setFrameShape(QFrame.HLine)
+        self.line_4.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_9.addWidget(self.line_4)
+
+        self.castellationConfiguration = QWidget(self.widget_11)
+        self.castellationConfiguration.setObjectName(u"castellationConfiguration")
+        self.verticalLayout_10 = QVBoxLayout(self.castellationConfiguration)
+        self.verticalLayout_10.setSpacing(0)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.verticalLayout_10.setContentsMargins(-1, 0, -1, 0)
+        self.widget_12 = QWidget(self.castellationConfiguration)
+        self.widget_12.setObjectName(u"widget_12")
+        self.formLayout_3 = QFormLayout(self.widget_12)
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.formLayout_3.setContentsMargins(0, -1, 0, 4)
+        self.label_15 = QLabel(self.widget_12)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout_3.setWidget(0, QFormLayout.LabelRole, self.label_15)
+
+        self.nCellsBetweenLevels = QLineEdit(self.widget_12)
+        self.nCellsBetweenLevels.setObjectName(u"nCellsBetweenLevels")
+
+        self.formLayout_3.setWidget(0, QFormLayout.FieldRole, self.nCellsBetweenLevels)
+
+        self.label_16 = QLabel(self.widget_12)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout_3.setWidget(1, QFormLayout.LabelRole, self.label_16)
+
+        self.resolveFeatureAngle = QLineEdit(self.widget_12)
+        self.resolveFeatureAngle.setObjectName(u"resolveFeatureAngle")
+
+        self.formLayout_3.setWidget(1, QFormLayout.FieldRole, self.resolveFeatureAngle)
+
+
+        self.verticalLayout_10.addWidget(self.widget_12)
+
+        self.widget_13 = QWidget(self.castellationConfiguration)
+        self.widget_13.setObjectName(u"widget_13")
+        self.verticalLayout_11 = QVBoxLayout(self.widget_13)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.verticalLayout_11.setContentsMargins(0, 4, 0, -1)
+        self.keepNonManifoldEdges = QCheckBox(self.widget_13)
+        self.keepNonManifoldEdges.setObjectName(u"keepNonManifoldEdges")
+
+        self.verticalLayout_11.addWidget(self.keepNonManifoldEdges)
+
+        self.keepOpenEdges = QCheckBox(self.widget_13)
+        self.keepOpenEdges.setObjectName(u"keepOpenEdges")
+
+        self.verticalLayout_11.addWidget(self.keepOpenEdges)
+
+
+        self.verticalLayout_10.addWidget(self.widget_13)
+
+
+        self.verticalLayout_9.addWidget(self.castellationConfiguration)
+
+
+        self.verticalLayout_8.addWidget(self.widget_11)
+
+        self.widget_22 = QWidget(self.scrollAreaWidgetContents)
+        self.widget_22.setObjectName(u"widget_22")
+        self.verticalLayout_13 = QVBoxLayout(self.widget_22)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(-1, -1, -1, 9)
+        self.castellationAdvancedHeader = FolderHeader(self.widget_22)
+        self.castellationAdvancedHeader.setObjectName(u"castellationAdvancedHeader")
+        sizePolicy4.setHeightForWidth(self.castellationAdvancedHeader.sizePolicy().hasHeightForWidth())
+        self.castellationAdvancedHeader.setSizePolicy(sizePolicy4)
+        self.castellationAdvancedHeader.setFont(font1)
+        self.castellationAdvancedHeader.setChecked(False)
+
+        self.verticalLayout_13.addWidget(self.castellationAdvancedHeader)
+
+        self.line_13 = QFrame(self.widget_22)
+        self.line_13.setObjectName(u"line_13")
+        self.line_13.setFrameShape(QFrame.HLine)
+        self.line_13.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_13.addWidget(self.line_13)
+
+        self.castellationAdvanced = QWidget(self.widget_22)
+        self.castellationAdvanced.setObjectName(u"castellationAdvanced")
+        self.verticalLayout_27 = QVBoxLayout(self.castellationAdvanced)
+        self.verticalLayout_27.setObjectName(u"verticalLayout_27")
+        self.widget_25 = QWidget(self.castellationAdvanced)
+        self.widget_25.setObjectName(u"widget_25")
+        self.formLayout_8 = QFormLayout(self.widget_25)
+        self.formLayout_8.setObjectName(u"formLayout_8")
+        self.formLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.label_41 = QLabel(self.widget_25)
+        self.label_41.setObjectName(u"label_41")
+
+        self.formLayout_8.setWidget(0, QFormLayout.LabelRole, self.label_41)
+
+        self.maxGlobalCells = QLineEdit(self.widget_25)
+        self.maxGlobalCells.setObjectName(u"maxGlobalCells")
+
+        self.formLayout_8.setWidget(0, QFormLayout.FieldRole, self.maxGlobalCells)
+
+        self.label_42 = QLabel(self.widget_25)
+        self.label_42.setObjectName(u"label_42")
+
+        self.formLayout_8.setWidget(1, QFormLayout.LabelRole, self.label_42)
+
+        self.maxLocalCells = QLineEdit(self.widget_25)
+        self.maxLocalCells.setObjectName(u"maxLocalCells")
+
+        self.formLayout_8.setWidget(1, QFormLayout.FieldRole, self.maxLocalCells)
+
+        self.label_43 = QLabel(self.widget_25)
+        self.label_43.setObjectName(u"label_43")
+
+        self.formLayout_8.setWidget(2, QFormLayout.LabelRole, self.label_43)
+
+        self.minRefinementCells = QLineEdit(self.widget_25)
+        self.minRefinementCells.setObjectName(u"minRefinementCells")
+
+        self.formLayout_8.setWidget(2, QFormLayout.FieldRole, self.minRefinementCells)
+
+        self.label_44 = QLabel(self.widget_25)
+        self.label_44.setObjectName(u"label_44")
+
+        self.formLayout_8.setWidget(3, QFormLayout.LabelRole, self.label_44)
+
+        self.maxLoadUnbalance = QLineEdit(self.widget_25)
+        self.maxLoadUnbalance.setObjectName(u"maxLoadUnbalance")
+
+        self.formLayout_8.setWidget(3, QFormLayout.FieldRole, self.maxLoadUnbalance)
+
+
+        self.verticalLayout_27.addWidget(self.widget_25)
+
+        self.allowFreeStandingZoneFaces = QCheckBox(self.castellationAdvanced)
+        self.allowFreeStandingZoneFaces.setObjectName(u"allowFreeStandingZoneFaces")
+
+        self.verticalLayout_27.addWidget(self.allowFreeStandingZoneFaces)
+
+
+        self.verticalLayout_13.addWidget(self.castellationAdvanced)
+
+
+        self.verticalLayout_8.addWidget(self.widget_22)
+
+        self.widget_26 = QWidget(self.scrollAreaWidgetContents)
+        self.widget_26.setObjectName(u"widget_26")
+        self.verticalLayout_28 = QVBoxLayout(self.widget_26)
+        self.verticalLayout_28.setObjectName(u"verticalLayout_28")
+        self.widget_27 = QWidget(self.widget_26)
+        self.widget_27.setObjectName(u"widget_27")
+        self.horizontalLayout_13 = QHBoxLayout(self.widget_27)
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.horizontalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.surfaceRefinementHeader = FolderHeader(self.widget_27)
+        self.surfaceRefinementHeader.setObjectName(u"surfaceRefinementHeader")
+        sizePolicy4.setHeightForWidth(self.surfaceRefinementHeader.sizePolicy().hasHeightForWidth())
+        self.surfaceRefinementHeader.setSizePolicy(sizePolicy4)
+        self.surfaceRefinementHeader.setFont(font1)
+        self.surfaceRefinementHeader.setChecked(True)
+
+        self.horizontalLayout_13.addWidget(self.surfaceRefinementHeader)
+
+        self.surfaceRefinementAdd = FlatPushButton(self.widget_27)
+        self.surfaceRefinementAdd.setObjectName(u"surfaceRefinementAdd")
+        self.surfaceRefinementAdd.setIcon(icon)
+
+        self.horizontalLayout_13.addWidget(self.surfaceRefinementAdd)
+
+
+        self.verticalLayout_28.addWidget(self.widget_27)
+
+        self.line_5 = QFrame(self.widget_26)
+        self.line_5.setObjectName(u"line_5")
+        self.line_5.setFrameShape(QFrame.HLine)
+        self.line_5.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_28.addWidget(self.line_5)
+
+        self.surfaceRefinement = ListTable(self.widget_26)
+        self.surfaceRefinement.setObjectName(u"surfaceRefinement")
+        self.surfaceRefinement.setStyleSheet(u"")
+        self.surfaceRefinement.setFrameShape(QFrame.Box)
+        self.surfaceRefinement.setFrameShadow(QFrame.Raised)
+        self.gridLayout_2 = QGridLayout(self.surfaceRefinement)
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_46 = QLabel(self.surfaceRefinement)
+        self.label_46.setObjectName(u"label_46")
+        self.label_46.setFont(font1)
+
+        self.gridLayout_2.addWidget(self.label_46, 0, 0, 1, 1)
+
+        self.label_45 = QLabel(self.surfaceRefinement)
+        self.label_45.setObjectName(u"label_45")
+        self.label_45.setFont(font1)
+
+        self.gridLayout_2.addWidget(self.label_45, 0, 1, 1, 1)
+
+        self.label_63 = QLabel(self.surfaceRefinement)
+        self.label_63.setObjectName(u"label_63")
+        self.label_63.setFont(font1)
+
+        self.gridLayout_2.addWidget(self.label_63, 0, 2, 1, 1)
+
+
+        self.verticalLayout_28.addWidget(self.surfaceRefinement)
+
+
+        self.verticalLayout_8.addWidget(self.widget_26)
+
+        self.widget_14 = QWidget(self.scrollAreaWidgetContents)
+        self.widget_14.setObjectName(u"widget_14")
+        self.verticalLayout_12 = QVBoxLayout(self.widget_14)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.widget_28 = QWidget(self.widget_14)
+        self.widget_28.setObjectName(u"widget_28")
+        self.horizontalLayout_15 = QHBoxLayout(self.widget_28)
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.horizontalLayout_15.setContentsMargins(0, 0, 0, 0)
+        self.volumeRefinementHeader = FolderHeader(self.widget_28)
+        self.volumeRefinementHeader.setObjectName(u"volumeRefinementHeader")
+        sizePolicy4.setHeightForWidth(self.volumeRefinementHeader.sizePolicy().hasHeightForWidth())
+        self.volumeRefinementHeader.setSizePolicy(sizePolicy4)
+        self.volumeRefinementHeader.setFont(font1)
+        self.volumeRefinementHeader.setChecked(True)
+
+        self.horizontalLayout_15.addWidget(self.volumeRefinementHeader)
+
+        self.volumeRefinementAdd = FlatPushButton(self.widget_28)
+        self.volumeRefinementAdd.setObjectName(u"volumeRefinementAdd")
+        self.volumeRefinementAdd.setIcon(icon)
+
+        self.horizontalLayout_15.addWidget(self.volumeRefinementAdd)
+
+
+        self.verticalLayout_12.addWidget(self.widget_28)
+
+        self.line_14 = QFrame(self.widget_14)
+        self.line_14.setObjectName(u"line_14")
+        self.line_14.setFrameShape(QFrame.HLine)
+        self.line_14.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_12.addWidget(self.line_14)
+
+        self.volumeRefinement = ListTable(self.widget_14)
+        self.volumeRefinement.setObjectName(u"volumeRefinement")
+        self.volumeRefinement.setFrameShape(QFrame.Box)
+        self.volumeRefinement.setFrameShadow(QFrame.Raised)
+        self.gridLayout_4 = QGridLayout(self.volumeRefinement)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.label_50 = QLabel(self.volumeRefinement)
+        self.label_50.setObjectName(u"label_50")
+        self.label_50.setFont(font1)
+
+        self.gridLayout_4.addWidget(self.label_50, 0, 0, 1, 1)
+
+        self.label_49 = QLabel(self.volumeRefinement)
+        self.label_49.setObjectName(u"label_49")
+        self.label_49.setFont(font1)
+
+        self.gridLayout_4.addWidget(self.label_49, 0, 1, 1, 1)
+
+
+        self.verticalLayout_12.addWidget(self.volumeRefinement)
+
+        self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_12.addItem(self.verticalSpacer_5)
+
+
+        self.verticalLayout_8.addWidget(self.widget_14)
+
+        self.scrollArea_2.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_6.addWidget(self.scrollArea_2)
+
+        self.castellationButtons = QWidget(self.castellationPage)
+        self.castellationButtons.setObjectName(u"castellationButtons")
+        self.horizontalLayout_9 = QHBoxLayout(self.castellationButtons)
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_9.addItem(self.horizontalSpacer_6)
+
+        self.refine = QPushButton(self.castellationButtons)
+        self.refine.setObjectName(u"refine")
+
+        self.horizontalLayout_9.addWidget(self.refine)
+
+        self.castellationCancel = QPushButton(self.castellationButtons)
+        self.castellationCancel.setObjectName(u"castellationCancel")
+
+        self.horizontalLayout_9.addWidget(self.castellationCancel)
+
+        self.castellationReset = QPushButton(self.castellationButtons)
+        self.castellationReset.setObjectName(u"castellationReset")
+
+        self.horizontalLayout_9.addWidget(self.castellationReset)
+
+
+        self.verticalLayout_6.addWidget(self.castellationButtons)
+
+        self.content.addWidget(self.castellationPage)
+        self.snapPage = QWidget()
+        self.snapPage.setObjectName(u"snapPage")
+        self.verticalLayout_16 = QVBoxLayout(self.snapPage)
+        self.verticalLayout_16.setObjectName(u"verticalLayout_16")
+        self.widget_42 = QWidget(self.snapPage)
+        self.widget_42.setObjectName(u"widget_42")
+        self.horizontalLayout_31 = QHBoxLayout(self.widget_42)
+        self.horizontalLayout_31.setObjectName(u"horizontalLayout_31")
+        self.horizontalLayout_31.setContentsMargins(0, 0, 0, 0)
+        self.label_68 = QLabel(self.widget_42)
+        self.label_68.setObjectName(u"label_68")
+        self.label_68.setFont(font)
+
+        self.horizontalLayout_31.addWidget(self.label_68)
+
+        self.loadSnapDefaults = FlatPushButton(self.widget_42)
+        self.loadSnapDefaults.setObjectName(u"loadSnapDefaults")
+        self.loadSnapDefaults.setMaximumSize(QSize(16, 16))
+        self.loadSnapDefaults.setIcon(icon1)
+        self.loadSnapDefaults.setIconSize(QSize(16, 16))
+        self.loadSnapDefaults.setCheckable(True)
+
+        self.horizontalLayout_31.addWidget(self.loadSnapDefaults)
+
+
+        self.verticalLayout_16.addWidget(self.widget_42)
+
+        self.line_7 = QFrame(self.snapPage)
+        self.line_7.setObjectName(u"line_7")
+        self.line_7.setFrameShape(QFrame.HLine)
+        self.line_7.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_16.addWidget(self.line_7)
+
+        self.snapContents = QScrollArea(self.snapPage)
+        self.snapContents.setObjectName(u"snapContents")
+        self.snapContents.setFrameShape(QFrame.NoFrame)
+        self.snapContents.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.snapContents.setWidgetResizable(True)
+        self.scrollAreaWidgetContents_3 = QWidget()
+        self.scrollAreaWidgetContents_3.setObjectName(u"scrollAreaWidgetContents_3")
+        self.scrollAreaWidgetContents_3.setGeometry(QRect(0, 0, 375, 736))
+        self.verticalLayout_40 = QVBoxLayout(self.scrollAreaWidgetContents_3)
+        self.verticalLayout_40.setObjectName(u"verticalLayout_40")
+        self.verticalLayout_40.setContentsMargins(0, 0, 0, 0)
+        self.widget_40 = QWidget(self.scrollAreaWidgetContents_3)
+        self.widget_40.setObjectName(u"widget_40")
+        self.verticalLayout_14 = QVBoxLayout(self.widget_40)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.label_20 = QLabel(self.widget_40)
+        self.label_20.setObjectName(u"label_20")
+
+        self.verticalLayout_14.addWidget(self.label_20)
+
+        self.line_8 = QFrame(self.widget_40)
+        self.line_8.setObjectName(u"line_8")
+        self.line_8.setFrameShape(QFrame.HLine)
+        self.line_8.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_14.addWidget(self.line_8)
+
+        self.groupBox_3 = QGroupBox(self.widget_40)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.formLayout_4 = QFormLayout(self.groupBox_3)
+        self.formLayout_4.setObjectName(u"formLayout_4")
+        self.label_21 = QLabel(self.groupBox_3)
+        self.label_21.setObjectName(u"label_21")
+
+        self.formLayout_4.setWidget(0, QFormLayout.LabelRole, self.label_21)
+
+        self.smoothingForSurface = QLineEdit(self.groupBox_3)
+        self.smoothingForSurface.setObjectName(u"smoothingForSurface")
+
+        self.formLayout_4.setWidget(0, QFormLayout.FieldRole, self.smoothingForSurface)
+
+        self.label_22 = QLabel(self.groupBox_3)
+        self.label_22.setObjectName(u"label_22")
+
+        self.formLayout_4.setWidget(1, QFormLayout.LabelRole, self.label_22)
+
+        self.smoothingForInternal = QLineEdit(self.groupBox_3)
+        self.smoothingForInternal.setObjectName(u"smoothingForInternal")
+
+        self.formLayout_4.setWidget(1, QFormLayout.FieldRole, self.smoothingForInternal)
+
+        self.label_23 = QLabel(self.groupBox_3)
+        self.label_23.setObjectName(u"label_23")
+
+        self.formLayout_4.setWidget(2, QFormLayout.LabelRole, self.label_23)
+
+        self.meshDisplacementRelaxation = QLineEdit(self.groupBox_3)
+        self.meshDisplacementRelaxation.setObjectName(u"meshDisplacementRelaxation")
+
+        self.formLayout_4.setWidget(2, QFormLayout.FieldRole, self.meshDisplacementRelaxation)
+
+        self.label_24 = QLabel(self.groupBox_3)
+        self.label_24.setObjectName(u"label_24")
+
+        self.formLayout_4.setWidget(3, QFormLayout.LabelRole, self.label_24)
+
+        self.globalSnappingRelaxation = QLineEdit(self.groupBox_3)
+        self.globalSnappingRelaxation.setObjectName(u"globalSnappingRelaxation")
+
+        self.formLayout_4.setWidget(3, QFormLayout.FieldRole, self.globalSnappingRelaxation)
+
+
+        self.verticalLayout_14.addWidget(self.groupBox_3)
+
+        self.groupBox_4 = QGroupBox(self.widget_40)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.verticalLayout_15 = QVBoxLayout(self.groupBox_4)
+        self.verticalLayout_15.setObjectName(u"verticalLayout_15")
+        self.widget_18 = QWidget(self.groupBox_4)
+        self.widget_18.setObjectName(u"widget_18")
+        self.formLayout_5 = QFormLayout(self.widget_18)
+        self.formLayout_5.setObjectName(u"formLayout_5")
+        self.formLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.label_25 = QLabel(self.widget_18)
+        self.label_25.setObjectName(u"label_25")
+
+        self.formLayout_5.setWidget(0, QFormLayout.LabelRole, self.label_25)
+
+        self.featureSnappingRelaxation = QLineEdit(self.widget_18)
+        self.featureSnappingRelaxation.setObjectName(u"featureSnappingRelaxation")
+
+        self.formLayout_5.setWidget(0, QFormLayout.FieldRole, self.featureSnappingRelaxation)
+
+        self.label_35 = QLabel(self.widget_18)
+        self.label_35.setObjectName(u"label_35")
+
+        self.formLayout_5.setWidget(1, QFormLayout.LabelRole, self.label_35)
+
+        self.featureSnapType = EnumComboBox(self.widget_18)
+        self.featureSnapType.setObjectName(u"featureSnapType")
+
+        self.formLayout_5.setWidget(1, QFormLayout.FieldRole, self.featureSnapType)
+
+
+        self.verticalLayout_15.addWidget(self.widget_18)
+
+        self.multiSurfaceFeatureSnap = QCheckBox(self.groupBox_4)
+        self.multiSurfaceFeatureSnap.setObjectName(u"multiSurfaceFeatureSnap")
+
+        self.verticalLayout_15.addWidget(self.multiSurfaceFeatureSnap)
+
+
+        self.verticalLayout_14.addWidget(self.groupBox_4)
+
+        self.widget_19 = QWidget(self.widget_40)
+        self.widget_19.setObjectName(u"widget_19")
+        self.formLayout_6 = QFormLayout(self.widget_19)
+        self.formLayout_6.setObjectName(u"formLayout_6")
+        self.label_26 = QLabel(self.widget_19)
+        self.label_26.setObjectName(u"label_26")
+
+        self.formLayout_6.setWidget(0, QFormLayout.LabelRole, self.label_26)
+
+        self.tolerance = QLineEdit(self.widget_19)
+        self.tolerance.setObjectName(u"tolerance")
+
+        self.formLayout_6.setWidget(0, QFormLayout.FieldRole, self.tolerance)
+
+        self.label_27 = QLabel(self.widget_19)
+        self.label_27.setObjectName(u"label_27")
+
+        self.formLayout_6.setWidget(1, QFormLayout.LabelRole, self.label_27)
+
+        self.concaveAngle = QLineEdit(self.widget_19)
+        self.concaveAngle.setObjectName(u"concaveAngle")
+
+        self.formLayout_6.setWidget(1, QFormLayout.FieldRole, self.concaveAngle)
+
+        self.label_28 = QLabel(self.widget_19)
+        self.label_28.setObjectName(u"label_28")
+
+        self.formLayout_6.setWidget(2, QFormLayout.LabelRole, self.label_28)
+
+        self.minAreaRatio = QLineEdit(self.widget_19)
+        self.minAreaRatio.setObjectName(u"minAreaRatio")
+
+        self.formLayout_6.setWidget(2, QFormLayout.FieldRole, self.minAreaRatio)
+
+
+        self.verticalLayout_14.addWidget(self.widget_19)
+
+
+        self.verticalLayout_40.addWidget(self.widget_40)
+
+        self.bufferLayer = QGroupBox(self.scrollAreaWidgetContents_3)
+        self.bufferLayer.setObjectName(u"bufferLayer")
+        self.bufferLayer.setCheckable(True)
+        self.bufferLayer.setChecked(False)
+        self.verticalLayout_36 = QVBoxLayout(self.bufferLayer)
+        self.verticalLayout_36.setObjectName(u"verticalLayout_36")
+        self.groupBox_11 = QGroupBox(self.bufferLayer)
+        self.groupBox_11.setObjectName(u"groupBox_11")
+        self.verticalLayout_38 = QVBoxLayout(self.groupBox_11)
+        self.verticalLayout_38.setObjectName(u"verticalLayout_38")
+        self.bufferLayerLaplacian = QRadioButton(self.groupBox_11)
+        self.bufferLayerLaplacian.setObjectName(u"bufferLayerLaplacian")
+
+        self.verticalLayout_38.addWidget(self.bufferLayerLaplacian)
+
+        self.bufferLayerGETMe = QRadioButton(self.groupBox_11)
+        self.bufferLayerGETMe.setObjectName(u"bufferLayerGETMe")
+
+        self.verticalLayout_38.addWidget(self.bufferLayerGETMe)
+
+
+        self.verticalLayout_36.addWidget(self.groupBox_11)
+
+        self.widget_20 = QWidget(self.bufferLayer)
+        self.widget_20.setObjectName(u"widget_20")
+        self.formLayout_13 = QFormLayout(self.widget_20)
+        self.formLayout_13.setObjectName(u"formLayout_13")
+        self.label_65 = QLabel(self.widget_20)
+        self.label_65.setObjectName(u"label_65")
+
+        self.formLayout_13.setWidget(0, QFormLayout.LabelRole, self.label_65)
+
+        self.bufferLayerNumberOfPointSmootherIteration = QLineEdit(self.widget_20)
+        self.bufferLayerNumberOfPointSmootherIteration.setObjectName(u"bufferLayerNumberOfPointSmootherIteration")
+
+        self.formLayout_13.setWidget(0, QFormLayout.FieldRole, self.bufferLayerNumberOfPointSmootherIteration)
+
+        self.label_66 = QLabel(self.widget_20)
+        self.label_66.setObjectName(u"label_66")
+
+        self.formLayout_13.setWidget(1, QFormLayout.LabelRole, self.label_66)
+
+        self.bufferLayerGETMeTransformationParameter = QLineEdit(self.widget_20)
+        self.bufferLayerGETMeTransformationParameter.setObjectName(u"bufferLayerGETMeTransformationParameter")
+
+        self.formLayout_13.setWidget(1, QFormLayout.FieldRole, self.bufferLayerGETMeTransformationParameter)
+
+
+        self.verticalLayout_36.addWidget(self.widget_20)
+
+        self.widget_38 = QWidget(self.bufferLayer)
+        self.widget_38.setObjectName(u"widget_38")
+        self.verticalLayout_39 = QVBoxLayout(self.widget_38)
+        self.verticalLayout_39.setObjectName(u"verticalLayout_39")
+        self.verticalLayout_39.setContentsMargins(-1, 0, -1, -1)
+        self.widget_39 = QWidget(self.widget_38)
+        self.widget_39.setObjectName(u"widget_39")
+        self.horizontalLayout_29 = QHBoxLayout(self.widget_39)
+        self.horizontalLayout_29.setObjectName(u"horizontalLayout_29")
+        self.horizontalLayout_29.setContentsMargins(0, -1, 0, 0)
+        self.label_67 = QLabel(self.widget_39)
+        self.label_67.setObjectName(u"label_67")
+
+        self.horizontalLayout_29.addWidget(self.label_67)
+
+        self.horizontalSpacer_9 = QSpacerItem(229, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_29.addItem(self.horizontalSpacer_9)
+
+        self.bufferLayerSurfacesSelect = QPushButton(self.widget_39)
+        self.bufferLayerSurfacesSelect.setObjectName(u"bufferLayerSurfacesSelect")
+
+        self.horizontalLayout_29.addWidget(self.bufferLayerSurfacesSelect)
+
+
+        self.verticalLayout_39.addWidget(self.widget_39)
+
+        self.bufferLayerSurfaces = QListWidget(self.widget_38)
+        self.bufferLayerSurfaces.setObjectName(u"bufferLayerSurfaces")
+        self.bufferLayerSurfaces.setSelectionMode(QAbstractItemView.NoSelection)
+
+        self.verticalLayout_39.addWidget(self.bufferLayerSurfaces)
+
+
+        self.verticalLayout_36.addWidget(self.widget_38)
+
+
+        self.verticalLayout_40.addWidget(self.bufferLayer)
+
+        self.snapContents.setWidget(self.scrollAreaWidgetContents_3)
+
+        self.verticalLayout_16.addWidget(self.snapContents)
+
+        self.widget_16 = QWidget(self.snapPage)
+        self.widget_16.setObjectName(u"widget_16")
+        self.horizontalLayout_10 = QHBoxLayout(self.widget_16)
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.horizontalSpacer_7 = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_10.addItem(self.horizontalSpacer_7)
+
+        self.snap = QPushButton(self.widget_16)
+        self.snap.setObjectName(u"snap")
+
+        self.horizontalLayout_10.addWidget(self.snap)
+
+        self.snapCancel = QPushButton(self.widget_16)
+        self.snapCancel.setObjectName(u"snapCancel")
+
+        self.horizontalLayout_10.addWidget(self.snapCancel)
+
+        self.snapReset = QPushButton(self.widget_16)
+        self.snapReset.setObjectName(u"snapReset")
+
+        self.horizontalLayout_10.addWidget(self.snapReset)
+
+
+        self.verticalLayout_16.addWidget(self.widget_16)
+
+        self.content.addWidget(self.snapPage)
+        self.boundaryLayerPage = QWidget()
+        self.boundaryLayerPage.setObjectName(u"boundaryLayerPage")
+        self.verticalLayout_18 = QVBoxLayout(self.boundaryLayerPage)
+        self.verticalLayout_18.setObjectName(u"verticalLayout_18")
+        self.widget_43 = QWidget(self.boundaryLayerPage)
+        self.widget_43.setObjectName(u"widget_43")
+        self.horizontalLayout_32 = QHBoxLayout(self.widget_43)
+        self.horizontalLayout_32.setObjectName(u"horizontalLayout_32")
+        self.horizontalLayout_32.setContentsMargins(0, 0, 0, 0)
+        self.label_19 = QLabel(self.widget_43)
+        self.label_19.setObjectName(u"label_19")
+        self.label_19.setFont(font)
+
+        self.horizontalLayout_32.addWidget(self.label_19)
+
+        self.loadBoundaryLayerDefaults = FlatPushButton(self.widget_43)
+        self.loadBoundaryLayerDefaults.setObjectName(u"loadBoundaryLayerDefaults")
+        self.loadBoundaryLayerDefaults.setMaximumSize(QSize(16, 16))
+        self.loadBoundaryLayerDefaults.setIcon(icon1)
+        self.loadBoundaryLayerDefaults.setIconSize(QSize(16, 16))
+        self.loadBoundaryLayerDefaults.setCheckable(True)
+
+        self.horizontalLayout_32.addWidget(self.loadBoundaryLayerDefaults)
+
+
+        self.verticalLayout_18.addWidget(self.widget_43)
+
+        self.line_9 = QFrame(self.boundaryLayerPage)
+        self.line_9.setObjectName(u"line_9")
+        self.line_9.setFrameShape(QFrame.HLine)
+        self.line_9.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_18.addWidget(self.line_9)
+
+        self.scrollArea_3 = QScrollArea(self.boundaryLayerPage)
+        self.scrollArea_3.setObjectName(u"scrollArea_3")
+        self.scrollArea_3.setFrameShape(QFrame.NoFrame)
+        self.scrollArea_3.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scrollArea_3.setWidgetResizable(True)
+        self.scrollAreaWidgetContents_2 = QWidget()
+        self.scrollAreaWidgetContents_2.setObjectName(u"scrollAreaWidgetContents_2")
+        self.scrollAreaWidgetContents_2.setGeometry(QRect(0, 0, 263, 661))
+        self.verticalLayout_20 = QVBoxLayout(self.scrollAreaWidgetContents_2)
+        self.verticalLayout_20.setObjectName(u"verticalLayout_20")
+        self.verticalLayout_20.setContentsMargins(0, 0, 0, 0)
+        self.widget_29 = QWidget(self.scrollAreaWidgetContents_2)
+        self.widget_29.setObjectName(u"widget_29")
+        self.verticalLayout_29 = QVBoxLayout(self.widget_29)
+        self.verticalLayout_29.setObjectName(u"verticalLayout_29")
+        self.widget_30 = QWidget(self.widget_29)
+        self.widget_30.setObjectName(u"widget_30")
+        self.horizontalLayout_16 = QHBoxLayout(self.widget_30)
+        self.horizontalLayout_16.setObjectName(u"horizontalLayout_16")
+        self.horizontalLayout_16.setContentsMargins(0, 0, 0, 0)
+        self.boundaryLayerConfigurationsHeader = FolderHeader(self.widget_30)
+        self.boundaryLayerConfigurationsHeader.setObjectName(u"boundaryLayerConfigurationsHeader")
+        sizePolicy4.setHeightForWidth(self.boundaryLayerConfigurationsHeader.sizePolicy().hasHeightForWidth())
+        self.boundaryLayerConfigurationsHeader.setSizePolicy(sizePolicy4)
+        self.boundaryLayerConfigurationsHeader.setFont(font1)
+        self.boundaryLayerConfigurationsHeader.setChecked(True)
+
+        self.horizontalLayout_16.addWidget(self.boundaryLayerConfigurationsHeader)
+
+        self.boundaryLayerConfigurationsAdd = FlatPushButton(self.widget_30)
+        self.boundaryLayerConfigurationsAdd.setObjectName(u"boundaryLayerConfigurationsAdd")
+        self.boundaryLayerConfigurationsAdd.setIcon(icon)
+
+        self.horizontalLayout_16.addWidget(self.boundaryLayerConfigurationsAdd)
+
+
+        self.verticalLayout_29.addWidget(self.widget_30)
+
+        self.line_15 = QFrame(self.widget_29)
+        self.line_15.setObjectName(u"line_15")
+        self.line_15.setFrameShape(QFrame.HLine)
+        self.line_15.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_29.addWidget(self.line_15)
+
+        self.boundaryLayerConfigurations = ListTable(self.widget_29)
+        self.boundaryLayerConfigurations.setObjectName(u"boundaryLayerConfigurations")
+        self.boundaryLayerConfigurations.setStyleSheet(u"")
+        self.boundaryLayerConfigurations.setFrameShape(QFrame.Box)
+        self.boundaryLayerConfigurations.setFrameShadow(QFrame.Raised)
+        self.gridLayout_3 = QGridLayout(self.boundaryLayerConfigurations)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.label_47 = QLabel(self.boundaryLayerConfigurations)
+        self.label_47.setObjectName(u"label_47")
+        self.label_47.setFont(font1)
+
+        self.gridLayout_3.addWidget(self.label_47, 0, 1, 1, 1)
+
+        self.label_48 = QLabel(self.boundaryLayerConfigurations)
+        self.label_48.setObjectName(u"label_48")
+        self.label_48.setFont(font1)
+
+        self.gridLayout_3.addWidget(self.label_48, 0, 0, 1, 1)
+
+
+        self.verticalLayout_29.addWidget(self.boundaryLayerConfigurations)
+
+
+        self.verticalLayout_20.addWidget(self.widget_29)
+
+        self.widget_31 = QWidget(self.scrollAreaWidgetContents_2)
+        self.widget_31.setObjectName(u"widget_31")
+        self.verticalLayout_30 = QVBoxLayout(self.widget_31)
+        self.verticalLayout_30.setObjectName(u"verticalLayout_30")
+        self.widget_32 = QWidget(self.widget_31)
+        self.widget_32.setObjectName(u"widget_32")
+        self.horizontalLayout_17 = QHBoxLayout(self.widget_32)
+        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
+        self.horizontalLayout_17.setContentsMargins(0, 0, 0, 0)
+        self.boundaryLayerAdvancedConfigurationHeader = FolderHeader(self.widget_32)
+        self.boundaryLayerAdvancedConfigurationHeader.setObjectName(u"boundaryLayerAdvancedConfigurationHeader")
+        sizePolicy4.setHeightForWidth(self.boundaryLayerAdvancedConfigurationHeader.sizePolicy().hasHeightForWidth())
+        self.boundaryLayerAdvancedConfigurationHeader.setSizePolicy(sizePolicy4)
+        self.boundaryLayerAdvancedConfigurationHeader.setFont(font1)
+        self.boundaryLayerAdvancedConfigurationHeader.setChecked(True)
+
+        self.horizontalLayout_17.addWidget(self.boundaryLayerAdvancedConfigurationHeader)
+
+
+        self.verticalLayout_30.addWidget(self.widget_32)
+
+        self.line_16 = QFrame(self.widget_31)
+        self.line_16.setObjectName(u"line_16")
+        self.line_16.setFrameShape(QFrame.HLine)
+        self.line_16.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_30.addWidget(self.line_16)
+
+        self.boundaryLayerAdvancedConfiguration = QWidget(self.widget_31)
+        self.boundaryLayerAdvancedConfiguration.setObjectName(u"boundaryLayerAdvancedConfiguration")
+        self.verticalLayout_19 = QVBoxLayout(self.boundaryLayerAdvancedConfiguration)
+        self.verticalLayout_19.setObjectName(u"verticalLayout_19")
+        self.verticalLayout_19.setContentsMargins(0, -1, 0, -1)
+        self.widget_15 = QWidget(self.boundaryLayerAdvancedConfiguration)
+        self.widget_15.setObjectName(u"widget_15")
+        self.formLayout_7 = QFormLayout(self.widget_15)
+        self.formLayout_7.setObjectName(u"formLayout_7")
+        self.formLayout_7.setContentsMargins(-1, 0, -1, -1)
+        self.label_14 = QLabel(self.widget_15)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout_7.setWidget(0, QFormLayout.LabelRole, self.label_14)
+
+        self.nGrow = QLineEdit(self.widget_15)
+        self.nGrow.setObjectName(u"nGrow")
+
+        self.formLayout_7.setWidget(0, QFormLayout.FieldRole, self.nGrow)
+
+
+        self.verticalLayout_19.addWidget(self.widget_15)
+
+        self.groupBox_5 = QGroupBox(self.boundaryLayerAdvancedConfiguration)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.formLayout_9 = QFormLayout(self.groupBox_5)
+        self.formLayout_9.setObjectName(u"formLayout_9")
+        self.label_17 = QLabel(self.groupBox_5)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout_9.setWidget(1, QFormLayout.LabelRole, self.label_17)
+
+        self.maxFaceThicknessRatio = QLineEdit(self.groupBox_5)
+        self.maxFaceThicknessRatio.setObjectName(u"maxFaceThicknessRatio")
+
+        self.formLayout_9.setWidget(1, QFormLayout.FieldRole, self.maxFaceThicknessRatio)
+
+        self.label_60 = QLabel(self.groupBox_5)
+        self.label_60.setObjectName(u"label_60")
+
+        self.formLayout_9.setWidget(0, QFormLayout.LabelRole, self.label_60)
+
+        self.featureAngleThreshold = QLineEdit(self.groupBox_5)
+        self.featureAngleThreshold.setObjectName(u"featureAngleThreshold")
+
+        self.formLayout_9.setWidget(0, QFormLayout.FieldRole, self.featureAngleThreshold)
+
+
+        self.verticalLayout_19.addWidget(self.groupBox_5)
+
+        self.groupBox_6 = QGroupBox(self.boundaryLayerAdvancedConfiguration)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.formLayout_10 = QFormLayout(self.groupBox_6)
+        self.formLayout_10.setObjectName(u"formLayout_10")
+        self.label_30 = QLabel(self.groupBox_6)
+        self.label_30.setObjectName(u"label_30")
+
+        self.formLayout_10.setWidget(0, QFormLayout.LabelRole, self.label_30)
+
+        self.nSmoothSurfaceNormals = QLineEdit(self.groupBox_6)
+        self.nSmoothSurfaceNormals.setObjectName(u"nSmoothSurfaceNormals")
+
+        self.formLayout_10.setWidget(0, QFormLayout.FieldRole, self.nSmoothSurfaceNormals)
+
+        self.label_31 = QLabel(self.groupBox_6)
+        self.label_31.setObjectName(u"label_31")
+
+        self.formLayout_10.setWidget(1, QFormLayout.LabelRole, self.label_31)
+
+        self.nSmoothThickness = QLineEdit(self.groupBox_6)
+        self.nSmoothThickness.setObjectName(u"nSmoothThickness")
+
+        self.formLayout_10.setWidget(1, QFormLayout.FieldRole, self.nSmoothThickness)
+
+
+        self.verticalLayout_19.addWidget(self.groupBox_6)
+
+        self.groupBox_7 = QGroupBox(self.boundaryLayerAdvancedConfiguration)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.formLayout_11 = QFormLayout(self.groupBox_7)
+        self.formLayout_11.setObjectName(u"formLayout_11")
+        self.label_32 = QLabel(self.groupBox_7)
+        self.label_32.setObjectName(u"label_32")
+
+        self.formLayout_11.setWidget(0, QFormLayout.LabelRole, self.label_32)
+
+        self.minMedialAxisAngle = QLineEdit(self.groupBox_7)
+        self.minMedialAxisAngle.setObjectName(u"minMedialAxisAngle")
+
+        self.formLayout_11.setWidget(0, QFormLayout.FieldRole, self.minMedialAxisAngle)
+
+        self.label_33 = QLabel(self.groupBox_7)
+        self.label_33.setObjectName(u"label_33")
+
+        self.formLayout_11.setWidget(1, QFormLayout.LabelRole, self.label_33)
+
+        self.maxThicknessToMedialRatio = QLineEdit(self.groupBox_7)
+        self.maxThicknessToMedialRatio.setObjectName(u"maxThicknessToMedialRatio")
+
+        self.formLayout_11.setWidget(1, QFormLayout.FieldRole, self.maxThicknessToMedialRatio)
+
+        self.label_34 = QLabel(self.groupBox_7)
+        self.label_34.setObjectName(u"label_34")
+
+        self.formLayout_11.setWidget(2, QFormLayout.LabelRole, self.label_34)
+
+        self.nSmoothNormals = QLineEdit(self.groupBox_7)
+        self.nSmoothNormals.setObjectName(u"nSmoothNormals")
+
+        self.formLayout_11.setWidget(2, QFormLayout.FieldRole, self.nSmoothNormals)
+
+        self.label_36 = QLabel(self.groupBox_7)
+        self.label_36.setObjectName(u"label_36")
+
+        self.formLayout_11.setWidget(3, QFormLayout.LabelRole, self.label_36)
+
+        self.nRelaxIter = QLineEdit(self.groupBox_7)
+        self.nRelaxIter.setObjectName(u"nRelaxIter")
+
+        self.formLayout_11.setWidget(3, QFormLayout.FieldRole, self.nRelaxIter)
+
+
+        self.verticalLayout_19.addWidget(self.groupBox_7)
+
+        self.groupBox_8 = QGroupBox(self.boundaryLayerAdvancedConfiguration)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.formLayout_12 = QFormLayout(self.groupBox_8)
+        self.formLayout_12.setObjectName(u"formLayout_12")
+        self.label_51 = QLabel(self.groupBox_8)
+        self.label_51.setObjectName(u"label_51")
+
+        self.formLayout_12.setWidget(0, QFormLayout.LabelRole, self.label_51)
+
+        self.nBufferCellsNoExtrude = QLineEdit(self.groupBox_8)
+        self.nBufferCellsNoExtrude.setObjectName(u"nBufferCellsNoExtrude")
+
+        self.formLayout_12.setWidget(0, QFormLayout.FieldRole, self.nBufferCellsNoExtrude)
+
+        self.label_52 = QLabel(self.groupBox_8)
+        self.label_52.setObjectName(u"label_52")
+
+        self.formLayout_12.setWidget(1, QFormLayout.LabelRole, self.label_52)
+
+        self.nLayerIter = QLineEdit(self.groupBox_8)
+        self.nLayerIter.setObjectName(u"nLayerIter")
+
+        self.formLayout_12.setWidget(1, QFormLayout.FieldRole, self.nLayerIter)
+
+        self.label_53 = QLabel(self.groupBox_8)
+        self.label_53.setObjectName(u"label_53")
+
+        self.formLayout_12.setWidget(2, QFormLayout.LabelRole, self.label_53)
+
+        self.nRelaxedIter = QLineEdit(self.groupBox_8)
+        self.nRelaxedIter.setObjectName(u"nRelaxedIter")
+
+        self.formLayout_12.setWidget(2, QFormLayout.FieldRole, self.nRelaxedIter)
+
+
+        self.verticalLayout_19.addWidget(self.groupBox_8)
+
+
+        self.verticalLayout_30.addWidget(self.boundaryLayerAdvancedConfiguration)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_30.addItem(self.verticalSpacer_3)
+
+
+        self.verticalLayout_20.addWidget(self.widget_31)
+
+        self.scrollArea_3.setWidget(self.scrollAreaWidgetContents_2)
+
+        self.verticalLayout_18.addWidget(self.scrollArea_3)
+
+        self.boundaryLayerButtons = QWidget(self.boundaryLayerPage)
+        self.boundaryLayerButtons.setObjectName(u"boundaryLayerButtons")
+        self.horizontalLayout_11 = QHBoxLayout(self.boundaryLayerButtons)
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.horizontalSpacer_8 = QSpacerItem(18, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_11.addItem(self.horizontalSpacer_8)
+
+        self.boundaryLayerApply = QPushButton(self.boundaryLayerButtons)
+        self.boundaryLayerApply.setObjectName(u"boundaryLayerApply")
+
+        self.horizontalLayout_11.addWidget(self.boundaryLayerApply)
+
+        self.boundaryLayerCancel = QPushButton(self.boundaryLayerButtons)
+        self.boundaryLayerCancel.setObjectName(u"boundaryLayerCancel")
+
+        self.horizontalLayout_11.addWidget(self.boundaryLayerCancel)
+
+        self.boundaryLayerReset = QPushButton(self.boundaryLayerButtons)
+        self.boundaryLayerReset.setObjectName(u"boundaryLayerReset")
+
+        self.horizontalLayout_11.addWidget(self.boundaryLayerReset)
+
+
+        self.verticalLayout_18.addWidget(self.boundaryLayerButtons)
+
+        self.content.addWidget(self.boundaryLayerPage)
+        self.exportPage = QWidget()
+        self.exportPage.setObjectName(u"exportPage")
+        self.verticalLayout_22 = QVBoxLayout(self.exportPage)
+        self.verticalLayout_22.setSpacing(9)
+        self.verticalLayout_22.setObjectName(u"verticalLayout_22")
+        self.label_37 = QLabel(self.exportPage)
+        self.label_37.setObjectName(u"label_37")
+        self.label_37.setFont(font)
+
+        self.verticalLayout_22.addWidget(self.label_37)
+
+        self.line_11 = QFrame(self.exportPage)
+        self.line_11.setObjectName(u"line_11")
+        self.line_11.setFrameShape(QFrame.HLine)
+        self.line_11.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_22.addWidget(self.line_11)
+
+        self.validationMessage = QLabel(self.exportPage)
+        self.validationMessage.setObjectName(u"validationMessage")
+        self.validationMessage.setStyleSheet(u"color: red")
+
+        self.verticalLayout_22.addWidget(self.validationMessage)
+
+        self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_22.addItem(self.verticalSpacer_4)
+
+        self.groupBox_20 = QGroupBox(self.exportPage)
+        self.groupBox_20.setObjectName(u"groupBox_20")
+        self.verticalLayout_37 = QVBoxLayout(self.groupBox_20)
+        self.verticalLayout_37.setObjectName(u"verticalLayout_37")
+        self.verticalLayout_37.setContentsMargins(9, 9, 9, 9)
+        self.widget = QWidget(self.groupBox_20)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_12 = QHBoxLayout(self.widget)
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.horizontalLayout_12.setContentsMargins(0, 0, 0, 0)
+        self.export2DPlane = QPushButton(self.widget)
+        self.export2DPlane.setObjectName(u"export2DPlane")
+
+        self.horizontalLayout_12.addWidget(self.export2DPlane)
+
+        self.export2DWedge = QPushButton(self.widget)
+        self.export2DWedge.setObjectName(u"export2DWedge")
+
+        self.horizontalLayout_12.addWidget(self.export2DWedge)
+
+
+        self.verticalLayout_37.addWidget(self.widget)
+
+        self.label_13 = QLabel(self.groupBox_20)
+        self.label_13.setObjectName(u"label_13")
+        self.label_13.setWordWrap(True)
+
+        self.verticalLayout_37.addWidget(self.label_13)
+
+
+        self.verticalLayout_22.addWidget(self.groupBox_20)
+
+        self.export_ = QPushButton(self.exportPage)
+        self.export_.setObjectName(u"export_")
+        self.export_.setMinimumSize(QSize(0, 50))
+
+        self.verticalLayout_22.addWidget(self.export_)
+
+        self.content.addWidget(self.exportPage)
+
+        self.verticalLayout_2.addWidget(self.content)
+
+        self.regionValidationMessage = QLabel(self.groupBox_9)
+        self.regionValidationMessage.setObjectName(u"regionValidationMessage")
+        self.regionValidationMessage.setStyleSheet(u"padding: 10px; border: 1px solid LightGrey; color: red")
+        self.regionValidationMessage.setWordWrap(True)
+
+        self.verticalLayout_2.addWidget(self.regionValidationMessage)
+
+        self.widget_4 = QWidget(self.groupBox_9)
+        self.widget_4.setObjectName(u"widget_4")
+        self.horizontalLayout_3 = QHBoxLayout(self.widget_4)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, -1, -1, 0)
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_2)
+
+        self.unlock = QPushButton(self.widget_4)
+        self.unlock.setObjectName(u"unlock")
+
+        self.horizontalLayout_3.addWidget(self.unlock)
+
+        self.finishSteps = QPushButton(self.widget_4)
+        self.finishSteps.setObjectName(u"finishSteps")
+
+        self.horizontalLayout_3.addWidget(self.finishSteps)
+
+        self.finishCancel = QPushButton(self.widget_4)
+        self.finishCancel.setObjectName(u"finishCancel")
+
+        self.horizontalLayout_3.addWidget(self.finishCancel)
+
+        self.next = QPushButton(self.widget_4)
+        self.next.setObjectName(u"next")
+        self.next.setEnabled(False)
+
+        self.horizontalLayout_3.addWidget(self.next)
+
+
+        self.verticalLayout_2.addWidget(self.widget_4)
+
+        self.centralSplitter.addWidget(self.groupBox_9)
+        self.groupBox_24 = QGroupBox(self.centralSplitter)
+        self.groupBox_24.setObjectName(u"groupBox_24")
+        sizePolicy3.setHeightForWidth(self.groupBox_24.sizePolicy().hasHeightForWidth())
+        self.groupBox_24.setSizePolicy(sizePolicy3)
+        self.verticalLayout_24 = QVBoxLayout(self.groupBox_24)
+        self.verticalLayout_24.setObjectName(u"verticalLayout_24")
+        self.verticalLayout_24.setContentsMargins(0, 0, -1, -1)
+        self.renderingSplitter = QSplitter(self.groupBox_24)
+        self.renderingSplitter.setObjectName(u"renderingSplitter")
+        sizePolicy2.setHeightForWidth(self.renderingSplitter.sizePolicy().hasHeightForWidth())
+        self.renderingSplitter.setSizePolicy(sizePolicy2)
+        self.renderingSplitter.setOrientation(Qt.Horizontal)
+        self.widget_37 = QWidget(self.renderingSplitter)
+        self.widget_37.setObjectName(u"widget_37")
+        self.widget_37.setMinimumSize(QSize(0, 0))
+        self.verticalLayout_3 = QVBoxLayout(self.widget_37)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, 2, -1, 0)
+        self.widget_34 = QWidget(self.widget_37)
+        self.widget_34.setObjectName(u"widget_34")
+        self.horizontalLayout_25 = QHBoxLayout(self.widget_34)
+        self.horizontalLayout_25.setObjectName(u"horizontalLayout_25")
+        self.horizontalLayout_25.setContentsMargins(0, 0, 0, 0)
+        self.label_61 = QLabel(self.widget_34)
+        self.label_61.setObjectName(u"label_61")
+        self.label_61.setFont(font)
+
+        self.horizontalLayout_25.addWidget(self.label_61)
+
+        self.horizontalSpacer_12 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_25.addItem(self.horizontalSpacer_12)
+
+        self.rendering = QCheckBox(self.widget_34)
+        self.rendering.setObjectName(u"rendering")
+        self.rendering.setStyleSheet(u"QCheckBox::indicator { width: 32px; height: 32px;}\n"
+"QCheckBox::indicator:unchecked { image: url(:/images/toggle_off); padding: 0; }\n"
+"QCheckBox::indicator:checked { image: url(:/images/toggle_on); padding: 0; }")
+        self.rendering.setChecked(True)
+
+        self.horizontalLayout_25.addWidget(self.rendering)
+
+
+        self.verticalLayout_3.addWidget(self.widget_34)
+
+        self.line_10 = QFrame(self.widget_37)
+        self.line_10.setObjectName(u"line_10")
+        self.line_10.setFrameShape(QFrame.HLine)
+        self.line_10.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_3.addWidget(self.line_10)
+
+        self.displayControl = QWidget(self.widget_37)
+        self.displayControl.setObjectName(u"displayControl")
+        self.verticalLayout_17 = QVBoxLayout(self.displayControl)
+        self.verticalLayout_17.setObjectName(u"verticalLayout_17")
+        self.verticalLayout_17.setContentsMargins(0, 0, 0, 0)
+        self.cutTool = QWidget(self.displayControl)
+        self.cutTool.setObjectName(u"cutTool")
+        self.verticalLayout_7 = QVBoxLayout(self.cutTool)
+        self.verticalLayout_7.setSpacing(6)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.cutHeader = FolderHeader(self.cutTool)
+        self.cutHeader.setObjectName(u"cutHeader")
+        sizePolicy4.setHeightForWidth(self.cutHeader.sizePolicy().hasHeightForWidth())
+        self.cutHeader.setSizePolicy(sizePolicy4)
+        font2 = QFont()
+        font2.setBold(False)
+        self.cutHeader.setFont(font2)
+        self.cutHeader.setChecked(False)
+
+        self.verticalLayout_7.addWidget(self.cutHeader)
+
+        self.cut = QGroupBox(self.cutTool)
+        self.cut.setObjectName(u"cut")
+        self.verticalLayout_21 = QVBoxLayout(self.cut)
+        self.verticalLayout_21.setObjectName(u"verticalLayout_21")
+        self.widget_35 = QWidget(self.cut)
+        self.widget_35.setObjectName(u"widget_35")
+        self.horizontalLayout_23 = QHBoxLayout(self.widget_35)
+        self.horizontalLayout_23.setObjectName(u"horizontalLayout_23")
+        self.horizontalLayout_23.setContentsMargins(-1, 0, -1, 0)
+        self.clip = QRadioButton(self.widget_35)
+        self.clip.setObjectName(u"clip")
+        self.clip.setChecked(True)
+
+        self.horizontalLayout_23.addWidget(self.clip)
+
+        self.slice = QRadioButton(self.widget_35)
+        self.slice.setObjectName(u"slice")
+
+        self.horizontalLayout_23.addWidget(self.slice)
+
+
+        self.verticalLayout_21.addWidget(self.widget_35)
+
+        self.line_3 = QFrame(self.cut)
+        self.line_3.setObjectName(u"line_3")
+        self.line_3.setFrameShape(QFrame.HLine)
+        self.line_3.setFrameShadow(QFrame.Sunken)
+
+        self.verticalLayout_21.addWidget(self.line_3)
+
+        self.clipOption = QWidget(self.cut)
+        self.clipOption.setObjectName(u"clipOption")
+        self.gridLayout_6 = QGridLayout(self.clipOption)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.gridLayout_6.setVerticalSpacing(0)
+        self.gridLayout_6.setContentsMargins(-1, 0, -1, 0)
+        self.cutX = QCheckBox(self.clipOption)
+        self.cutX.setObjectName(u"cutX")
+
+        self.gridLayout_6.addWidget(self.cutX, 0, 0, 1, 1)
+
+        self.cutXPlane = QWidget(self.clipOption)
+        self.cutXPlane.setObjectName(u"cutXPlane")
+        self.cutXPlane.setEnabled(False)
+        self.horizontalLayout_6 = QHBoxLayout(self.cutXPlane)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(0, 0, 9, 0)
+        self.widget_10 = QWidget(self.cutXPlane)
+        self.widget_10.setObjectName(u"widget_10")
+        self.horizontalLayout_20 = QHBoxLayout(self.widget_10)
+        self.horizontalLayout_20.setSpacing(0)
+        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
+        self.horizontalLayout_20.setContentsMargins(0, 0, 0, 0)
+        self.xCutPlane = QLineEdit(self.widget_10)
+        self.xCutPlane.setObjectName(u"xCutPlane")
+        sizePolicy5 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        sizePolicy5.setHorizontalStretch(0)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.xCutPlane.sizePolicy().hasHeightForWidth())
+        self.xCutPlane.setSizePolicy(sizePolicy5)
+
+        self.horizontalLayout_20.addWidget(self.xCutPlane)
+
+        self.xPlaneHandle = QPushButton(self.widget_10)
+        self.clipHandles = QButtonGroup(MainWindow)
+        self.clipHandles.setObjectName(u"clipHandles")
+        self.clipHandles.setExclusive(False)
+        self.clipHandles.addButton(self.xPlaneHandle)
+        self.xPlaneHandle.setObjectName(u"xPlaneHandle")
+        icon2 = QIcon()
+        icon2.addFile(u":/graphicsIcons/planeHandle.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.xPlaneHandle.setIcon(icon2)
+        self.xPlaneHandle.setCheckable(True)
+
+        self.horizontalLayout_20.addWidget(self.xPlaneHandle)
+
+
+        self.horizontalLayout_6.addWidget(self.widget_10)
+
+        self.xCutInvert = QCheckBox(self.cutXPlane)
+        self.xCutInvert.setObjectName(u"xCutInvert")
+
+        self.horizontalLayout_6.addWidget(self.xCutInvert)
+
+
+        self.gridLayout_6.addWidget(self.cutXPlane, 0, 1, 1, 1)
+
+        self.cutY = QCheckBox(self.clipOption)
+        self.cutY.setObjectName(u"cutY")
+
+        self.gridLayout_6.addWidget(self.cutY, 1, 0, 1, 1)
+
+        self.cutYPlane = QWidget(self.clipOption)
+        self.cutYPlane.setObjectName(u"cutYPlane")
+        self.cutYPlane.setEnabled(False)
+        self.horizontalLayout_7 = QHBoxLayout(self.cutYPlane)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 0, 9, 0)
+        self.widget_21 = QWidget(self.cutYPlane)
+        self.widget_21.setObjectName(u"widget_21")
+        self.horizontalLayout_21 = QHBoxLayout(self.widget_21)
+        self.horizontalLayout_21.setSpacing(0)
+        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
+        self.horizontalLayout_21.setContentsMargins(0, 0, 0, 0)
+        self.yCutPlane = QLineEdit(self.widget_21)
+        self.yCutPlane.setObjectName(u"yCutPlane")
+        sizePolicy5.setHeightForWidth(self.yCutPlane.sizePolicy().hasHeightForWidth())
+        self.yCutPlane.setSizePolicy(sizePolicy5)
+
+        self.horizontalLayout_21.addWidget(self.yCutPlane)
+
+        self.yPlaneHandle = QPushButton(self.widget_21)
+        self.clipHandles.addButton(self.yPlaneHandle)
+        self.yPlaneHandle.setObjectName(u"yPlaneHandle")
+        self.yPlaneHandle.setIcon(icon2)
+        self.yPlaneHandle.setCheckable(True)
+
+        self.horizontalLayout_21.addWidget(self.yPlaneHandle)
+
+
+        self.horizontalLayout_7.addWidget(self.widget_21)
+
+        self.yCutInvert = QCheckBox(self.cutYPlane)
+        self.yCutInvert.setObjectName(u"yCutInvert")
+
+        self.horizontalLayout_7.addWidget(self.yCutInvert)
+
+
+        self.gridLayout_6.addWidget(self.cutYPlane, 1, 1, 1, 1)
+
+        self.cutZ = QCheckBox(self.clipOption)
+        self.cutZ.setObjectName(u"cutZ")
+
+        self.gridLayout_6.addWidget(self.cutZ, 2, 0, 1, 1)
+
+        self.cutZPlane = QWidget(self.clipOption)
+        self.cutZPlane.setObjectName(u"cutZPlane")
+        self.cutZPlane.setEnabled(False)
+        self.horizontalLayout_8 = QHBoxLayout(self.cutZPlane)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(0, 0, 9, 0)
+        self.widget_24 = QWidget(self.cutZPlane)
+        self.widget_24.setObjectName(u"widget_24")
+        self.horizontalLayout_22 = QHBoxLayout(self.widget_24)
+        self.horizontalLayout_22.setSpacing(0)
+        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
+        self.horizontalLayout_22.setContentsMargins(0, 0, 0, 0)
+        self.zCutPlane = QLineEdit(self.widget_24)
+        self.zCutPlane.setObjectName(u"zCutPlane")
+        sizePolicy5.setHeightForWidth(self.zCutPlane.sizePolicy().hasHeightForWidth())
+        self.zCutPlane.setSizePolicy(sizePolicy5)
+
+        self.horizontalLayout_22.addWidget(self.zCutPlane)
+
+        self.zPlaneHandle = QPushButton(self.widget_24)
+        self.clipHandles.addButton(self.zPlaneHandle)
+        self.zPlaneHandle.setObjectName(u"zPlaneHandle")
+        self.zPlaneHandle.setIcon(icon2)
+        self.zPlaneHandle.setCheckable(True)
+
+        self.horizontalLayout_22.addWidget(self.zPlaneHandle)
+
+
+        self.horizontalLayout_8.addWidget(self.widget_24)
+
+        self.zCutInvert = QCheckBox(self.cutZPlane)
+        self.zCutInvert.setObjectName(u"zCutInvert")
+
+        self.horizontalLayout_8.addWidget(self.zCutInvert)
+
+
+        self.gridLayout_6.addWidget(self.cutZPlane, 2, 1, 1, 1)
+
+
+        self.verticalLayout_21.addWidget(self.clipOption)
+
+        self.widget_8 = QWidget(self.cut)
+        self.widget_8.setObjectName(u"widget_8")
+        self.formLayout_2 = QFormLayout(self.widget_8)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setVerticalSpacing(0)
+        self.formLayout_2.setContentsMargins(0, 0, 0, 0)
+
+        self.verticalLayout_21.addWidget(self.widget_8)
+
+        self.sliceOption = QWidget(self.cut)
+        self.sliceOption.setObjectName(u"sliceOption")
+        self.gridLayout_7 = QGridLayout(self.sliceOption)
+        self.gridLayout_7.setObjectName(u"gridLayout_7")
+        self.gridLayout_7.setVerticalSpacing(0)
+        self.gridLayout_7.setContentsMargins(-1, 0, -1, 0)
+        self.slicePlane = QComboBox(self.sliceOption)
+        self.slicePlane.addItem("")
+        self.slicePlane.addItem("")
+        self.slicePlane.addItem("")
+        self.slicePlane.addItem("")
+        self.slicePlane.setObjectName(u"slicePlane")
+
+        self.gridLayout_7.addWidget(self.slicePlane, 0, 0, 1, 1)
+
+        self.sliceBox = QWidget(self.sliceOption)
+        self.sliceBox.setObjectName(u"sliceBox")
+        self.sliceBox.setEnabled(False)
+        self.horizontalLayout_26 = QHBoxLayout(self.sliceBox)
+        self.horizontalLayout_26.setSpacing(0)
+        self.horizontalLayout_26.setObjectName(u"horizontalLayout_26")
+        self.horizontalLayout_26.setContentsMargins(0, 0, 0, 0)
+        self.sliceValue = QLineEdit(self.sliceBox)
+        self.sliceValue.setObjectName(u"sliceValue")
+        sizePolicy5.setHeightForWidth(self.sliceValue.sizePolicy().hasHeightForWidth())
+        self.sliceValue.setSizePolicy(sizePolicy5)
+
+        self.horizontalLayout_26.addWidget(self.sliceValue)
+
+        self.sliceHandle = QPushButton(self.sliceBox)
+        self.sliceHandle.setObjectName(u"sliceHandle")
+        self.sliceHandle.setIcon(icon2)
+        self.sliceHandle.setCheckable(True)
+
+        self.horizontalLayout_26.addWidget(self.sliceHandle)
+
+
+        self.gridLayout_7.addWidget(self.sliceBox, 0, 1, 1, 1)
+
+
+        self.verticalLayout_21.addWidget(self.sliceOption)
+
+        self.widget_36 = QWidget(self.cut)
+        self.widget_36.setObjectName(u"widget_36")
+        self.horizontalLayout_19 = QHBoxLayout(self.widget_36)
+        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
+        self.horizontalLayout_19.setContentsMargins(-1, 0, 0, 0)
+        self.horizontalSpacer_5 = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_19.addItem(self.horizontalSpacer_5)
+
+        self.cutApply = QPushButton(self.widget_36)
+        self.cutApply.setObjectName(u"cutApply")
+
+        self.horizontalLayout_19.addWidget(self.cutApply)
+
+
+        self.verticalLayout_21.addWidget(self.widget_36)
+
+
+        self.verticalLayout_7.addWidget(self.cut)
+
+
+        self.verticalLayout_17.addWidget(self.cutTool)
+
+        self.meshQualityInfo = QWidget(self.displayControl)
+        self.meshQualityInfo.setObjectName(u"meshQualityInfo")
+        self.verticalLayout_33 = QVBoxLayout(self.meshQualityInfo)
+        self.verticalLayout_33.setSpacing(6)
+        self.verticalLayout_33.setObjectName(u"verticalLayout_33")
+        self.verticalLayout_33.setContentsMargins(0, 0, 0, 0)
+        self.meshQualityHeader = FolderHeader(self.meshQualityInfo)
+        self.meshQualityHeader.setObjectName(u"meshQualityHeader")
+        sizePolicy4.setHeightForWidth(self.meshQualityHeader.sizePolicy().hasHeightForWidth())
+        self.meshQualityHeader.setSizePolicy(sizePolicy4)
+        self.meshQualityHeader.setFont(font2)
+        self.meshQualityHeader.setChecked(False)
+
+        self.verticalLayout_33.addWidget(self.meshQualityHeader)
+
+        self.meshQualityGroupBox = QGroupBox(self.meshQualityInfo)
+        self.meshQualityGroupBox.setObjectName(u"meshQualityGroupBox")
+        self.verticalLayout_34 = QVBoxLayout(self.meshQualityGroupBox)
+        self.verticalLayout_34.setObjectName(u"verticalLayout_34")
+        self.widget_6 = QWidget(self.meshQualityGroupBox)
+        self.widget_6.setObjectName(u"widget_6")
+        self.gridLayout_5 = QGridLayout(self.widget_6)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.gridLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.meshQualityRangeSlider = QLabeledDoubleRangeSlider(self.widget_6)
+        self.meshQualityRangeSlider.setObjectName(u"meshQualityRangeSlider")
+        self.meshQualityRangeSlider.setOrientation(Qt.Horizontal)
+
+        self.gridLayout_5.addWidget(self.meshQualityRangeSlider, 1, 1, 1, 1)
+
+        self.label_5 = QLabel(self.widget_6)
+        self.label_5.setObjectName(u"label_5")
+
+        self.gridLayout_5.addWidget(self.label_5, 0, 0, 1, 1)
+
+        self.label_6 = QLabel(self.widget_6)
+        self.label_6.setObjectName(u"label_6")
+
+        self.gridLayout_5.addWidget(self.label_6, 1, 0, 1, 1)
+
+        self.widget_9 = QWidget(self.widget_6)
+        self.widget_9.setObjectName(u"widget_9")
+        self.horizontalLayout_14 = QHBoxLayout(self.widget_9)
+        self.horizontalLayout_14.setObjectName(u"horizontalLayout_14")
+        self.horizontalLayout_14.setContentsMargins(0, 0, 0, 0)
+        self.meshQualityIndex = QComboBox(self.widget_9)
+        self.meshQualityIndex.setObjectName(u"meshQualityIndex")
+
+        self.horizontalLayout_14.addWidget(self.meshQualityIndex)
+
+        self.horizontalSpacer_11 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_14.addItem(self.horizontalSpacer_11)
+
+
+        self.gridLayout_5.addWidget(self.widget_9, 0, 1, 1, 1)
+
+
+        self.verticalLayout_34.addWidget(self.widget_6)
+
+        self.widget_7 = QWidget(self.meshQualityGroupBox)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_28 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_28.setObjectName(u"horizontalLayout_28")
+        self.horizontalLayout_28.setContentsMargins(0, 0, 0, 0)
+        self.horizontalSpacer_10 = QSpacerItem(0, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_28.addItem(self.horizontalSpacer_10)
+
+        self.meshQualityApply = QPushButton(self.widget_7)
+        self.meshQualityApply.setObjectName(u"meshQualityApply")
+
+        self.horizontalLayout_28.addWidget(self.meshQualityApply)
+
+
+        self.verticalLayout_34.addWidget(self.widget_7)
+
+
+        self.verticalLayout_33.addWidget(self.meshQualityGroupBox)
+
+
+        self.verticalLayout_17.addWidget(self.meshQualityInfo)
+
+        self.actors = QTreeWidget(self.displayControl)
+        self.actors.headerItem().setText(2, "")
+        self.actors.setObjectName(u"actors")
+        self.actors.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.actors.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.actors.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.actors.setSortingEnabled(True)
+        self.actors.setColumnCount(3)
+        self.actors.header().setVisible(True)
+        self.actors.header().setStretchLastSection(False)
+
+        self.verticalLayout_17.addWidget(self.actors)
+
+
+        self.verticalLayout_3.addWidget(self.displayControl)
+
+        self.renderingSplitter.addWidget(self.widget_37)
+        self.widget_2 = QWidget(self.renderingSplitter)
+        self.widget_2.setObjectName(u"widget_2")
+        sizePolicy3.setHeightForWidth(self.widget_2.sizePolicy().hasHeightForWidth())
+        self.widget_2.setSizePolicy(sizePolicy3)
+        self.verticalLayout = QVBoxLayout(self.widget_2)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.toolbar = QWidget(self.widget_2)
+        self.toolbar.setObjectName(u"toolbar")
+        sizePolicy6 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.toolbar.sizePolicy().hasHeightForWidth())
+        self.toolbar.setSizePolicy(sizePolicy6)
+        self.horizontalLayout = QHBoxLayout(self.toolbar)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.axis = FlatPushButton(self.toolbar)
+        self.axis.setObjectName(u"axis")
+        self.axis.setMaximumSize(QSize(32, 32))
+        icon3 = QIcon()
+        icon3.addFile(u":/graphicsIcons/originAxes", QSize(), QIcon.Normal, QIcon.Off)
+        self.axis.setIcon(icon3)
+        self.axis.setIconSize(QSize(22, 22))
+        self.axis.setCheckable(True)
+        self.axis.setChecked(False)
+
+        self.horizontalLayout.addWidget(self.axis)
+
+        self.cubeAxis = FlatPushButton(self.toolbar)
+        self.cubeAxis.setObjectName(u"cubeAxis")
+        self.cubeAxis.setMaximumSize(QSize(32, 32))
+        icon4 = QIcon()
+        icon4.addFile(u":/graphicsIcons/ruler", QSize(), QIcon.Normal, QIcon.Off)
+        self.cubeAxis.setIcon(icon4)
+        self.cubeAxis.setIconSize(QSize(24, 24))
+        self.cubeAxis.setCheckable(True)
+
+        self.horizontalLayout.addWidget(self.cubeAxis)
+
+        self.ruler = FlatPushButton(self.toolbar)
+        self.ruler.setObjectName(u"ruler")
+        self.ruler.setMaximumSize(QSize(32, 32))
+        icon5 = QIcon()
+        icon5.addFile(u":/graphicsIcons/distance.png", QSize(), QIcon.Normal, QIcon.Off)
+        self.ruler.setIcon(icon5)
+        self.ruler.setIconSize(QSize(24, 24))
+        self.ruler.setCheckable(True)
+
+        self.horizontalLayout.addWidget(self.ruler)
+
+        self.perspective = FlatPushButton(self.toolbar)
+        self.perspective.setObjectName(u"perspective")
+        self.perspective.setMaximumSize(QSize(32, 32))
+        icon6 = QIcon()
+        icon6.addFile(u":/graphicsIcons/2d-label-icon.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.perspective.setIcon(icon6)
+        self.perspective.setIconSize(QSize(24, 24))
+        self.perspective.setCheckable(True)
+
+        self.horizontalLayout.addWidget(self.perspective)
+
+        self.fit = FlatPushButton(self.toolbar)
+        self.fit.setObjectName(u"fit")
+        self.fit.setMaximumSize(QSize(32, 32))
+        icon7 = QIcon()
+        icon7.addFile(u":/icons/expand.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.fit.setIcon(icon7)
+        self.fit.setIconSize(QSize(24, 24))
+
+        self.horizontalLayout.addWidget(self.fit)
+
+        self.alignAxis = FlatPushButton(self.toolbar)
+        self.alignAxis.setObjectName(u"alignAxis")
+        self.alignAxis.setMaximumSize(QSize(32, 32))
+        icon8 = QIcon()
+        icon8.addFile(u":/graphicsIcons/alignAxis.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.alignAxis.setIcon(icon8)
+        self.alignAxis.setIconSize(QSize(24, 24))
+
+        self.horizontalLayout.addWidget(self.alignAxis)
+
+        self.rotate = FlatPushButton(self.toolbar)
+        self.rotate.setObjectName(u"rotate")
+        self.rotate.setMaximumSize(QSize(32, 32))
+        icon9 = QIcon()
+        icon9.addFile(u":/icons/reload.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.rotate.setIcon(icon9)
+        self.rotate.setIconSize(QSize(24, 24))
+
+        self.horizontalLayout.addWidget(self.rotate)
+
+        self.rotationCenter = FlatPushButton(self.toolbar)
+        self.rotationCenter.setObjectName(u"rotationCenter")
+        self.rotationCenter.setMaximumSize(QSize(32, 32))
+        icon10 = QIcon()
+        icon10.addFile(u":/graphicsIcons/rotationCenter", QSize(), QIcon.Normal, QIcon.Off)
+        self.rotationCenter.setIcon(icon10)
+        self.rotationCenter.setIconSize(QSize(24, 24))
+        self.rotationCenter.setCheckable(True)
+
+        self.horizontalLayout.addWidget(self.rotationCenter)
+
+        self.widget_17 = QWidget(self.toolbar)
+        self.widget_17.setObjectName(u"widget_17")
+        self.horizontalLayout_24 = QHBoxLayout(self.widget_17)
+        self.horizontalLayout_24.setSpacing(3)
+        self.horizontalLayout_24.setObjectName(u"horizontalLayout_24")
+        self.horizontalLayout_24.setContentsMargins(-1, 0, -1, 0)
+        self.cellCount = QLabel(self.widget_17)
+        self.cellCount.setObjectName(u"cellCount")
+        sizePolicy5.setHeightForWidth(self.cellCount.sizePolicy().hasHeightForWidth())
+        self.cellCount.setSizePolicy(sizePolicy5)
+        self.cellCount.setFont(font)
+        self.cellCount.setFrameShape(QFrame.NoFrame)
+
+        self.horizontalLayout_24.addWidget(self.cellCount)
+
+        self.label_62 = QLabel(self.widget_17)
+        self.label_62.setObjectName(u"label_62")
+
+        self.horizontalLayout_24.addWidget(self.label_62)
+
+
+        self.horizontalLayout.addWidget(self.widget_17)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.frame_2 = QFrame(self.toolbar)
+        self.frame_2.setObjectName(u"frame_2")
+        self.frame_2.setFrameShape(QFrame.Box)
+        self.frame_2.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout_27 = QHBoxLayout(self.frame_2)
+        self.horizontalLayout_27.setSpacing(2)
+        self.horizontalLayout_27.setObjectName(u"horizontalLayout_27")
+        self.horizontalLayout_27.setContentsMargins(2, 1, 1, 1)
+        self.label_64 = QLabel(self.frame_2)
+        self.label_64.setObjectName(u"label_64")
+        font3 = QFont()
+        font3.setPointSize(12)
+        font3.setBold(True)
+        self.label_64.setFont(font3)
+
+        self.horizontalLayout_27.addWidget(self.label_64)
+
+        self.bg2 = QPushButton(self.frame_2)
+        self.bg2.setObjectName(u"bg2")
+        self.bg2.setMaximumSize(QSize(24, 24))
+
+        self.horizontalLayout_27.addWidget(self.bg2)
+
+        self.bg1 = QPushButton(self.frame_2)
+        self.bg1.setObjectName(u"bg1")
+        self.bg1.setMaximumSize(QSize(24, 24))
+
+        self.horizontalLayout_27.addWidget(self.bg1)
+
+
+        self.horizontalLayout.addWidget(self.frame_2)
+
+
+        self.verticalLayout.addWidget(self.toolbar)
+
+        self.renderingView = RenderingWidget(self.widget_2)
+        self.renderingView.setObjectName(u"renderingView")
+        sizePolicy1.setHeightForWidth(self.renderingView.sizePolicy().hasHeightForWidth())
+        self.renderingView.setSizePolicy(sizePolicy1)
+        font4 = QFont()
+        font4.setFamilies([u"\ud734\uba3c\uc61b\uccb4"])
+        self.renderingView.setFont(font4)
+        self.renderingView.setContextMenuPolicy(Qt.CustomContextMenu)
+
+        self.verticalLayout.addWidget(self.renderingView)
+
+        self.renderingSplitter.addWidget(self.widget_2)
+
+        self.verticalLayout_24.addWidget(self.renderingSplitter)
+
+        self.centralSplitter.addWidget(self.groupBox_24)
+
+        self.verticalLayout_25.addWidget(self.centralSplitter)
+
+
+        self.verticalLayout_35.addWidget(self.widget_5)
+
+        self.splitter.addWidget(self.widget_23)
+        self.dockContainer = QWidget(self.splitter)
+        self.dockContainer.setObjectName(u"dockContainer")
+        self.splitter.addWidget(self.dockContainer)
+
+        self.verticalLayout_23.addWidget(self.splitter)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1221, 22))
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menuOpen_Recent = QMenu(self.menuFile)
+        self.menuOpen_Recent.setObjectName(u"menuOpen_Recent")
+        self.menuMesh_Quality = QMenu(self.menubar)
+        self.menuMesh_Quality.setObjectName(u"menuMesh_Quality")
+        self.menuSettings = QMenu(self.menubar)
+        self.menuSettings.setObjectName(u"menuSettings")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        self.menuView = QMenu(self.menubar)
+        self.menuView.setObjectName(u"menuView")
+        self.menuParallel = QMenu(self.menubar)
+        self.menuParallel.setObjectName(u"menuParallel")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuMesh_Quality.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
+        self.menubar.addAction(self.menuParallel.menuAction())
+        self.menubar.addAction(self.menuSettings.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addAction(self.actionNew)
+        self.menuFile.addAction(self.actionOpen)
+        self.menuFile.addAction(self.menuOpen_Recent.menuAction())
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionSave)
+        self.menuFile.addAction(self.actionSaveAs)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionExit)
+        self.menuOpen_Recent.addAction(self.action)
+        self.menuMesh_Quality.addAction(self.actionParameters)
+        self.menuMesh_Quality.addAction(self.actionDeferCheckMesh)
+        self.menuSettings.addAction(self.actionScale)
+        self.menuSettings.addAction(self.actionLanguage)
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuHelp.addAction(self.actionTutorials)
+        self.menuParallel.addAction(self.actionParallelEnvironment)
+
+        self.retranslateUi(MainWindow)
+
+        self.content.setCurrentIndex(0)
+        self.slicePlane.setCurrentIndex(3)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"BaramMesh", None))
+        self.actionNew.setText(QCoreApplication.translate("MainWindow", u"&New", None))
+        self.actionOpen.setText(QCoreApplication.translate("MainWindow", u"&Open", None))
+        self.actionSave.setText(QCoreApplication.translate("MainWindow", u"&Save", None))
+        self.actionSaveAs.setText(QCoreApplication.translate("MainWindow", u"Save As", None))
+        self.actionExport.setText(QCoreApplication.translate("MainWindow", u"Export", None))
+        self.actionClose.setText(QCoreApplication.translate("MainWindow", u"Close", None))
+        self.actionExit.setText(QCoreApplication.translate("MainWindow", u"&Exit", None))
+        self.actionParameters.setText(QCoreApplication.translate("MainWindow", u"&Parameters", None))
+        self.actionDeferCheckMesh.setText(QCoreApplication.translate("MainWindow", u"&Defer Check of Intermediate Steps", None))
+#if QT_CONFIG(tooltip)
+        self.actionDeferCheckMesh.setToolTip(QCoreApplication.translate("MainWindow", u"Check the quality of castellation and snap meshes only when it is displayed", None))
+#endif // QT_CONFIG(tooltip)
+        self.actionScale.setText(QCoreApplication.translate("MainWindow", u"&Scale", None))
+        self.actionLanguage.setText(QCoreApplication.translate("MainWindow", u"&Language", None))
+        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"About", None))
+        self.action.setText("")
+        self.actionParallelEnvironment.setText(QCoreApplication.translate("MainWindow", u"&Environment", None))
+        self.actionTutorials.setText(QCoreApplication.translate("MainWindow", u"Tutorials", None))
+        self.geometryStep.setText(QCoreApplication.translate("MainWindow", u"&1. Geometry", None))
+        self.label_54.setText("")
+        self.regionStep.setText(QCoreApplication.translate("MainWindow", u"&2. Region", None))
+        self.label_55.setText("")
+        self.baseGridStep.setText(QCoreApplication.translate("MainWindow", u"&3. Base Grid", None))
+        self.label_57.setText("")
+        self.castellationStep.setText(QCoreApplication.translate("MainWindow", u"&4. Castellation", None))
+        self.label_59.setText("")
+        self.snapStep.setText(QCoreApplication.translate("MainWindow", u"&5. Snap", None))
+        self.label_58.setText("")
+        self.boundaryLayerStep.setText(QCoreApplication.translate("MainWindow", u"&6. Boundary Layer", None))
+        self.label_56.setText("")
+        self.exportStep.setText(QCoreApplication.translate("MainWindow", u"&7. Export", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Geometry", None))
+        ___qtreewidgetitem = self.geometryList.headerItem()
+        ___qtreewidgetitem.setText(1, QCoreApplication.translate("MainWindow", u"Type", None));
+        ___qtreewidgetitem.setText(0, QCoreApplication.translate("MainWindow", u"Name", None));
+        self.import_.setText(QCoreApplication.translate("MainWindow", u"&Import", None))
+        self.add.setText(QCoreApplication.translate("MainWindow", u"&Add", None))
+        self.label_38.setText(QCoreApplication.translate("MainWindow", u"Region", None))
+        self.regionAdd.setText("")
+        self.regionEmptyMessage.setText(QCoreApplication.translate("MainWindow", u"<html><head/><body><p style=\" color:#ff0000;\">At least one region point should be configured.</p><p>Multiple region points can be configured for multi-region case.</p><p style=\" font-weight: bold;\">You can add region points by clicking the plus(+) icon on the upper right corner.</p></body></html>", None))
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Base Grid", None))
+        self.groupBox_10.setTitle(QCoreApplication.translate("MainWindow", u"Grid Span", None))
+        self.xMin.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.zMax.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label_39.setText(QCoreApplication.translate("MainWindow", u"Len.", None))
+        self.label_4.setText(QCoreApplication.translate("MainWindow", u"Max.", None))
+        self.label_9.setText(QCoreApplication.translate("MainWindow", u"Z", None))
+        self.zMin.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.yMin.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.yMax.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label_3.setText(QCoreApplication.translate("MainWindow", u"Min.", None))
+        self.label_8.setText(QCoreApplication.translate("MainWindow", u"Y", None))
+        self.xMax.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label_7.setText(QCoreApplication.translate("MainWindow", u"X", None))
+        self.label_40.setText(QCoreApplication.translate("MainWindow", u"Cell", None))
+        self.xLen.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.yLen.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.zLen.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.xCell.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.yCell.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.zCell.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.useHex6.setTitle(QCoreApplication.translate("MainWindow", u"Use Hex6", None))
+        self.boundingHex6.setPlaceholderText(QCoreApplication.translate("MainWindow", u"None", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("MainWindow", u"Number of Cells per Direction", None))
+        self.label_12.setText(QCoreApplication.translate("MainWindow", u"X", None))
+        self.numCellsX.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.label_10.setText(QCoreApplication.translate("MainWindow", u"Y", None))
+        self.numCellsY.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.label_11.setText(QCoreApplication.translate("MainWindow", u"Z", None))
+        self.numCellsZ.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.generate.setText(QCoreApplication.translate("MainWindow", u"&Generate", None))
+        self.baseGridReset.setText(QCoreApplication.translate("MainWindow", u"&Reset", None))
+        self.label_18.setText(QCoreApplication.translate("MainWindow", u"Castellation", None))
+#if QT_CONFIG(tooltip)
+        self.loadCastellationDefaults.setToolTip(QCoreApplication.translate("MainWindow", u"Load Default Settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.castellationConfigurationHeader.setText(QCoreApplication.translate("MainWindow", u"Configuration", None))
+        self.label_15.setText(QCoreApplication.translate("MainWindow", u"Number of Cells between Levels", None))
+        self.label_16.setText(QCoreApplication.translate("MainWindow", u"Feature Angle Threshold", None))
+        self.keepNonManifoldEdges.setText(QCoreApplication.translate("MainWindow", u"Keep Non-Manifold Edges", None))
+        self.keepOpenEdges.setText(QCoreApplication.translate("MainWindow", u"Keep Open Edges", None))
+        self.castellationAdvancedHeader.setText(QCoreApplication.translate("MainWindow", u"Advanced", None))
+        self.label_41.setText(QCoreApplication.translate("MainWindow", u"Max. Global Cell Count", None))
+        self.label_42.setText(QCoreApplication.translate("MainWindow", u"Max. Local Cell Count", None))
+        self.label_43.setText(QCoreApplication.translate("MainWindow", u"Min. Refinement Cell Count", None))
+        self.label_44.setText(QCoreApplication.translate("MainWindow", u"Max. Load Unbalance", None))
+        self.allowFreeStandingZoneFaces.setText(QCoreApplication.translate("MainWindow", u"Allow Free Standing Zone Faces", None))
+        self.surfaceRefinementHeader.setText(QCoreApplication.translate("MainWindow", u"Surface/Feature Refinement", None))
+        self.surfaceRefinementAdd.setText("")
+        self.label_46.setText(QCoreApplication.translate("MainWindow", u"Group", None))
+        self.label_45.setText(QCoreApplication.translate("MainWindow", u"Min. Level", None))
+        self.label_63.setText(QCoreApplication.translate("MainWindow", u"Max. Level", None))
+        self.volumeRefinementHeader.setText(QCoreApplication.translate("MainWindow", u"Volume Refinement", None))
+        self.volumeRefinementAdd.setText("")
+        self.label_50.setText(QCoreApplication.translate("MainWindow", u"Group", None))
+        self.label_49.setText(QCoreApplication.translate("MainWindow", u"Level / Split", None))
+        self.refine.setText(QCoreApplication.translate("MainWindow", u"&Refine", None))
+        self.castellationCancel.setText(QCoreApplication.translate("MainWindow", u"Cancel", None))
+        self.castellationReset.setText(QCoreApplication.translate("MainWindow", u"&Reset", None))
+        self.label_68.setText(QCoreApplication.translate("MainWindow", u"Snap", None))
+#if QT_CONFIG(tooltip)
+        self.loadSnapDefaults.setToolTip(QCoreApplication.translate("MainWindow", u"Load Default Settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_20.setText(QCoreApplication.translate("MainWindow", u"Global Configuration", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("MainWindow", u"Iteration Count", None))
+        self.label_21.setText(QCoreApplication.translate("MainWindow", u"Smoothing for Surface", None))
+        self.label_22.setText(QCoreApplication.translate("MainWindow", u"Smoothing for Internal", None))
+        self.label_23.setText(QCoreApplication.translate("MainWindow", u"Mesh Displacement Relaxation", None))
+        self.label_24.setText(QCoreApplication.translate("MainWindow", u"Snapping Relaxation", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("MainWindow", u"Feature Snapping", None))
+        self.label_25.setText(QCoreApplication.translate("MainWindow", u"Snapping Relaxation", None))
+        self.label_35.setText(QCoreApplication.translate("MainWindow", u"Feature Snap Type", None))
+        self.multiSurfaceFeatureSnap.setText(QCoreApplication.translate("MainWindow", u"Multi-Surface Feature Snap", None))
+        self.label_26.setText(QCoreApplication.translate("MainWindow", u"Tolerance", None))
+        self.label_27.setText(QCoreApplication.translate("MainWindow", u"Concave Angle (degree)", None))
+        self.label_28.setText(QCoreApplication.translate("MainWindow", u"Min. Area Ratio", None))
+        self.bufferLayer.setTitle(QCoreApplication.translate("MainWindow", u"Buffer Layer", None))
+        self.groupBox_11.setTitle(QCoreApplication.translate("MainWindow", u"Point Smoothing Method", None))
+        self.bufferLayerLaplacian.setText(QCoreApplication.translate("MainWindow", u"Laplacian", None))
+        self.bufferLayerGETMe.setText(QCoreApplication.translate("MainWindow", u"GETMe (Geometrical Element Transformation Method)", None))
+        self.label_65.setText(QCoreApplication.translate("MainWindow", u"Number of Point Smoother Iterations per Timestep", None))
+        self.label_66.setText(QCoreApplication.translate("MainWindow", u"GETMe Transformation Parameter", None))
+        self.label_67.setText(QCoreApplication.translate("MainWindow", u"Surfaces", None))
+        self.bufferLayerSurfacesSelect.setText(QCoreApplication.translate("MainWindow", u"Select", None))
+        self.snap.setText(QCoreApplication.translate("MainWindow", u"S&nap", None))
+        self.snapCancel.setText(QCoreApplication.translate("MainWindow", u"Cancel", None))
+        self.snapReset.setText(QCoreApplication.translate("MainWindow", u"&Reset", None))
+        self.label_19.setText(QCoreApplication.translate("MainWindow", u"Boundary Layer", None))
+#if QT_CONFIG(tooltip)
+        self.loadBoundaryLayerDefaults.setToolTip(QCoreApplication.translate("MainWindow", u"Load Default Settings", None))
+#endif // QT_CONFIG(tooltip)
+        self.boundaryLayerConfigurationsHeader.setText(QCoreApplication.translate("MainWindow", u"Configurations", None))
+        self.boundaryLayerConfigurationsAdd.setText("")
+        self.label_47.setText(QCoreApplication.translate("MainWindow", u"Layers", None))
+        self.label_48.setText(QCoreApplication.translate("MainWindow", u"Group", None))
+        self.boundaryLayerAdvancedConfigurationHeader.setText(QCoreApplication.translate("MainWindow", u"Advanced Configuration", None))
+        self.label_14.setText(QCoreApplication.translate("MainWindow", u"Number of Grow", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("MainWindow", u"Static Analysis of Starting Mesh", None))
+        self.label_17.setText(QCoreApplication.translate("MainWindow", u"Max. Thickness Ratio", None))
+        self.label_60.setText(QCoreApplication.translate("MainWindow", u"Feature Angle Threshold", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("MainWindow", u"Patch Displacement Smoothing", None))
+        self.label_30.setText(QCoreApplication.translate("MainWindow", u"Number of Iterations", None))
+        self.label_31.setText(QCoreApplication.translate("MainWindow", u"Smooth Layer Thickness", None))
+        self.groupBox_7.setTitle(QCoreApplication.translate("MainWindow", u"Medial Axis", None))
+        self.label_32.setText(QCoreApplication.translate("MainWindow", u"Min. Axis Angle", None))
+        self.label_33.setText(QCoreApplication.translate("MainWindow", u"max Thickness Ratio", None))
+        self.label_34.setText(QCoreApplication.translate("MainWindow", u"Number of Smoothing Iter.", None))
+        self.label_36.setText(QCoreApplication.translate("MainWindow", u"Max. Snapping Relaxation Iter.", None))
+        self.groupBox_8.setTitle(QCoreApplication.translate("MainWindow", u"Mesh Shrinking", None))
+        self.label_51.setText(QCoreApplication.translate("MainWindow", u"Num. of Buffer Cells", None))
+        self.label_52.setText(QCoreApplication.translate("MainWindow", u"Max. Layer Addition Iter.", None))
+        self.label_53.setText(QCoreApplication.translate("MainWindow", u"Max. Iter. Before Relax", None))
+        self.boundaryLayerApply.setText(QCoreApplication.translate("MainWindow", u"&Apply", None))
+        self.boundaryLayerCancel.setText(QCoreApplication.translate("MainWindow", u"Cancel", None))
+        self.boundaryLayerReset.setText(QCoreApplication.translate("MainWindow", u"&Reset", None))
+        self.label_37.setText(QCoreApplication.translate("MainWindow", u"Export", None))
+        self.validationMessage.setText("")
+        self.groupBox_20.setTitle(QCoreApplication.translate("MainWindow", u" 2D Exports", None))
+        self.export2DPlane.setText(QCoreApplication.translate("MainWindow", u"2D Plane", None))
+        self.export2DWedge.setText(QCoreApplication.translate("MainWindow", u"Axi-Symmetry", None))
+        self.label_13.setText(QCoreApplication.translate("MainWindow", u"\"2D exports\" exports generated mesh as BaramFlow project yet in 2D. It is implemented using OpenFOAM \"extrudeMesh\" utility. \"2D Plane\" uses \"plane\" extrudeModel and \"Axi-Symmetry\" uses \"wedge\". This is for the users who are familiar with the operation of \"extrudeMesh\".", None))
+        self.export_.setText(QCoreApplication.translate("MainWindow", u"Export as BaramFlow project", None))
+        self.regionValidationMessage.setText("")
+        self.unlock.setText(QCoreApplication.translate("MainWindow", u"Unlock", None))
+        self.finishSteps.setText(QCoreApplication.translate("MainWindow", u"Finish All Steps", None))
+        self.finishCancel.setText(QCoreApplication.translate("MainWindow", u"Cancel", None))
+        self.next.setText(QCoreApplication.translate("MainWindow", u"Next", None))
+        self.label_61.setText(QCoreApplication.translate("MainWindow", u"Display Control", None))
+        self.rendering.setText("")
+        self.cutHeader.setText(QCoreApplication.translate("MainWindow", u"Cut", None))
+        self.clip.setText(QCoreApplication.translate("MainWindow", u"Clip", None))
+        self.slice.setText(QCoreApplication.translate("MainWindow", u"Slice", None))
+        self.cutX.setText(QCoreApplication.translate("MainWindow", u"X Plane", None))
+        self.xCutPlane.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.xPlaneHandle.setText("")
+        self.xCutInvert.setText(QCoreApplication.translate("MainWindow", u"Invert", None))
+        self.cutY.setText(QCoreApplication.translate("MainWindow", u"Y Plane", None))
+        self.yCutPlane.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.yPlaneHandle.setText("")
+        self.yCutInvert.setText(QCoreApplication.translate("MainWindow", u"Invert", None))
+        self.cutZ.setText(QCoreApplication.translate("MainWindow", u"Z Plane", None))
+        self.zCutPlane.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.zPlaneHandle.setText("")
+        self.zCutInvert.setText(QCoreApplication.translate("MainWindow", u"Invert", None))
+        self.slicePlane.setItemText(0, QCoreApplication.translate("MainWindow", u"X", None))
+        self.slicePlane.setItemText(1, QCoreApplication.translate("MainWindow", u"Y", None))
+        self.slicePlane.setItemText(2, QCoreApplication.translate("MainWindow", u"Z", None))
+        self.slicePlane.setItemText(3, QCoreApplication.translate("MainWindow", u"None", None))
+
+        self.sliceValue.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.sliceHandle.setText("")
+        self.cutApply.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        self.meshQualityHeader.setText(QCoreApplication.translate("MainWindow", u"Mesh Quality", None))
+        self.label_5.setText(QCoreApplication.translate("MainWindow", u"Index", None))
+        self.label_6.setText(QCoreApplication.translate("MainWindow", u"Range", None))
+        self.meshQualityApply.setText(QCoreApplication.translate("MainWindow", u"Apply", None))
+        ___qtreewidgetitem1 = self.actors.headerItem()
+        ___qtreewidgetitem1.setText(1, QCoreApplication.translate("MainWindow", u"Type", None));
+        ___qtreewidgetitem1.setText(0, QCoreApplication.translate("MainWindow", u"Name", None));
+#if QT_CONFIG(tooltip)
+        self.axis.setToolTip(QCoreApplication.translate("MainWindow", u" Set the axis direction based on the origin", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.cubeAxis.setToolTip(QCoreApplication.translate("MainWindow", u" Display x,y and z axis coordinates", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.ruler.setToolTip(QCoreApplication.translate("MainWindow", u"Ruler", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.perspective.setToolTip(QCoreApplication.translate("MainWindow", u" Toggle between Perspective and Orthogonal views", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.fit.setToolTip(QCoreApplication.translate("MainWindow", u" Show the entire model in the windows to fit the view", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.alignAxis.setToolTip(QCoreApplication.translate("MainWindow", u" View the model from cross-section of the closest-axis, aligning with current state", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.rotate.setToolTip(QCoreApplication.translate("MainWindow", u" Rotate the model by 90 degrees", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.rotationCenter.setToolTip(QCoreApplication.translate("MainWindow", u"Rotation Center", None))
+#endif // QT_CONFIG(tooltip)
+        self.cellCount.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.label_62.setText(QCoreApplication.translate("MainWindow", u"cells", None))
+        self.label_64.setText(QCoreApplication.translate("MainWindow", u"BG", None))
+        self.bg2.setText("")
+        self.bg1.setText("")
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"&File", None))
+        self.menuOpen_Recent.setTitle(QCoreApplication.translate("MainWindow", u"Open Recent", None))
+        self.menuMesh_Quality.setTitle(QCoreApplication.translate("MainWindow", u"&Mesh Quality", None))
+        self.menuSettings.setTitle(QCoreApplication.translate("MainWindow", u"&Settings", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"&Help", None))
+        self.menuView.setTitle(QCoreApplication.translate("MainWindow", u"&View", None))
+        self.menuParallel.setTitle(QCoreApplication.translate("MainWindow", u"&Parallel", None))
+    # retranslateUi
+
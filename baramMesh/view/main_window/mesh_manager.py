@@ -1,25 +1,34 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+from typing import Optional
+
 import qasync
 from PySide6.QtCore import Signal
 
+from libbaram.exception import CanceledException
+from libbaram.process import ProcessError
 from widgets.progress_dialog import ProgressDialog
 
 from baramMesh.app import app
 from baramMesh.openfoam.poly_mesh.poly_mesh_loader import PolyMeshLoader
+from baramMesh.openfoam.utility.snappy_hex_mesh import snappyHexMesh
 from baramMesh.rendering.actor_info import ActorInfo, BoundaryActor, MeshActor, MeshQualityIndex
+from baramMesh.rendering.mesh_quality import MeshQualityStatistics
 from baramMesh.view.main_window.actor_manager import ActorManager
 
 
 class MeshManager(ActorManager):
     cellCountChanged = Signal(int)
+    qualityFieldsLoaded = Signal()
 
     def __init__(self):
         super().__init__()
 
         self._loader = None
         self._time = None
+        self._fieldsLoading = None
 
         self._name = 'Mesh'
 
@@ -29,6 +38,7 @@ class MeshManager(ActorManager):
 
         self.clear()
         self._visibility = True
+        self._fieldsLoading = None
 
         if time is not None:
             self._time = time
@@ -43,7 +53,10 @@ class MeshManager(ActorManager):
         self._loader = PolyMeshLoader(app.fileSystem.foamFilePath())
         self._loader.progress.connect(progressDialog.setLabelText)
 
-        vtkMesh = await self._loader.loadMesh(self._time)
+        # Quality fields being written by checkMesh are read after the mesh is shown
+        checking = snappyHexMesh.isCheckingMesh(self._time)
+
+        vtkMesh = await self._loader.loadMesh(self._time, not checking)
         if vtkMesh:
             for rname, region in vtkMesh.items():
                 for bname, polyData in region['boundary'].items():
@@ -58,9 +71,56 @@ class MeshManager(ActorManager):
 
         progressDialog.close()
 
+        if vtkMesh and checking:
+            # Not awaited, not to keep the callers waiting for checkMesh
+            self._fieldsLoading = asyncio.create_task(self._loadQualityFields())
+
+    async def loadQualityFields(self) -> bool:
+        """Reads the quality fields of the mesh into the actors, running checkMesh if they have not been written
+
+        Returns False if checkMesh fails or is canceled.
+        The result is kept until another mesh is loaded, so a failed check is not run again for every request.
+        """
+        if self._fieldsLoading is None:
+            self._fieldsLoading = asyncio.create_task(self._loadQualityFields())
+
+        # Shielded, not to stop loading for other waiters
+        return await asyncio.shield(self._fieldsLoading)
+
+    async def _loadQualityFields(self) -> bool:
+        time = self._time
+        loader = self._loader
+        if loader is None:
+            return True
+
+        try:
+            await snappyHexMesh.checkMesh(time)
+        except (ProcessError, CanceledException):
+            return False
+
+        if self._loader is not loader:  # Another mesh has been loaded
+            return True
+
+        vtkMesh = await loader.loadCellArrays(time)
+        if not vtkMesh or self._loader is not loader:
+            return True
+
+        for rname, region in vtkMesh.items():
+            for bname, polyData in region['boundary'].items():
+                if self.actorInfo(bname) is not None:
+                    self.update(bname, polyData)
+
+        self.update('internalMesh', vtkMesh['']['internalMesh'])
+
+        self.applyToDisplay()
+        self.qualityFieldsLoaded.emit()
+
+        return True
+
     def unload(self):
         self.hide()
         self._time = None
+        self._loader = None
 
     @qasync.asyncSlot()
     async def show(self, time):
@@ -78,6 +138,14 @@ class MeshManager(ActorManager):
             if isinstance(actorInfo, MeshActor):
                 return actorInfo.getScalarRange(index)
 
+    def qualityStatistics(self) -> Optional[MeshQualityStatistics]:
+        actorInfo: ActorInfo
+        for actorInfo in self._actorInfos.values():
+            if isinstance(actorInfo, MeshActor):
+                return actorInfo.qualityStatistics()
+
+        return None
+
     def getNumberOfDisplayedCells(self) -> int:
         actorInfo: ActorInfo
         for actorInfo in self._actorInfos.values():
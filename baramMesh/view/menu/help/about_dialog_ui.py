@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'about_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+import resource_rc
+
+class Ui_AboutDialog(object):
+    def setupUi(self, AboutDialog):
+        if not AboutDialog.objectName():
+            AboutDialog.setObjectName(u"AboutDialog")
+        AboutDialog.resize(400, 300)
+        self.verticalLayout_2 = QVBoxLayout(AboutDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalSpacer = QSpacerItem(20, 42, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.widget = QWidget(AboutDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_2 = QSpacerItem(90, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.widget_3 = QWidget(self.widget)
+        self.widget_3.setObjectName(u"widget_3")
+        self.verticalLayout = QVBoxLayout(self.widget_3)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.logo = QLabel(self.widget_3)
+        self.logo.setObjectName(u"logo")
+        self.logo.setMinimumSize(QSize(48, 48))
+        self.logo.setScaledContents(True)
+        self.logo.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.verticalLayout.addWidget(self.logo)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer_3)
+
+
+        self.horizontalLayout_2.addWidget(self.widget_3)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_2.addWidget(self.label_2)
+
+        self.horizontalSpacer_3 = QSpacerItem(90, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout_2.addWidget(self.widget)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 41, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer_2)
+
+        self.widget_2 = QWidget(AboutDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(280, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.thirdPartySoftwares = QPushButton(self.widget_2)
+        self.thirdPartySoftwares.setObjectName(u"thirdPartySoftwares")
+
+        self.horizontalLayout.addWidget(self.thirdPartySoftwares)
+
+        self.close = QPushButton(self.widget_2)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout.addWidget(self.close)
+
+
+        self.verticalLayout_2.addWidget(self.widget_2)
+
+
+        self.retranslateUi(AboutDialog)
+
+        QMetaObject.connectSlotsByName(AboutDialog)
+    # setupUi
+
+    def retranslateUi(self, AboutDialog):
+        AboutDialog.setWindowTitle(QCoreApplication.translate("AboutDialog", u"About BARAM", None))
+        self.logo.setText("")
+        self.label_2.setText(QCoreApplication.translate("AboutDialog", u"<p><b><font size=\"4\">BaramMesh 26.1.0</font></b></p>\n"
+"\n"
+"<p>Powered by open-source software</p>\n"
+"\n"
+"<p>Copyright &#169; 2025 nextfoam</p>", None))
+        self.thirdPartySoftwares.setText(QCoreApplication.translate("AboutDialog", u"Third-party Softwares", None))
+        self.close.setText(QCoreApplication.translate("AboutDialog", u"Close", None))
+    # retranslateUi
+
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'license_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFrame, QGridLayout,
+    QHBoxLayout, QLabel, QPushButton, QScrollArea,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_LicenseDialog(object):
+    def setupUi(self, LicenseDialog):
+        if not LicenseDialog.objectName():
+            LicenseDialog.setObjectName(u"LicenseDialog")
+        LicenseDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(LicenseDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.scrollArea = QScrollArea(LicenseDialog)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setFrameShape(QFrame.NoFrame)
+        self.scrollArea.setWidgetResizable(True)
+        self.licenses = QWidget()
+        self.licenses.setObjectName(u"licenses")
+        self.licenses.setGeometry(QRect(0, 0, 382, 114))
+        self.gridLayout = QGridLayout(self.licenses)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(self.licenses)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_3 = QLabel(self.licenses)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 0, 1, 1, 1)
+
+        self.scrollArea.setWidget(self.licenses)
+
+        self.verticalLayout.addWidget(self.scrollArea)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.widget_2 = QWidget(LicenseDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout = QHBoxLayout(self.widget_2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.close = QPushButton(self.widget_2)
+        self.close.setObjectName(u"close")
+
+        self.horizontalLayout.addWidget(self.close)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(LicenseDialog)
+
+        QMetaObject.connectSlotsByName(LicenseDialog)
+    # setupUi
+
+    def retranslateUi(self, LicenseDialog):
+        LicenseDialog.setWindowTitle(QCoreApplication.translate("LicenseDialog", u"Thrid-Party Software Used by BARAM", None))
+        self.label.setText(QCoreApplication.translate("LicenseDialog", u"Software", None))
+        self.label_3.setText(QCoreApplication.translate("LicenseDialog", u"License", None))
+        self.close.setText(QCoreApplication.translate("LicenseDialog", u"Close", None))
+    # retranslateUi
+
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mesh_quality_parameters_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QLabel, QLineEdit, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_MeshQualityParametersDialog(object):
+    def setupUi(self, MeshQualityParametersDialog):
+        if not MeshQualityParametersDialog.objectName():
+            MeshQualityParametersDialog.setObjectName(u"MeshQualityParametersDialog")
+        MeshQualityParametersDialog.resize(418, 564)
+        self.verticalLayout = QVBoxLayout(MeshQualityParametersDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(MeshQualityParametersDialog)
+        self.widget.setObjectName(u"widget")
+        self.formLayout = QFormLayout(self.widget)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.widget)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.maxNonOrtho = QLineEdit(self.widget)
+        self.maxNonOrtho.setObjectName(u"maxNonOrtho")
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.maxNonOrtho)
+
+        self.label_2 = QLabel(self.widget)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.label_3 = QLabel(self.widget)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.label_3)
+
+        self.label_4 = QLabel(self.widget)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_4)
+
+        self.label_5 = QLabel(self.widget)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(4, QFormLayout.LabelRole, self.label_5)
+
+        self.label_6 = QLabel(self.widget)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout.setWidget(5, QFormLayout.LabelRole, self.label_6)
+
+        self.label_7 = QLabel(self.widget)
+        self.label_7.setObjectName(u"label_7")
+
+        self.formLayout.setWidget(6, QFormLayout.LabelRole, self.label_7)
+
+        self.label_8 = QLabel(self.widget)
+        self.label_8.setObjectName(u"label_8")
+
+        self.formLayout.setWidget(7, QFormLayout.LabelRole, self.label_8)
+
+        self.label_9 = QLabel(self.widget)
+        self.label_9.setObjectName(u"label_9")
+
+        self.formLayout.setWidget(8, QFormLayout.LabelRole, self.label_9)
+
+        self.label_10 = QLabel(self.widget)
+        self.label_10.setObjectName(u"label_10")
+
+        self.formLayout.setWidget(9, QFormLayout.LabelRole, self.label_10)
+
+        self.label_11 = QLabel(self.widget)
+        self.label_11.setObjectName(u"label_11")
+
+        self.formLayout.setWidget(10, QFormLayout.LabelRole, self.label_11)
+
+        self.label_12 = QLabel(self.widget)
+        self.label_12.setObjectName(u"label_12")
+
+        self.formLayout.setWidget(11, QFormLayout.LabelRole, self.label_12)
+
+        self.label_13 = QLabel(self.widget)
+        self.label_13.setObjectName(u"label_13")
+
+        self.formLayout.setWidget(12, QFormLayout.LabelRole, self.label_13)
+
+        self.label_14 = QLabel(self.widget)
+        self.label_14.setObjectName(u"label_14")
+
+        self.formLayout.setWidget(13, QFormLayout.LabelRole, self.label_14)
+
+        self.label_15 = QLabel(self.widget)
+        self.label_15.setObjectName(u"label_15")
+
+        self.formLayout.setWidget(14, QFormLayout.LabelRole, self.label_15)
+
+        self.label_16 = QLabel(self.widget)
+        self.label_16.setObjectName(u"label_16")
+
+        self.formLayout.setWidget(15, QFormLayout.LabelRole, self.label_16)
+
+        self.label_17 = QLabel(self.widget)
+        self.label_17.setObjectName(u"label_17")
+
+        self.formLayout.setWidget(16, QFormLayout.LabelRole, self.label_17)
+
+        self.label_18 = QLabel(self.widget)
+        self.label_18.setObjectName(u"label_18")
+
+        self.formLayout.setWidget(17, QFormLayout.LabelRole, self.label_18)
+
+        self.maxNonOrthoRelaxed = QLineEdit(self.widget)
+        self.maxNonOrthoRelaxed.setObjectName(u"maxNonOrthoRelaxed")
+
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.maxNonOrthoRelaxed)
+
+        self.maxBoundarySkewness = QLineEdit(self.widget)
+        self.maxBoundarySkewness.setObjectName(u"maxBoundarySkewness")
+
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.maxBoundarySkewness)
+
+        self.maxInternalSkewness = QLineEdit(self.widget)
+        self.maxInternalSkewness.setObjectName(u"maxInternalSkewness")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.maxInternalSkewness)
+
+        self.maxConcave = QLineEdit(self.widget)
+        self.maxConcave.setObjectName(u"maxConcave")
+
+        self.formLayout.setWidget(4, QFormLayout.FieldRole, self.maxConcave)
+
+        self.minVol = QLineEdit(self.widget)
+        self.minVol.setObjectName(u"minVol")
+
+        self.formLayout.setWidget(5, QFormLayout.FieldRole, self.minVol)
+
+        self.minTetQuality = QLineEdit(self.widget)
+        self.minTetQuality.setObjectName(u"minTetQuality")
+
+        self.formLayout.setWidget(6, QFormLayout.FieldRole, self.minTetQuality)
+
+        self.minVolCollapseRatio = QLineEdit(self.widget)
+        self.minVolCollapseRatio.setObjectName(u"minVolCollapseRatio")
+
+        self.formLayout.setWidget(7, QFormLayout.FieldRole, self.minVolCollapseRatio)
+
+        self.minArea = QLineEdit(self.widget)
+        self.minArea.setObjectName(u"minArea")
+
+        self.formLayout.setWidget(8, QFormLayout.FieldRole, self.minArea)
+
+        self.minTwist = QLineEdit(self.widget)
+        self.minTwist.setObjectName(u"minTwist")
+
+        self.formLayout.setWidget(9, QFormLayout.FieldRole, self.minTwist)
+
+        self.minDeterminant = QLineEdit(self.widget)
+        self.minDeterminant.setObjectName(u"minDeterminant")
+
+        self.formLayout.setWidget(10, QFormLayout.FieldRole, self.minDeterminant)
+
+        self.minFaceWeight = QLineEdit(self.widget)
+        self.minFaceWeight.setObjectName(u"minFaceWeight")
+
+        self.formLayout.setWidget(11, QFormLayout.FieldRole, self.minFaceWeight)
+
+        self.minFaceFlatness = QLineEdit(self.widget)
+        self.minFaceFlatness.setObjectName(u"minFaceFlatness")
+
+        self.formLayout.setWidget(12, QFormLayout.FieldRole, self.minFaceFlatness)
+
+        self.minVolRatio = QLineEdit(self.widget)
+        self.minVolRatio.setObjectName(u"minVolRatio")
+
+        self.formLayout.setWidget(13, QFormLayout.FieldRole, self.minVolRatio)
+
+        self.minTriangleTwist = QLineEdit(self.widget)
+        self.minTriangleTwist.setObjectName(u"minTriangleTwist")
+
+        self.formLayout.setWidget(14, QFormLayout.FieldRole, self.minTriangleTwist)
+
+        self.nSmoothScale = QLineEdit(self.widget)
+        self.nSmoothScale.setObjectName(u"nSmoothScale")
+
+        self.formLayout.setWidget(15, QFormLayout.FieldRole, self.nSmoothScale)
+
+        self.errorReduction = QLineEdit(self.widget)
+        self.errorReduction.setObjectName(u"errorReduction")
+
+        self.formLayout.setWidget(16, QFormLayout.FieldRole, self.errorReduction)
+
+        self.mergeTolerance = QLineEdit(self.widget)
+        self.mergeTolerance.setObjectName(u"mergeTolerance")
+
+        self.formLayout.setWidget(17, QFormLayout.FieldRole, self.mergeTolerance)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.buttonBox = QDialogButtonBox(MeshQualityParametersDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(MeshQualityParametersDialog)
+        self.buttonBox.accepted.connect(MeshQualityParametersDialog.accept)
+        self.buttonBox.rejected.connect(MeshQualityParametersDialog.reject)
+
+        QMetaObject.connectSlotsByName(MeshQualityParametersDialog)
+    # setupUi
+
+    def retranslateUi(self, MeshQualityParametersDialog):
+        MeshQualityParametersDialog.setWindowTitle(QCoreApplication.translate("MeshQualityParametersDialog", u"Mesh Qualitiy Parameters", None))
+        self.label.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Max. Face non-ortho, Angle", None))
+        self.label_2.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Max. Face non-ortho, Angle (Relaxed)", None))
+        self.label_3.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Max. Boundary Skewness", None))
+        self.label_4.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Max. Internal Face Skewness", None))
+        self.label_5.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Max. Cell Concavity", None))
+        self.label_6.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Cell Pyramid Volume (m<sup>3</sup>)", None))
+        self.label_7.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Tetrahedron Quality", None))
+        self.label_8.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Volume Collapse Ratio", None))
+        self.label_9.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Face Area (m<sup>2</sup>)", None))
+        self.label_10.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Twist", None))
+        self.label_11.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Cell Determinant", None))
+        self.label_12.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Face Interpolation Weight", None))
+        self.label_13.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Face Flatness", None))
+        self.label_14.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Volume Ratio", None))
+        self.label_15.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Min. Triangle Twist", None))
+        self.label_16.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"smoothing Iteration", None))
+        self.label_17.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Error Reduction", None))
+        self.label_18.setText(QCoreApplication.translate("MeshQualityParametersDialog", u"Merge Tolerance", None))
+    # retranslateUi
+
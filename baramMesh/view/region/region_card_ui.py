@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'region_card.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+import resource_rc
+
+class Ui_RegionCard(object):
+    def setupUi(self, RegionCard):
+        if not RegionCard.objectName():
+            RegionCard.setObjectName(u"RegionCard")
+        RegionCard.resize(400, 92)
+        self.verticalLayout_3 = QVBoxLayout(RegionCard)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(2, 0, 2, 2)
+        self.card = QFrame(RegionCard)
+        self.card.setObjectName(u"card")
+        self.card.setFrameShape(QFrame.Box)
+        self.card.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_2 = QVBoxLayout(self.card)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 7, 0, 7)
+        self.header = QWidget(self.card)
+        self.header.setObjectName(u"header")
+        self.horizontalLayout = QHBoxLayout(self.header)
+        self.horizontalLayout.setSpacing(2)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(-1, 4, -1, 4)
+        self.name = QLabel(self.header)
+        self.name.setObjectName(u"name")
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setUnderline(True)
+        self.name.setFont(font)
+
+        self.horizontalLayout.addWidget(self.name)
+
+        self.type = QLabel(self.header)
+        self.type.setObjectName(u"type")
+        font1 = QFont()
+        font1.setPointSize(11)
+        self.type.setFont(font1)
+
+        self.horizontalLayout.addWidget(self.type)
+
+        self.horizontalSpacer = QSpacerItem(23, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit = QPushButton(self.header)
+        self.edit.setObjectName(u"edit")
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.edit.sizePolicy().hasHeightForWidth())
+        self.edit.setSizePolicy(sizePolicy)
+        icon = QIcon()
+        icon.addFile(u":/icons/create-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.edit.setIcon(icon)
+
+        self.horizontalLayout.addWidget(self.edit)
+
+        self.remove = QPushButton(self.header)
+        self.remove.setObjectName(u"remove")
+        sizePolicy.setHeightForWidth(self.remove.sizePolicy().hasHeightForWidth())
+        self.remove.setSizePolicy(sizePolicy)
+        icon1 = QIcon()
+        icon1.addFile(u":/icons/trash-outline.svg", QSize(), QIcon.Normal, QIcon.Off)
+        self.remove.setIcon(icon1)
+
+        self.horizontalLayout.addWidget(self.remove)
+
+
+        self.verticalLayout_2.addWidget(self.header)
+
+        self.widget_6 = QWidget(self.card)
+        self.widget_6.setObjectName(u"widget_6")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_6)
+        self.horizontalLayout_2.setSpacing(10)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(18, 4, 9, 4)
+        self.label = QLabel(self.widget_6)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.point = QLabel(self.widget_6)
+        self.point.setObjectName(u"point")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.point.sizePolicy().hasHeightForWidth())
+        self.point.setSizePolicy(sizePolicy1)
+        self.point.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.horizontalLayout_2.addWidget(self.point)
+
+
+        self.verticalLayout_2.addWidget(self.widget_6)
+
+        self.warning = QLabel(self.card)
+        self.warning.setObjectName(u"warning")
+        self.warning.setStyleSheet(u"color: red")
+
+        self.verticalLayout_2.addWidget(self.warning)
+
+
+        self.verticalLayout_3.addWidget(self.card)
+
+
+        self.retranslateUi(RegionCard)
+
+        QMetaObject.connectSlotsByName(RegionCard)
+    # setupUi
+
+    def retranslateUi(self, RegionCard):
+        RegionCard.setWindowTitle(QCoreApplication.translate("RegionCard", u"Form", None))
+        self.name.setText(QCoreApplication.translate("RegionCard", u"TextLabel", None))
+        self.type.setText(QCoreApplication.translate("RegionCard", u"TextLabel", None))
+        self.edit.setText("")
+        self.remove.setText("")
+        self.label.setText(QCoreApplication.translate("RegionCard", u"Point", None))
+        self.point.setText(QCoreApplication.translate("RegionCard", u"TextLabel", None))
+        self.warning.setText(QCoreApplication.translate("RegionCard", u"               Invalid point - outside bounding box.", None))
+    # retranslateUi
+
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'region_form.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QRadioButton, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_RegionForm(object):
+    def setupUi(self, RegionForm):
+        if not RegionForm.objectName():
+            RegionForm.setObjectName(u"RegionForm")
+        RegionForm.resize(400, 208)
+        self.verticalLayout = QVBoxLayout(RegionForm)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.regionForm = QGroupBox(RegionForm)
+        self.regionForm.setObjectName(u"regionForm")
+        self.verticalLayout_7 = QVBoxLayout(self.regionForm)
+        self.verticalLayout_7.setSpacing(2)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(-1, 0, -1, -1)
+        self.widget_6 = QWidget(self.regionForm)
+        self.widget_6.setObjectName(u"widget_6")
+        self.formLayout_2 = QFormLayout(self.widget_6)
+        self.formLayout_2.setObjectName(u"formLayout_2")
+        self.formLayout_2.setRowWrapPolicy(QFormLayout.WrapLongRows)
+        self.label_5 = QLabel(self.widget_6)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout_2.setWidget(0, QFormLayout.LabelRole, self.label_5)
+
+        self.name = QLineEdit(self.widget_6)
+        self.name.setObjectName(u"name")
+
+        self.formLayout_2.setWidget(0, QFormLayout.FieldRole, self.name)
+
+        self.label_6 = QLabel(self.widget_6)
+        self.label_6.setObjectName(u"label_6")
+
+        self.formLayout_2.setWidget(1, QFormLayout.LabelRole, self.label_6)
+
+        self.widget_7 = QWidget(self.widget_6)
+        self.widget_7.setObjectName(u"widget_7")
+        self.horizontalLayout_6 = QHBoxLayout(self.widget_7)
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.horizontalLayout_6.setContentsMargins(0, 6, -1, 6)
+        self.fluid = QRadioButton(self.widget_7)
+        self.typeRadios = QButtonGroup(RegionForm)
+        self.typeRadios.setObjectName(u"typeRadios")
+        self.typeRadios.addButton(self.fluid)
+        self.fluid.setObjectName(u"fluid")
+        self.fluid.setChecked(True)
+
+        self.horizontalLayout_6.addWidget(self.fluid)
+
+        self.solid = QRadioButton(self.widget_7)
+        self.typeRadios.addButton(self.solid)
+        self.solid.setObjectName(u"solid")
+        self.solid.setChecked(False)
+
+        self.horizontalLayout_6.addWidget(self.solid)
+
+
+        self.formLayout_2.setWidget(1, QFormLayout.FieldRole, self.widget_7)
+
+        self.label_13 = QLabel(self.widget_6)
+        self.label_13.setObjectName(u"label_13")
+
+        self.formLayout_2.setWidget(2, QFormLayout.LabelRole, self.label_13)
+
+        self.widget_8 = QWidget(self.widget_6)
+        self.widget_8.setObjectName(u"widget_8")
+        self.horizontalLayout_7 = QHBoxLayout(self.widget_8)
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.horizontalLayout_7.setContentsMargins(0, 6, 0, 6)
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_7.addItem(self.horizontalSpacer_4)
+
+        self.x = QLineEdit(self.widget_8)
+        self.x.setObjectName(u"x")
+
+        self.horizontalLayout_7.addWidget(self.x)
+
+        self.y = QLineEdit(self.widget_8)
+        self.y.setObjectName(u"y")
+
+        self.horizontalLayout_7.addWidget(self.y)
+
+        self.z = QLineEdit(self.widget_8)
+        self.z.setObjectName(u"z")
+
+        self.horizontalLayout_7.addWidget(self.z)
+
+
+        self.formLayout_2.setWidget(2, QFormLayout.FieldRole, self.widget_8)
+
+
+        self.verticalLayout_7.addWidget(self.widget_6)
+
+        self.widget_9 = QWidget(self.regionForm)
+        self.widget_9.setObjectName(u"widget_9")
+        self.horizontalLayout_8 = QHBoxLayout(self.widget_9)
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.horizontalLayout_8.setContentsMargins(-1, 0, -1, 0)
+        self.horizontalSpacer_5 = QSpacerItem(177, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer_5)
+
+        self.ok = QPushButton(self.widget_9)
+        self.ok.setObjectName(u"ok")
+        self.ok.setEnabled(False)
+
+        self.horizontalLayout_8.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget_9)
+        self.cancel.setObjectName(u"cancel")
+        self.cancel.setEnabled(True)
+
+        self.horizontalLayout_8.addWidget(self.cancel)
+
+
+        self.verticalLayout_7.addWidget(self.widget_9)
+
+
+        self.verticalLayout.addWidget(self.regionForm)
+
+
+        self.retranslateUi(RegionForm)
+
+        QMetaObject.connectSlotsByName(RegionForm)
+    # setupUi
+
+    def retranslateUi(self, RegionForm):
+        RegionForm.setWindowTitle(QCoreApplication.translate("RegionForm", u"Form", None))
+        self.regionForm.setTitle(QCoreApplication.translate("RegionForm", u"Add Region", None))
+        self.label_5.setText(QCoreApplication.translate("RegionForm", u"Name", None))
+        self.label_6.setText(QCoreApplication.translate("RegionForm", u"Type", None))
+        self.fluid.setText(QCoreApplication.translate("RegionForm", u"Fluid", None))
+        self.solid.setText(QCoreApplication.translate("RegionForm", u"Solid", None))
+        self.label_13.setText(QCoreApplication.translate("RegionForm", u"Point (Specify a point in the region)", None))
+        self.x.setText(QCoreApplication.translate("RegionForm", u"0", None))
+        self.y.setText(QCoreApplication.translate("RegionForm", u"0", None))
+        self.z.setText(QCoreApplication.translate("RegionForm", u"0", None))
+        self.ok.setText(QCoreApplication.translate("RegionForm", u"&Add", None))
+        self.cancel.setText(QCoreApplication.translate("RegionForm", u"Cancel", None))
+    # retranslateUi
+
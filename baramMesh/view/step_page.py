@@ -9,6 +9,7 @@ from PySide6.QtCore import QObject, Signal
 from libbaram.utils import rmtree
 
 from baramMesh.app import app
+from baramMesh.openfoam.utility.snappy_hex_mesh import snappyHexMesh
 from baramMesh.view.main_window.main_window_ui import Ui_MainWindow
 
 
@@ -67,6 +68,8 @@ class StepPage(QObject):
         return
 
     def clearResult(self):
+        snappyHexMesh.cancelCheckMesh(self.OUTPUT_TIME)
+
         path = self._outputPath()
         if path and path.exists():
             rmtree(path)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'language_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QComboBox, QDialog,
+    QDialogButtonBox, QGroupBox, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+class Ui_LanguageDialog(object):
+    def setupUi(self, LanguageDialog):
+        if not LanguageDialog.objectName():
+            LanguageDialog.setObjectName(u"LanguageDialog")
+        LanguageDialog.setWindowModality(Qt.WindowModal)
+        LanguageDialog.resize(240, 120)
+        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(LanguageDialog.sizePolicy().hasHeightForWidth())
+        LanguageDialog.setSizePolicy(sizePolicy)
+        LanguageDialog.setMinimumSize(QSize(240, 120))
+        LanguageDialog.setMaximumSize(QSize(240, 120))
+        LanguageDialog.setModal(True)
+        self.verticalLayout_2 = QVBoxLayout(LanguageDialog)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.group = QGroupBox(LanguageDialog)
+        self.group.setObjectName(u"group")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.group.sizePolicy().hasHeightForWidth())
+        self.group.setSizePolicy(sizePolicy1)
+        font = QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.group.setFont(font)
+        self.group.setStyleSheet(u"QGroupBox {\n"
+"    border: 1px solid gray;\n"
+"    border-radius: 2px;\n"
+"    margin-top: 8;\n"
+"	 border-color : rgb(200, 200, 200);\n"
+"}\n"
+"\n"
+"QGroupBox::title {\n"
+"    subcontrol-origin: margin;\n"
+"    left: 10px;\n"
+"    padding: 0 3px 0 3px;\n"
+"}\n"
+"")
+        self.vGBox_MeshSize = QVBoxLayout(self.group)
+        self.vGBox_MeshSize.setObjectName(u"vGBox_MeshSize")
+        self.vGBox_MeshSize.setContentsMargins(10, 15, 10, 10)
+        self.language = QComboBox(self.group)
+        self.language.setObjectName(u"language")
+        self.language.setInsertPolicy(QComboBox.InsertAlphabetically)
+        self.language.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        self.language.setFrame(True)
+
+        self.vGBox_MeshSize.addWidget(self.language)
+
+
+        self.verticalLayout_2.addWidget(self.group)
+
+        self.verticalLayout_3 = QVBoxLayout()
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(-1, 10, -1, -1)
+        self.buttonBox = QDialogButtonBox(LanguageDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_3.addWidget(self.buttonBox)
+
+
+        self.verticalLayout_2.addLayout(self.verticalLayout_3)
+
+
+        self.retranslateUi(LanguageDialog)
+        self.buttonBox.rejected.connect(LanguageDialog.reject)
+        self.buttonBox.accepted.connect(LanguageDialog.accept)
+
+        self.language.setCurrentIndex(-1)
+
+
+        QMetaObject.connectSlotsByName(LanguageDialog)
+    # setupUi
+
+    def retranslateUi(self, LanguageDialog):
+        LanguageDialog.setWindowTitle(QCoreApplication.translate("LanguageDialog", u"Setting", None))
+        self.group.setTitle(QCoreApplication.translate("LanguageDialog", u"< Language >", None))
+        self.language.setCurrentText("")
+    # retranslateUi
+
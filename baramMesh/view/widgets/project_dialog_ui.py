@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'project_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QFrame, QHBoxLayout,
+    QListWidget, QListWidgetItem, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_ProjectSelector(object):
+    def setupUi(self, ProjectSelector):
+        if not ProjectSelector.objectName():
+            ProjectSelector.setObjectName(u"ProjectSelector")
+        ProjectSelector.resize(460, 320)
+        ProjectSelector.setMinimumSize(QSize(400, 300))
+        self.verticalLayout = QVBoxLayout(ProjectSelector)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget = QWidget(ProjectSelector)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(199, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.newCase = QPushButton(self.widget)
+        self.newCase.setObjectName(u"newCase")
+
+        self.horizontalLayout.addWidget(self.newCase)
+
+        self.open = QPushButton(self.widget)
+        self.open.setObjectName(u"open")
+
+        self.horizontalLayout.addWidget(self.open)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+        self.recentCases = QListWidget(ProjectSelector)
+        self.recentCases.setObjectName(u"recentCases")
+        self.recentCases.setFrameShape(QFrame.NoFrame)
+        self.recentCases.setItemAlignment(Qt.AlignTop)
+
+        self.verticalLayout.addWidget(self.recentCases)
+
+
+        self.retranslateUi(ProjectSelector)
+
+        QMetaObject.connectSlotsByName(ProjectSelector)
+    # setupUi
+
+    def retranslateUi(self, ProjectSelector):
+        ProjectSelector.setWindowTitle(QCoreApplication.translate("ProjectSelector", u"Start Baram", None))
+        self.newCase.setText(QCoreApplication.translate("ProjectSelector", u"New Case", None))
+        self.open.setText(QCoreApplication.translate("ProjectSelector", u"Open", None))
+    # retranslateUi
+
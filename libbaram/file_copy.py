@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import platform
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum, auto
+from functools import partial
+from pathlib import Path
+
+MAX_COPY_WORKERS = 8    # Copies wait on the disk more than on the CPU
+
+_FICLONE = 0x40049409   # ioctl request to share the blocks of a file, from linux/fs.h
+
+_reflinkUnsupported = set()     # Devices that failed to clone files
+
+
+class CopyMode(Enum):
+    COPY = auto()       # Contents are always copied
+    REFLINK = auto()    # Blocks are shared copy-on-write where the file system supports it, or copied
+    HARDLINK = auto()   # Files are linked on the same file system, or handled as REFLINK.
+                        # Only for targets that are replaced, not written in place, because sources change with them
+
+
+def _reflink(source, target) -> bool:
+    if platform.system() != 'Linux':
+        return False
+
+    device = os.stat(source).st_dev
+    if device in _reflinkUnsupported:
+        return False
+
+    import fcntl
+
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        _reflinkUnsupported.add(device)
+        return False
+
+    return True
+
+
+def copyFile(source, target, mode=CopyMode.REFLINK):
+    if mode == CopyMode.HARDLINK:
+        try:
+            os.link(source, target)
+            return target
+        except OSError:
+            pass
+
+    if mode != CopyMode.COPY and _reflink(source, target):
+        shutil.copystat(source, target)
+        return target
+
+    # shutil copies in chunks, in the kernel where the platform allows
+    return shutil.copy2(source, target)
+
+
+def copyTree(source: Path, target: Path, mode=CopyMode.REFLINK):
+    if mode == CopyMode.HARDLINK and os.stat(source).st_dev != os.stat(target.parent).st_dev:
+        mode = CopyMode.REFLINK
+
+    shutil.copytree(source, target, copy_function=partial(copyFile, mode=mode))
+
+
+async def copyTrees(pairs: list[tuple[Path, Path]], mode=CopyMode.REFLINK, concurrency=MAX_COPY_WORKERS):
+    """Copies directory trees, each of the pairs of a source and a target, concurrently in threads"""
+    if not pairs:
+        return
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pairs)))) as executor:
+        await asyncio.gather(*[loop.run_in_executor(executor, copyTree, source, target, mode)
+                               for source, target in pairs])
@@ -29,12 +29,14 @@ if platform.system() == 'Windows':
     VERSION_CHECK_OPTION = '-help'
     MAJOR_VERSION = 10
     MINOR_VERSION = 1
+    NO_BINDING_OPTIONS = []     # MS-MPI does not bind processes to cores unless asked
 else:
     MPICMD = 'mpirun'
     HOST_FILE_OPTION = '-hostfile'
     VERSION_CHECK_OPTION = '--version'
     MAJOR_VERSION = 4
     MINOR_VERSION = 1
+    NO_BINDING_OPTIONS = ['--bind-to', 'none']
 
 
 async def checkMPI():
@@ -60,6 +62,7 @@ class ParallelEnvironment:
         self._np: int = np
         self._type = type_
         self._hosts = '' if hosts is None else hosts
+        self._coreBinding = True
 
     def np(self):
         return self._np
@@ -82,6 +85,14 @@ class ParallelEnvironment:
     def setHosts(self, hosts):
         self._hosts = hosts
 
+    def setCoreBinding(self, binding: bool):
+        """Sets whether MPI binds the processes to cores
+
+        Open MPI binds the processes of every job to the same cores from the first one,
+        so jobs running on the same machine at the same time should not be bound.
+        """
+        self._coreBinding = binding
+
     def makeCommand(self, *command, cwd: Path, options):
         # windows: mpiexec
         # others: mpirun
@@ -102,6 +113,9 @@ class ParallelEnvironment:
                 cmdline.append(HOST_FILE_OPTION)
                 cmdline.append(str(path))
 
+        if not self._coreBinding:
+            cmdline.extend(NO_BINDING_OPTIONS)
+
         # -np <N>
         cmdline.append('-np')
         cmdline.append(str(self._np))
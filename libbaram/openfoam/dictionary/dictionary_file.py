@@ -58,6 +58,9 @@ class DictionaryFile:
         processorDir = '' if processorNo is None else f'processor{processorNo}'
         return self._casePath / processorDir / self._header['location'] / self._header['object']
 
+    def objectPath(self) -> Path:
+        return Path(self._header['location']) / self._header['object']
+
     def asDict(self):
         return self._data
 
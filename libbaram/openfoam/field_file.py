@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gzip
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from PyFoam.Basics.FoamFileGenerator import FoamFileGenerator
+
+
+_SPACES = b' \t\r\n\f\v'
+
+# Number of components of primitive types that OpenFOAM writes as raw bytes in binary format
+_COMPONENTS = {
+    b'scalar': 1,
+    b'vector': 3,
+    b'sphericalTensor': 1,
+    b'symmTensor': 6,
+    b'tensor': 9,
+    b'label': 1,
+}
+
+_LIST_TYPE_PATTERN = re.compile(rb'List<(\w+)>')
+_PUNCTUATION_SPACES_PATTERN = re.compile(rb'\s*([(){}\[\];])\s*')
+_SPACES_PATTERN = re.compile(rb'(?:[ \t\r\n\f\v]+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)  # Spaces and comments
+_WORD_PATTERN = re.compile(rb'[^ \t\r\n\f\v(){}\[\];"]*')
+
+
+def fieldFilePath(path: Path) -> Optional[Path]:
+    """Returns the path of the field file, or its compressed file, or None if neither exists"""
+    if path.is_file():
+        return path
+
+    compressed = path.with_name(path.name + '.gz')
+    if compressed.is_file():
+        return compressed
+
+    return None
+
+
+def readFileBytes(path: Path) -> bytes:
+    """Returns the contents of the file, decompressed if it is compressed with gzip"""
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rb') as f:
+            return f.read()
+
+    return path.read_bytes()
+
+
+def writeFileBytes(path: Path, chunks: list[bytes]):
+    """Writes the chunks to the file through a temporary file, compressed with gzip if the file name says so
+
+    The permissions of the file are kept, since the temporary file is created readable only by the user.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, dir=path.parent) as f:
+        if path.suffix == '.gz':
+            with gzip.GzipFile(fileobj=f, mode='wb') as z:
+                for chunk in chunks:
+                    z.write(chunk)
+        else:
+            for chunk in chunks:
+                f.write(chunk)
+        temp = Path(f.name)
+
+    if path.exists():
+        shutil.copymode(path, temp)
+
+    temp.replace(path)
+
+
+def _normalize(text: bytes) -> bytes:
+    return _PUNCTUATION_SPACES_PATTERN.sub(rb'\1', b' '.join(text.split()))
+
+
+class _Entry:
+    def __init__(self, key: bytes, start: int, end: int, valueStart: int, valueEnd: int):
+        self.key = key
+        self.start = start              # Start of the keyword
+        self.end = end                  # End of the entry, after ";" or "}"
+        self.valueStart = valueStart
+        self.valueEnd = valueEnd        # End of the value, before ";" or after "}"
+
+    @property
+    def name(self) -> str:
+        return self.key.strip(b'"').decode()
+
+
+class _Scanner:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+        self.binary = False
+        self.labelSize = 4
+        self.scalarSize = 8
+
+    def atEnd(self):
+        self.skipSpaces()
+        return self.pos >= len(self.data)
+
+    def skipSpaces(self):
+        self.pos = _SPACES_PATTERN.match(self.data, self.pos).end()
+        if self.data.startswith(b'/*', self.pos):
+            raise ValueError('Unterminated comment')
+
+    def peek(self) -> int:
+        self.skipSpaces()
+        if self.pos >= len(self.data):
+            raise ValueError('Unexpected end of file')
+
+        return self.data[self.pos]
+
+    def word(self) -> bytes:
+        self.skipSpaces()
+        start = self.pos
+        data = self.data
+        if data.startswith(b'"', start):
+            self._skipString()
+        else:
+            self.pos = _WORD_PATTERN.match(data, start).end()
+
+        if self.pos == start:
+            raise ValueError(f'Keyword expected at {start}')
+
+        return data[start:self.pos]
+
+    def entry(self) -> _Entry:
+        """Reads an entry of dictionary and returns its span"""
+        self.skipSpaces()
+        start = self.pos
+        key = self.word()
+
+        if key.startswith(b'#'):   # Directives like "#include" take the rest of the line
+            end = self.data.find(b'\n', self.pos)
+            self.pos = len(self.data) if end < 0 else end
+            return _Entry(key, start, self.pos, self.pos, self.pos)
+
+        if self.peek() == ord('{'):
+            valueStart = self.pos
+            self.skipDictionary()
+            return _Entry(key, start, self.pos, valueStart, self.pos)
+
+        self.skipSpaces()
+        valueStart = self.pos
+        self.skipValue()
+        valueEnd = self.pos
+        self.pos += 1   # ";"
+
+        return _Entry(key, start, self.pos, valueStart, valueEnd)
+
+    def readEntries(self, dictionary: _Entry) -> dict[str, _Entry]:
+        """Returns the entries of the dictionary, keeping the position of the scanner"""
+        end = self.pos
+        self.pos = dictionary.valueStart + 1     # After "{"
+        entries = {}
+        while self.peek() != ord('}'):
+            e = self.entry()
+            entries[e.name] = e
+        self.pos = end
+
+        return entries
+
+    def readHeader(self, header: _Entry):
+        """Sets the format of lists from the "FoamFile" header"""
+        entries = self.readEntries(header)
+        if e := entries.get('format'):
+            self.binary = self.data[e.valueStart:e.valueEnd].strip() == b'binary'
+        if e := entries.get('arch'):
+            arch = self.data[e.valueStart:e.valueEnd].strip(b'" ')
+            if m := re.search(rb'label=(\d+)', arch):
+                self.labelSize = int(m.group(1)) // 8
+            if m := re.search(rb'scalar=(\d+)', arch):
+                self.scalarSize = int(m.group(1)) // 8
+
+    def skipDictionary(self):
+        self.pos += 1   # "{"
+        while self.peek() != ord('}'):
+            self.entry()
+        self.pos += 1
+
+    def skipValue(self):
+        """Moves to the ";" that ends the value of an entry"""
+        data = self.data
+        depth = 0
+        words = [b'', b'']
+        while True:
+            c = self.peek()
+            if c == ord(';') and depth == 0:
+                return
+            elif c == ord('"'):
+                self._skipString()
+            elif c == ord('(') and words[1].isdigit() and (m := _LIST_TYPE_PATTERN.fullmatch(words[0])):
+                self._skipList(m.group(1), int(words[1]))
+            elif c in b'([{':
+                depth += 1
+                self.pos += 1
+            elif c in b')]}':
+                depth -= 1
+                self.pos += 1
+            else:
+                words = [words[1], self.word()]
+                continue
+
+            words = [words[1], b'']
+
+            if self.pos >= len(data):
+                raise ValueError('Unexpected end of file')
+
+    def _skipList(self, type_: bytes, size: int):
+        if self.binary and type_ in _COMPONENTS:
+            width = self.labelSize if type_ == b'label' else self.scalarSize
+            self.pos += 1 + size * _COMPONENTS[type_] * width
+            if self.data[self.pos:self.pos + 1] != b')':
+                raise ValueError(f'Invalid binary list at {self.pos}')
+            self.pos += 1
+        else:
+            # Numbers in ascii lists have no ";", so the entry ends at the first one after the list
+            end = self.data.find(b';', self.pos)
+            if end < 0:
+                raise ValueError('Unexpected end of file')
+            self.pos = end
+
+    def _skipString(self):
+        data = self.data
+        pos = self.pos + 1
+        while True:
+            end = data.find(b'"', pos)
+            if end < 0:
+                raise ValueError('Unterminated string')
+            if data[end - 1] != ord('\\'):
+                self.pos = end + 1
+                return
+            pos = end + 1
+
+
+class FieldFile:
+    """Field file of OpenFOAM whose boundaryField can be updated without parsing internalField
+
+    The file is scanned for the span of each top level entry and patch,
+    and lists in internalField and boundaryField are skipped over by their sizes in binary format,
+    or by searching for the end of the entry in ascii format.
+    Updated patches are spliced in, and the rest of the file is written back byte for byte.
+    Files compressed with gzip are read and written compressed.
+    """
+    def __init__(self, path: Path):
+        self._path = path
+        self._data = readFileBytes(path)
+
+        self._boundaryField: Optional[_Entry] = None
+        self._patches: dict[str, _Entry] = {}
+        self._entries: dict[str, dict[str, _Entry]] = {}
+        self._updated: dict[str, bytes] = {}
+
+        self._scan()
+
+    @property
+    def path(self):
+        return self._path
+
+    def patchNames(self) -> list[str]:
+        return list(self._patches.keys())
+
+    def entry(self, patch: str, key: str) -> Optional[str]:
+        """Returns the text of the entry value in the patch, or None if the patch or the entry does not exist"""
+        if e := self._entries.get(patch, {}).get(key):
+            return self._data[e.valueStart:e.valueEnd].decode('latin-1').strip()
+
+        return None
+
+    def updatePatch(self, patch: str, entries: dict):
+        """Sets the entries of the patch, keeping the other entries of the patch as they are
+
+        Entries of None value are ignored.
+        The patch is appended to boundaryField if it does not exist.
+        """
+        def generate(key):
+            return str(FoamFileGenerator({key: entries[key]})).strip().encode().replace(b'\n', b'\n        ')
+
+        lines = []
+        changed = patch not in self._patches
+        existing = self._entries.get(patch, {})
+        entries = {k: v for k, v in entries.items() if v is not None}
+
+        for key, e in existing.items():
+            original = self._data[e.start:e.end]
+            if key in entries:
+                text = generate(key)
+                changed = changed or _normalize(text) != _normalize(original)
+                lines.append(text)
+            else:
+                lines.append(original)
+
+        for key in entries:
+            if key not in existing:
+                lines.append(generate(key))
+                changed = True
+
+        if changed:
+            body = b'\n'.join(b'        ' + line for line in lines)
+            # The name is written as it is in the file, which may be quoted like "inlet.*"
+            key = self._patches[patch].key if patch in self._patches else patch.encode()
+            self._updated[patch] = b'%s\n    {\n%s\n    }' % (key, body)
+
+    def write(self):
+        """Writes the file if any patch has been updated"""
+        if not self._updated:
+            return
+
+        chunks = []
+        pos = 0
+        for name, e in self._patches.items():
+            if name in self._updated:
+                chunks.append(self._data[pos:e.start])
+                chunks.append(self._updated[name])
+                pos = e.end
+
+        # Patches that did not exist are added at the end of boundaryField
+        if added := [name for name in self._updated if name not in self._patches]:
+            end = self._boundaryField.end - 1
+            chunks.append(self._data[pos:end].rstrip(_SPACES))
+            for name in added:
+                chunks.append(b'\n    ' + self._updated[name])
+            chunks.append(b'\n' + self._data[end:])
+        else:
+            chunks.append(self._data[pos:])
+
+        writeFileBytes(self._path, chunks)
+
+    def _scan(self):
+        scanner = _Scanner(self._data)
+        while not scanner.atEnd():
+            e = scanner.entry()
+            if e.key == b'FoamFile':
+                scanner.readHeader(e)
+            elif e.key == b'boundaryField':
+                self._readBoundaryField(e, scanner)
+
+        if self._boundaryField is None:
+            raise ValueError(f'No boundaryField in {self._path}')
+
+    def _readBoundaryField(self, boundaryField: _Entry, scanner: _Scanner):
+        self._boundaryField = boundaryField
+        self._patches = scanner.readEntries(boundaryField)
+        for name, patch in self._patches.items():
+            if self._data.startswith(b'{', patch.valueStart):
+                self._entries[name] = scanner.readEntries(patch)
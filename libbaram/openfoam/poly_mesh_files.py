@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from pathlib import Path
+
+from libbaram.openfoam.field_file import _LIST_TYPE_PATTERN, _Scanner, fieldFilePath, readFileBytes, writeFileBytes
+
+
+_INT_PATTERN = re.compile(rb'[-+]?\d+')
+_FLOAT_PATTERN = re.compile(rb'[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?')
+
+
+def _value(word: bytes):
+    if _INT_PATTERN.fullmatch(word):
+        return int(word)
+    if _FLOAT_PATTERN.fullmatch(word):
+        return float(word)
+
+    return word.decode()
+
+
+def _parseItems(scanner: _Scanner, end: int) -> list:
+    """Reads values up to the end character, which is not consumed
+
+    Types and sizes of lists, like "List<word> 2" of "List<word> 2(wall group)", are not kept.
+    """
+    items = []
+    while (c := scanner.peek()) != end:
+        if c == ord('('):
+            scanner.pos += 1
+            items.append(_parseItems(scanner, ord(')')))
+            scanner.pos += 1
+        elif c == ord('{'):
+            items.append(_parseDictionary(scanner))
+        else:
+            word = scanner.word()
+            if _LIST_TYPE_PATTERN.fullmatch(word) or (word.isdigit() and scanner.peek() == ord('(')):
+                continue
+            items.append(_value(word))
+
+    return items
+
+
+def _parseEntry(scanner: _Scanner) -> tuple[str, object]:
+    key = scanner.word()
+    if key.startswith(b'#'):
+        raise ValueError(f'Directive {key.decode()} is not supported')
+
+    if scanner.peek() == ord('{'):
+        return key.decode(), _parseDictionary(scanner)
+
+    start = scanner.pos
+    items = _parseItems(scanner, ord(';'))
+    end = scanner.pos
+    scanner.pos += 1    # ";"
+
+    # Values of several words are kept as they are written
+    return key.decode(), items[0] if len(items) == 1 else scanner.data[start:end].decode().strip()
+
+
+def _parseDictionary(scanner: _Scanner) -> dict:
+    scanner.pos += 1    # "{"
+    content = {}
+    while scanner.peek() != ord('}'):
+        key, value = _parseEntry(scanner)
+        content[key] = value
+    scanner.pos += 1
+
+    return content
+
+
+def _format(value) -> str:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (list, tuple)):
+        return '(' + ' '.join(_format(v) for v in value) + ')'
+
+    return str(value)
+
+
+def _formatDictionary(content: dict, indent: str) -> list[str]:
+    lines = [indent + '{']
+    for key, value in content.items():
+        if isinstance(value, dict):
+            lines.append(f'{indent}    {key}')
+            lines.extend(_formatDictionary(value, indent + '    '))
+        else:
+            lines.append(f'{indent}    {key:<15} {_format(value)};')
+    lines.append(indent + '}')
+
+    return lines
+
+
+def _openList(scanner: _Scanner) -> int:
+    """Moves into the list of a polyMesh file, after "(", and returns the start of the list including its size
+
+    The "FoamFile" header is read on the way, so that the scanner knows the format of the lists.
+    """
+    while scanner.peek() not in b'(0123456789':
+        e = scanner.entry()
+        if e.key == b'FoamFile':
+            scanner.readHeader(e)
+
+    start = scanner.pos
+    if scanner.peek() != ord('('):
+        scanner.word()
+    if scanner.peek() != ord('('):
+        raise ValueError(f'List expected at {scanner.pos}')
+    scanner.pos += 1
+
+    return start
+
+
+class BoundaryFile:
+    """boundary file of polyMesh read by a tokenizer of its own instead of PyFoam
+
+    content is a dict of patches in the order of the file,
+    and each patch is a dict of its entries with int, float, str or list values.
+    Parts of the file other than the list of patches, like the banner and the header, are written back as they are,
+    and the patches are written in the order of their startFace as PyFoam does.
+    """
+    def __init__(self, path: Path):
+        self._path = fieldFilePath(path) or path
+        self._data = readFileBytes(self._path)
+
+        self.content: dict[str, dict] = {}
+
+        scanner = _Scanner(self._data)
+        self._listStart = _openList(scanner)
+        while scanner.peek() != ord(')'):
+            name = scanner.word().decode()
+            if scanner.peek() != ord('{'):
+                raise ValueError(f'Invalid patch {name} in {self._path}')
+            self.content[name] = _parseDictionary(scanner)
+        scanner.pos += 1
+        self._listEnd = scanner.pos
+
+    @property
+    def path(self):
+        return self._path
+
+    def writeFile(self):
+        patches = sorted(self.content.items(), key=lambda p: int(p[1].get('startFace', 0)))
+
+        lines = [str(len(patches)), '(']
+        for name, patch in patches:
+            lines.append(f'    {name}')
+            lines.extend(_formatDictionary(patch, '    '))
+        lines.append(')')
+
+        writeFileBytes(self._path,
+                       [self._data[:self._listStart], '\n'.join(lines).encode(), self._data[self._listEnd:]])
+
+
+def readDictionary(path: Path) -> dict:
+    """Returns the entries of a small dictionary file like regionProperties, except for the header"""
+    scanner = _Scanner(readFileBytes(path))
+
+    content = {}
+    while not scanner.atEnd():
+        key, value = _parseEntry(scanner)
+        if key != 'FoamFile':
+            content[key] = value
+
+    return content
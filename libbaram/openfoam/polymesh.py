@@ -7,9 +7,8 @@ from vtkmodules.vtkCommonCore import VTK_MULTIBLOCK_DATA_SET, VTK_POLY_DATA, vtk
 from vtkmodules.vtkCommonDataModel import vtkCompositeDataIterator, vtkCompositeDataSet, vtkDataSet, vtkDataSetAttributes, vtkMultiBlockDataSet, vtkPolyData, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkAppendFilter, vtkAppendPolyData, vtkArrayCalculator, vtkPointDataToCellData
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict, ParsedParameterFile
-
 from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.poly_mesh_files import BoundaryFile, readDictionary
 from libbaram.vtk_threads import vtk_run_in_thread
 
 
@@ -29,6 +28,41 @@ def _addArrayIfNotExists(dsa: vtkDataSetAttributes, name: str, numComponents: in
     dsa.AddArray(dataArray)
 
 
+def _unionFieldsAppender(appendFilter, dataSetList: list[vtkDataSet]):
+    """Sets shallow copies of the data sets as the inputs of the filter, and returns the function appending them
+
+    The function adds arrays of the union fields to the copies and updates the filter,
+    and should be run in the VTK thread.
+    The data sets are not modified because they may be rendered or read by other pipelines at the same time.
+    """
+    copies = []
+    for dataSet in dataSetList:
+        copied = dataSet.NewInstance()
+        copied.ShallowCopy(dataSet)
+        copies.append(copied)
+        appendFilter.AddInputData(copied)
+
+    def append():
+        cellFields: dict[str, int] = {}   # FieldName, NumberOfComponent
+        pointFields: dict[str, int] = {}  # FieldName, NumberOfComponent
+        for ds in copies:
+            cellFields.update(_collectArrayFields(ds.GetCellData()))
+            pointFields.update(_collectArrayFields(ds.GetPointData()))
+
+        for ds in copies:
+            cellData = ds.GetCellData()
+            for name, numComponents in cellFields.items():
+                _addArrayIfNotExists(cellData, name, numComponents)
+
+            pointData = ds.GetPointData()
+            for name, numComponents in pointFields.items():
+                _addArrayIfNotExists(pointData, name, numComponents)
+
+        appendFilter.Update()
+
+    return append
+
+
 def _collectArrayFields(dsa: vtkDataSetAttributes) -> dict[str, int]:
     fields: dict[str, int] = {}
     for i in range(dsa.GetNumberOfArrays()):
@@ -58,7 +92,7 @@ def loadRegions(constant: Path):
     regionPropFile = constant / Directory.REGION_PROPERTIES_FILE_NAME
 
     if regionPropFile.is_file():
-        regionsDict = ParsedParameterFile(regionPropFile).content['regions']
+        regionsDict = readDictionary(regionPropFile)['regions']
         for i in range(1, len(regionsDict), 2):
             for rname in regionsDict[i]:
                 if not constant.joinpath(rname).is_dir():
@@ -84,7 +118,7 @@ def removeVoidBoundaries(caseRoot: Path):
         if not isPolyMesh(constant / rname / 'polyMesh'):
             continue
         boundaryPath = constant / rname / 'polyMesh' / 'boundary'
-        boundaryDict = ParsedBoundaryDict(str(boundaryPath), treatBinaryAsASCII=True)
+        boundaryDict = BoundaryFile(boundaryPath)
         boundaries = boundaryDict.content
 
         for b in list(boundaries.keys()):
@@ -120,10 +154,6 @@ def findBlock(mBlock: vtkMultiBlockDataSet, name: str, type_: int):
 async def collectInternalMesh(mBlock: vtkMultiBlockDataSet) -> vtkUnstructuredGrid:
     dataSetList: list[vtkDataSet] = []
 
-    # Collect Fields to make union Field list
-    cellFields: dict[str, int] = {}   # FieldName, NumberOfComponent
-    pointFields: dict[str, int] = {}  # FieldName, NumberOfComponent
-
     iterator: vtkCompositeDataIterator = mBlock.NewIterator()
     while not iterator.IsDoneWithTraversal():
         if not iterator.HasCurrentMetaData():
@@ -137,30 +167,12 @@ async def collectInternalMesh(mBlock: vtkMultiBlockDataSet) -> vtkUnstructuredGr
 
         dataSet: vtkDataSet = iterator.GetCurrentDataObject()
         if dataSet is not None:
-            fields = _collectArrayFields(dataSet.GetCellData())
-            cellFields.update(fields)
-
-            fields = _collectArrayFields(dataSet.GetPointData())
-            pointFields.update(fields)
-
             dataSetList.append(dataSet)
 
         iterator.GoToNextItem()
 
     appendFilter = vtkAppendFilter()
-
-    for dataSet in dataSetList:
-        cellData = dataSet.GetCellData()
-        for name, numComponents in cellFields.items():
-            _addArrayIfNotExists(cellData, name, numComponents)
-
-        pointData = dataSet.GetPointData()
-        for name, numComponents in pointFields.items():
-            _addArrayIfNotExists(pointData, name, numComponents)
-
-        appendFilter.AddInputData(dataSet)
-
-    await vtk_run_in_thread(appendFilter.Update)
+    await vtk_run_in_thread(_unionFieldsAppender(appendFilter, dataSetList), pipeline=appendFilter)
 
     collectedMesh: vtkUnstructuredGrid = appendFilter.GetOutput()
 
@@ -185,10 +197,6 @@ async def collectBoundaryMesh(mBlock: vtkMultiBlockDataSet, boundaries: list[tup
 
     dataSetList: list[vtkPolyData] = []
 
-    # Collect Fields to make union Field list
-    cellFields: dict[str, int] = {}   # FieldName, NumberOfComponent
-    pointFields: dict[str, int] = {}  # FieldName, NumberOfComponent
-
     for rname, bcname in boundaries:
         if rname != '':  # multi-region
             block = findBlock(mBlock, rname, VTK_MULTIBLOCK_DATA_SET)
@@ -207,26 +215,8 @@ async def collectBoundaryMesh(mBlock: vtkMultiBlockDataSet, boundaries: list[tup
 
         dataSetList.append(dataSet)
 
-        fields = _collectArrayFields(dataSet.GetCellData())
-        cellFields.update(fields)
-
-        fields = _collectArrayFields(dataSet.GetPointData())
-        pointFields.update(fields)
-
     appendFilter = vtkAppendPolyData()
-
-    for dataSet in dataSetList:
-        cellData = dataSet.GetCellData()
-        for name, numComponents in cellFields.items():
-            _addArrayIfNotExists(cellData, name, numComponents)
-
-        pointData = dataSet.GetPointData()
-        for name, numComponents in pointFields.items():
-            _addArrayIfNotExists(pointData, name, numComponents)
-
-        appendFilter.AddInputData(dataSet)
-
-    await vtk_run_in_thread(appendFilter.Update)
+    await vtk_run_in_thread(_unionFieldsAppender(appendFilter, dataSetList), pipeline=appendFilter)
 
     return appendFilter.GetOutput()
 
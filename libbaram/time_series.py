@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+INITIAL_CAPACITY = 1024
+
+
+class TimeSeriesBuffer:
+    """Growable columnar store of samples ordered by time
+
+    Rows are kept in preallocated NumPy arrays that double in capacity when full,
+    so appending is amortized O(rows appended) regardless of the history length.
+    Appending rows that start at or before the last stored time drops the stored rows from that time on,
+    which is what happens when a solver restarts from an earlier time.
+    """
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self._times = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty((capacity, 0), dtype=np.float64)
+        self._columns = []
+        self._columnIndex = {}
+        self._size = 0
+        self._modifiedFrom: Optional[int] = None
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def columns(self) -> [str]:
+        return self._columns
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times[:self._size]
+
+    def column(self, name) -> np.ndarray:
+        return self._values[:self._size, self._columnIndex[name]]
+
+    def firstTime(self) -> Optional[float]:
+        return float(self._times[0]) if self._size else None
+
+    def lastTime(self) -> Optional[float]:
+        return float(self._times[self._size - 1]) if self._size else None
+
+    def append(self, times: np.ndarray, columns: [str], values: np.ndarray):
+        """Append rows, truncating stored rows at or after the first new time
+
+        Args:
+            times: 1-D array of increasing time values
+            columns: column names of "values"
+            values: 2-D array of shape (len(times), len(columns))
+        """
+        count = len(times)
+        if count == 0:
+            return
+
+        start = self.truncate(times[0])
+
+        self._addColumns(columns)
+        self._reserve(start + count)
+
+        end = start + count
+        self._times[start:end] = times
+        if len(columns) < len(self._columns):
+            self._values[start:end, :] = np.nan
+        self._values[start:end, [self._columnIndex[c] for c in columns]] = values
+
+        self._size = end
+        self._markModified(start)
+
+    def appendDataFrame(self, df: pd.DataFrame):
+        self.append(df.index.to_numpy(dtype=np.float64),
+                    df.columns.values.tolist(),
+                    df.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    def truncate(self, time) -> int:
+        """Drop rows at or after "time" and return the new number of rows"""
+        size = int(np.searchsorted(self._times[:self._size], time, side='left'))
+        if size < self._size:
+            self._size = size
+            self._markModified(size)
+
+        return self._size
+
+    def clear(self):
+        self.truncate(-np.inf)
+
+    def takeModifiedFrom(self) -> Optional[int]:
+        """Return the first row changed since the last call, or None if nothing has changed"""
+        modifiedFrom = self._modifiedFrom
+        self._modifiedFrom = None
+
+        return modifiedFrom
+
+    def toDataFrame(self, start=0) -> pd.DataFrame:
+        return pd.DataFrame(self._values[start:self._size].copy(),
+                            index=pd.Index(self._times[start:self._size].copy(), name='Time'),
+                            columns=list(self._columns))
+
+    def _markModified(self, row):
+        if self._modifiedFrom is None or row < self._modifiedFrom:
+            self._modifiedFrom = row
+
+    def _reserve(self, size):
+        capacity = len(self._times)
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        times = np.empty(capacity, dtype=np.float64)
+        times[:self._size] = self._times[:self._size]
+        self._times = times
+
+        values = np.empty((capacity, len(self._columns)), dtype=np.float64)
+        values[:self._size] = self._values[:self._size]
+        self._values = values
+
+    def _addColumns(self, columns):
+        newColumns = [c for c in columns if c not in self._columnIndex]
+        if not newColumns:
+            return
+
+        for c in newColumns:
+            self._columnIndex[c] = len(self._columns)
+            self._columns.append(c)
+
+        values = np.full((len(self._times), len(self._columns)), np.nan, dtype=np.float64)
+        values[:self._size, :self._values.shape[1]] = self._values[:self._size]
+        self._values = values
+
+
+class MinMaxLevels:
+    """Pyramid of min/max summaries of a column of TimeSeriesBuffer for level-of-detail rendering
+
+    Level k summarizes blocks of 2**k rows by the row indices of their minimum and maximum values.
+    Summaries are updated only for the rows changed, and a window of any length is reduced to O(width) points
+    that keep the extremes of every bucket, so the shape of the line and its value range are preserved.
+    """
+    def __init__(self):
+        self._minRows: list[np.ndarray] = []    # Index k-1 is for level k
+        self._maxRows: list[np.ndarray] = []
+        self._counts: list[int] = []
+
+    def update(self, values: np.ndarray, start=0):
+        """Bring summaries up to date with "values" whose rows from "start" on have been appended or rewritten"""
+        size = len(values)
+        level = 1
+        while (count := size >> level) > 0:
+            if len(self._counts) < level:
+                self._minRows.append(np.empty(max(count, INITIAL_CAPACITY), dtype=np.int64))
+                self._maxRows.append(np.empty(max(count, INITIAL_CAPACITY), dtype=np.int64))
+                self._counts.append(0)
+
+            i = level - 1
+            valid = min(self._counts[i], start >> level)   # Blocks before "start" are still valid
+            if valid < count:
+                if len(self._minRows[i]) < count:
+                    capacity = len(self._minRows[i])
+                    while capacity < count:
+                        capacity *= 2
+                    self._minRows[i] = np.resize(self._minRows[i], capacity)
+                    self._maxRows[i] = np.resize(self._maxRows[i], capacity)
+
+                blocks = np.arange(valid, count)
+                if level == 1:
+                    aMin = aMax = blocks * 2
+                    bMin = bMax = aMin + 1
+                else:
+                    aMin = self._minRows[i - 1][blocks * 2]
+                    bMin = self._minRows[i - 1][blocks * 2 + 1]
+                    aMax = self._maxRows[i - 1][blocks * 2]
+                    bMax = self._maxRows[i - 1][blocks * 2 + 1]
+
+                a = values[aMin]
+                b = values[bMin]
+                self._minRows[i][valid:count] = np.where(np.isnan(a) | (b < a), bMin, aMin)
+
+                a = values[aMax]
+                b = values[bMax]
+                self._maxRows[i][valid:count] = np.where(np.isnan(a) | (b > a), bMax, aMax)
+
+            self._counts[i] = count
+            level += 1
+
+        del self._minRows[level - 1:]
+        del self._maxRows[level - 1:]
+        del self._counts[level - 1:]
+
+    def rows(self, values: np.ndarray, start: int, end: int, width: int) -> np.ndarray:
+        """Return indices of about 2 to 4 times "width" rows representing rows from "start" to "end"
+
+        The rows are sorted and include the minimum and the maximum of every bucket.
+        """
+        if end - start <= 2 * width or not self._counts:
+            return np.arange(start, end)
+
+        level = min(int(np.log2((end - start) / width)), len(self._counts))
+        i = level - 1
+
+        first = start >> level
+        last = max(min((end + (1 << level) - 1) >> level, self._counts[i]), first)
+        rows = np.stack([self._minRows[i][first:last], self._maxRows[i][first:last]], axis=1)
+
+        tail = max(last << level, start)  # Rows not summarized at this level
+        if tail < end:
+            part = values[tail:end]
+            if np.isnan(part).all():
+                rows = np.concatenate([rows, [[tail, end - 1]]])
+            else:
+                rows = np.concatenate([rows, [[tail + np.nanargmin(part), tail + np.nanargmax(part)]]])
+
+        return np.sort(rows, axis=1).ravel()
@@ -4,13 +4,35 @@
 import asyncio
 import functools
 import contextvars
+import os
 from concurrent.futures import ThreadPoolExecutor
 
+from vtkmodules.vtkCommonCore import vtkSMPTools
+from vtkmodules.vtkCommonExecutionModel import vtkAlgorithm
+from vtkmodules.vtkRenderingCore import vtkAbstractMapper
 
-_pool = ThreadPoolExecutor(1)  # To make only one thread running for VTK
 
-# vtkThreadLock = asyncio.Lock()
-vtkThreadLock: asyncio.Lock = None  # it should be initialized in main as soon as main loop is created
+MAX_VTK_WORKERS = 4
+
+_pool = ThreadPoolExecutor(min(MAX_VTK_WORKERS, os.cpu_count() or 1))
+
+# Locks of VTK objects used by running pipelines, keyed by the addresses of the objects
+_locks: dict[str, asyncio.Lock] = {}
+_lockUsers: dict[str, int] = {}
+
+
+def configureSMP(backend='STDThread', numberOfThreads=None):
+    """Sets the backend of vtkSMPTools used by the filters running in parallel, and the number of its threads
+
+    The default backend of VTK is "Sequential", which runs the filters in one thread.
+    numberOfThreads defaults to the cores shared by the worker threads,
+    not to oversubscribe the cores when pipelines run in all the workers.
+    """
+    if numberOfThreads is None:
+        numberOfThreads = max(1, (os.cpu_count() or 1) // _pool._max_workers)
+
+    vtkSMPTools.SetBackend(backend)
+    vtkSMPTools.Initialize(numberOfThreads)
 
 
 # Copied from asyncio.to_thread
@@ -21,21 +43,17 @@ async def _to_vtk_thread(func, /, *args, **kwargs):
     return await loop.run_in_executor(_pool, func_call)
 
 
-_holdRendering = False
+_holdRendering = 0
 
 
 def holdRendering():
     """Holds VTK rendering while VTK is working in background
 
-    Raises:
-        AssertionError: Rendering is already on hold
+    Holds can be nested, and rendering resumes when all of them are released.
     """
     global _holdRendering
 
-    if _holdRendering:
-        raise AssertionError
-
-    _holdRendering = True
+    _holdRendering += 1
 
 
 def resumeRendering():
@@ -49,15 +67,124 @@ def resumeRendering():
     if not _holdRendering:
         raise AssertionError
 
-    _holdRendering = False
+    _holdRendering -= 1
 
 
 def isRenderingHold():
-    return _holdRendering
+    return _holdRendering > 0
+
+
+def _key(obj) -> str:
+    return obj.GetAddressAsString('vtkObjectBase')
+
 
+def _pipelineObjects(algorithm: vtkAlgorithm, locked: list[str]) -> dict:
+    """Returns the algorithms and data objects that updating the algorithm reads or writes, keyed by their addresses
 
-async def vtk_run_in_thread(func, /, *args, **kwargs):
-    async with vtkThreadLock:
-        holdRendering()
-        await _to_vtk_thread(func, *args, **kwargs)
-        resumeRendering()
+    Only the algorithms in locked are walked through, since other pipelines may be updating the others.
+    """
+    objects = {}
+
+    def visit(a):
+        key = _key(a)
+        if key in objects:
+            return
+
+        objects[key] = a
+        if key not in locked:
+            return
+
+        for port in range(a.GetNumberOfOutputPorts()):
+            if (output := a.GetOutputDataObject(port)) is not None:
+                objects[_key(output)] = output
+
+        # Input data objects are the outputs of the input algorithms, trivial producers for data set directly
+        for port in range(a.GetNumberOfInputPorts()):
+            for i in range(a.GetNumberOfInputConnections(port)):
+                visit(a.GetInputAlgorithm(port, i))
+
+    visit(algorithm)
+
+    return objects
+
+
+async def _acquirePipeline(algorithm: vtkAlgorithm) -> tuple[dict, list[str]]:
+    """Locks the objects of the pipeline of the algorithm, walking it further as its algorithms are locked
+
+    All the locks are released and acquired again in order whenever more objects are found,
+    not to deadlock with other pipelines.
+    """
+    keys = await _acquire([_key(algorithm)])
+    while True:
+        try:
+            objects = _pipelineObjects(algorithm, keys)
+        except BaseException:
+            _release(keys)
+            raise
+
+        if objects.keys() <= set(keys):
+            return objects, keys
+
+        _release(keys)
+        keys = await _acquire(list(set(keys) | objects.keys()))
+
+
+async def _acquire(keys: list[str]):
+    acquired = []
+    try:
+        # Acquired in a fixed order not to deadlock with other pipelines
+        for key in sorted(keys):
+            if key not in _locks:
+                _locks[key] = asyncio.Lock()
+                _lockUsers[key] = 0
+            _lockUsers[key] += 1
+            acquired.append(key)
+            await _locks[key].acquire()
+    except BaseException:
+        _release(acquired[:-1], acquired[-1:])
+        raise
+
+    return acquired
+
+
+def _release(keys: list[str], waiting: list[str] = None):
+    for key in keys:
+        _locks[key].release()
+
+    for key in keys + (waiting or []):
+        _lockUsers[key] -= 1
+        if _lockUsers[key] == 0:
+            del _locks[key]
+            del _lockUsers[key]
+
+
+async def vtk_run_in_thread(func, /, *args, pipeline: vtkAlgorithm = None, **kwargs):
+    """Runs func in one of the VTK worker threads
+
+    Calls running pipelines that share no algorithm or data object run concurrently,
+    and the others wait for each other.
+    The pipeline is the one of the algorithm whose method is func, like "filter.Update",
+    or the one given as "pipeline" when func is a function that works on it.
+    Rendering is held only while a pipeline including a mapper is running,
+    so algorithms whose output is the input of a mapper should be updated through the mapper.
+    """
+    algorithm = pipeline or getattr(func, '__self__', None)
+    if isinstance(algorithm, vtkAlgorithm):
+        objects, keys = await _acquirePipeline(algorithm)
+    else:
+        # Not known what it works on, so it runs alone among such functions
+        objects = {'': None}
+        keys = await _acquire([''])
+
+    render = any(isinstance(o, vtkAbstractMapper) for o in objects.values())
+
+    try:
+        if render:
+            holdRendering()
+        try:
+            await _to_vtk_thread(func, *args, **kwargs)
+        finally:
+            if render:
+                resumeRendering()
+    finally:
+        _release(keys)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from PySide6.QtCore import QRectF, QSize
+from PySide6.QtGui import QPainter, QColor
+from PySide6.QtWidgets import QWidget
+
+
+class HistogramWidget(QWidget):
+    """Bars of counts in bins of equal width, with the bins in a band highlighted
+
+    Heights are in the log scale of the counts, so that bins of a few cells are not lost beside large ones.
+    """
+    BAR_COLOR = QColor(160, 160, 160)
+    BAND_COLOR = QColor(200, 60, 50)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._counts = np.zeros(0)
+        self._edges = np.zeros(1)
+        self._band = None
+
+    def setHistogram(self, counts: np.ndarray, edges: np.ndarray):
+        self._counts = counts
+        self._edges = edges
+        self.update()
+
+    def setBand(self, low, high):
+        self._band = (low, high)
+        self.update()
+
+    def clear(self):
+        self._counts = np.zeros(0)
+        self._edges = np.zeros(1)
+        self._band = None
+        self.update()
+
+    def paintEvent(self, event):
+        if not len(self._counts) or not self._counts.any():
+            return
+
+        painter = QPainter(self)
+
+        heights = np.log1p(self._counts)
+        heights = heights / heights.max() * self.height()
+        width = self.width() / len(self._counts)
+        for i, height in enumerate(heights):
+            inBand = (self._band is not None
+                      and self._edges[i + 1] >= self._band[0] and self._edges[i] <= self._band[1])
+            painter.fillRect(QRectF(i * width, self.height() - height, max(width - 1, 1), height),
+                             self.BAND_COLOR if inBand else self.BAR_COLOR)
+
+        painter.end()
+
+    def sizeHint(self):
+        return self.minimumSizeHint()
+
+    def minimumSizeHint(self):
+        return QSize(100, 60)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'new_project_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_NewProjectWidget(object):
+    def setupUi(self, NewProjectWidget):
+        if not NewProjectWidget.objectName():
+            NewProjectWidget.setObjectName(u"NewProjectWidget")
+        NewProjectWidget.resize(400, 150)
+        self.verticalLayout = QVBoxLayout(NewProjectWidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.project = QWidget(NewProjectWidget)
+        self.project.setObjectName(u"project")
+        self.formLayout = QFormLayout(self.project)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(self.project)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.LabelRole, self.label)
+
+        self.projectName = QLineEdit(self.project)
+        self.projectName.setObjectName(u"projectName")
+        self.projectName.setEnabled(True)
+
+        self.formLayout.setWidget(0, QFormLayout.FieldRole, self.projectName)
+
+        self.label_2 = QLabel(self.project)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.label_2)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.projectLocation = QLineEdit(self.project)
+        self.projectLocation.setObjectName(u"projectLocation")
+        self.projectLocation.setEnabled(False)
+
+        self.horizontalLayout.addWidget(self.projectLocation)
+
+        self.select = QPushButton(self.project)
+        self.select.setObjectName(u"select")
+        self.select.setMinimumSize(QSize(20, 0))
+        self.select.setMaximumSize(QSize(20, 16777215))
+
+        self.horizontalLayout.addWidget(self.select)
+
+
+        self.formLayout.setLayout(1, QFormLayout.FieldRole, self.horizontalLayout)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setSpacing(0)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.locationDescription = QLabel(self.project)
+        self.locationDescription.setObjectName(u"locationDescription")
+        self.locationDescription.setStyleSheet(u"color: grey")
+
+        self.horizontalLayout_2.addWidget(self.locationDescription)
+
+        self.folderName = QLabel(self.project)
+        self.folderName.setObjectName(u"folderName")
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.folderName.sizePolicy().hasHeightForWidth())
+        self.folderName.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_2.addWidget(self.folderName)
+
+
+        self.formLayout.setLayout(2, QFormLayout.FieldRole, self.horizontalLayout_2)
+
+        self.label_3 = QLabel(self.project)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.label_3)
+
+        self.suffixField = QHBoxLayout()
+        self.suffixField.setObjectName(u"suffixField")
+        self.suffix = QComboBox(self.project)
+        self.suffix.setObjectName(u"suffix")
+
+        self.suffixField.addWidget(self.suffix)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.suffixField.addItem(self.horizontalSpacer)
+
+
+        self.formLayout.setLayout(3, QFormLayout.FieldRole, self.suffixField)
+
+
+        self.verticalLayout.addWidget(self.project)
+
+        self.validationMessage = QLabel(NewProjectWidget)
+        self.validationMessage.setObjectName(u"validationMessage")
+        self.validationMessage.setStyleSheet(u"color: red")
+
+        self.verticalLayout.addWidget(self.validationMessage)
+
+
+        self.retranslateUi(NewProjectWidget)
+
+        QMetaObject.connectSlotsByName(NewProjectWidget)
+    # setupUi
+
+    def retranslateUi(self, NewProjectWidget):
+        NewProjectWidget.setWindowTitle(QCoreApplication.translate("NewProjectWidget", u"Form", None))
+        self.label.setText(QCoreApplication.translate("NewProjectWidget", u"Project Name", None))
+        self.label_2.setText(QCoreApplication.translate("NewProjectWidget", u"Project Location", None))
+        self.select.setText(QCoreApplication.translate("NewProjectWidget", u"...", None))
+        self.locationDescription.setText(QCoreApplication.translate("NewProjectWidget", u"Project will be created in &lt;Project Location&gt;", None))
+        self.folderName.setText("")
+        self.label_3.setText(QCoreApplication.translate("NewProjectWidget", u"Suffix", None))
+        self.validationMessage.setText("")
+    # retranslateUi
+
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'edit_hostfile_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QPlainTextEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+class Ui_EditHostfileDialog(object):
+    def setupUi(self, EditHostfileDialog):
+        if not EditHostfileDialog.objectName():
+            EditHostfileDialog.setObjectName(u"EditHostfileDialog")
+        EditHostfileDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(EditHostfileDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.textEdit = QPlainTextEdit(EditHostfileDialog)
+        self.textEdit.setObjectName(u"textEdit")
+
+        self.verticalLayout.addWidget(self.textEdit)
+
+        self.widget = QWidget(EditHostfileDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.importButton = QPushButton(self.widget)
+        self.importButton.setObjectName(u"importButton")
+
+        self.horizontalLayout.addWidget(self.importButton)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.buttonBox = QDialogButtonBox(self.widget)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.horizontalLayout.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(EditHostfileDialog)
+        self.buttonBox.accepted.connect(EditHostfileDialog.accept)
+        self.buttonBox.rejected.connect(EditHostfileDialog.reject)
+
+        QMetaObject.connectSlotsByName(EditHostfileDialog)
+    # setupUi
+
+    def retranslateUi(self, EditHostfileDialog):
+        EditHostfileDialog.setWindowTitle(QCoreApplication.translate("EditHostfileDialog", u"hostfile", None))
+        self.importButton.setText(QCoreApplication.translate("EditHostfileDialog", u"Import", None))
+    # retranslateUi
+
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'parallel_environment_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QButtonGroup, QDialog, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QRadioButton, QSizePolicy, QSpacerItem, QStackedWidget,
+    QVBoxLayout, QWidget)
+
+class Ui_parallelEnvironmentDialog(object):
+    def setupUi(self, parallelEnvironmentDialog):
+        if not parallelEnvironmentDialog.objectName():
+            parallelEnvironmentDialog.setObjectName(u"parallelEnvironmentDialog")
+        parallelEnvironmentDialog.resize(227, 298)
+        self.verticalLayout = QVBoxLayout(parallelEnvironmentDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.dialogContents = QWidget(parallelEnvironmentDialog)
+        self.dialogContents.setObjectName(u"dialogContents")
+        self.verticalLayout_5 = QVBoxLayout(self.dialogContents)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.widget = QWidget(self.dialogContents)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label_11 = QLabel(self.widget)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout.addWidget(self.label_11)
+
+        self.numberOfCores = QLineEdit(self.widget)
+        self.numberOfCores.setObjectName(u"numberOfCores")
+
+        self.horizontalLayout.addWidget(self.numberOfCores)
+
+
+        self.verticalLayout_5.addWidget(self.widget)
+
+        self.groupBox = QGroupBox(self.dialogContents)
+        self.groupBox.setObjectName(u"groupBox")
+        self.groupBox.setCheckable(False)
+        self.groupBox.setChecked(False)
+        self.verticalLayout_4 = QVBoxLayout(self.groupBox)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(20, -1, -1, -1)
+        self.typeLocalMachine = QRadioButton(self.groupBox)
+        self.typeRadios = QButtonGroup(parallelEnvironmentDialog)
+        self.typeRadios.setObjectName(u"typeRadios")
+        self.typeRadios.addButton(self.typeLocalMachine)
+        self.typeLocalMachine.setObjectName(u"typeLocalMachine")
+        self.typeLocalMachine.setChecked(True)
+
+        self.verticalLayout_4.addWidget(self.typeLocalMachine)
+
+        self.typeCluster = QRadioButton(self.groupBox)
+        self.typeRadios.addButton(self.typeCluster)
+        self.typeCluster.setObjectName(u"typeCluster")
+
+        self.verticalLayout_4.addWidget(self.typeCluster)
+
+        self.typeSlurm = QRadioButton(self.groupBox)
+        self.typeRadios.addButton(self.typeSlurm)
+        self.typeSlurm.setObjectName(u"typeSlurm")
+        self.typeSlurm.setEnabled(False)
+
+        self.verticalLayout_4.addWidget(self.typeSlurm)
+
+
+        self.verticalLayout_5.addWidget(self.groupBox)
+
+        self.stackedParameters = QStackedWidget(self.dialogContents)
+        self.stackedParameters.setObjectName(u"stackedParameters")
+        self.page = QWidget()
+        self.page.setObjectName(u"page")
+        self.verticalLayout_2 = QVBoxLayout(self.page)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.stackedParameters.addWidget(self.page)
+        self.page_2 = QWidget()
+        self.page_2.setObjectName(u"page_2")
+        self.verticalLayout_3 = QVBoxLayout(self.page_2)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.groupBox_3 = QGroupBox(self.page_2)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.horizontalLayout_3 = QHBoxLayout(self.groupBox_3)
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.label_25 = QLabel(self.groupBox_3)
+        self.label_25.setObjectName(u"label_25")
+
+        self.horizontalLayout_3.addWidget(self.label_25)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer_4)
+
+        self.editHostFile = QPushButton(self.groupBox_3)
+        self.editHostFile.setObjectName(u"editHostFile")
+
+        self.horizontalLayout_3.addWidget(self.editHostFile)
+
+
+        self.verticalLayout_3.addWidget(self.groupBox_3)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer_2)
+
+        self.stackedParameters.addWidget(self.page_2)
+
+        self.verticalLayout_5.addWidget(self.stackedParameters)
+
+
+        self.verticalLayout.addWidget(self.dialogContents)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer_3)
+
+        self.widget_2 = QWidget(parallelEnvironmentDialog)
+        self.widget_2.setObjectName(u"widget_2")
+        self.horizontalLayout_2 = QHBoxLayout(self.widget_2)
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer)
+
+        self.applyButton = QPushButton(self.widget_2)
+        self.applyButton.setObjectName(u"applyButton")
+
+        self.horizontalLayout_2.addWidget(self.applyButton)
+
+        self.closeButton = QPushButton(self.widget_2)
+        self.closeButton.setObjectName(u"closeButton")
+
+        self.horizontalLayout_2.addWidget(self.closeButton)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+
+        self.retranslateUi(parallelEnvironmentDialog)
+
+        self.stackedParameters.setCurrentIndex(1)
+
+
+        QMetaObject.connectSlotsByName(parallelEnvironmentDialog)
+    # setupUi
+
+    def retranslateUi(self, parallelEnvironmentDialog):
+        parallelEnvironmentDialog.setWindowTitle(QCoreApplication.translate("parallelEnvironmentDialog", u"Parallel Environment", None))
+        self.label_11.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Number of Cores", None))
+        self.groupBox.setTitle(QCoreApplication.translate("parallelEnvironmentDialog", u"Parallel Type", None))
+        self.typeLocalMachine.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Local Machine", None))
+        self.typeCluster.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Cluster", None))
+        self.typeSlurm.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Slurm", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("parallelEnvironmentDialog", u"Cluster Parameter", None))
+        self.label_25.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Node List (hostfile)", None))
+        self.editHostFile.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"View/Edit", None))
+        self.applyButton.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Apply", None))
+        self.closeButton.setText(QCoreApplication.translate("parallelEnvironmentDialog", u"Close", None))
+    # retranslateUi
+
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'selector_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_SelectorDialog(object):
+    def setupUi(self, SelectorDialog):
+        if not SelectorDialog.objectName():
+            SelectorDialog.setObjectName(u"SelectorDialog")
+        SelectorDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(SelectorDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(SelectorDialog)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.filter = QLineEdit(SelectorDialog)
+        self.filter.setObjectName(u"filter")
+
+        self.verticalLayout.addWidget(self.filter)
+
+        self.list = QListWidget(SelectorDialog)
+        self.list.setObjectName(u"list")
+
+        self.verticalLayout.addWidget(self.list)
+
+        self.buttonBox = QDialogButtonBox(SelectorDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(SelectorDialog)
+        self.buttonBox.accepted.connect(SelectorDialog.accept)
+        self.buttonBox.rejected.connect(SelectorDialog.reject)
+
+        QMetaObject.connectSlotsByName(SelectorDialog)
+    # setupUi
+
+    def retranslateUi(self, SelectorDialog):
+        SelectorDialog.setWindowTitle(QCoreApplication.translate("SelectorDialog", u"Dialog", None))
+        self.label.setText(QCoreApplication.translate("SelectorDialog", u"TextLabel", None))
+    # retranslateUi
+
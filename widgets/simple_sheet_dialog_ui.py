@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'simple_sheet_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.4.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QHeaderView,
+    QPushButton, QSizePolicy, QSpacerItem, QTableWidgetItem,
+    QVBoxLayout, QWidget)
+
+from widgets.simple_excel_sheet import SimpleExcelSheet
+
+class Ui_SimpleSheetDialog(object):
+    def setupUi(self, SimpleSheetDialog):
+        if not SimpleSheetDialog.objectName():
+            SimpleSheetDialog.setObjectName(u"SimpleSheetDialog")
+        SimpleSheetDialog.resize(400, 300)
+        self.verticalLayout = QVBoxLayout(SimpleSheetDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.sheet = SimpleExcelSheet(SimpleSheetDialog)
+        self.sheet.setObjectName(u"sheet")
+
+        self.verticalLayout.addWidget(self.sheet)
+
+        self.widget = QWidget(SimpleSheetDialog)
+        self.widget.setObjectName(u"widget")
+        self.horizontalLayout = QHBoxLayout(self.widget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(95, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.ok = QPushButton(self.widget)
+        self.ok.setObjectName(u"ok")
+
+        self.horizontalLayout.addWidget(self.ok)
+
+        self.cancel = QPushButton(self.widget)
+        self.cancel.setObjectName(u"cancel")
+
+        self.horizontalLayout.addWidget(self.cancel)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout.addWidget(self.widget)
+
+
+        self.retranslateUi(SimpleSheetDialog)
+
+        QMetaObject.connectSlotsByName(SimpleSheetDialog)
+    # setupUi
+
+    def retranslateUi(self, SimpleSheetDialog):
+        SimpleSheetDialog.setWindowTitle(QCoreApplication.translate("SimpleSheetDialog", u"Dialog", None))
+        self.ok.setText(QCoreApplication.translate("SimpleSheetDialog", u"Ok", None))
+        self.cancel.setText(QCoreApplication.translate("SimpleSheetDialog", u"Cancel", None))
+    # retranslateUi
+